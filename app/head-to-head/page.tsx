@@ -1,29 +1,71 @@
+"use client";
+
+import { useState, useMemo } from "react";
 import Navigation from "@/components/Navigation";
-import { headToHeadRecords } from "@/data/headToHead";
+import { headToHeadByManager } from "@/data/headToHead";
+import { headToHeadCube } from "@/data/headToHeadCube";
+import { groupByManager, recordsForSeasonRange, ManagerData } from "@/lib/headToHead";
 
-interface ManagerRecord {
-  opponent: string;
-  wins: number;
-  losses: number;
-  ties?: number;
-  record: string;
-}
-
-interface ManagerData {
-  manager: string;
-  records: ManagerRecord[];
-  totalWins: number;
-  totalLosses: number;
-  totalTies: number;
-  totalGames: number;
-  winPercentage: number;
-}
+const seasons = headToHeadCube.seasons;
+const firstSeason = seasons[0];
+const lastSeason = seasons[seasons.length - 1];
 
 export default function HeadToHead() {
-  // Ensure we have valid data
-  const matchups = Array.isArray(headToHeadRecords) ? headToHeadRecords : [];
+  const [startSeason, setStartSeason] = useState<number>(firstSeason);
+  const [endSeason, setEndSeason] = useState<number>(lastSeason);
+  const isAllTime = startSeason === firstSeason && endSeason === lastSeason;
+
+  // All-time totals are pre-grouped in headToHead.js; other ranges are
+  // answered from the per-season prefix sums in the cube
+  const managerData: ManagerData[] = useMemo(() => {
+    if (isAllTime) {
+      return Array.isArray(headToHeadByManager) ? headToHeadByManager : [];
+    }
+    return groupByManager(recordsForSeasonRange(headToHeadCube, startSeason, endSeason));
+  }, [isAllTime, startSeason, endSeason]);
 
-  if (matchups.length === 0) {
+  const seasonRangeSelector = (
+    <div className="flex flex-wrap items-center gap-3">
+      <label htmlFor="start-season" className="text-lg font-semibold">
+        Seasons:
+      </label>
+      <select
+        id="start-season"
+        value={startSeason}
+        onChange={(e) => {
+          const season = Number(e.target.value);
+          setStartSeason(season);
+          if (season > endSeason) setEndSeason(season);
+        }}
+        className="px-4 py-2 border-2 border-white rounded-lg text-jbsBlue font-semibold bg-white hover:bg-gray-50 focus:outline-none focus:ring-2 focus:ring-jbsGold"
+      >
+        {seasons.map((season) => (
+          <option key={season} value={season}>
+            {season}
+          </option>
+        ))}
+      </select>
+      <span>to</span>
+      <select
+        id="end-season"
+        value={endSeason}
+        onChange={(e) => {
+          const season = Number(e.target.value);
+          setEndSeason(season);
+          if (season < startSeason) setStartSeason(season);
+        }}
+        className="px-4 py-2 border-2 border-white rounded-lg text-jbsBlue font-semibold bg-white hover:bg-gray-50 focus:outline-none focus:ring-2 focus:ring-jbsGold"
+      >
+        {seasons.map((season) => (
+          <option key={season} value={season}>
+            {season}
+          </option>
+        ))}
+      </select>
+    </div>
+  );
+
+  if (managerData.length === 0) {
     return (
       <div className="min-h-screen bg-gradient-to-br from-white to-gray-50">
         <Navigation currentPage="/head-to-head" />
@@ -31,6 +73,9 @@ export default function HeadToHead() {
           <h1 className="text-4xl font-bold text-jbsBlue mb-8 text-center">
             Head-to-Head Records
           </h1>
+          <div className="mb-6 flex justify-center text-jbsBlue">
+            {seasonRangeSelector}
+          </div>
           <div className="bg-white rounded-lg shadow-lg p-8 text-center">
             <p className="text-gray-600">No head-to-head records available.</p>
           </div>
@@ -39,83 +84,6 @@ export default function HeadToHead() {
     );
   }
 
-  // Transform flat array into manager-grouped structure
-  const managerDataMap = new Map<string, ManagerData>();
-
-  matchups.forEach((matchup) => {
-    const { manager1, manager2, manager1Wins, manager2Wins } = matchup;
-    // Ensure ties is a number, defaulting to 0
-    const ties = typeof matchup.ties === 'number' ? matchup.ties : 0;
-
-    // Process manager1's record against manager2
-    if (!managerDataMap.has(manager1)) {
-      managerDataMap.set(manager1, {
-        manager: manager1,
-        records: [],
-        totalWins: 0,
-        totalLosses: 0,
-        totalTies: 0,
-        totalGames: 0,
-        winPercentage: 0,
-      });
-    }
-    const mgr1Data = managerDataMap.get(manager1)!;
-    mgr1Data.records.push({
-      opponent: manager2,
-      wins: manager1Wins,
-      losses: manager2Wins,
-      ties: ties,
-      record: ties > 0 ? `${manager1Wins}-${manager2Wins}-${ties}` : `${manager1Wins}-${manager2Wins}`,
-    });
-    mgr1Data.totalWins += manager1Wins;
-    mgr1Data.totalLosses += manager2Wins;
-    mgr1Data.totalTies += ties;
-    mgr1Data.totalGames += manager1Wins + manager2Wins + ties;
-
-    // Process manager2's record against manager1
-    if (!managerDataMap.has(manager2)) {
-      managerDataMap.set(manager2, {
-        manager: manager2,
-        records: [],
-        totalWins: 0,
-        totalLosses: 0,
-        totalTies: 0,
-        totalGames: 0,
-        winPercentage: 0,
-      });
-    }
-    const mgr2Data = managerDataMap.get(manager2)!;
-    mgr2Data.records.push({
-      opponent: manager1,
-      wins: manager2Wins,
-      losses: manager1Wins,
-      ties: ties,
-      record: ties > 0 ? `${manager2Wins}-${manager1Wins}-${ties}` : `${manager2Wins}-${manager1Wins}`,
-    });
-    mgr2Data.totalWins += manager2Wins;
-    mgr2Data.totalLosses += manager1Wins;
-    mgr2Data.totalTies += ties;
-    mgr2Data.totalGames += manager2Wins + manager1Wins + ties;
-  });
-
-  // Calculate win percentages and sort records
-  const managerData: ManagerData[] = Array.from(managerDataMap.values()).map(
-    (data) => {
-      data.winPercentage =
-        data.totalGames > 0
-          ? (data.totalWins / data.totalGames) * 100
-          : 0;
-      // Sort records by total games (most played first)
-      data.records.sort(
-        (a, b) => b.wins + b.losses - (a.wins + a.losses)
-      );
-      return data;
-    }
-  );
-
-  // Sort managers by win percentage (highest to lowest)
-  managerData.sort((a, b) => b.winPercentage - a.winPercentage);
-
   return (
     <div className="min-h-screen bg-gradient-to-br from-white to-gray-50">
       <Navigation currentPage="/head-to-head" />
@@ -128,10 +96,11 @@ export default function HeadToHead() {
             since the league began using ESPN to host. Only regular season games
             are included in these statistics; playoff games are excluded.
           </p>
-          <p className="text-sm opacity-90">
+          <p className="mb-6 text-sm opacity-90">
             Records are color-coded: green indicates a winning record, red
             indicates a losing record against that opponent.
           </p>
+          {seasonRangeSelector}
         </div>
 
         <div className="grid grid-cols-1 lg:grid-cols-2 gap-6">
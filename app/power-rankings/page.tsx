@@ -1,45 +1,45 @@
 "use client";
 
-import { useState, useMemo } from "react";
+import { useState, useEffect } from "react";
 import Navigation from "@/components/Navigation";
 import { LineChart, Line, XAxis, YAxis, CartesianGrid, Tooltip, Legend, ResponsiveContainer } from "recharts";
-import { powerRankings } from "@/data/powerRankings";
+import { powerRankingSeasons } from "@/data/powerRankings";
+import { PowerRankingSeason, loadPowerRankingSeason } from "@/lib/powerRankings";
 
 // Get available seasons (sorted, newest first)
 const getAvailableSeasons = () => {
-  const seasons = Object.keys(powerRankings).map(Number).sort((a, b) => b - a);
+  const seasons = [...powerRankingSeasons].sort((a, b) => b - a);
   return seasons;
 };
 
 export default function PowerRankings() {
   const availableSeasons = getAvailableSeasons();
   const [selectedSeason, setSelectedSeason] = useState<number>(availableSeasons[0] || 2025);
+  const [seasonData, setSeasonData] = useState<PowerRankingSeason | null>(null);
+  const [loading, setLoading] = useState<boolean>(true);
 
-  const seasonData = powerRankings[selectedSeason.toString() as keyof typeof powerRankings];
-
-  // Prepare chart data: one data point per week with each manager's totalRank
-  const chartData = useMemo(() => {
-    if (!seasonData) return [];
-
-    const managers = new Set<string>();
-    seasonData.weeks.forEach((week) => {
-      week.managers.forEach((m) => managers.add(m.manager));
-    });
-
-    return seasonData.weeks.map((week) => {
-      const dataPoint: any = { week: week.week };
-      week.managers.forEach((manager) => {
-        dataPoint[manager.manager] = manager.totalRank;
+  // Only the selected season's rankings are downloaded
+  useEffect(() => {
+    let cancelled = false;
+    setLoading(true);
+    loadPowerRankingSeason(selectedSeason)
+      .then((data) => {
+        if (!cancelled) setSeasonData(data);
+      })
+      .catch(() => {
+        if (!cancelled) setSeasonData(null);
+      })
+      .finally(() => {
+        if (!cancelled) setLoading(false);
       });
-      return dataPoint;
-    });
-  }, [seasonData]);
+    return () => {
+      cancelled = true;
+    };
+  }, [selectedSeason]);
 
-  // Get final/latest rankings for summary table
-  const finalRankings = useMemo(() => {
-    if (!seasonData) return [];
-    return seasonData.finalRankings || [];
-  }, [seasonData]);
+  // Chart points and final rankings are precomputed per season by the generator
+  const chartData = seasonData?.chartData ?? [];
+  const finalRankings = seasonData?.finalRankings ?? [];
 
   // Manager colors for chart lines (JBS color scheme)
   const managerColors: Record<string, string> = {
@@ -63,7 +63,9 @@ export default function PowerRankings() {
           <h1 className="text-4xl font-bold text-jbsBlue mb-8 text-center">
             Power Rankings
           </h1>
-          <p className="text-center text-gray-600">No data available for selected season.</p>
+          <p className="text-center text-gray-600">
+            {loading ? "Loading power rankings..." : "No data available for selected season."}
+          </p>
         </main>
       </div>
     );
@@ -207,6 +209,17 @@ export default function PowerRankings() {
                           {rank === 1 && "👑 "}
                           {rank}
                         </span>
+                        {manager.movement !== null && manager.movement !== 0 && (
+                          <span
+                            className={`ml-2 text-xs font-semibold ${
+                              manager.movement > 0 ? "text-green-600" : "text-red-600"
+                            }`}
+                            title={`${Math.abs(manager.movement)} place${Math.abs(manager.movement) === 1 ? "" : "s"} ${manager.movement > 0 ? "up" : "down"} since last week`}
+                          >
+                            {manager.movement > 0 ? "▲" : "▼"}
+                            {Math.abs(manager.movement)}
+                          </span>
+                        )}
                       </td>
                       <td className="px-6 py-4 whitespace-nowrap">
                         <span className="text-sm font-semibold text-jbsBlue">
@@ -1,91 +1,133 @@
-import Link from "next/link";
+"use client";
+
+import { useState, useEffect } from "react";
+import Navigation from "@/components/Navigation";
+import { standingsSeasons } from "@/data/standings";
+import { SeasonStandings, loadSeasonStandings } from "@/lib/seasonData";
+
+// Newest season first
+const availableSeasons = [...standingsSeasons].sort((a, b) => b - a);
 
 export default function Standings() {
-  // Sample standings data - replace with your actual data
-  const standings = [
-    { rank: 1, team: "Team Alpha", wins: 10, losses: 2, points: 1520 },
-    { rank: 2, team: "Team Beta", wins: 9, losses: 3, points: 1480 },
-    { rank: 3, team: "Team Gamma", wins: 8, losses: 4, points: 1450 },
-    { rank: 4, team: "Team Delta", wins: 7, losses: 5, points: 1420 },
-    { rank: 5, team: "Team Epsilon", wins: 6, losses: 6, points: 1380 },
-    { rank: 6, team: "Team Zeta", wins: 5, losses: 7, points: 1350 },
-  ];
+  const [selectedSeason, setSelectedSeason] = useState<number>(availableSeasons[0] || 2025);
+  const [seasonData, setSeasonData] = useState<SeasonStandings | null>(null);
+  const [loading, setLoading] = useState<boolean>(true);
+
+  // Only the selected season's standings are downloaded
+  useEffect(() => {
+    let cancelled = false;
+    setLoading(true);
+    loadSeasonStandings(selectedSeason)
+      .then((data) => {
+        if (!cancelled) setSeasonData(data);
+      })
+      .catch(() => {
+        if (!cancelled) setSeasonData(null);
+      })
+      .finally(() => {
+        if (!cancelled) setLoading(false);
+      });
+    return () => {
+      cancelled = true;
+    };
+  }, [selectedSeason]);
 
   return (
-    <div className="min-h-screen bg-gradient-to-br from-blue-50 to-indigo-100 dark:from-gray-900 dark:to-gray-800">
-      <nav className="bg-white dark:bg-gray-800 shadow-md">
-        <div className="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8">
-          <div className="flex justify-between h-16">
-            <div className="flex items-center">
-              <Link href="/" className="text-2xl font-bold text-indigo-600 dark:text-indigo-400">
-                Fantasy Football League
-              </Link>
-            </div>
-            <div className="flex items-center space-x-4">
-              <Link
-                href="/standings"
-                className="text-indigo-600 dark:text-indigo-400 px-3 py-2 rounded-md text-sm font-medium"
-              >
-                Standings
-              </Link>
-              <Link
-                href="/teams"
-                className="text-gray-700 dark:text-gray-300 hover:text-indigo-600 dark:hover:text-indigo-400 px-3 py-2 rounded-md text-sm font-medium"
-              >
-                Teams
-              </Link>
-              <Link
-                href="/schedule"
-                className="text-gray-700 dark:text-gray-300 hover:text-indigo-600 dark:hover:text-indigo-400 px-3 py-2 rounded-md text-sm font-medium"
-              >
-                Schedule
-              </Link>
-            </div>
-          </div>
-        </div>
-      </nav>
+    <div className="min-h-screen bg-gradient-to-br from-white to-gray-50">
+      <Navigation currentPage="/standings" />
 
       <main className="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8 py-12">
-        <h1 className="text-4xl font-bold text-gray-900 dark:text-white mb-8">League Standings</h1>
-        
-        <div className="bg-white dark:bg-gray-800 rounded-lg shadow-lg overflow-hidden">
-          <table className="min-w-full divide-y divide-gray-200 dark:divide-gray-700">
-            <thead className="bg-gray-50 dark:bg-gray-700">
-              <tr>
-                <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 dark:text-gray-300 uppercase tracking-wider">
-                  Rank
-                </th>
-                <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 dark:text-gray-300 uppercase tracking-wider">
-                  Team
-                </th>
-                <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 dark:text-gray-300 uppercase tracking-wider">
-                  W-L
-                </th>
-                <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 dark:text-gray-300 uppercase tracking-wider">
-                  Points
-                </th>
-              </tr>
-            </thead>
-            <tbody className="bg-white dark:bg-gray-800 divide-y divide-gray-200 dark:divide-gray-700">
-              {standings.map((team) => (
-                <tr key={team.rank} className="hover:bg-gray-50 dark:hover:bg-gray-700">
-                  <td className="px-6 py-4 whitespace-nowrap text-sm font-medium text-gray-900 dark:text-white">
-                    {team.rank}
-                  </td>
-                  <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-900 dark:text-white">
-                    {team.team}
-                  </td>
-                  <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-500 dark:text-gray-400">
-                    {team.wins}-{team.losses}
-                  </td>
-                  <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-500 dark:text-gray-400">
-                    {team.points}
-                  </td>
-                </tr>
-              ))}
-            </tbody>
-          </table>
+        <h1 className="text-4xl font-bold text-jbsBlue mb-4 text-center">League Standings</h1>
+
+        {/* Season Selector */}
+        <div className="flex justify-center mb-6">
+          <label htmlFor="season-select" className="mr-3 text-lg font-semibold text-gray-700">
+            Season:
+          </label>
+          <select
+            id="season-select"
+            value={selectedSeason}
+            onChange={(e) => setSelectedSeason(Number(e.target.value))}
+            className="px-4 py-2 border-2 border-jbsBlue rounded-lg text-jbsBlue font-semibold bg-white hover:bg-gray-50 focus:outline-none focus:ring-2 focus:ring-jbsGold"
+          >
+            {availableSeasons.map((season) => (
+              <option key={season} value={season}>
+                {season}
+              </option>
+            ))}
+          </select>
         </div>
+
+        {!seasonData || seasonData.season !== selectedSeason ? (
+          <p className="text-center text-gray-600">
+            {loading ? "Loading standings..." : "No data available for selected season."}
+          </p>
+        ) : (
+          <div className="bg-white rounded-lg shadow-lg overflow-hidden">
+            <div className="px-6 py-4 bg-gradient-to-r from-jbsBlue to-jbsGold">
+              <h2 className="text-2xl font-bold text-white">{selectedSeason} Regular Season</h2>
+              <p className="text-white/90 text-sm mt-1">Ordered by record, then points for</p>
+            </div>
+            <div className="overflow-x-auto">
+              <table className="min-w-full divide-y divide-gray-200">
+                <thead className="bg-gray-50">
+                  <tr>
+                    <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">
+                      Rank
+                    </th>
+                    <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">
+                      Manager
+                    </th>
+                    <th className="px-6 py-3 text-center text-xs font-medium text-gray-500 uppercase tracking-wider">
+                      W-L-T
+                    </th>
+                    <th className="px-6 py-3 text-center text-xs font-medium text-gray-500 uppercase tracking-wider">
+                      Win %
+                    </th>
+                    <th className="px-6 py-3 text-right text-xs font-medium text-gray-500 uppercase tracking-wider">
+                      Points For
+                    </th>
+                    <th className="px-6 py-3 text-right text-xs font-medium text-gray-500 uppercase tracking-wider">
+                      Points Against
+                    </th>
+                  </tr>
+                </thead>
+                <tbody className="bg-white divide-y divide-gray-200">
+                  {seasonData.standings.map((team) => (
+                    <tr
+                      key={team.manager}
+                      className={`hover:bg-gray-50 ${
+                        team.place === 1 ? "bg-gradient-to-r from-jbsGold/10 to-jbsGold/5" : ""
+                      }`}
+                    >
+                      <td className="px-6 py-4 whitespace-nowrap">
+                        <span className={`text-lg font-bold ${team.place === 1 ? "text-jbsGold" : "text-gray-700"}`}>
+                          {team.place}
+                        </span>
+                      </td>
+                      <td className="px-6 py-4 whitespace-nowrap">
+                        <div className="text-sm font-semibold text-jbsBlue">{team.manager}</div>
+                        {team.teamName && <div className="text-xs text-gray-500">{team.teamName}</div>}
+                      </td>
+                      <td className="px-6 py-4 whitespace-nowrap text-center text-sm text-gray-700">
+                        {team.wins}-{team.losses}-{team.ties}
+                      </td>
+                      <td className="px-6 py-4 whitespace-nowrap text-center text-sm text-gray-700">
+                        {(team.winPct * 100).toFixed(1)}%
+                      </td>
+                      <td className="px-6 py-4 whitespace-nowrap text-right text-sm text-gray-700">
+                        {team.pointsFor.toFixed(2)}
+                      </td>
+                      <td className="px-6 py-4 whitespace-nowrap text-right text-sm text-gray-700">
+                        {team.pointsAgainst.toFixed(2)}
+                      </td>
+                    </tr>
+                  ))}
+                </tbody>
+              </table>
+            </div>
+          </div>
+        )}
       </main>
     </div>
   );
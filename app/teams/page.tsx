@@ -1,74 +1,216 @@
-import Link from "next/link";
+"use client";
+
+import { useState, useEffect } from "react";
+import Navigation from "@/components/Navigation";
+import { managerSummaries } from "@/data/managers";
+import { ManagerProfile, formatRecord, loadManagerProfile } from "@/lib/managerProfiles";
+
+const formatPct = (pct: number | null) => (pct === null ? "-" : `${(pct * 100).toFixed(1)}%`);
 
 export default function Teams() {
-  // Sample teams data - replace with your actual data
-  const teams = [
-    { id: 1, name: "Team Alpha", owner: "John Doe", wins: 10, losses: 2 },
-    { id: 2, name: "Team Beta", owner: "Jane Smith", wins: 9, losses: 3 },
-    { id: 3, name: "Team Gamma", owner: "Bob Johnson", wins: 8, losses: 4 },
-    { id: 4, name: "Team Delta", owner: "Alice Williams", wins: 7, losses: 5 },
-    { id: 5, name: "Team Epsilon", owner: "Charlie Brown", wins: 6, losses: 6 },
-    { id: 6, name: "Team Zeta", owner: "Diana Prince", wins: 5, losses: 7 },
-  ];
+  const managers = [...managerSummaries].sort((a, b) => (b.winPct ?? 0) - (a.winPct ?? 0));
+  const [selectedManager, setSelectedManager] = useState<string>(managers[0]?.manager ?? "");
+  const [profile, setProfile] = useState<ManagerProfile | null>(null);
+  const [loading, setLoading] = useState<boolean>(true);
+
+  // Only the selected manager's profile is downloaded
+  useEffect(() => {
+    if (!selectedManager) return;
+    let cancelled = false;
+    setLoading(true);
+    loadManagerProfile(selectedManager)
+      .then((data) => {
+        if (!cancelled) setProfile(data);
+      })
+      .catch(() => {
+        if (!cancelled) setProfile(null);
+      })
+      .finally(() => {
+        if (!cancelled) setLoading(false);
+      });
+    return () => {
+      cancelled = true;
+    };
+  }, [selectedManager]);
 
   return (
-    <div className="min-h-screen bg-gradient-to-br from-blue-50 to-indigo-100 dark:from-gray-900 dark:to-gray-800">
-      <nav className="bg-white dark:bg-gray-800 shadow-md">
-        <div className="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8">
-          <div className="flex justify-between h-16">
-            <div className="flex items-center">
-              <Link href="/" className="text-2xl font-bold text-indigo-600 dark:text-indigo-400">
-                Fantasy Football League
-              </Link>
-            </div>
-            <div className="flex items-center space-x-4">
-              <Link
-                href="/standings"
-                className="text-gray-700 dark:text-gray-300 hover:text-indigo-600 dark:hover:text-indigo-400 px-3 py-2 rounded-md text-sm font-medium"
-              >
-                Standings
-              </Link>
-              <Link
-                href="/teams"
-                className="text-indigo-600 dark:text-indigo-400 px-3 py-2 rounded-md text-sm font-medium"
-              >
-                Teams
-              </Link>
-              <Link
-                href="/schedule"
-                className="text-gray-700 dark:text-gray-300 hover:text-indigo-600 dark:hover:text-indigo-400 px-3 py-2 rounded-md text-sm font-medium"
-              >
-                Schedule
-              </Link>
-            </div>
-          </div>
-        </div>
-      </nav>
+    <div className="min-h-screen bg-gradient-to-br from-white to-gray-50">
+      <Navigation currentPage="/teams" />
 
       <main className="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8 py-12">
-        <h1 className="text-4xl font-bold text-gray-900 dark:text-white mb-8">Teams</h1>
-        
-        <div className="grid grid-cols-1 gap-6 sm:grid-cols-2 lg:grid-cols-3">
-          {teams.map((team) => (
-            <div
-              key={team.id}
-              className="bg-white dark:bg-gray-800 rounded-lg shadow-lg p-6 hover:shadow-xl transition-shadow"
+        <h1 className="text-4xl font-bold text-jbsBlue mb-4 text-center">Managers</h1>
+        <p className="text-center text-gray-600 mb-8 text-sm">
+          Career regular season records since 2009. Championships cover the full league history.
+        </p>
+
+        {/* Manager cards */}
+        <div className="grid grid-cols-2 gap-4 sm:grid-cols-3 lg:grid-cols-6 mb-10">
+          {managers.map((manager) => (
+            <button
+              key={manager.manager}
+              onClick={() => setSelectedManager(manager.manager)}
+              className={`rounded-lg shadow p-4 text-left transition-shadow hover:shadow-lg ${
+                manager.manager === selectedManager
+                  ? "bg-jbsBlue text-white"
+                  : "bg-white text-jbsBlue"
+              }`}
             >
-              <h2 className="text-2xl font-semibold text-gray-900 dark:text-white mb-2">
-                {team.name}
-              </h2>
-              <p className="text-gray-600 dark:text-gray-400 mb-4">Owner: {team.owner}</p>
-              <div className="flex justify-between items-center">
-                <span className="text-sm text-gray-500 dark:text-gray-400">
-                  Record: {team.wins}-{team.losses}
-                </span>
-                <span className="text-sm font-medium text-indigo-600 dark:text-indigo-400">
-                  {((team.wins / (team.wins + team.losses)) * 100).toFixed(1)}% Win Rate
-                </span>
+              <div className="text-lg font-bold">{manager.manager}</div>
+              <div className={`text-sm ${manager.manager === selectedManager ? "text-white/80" : "text-gray-600"}`}>
+                {formatRecord(manager)} ({formatPct(manager.winPct)})
               </div>
-            </div>
+              {manager.championships > 0 && (
+                <div className="text-sm text-jbsGold font-semibold">
+                  {"🏆".repeat(manager.championships)}
+                </div>
+              )}
+            </button>
           ))}
         </div>
+
+        {!profile || profile.manager !== selectedManager ? (
+          <p className="text-center text-gray-600">
+            {loading ? "Loading profile..." : "No profile available for this manager."}
+          </p>
+        ) : (
+          <div className="space-y-8">
+            {/* Career overview */}
+            <div className="bg-white rounded-lg shadow-lg overflow-hidden">
+              <div className="px-6 py-4 bg-gradient-to-r from-jbsBlue to-jbsGold">
+                <h2 className="text-2xl font-bold text-white">{profile.manager}</h2>
+                <p className="text-white/90 text-sm mt-1">
+                  {profile.seasonsPlayed} season{profile.seasonsPlayed === 1 ? "" : "s"}
+                  {profile.firstSeason !== null && ` (${profile.firstSeason}-${profile.lastSeason})`}
+                </p>
+              </div>
+              <div className="grid grid-cols-2 md:grid-cols-4 gap-6 p-6">
+                <div>
+                  <div className="text-xs text-gray-500 uppercase">Record</div>
+                  <div className="text-2xl font-bold text-jbsBlue">{formatRecord(profile)}</div>
+                  <div className="text-sm text-gray-600">{formatPct(profile.winPct)}</div>
+                </div>
+                <div>
+                  <div className="text-xs text-gray-500 uppercase">Points For / Against</div>
+                  <div className="text-2xl font-bold text-jbsBlue">{profile.pointsFor.toFixed(2)}</div>
+                  <div className="text-sm text-gray-600">
+                    {profile.pointsAgainst.toFixed(2)} against, {profile.pointsPerGame?.toFixed(2)} per game
+                  </div>
+                </div>
+                <div>
+                  <div className="text-xs text-gray-500 uppercase">Championships</div>
+                  <div className="text-2xl font-bold text-jbsGold">{profile.championships.length}</div>
+                  <div className="text-sm text-gray-600">
+                    {profile.championships.length > 0 ? profile.championships.join(", ") : "None yet"}
+                  </div>
+                </div>
+                <div>
+                  <div className="text-xs text-gray-500 uppercase">Runner-Up / Third</div>
+                  <div className="text-2xl font-bold text-jbsBlue">
+                    {profile.runnerUps.length} / {profile.thirdPlaces.length}
+                  </div>
+                  <div className="text-sm text-gray-600">
+                    {[...profile.runnerUps, ...profile.thirdPlaces].sort((a, b) => a - b).join(", ") || "-"}
+                  </div>
+                </div>
+              </div>
+            </div>
+
+            {/* Highlights */}
+            <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-4 gap-6">
+              {profile.bestSeason && (
+                <div className="bg-white rounded-lg shadow-lg p-6 border-l-4 border-jbsGold">
+                  <h3 className="text-sm font-semibold text-gray-500 uppercase mb-2">Best Season</h3>
+                  <div className="text-xl font-bold text-jbsBlue">{profile.bestSeason.season}</div>
+                  <div className="text-sm text-gray-600">
+                    {formatRecord(profile.bestSeason)}, {profile.bestSeason.pointsFor.toFixed(2)} points
+                  </div>
+                </div>
+              )}
+              {profile.worstSeason && (
+                <div className="bg-white rounded-lg shadow-lg p-6 border-l-4 border-gray-300">
+                  <h3 className="text-sm font-semibold text-gray-500 uppercase mb-2">Worst Season</h3>
+                  <div className="text-xl font-bold text-jbsBlue">{profile.worstSeason.season}</div>
+                  <div className="text-sm text-gray-600">
+                    {formatRecord(profile.worstSeason)}, {profile.worstSeason.pointsFor.toFixed(2)} points
+                  </div>
+                </div>
+              )}
+              {profile.bestGame && (
+                <div className="bg-white rounded-lg shadow-lg p-6 border-l-4 border-jbsGold">
+                  <h3 className="text-sm font-semibold text-gray-500 uppercase mb-2">Best Game</h3>
+                  <div className="text-xl font-bold text-jbsBlue">{profile.bestGame.score.toFixed(2)} points</div>
+                  <div className="text-sm text-gray-600">
+                    vs {profile.bestGame.opponent} ({profile.bestGame.opponentScore.toFixed(2)}), Week{" "}
+                    {profile.bestGame.week}, {profile.bestGame.season}
+                  </div>
+                </div>
+              )}
+              <div className="bg-white rounded-lg shadow-lg p-6 border-l-4 border-jbsBlue">
+                <h3 className="text-sm font-semibold text-gray-500 uppercase mb-2">Nemesis / Victim</h3>
+                <div className="text-sm text-gray-700">
+                  <span className="font-semibold text-red-600">{profile.nemesis?.opponent ?? "-"}</span>
+                  {profile.nemesis && ` (${formatRecord(profile.nemesis)})`}
+                </div>
+                <div className="text-sm text-gray-700">
+                  <span className="font-semibold text-green-600">{profile.victim?.opponent ?? "-"}</span>
+                  {profile.victim && ` (${formatRecord(profile.victim)})`}
+                </div>
+              </div>
+            </div>
+
+            {/* Season by season and head-to-head */}
+            <div className="grid grid-cols-1 lg:grid-cols-2 gap-6">
+              <div className="bg-white rounded-lg shadow-lg overflow-hidden">
+                <h3 className="px-6 py-4 text-lg font-semibold text-jbsBlue border-b">Season by Season</h3>
+                <table className="min-w-full divide-y divide-gray-200">
+                  <thead className="bg-gray-50">
+                    <tr>
+                      <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase">Season</th>
+                      <th className="px-6 py-3 text-center text-xs font-medium text-gray-500 uppercase">Record</th>
+                      <th className="px-6 py-3 text-right text-xs font-medium text-gray-500 uppercase">PF</th>
+                      <th className="px-6 py-3 text-right text-xs font-medium text-gray-500 uppercase">PA</th>
+                    </tr>
+                  </thead>
+                  <tbody className="bg-white divide-y divide-gray-200">
+                    {[...profile.seasons].reverse().map((season) => (
+                      <tr key={season.season} className="hover:bg-gray-50">
+                        <td className="px-6 py-2 text-sm font-semibold text-jbsBlue">
+                          {season.season}
+                          {profile.championships.includes(season.season) && " 🏆"}
+                        </td>
+                        <td className="px-6 py-2 text-sm text-center text-gray-700">{formatRecord(season)}</td>
+                        <td className="px-6 py-2 text-sm text-right text-gray-700">{season.pointsFor.toFixed(2)}</td>
+                        <td className="px-6 py-2 text-sm text-right text-gray-700">{season.pointsAgainst.toFixed(2)}</td>
+                      </tr>
+                    ))}
+                  </tbody>
+                </table>
+              </div>
+
+              <div className="bg-white rounded-lg shadow-lg overflow-hidden">
+                <h3 className="px-6 py-4 text-lg font-semibold text-jbsBlue border-b">Head-to-Head</h3>
+                <table className="min-w-full divide-y divide-gray-200">
+                  <thead className="bg-gray-50">
+                    <tr>
+                      <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase">Opponent</th>
+                      <th className="px-6 py-3 text-center text-xs font-medium text-gray-500 uppercase">Record</th>
+                      <th className="px-6 py-3 text-right text-xs font-medium text-gray-500 uppercase">Win %</th>
+                    </tr>
+                  </thead>
+                  <tbody className="bg-white divide-y divide-gray-200">
+                    {profile.headToHead.map((opponent) => (
+                      <tr key={opponent.opponent} className="hover:bg-gray-50">
+                        <td className="px-6 py-2 text-sm font-semibold text-jbsBlue">{opponent.opponent}</td>
+                        <td className="px-6 py-2 text-sm text-center text-gray-700">{formatRecord(opponent)}</td>
+                        <td className="px-6 py-2 text-sm text-right text-gray-700">{formatPct(opponent.winPct)}</td>
+                      </tr>
+                    ))}
+                  </tbody>
+                </table>
+              </div>
+            </div>
+          </div>
+        )}
       </main>
     </div>
   );
@@ -4,9 +4,12 @@ export default function Navigation({ currentPage }: { currentPage?: string }) {
   const navItems = [
     { href: "/", label: "Home" },
     { href: "/championship-history", label: "Championship History" },
+    { href: "/standings", label: "Standings" },
+    { href: "/schedule", label: "Schedule" },
     { href: "/power-rankings", label: "Power Rankings" },
     { href: "/all-time-records", label: "All-Time Records" },
     { href: "/head-to-head", label: "Head-to-Head" },
+    { href: "/teams", label: "Managers" },
     { href: "/trophy-room", label: "Trophy Room" },
   ];
 
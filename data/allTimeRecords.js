@@ -142,4 +142,249 @@ export const allTimeRecords = [
       },
     ],
   },
+  {
+    category: "Longest Winning Streak",
+    top5: [
+      {
+        rank: 1,
+        holder: "Tyler",
+        record: "12 wins",
+        details: "Week 5, 2018 - Week 3, 2019",
+      },
+      {
+        rank: 2,
+        holder: "Ben",
+        record: "11 wins",
+        details: "Week 6, 2021 - Week 2, 2022",
+      },
+      {
+        rank: 3,
+        holder: "John",
+        record: "10 wins",
+        details: "Weeks 4-13, 2022",
+      },
+      {
+        rank: 4,
+        holder: "Vernon",
+        record: "9 wins",
+        details: "Week 10, 2011 - Week 5, 2012",
+      },
+      {
+        rank: 5,
+        holder: "John",
+        record: "9 wins",
+        details: "Week 6, 2017 - Week 1, 2018",
+      },
+    ],
+  },
+  {
+    category: "Longest Losing Streak",
+    top5: [
+      {
+        rank: 1,
+        holder: "Joey",
+        record: "12 losses",
+        details: "Week 13, 2017 - Week 11, 2018",
+      },
+      {
+        rank: 2,
+        holder: "Ben",
+        record: "11 losses",
+        details: "Week 10, 2024 - Week 6, 2025",
+      },
+      {
+        rank: 3,
+        holder: "Ty",
+        record: "9 losses",
+        details: "Week 9, 2010 - Week 4, 2011",
+      },
+      {
+        rank: 4,
+        holder: "Ben",
+        record: "9 losses",
+        details: "Weeks 5-13, 2014",
+      },
+      {
+        rank: 5,
+        holder: "Jason",
+        record: "9 losses",
+        details: "Weeks 1-9, 2021",
+      },
+    ],
+  },
+  {
+    category: "Longest Streak of 100+ Point Games",
+    top5: [
+      {
+        rank: 1,
+        holder: "Peter",
+        record: "38 games of 100+",
+        details: "Week 11, 2017 - Week 9, 2020",
+      },
+      {
+        rank: 2,
+        holder: "John",
+        record: "34 games of 100+",
+        details: "Week 11, 2020 - Week 3, 2023",
+      },
+      {
+        rank: 3,
+        holder: "Peter",
+        record: "32 games of 100+",
+        details: "Week 10, 2023 - Week 13, 2025",
+      },
+      {
+        rank: 4,
+        holder: "Jason",
+        record: "29 games of 100+",
+        details: "Week 1, 2018 - Week 3, 2020",
+      },
+      {
+        rank: 5,
+        holder: "Ben",
+        record: "28 games of 100+",
+        details: "Week 6, 2020 - Week 6, 2022",
+      },
+    ],
+  },
+  {
+    category: "Longest Active Streak",
+    top5: [
+      {
+        rank: 1,
+        holder: "Matt",
+        record: "14 games of 100+",
+        details: "Weeks 1-14, 2025 (active)",
+      },
+      {
+        rank: 2,
+        holder: "Jason",
+        record: "10 games of 100+",
+        details: "Weeks 5-14, 2025 (active)",
+      },
+      {
+        rank: 3,
+        holder: "John",
+        record: "6 losses",
+        details: "Weeks 9-14, 2025 (active)",
+      },
+      {
+        rank: 4,
+        holder: "Joey",
+        record: "5 games of 100+",
+        details: "Weeks 10-14, 2025 (active)",
+      },
+      {
+        rank: 5,
+        holder: "Tyler",
+        record: "4 wins",
+        details: "Weeks 11-14, 2025 (active)",
+      },
+    ],
+  },
+  {
+    category: "Largest Margin of Victory",
+    top5: [
+      {
+        rank: 1,
+        holder: "Vernon",
+        record: "131.68 points",
+        details: "191.28-59.60 vs Matt, Week 14, 2024",
+      },
+      {
+        rank: 2,
+        holder: "Ted",
+        record: "124.08 points",
+        details: "208.98-84.90 vs Lanny, Week 5, 2019",
+      },
+      {
+        rank: 3,
+        holder: "Peter",
+        record: "115.00 points",
+        details: "184.00-69.00 vs Ty, Week 9, 2010",
+      },
+      {
+        rank: 4,
+        holder: "Lanny",
+        record: "111.00 points",
+        details: "212.00-101.00 vs Ty, Week 8, 2014",
+      },
+      {
+        rank: 5,
+        holder: "Vernon",
+        record: "108.90 points",
+        details: "160.44-51.54 vs Peter, Week 2, 2022",
+      },
+    ],
+  },
+  {
+    category: "Narrowest Loss",
+    top5: [
+      {
+        rank: 1,
+        holder: "Joey",
+        record: "0.02 points",
+        details: "128.16-128.18 vs Tyler, Week 4, 2023",
+      },
+      {
+        rank: 2,
+        holder: "Vernon",
+        record: "0.04 points",
+        details: "113.20-113.24 vs Jason, Week 6, 2020",
+      },
+      {
+        rank: 3,
+        holder: "Peter",
+        record: "0.04 points",
+        details: "129.92-129.96 vs Ted, Week 8, 2021",
+      },
+      {
+        rank: 4,
+        holder: "Vernon",
+        record: "0.10 points",
+        details: "127.32-127.42 vs Lanny, Week 13, 2024",
+      },
+      {
+        rank: 5,
+        holder: "Jason",
+        record: "0.20 points",
+        details: "105.38-105.58 vs Matt, Week 10, 2024",
+      },
+    ],
+  },
+  {
+    category: "Best Record in One-Score Games",
+    top5: [
+      {
+        rank: 1,
+        holder: "Ben",
+        record: "28-16-2",
+        details: "Games decided by less than 8 points",
+      },
+      {
+        rank: 2,
+        holder: "Lanny",
+        record: "31-20-1",
+        details: "Games decided by less than 8 points",
+      },
+      {
+        rank: 3,
+        holder: "Tyler",
+        record: "23-15-1",
+        details: "Games decided by less than 8 points",
+      },
+      {
+        rank: 4,
+        holder: "Matt",
+        record: "23-20-1",
+        details: "Games decided by less than 8 points",
+      },
+      {
+        rank: 5,
+        holder: "Joey",
+        record: "19-20-1",
+        details: "Games decided by less than 8 points",
+      },
+    ],
+  },
 ];
@@ -0,0 +1,4 @@
+// JBS FFL Elo Rating History
+// Generated by scripts/elo.py - Do not edit manually
+
+export const eloHistory = {"k":20.0,"regression":0.25,"initialRating":1500.0,"managers":["Ted","Peter","Ty","Lanny","Ben","Vernon","John","Joey","Matt","Tyler","Jason"],"weeks":[[2009,1],[2009,2],[2009,3],[2009,4],[2009,5],[2009,6],[2009,7],[2009,8],[2009,9],[2009,10],[2009,11],[2009,12],[2009,13],[2010,1],[2010,2],[2010,3],[2010,4],[2010,5],[2010,6],[2010,7],[2010,8],[2010,9],[2010,10],[2010,11],[2010,12],[2010,13],[2011,1],[2011,2],[2011,3],[2011,4],[2011,5],[2011,6],[2011,7],[2011,8],[2011,9],[2011,10],[2011,11],[2011,12],[2011,13],[2012,1],[2012,2],[2012,3],[2012,4],[2012,5],[2012,6],[2012,7],[2012,8],[2012,9],[2012,10],[2012,11],[2012,12],[2012,13],[2013,1],[2013,2],[2013,3],[2013,4],[2013,5],[2013,6],[2013,7],[2013,8],[2013,9],[2013,10],[2013,11],[2013,12],[2013,13],[2014,1],[2014,2],[2014,3],[2014,4],[2014,5],[2014,6],[2014,7],[2014,8],[2014,9],[2014,10],[2014,11],[2014,12],[2014,13],[2015,1],[2015,2],[2015,3],[2015,4],[2015,5],[2015,6],[2015,7],[2015,8],[2015,9],[2015,10],[2015,11],[2015,12],[2015,13],[2016,1],[2016,2],[2016,3],[2016,4],[2016,5],[2016,6],[2016,7],[2016,8],[2016,9],[2016,10],[2016,11],[2016,12],[2016,13],[2017,1],[2017,2],[2017,3],[2017,4],[2017,5],[2017,6],[2017,7],[2017,8],[2017,9],[2017,10],[2017,11],[2017,12],[2017,13],[2018,1],[2018,2],[2018,3],[2018,4],[2018,5],[2018,6],[2018,7],[2018,8],[2018,9],[2018,10],[2018,11],[2018,12],[2018,13],[2019,1],[2019,2],[2019,3],[2019,4],[2019,5],[2019,6],[2019,7],[2019,8],[2019,9],[2019,10],[2019,11],[2019,12],[2019,13],[2020,1],[2020,2],[2020,3],[2020,4],[2020,5],[2020,6],[2020,7],[2020,8],[2020,9],[2020,10],[2020,11],[2020,12],[2020,13],[2021,1],[2021,2],[2021,3],[2021,4],[2021,5],[2021,6],[2021,7],[2021,8],[2021,9],[2021,10],[2021,11],[2021,12],[2021,13],[2021,14],[2022,1],[2022,2],[2022,3],[2022,4],[2022,5],[2022,6],[2022,7],[2022,8],[2022,9],[2022,10],[2022,11],[2022,12],[2022,13],[2022,14],[2023,1],[2023,2],[2023,3],[2023,4],[2023,5],[2023,6],[2023,7],[2023,8],[2023,9],[2023,10],[2023,11],[2023,12],[2023,13],[2023,14],[2024,1],[2024,2],[2024,3],[2024,4],[2024,5],[2024,6],[2024,7],[2024,8],[2024,9],[2024,10],[2024,11],[2024,12],[2024,13],[2024,14],[2025,1],[2025,2],[2025,3],[2025,4],[2025,5],[2025,6],[2025,7],[2025,8],[2025,9],[2025,10],[2025,11],[2025,12],[2025,13],[2025,14]],"ratings":[[1490.0,1510.0,1490.0,1510.0,1490.0,1510.0,1510.0,1490.0,1510.0,1490.0,null],[1500.0,1509.4,1480.0,1500.0,1490.6,1519.4,1520.0,1480.6,1519.4,1480.6,null],[1490.0,1518.6,1470.3,1510.0,1500.3,1529.4,1518.9,1471.4,1509.4,1481.7,null],[1500.3,1528.3,1481.4,1500.2,1490.0,1529.1,1519.2,1481.7,1498.3,1471.4,null],[1509.5,1537.0,1472.8,1510.0,1480.3,1537.8,1528.6,1473.1,1488.9,1462.2,null],[1520.3,1526.2,1463.0,1520.8,1490.1,1527.0,1516.7,1463.5,1498.4,1474.1,null],[1528.6,1535.2,1454.6,1510.1,1481.1,1536.7,1507.0,1473.8,1509.1,1463.8,null],[1517.3,1524.4,1446.2,1518.5,1492.5,1544.9,1517.8,1465.6,1517.8,1455.1,null],[1527.3,1532.2,1438.4,1508.5,1501.4,1534.1,1506.3,1477.1,1528.6,1446.2,null],[1515.9,1522.1,1430.3,1518.3,1491.6,1541.6,1514.4,1488.5,1538.7,1438.7,null],[1526.6,1531.9,1420.6,1508.4,1481.5,1530.9,1505.1,1498.6,1548.0,1448.4,null],[1517.2,1519.6,1413.7,1498.1,1472.2,1537.8,1514.4,1508.9,1557.4,1460.8,null],[1507.1,1510.1,1426.3,1487.0,1464.6,1547.3,1524.5,1496.2,1565.0,1471.9,null],[1515.4,1497.5,1436.1,1499.0,1485.2,1523.7,1527.7,1487.8,1536.7,1490.9,null],[1523.2,1507.2,1428.3,1489.8,1475.6,1512.8,1536.9,1479.2,1545.3,1501.8,null],[1512.2,1496.4,1419.6,1500.8,1484.2,1503.7,1545.9,1490.0,1554.4,1492.8,null],[1501.4,1506.5,1433.3,1490.6,1495.0,1514.9,1534.7,1500.1,1540.7,1482.7,null],[1510.9,1494.4,1445.4,1480.8,1504.9,1524.5,1544.9,1490.5,1530.5,1473.3,null],[1500.4,1504.9,1437.1,1472.0,1513.2,1533.2,1552.8,1501.6,1519.4,1465.3,null],[1488.6,1515.1,1448.9,1463.4,1502.9,1543.8,1542.3,1490.6,1528.0,1476.4,null],[1479.0,1525.9,1459.3,1453.0,1512.5,1552.3,1531.5,1482.1,1536.6,1467.8,null],[1488.3,1534.0,1451.2,1443.7,1521.3,1541.8,1520.1,1493.5,1547.0,1459.1,null],[1478.4,1524.4,1443.2,1455.9,1509.1,1529.5,1528.1,1503.4,1556.6,1471.4,null],[1469.9,1532.4,1434.0,1447.8,1498.9,1538.0,1519.0,1513.5,1565.8,1480.6,null],[1462.6,1541.0,1426.9,1439.7,1489.5,1545.1,1528.4,1521.7,1573.1,1472.1,null],[1454.4,1551.1,1419.6,1450.6,1501.8,1535.0,1536.5,1529.0,1560.8,1461.2,null],[1457.9,1546.3,1430.3,1472.3,1512.1,1515.5,1517.2,1531.9,1533.5,1483.0,null],[1467.1,1535.3,1421.1,1483.6,1523.1,1524.6,1505.9,1542.0,1523.4,1473.9,null],[1457.6,1525.5,1414.0,1493.1,1530.2,1534.6,1515.0,1551.8,1513.4,1464.9,null],[1449.6,1514.5,1406.8,1504.0,1538.2,1544.0,1505.6,1539.3,1520.7,1477.3,null],[1440.4,1501.5,1419.8,1495.0,1547.2,1553.9,1496.0,1529.5,1530.2,1486.5,null],[1432.2,1509.8,1433.3,1486.7,1533.7,1562.2,1485.7,1539.5,1520.2,1496.8,null],[1442.2,1520.5,1423.3,1477.7,1523.0,1550.0,1497.9,1548.3,1529.2,1488.0,null],[1434.5,1529.8,1414.8,1486.1,1530.7,1540.0,1488.5,1558.3,1518.1,1499.2,null],[1426.0,1536.6,1408.0,1494.6,1519.8,1529.3,1480.5,1566.3,1528.7,1510.1,null],[1419.8,1546.4,1400.1,1505.4,1509.1,1538.8,1488.5,1572.5,1518.9,1500.6,null],[1413.1,1535.2,1392.9,1516.5,1510.9,1545.5,1499.3,1570.7,1508.0,1507.8,null],[1425.8,1524.4,1387.0,1528.1,1520.5,1551.4,1489.7,1559.1,1495.4,1518.6,null],[1437.6,1515.2,1381.6,1537.8,1529.8,1560.6,1477.9,1564.6,1486.1,1508.9,null],[1464.8,1499.8,1424.4,1515.1,1513.0,1554.8,1495.2,1536.6,1500.1,1496.2,null],[1473.7,1490.1,1415.6,1524.5,1522.6,1563.1,1485.8,1525.5,1511.1,1487.8,null],[1485.1,1501.1,1428.6,1513.1,1509.7,1571.6,1495.9,1514.5,1502.6,1477.8,null],[1475.8,1491.5,1420.7,1522.7,1519.0,1579.5,1488.0,1523.5,1510.5,1468.8,null],[1465.6,1479.5,1432.7,1532.6,1509.1,1587.9,1478.7,1515.0,1519.9,1479.0,null],[1476.0,1469.1,1444.9,1544.2,1496.9,1576.3,1488.7,1525.2,1509.7,1469.0,null],[1465.1,1459.9,1455.8,1553.2,1506.1,1583.8,1481.1,1513.6,1500.7,1480.6,null],[1476.3,1470.5,1468.5,1540.5,1494.9,1571.8,1470.5,1525.6,1510.1,1471.2,null],[1468.1,1460.4,1478.5,1548.7,1504.2,1560.1,1482.1,1514.0,1521.9,1461.9,null],[1479.5,1472.2,1468.7,1537.4,1515.5,1567.3,1492.0,1502.7,1510.1,1454.6,null],[1491.9,1464.0,1458.2,1545.5,1505.1,1554.8,1482.5,1513.1,1519.6,1465.0,null],[1502.7,1474.1,1451.0,1554.6,1514.5,1562.1,1473.2,1504.0,1508.8,1455.0,null],[1491.9,1486.6,1442.5,1561.8,1524.3,1549.7,1484.0,1512.5,1499.0,1447.8,null],[1503.8,1480.0,1469.4,1533.8,1528.8,1526.7,1478.6,1518.7,1488.1,1472.0,null],[1492.8,1471.4,1480.4,1542.3,1537.4,1535.1,1470.2,1507.9,1499.0,1463.5,null],[1504.2,1482.5,1472.0,1530.8,1545.8,1544.1,1460.0,1496.8,1490.1,1473.7,null],[1495.4,1493.9,1462.5,1519.5,1554.6,1551.7,1452.4,1486.2,1499.5,1484.4,null],[1485.1,1503.0,1453.4,1530.5,1543.6,1539.9,1443.7,1498.0,1508.2,1494.7,null],[1485.6,1502.4,1445.9,1520.7,1551.0,1549.6,1435.2,1508.3,1497.9,1503.2,null],[1494.5,1493.8,1437.1,1510.1,1559.6,1556.4,1428.4,1518.2,1508.5,1493.4,null],[1486.3,1482.0,1429.2,1518.0,1567.8,1565.3,1440.2,1509.3,1498.1,1503.8,null],[1477.2,1470.5,1440.7,1527.1,1576.0,1573.4,1452.2,1497.3,1490.0,1495.6,null],[1467.8,1481.0,1431.0,1538.5,1564.6,1581.2,1461.9,1506.7,1479.5,1487.8,null],[1481.0,1492.7,1442.6,1526.9,1572.9,1568.0,1472.4,1498.4,1469.0,1476.2,null],[1470.6,1482.2,1436.1,1516.0,1560.1,1574.6,1485.2,1509.2,1479.3,1486.7,null],[1481.0,1494.8,1428.2,1525.2,1567.8,1562.0,1474.8,1517.1,1471.6,1477.5,null],[1476.1,1505.8,1438.2,1526.8,1560.7,1536.6,1472.0,1521.9,1468.8,1493.0,null],[1485.0,1497.4,1429.3,1535.3,1569.2,1525.4,1463.6,1530.4,1460.3,1504.3,null],[1486.4,1488.3,1423.1,1533.8,1575.4,1533.5,1454.7,1539.5,1452.2,1513.1,null],[1478.9,1479.6,1433.9,1542.5,1582.8,1521.3,1466.9,1528.7,1441.3,1523.9,null],[1490.2,1488.3,1425.2,1553.7,1571.7,1531.5,1456.2,1518.5,1452.1,1512.6,null],[1500.2,1478.4,1439.2,1563.0,1557.7,1522.1,1447.8,1506.6,1464.0,1521.0,null],[1508.4,1490.6,1430.9,1570.3,1545.5,1510.0,1459.9,1497.0,1456.7,1530.6,null],[1519.5,1499.7,1424.8,1576.5,1534.4,1499.7,1450.8,1507.4,1468.8,1518.5,null],[1511.1,1507.6,1416.9,1584.8,1523.9,1488.8,1442.4,1515.8,1479.7,1528.9,null],[1501.2,1496.8,1407.6,1593.1,1515.7,1479.9,1451.7,1525.6,1490.5,1537.8,null],[1510.6,1509.5,1401.2,1580.4,1506.0,1470.5,1462.8,1535.4,1479.4,1544.2,null],[1499.7,1520.5,1393.2,1569.1,1494.7,1478.6,1474.0,1546.6,1490.3,1533.2,null],[1489.0,1509.3,1387.3,1558.1,1484.6,1489.8,1484.8,1552.5,1500.4,1544.2,null],[1482.2,1516.5,1429.0,1530.0,1498.6,1482.2,1500.0,1527.9,1511.3,1522.2,null],[1493.5,1526.4,1441.0,1519.1,1509.5,1473.4,1488.0,1516.6,1501.4,1531.1,null],[1502.0,1515.9,1432.5,1508.2,1520.0,1465.0,1498.9,1506.2,1511.9,1539.4,null],[1510.9,1525.7,1445.5,1498.5,1529.6,1456.1,1509.3,1496.6,1501.5,1526.5,null],[1520.6,1514.8,1437.9,1488.8,1537.2,1447.4,1499.8,1507.4,1510.2,1536.0,null],[1530.3,1505.4,1448.2,1499.4,1546.1,1437.1,1490.9,1496.9,1500.5,1545.3,null],[1540.7,1515.3,1439.7,1489.5,1535.7,1428.6,1499.3,1488.3,1509.0,1554.0,null],[1529.5,1522.8,1431.0,1481.4,1524.9,1421.1,1510.5,1496.9,1519.8,1562.1,null],[1520.5,1530.2,1423.6,1492.6,1513.6,1433.2,1500.8,1484.7,1529.5,1571.2,null],[1530.8,1520.0,1436.2,1480.9,1501.1,1444.9,1492.8,1496.0,1518.2,1579.2,null],[1538.1,1529.4,1428.8,1472.0,1491.7,1436.3,1501.4,1508.4,1527.1,1566.8,null],[1526.8,1538.6,1440.1,1460.7,1503.0,1428.3,1492.2,1516.3,1518.3,1575.7,null],[1534.9,1545.9,1432.8,1452.6,1515.0,1420.9,1482.9,1525.6,1525.7,1563.6,null],[1516.4,1544.2,1460.0,1454.0,1519.3,1432.7,1498.1,1508.3,1530.1,1536.9,null],[1526.2,1533.8,1451.1,1445.9,1527.4,1445.6,1507.0,1498.5,1540.5,1524.0,null],[1534.1,1543.6,1443.3,1457.6,1517.6,1437.8,1495.3,1509.7,1529.3,1531.8,null],[1541.3,1531.1,1455.8,1470.1,1507.4,1430.5,1506.2,1520.0,1518.3,1519.3,null],[1529.3,1540.8,1467.2,1482.1,1495.9,1443.0,1516.6,1510.3,1505.9,1508.9,null],[1518.7,1549.9,1456.5,1492.9,1486.5,1453.7,1526.0,1499.5,1516.5,1499.8,null],[1527.7,1538.3,1448.2,1504.5,1477.4,1445.7,1534.0,1509.5,1524.8,1489.8,null],[1537.9,1525.7,1460.0,1514.1,1488.8,1458.3,1523.8,1497.7,1513.5,1480.2,null],[1526.3,1533.8,1451.9,1523.4,1479.5,1469.4,1533.5,1486.6,1503.8,1491.9,null],[1536.5,1523.6,1462.6,1531.8,1468.7,1461.0,1542.3,1477.1,1513.3,1483.1,null],[1544.4,1532.0,1454.7,1521.3,1460.3,1453.3,1550.0,1467.3,1523.8,1492.9,null],[1532.0,1522.5,1446.6,1529.4,1472.7,1463.7,1559.5,1456.9,1532.9,1483.8,null],[1541.9,1530.4,1438.8,1519.5,1463.0,1455.7,1566.6,1449.7,1541.0,1493.5,null],[1519.8,1533.0,1454.1,1524.2,1483.9,1457.6,1537.5,1474.8,1520.5,1504.3,1490.4],[1510.1,1542.6,1454.1,1513.6,1494.1,1449.8,1545.2,1486.1,1509.2,1514.9,1480.2],[1519.5,1550.9,1454.1,1503.1,1504.7,1451.5,1534.4,1476.8,1507.5,1525.7,1472.0],[1528.1,1539.5,1454.1,1514.4,1495.5,1462.2,1543.5,1466.0,1498.0,1535.2,1463.4],[1517.7,1528.2,1454.1,1524.8,1506.8,1452.3,1532.2,1458.0,1509.3,1543.2,1473.3],[1508.4,1516.1,1454.1,1514.4,1515.4,1464.4,1540.5,1449.4,1519.8,1552.5,1465.0],[1498.8,1506.8,1454.1,1502.9,1506.4,1475.8,1549.8,1439.9,1529.4,1561.4,1474.6],[1488.1,1514.9,1454.1,1494.3,1497.1,1486.5,1558.5,1431.8,1538.8,1549.0,1487.0],[1478.3,1524.4,1454.1,1504.1,1487.6,1498.3,1565.0,1425.3,1547.3,1537.2,1478.5],[1488.6,1514.7,1454.1,1513.4,1477.4,1490.2,1573.1,1418.6,1553.9,1546.8,1469.2],[1499.3,1504.0,1454.1,1500.7,1467.1,1502.0,1582.3,1431.3,1542.1,1537.6,1479.5],[1491.6,1513.3,1454.1,1489.7,1478.1,1490.0,1590.0,1443.3,1552.0,1527.7,1470.2],[1501.0,1522.6,1454.1,1480.4,1488.4,1479.6,1598.9,1435.7,1543.1,1535.3,1460.8],[1510.5,1507.4,1465.6,1494.9,1481.6,1475.9,1580.8,1445.1,1541.9,1535.3,1461.0],[1500.4,1517.5,1465.6,1486.1,1471.0,1488.9,1567.9,1437.9,1549.1,1544.2,1471.6],[1508.6,1526.2,1465.6,1475.6,1481.4,1480.6,1577.2,1429.6,1557.4,1534.8,1462.9],[1517.3,1534.7,1465.6,1467.1,1494.1,1489.1,1564.5,1421.1,1566.8,1525.5,1454.2],[1525.9,1543.6,1465.6,1458.5,1485.3,1498.1,1574.6,1414.0,1556.7,1532.6,1445.2],[1516.1,1552.3,1465.6,1451.3,1493.3,1489.4,1581.0,1406.0,1564.0,1542.4,1438.8],[1527.4,1563.1,1465.6,1442.3,1484.7,1498.3,1570.2,1397.0,1552.6,1551.0,1447.8],[1536.6,1568.6,1465.6,1435.9,1476.6,1489.2,1576.7,1391.4,1560.7,1558.1,1440.7],[1523.8,1576.1,1465.6,1448.7,1469.2,1481.1,1581.8,1386.3,1547.3,1566.1,1454.1],[1532.2,1565.8,1465.6,1438.8,1460.7,1473.9,1589.0,1380.6,1553.0,1576.4,1463.9],[1523.2,1574.8,1465.6,1447.2,1450.8,1466.2,1578.6,1372.3,1560.8,1586.8,1473.8],[1534.8,1562.0,1465.6,1437.3,1460.7,1453.5,1567.0,1384.9,1551.5,1596.0,1486.6],[1543.4,1548.5,1465.6,1450.7,1470.5,1443.7,1556.6,1380.4,1562.0,1600.6,1478.0],[1541.0,1546.7,1474.2,1453.6,1469.5,1451.1,1548.8,1403.9,1536.2,1582.2,1492.9],[1531.2,1556.5,1474.2,1447.2,1460.1,1463.8,1536.1,1417.5,1522.5,1588.7,1502.2],[1518.0,1565.0,1474.2,1437.5,1469.8,1475.5,1527.6,1430.7,1510.9,1597.1,1493.8],[1507.3,1571.5,1474.2,1431.1,1481.4,1464.2,1515.9,1442.0,1523.3,1584.7,1504.5],[1515.1,1558.9,1474.2,1423.2,1493.9,1475.4,1526.1,1455.9,1513.1,1570.8,1493.3],[1526.7,1546.6,1474.2,1435.8,1502.8,1487.7,1515.2,1447.0,1500.6,1559.2,1504.3],[1536.0,1555.7,1474.2,1427.2,1514.5,1496.2,1506.1,1438.6,1491.3,1547.6,1512.6],[1544.8,1542.4,1474.2,1419.5,1503.8,1487.4,1513.8,1451.8,1502.0,1536.6,1523.6],[1551.4,1551.3,1474.2,1412.9,1494.9,1478.8,1502.1,1463.6,1492.6,1545.2,1533.0],[1559.8,1561.1,1474.2,1406.3,1486.5,1469.5,1511.4,1474.4,1481.8,1535.4,1539.7],[1549.8,1571.1,1474.2,1398.2,1478.0,1459.8,1502.1,1482.5,1491.4,1544.7,1548.2],[1538.4,1560.4,1474.2,1390.4,1485.8,1450.5,1513.5,1491.8,1502.9,1533.2,1558.8],[1549.0,1545.9,1474.2,1405.0,1494.8,1441.5,1503.2,1483.0,1513.2,1542.0,1548.3],[1526.7,1544.5,1480.6,1419.5,1507.2,1465.3,1492.6,1478.5,1519.7,1540.2,1525.0],[1536.5,1532.3,1480.6,1432.9,1516.8,1477.6,1483.0,1469.9,1509.9,1526.9,1533.7],[1525.9,1542.1,1480.6,1443.9,1527.4,1488.5,1474.5,1458.8,1499.0,1517.0,1542.3],[1536.4,1529.7,1480.6,1434.8,1536.5,1499.3,1483.6,1471.2,1489.8,1506.2,1531.8],[1524.9,1517.1,1480.6,1447.5,1525.7,1488.5,1495.1,1482.0,1481.0,1517.1,1540.6],[1513.7,1527.3,1480.6,1438.4,1515.4,1480.0,1485.7,1493.2,1490.0,1526.5,1549.1],[1522.7,1516.1,1480.6,1431.5,1524.8,1471.0,1496.9,1483.8,1501.1,1515.4,1556.0],[1510.1,1525.7,1480.6,1444.1,1513.3,1482.5,1486.5,1494.2,1491.5,1506.6,1564.9],[1520.0,1513.4,1480.6,1456.4,1524.7,1492.8,1496.7,1483.9,1481.4,1496.7,1553.4],[1528.9,1504.5,1480.6,1447.4,1533.9,1501.8,1487.5,1474.2,1472.5,1506.3,1562.2],[1519.1,1494.5,1480.6,1459.1,1543.8,1511.9,1479.6,1484.2,1462.5,1494.6,1570.1],[1510.5,1504.5,1480.6,1449.8,1551.5,1520.9,1470.5,1493.5,1454.8,1484.6,1578.7],[1519.4,1494.2,1480.6,1442.7,1558.6,1529.9,1461.7,1503.8,1448.3,1475.7,1585.2],[1524.2,1504.5,1485.5,1448.1,1554.6,1531.3,1461.0,1493.2,1471.5,1472.9,1553.4],[1535.1,1515.3,1485.5,1459.4,1543.7,1520.5,1471.3,1481.9,1483.8,1462.6,1541.0],[1543.6,1523.8,1485.5,1451.8,1551.3,1529.4,1483.3,1473.0,1475.3,1454.1,1529.1],[1551.9,1533.9,1485.5,1464.0,1539.1,1517.2,1475.0,1462.5,1487.4,1464.6,1518.9],[1560.9,1541.9,1485.5,1474.0,1527.3,1506.3,1486.8,1454.5,1498.3,1454.6,1509.9],[1548.0,1531.5,1485.5,1484.4,1537.7,1516.4,1476.5,1465.7,1487.0,1467.6,1499.8],[1536.2,1519.9,1485.5,1496.2,1547.1,1507.0,1488.0,1476.7,1476.5,1478.1,1488.8],[1545.7,1510.4,1485.5,1485.6,1555.1,1516.5,1478.6,1468.7,1487.0,1488.4,1478.5],[1554.9,1519.2,1485.5,1475.7,1563.0,1507.3,1488.8,1459.9,1476.8,1498.4,1470.6],[1545.1,1507.9,1485.5,1486.9,1572.7,1517.1,1498.0,1450.7,1466.6,1488.6,1480.8],[1552.9,1498.2,1485.5,1495.9,1580.3,1526.8,1507.5,1441.8,1458.8,1481.0,1471.3],[1561.6,1487.7,1485.5,1505.2,1587.0,1534.4,1498.8,1434.2,1452.2,1491.5,1462.0],[1568.8,1496.7,1485.5,1496.0,1594.5,1543.6,1491.3,1445.8,1443.2,1479.9,1454.8],[1555.4,1505.5,1485.5,1488.8,1601.7,1550.8,1481.0,1459.2,1436.0,1490.2,1446.0],[1529.5,1513.8,1489.1,1482.0,1583.1,1546.8,1494.8,1481.5,1443.0,1483.9,1452.7],[1521.0,1504.7,1489.1,1471.9,1591.5,1555.8,1504.4,1491.5,1453.3,1474.2,1442.5],[1509.1,1493.8,1489.1,1485.3,1578.2,1544.0,1492.7,1503.3,1465.2,1485.1,1454.2],[1498.6,1502.7,1489.1,1496.9,1585.1,1532.3,1503.1,1492.8,1458.3,1495.6,1445.4],[1487.1,1512.4,1489.1,1486.9,1572.8,1540.2,1515.5,1483.1,1450.4,1505.7,1456.9],[1497.6,1524.1,1489.1,1477.7,1561.0,1527.9,1524.6,1492.1,1441.4,1495.1,1469.2],[1507.1,1514.1,1489.1,1468.3,1550.1,1538.8,1534.6,1481.5,1432.9,1503.6,1479.9],[1517.3,1503.9,1489.1,1457.3,1538.1,1528.7,1544.7,1493.4,1443.9,1512.9,1470.6],[1527.6,1513.6,1489.1,1448.9,1526.2,1518.4,1551.9,1483.7,1436.7,1521.3,1482.5],[1517.6,1521.8,1489.1,1440.7,1536.3,1528.5,1560.0,1475.7,1448.0,1511.3,1471.2],[1505.6,1532.0,1489.1,1451.7,1525.5,1518.3,1567.5,1464.7,1460.0,1522.0,1463.7],[1497.3,1521.7,1489.1,1442.0,1533.7,1526.7,1575.7,1456.2,1451.9,1532.3,1473.3],[1486.7,1509.7,1489.1,1454.4,1524.9,1514.3,1584.5,1448.3,1463.9,1540.1,1484.0],[1475.6,1499.0,1489.1,1446.4,1532.9,1522.9,1573.2,1459.4,1455.3,1551.4,1494.8],[1491.3,1508.1,1491.8,1451.0,1533.8,1507.8,1562.4,1459.9,1459.0,1547.9,1486.9],[1502.5,1498.1,1491.8,1461.2,1522.6,1517.8,1572.0,1449.7,1449.8,1538.3,1496.1],[1491.0,1489.2,1491.8,1473.0,1510.9,1505.9,1559.9,1461.6,1461.3,1547.2,1508.2],[1503.0,1499.8,1491.8,1463.9,1499.5,1514.9,1547.9,1454.0,1472.7,1554.8,1497.7],[1492.8,1488.5,1491.8,1476.5,1490.8,1503.7,1556.5,1465.3,1483.9,1542.2,1507.9],[1484.2,1478.6,1491.8,1468.7,1500.8,1493.8,1564.3,1475.9,1473.4,1550.8,1517.7],[1473.8,1491.0,1491.8,1479.2,1510.6,1484.0,1551.8,1467.1,1465.6,1558.6,1526.5],[1484.3,1480.5,1491.8,1468.8,1519.3,1496.0,1539.9,1458.3,1476.0,1567.7,1517.5],[1474.6,1469.8,1491.8,1461.6,1529.3,1505.6,1528.1,1468.9,1487.8,1574.9,1507.5],[1486.2,1479.6,1491.8,1451.8,1517.7,1497.6,1516.4,1480.6,1498.3,1582.9,1496.9],[1476.5,1490.1,1491.8,1442.6,1509.6,1487.1,1525.9,1489.8,1508.0,1591.1,1487.5],[1487.9,1482.9,1491.8,1453.9,1499.5,1477.1,1514.4,1499.7,1518.0,1598.3,1476.2],[1477.6,1494.0,1491.8,1444.6,1510.0,1486.5,1504.0,1492.5,1507.0,1605.5,1486.6],[1468.0,1483.7,1491.8,1456.4,1498.1,1497.1,1496.9,1502.1,1496.4,1612.7,1496.8],[1466.8,1497.2,1493.9,1457.9,1508.5,1510.2,1487.6,1510.8,1507.3,1572.1,1487.6],[1458.0,1507.6,1493.9,1449.4,1517.3,1499.9,1480.0,1519.3,1516.8,1579.7,1478.2],[1469.6,1519.6,1493.9,1461.4,1505.4,1490.4,1470.0,1528.7,1505.1,1567.6,1488.2],[1479.6,1508.7,1493.9,1472.2,1515.4,1479.6,1460.0,1539.9,1495.1,1556.5,1499.1],[1490.2,1519.6,1493.9,1464.6,1503.8,1470.0,1471.5,1529.0,1504.7,1564.1,1488.6],[1502.3,1529.2,1493.9,1474.8,1494.3,1460.6,1461.3,1538.3,1495.4,1552.0,1498.0],[1491.5,1537.2,1493.9,1485.6,1503.3,1451.5,1453.3,1527.1,1507.0,1540.4,1509.2],[1482.8,1545.9,1493.9,1496.2,1514.0,1461.6,1443.2,1516.4,1496.4,1549.5,1500.1],[1492.2,1535.1,1493.9,1487.7,1523.6,1452.2,1434.7,1527.3,1504.8,1558.0,1490.5],[1503.1,1543.7,1493.9,1479.1,1512.7,1465.2,1427.3,1534.7,1514.4,1545.0,1480.9],[1493.4,1531.5,1493.9,1490.6,1503.6,1477.4,1418.9,1523.1,1524.1,1554.1,1489.4],[1501.3,1522.2,1493.9,1480.6,1494.2,1488.7,1411.0,1511.8,1533.5,1563.5,1499.4],[1511.3,1532.5,1493.9,1490.8,1481.9,1478.5,1423.3,1523.3,1523.2,1552.0,1489.5],[1501.6,1521.3,1493.9,1500.6,1472.1,1489.7,1416.9,1532.9,1511.9,1558.4,1500.7],[1511.9,1525.5,1495.4,1490.9,1469.7,1483.8,1429.7,1514.0,1516.9,1552.4,1509.9],[1520.7,1534.3,1495.4,1501.5,1460.9,1475.0,1423.1,1503.3,1526.7,1559.0,1500.1],[1510.8,1545.0,1495.4,1510.4,1452.1,1465.8,1435.2,1512.5,1536.5,1548.3,1487.9],[1518.7,1553.4,1495.4,1499.1,1444.5,1477.1,1427.4,1503.6,1544.1,1557.2,1479.6],[1527.6,1542.0,1495.4,1490.8,1434.0,1489.0,1437.9,1515.0,1532.2,1565.6,1470.7],[1538.7,1548.9,1495.4,1479.3,1427.0,1478.4,1449.4,1505.5,1541.7,1554.5,1481.2],[1527.0,1536.2,1495.4,1490.9,1438.5,1467.0,1462.2,1514.8,1532.1,1564.1,1471.9],[1517.2,1545.9,1495.4,1482.1,1430.6,1456.8,1472.3,1522.6,1540.9,1571.5,1464.5],[1525.5,1555.2,1495.4,1474.6,1421.6,1448.6,1464.3,1513.3,1549.0,1579.0,1473.5],[1512.6,1562.9,1495.4,1466.9,1434.5,1462.1,1455.7,1521.9,1556.8,1565.4,1465.7],[1503.9,1570.1,1495.4,1458.5,1428.1,1455.0,1446.0,1530.3,1565.6,1571.8,1475.4],[1512.2,1560.2,1495.4,1449.0,1441.9,1447.1,1437.6,1538.2,1551.8,1581.8,1484.9],[1521.4,1569.9,1495.4,1438.9,1451.7,1457.2,1427.7,1529.4,1542.1,1590.5,1475.7],[1511.7,1557.3,1495.4,1449.3,1441.4,1469.6,1422.1,1539.2,1529.7,1596.2,1488.3]],"current":[{"manager":"Tyler","rating":1596.2,"peak":1612.7,"peakSeason":2023,"peakWeek":14},{"manager":"Peter","rating":1557.3,"peak":1576.1,"peakSeason":2018,"peakWeek":9},{"manager":"Joey","rating":1539.2,"peak":1572.5,"peakSeason":2011,"peakWeek":10},{"manager":"Matt","rating":1529.7,"peak":1573.1,"peakSeason":2010,"peakWeek":12},{"manager":"Ted","rating":1511.7,"peak":1568.8,"peakSeason":2021,"peakWeek":13},{"manager":"Ty","rating":1495.4,"peak":1495.4,"peakSeason":2025,"peakWeek":1},{"manager":"Jason","rating":1488.3,"peak":1585.2,"peakSeason":2020,"peakWeek":13},{"manager":"Vernon","rating":1469.6,"peak":1587.9,"peakSeason":2012,"peakWeek":5},{"manager":"Lanny","rating":1449.3,"peak":1593.1,"peakSeason":2014,"peakWeek":10},{"manager":"Ben","rating":1441.4,"peak":1601.7,"peakSeason":2021,"peakWeek":14},{"manager":"John","rating":1422.1,"peak":1598.9,"peakSeason":2017,"peakWeek":13}]};
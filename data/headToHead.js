@@ -2,14 +2,6 @@
 // Generated from ESPN scraped data
 
 export const headToHeadRecords = [
-  {
-    manager1: "Joey",
-    manager2: "Tyler",
-    manager1Wins: 12,
-    manager2Wins: 22,
-    ties: 0,
-    record: "12-22",
-  },
   {
     manager1: "Ben",
     manager2: "Ted",
@@ -19,29 +11,37 @@ export const headToHeadRecords = [
     record: "19-15",
   },
   {
-    manager1: "Lanny",
-    manager2: "Peter",
-    manager1Wins: 13,
-    manager2Wins: 21,
+    manager1: "Joey",
+    manager2: "Tyler",
+    manager1Wins: 12,
+    manager2Wins: 22,
     ties: 0,
-    record: "13-21",
+    record: "12-22",
   },
   {
-    manager1: "John",
-    manager2: "Matt",
+    manager1: "Joey",
+    manager2: "Vernon",
     manager1Wins: 16,
     manager2Wins: 18,
     ties: 0,
     record: "16-18",
   },
   {
-    manager1: "Joey",
-    manager2: "Vernon",
+    manager1: "John",
+    manager2: "Matt",
     manager1Wins: 16,
     manager2Wins: 18,
     ties: 0,
     record: "16-18",
   },
+  {
+    manager1: "Lanny",
+    manager2: "Peter",
+    manager1Wins: 13,
+    manager2Wins: 21,
+    ties: 0,
+    record: "13-21",
+  },
   {
     manager1: "Tyler",
     manager2: "Vernon",
@@ -50,6 +50,14 @@ export const headToHeadRecords = [
     ties: 0,
     record: "15-19",
   },
+  {
+    manager1: "Ben",
+    manager2: "Lanny",
+    manager1Wins: 15,
+    manager2Wins: 18,
+    ties: 0,
+    record: "15-18",
+  },
   {
     manager1: "John",
     manager2: "Tyler",
@@ -66,38 +74,6 @@ export const headToHeadRecords = [
     ties: 1,
     record: "15-17-1",
   },
-  {
-    manager1: "Ben",
-    manager2: "Lanny",
-    manager1Wins: 15,
-    manager2Wins: 18,
-    ties: 0,
-    record: "15-18",
-  },
-  {
-    manager1: "Peter",
-    manager2: "Ted",
-    manager1Wins: 15,
-    manager2Wins: 12,
-    ties: 1,
-    record: "15-12-1",
-  },
-  {
-    manager1: "Lanny",
-    manager2: "Ted",
-    manager1Wins: 16,
-    manager2Wins: 11,
-    ties: 1,
-    record: "16-11-1",
-  },
-  {
-    manager1: "Joey",
-    manager2: "Matt",
-    manager1Wins: 16,
-    manager2Wins: 12,
-    ties: 0,
-    record: "16-12",
-  },
   {
     manager1: "Ben",
     manager2: "Peter",
@@ -106,14 +82,6 @@ export const headToHeadRecords = [
     ties: 1,
     record: "11-16-1",
   },
-  {
-    manager1: "Matt",
-    manager2: "Tyler",
-    manager1Wins: 15,
-    manager2Wins: 13,
-    ties: 0,
-    record: "15-13",
-  },
   {
     manager1: "Joey",
     manager2: "John",
@@ -122,6 +90,14 @@ export const headToHeadRecords = [
     ties: 0,
     record: "14-14",
   },
+  {
+    manager1: "Joey",
+    manager2: "Matt",
+    manager1Wins: 16,
+    manager2Wins: 12,
+    ties: 0,
+    record: "16-12",
+  },
   {
     manager1: "John",
     manager2: "Vernon",
@@ -131,28 +107,36 @@ export const headToHeadRecords = [
     record: "13-14-1",
   },
   {
-    manager1: "Matt",
+    manager1: "Lanny",
     manager2: "Ted",
-    manager1Wins: 13,
-    manager2Wins: 10,
-    ties: 0,
-    record: "13-10",
+    manager1Wins: 16,
+    manager2Wins: 11,
+    ties: 1,
+    record: "16-11-1",
   },
   {
-    manager1: "Peter",
+    manager1: "Matt",
     manager2: "Tyler",
-    manager1Wins: 10,
+    manager1Wins: 15,
     manager2Wins: 13,
     ties: 0,
-    record: "10-13",
+    record: "15-13",
   },
   {
-    manager1: "Lanny",
-    manager2: "Tyler",
-    manager1Wins: 9,
-    manager2Wins: 14,
+    manager1: "Peter",
+    manager2: "Ted",
+    manager1Wins: 15,
+    manager2Wins: 12,
+    ties: 1,
+    record: "15-12-1",
+  },
+  {
+    manager1: "Ben",
+    manager2: "John",
+    manager1Wins: 10,
+    manager2Wins: 13,
     ties: 0,
-    record: "9-14",
+    record: "10-13",
   },
   {
     manager1: "Ben",
@@ -171,45 +155,61 @@ export const headToHeadRecords = [
     record: "11-12",
   },
   {
-    manager1: "Peter",
-    manager2: "Vernon",
+    manager1: "Joey",
+    manager2: "Peter",
     manager1Wins: 11,
     manager2Wins: 12,
     ties: 0,
     record: "11-12",
   },
+  {
+    manager1: "John",
+    manager2: "Ted",
+    manager1Wins: 10,
+    manager2Wins: 13,
+    ties: 0,
+    record: "10-13",
+  },
   {
     manager1: "Lanny",
-    manager2: "Vernon",
+    manager2: "Tyler",
     manager1Wins: 9,
     manager2Wins: 14,
     ties: 0,
     record: "9-14",
   },
   {
-    manager1: "Joey",
-    manager2: "Peter",
-    manager1Wins: 11,
-    manager2Wins: 12,
+    manager1: "Lanny",
+    manager2: "Vernon",
+    manager1Wins: 9,
+    manager2Wins: 14,
     ties: 0,
-    record: "11-12",
+    record: "9-14",
   },
   {
-    manager1: "John",
+    manager1: "Matt",
     manager2: "Ted",
-    manager1Wins: 10,
-    manager2Wins: 13,
+    manager1Wins: 13,
+    manager2Wins: 10,
     ties: 0,
-    record: "10-13",
+    record: "13-10",
   },
   {
-    manager1: "Ben",
-    manager2: "John",
+    manager1: "Peter",
+    manager2: "Tyler",
     manager1Wins: 10,
     manager2Wins: 13,
     ties: 0,
     record: "10-13",
   },
+  {
+    manager1: "Peter",
+    manager2: "Vernon",
+    manager1Wins: 11,
+    manager2Wins: 12,
+    ties: 0,
+    record: "11-12",
+  },
   {
     manager1: "Joey",
     manager2: "Ted",
@@ -218,6 +218,14 @@ export const headToHeadRecords = [
     ties: 0,
     record: "14-8",
   },
+  {
+    manager1: "Ben",
+    manager2: "Jason",
+    manager1Wins: 10,
+    manager2Wins: 8,
+    ties: 0,
+    record: "10-8",
+  },
   {
     manager1: "Jason",
     manager2: "Ted",
@@ -228,19 +236,27 @@ export const headToHeadRecords = [
   },
   {
     manager1: "Ben",
-    manager2: "Jason",
-    manager1Wins: 10,
-    manager2Wins: 8,
+    manager2: "Joey",
+    manager1Wins: 9,
+    manager2Wins: 7,
+    ties: 1,
+    record: "9-7-1",
+  },
+  {
+    manager1: "Ben",
+    manager2: "Tyler",
+    manager1Wins: 7,
+    manager2Wins: 10,
     ties: 0,
-    record: "10-8",
+    record: "7-10",
   },
   {
-    manager1: "John",
-    manager2: "Peter",
-    manager1Wins: 8,
-    manager2Wins: 9,
+    manager1: "Ben",
+    manager2: "Vernon",
+    manager1Wins: 13,
+    manager2Wins: 4,
     ties: 0,
-    record: "8-9",
+    record: "13-4",
   },
   {
     manager1: "Jason",
@@ -251,28 +267,20 @@ export const headToHeadRecords = [
     record: "8-9",
   },
   {
-    manager1: "Ted",
-    manager2: "Vernon",
-    manager1Wins: 13,
-    manager2Wins: 4,
+    manager1: "John",
+    manager2: "Lanny",
+    manager1Wins: 10,
+    manager2Wins: 7,
     ties: 0,
-    record: "13-4",
+    record: "10-7",
   },
   {
-    manager1: "Matt",
+    manager1: "John",
     manager2: "Peter",
-    manager1Wins: 6,
-    manager2Wins: 11,
-    ties: 0,
-    record: "6-11",
-  },
-  {
-    manager1: "Ben",
-    manager2: "Tyler",
-    manager1Wins: 7,
-    manager2Wins: 10,
+    manager1Wins: 8,
+    manager2Wins: 9,
     ties: 0,
-    record: "7-10",
+    record: "8-9",
   },
   {
     manager1: "Lanny",
@@ -283,23 +291,23 @@ export const headToHeadRecords = [
     record: "4-13",
   },
   {
-    manager1: "Ben",
-    manager2: "Joey",
-    manager1Wins: 9,
-    manager2Wins: 7,
-    ties: 1,
-    record: "9-7-1",
+    manager1: "Matt",
+    manager2: "Peter",
+    manager1Wins: 6,
+    manager2Wins: 11,
+    ties: 0,
+    record: "6-11",
   },
   {
-    manager1: "John",
-    manager2: "Lanny",
-    manager1Wins: 10,
-    manager2Wins: 7,
+    manager1: "Ted",
+    manager2: "Tyler",
+    manager1Wins: 8,
+    manager2Wins: 9,
     ties: 0,
-    record: "10-7",
+    record: "8-9",
   },
   {
-    manager1: "Ben",
+    manager1: "Ted",
     manager2: "Vernon",
     manager1Wins: 13,
     manager2Wins: 4,
@@ -307,20 +315,20 @@ export const headToHeadRecords = [
     record: "13-4",
   },
   {
-    manager1: "Ted",
-    manager2: "Tyler",
-    manager1Wins: 8,
-    manager2Wins: 9,
+    manager1: "Ben",
+    manager2: "Ty",
+    manager1Wins: 9,
+    manager2Wins: 7,
     ties: 0,
-    record: "8-9",
+    record: "9-7",
   },
   {
-    manager1: "Ted",
+    manager1: "Lanny",
     manager2: "Ty",
-    manager1Wins: 13,
-    manager2Wins: 3,
+    manager1Wins: 9,
+    manager2Wins: 7,
     ties: 0,
-    record: "13-3",
+    record: "9-7",
   },
   {
     manager1: "Peter",
@@ -331,20 +339,20 @@ export const headToHeadRecords = [
     record: "11-5",
   },
   {
-    manager1: "Lanny",
+    manager1: "Ted",
     manager2: "Ty",
-    manager1Wins: 9,
-    manager2Wins: 7,
+    manager1Wins: 13,
+    manager2Wins: 3,
     ties: 0,
-    record: "9-7",
+    record: "13-3",
   },
   {
-    manager1: "Ben",
-    manager2: "Ty",
-    manager1Wins: 9,
+    manager1: "Jason",
+    manager2: "John",
+    manager1Wins: 8,
     manager2Wins: 7,
     ties: 0,
-    record: "9-7",
+    record: "8-7",
   },
   {
     manager1: "Jason",
@@ -356,19 +364,19 @@ export const headToHeadRecords = [
   },
   {
     manager1: "Jason",
-    manager2: "John",
-    manager1Wins: 8,
-    manager2Wins: 7,
+    manager2: "Lanny",
+    manager1Wins: 7,
+    manager2Wins: 5,
     ties: 0,
-    record: "8-7",
+    record: "7-5",
   },
   {
     manager1: "Jason",
-    manager2: "Lanny",
+    manager2: "Joey",
     manager1Wins: 7,
-    manager2Wins: 5,
+    manager2Wins: 2,
     ties: 0,
-    record: "7-5",
+    record: "7-2",
   },
   {
     manager1: "Jason",
@@ -378,14 +386,6 @@ export const headToHeadRecords = [
     ties: 0,
     record: "3-6",
   },
-  {
-    manager1: "Jason",
-    manager2: "Joey",
-    manager1Wins: 7,
-    manager2Wins: 2,
-    ties: 0,
-    record: "7-2",
-  },
   {
     manager1: "Jason",
     manager2: "Vernon",
@@ -394,14 +394,6 @@ export const headToHeadRecords = [
     ties: 0,
     record: "6-3",
   },
-  {
-    manager1: "Ty",
-    manager2: "Tyler",
-    manager1Wins: 3,
-    manager2Wins: 5,
-    ties: 0,
-    record: "3-5",
-  },
   {
     manager1: "Joey",
     manager2: "Ty",
@@ -418,6 +410,22 @@ export const headToHeadRecords = [
     ties: 0,
     record: "7-1",
   },
+  {
+    manager1: "Matt",
+    manager2: "Ty",
+    manager1Wins: 5,
+    manager2Wins: 3,
+    ties: 0,
+    record: "5-3",
+  },
+  {
+    manager1: "Ty",
+    manager2: "Tyler",
+    manager1Wins: 3,
+    manager2Wins: 5,
+    ties: 0,
+    record: "3-5",
+  },
   {
     manager1: "Ty",
     manager2: "Vernon",
@@ -426,12 +434,873 @@ export const headToHeadRecords = [
     ties: 0,
     record: "1-7",
   },
+];
+
+export const headToHeadByManager = [
   {
-    manager1: "Matt",
-    manager2: "Ty",
-    manager1Wins: 5,
-    manager2Wins: 3,
-    ties: 0,
-    record: "5-3",
+    "manager": "Tyler",
+    "records": [
+      {
+        "opponent": "Joey",
+        "wins": 22,
+        "losses": 12,
+        "ties": 0,
+        "record": "22-12"
+      },
+      {
+        "opponent": "Vernon",
+        "wins": 15,
+        "losses": 19,
+        "ties": 0,
+        "record": "15-19"
+      },
+      {
+        "opponent": "John",
+        "wins": 20,
+        "losses": 12,
+        "ties": 1,
+        "record": "20-12-1"
+      },
+      {
+        "opponent": "Matt",
+        "wins": 13,
+        "losses": 15,
+        "ties": 0,
+        "record": "13-15"
+      },
+      {
+        "opponent": "Lanny",
+        "wins": 14,
+        "losses": 9,
+        "ties": 0,
+        "record": "14-9"
+      },
+      {
+        "opponent": "Peter",
+        "wins": 13,
+        "losses": 10,
+        "ties": 0,
+        "record": "13-10"
+      },
+      {
+        "opponent": "Ben",
+        "wins": 10,
+        "losses": 7,
+        "ties": 0,
+        "record": "10-7"
+      },
+      {
+        "opponent": "Ted",
+        "wins": 9,
+        "losses": 8,
+        "ties": 0,
+        "record": "9-8"
+      },
+      {
+        "opponent": "Jason",
+        "wins": 6,
+        "losses": 3,
+        "ties": 0,
+        "record": "6-3"
+      },
+      {
+        "opponent": "Ty",
+        "wins": 5,
+        "losses": 3,
+        "ties": 0,
+        "record": "5-3"
+      }
+    ],
+    "totalWins": 127,
+    "totalLosses": 98,
+    "totalTies": 1,
+    "totalGames": 226,
+    "winPercentage": 56.19469026548673
+  },
+  {
+    "manager": "Peter",
+    "records": [
+      {
+        "opponent": "Lanny",
+        "wins": 21,
+        "losses": 13,
+        "ties": 0,
+        "record": "21-13"
+      },
+      {
+        "opponent": "Ben",
+        "wins": 16,
+        "losses": 11,
+        "ties": 1,
+        "record": "16-11-1"
+      },
+      {
+        "opponent": "Ted",
+        "wins": 15,
+        "losses": 12,
+        "ties": 1,
+        "record": "15-12-1"
+      },
+      {
+        "opponent": "Joey",
+        "wins": 12,
+        "losses": 11,
+        "ties": 0,
+        "record": "12-11"
+      },
+      {
+        "opponent": "Tyler",
+        "wins": 10,
+        "losses": 13,
+        "ties": 0,
+        "record": "10-13"
+      },
+      {
+        "opponent": "Vernon",
+        "wins": 11,
+        "losses": 12,
+        "ties": 0,
+        "record": "11-12"
+      },
+      {
+        "opponent": "Jason",
+        "wins": 9,
+        "losses": 8,
+        "ties": 0,
+        "record": "9-8"
+      },
+      {
+        "opponent": "John",
+        "wins": 9,
+        "losses": 8,
+        "ties": 0,
+        "record": "9-8"
+      },
+      {
+        "opponent": "Matt",
+        "wins": 11,
+        "losses": 6,
+        "ties": 0,
+        "record": "11-6"
+      },
+      {
+        "opponent": "Ty",
+        "wins": 11,
+        "losses": 5,
+        "ties": 0,
+        "record": "11-5"
+      }
+    ],
+    "totalWins": 125,
+    "totalLosses": 99,
+    "totalTies": 2,
+    "totalGames": 226,
+    "winPercentage": 55.309734513274336
+  },
+  {
+    "manager": "Matt",
+    "records": [
+      {
+        "opponent": "John",
+        "wins": 18,
+        "losses": 16,
+        "ties": 0,
+        "record": "18-16"
+      },
+      {
+        "opponent": "Vernon",
+        "wins": 15,
+        "losses": 17,
+        "ties": 1,
+        "record": "15-17-1"
+      },
+      {
+        "opponent": "Joey",
+        "wins": 12,
+        "losses": 16,
+        "ties": 0,
+        "record": "12-16"
+      },
+      {
+        "opponent": "Tyler",
+        "wins": 15,
+        "losses": 13,
+        "ties": 0,
+        "record": "15-13"
+      },
+      {
+        "opponent": "Ben",
+        "wins": 11,
+        "losses": 12,
+        "ties": 0,
+        "record": "11-12"
+      },
+      {
+        "opponent": "Ted",
+        "wins": 13,
+        "losses": 10,
+        "ties": 0,
+        "record": "13-10"
+      },
+      {
+        "opponent": "Lanny",
+        "wins": 13,
+        "losses": 4,
+        "ties": 0,
+        "record": "13-4"
+      },
+      {
+        "opponent": "Peter",
+        "wins": 6,
+        "losses": 11,
+        "ties": 0,
+        "record": "6-11"
+      },
+      {
+        "opponent": "Jason",
+        "wins": 9,
+        "losses": 6,
+        "ties": 0,
+        "record": "9-6"
+      },
+      {
+        "opponent": "Ty",
+        "wins": 5,
+        "losses": 3,
+        "ties": 0,
+        "record": "5-3"
+      }
+    ],
+    "totalWins": 117,
+    "totalLosses": 108,
+    "totalTies": 1,
+    "totalGames": 226,
+    "winPercentage": 51.76991150442478
+  },
+  {
+    "manager": "Ben",
+    "records": [
+      {
+        "opponent": "Ted",
+        "wins": 19,
+        "losses": 15,
+        "ties": 0,
+        "record": "19-15"
+      },
+      {
+        "opponent": "Lanny",
+        "wins": 15,
+        "losses": 18,
+        "ties": 0,
+        "record": "15-18"
+      },
+      {
+        "opponent": "Peter",
+        "wins": 11,
+        "losses": 16,
+        "ties": 1,
+        "record": "11-16-1"
+      },
+      {
+        "opponent": "John",
+        "wins": 10,
+        "losses": 13,
+        "ties": 0,
+        "record": "10-13"
+      },
+      {
+        "opponent": "Matt",
+        "wins": 12,
+        "losses": 11,
+        "ties": 0,
+        "record": "12-11"
+      },
+      {
+        "opponent": "Jason",
+        "wins": 10,
+        "losses": 8,
+        "ties": 0,
+        "record": "10-8"
+      },
+      {
+        "opponent": "Tyler",
+        "wins": 7,
+        "losses": 10,
+        "ties": 0,
+        "record": "7-10"
+      },
+      {
+        "opponent": "Vernon",
+        "wins": 13,
+        "losses": 4,
+        "ties": 0,
+        "record": "13-4"
+      },
+      {
+        "opponent": "Joey",
+        "wins": 9,
+        "losses": 7,
+        "ties": 1,
+        "record": "9-7-1"
+      },
+      {
+        "opponent": "Ty",
+        "wins": 9,
+        "losses": 7,
+        "ties": 0,
+        "record": "9-7"
+      }
+    ],
+    "totalWins": 115,
+    "totalLosses": 109,
+    "totalTies": 2,
+    "totalGames": 226,
+    "winPercentage": 50.88495575221239
+  },
+  {
+    "manager": "Ted",
+    "records": [
+      {
+        "opponent": "Ben",
+        "wins": 15,
+        "losses": 19,
+        "ties": 0,
+        "record": "15-19"
+      },
+      {
+        "opponent": "Lanny",
+        "wins": 11,
+        "losses": 16,
+        "ties": 1,
+        "record": "11-16-1"
+      },
+      {
+        "opponent": "Peter",
+        "wins": 12,
+        "losses": 15,
+        "ties": 1,
+        "record": "12-15-1"
+      },
+      {
+        "opponent": "John",
+        "wins": 13,
+        "losses": 10,
+        "ties": 0,
+        "record": "13-10"
+      },
+      {
+        "opponent": "Matt",
+        "wins": 10,
+        "losses": 13,
+        "ties": 0,
+        "record": "10-13"
+      },
+      {
+        "opponent": "Joey",
+        "wins": 8,
+        "losses": 14,
+        "ties": 0,
+        "record": "8-14"
+      },
+      {
+        "opponent": "Jason",
+        "wins": 12,
+        "losses": 6,
+        "ties": 0,
+        "record": "12-6"
+      },
+      {
+        "opponent": "Tyler",
+        "wins": 8,
+        "losses": 9,
+        "ties": 0,
+        "record": "8-9"
+      },
+      {
+        "opponent": "Vernon",
+        "wins": 13,
+        "losses": 4,
+        "ties": 0,
+        "record": "13-4"
+      },
+      {
+        "opponent": "Ty",
+        "wins": 13,
+        "losses": 3,
+        "ties": 0,
+        "record": "13-3"
+      }
+    ],
+    "totalWins": 115,
+    "totalLosses": 109,
+    "totalTies": 2,
+    "totalGames": 226,
+    "winPercentage": 50.88495575221239
   },
+  {
+    "manager": "Vernon",
+    "records": [
+      {
+        "opponent": "Joey",
+        "wins": 18,
+        "losses": 16,
+        "ties": 0,
+        "record": "18-16"
+      },
+      {
+        "opponent": "Tyler",
+        "wins": 19,
+        "losses": 15,
+        "ties": 0,
+        "record": "19-15"
+      },
+      {
+        "opponent": "Matt",
+        "wins": 17,
+        "losses": 15,
+        "ties": 1,
+        "record": "17-15-1"
+      },
+      {
+        "opponent": "John",
+        "wins": 14,
+        "losses": 13,
+        "ties": 1,
+        "record": "14-13-1"
+      },
+      {
+        "opponent": "Lanny",
+        "wins": 14,
+        "losses": 9,
+        "ties": 0,
+        "record": "14-9"
+      },
+      {
+        "opponent": "Peter",
+        "wins": 12,
+        "losses": 11,
+        "ties": 0,
+        "record": "12-11"
+      },
+      {
+        "opponent": "Ben",
+        "wins": 4,
+        "losses": 13,
+        "ties": 0,
+        "record": "4-13"
+      },
+      {
+        "opponent": "Ted",
+        "wins": 4,
+        "losses": 13,
+        "ties": 0,
+        "record": "4-13"
+      },
+      {
+        "opponent": "Jason",
+        "wins": 3,
+        "losses": 6,
+        "ties": 0,
+        "record": "3-6"
+      },
+      {
+        "opponent": "Ty",
+        "wins": 7,
+        "losses": 1,
+        "ties": 0,
+        "record": "7-1"
+      }
+    ],
+    "totalWins": 112,
+    "totalLosses": 112,
+    "totalTies": 2,
+    "totalGames": 226,
+    "winPercentage": 49.557522123893804
+  },
+  {
+    "manager": "John",
+    "records": [
+      {
+        "opponent": "Matt",
+        "wins": 16,
+        "losses": 18,
+        "ties": 0,
+        "record": "16-18"
+      },
+      {
+        "opponent": "Tyler",
+        "wins": 12,
+        "losses": 20,
+        "ties": 1,
+        "record": "12-20-1"
+      },
+      {
+        "opponent": "Joey",
+        "wins": 14,
+        "losses": 14,
+        "ties": 0,
+        "record": "14-14"
+      },
+      {
+        "opponent": "Vernon",
+        "wins": 13,
+        "losses": 14,
+        "ties": 1,
+        "record": "13-14-1"
+      },
+      {
+        "opponent": "Ben",
+        "wins": 13,
+        "losses": 10,
+        "ties": 0,
+        "record": "13-10"
+      },
+      {
+        "opponent": "Ted",
+        "wins": 10,
+        "losses": 13,
+        "ties": 0,
+        "record": "10-13"
+      },
+      {
+        "opponent": "Lanny",
+        "wins": 10,
+        "losses": 7,
+        "ties": 0,
+        "record": "10-7"
+      },
+      {
+        "opponent": "Peter",
+        "wins": 8,
+        "losses": 9,
+        "ties": 0,
+        "record": "8-9"
+      },
+      {
+        "opponent": "Jason",
+        "wins": 7,
+        "losses": 8,
+        "ties": 0,
+        "record": "7-8"
+      },
+      {
+        "opponent": "Ty",
+        "wins": 7,
+        "losses": 1,
+        "ties": 0,
+        "record": "7-1"
+      }
+    ],
+    "totalWins": 110,
+    "totalLosses": 114,
+    "totalTies": 2,
+    "totalGames": 226,
+    "winPercentage": 48.67256637168141
+  },
+  {
+    "manager": "Jason",
+    "records": [
+      {
+        "opponent": "Ben",
+        "wins": 8,
+        "losses": 10,
+        "ties": 0,
+        "record": "8-10"
+      },
+      {
+        "opponent": "Ted",
+        "wins": 6,
+        "losses": 12,
+        "ties": 0,
+        "record": "6-12"
+      },
+      {
+        "opponent": "Peter",
+        "wins": 8,
+        "losses": 9,
+        "ties": 0,
+        "record": "8-9"
+      },
+      {
+        "opponent": "John",
+        "wins": 8,
+        "losses": 7,
+        "ties": 0,
+        "record": "8-7"
+      },
+      {
+        "opponent": "Matt",
+        "wins": 6,
+        "losses": 9,
+        "ties": 0,
+        "record": "6-9"
+      },
+      {
+        "opponent": "Lanny",
+        "wins": 7,
+        "losses": 5,
+        "ties": 0,
+        "record": "7-5"
+      },
+      {
+        "opponent": "Joey",
+        "wins": 7,
+        "losses": 2,
+        "ties": 0,
+        "record": "7-2"
+      },
+      {
+        "opponent": "Tyler",
+        "wins": 3,
+        "losses": 6,
+        "ties": 0,
+        "record": "3-6"
+      },
+      {
+        "opponent": "Vernon",
+        "wins": 6,
+        "losses": 3,
+        "ties": 0,
+        "record": "6-3"
+      }
+    ],
+    "totalWins": 59,
+    "totalLosses": 63,
+    "totalTies": 0,
+    "totalGames": 122,
+    "winPercentage": 48.36065573770492
+  },
+  {
+    "manager": "Joey",
+    "records": [
+      {
+        "opponent": "Tyler",
+        "wins": 12,
+        "losses": 22,
+        "ties": 0,
+        "record": "12-22"
+      },
+      {
+        "opponent": "Vernon",
+        "wins": 16,
+        "losses": 18,
+        "ties": 0,
+        "record": "16-18"
+      },
+      {
+        "opponent": "John",
+        "wins": 14,
+        "losses": 14,
+        "ties": 0,
+        "record": "14-14"
+      },
+      {
+        "opponent": "Matt",
+        "wins": 16,
+        "losses": 12,
+        "ties": 0,
+        "record": "16-12"
+      },
+      {
+        "opponent": "Lanny",
+        "wins": 11,
+        "losses": 12,
+        "ties": 0,
+        "record": "11-12"
+      },
+      {
+        "opponent": "Peter",
+        "wins": 11,
+        "losses": 12,
+        "ties": 0,
+        "record": "11-12"
+      },
+      {
+        "opponent": "Ted",
+        "wins": 14,
+        "losses": 8,
+        "ties": 0,
+        "record": "14-8"
+      },
+      {
+        "opponent": "Ben",
+        "wins": 7,
+        "losses": 9,
+        "ties": 1,
+        "record": "7-9-1"
+      },
+      {
+        "opponent": "Jason",
+        "wins": 2,
+        "losses": 7,
+        "ties": 0,
+        "record": "2-7"
+      },
+      {
+        "opponent": "Ty",
+        "wins": 6,
+        "losses": 2,
+        "ties": 0,
+        "record": "6-2"
+      }
+    ],
+    "totalWins": 109,
+    "totalLosses": 116,
+    "totalTies": 1,
+    "totalGames": 226,
+    "winPercentage": 48.23008849557522
+  },
+  {
+    "manager": "Lanny",
+    "records": [
+      {
+        "opponent": "Peter",
+        "wins": 13,
+        "losses": 21,
+        "ties": 0,
+        "record": "13-21"
+      },
+      {
+        "opponent": "Ben",
+        "wins": 18,
+        "losses": 15,
+        "ties": 0,
+        "record": "18-15"
+      },
+      {
+        "opponent": "Ted",
+        "wins": 16,
+        "losses": 11,
+        "ties": 1,
+        "record": "16-11-1"
+      },
+      {
+        "opponent": "Joey",
+        "wins": 12,
+        "losses": 11,
+        "ties": 0,
+        "record": "12-11"
+      },
+      {
+        "opponent": "Tyler",
+        "wins": 9,
+        "losses": 14,
+        "ties": 0,
+        "record": "9-14"
+      },
+      {
+        "opponent": "Vernon",
+        "wins": 9,
+        "losses": 14,
+        "ties": 0,
+        "record": "9-14"
+      },
+      {
+        "opponent": "John",
+        "wins": 7,
+        "losses": 10,
+        "ties": 0,
+        "record": "7-10"
+      },
+      {
+        "opponent": "Matt",
+        "wins": 4,
+        "losses": 13,
+        "ties": 0,
+        "record": "4-13"
+      },
+      {
+        "opponent": "Ty",
+        "wins": 9,
+        "losses": 7,
+        "ties": 0,
+        "record": "9-7"
+      },
+      {
+        "opponent": "Jason",
+        "wins": 5,
+        "losses": 7,
+        "ties": 0,
+        "record": "5-7"
+      }
+    ],
+    "totalWins": 102,
+    "totalLosses": 123,
+    "totalTies": 1,
+    "totalGames": 226,
+    "winPercentage": 45.13274336283185
+  },
+  {
+    "manager": "Ty",
+    "records": [
+      {
+        "opponent": "Ben",
+        "wins": 7,
+        "losses": 9,
+        "ties": 0,
+        "record": "7-9"
+      },
+      {
+        "opponent": "Lanny",
+        "wins": 7,
+        "losses": 9,
+        "ties": 0,
+        "record": "7-9"
+      },
+      {
+        "opponent": "Peter",
+        "wins": 5,
+        "losses": 11,
+        "ties": 0,
+        "record": "5-11"
+      },
+      {
+        "opponent": "Ted",
+        "wins": 3,
+        "losses": 13,
+        "ties": 0,
+        "record": "3-13"
+      },
+      {
+        "opponent": "Joey",
+        "wins": 2,
+        "losses": 6,
+        "ties": 0,
+        "record": "2-6"
+      },
+      {
+        "opponent": "John",
+        "wins": 1,
+        "losses": 7,
+        "ties": 0,
+        "record": "1-7"
+      },
+      {
+        "opponent": "Matt",
+        "wins": 3,
+        "losses": 5,
+        "ties": 0,
+        "record": "3-5"
+      },
+      {
+        "opponent": "Tyler",
+        "wins": 3,
+        "losses": 5,
+        "ties": 0,
+        "record": "3-5"
+      },
+      {
+        "opponent": "Vernon",
+        "wins": 1,
+        "losses": 7,
+        "ties": 0,
+        "record": "1-7"
+      }
+    ],
+    "totalWins": 32,
+    "totalLosses": 72,
+    "totalTies": 0,
+    "totalGames": 104,
+    "winPercentage": 30.76923076923077
+  }
 ];
@@ -0,0 +1,6 @@
+// JBS FFL Head-to-Head Cube
+// Cumulative per-season head-to-head counts (prefix sums over seasons)
+// wins[k][i * managers.length + j] = wins of managers[i] over managers[j] in seasons[0..k-1]
+// Generated from ESPN scraped data
+
+export const headToHeadCube = {"seasons":[2009,2010,2011,2012,2013,2014,2015,2016,2017,2018,2019,2020,2021,2022,2023,2024,2025],"managers":["Ben","Jason","Joey","John","Lanny","Matt","Peter","Ted","Ty","Tyler","Vernon"],"wins":[[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,1,2,1,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,1,1,0,0,1,0,2,0,1,0,1,0,1,1,1,1,1,0,0,2,0,0,0,0,0,0,1,2,0,1,1,0,2,1,1,0,1,1,0,2,1,1,0,1,0,2,0,0,1,2,0,0,1,0,0,0,1,0,1,0,2,1,1,0,0,1,0,0,1,0,0,0,0,0,0,0,0,1,1,0,1,0,1,0,0,1,0,2,1,0,1,1,0,1,2,0],[0,0,0,0,1,1,0,3,4,2,1,0,0,0,0,0,0,0,0,0,0,0,2,0,0,2,2,1,1,2,1,3,0,2,0,2,0,2,2,1,2,2,2,0,3,0,0,0,0,0,0,2,3,1,1,1,0,3,2,2,0,2,2,0,3,3,3,0,1,1,4,0,0,2,3,1,1,1,0,0,0,2,0,2,0,3,2,1,0,0,1,0,1,2,1,1,0,0,0,0,0,1,1,1,1,1,0,2,0,2,1,0,4,3,1,1,1,1,2,2,0],[0,0,0,1,2,2,1,5,5,2,2,0,0,0,0,0,0,0,0,0,0,0,2,0,0,4,2,3,2,3,2,4,1,2,0,2,0,2,3,1,2,3,3,1,4,0,1,1,0,0,2,4,5,2,1,1,0,3,3,3,0,2,2,1,3,4,4,0,1,2,4,1,0,4,4,1,1,1,0,0,1,2,1,2,0,5,2,1,1,0,1,0,1,2,2,1,0,0,0,1,0,2,2,1,3,2,1,3,0,2,1,0,5,4,2,2,2,2,3,4,0],[0,0,0,2,3,3,3,6,5,3,2,0,0,0,0,0,0,0,0,0,0,0,3,0,0,4,2,4,2,3,3,5,2,2,0,4,0,2,3,1,3,4,5,1,5,0,2,2,0,1,4,5,5,3,2,1,0,4,5,3,0,2,2,2,5,5,4,0,2,3,4,2,0,4,4,2,2,2,0,1,1,3,2,4,0,6,2,2,3,0,1,0,3,2,4,2,0,0,0,1,0,3,2,1,3,2,2,4,0,2,2,0,6,6,2,3,2,2,4,6,0],[0,0,1,2,3,4,5,8,7,4,3,0,0,0,0,0,0,0,0,0,0,0,3,0,0,5,3,5,2,4,4,6,3,3,0,5,0,2,4,2,3,5,5,1,7,0,2,3,0,1,4,6,6,4,2,1,0,5,6,4,0,2,3,3,5,5,4,0,3,3,6,3,0,4,5,2,3,2,0,1,2,4,2,5,0,7,2,3,3,0,1,0,4,2,5,3,0,1,0,1,0,4,4,1,5,3,3,4,0,2,2,0,7,8,3,5,2,2,5,8,0],[0,0,1,2,3,4,6,9,8,4,4,0,0,0,0,0,0,0,0,0,0,0,4,0,0,7,4,6,3,5,5,6,4,4,0,5,0,2,5,2,4,6,5,3,9,0,2,4,0,2,5,7,8,4,3,2,0,6,7,4,0,3,4,3,6,6,5,0,3,4,7,3,0,5,7,3,3,3,0,1,2,4,2,6,0,9,3,4,4,0,1,0,4,3,5,3,0,1,0,2,0,6,6,2,6,3,3,5,0,4,2,0,8,8,3,6,3,2,6,8,0],[0,0,2,3,4,4,7,10,9,5,5,0,0,0,0,0,0,0,0,0,0,0,4,0,0,8,4,7,4,5,6,7,5,4,0,6,0,3,6,2,5,6,5,5,10,0,3,4,0,2,5,7,8,4,3,3,0,7,8,5,0,3,4,4,7,8,6,0,3,5,9,4,0,6,9,3,4,4,0,2,2,6,3,7,0,11,3,5,5,0,1,1,6,3,5,3,0,2,1,2,0,7,8,3,7,4,4,5,0,6,2,0,9,8,4,6,3,2,6,8,0],[0,0,2,3,5,5,7,11,9,5,6,0,0,0,0,0,0,0,0,0,0,0,5,0,0,8,4,8,4,5,6,8,5,5,0,8,0,3,8,3,5,7,7,7,11,0,4,5,0,2,7,8,9,5,4,3,0,8,8,6,0,4,5,5,9,9,8,0,4,5,9,4,0,7,11,4,4,5,0,3,3,7,3,8,0,13,3,6,7,0,2,1,7,3,5,3,0,3,1,3,0,8,8,3,7,4,5,5,0,7,2,0,11,8,4,7,4,2,7,9,0],[0,1,3,3,7,5,8,12,9,5,7,1,0,1,0,0,0,0,0,0,1,1,5,0,0,9,5,9,4,5,6,8,6,6,1,9,0,4,9,4,6,7,8,9,11,2,4,5,0,2,8,10,9,5,4,4,1,9,9,7,0,4,6,5,10,9,9,2,5,5,10,5,0,8,11,4,4,6,2,4,3,7,3,9,0,13,3,6,7,0,2,1,7,3,5,3,0,3,1,4,0,10,9,4,8,5,6,5,0,8,2,0,12,8,5,8,5,3,7,10,0],[0,1,4,4,9,5,8,12,9,5,8,3,0,2,0,1,1,1,0,0,1,1,5,0,0,9,5,9,4,5,6,8,7,6,2,11,0,5,10,4,6,7,9,10,11,3,5,5,0,2,9,11,9,5,4,5,1,11,10,8,0,5,6,5,11,11,11,3,6,6,11,5,0,10,11,4,5,8,4,5,4,8,4,9,0,13,3,7,7,0,2,1,7,3,5,3,0,3,1,5,1,12,10,5,9,6,7,5,0,10,2,1,13,9,6,8,5,3,7,10,0],[0,1,5,5,11,5,9,12,9,6,9,5,0,3,1,3,2,2,1,0,2,1,5,0,0,10,6,11,5,6,6,9,9,6,2,12,0,6,11,4,7,7,9,11,11,3,5,5,0,3,10,11,9,5,4,6,1,11,11,8,0,5,6,5,13,12,12,4,6,7,12,6,0,12,11,5,5,10,5,5,4,10,5,9,0,13,4,8,7,0,2,1,7,3,5,3,0,3,1,5,1,13,12,6,9,6,7,5,0,12,2,2,13,10,7,9,6,3,7,10,0],[0,3,6,7,12,7,9,14,9,6,9,5,0,4,3,4,4,3,2,0,3,2,5,0,0,11,7,12,7,7,6,9,10,6,2,12,0,7,12,5,8,7,9,11,11,3,6,5,0,3,12,12,9,7,4,6,1,11,12,9,0,5,6,5,14,12,13,4,6,7,12,7,0,13,11,7,5,10,6,5,5,10,7,9,0,13,5,9,7,0,2,1,7,3,5,3,0,3,1,6,1,15,13,6,9,6,7,5,0,12,3,2,14,11,9,10,8,3,7,12,0],[0,5,7,8,14,8,10,15,9,7,10,5,0,4,3,4,5,3,2,0,3,2,5,1,0,11,7,13,7,8,6,10,10,7,4,13,0,7,13,6,8,7,10,11,11,4,8,6,0,3,13,13,9,8,5,7,2,11,13,10,0,5,6,5,14,13,13,6,8,7,13,8,0,13,11,8,6,11,8,6,7,10,9,10,0,13,5,10,7,0,2,1,7,3,5,3,0,3,1,6,2,16,14,7,10,7,8,5,0,12,3,3,16,12,10,11,9,3,7,14,0],[0,6,7,8,15,10,10,17,9,7,10,6,0,5,4,5,5,4,4,0,3,3,6,1,0,11,8,14,7,10,6,10,11,9,5,14,0,8,15,7,10,7,11,12,12,4,9,6,0,3,13,13,9,8,7,7,4,11,13,11,0,6,8,5,14,13,14,7,10,7,15,8,0,13,11,8,7,11,8,6,7,11,9,11,0,13,6,11,7,0,2,1,7,3,5,3,0,3,1,7,3,18,15,9,11,9,8,5,0,12,4,3,17,12,10,13,10,3,7,16,0],[0,8,8,9,15,10,11,17,9,7,11,6,0,6,5,5,6,5,6,0,3,4,6,1,0,12,9,15,9,11,6,10,13,10,6,14,0,9,16,7,10,7,12,12,14,5,10,6,0,3,13,14,9,9,7,9,5,11,14,12,0,6,10,5,14,14,14,8,10,8,17,9,0,13,11,8,8,13,8,7,9,11,9,12,0,13,6,11,7,0,2,1,7,3,5,3,0,3,1,8,4,20,16,10,12,11,9,5,0,14,4,3,17,13,12,14,11,4,7,16,0],[0,10,9,9,15,11,11,18,9,7,12,6,0,7,7,6,6,7,6,0,3,5,6,1,0,13,10,16,10,13,6,12,14,12,6,14,0,9,16,7,10,7,12,12,16,5,11,7,0,4,13,15,9,9,9,10,7,11,16,12,0,6,11,5,15,15,15,8,11,9,19,10,0,14,11,9,9,14,10,7,11,11,10,12,0,13,7,12,7,0,2,1,7,3,5,3,0,3,1,9,5,20,18,12,12,12,9,5,0,14,4,3,18,14,12,15,12,4,7,18,0],[0,10,9,10,15,12,11,19,9,7,13,8,0,7,8,7,6,8,6,0,3,6,7,2,0,14,11,16,11,14,6,12,16,13,7,14,0,10,16,8,10,7,12,13,18,5,12,7,0,4,13,16,9,9,9,11,9,12,18,13,0,6,13,5,15,15,16,9,12,9,21,11,0,15,11,10,11,15,12,8,13,11,10,12,0,13,8,13,7,0,2,1,7,3,5,3,0,3,1,10,6,22,20,14,13,13,9,5,0,15,4,3,18,14,14,17,12,4,7,19,0]],"ties":[[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0],[0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0],[0,0,1,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0],[0,0,1,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0],[0,0,1,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0],[0,0,1,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,1,0,0,0,0,0,0,0,1,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0],[0,0,1,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,1,0,0,0,0,0,0,0,1,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0],[0,0,1,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,1,0,0,0,0,0,0,0,1,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0],[0,0,1,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,0,0,0,0,0,0,1,0,0,0,0,0,0,0,1,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,1,0,1,0,0,0,0,0],[0,0,1,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,0,0,0,0,0,0,1,0,0,0,0,0,0,0,1,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,1,0,1,0,0,0,0,0],[0,0,1,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,0,0,0,0,0,0,1,0,0,0,0,0,0,0,1,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,1,0,1,0,0,0,0,0],[0,0,1,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,0,0,0,0,0,0,1,0,0,0,0,0,0,0,1,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,1,0,1,0,0,0,0,0],[0,0,1,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,0,0,0,0,0,0,1,0,0,0,0,0,0,0,1,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,1,0,1,0,0,0,0,0],[0,0,1,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,0,0,0,0,0,0,1,0,0,0,0,0,0,0,1,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,1,0,1,0,0,0,0,0],[0,0,1,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,0,0,0,0,0,0,1,0,0,0,0,0,0,0,1,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,1,0,1,0,0,0,0,0],[0,0,1,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,0,0,0,0,0,0,1,0,0,0,0,0,0,0,1,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,1,0,1,0,0,0,0,0],[0,0,1,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,0,0,0,0,0,0,1,0,0,0,0,0,0,0,1,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,1,0,1,0,0,0,0,0]]};
@@ -0,0 +1,5 @@
+// JBS FFL Manager Profiles
+// Generated by scripts/manager_profiles.py - Do not edit manually
+// Each manager's full profile is in managers/<Manager>.json
+
+export const managerSummaries = [{"manager":"Ben","seasonsPlayed":17,"wins":115,"losses":109,"ties":2,"winPct":0.513,"championships":1},{"manager":"Jason","seasonsPlayed":9,"wins":59,"losses":63,"ties":0,"winPct":0.484,"championships":1},{"manager":"Joey","seasonsPlayed":17,"wins":109,"losses":116,"ties":1,"winPct":0.485,"championships":4},{"manager":"John","seasonsPlayed":17,"wins":110,"losses":114,"ties":2,"winPct":0.491,"championships":2},{"manager":"Lanny","seasonsPlayed":17,"wins":102,"losses":123,"ties":1,"winPct":0.454,"championships":2},{"manager":"Matt","seasonsPlayed":17,"wins":117,"losses":108,"ties":1,"winPct":0.52,"championships":1},{"manager":"Peter","seasonsPlayed":17,"wins":125,"losses":99,"ties":2,"winPct":0.558,"championships":3},{"manager":"Ted","seasonsPlayed":17,"wins":115,"losses":109,"ties":2,"winPct":0.513,"championships":5},{"manager":"Ty","seasonsPlayed":8,"wins":32,"losses":72,"ties":0,"winPct":0.308,"championships":2},{"manager":"Tyler","seasonsPlayed":17,"wins":127,"losses":98,"ties":1,"winPct":0.564,"championships":4},{"manager":"Vernon","seasonsPlayed":17,"wins":112,"losses":112,"ties":2,"winPct":0.5,"championships":2}];
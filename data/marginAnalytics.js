@@ -0,0 +1,4 @@
+// JBS FFL Margin of Victory and Close Game Analytics
+// Generated from ESPN scraped data
+
+export const marginAnalytics = {"decidedGames":1123,"oneScoreMargin":8.0,"blowoutPercentile":90,"blowoutMargin":57.9,"medianMargin":24.0,"gamesWithin":{"1":19,"2":52,"5":127,"10":248},"managers":[{"manager":"Ben","games":226,"oneScoreWins":28,"oneScoreLosses":16,"oneScoreTies":2,"oneScoreWinPct":0.63,"blowoutWins":15,"blowoutLosses":14,"averageWinMargin":26.44,"averageLossMargin":30.07,"medianWinMargin":22.0,"medianLossMargin":27.02,"biggestWin":{"margin":104.0,"opponent":"Ty","season":2009,"week":6},"narrowestLoss":{"margin":0.54,"opponent":"Ted","season":2023,"week":10}},{"manager":"Lanny","games":226,"oneScoreWins":31,"oneScoreLosses":20,"oneScoreTies":1,"oneScoreWinPct":0.606,"blowoutWins":9,"blowoutLosses":17,"averageWinMargin":24.87,"averageLossMargin":28.79,"medianWinMargin":16.0,"medianLossMargin":23.0,"biggestWin":{"margin":111.0,"opponent":"Ty","season":2014,"week":8},"narrowestLoss":{"margin":0.88,"opponent":"Vernon","season":2019,"week":7}},{"manager":"Tyler","games":226,"oneScoreWins":23,"oneScoreLosses":15,"oneScoreTies":1,"oneScoreWinPct":0.603,"blowoutWins":8,"blowoutLosses":11,"averageWinMargin":26.6,"averageLossMargin":30.18,"medianWinMargin":25.16,"medianLossMargin":27.96,"biggestWin":{"margin":89.08,"opponent":"Vernon","season":2018,"week":1},"narrowestLoss":{"margin":0.64,"opponent":"John","season":2018,"week":3}},{"manager":"Matt","games":226,"oneScoreWins":23,"oneScoreLosses":20,"oneScoreTies":1,"oneScoreWinPct":0.534,"blowoutWins":11,"blowoutLosses":9,"averageWinMargin":26.82,"averageLossMargin":27.94,"medianWinMargin":23.2,"medianLossMargin":22.0,"biggestWin":{"margin":107.4,"opponent":"John","season":2023,"week":9},"narrowestLoss":{"margin":1.0,"opponent":"Ben","season":2010,"week":13}},{"manager":"Joey","games":226,"oneScoreWins":19,"oneScoreLosses":20,"oneScoreTies":1,"oneScoreWinPct":0.487,"blowoutWins":12,"blowoutLosses":5,"averageWinMargin":29.31,"averageLossMargin":23.32,"medianWinMargin":26.64,"medianLossMargin":19.26,"biggestWin":{"margin":84.42,"opponent":"Peter","season":2023,"week":5},"narrowestLoss":{"margin":0.02,"opponent":"Tyler","season":2023,"week":4}},{"manager":"Ted","games":226,"oneScoreWins":22,"oneScoreLosses":26,"oneScoreTies":2,"oneScoreWinPct":0.46,"blowoutWins":11,"blowoutLosses":11,"averageWinMargin":27.31,"averageLossMargin":27.87,"medianWinMargin":21.0,"medianLossMargin":23.0,"biggestWin":{"margin":124.08,"opponent":"Lanny","season":2019,"week":5},"narrowestLoss":{"margin":0.26,"opponent":"Lanny","season":2023,"week":7}},{"manager":"John","games":226,"oneScoreWins":16,"oneScoreLosses":19,"oneScoreTies":2,"oneScoreWinPct":0.459,"blowoutWins":10,"blowoutLosses":13,"averageWinMargin":27.25,"averageLossMargin":30.85,"medianWinMargin":22.0,"medianLossMargin":25.4,"biggestWin":{"margin":90.0,"opponent":"Lanny","season":2010,"week":2},"narrowestLoss":{"margin":0.44,"opponent":"Tyler","season":2022,"week":14}},{"manager":"Vernon","games":226,"oneScoreWins":18,"oneScoreLosses":22,"oneScoreTies":2,"oneScoreWinPct":0.452,"blowoutWins":11,"blowoutLosses":6,"averageWinMargin":29.04,"averageLossMargin":24.26,"medianWinMargin":21.4,"medianLossMargin":20.88,"biggestWin":{"margin":131.68,"opponent":"Matt","season":2024,"week":14},"narrowestLoss":{"margin":0.04,"opponent":"Jason","season":2020,"week":6}},{"manager":"Jason","games":122,"oneScoreWins":8,"oneScoreLosses":11,"oneScoreTies":0,"oneScoreWinPct":0.421,"blowoutWins":9,"blowoutLosses":7,"averageWinMargin":33.65,"averageLossMargin":30.06,"medianWinMargin":30.7,"medianLossMargin":26.82,"biggestWin":{"margin":93.26,"opponent":"Ben","season":2018,"week":2},"narrowestLoss":{"margin":0.2,"opponent":"Matt","season":2024,"week":10}},{"manager":"Peter","games":226,"oneScoreWins":12,"oneScoreLosses":25,"oneScoreTies":2,"oneScoreWinPct":0.333,"blowoutWins":15,"blowoutLosses":8,"averageWinMargin":31.1,"averageLossMargin":25.62,"medianWinMargin":27.0,"medianLossMargin":22.5,"biggestWin":{"margin":115.0,"opponent":"Ty","season":2010,"week":9},"narrowestLoss":{"margin":0.04,"opponent":"Ted","season":2021,"week":8}},{"manager":"Ty","games":104,"oneScoreWins":4,"oneScoreLosses":10,"oneScoreTies":0,"oneScoreWinPct":0.286,"blowoutWins":2,"blowoutLosses":12,"averageWinMargin":29.28,"averageLossMargin":31.74,"medianWinMargin":26.0,"medianLossMargin":23.0,"biggestWin":{"margin":87.0,"opponent":"Ben","season":2012,"week":3},"narrowestLoss":{"margin":1.0,"opponent":"Vernon","season":2012,"week":12}}]};
@@ -0,0 +1,4 @@
+// JBS FFL Playoff Odds
+// Generated by scripts/playoff_odds.py - Do not edit manually
+
+export const playoffOdds = {"season":2025,"asOfWeek":14,"regularSeasonWeeks":14,"simulations":100000,"playoffTeams":6,"byeTeams":2,"managers":[{"manager":"Tyler","wins":11.0,"pointsFor":1899.76,"projectedMean":133.25,"playoffs":1.0,"bye":1.0,"lastPlace":0.0,"averageSeed":1.0,"seedDistribution":[1.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0]},{"manager":"Peter","wins":10.0,"pointsFor":1777.48,"projectedMean":126.05,"playoffs":1.0,"bye":1.0,"lastPlace":0.0,"averageSeed":2.0,"seedDistribution":[0.0,1.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0]},{"manager":"Matt","wins":9.0,"pointsFor":1831.06,"projectedMean":129.2,"playoffs":1.0,"bye":0.0,"lastPlace":0.0,"averageSeed":3.0,"seedDistribution":[0.0,0.0,1.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0]},{"manager":"Ted","wins":8.0,"pointsFor":1755.86,"projectedMean":124.78,"playoffs":1.0,"bye":0.0,"lastPlace":0.0,"averageSeed":4.0,"seedDistribution":[0.0,0.0,0.0,1.0,0.0,0.0,0.0,0.0,0.0,0.0]},{"manager":"Joey","wins":8.0,"pointsFor":1742.24,"projectedMean":123.98,"playoffs":1.0,"bye":0.0,"lastPlace":0.0,"averageSeed":5.0,"seedDistribution":[0.0,0.0,0.0,0.0,1.0,0.0,0.0,0.0,0.0,0.0]},{"manager":"Jason","wins":6.0,"pointsFor":1669.34,"projectedMean":119.69,"playoffs":1.0,"bye":0.0,"lastPlace":0.0,"averageSeed":6.0,"seedDistribution":[0.0,0.0,0.0,0.0,0.0,1.0,0.0,0.0,0.0,0.0]},{"manager":"Vernon","wins":5.0,"pointsFor":1685.2,"projectedMean":120.62,"playoffs":0.0,"bye":0.0,"lastPlace":0.0,"averageSeed":7.0,"seedDistribution":[0.0,0.0,0.0,0.0,0.0,0.0,1.0,0.0,0.0,0.0]},{"manager":"John","wins":5.0,"pointsFor":1655.38,"projectedMean":118.87,"playoffs":0.0,"bye":0.0,"lastPlace":0.0,"averageSeed":8.0,"seedDistribution":[0.0,0.0,0.0,0.0,0.0,0.0,0.0,1.0,0.0,0.0]},{"manager":"Ben","wins":4.0,"pointsFor":1556.3,"projectedMean":113.04,"playoffs":0.0,"bye":0.0,"lastPlace":0.0,"averageSeed":9.0,"seedDistribution":[0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,1.0,0.0]},{"manager":"Lanny","wins":4.0,"pointsFor":1480.42,"projectedMean":108.58,"playoffs":0.0,"bye":0.0,"lastPlace":1.0,"averageSeed":10.0,"seedDistribution":[0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,1.0]}]};
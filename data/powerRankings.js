@@ -1,35274 +0,0 @@
-// JBS FFL Power Rankings Data
-// Generated from CSV files - Do not edit manually
-
-export const powerRankings = {
-  "2009": {
-    "weeks": [
-      {
-        "week": 1,
-        "managers": [
-          {
-            "manager": "Vernon",
-            "recordRank": 8.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 159.0,
-            "theoreticalWins": 9,
-            "theoreticalLosses": 0,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 8.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 26.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 151.0,
-            "theoreticalWins": 8,
-            "theoreticalLosses": 1,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 8.0,
-            "pointsRank": 7.5,
-            "breakdownRank": 7.5,
-            "totalRank": 23.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 129.0,
-            "theoreticalWins": 6,
-            "theoreticalLosses": 2,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 8.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 20.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 125.0,
-            "theoreticalWins": 5,
-            "theoreticalLosses": 4,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 3.0,
-            "pointsRank": 7.5,
-            "breakdownRank": 7.5,
-            "totalRank": 18.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 129.0,
-            "theoreticalWins": 6,
-            "theoreticalLosses": 2,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "John",
-            "recordRank": 8.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 18.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 99.0,
-            "theoreticalWins": 4,
-            "theoreticalLosses": 5,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 3.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 11.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 81.0,
-            "theoreticalWins": 3,
-            "theoreticalLosses": 6,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 3.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 9.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 71.0,
-            "theoreticalWins": 2,
-            "theoreticalLosses": 7,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 3.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 7.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 70.0,
-            "theoreticalWins": 1,
-            "theoreticalLosses": 8,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 3.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 5.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 69.0,
-            "theoreticalWins": 0,
-            "theoreticalLosses": 9,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 2,
-        "managers": [
-          {
-            "manager": "Vernon",
-            "recordRank": 9.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.0,
-            "wins": 2,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 284.0,
-            "theoreticalWins": 16,
-            "theoreticalLosses": 2,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 9.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 27.0,
-            "wins": 2,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 267.0,
-            "theoreticalWins": 14,
-            "theoreticalLosses": 3,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "John",
-            "recordRank": 9.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 25.0,
-            "wins": 2,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 253.0,
-            "theoreticalWins": 13,
-            "theoreticalLosses": 5,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 6.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 18.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 1,
-            "totalPoints": 245.0,
-            "theoreticalWins": 10,
-            "theoreticalLosses": 7,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 2.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 16.5,
-            "wins": 0,
-            "losses": 1,
-            "ties": 1,
-            "totalPoints": 249.0,
-            "theoreticalWins": 11,
-            "theoreticalLosses": 5,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 6.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 16.0,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 237.0,
-            "theoreticalWins": 9,
-            "theoreticalLosses": 9,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 6.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 14.0,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 174.0,
-            "theoreticalWins": 6,
-            "theoreticalLosses": 12,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 2.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 8.5,
-            "wins": 0,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 173.0,
-            "theoreticalWins": 5,
-            "theoreticalLosses": 13,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 2.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 6.5,
-            "wins": 0,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 162.0,
-            "theoreticalWins": 4,
-            "theoreticalLosses": 14,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 2.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 4.5,
-            "wins": 0,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 149.0,
-            "theoreticalWins": 0,
-            "theoreticalLosses": 18,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 3,
-        "managers": [
-          {
-            "manager": "Vernon",
-            "recordRank": 10.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 30.0,
-            "wins": 3,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 412.0,
-            "theoreticalWins": 25,
-            "theoreticalLosses": 2,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 7.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 8.5,
-            "totalRank": 25.0,
-            "wins": 2,
-            "losses": 0,
-            "ties": 1,
-            "totalPoints": 368.0,
-            "theoreticalWins": 17,
-            "theoreticalLosses": 9,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 7.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.5,
-            "totalRank": 24.0,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 364.0,
-            "theoreticalWins": 17,
-            "theoreticalLosses": 10,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 7.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 21.5,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 362.0,
-            "theoreticalWins": 16,
-            "theoreticalLosses": 10,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "John",
-            "recordRank": 7.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 17.5,
-            "wins": 2,
-            "losses": 0,
-            "ties": 1,
-            "totalPoints": 339.0,
-            "theoreticalWins": 13,
-            "theoreticalLosses": 13,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 4.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 16.5,
-            "wins": 1,
-            "losses": 1,
-            "ties": 1,
-            "totalPoints": 352.0,
-            "theoreticalWins": 15,
-            "theoreticalLosses": 10,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 4.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.5,
-            "totalRank": 11.0,
-            "wins": 1,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 279.0,
-            "theoreticalWins": 11,
-            "theoreticalLosses": 16,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 2.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 3.5,
-            "totalRank": 9.5,
-            "wins": 0,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 295.0,
-            "theoreticalWins": 11,
-            "theoreticalLosses": 16,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 2.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 2.0,
-            "totalRank": 5.0,
-            "wins": 0,
-            "losses": 2,
-            "ties": 1,
-            "totalPoints": 248.0,
-            "theoreticalWins": 4,
-            "theoreticalLosses": 22,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 2.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 1.0,
-            "totalRank": 5.0,
-            "wins": 0,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 249.0,
-            "theoreticalWins": 3,
-            "theoreticalLosses": 24,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 4,
-        "managers": [
-          {
-            "manager": "Vernon",
-            "recordRank": 9.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.5,
-            "wins": 3,
-            "losses": 0,
-            "ties": 1,
-            "totalPoints": 512.0,
-            "theoreticalWins": 28,
-            "theoreticalLosses": 7,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 9.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 27.5,
-            "wins": 3,
-            "losses": 0,
-            "ties": 1,
-            "totalPoints": 485.0,
-            "theoreticalWins": 24,
-            "theoreticalLosses": 11,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 6.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 6.0,
-            "totalRank": 19.5,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 444.0,
-            "theoreticalWins": 18,
-            "theoreticalLosses": 18,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 6.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 8.0,
-            "totalRank": 18.5,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 424.0,
-            "theoreticalWins": 20,
-            "theoreticalLosses": 16,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 3.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 5.0,
-            "totalRank": 16.0,
-            "wins": 1,
-            "losses": 2,
-            "ties": 1,
-            "totalPoints": 448.0,
-            "theoreticalWins": 17,
-            "theoreticalLosses": 17,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "John",
-            "recordRank": 6.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 3.5,
-            "totalRank": 16.0,
-            "wins": 2,
-            "losses": 0,
-            "ties": 2,
-            "totalPoints": 439.0,
-            "theoreticalWins": 16,
-            "theoreticalLosses": 18,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 6.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 3.5,
-            "totalRank": 15.0,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 432.0,
-            "theoreticalWins": 16,
-            "theoreticalLosses": 19,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 3.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 7.0,
-            "totalRank": 13.0,
-            "wins": 1,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 423.0,
-            "theoreticalWins": 19,
-            "theoreticalLosses": 17,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 3.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 1.5,
-            "totalRank": 6.5,
-            "wins": 1,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 360.0,
-            "theoreticalWins": 9,
-            "theoreticalLosses": 27,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.5,
-            "totalRank": 3.5,
-            "wins": 0,
-            "losses": 3,
-            "ties": 1,
-            "totalPoints": 351.0,
-            "theoreticalWins": 9,
-            "theoreticalLosses": 26,
-            "theoreticalTies": 1
-          }
-        ]
-      },
-      {
-        "week": 5,
-        "managers": [
-          {
-            "manager": "Vernon",
-            "recordRank": 9.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.5,
-            "wins": 4,
-            "losses": 0,
-            "ties": 1,
-            "totalPoints": 658.0,
-            "theoreticalWins": 36,
-            "theoreticalLosses": 8,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 9.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 27.5,
-            "wins": 4,
-            "losses": 0,
-            "ties": 1,
-            "totalPoints": 594.0,
-            "theoreticalWins": 30,
-            "theoreticalLosses": 14,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 7.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 23.0,
-            "wins": 3,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 591.0,
-            "theoreticalWins": 27,
-            "theoreticalLosses": 18,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 7.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 6.0,
-            "totalRank": 17.0,
-            "wins": 3,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 514.0,
-            "theoreticalWins": 23,
-            "theoreticalLosses": 22,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 7.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 4.0,
-            "totalRank": 17.0,
-            "wins": 3,
-            "losses": 0,
-            "ties": 2,
-            "totalPoints": 537.0,
-            "theoreticalWins": 20,
-            "theoreticalLosses": 23,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 3.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 5.0,
-            "totalRank": 15.0,
-            "wins": 1,
-            "losses": 3,
-            "ties": 1,
-            "totalPoints": 555.0,
-            "theoreticalWins": 22,
-            "theoreticalLosses": 21,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 3.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 7.0,
-            "totalRank": 15.0,
-            "wins": 1,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 536.0,
-            "theoreticalWins": 26,
-            "theoreticalLosses": 19,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 5.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 11.0,
-            "wins": 2,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 509.0,
-            "theoreticalWins": 16,
-            "theoreticalLosses": 27,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 3.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 7.0,
-            "wins": 1,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 440.0,
-            "theoreticalWins": 11,
-            "theoreticalLosses": 34,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 0,
-            "losses": 4,
-            "ties": 1,
-            "totalPoints": 428.0,
-            "theoreticalWins": 9,
-            "theoreticalLosses": 34,
-            "theoreticalTies": 2
-          }
-        ]
-      },
-      {
-        "week": 6,
-        "managers": [
-          {
-            "manager": "Vernon",
-            "recordRank": 8.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.5,
-            "wins": 4,
-            "losses": 1,
-            "ties": 1,
-            "totalPoints": 763.0,
-            "theoreticalWins": 39,
-            "theoreticalLosses": 14,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 8.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 9.0,
-            "totalRank": 25.5,
-            "wins": 4,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 736.0,
-            "theoreticalWins": 35,
-            "theoreticalLosses": 19,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 8.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 8.0,
-            "totalRank": 23.5,
-            "wins": 4,
-            "losses": 1,
-            "ties": 1,
-            "totalPoints": 716.0,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 19,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 4.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 6.5,
-            "totalRank": 19.5,
-            "wins": 2,
-            "losses": 3,
-            "ties": 1,
-            "totalPoints": 742.0,
-            "theoreticalWins": 31,
-            "theoreticalLosses": 21,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 8.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 18.5,
-            "wins": 4,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 651.0,
-            "theoreticalWins": 29,
-            "theoreticalLosses": 25,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 2.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.5,
-            "totalRank": 14.5,
-            "wins": 1,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 672.0,
-            "theoreticalWins": 31,
-            "theoreticalLosses": 23,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 5.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 13.5,
-            "wins": 3,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 648.0,
-            "theoreticalWins": 23,
-            "theoreticalLosses": 29,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "John",
-            "recordRank": 5.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 11.5,
-            "wins": 3,
-            "losses": 1,
-            "ties": 2,
-            "totalPoints": 616.0,
-            "theoreticalWins": 20,
-            "theoreticalLosses": 32,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 2.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 1.0,
-            "totalRank": 5.0,
-            "wins": 1,
-            "losses": 4,
-            "ties": 1,
-            "totalPoints": 532.0,
-            "theoreticalWins": 11,
-            "theoreticalLosses": 41,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 2.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 2.0,
-            "totalRank": 5.0,
-            "wins": 1,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 523.0,
-            "theoreticalWins": 12,
-            "theoreticalLosses": 42,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 7,
-        "managers": [
-          {
-            "manager": "Vernon",
-            "recordRank": 9.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.0,
-            "wins": 5,
-            "losses": 1,
-            "ties": 1,
-            "totalPoints": 897.0,
-            "theoreticalWins": 46,
-            "theoreticalLosses": 16,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 9.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 27.0,
-            "wins": 5,
-            "losses": 1,
-            "ties": 1,
-            "totalPoints": 859.0,
-            "theoreticalWins": 42,
-            "theoreticalLosses": 20,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 6.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 22.5,
-            "wins": 4,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 857.0,
-            "theoreticalWins": 40,
-            "theoreticalLosses": 23,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 9.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 6.0,
-            "totalRank": 19.0,
-            "wins": 5,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 766.0,
-            "theoreticalWins": 33,
-            "theoreticalLosses": 30,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 6.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 4.5,
-            "totalRank": 17.0,
-            "wins": 4,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 805.0,
-            "theoreticalWins": 32,
-            "theoreticalLosses": 29,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 3.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 7.0,
-            "totalRank": 15.5,
-            "wins": 2,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 794.0,
-            "theoreticalWins": 37,
-            "theoreticalLosses": 26,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 3.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 4.5,
-            "totalRank": 15.0,
-            "wins": 2,
-            "losses": 4,
-            "ties": 1,
-            "totalPoints": 821.0,
-            "theoreticalWins": 32,
-            "theoreticalLosses": 29,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "John",
-            "recordRank": 5.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 11.0,
-            "wins": 3,
-            "losses": 2,
-            "ties": 2,
-            "totalPoints": 689.0,
-            "theoreticalWins": 20,
-            "theoreticalLosses": 41,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 1.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 5.5,
-            "wins": 1,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 624.0,
-            "theoreticalWins": 15,
-            "theoreticalLosses": 48,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 1.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.5,
-            "wins": 1,
-            "losses": 5,
-            "ties": 1,
-            "totalPoints": 619.0,
-            "theoreticalWins": 13,
-            "theoreticalLosses": 48,
-            "theoreticalTies": 2
-          }
-        ]
-      },
-      {
-        "week": 8,
-        "managers": [
-          {
-            "manager": "Vernon",
-            "recordRank": 10.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.0,
-            "wins": 6,
-            "losses": 1,
-            "ties": 1,
-            "totalPoints": 1024.0,
-            "theoreticalWins": 54,
-            "theoreticalLosses": 17,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 7.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 9.0,
-            "totalRank": 26.5,
-            "wins": 5,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1035.0,
-            "theoreticalWins": 49,
-            "theoreticalLosses": 23,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 7.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 23.5,
-            "wins": 5,
-            "losses": 2,
-            "ties": 1,
-            "totalPoints": 969.0,
-            "theoreticalWins": 48,
-            "theoreticalLosses": 23,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 7.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 19.5,
-            "wins": 5,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 911.0,
-            "theoreticalWins": 36,
-            "theoreticalLosses": 34,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 7.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.5,
-            "totalRank": 16.0,
-            "wins": 5,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 861.0,
-            "theoreticalWins": 35,
-            "theoreticalLosses": 37,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 4.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 4.5,
-            "totalRank": 15.5,
-            "wins": 3,
-            "losses": 4,
-            "ties": 1,
-            "totalPoints": 917.0,
-            "theoreticalWins": 35,
-            "theoreticalLosses": 35,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 3.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 7.0,
-            "totalRank": 15.0,
-            "wins": 2,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 867.0,
-            "theoreticalWins": 38,
-            "theoreticalLosses": 34,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 5.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 11.0,
-            "wins": 4,
-            "losses": 2,
-            "ties": 2,
-            "totalPoints": 814.0,
-            "theoreticalWins": 27,
-            "theoreticalLosses": 43,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 1.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 5.5,
-            "wins": 1,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 733.0,
-            "theoreticalWins": 20,
-            "theoreticalLosses": 52,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 1.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.5,
-            "wins": 1,
-            "losses": 6,
-            "ties": 1,
-            "totalPoints": 684.0,
-            "theoreticalWins": 13,
-            "theoreticalLosses": 57,
-            "theoreticalTies": 2
-          }
-        ]
-      },
-      {
-        "week": 9,
-        "managers": [
-          {
-            "manager": "Vernon",
-            "recordRank": 8.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.5,
-            "wins": 6,
-            "losses": 2,
-            "ties": 1,
-            "totalPoints": 1128.0,
-            "theoreticalWins": 57,
-            "theoreticalLosses": 23,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 8.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 9.0,
-            "totalRank": 25.5,
-            "wins": 6,
-            "losses": 2,
-            "ties": 1,
-            "totalPoints": 1113.0,
-            "theoreticalWins": 55,
-            "theoreticalLosses": 25,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 6.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 8.0,
-            "totalRank": 23.0,
-            "wins": 5,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1124.0,
-            "theoreticalWins": 50,
-            "theoreticalLosses": 31,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 8.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 5.0,
-            "totalRank": 19.5,
-            "wins": 6,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1038.0,
-            "theoreticalWins": 41,
-            "theoreticalLosses": 37,
-            "theoreticalTies": 3
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 4.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 6.0,
-            "totalRank": 17.5,
-            "wins": 4,
-            "losses": 4,
-            "ties": 1,
-            "totalPoints": 1064.0,
-            "theoreticalWins": 43,
-            "theoreticalLosses": 36,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 8.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 16.5,
-            "wins": 6,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 966.0,
-            "theoreticalWins": 39,
-            "theoreticalLosses": 42,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 3.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 7.0,
-            "totalRank": 15.0,
-            "wins": 3,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1016.0,
-            "theoreticalWins": 47,
-            "theoreticalLosses": 34,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 4.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 10.5,
-            "wins": 4,
-            "losses": 3,
-            "ties": 2,
-            "totalPoints": 907.0,
-            "theoreticalWins": 29,
-            "theoreticalLosses": 50,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 1.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 5.5,
-            "wins": 1,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 860.0,
-            "theoreticalWins": 25,
-            "theoreticalLosses": 55,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 1.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.5,
-            "wins": 1,
-            "losses": 7,
-            "ties": 1,
-            "totalPoints": 752.0,
-            "theoreticalWins": 13,
-            "theoreticalLosses": 66,
-            "theoreticalTies": 2
-          }
-        ]
-      },
-      {
-        "week": 10,
-        "managers": [
-          {
-            "manager": "Vernon",
-            "recordRank": 9.5,
-            "pointsRank": 9.5,
-            "breakdownRank": 10.0,
-            "totalRank": 29.0,
-            "wins": 7,
-            "losses": 2,
-            "ties": 1,
-            "totalPoints": 1262.0,
-            "theoreticalWins": 65,
-            "theoreticalLosses": 24,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 7.0,
-            "pointsRank": 9.5,
-            "breakdownRank": 9.0,
-            "totalRank": 25.5,
-            "wins": 6,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1262.0,
-            "theoreticalWins": 59,
-            "theoreticalLosses": 31,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 7.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 23.0,
-            "wins": 6,
-            "losses": 3,
-            "ties": 1,
-            "totalPoints": 1211.0,
-            "theoreticalWins": 58,
-            "theoreticalLosses": 31,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 9.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 21.5,
-            "wins": 7,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1143.0,
-            "theoreticalWins": 45,
-            "theoreticalLosses": 42,
-            "theoreticalTies": 3
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 3.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 17.5,
-            "wins": 4,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1145.0,
-            "theoreticalWins": 53,
-            "theoreticalLosses": 37,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 7.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 15.0,
-            "wins": 6,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1060.0,
-            "theoreticalWins": 41,
-            "theoreticalLosses": 49,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 3.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 13.5,
-            "wins": 4,
-            "losses": 5,
-            "ties": 1,
-            "totalPoints": 1130.0,
-            "theoreticalWins": 43,
-            "theoreticalLosses": 45,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "John",
-            "recordRank": 5.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 11.0,
-            "wins": 5,
-            "losses": 3,
-            "ties": 2,
-            "totalPoints": 1037.0,
-            "theoreticalWins": 36,
-            "theoreticalLosses": 52,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 1.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 5.5,
-            "wins": 1,
-            "losses": 9,
-            "ties": 0,
-            "totalPoints": 977.0,
-            "theoreticalWins": 30,
-            "theoreticalLosses": 59,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 1.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.5,
-            "wins": 1,
-            "losses": 8,
-            "ties": 1,
-            "totalPoints": 833.0,
-            "theoreticalWins": 14,
-            "theoreticalLosses": 74,
-            "theoreticalTies": 2
-          }
-        ]
-      },
-      {
-        "week": 11,
-        "managers": [
-          {
-            "manager": "Vernon",
-            "recordRank": 8.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 10.0,
-            "totalRank": 27.0,
-            "wins": 7,
-            "losses": 3,
-            "ties": 1,
-            "totalPoints": 1376.0,
-            "theoreticalWins": 68,
-            "theoreticalLosses": 30,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 6.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 8.5,
-            "totalRank": 24.5,
-            "wins": 6,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1402.0,
-            "theoreticalWins": 67,
-            "theoreticalLosses": 32,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 8.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.5,
-            "totalRank": 24.5,
-            "wins": 7,
-            "losses": 3,
-            "ties": 1,
-            "totalPoints": 1361.0,
-            "theoreticalWins": 67,
-            "theoreticalLosses": 31,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 10.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 6.0,
-            "totalRank": 23.0,
-            "wins": 8,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1280.0,
-            "theoreticalWins": 52,
-            "theoreticalLosses": 44,
-            "theoreticalTies": 3
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 4.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 7.0,
-            "totalRank": 17.5,
-            "wins": 5,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1270.0,
-            "theoreticalWins": 59,
-            "theoreticalLosses": 40,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 8.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.5,
-            "totalRank": 16.5,
-            "wins": 7,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1176.0,
-            "theoreticalWins": 45,
-            "theoreticalLosses": 54,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 3.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 4.5,
-            "totalRank": 12.5,
-            "wins": 4,
-            "losses": 6,
-            "ties": 1,
-            "totalPoints": 1228.0,
-            "theoreticalWins": 45,
-            "theoreticalLosses": 52,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "John",
-            "recordRank": 4.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 10.5,
-            "wins": 5,
-            "losses": 4,
-            "ties": 2,
-            "totalPoints": 1157.0,
-            "theoreticalWins": 41,
-            "theoreticalLosses": 56,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 1.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 5.0,
-            "wins": 1,
-            "losses": 10,
-            "ties": 0,
-            "totalPoints": 1054.0,
-            "theoreticalWins": 30,
-            "theoreticalLosses": 68,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 2.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 4.0,
-            "wins": 2,
-            "losses": 8,
-            "ties": 1,
-            "totalPoints": 914.0,
-            "theoreticalWins": 15,
-            "theoreticalLosses": 82,
-            "theoreticalTies": 2
-          }
-        ]
-      },
-      {
-        "week": 12,
-        "managers": [
-          {
-            "manager": "Peter",
-            "recordRank": 7.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 10.0,
-            "totalRank": 26.5,
-            "wins": 7,
-            "losses": 4,
-            "ties": 1,
-            "totalPoints": 1466.0,
-            "theoreticalWins": 72,
-            "theoreticalLosses": 35,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 9.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 25.0,
-            "wins": 8,
-            "losses": 3,
-            "ties": 1,
-            "totalPoints": 1463.0,
-            "theoreticalWins": 69,
-            "theoreticalLosses": 38,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 5.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 9.0,
-            "totalRank": 24.0,
-            "wins": 6,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1503.0,
-            "theoreticalWins": 71,
-            "theoreticalLosses": 37,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 10.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 6.0,
-            "totalRank": 23.0,
-            "wins": 9,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1451.0,
-            "theoreticalWins": 61,
-            "theoreticalLosses": 44,
-            "theoreticalTies": 3
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 5.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 7.0,
-            "totalRank": 18.0,
-            "wins": 6,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1391.0,
-            "theoreticalWins": 67,
-            "theoreticalLosses": 41,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 7.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 3.5,
-            "totalRank": 15.0,
-            "wins": 7,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1269.0,
-            "theoreticalWins": 47,
-            "theoreticalLosses": 61,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 3.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 13.0,
-            "wins": 4,
-            "losses": 7,
-            "ties": 1,
-            "totalPoints": 1326.0,
-            "theoreticalWins": 48,
-            "theoreticalLosses": 58,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "John",
-            "recordRank": 5.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.5,
-            "totalRank": 11.5,
-            "wins": 6,
-            "losses": 4,
-            "ties": 2,
-            "totalPoints": 1268.0,
-            "theoreticalWins": 47,
-            "theoreticalLosses": 59,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 1.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 5.0,
-            "wins": 1,
-            "losses": 11,
-            "ties": 0,
-            "totalPoints": 1120.0,
-            "theoreticalWins": 30,
-            "theoreticalLosses": 77,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 2.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 4.0,
-            "wins": 3,
-            "losses": 8,
-            "ties": 1,
-            "totalPoints": 1026.0,
-            "theoreticalWins": 22,
-            "theoreticalLosses": 84,
-            "theoreticalTies": 2
-          }
-        ]
-      },
-      {
-        "week": 13,
-        "managers": [
-          {
-            "manager": "Matt",
-            "recordRank": 10.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 7.0,
-            "totalRank": 26.0,
-            "wins": 10,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1583.0,
-            "theoreticalWins": 69,
-            "theoreticalLosses": 45,
-            "theoreticalTies": 3
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 9.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 25.0,
-            "wins": 9,
-            "losses": 3,
-            "ties": 1,
-            "totalPoints": 1573.0,
-            "theoreticalWins": 72,
-            "theoreticalLosses": 44,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 4.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 24.5,
-            "wins": 6,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1633.0,
-            "theoreticalWins": 78,
-            "theoreticalLosses": 39,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 7.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 9.0,
-            "totalRank": 23.0,
-            "wins": 7,
-            "losses": 5,
-            "ties": 1,
-            "totalPoints": 1566.0,
-            "theoreticalWins": 73,
-            "theoreticalLosses": 43,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 4.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 16.5,
-            "wins": 6,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1487.0,
-            "theoreticalWins": 67,
-            "theoreticalLosses": 50,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 7.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.5,
-            "totalRank": 15.5,
-            "wins": 7,
-            "losses": 4,
-            "ties": 2,
-            "totalPoints": 1391.0,
-            "theoreticalWins": 53,
-            "theoreticalLosses": 62,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 7.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 13.0,
-            "wins": 7,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1388.0,
-            "theoreticalWins": 51,
-            "theoreticalLosses": 66,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 2.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 4.5,
-            "totalRank": 12.0,
-            "wins": 4,
-            "losses": 8,
-            "ties": 1,
-            "totalPoints": 1447.0,
-            "theoreticalWins": 53,
-            "theoreticalLosses": 62,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 1.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 5.0,
-            "wins": 2,
-            "losses": 11,
-            "ties": 0,
-            "totalPoints": 1226.0,
-            "theoreticalWins": 32,
-            "theoreticalLosses": 84,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 2.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 4.5,
-            "wins": 4,
-            "losses": 8,
-            "ties": 1,
-            "totalPoints": 1181.0,
-            "theoreticalWins": 31,
-            "theoreticalLosses": 84,
-            "theoreticalTies": 2
-          }
-        ]
-      }
-    ],
-    "finalWeek": 13,
-    "finalRankings": [
-      {
-        "manager": "Matt",
-        "recordRank": 10.0,
-        "pointsRank": 9.0,
-        "breakdownRank": 7.0,
-        "totalRank": 26.0,
-        "wins": 10,
-        "losses": 3,
-        "ties": 0,
-        "totalPoints": 1583.0,
-        "theoreticalWins": 69,
-        "theoreticalLosses": 45,
-        "theoreticalTies": 3
-      },
-      {
-        "manager": "Vernon",
-        "recordRank": 9.0,
-        "pointsRank": 8.0,
-        "breakdownRank": 8.0,
-        "totalRank": 25.0,
-        "wins": 9,
-        "losses": 3,
-        "ties": 1,
-        "totalPoints": 1573.0,
-        "theoreticalWins": 72,
-        "theoreticalLosses": 44,
-        "theoreticalTies": 1
-      },
-      {
-        "manager": "Lanny",
-        "recordRank": 4.5,
-        "pointsRank": 10.0,
-        "breakdownRank": 10.0,
-        "totalRank": 24.5,
-        "wins": 6,
-        "losses": 7,
-        "ties": 0,
-        "totalPoints": 1633.0,
-        "theoreticalWins": 78,
-        "theoreticalLosses": 39,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Peter",
-        "recordRank": 7.0,
-        "pointsRank": 7.0,
-        "breakdownRank": 9.0,
-        "totalRank": 23.0,
-        "wins": 7,
-        "losses": 5,
-        "ties": 1,
-        "totalPoints": 1566.0,
-        "theoreticalWins": 73,
-        "theoreticalLosses": 43,
-        "theoreticalTies": 1
-      },
-      {
-        "manager": "Joey",
-        "recordRank": 4.5,
-        "pointsRank": 6.0,
-        "breakdownRank": 6.0,
-        "totalRank": 16.5,
-        "wins": 6,
-        "losses": 7,
-        "ties": 0,
-        "totalPoints": 1487.0,
-        "theoreticalWins": 67,
-        "theoreticalLosses": 50,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "John",
-        "recordRank": 7.0,
-        "pointsRank": 4.0,
-        "breakdownRank": 4.5,
-        "totalRank": 15.5,
-        "wins": 7,
-        "losses": 4,
-        "ties": 2,
-        "totalPoints": 1391.0,
-        "theoreticalWins": 53,
-        "theoreticalLosses": 62,
-        "theoreticalTies": 2
-      },
-      {
-        "manager": "Ted",
-        "recordRank": 7.0,
-        "pointsRank": 3.0,
-        "breakdownRank": 3.0,
-        "totalRank": 13.0,
-        "wins": 7,
-        "losses": 6,
-        "ties": 0,
-        "totalPoints": 1388.0,
-        "theoreticalWins": 51,
-        "theoreticalLosses": 66,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Ben",
-        "recordRank": 2.5,
-        "pointsRank": 5.0,
-        "breakdownRank": 4.5,
-        "totalRank": 12.0,
-        "wins": 4,
-        "losses": 8,
-        "ties": 1,
-        "totalPoints": 1447.0,
-        "theoreticalWins": 53,
-        "theoreticalLosses": 62,
-        "theoreticalTies": 2
-      },
-      {
-        "manager": "Ty",
-        "recordRank": 1.0,
-        "pointsRank": 2.0,
-        "breakdownRank": 2.0,
-        "totalRank": 5.0,
-        "wins": 2,
-        "losses": 11,
-        "ties": 0,
-        "totalPoints": 1226.0,
-        "theoreticalWins": 32,
-        "theoreticalLosses": 84,
-        "theoreticalTies": 1
-      },
-      {
-        "manager": "Tyler",
-        "recordRank": 2.5,
-        "pointsRank": 1.0,
-        "breakdownRank": 1.0,
-        "totalRank": 4.5,
-        "wins": 4,
-        "losses": 8,
-        "ties": 1,
-        "totalPoints": 1181.0,
-        "theoreticalWins": 31,
-        "theoreticalLosses": 84,
-        "theoreticalTies": 2
-      }
-    ]
-  },
-  "2010": {
-    "weeks": [
-      {
-        "week": 1,
-        "managers": [
-          {
-            "manager": "John",
-            "recordRank": 8.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 124.0,
-            "theoreticalWins": 9,
-            "theoreticalLosses": 0,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 8.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 26.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 121.0,
-            "theoreticalWins": 8,
-            "theoreticalLosses": 1,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 8.0,
-            "pointsRank": 6.5,
-            "breakdownRank": 6.5,
-            "totalRank": 21.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 111.0,
-            "theoreticalWins": 5,
-            "theoreticalLosses": 3,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 8.0,
-            "pointsRank": 6.5,
-            "breakdownRank": 6.5,
-            "totalRank": 21.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 111.0,
-            "theoreticalWins": 5,
-            "theoreticalLosses": 3,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 3.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 19.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 112.0,
-            "theoreticalWins": 7,
-            "theoreticalLosses": 2,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 8.0,
-            "pointsRank": 4.5,
-            "breakdownRank": 4.5,
-            "totalRank": 17.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 105.0,
-            "theoreticalWins": 3,
-            "theoreticalLosses": 5,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 3.0,
-            "pointsRank": 4.5,
-            "breakdownRank": 4.5,
-            "totalRank": 12.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 105.0,
-            "theoreticalWins": 3,
-            "theoreticalLosses": 5,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 3.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 9.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 82.0,
-            "theoreticalWins": 2,
-            "theoreticalLosses": 7,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 3.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 7.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 59.0,
-            "theoreticalWins": 1,
-            "theoreticalLosses": 8,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 3.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 5.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 41.0,
-            "theoreticalWins": 0,
-            "theoreticalLosses": 9,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 2,
-        "managers": [
-          {
-            "manager": "John",
-            "recordRank": 9.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.0,
-            "wins": 2,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 275.0,
-            "theoreticalWins": 17,
-            "theoreticalLosses": 1,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 9.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 9.0,
-            "totalRank": 28.0,
-            "wins": 2,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 296.0,
-            "theoreticalWins": 14,
-            "theoreticalLosses": 3,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 9.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 6.5,
-            "totalRank": 22.5,
-            "wins": 2,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 215.0,
-            "theoreticalWins": 10,
-            "theoreticalLosses": 7,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 5.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 6.5,
-            "totalRank": 20.0,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 231.0,
-            "theoreticalWins": 10,
-            "theoreticalLosses": 7,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 2.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 8.0,
-            "totalRank": 16.0,
-            "wins": 0,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 214.0,
-            "theoreticalWins": 11,
-            "theoreticalLosses": 7,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 5.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.5,
-            "totalRank": 14.0,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 202.0,
-            "theoreticalWins": 8,
-            "theoreticalLosses": 10,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 5.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 3.0,
-            "totalRank": 13.5,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 204.0,
-            "theoreticalWins": 6,
-            "theoreticalLosses": 11,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 5.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 4.5,
-            "totalRank": 13.0,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 182.0,
-            "theoreticalWins": 8,
-            "theoreticalLosses": 10,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 2.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 6.0,
-            "wins": 0,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 151.0,
-            "theoreticalWins": 3,
-            "theoreticalLosses": 15,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 2.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 4.0,
-            "wins": 0,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 118.0,
-            "theoreticalWins": 1,
-            "theoreticalLosses": 17,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 3,
-        "managers": [
-          {
-            "manager": "John",
-            "recordRank": 10.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 30.0,
-            "wins": 3,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 424.0,
-            "theoreticalWins": 26,
-            "theoreticalLosses": 1,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 7.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 6.5,
-            "totalRank": 22.5,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 386.0,
-            "theoreticalWins": 15,
-            "theoreticalLosses": 11,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 7.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 6.5,
-            "totalRank": 20.5,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 340.0,
-            "theoreticalWins": 15,
-            "theoreticalLosses": 12,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 7.0,
-            "pointsRank": 4.5,
-            "breakdownRank": 8.5,
-            "totalRank": 20.0,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 325.0,
-            "theoreticalWins": 16,
-            "theoreticalLosses": 11,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 3.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 8.5,
-            "totalRank": 18.0,
-            "wins": 1,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 332.0,
-            "theoreticalWins": 16,
-            "theoreticalLosses": 11,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 3.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 5.0,
-            "totalRank": 16.5,
-            "wins": 1,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 343.0,
-            "theoreticalWins": 14,
-            "theoreticalLosses": 12,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 7.0,
-            "pointsRank": 4.5,
-            "breakdownRank": 4.0,
-            "totalRank": 15.5,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 325.0,
-            "theoreticalWins": 13,
-            "theoreticalLosses": 13,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 7.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 13.0,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 308.0,
-            "theoreticalWins": 8,
-            "theoreticalLosses": 18,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 1.5,
-            "pointsRank": 1.5,
-            "breakdownRank": 2.0,
-            "totalRank": 5.0,
-            "wins": 0,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 239.0,
-            "theoreticalWins": 7,
-            "theoreticalLosses": 20,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 1.5,
-            "pointsRank": 1.5,
-            "breakdownRank": 1.0,
-            "totalRank": 4.0,
-            "wins": 0,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 239.0,
-            "theoreticalWins": 3,
-            "theoreticalLosses": 24,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 4,
-        "managers": [
-          {
-            "manager": "John",
-            "recordRank": 9.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.5,
-            "wins": 3,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 481.0,
-            "theoreticalWins": 26,
-            "theoreticalLosses": 10,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 5.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 8.0,
-            "totalRank": 22.5,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 473.0,
-            "theoreticalWins": 22,
-            "theoreticalLosses": 13,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 5.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 9.0,
-            "totalRank": 21.5,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 464.0,
-            "theoreticalWins": 25,
-            "theoreticalLosses": 11,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 5.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 5.0,
-            "totalRank": 18.5,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 471.0,
-            "theoreticalWins": 18,
-            "theoreticalLosses": 17,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 5.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.5,
-            "totalRank": 18.0,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 448.0,
-            "theoreticalWins": 19,
-            "theoreticalLosses": 15,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 5.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 6.5,
-            "totalRank": 17.0,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 436.0,
-            "theoreticalWins": 19,
-            "theoreticalLosses": 17,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 9.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 3.0,
-            "totalRank": 16.5,
-            "wins": 3,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 421.0,
-            "theoreticalWins": 13,
-            "theoreticalLosses": 22,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 5.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 4.0,
-            "totalRank": 12.5,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 383.0,
-            "theoreticalWins": 17,
-            "theoreticalLosses": 19,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 1.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 1.5,
-            "totalRank": 5.0,
-            "wins": 1,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 362.0,
-            "theoreticalWins": 9,
-            "theoreticalLosses": 26,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 1.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.5,
-            "totalRank": 4.0,
-            "wins": 1,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 307.0,
-            "theoreticalWins": 9,
-            "theoreticalLosses": 27,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 5,
-        "managers": [
-          {
-            "manager": "John",
-            "recordRank": 9.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.5,
-            "wins": 4,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 621.0,
-            "theoreticalWins": 33,
-            "theoreticalLosses": 12,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 8.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 7.5,
-            "totalRank": 24.5,
-            "wins": 3,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 593.0,
-            "theoreticalWins": 23,
-            "theoreticalLosses": 21,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 9.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 5.5,
-            "totalRank": 22.0,
-            "wins": 4,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 573.0,
-            "theoreticalWins": 22,
-            "theoreticalLosses": 22,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 4.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 9.0,
-            "totalRank": 21.0,
-            "wins": 2,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 582.0,
-            "theoreticalWins": 28,
-            "theoreticalLosses": 17,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 4.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 7.5,
-            "totalRank": 16.5,
-            "wins": 2,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 555.0,
-            "theoreticalWins": 23,
-            "theoreticalLosses": 22,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 4.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 4.0,
-            "totalRank": 14.0,
-            "wins": 2,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 561.0,
-            "theoreticalWins": 21,
-            "theoreticalLosses": 22,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 4.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 5.5,
-            "totalRank": 13.5,
-            "wins": 2,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 544.0,
-            "theoreticalWins": 22,
-            "theoreticalLosses": 22,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 4.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 3.0,
-            "totalRank": 9.0,
-            "wins": 2,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 474.0,
-            "theoreticalWins": 18,
-            "theoreticalLosses": 27,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 4.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 1.0,
-            "totalRank": 8.0,
-            "wins": 2,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 489.0,
-            "theoreticalWins": 15,
-            "theoreticalLosses": 29,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 4.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 2.0,
-            "totalRank": 7.0,
-            "wins": 2,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 450.0,
-            "theoreticalWins": 17,
-            "theoreticalLosses": 28,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 6,
-        "managers": [
-          {
-            "manager": "John",
-            "recordRank": 9.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.5,
-            "wins": 5,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 728.0,
-            "theoreticalWins": 38,
-            "theoreticalLosses": 16,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 6.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 24.5,
-            "wins": 3,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 704.0,
-            "theoreticalWins": 36,
-            "theoreticalLosses": 18,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 6.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 8.0,
-            "totalRank": 21.5,
-            "wins": 3,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 681.0,
-            "theoreticalWins": 31,
-            "theoreticalLosses": 22,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 6.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 7.0,
-            "totalRank": 21.5,
-            "wins": 3,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 702.0,
-            "theoreticalWins": 29,
-            "theoreticalLosses": 24,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 9.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 5.0,
-            "totalRank": 20.5,
-            "wins": 5,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 675.0,
-            "theoreticalWins": 25,
-            "theoreticalLosses": 28,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 2.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 6.0,
-            "totalRank": 13.5,
-            "wins": 2,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 660.0,
-            "theoreticalWins": 27,
-            "theoreticalLosses": 27,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 6.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 4.0,
-            "totalRank": 11.5,
-            "wins": 3,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 564.0,
-            "theoreticalWins": 24,
-            "theoreticalLosses": 30,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 2.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 3.0,
-            "totalRank": 9.5,
-            "wins": 2,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 651.0,
-            "theoreticalWins": 22,
-            "theoreticalLosses": 30,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 2.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 2.0,
-            "totalRank": 7.5,
-            "wins": 2,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 575.0,
-            "theoreticalWins": 20,
-            "theoreticalLosses": 34,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 2.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 1.0,
-            "totalRank": 5.5,
-            "wins": 2,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 568.0,
-            "theoreticalWins": 15,
-            "theoreticalLosses": 38,
-            "theoreticalTies": 1
-          }
-        ]
-      },
-      {
-        "week": 7,
-        "managers": [
-          {
-            "manager": "John",
-            "recordRank": 9.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 27.5,
-            "wins": 5,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 833.0,
-            "theoreticalWins": 41,
-            "theoreticalLosses": 22,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 4.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 24.0,
-            "wins": 3,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 855.0,
-            "theoreticalWins": 44,
-            "theoreticalLosses": 19,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 7.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 23.5,
-            "wins": 4,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 811.0,
-            "theoreticalWins": 38,
-            "theoreticalLosses": 24,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 9.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 3.0,
-            "totalRank": 17.5,
-            "wins": 5,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 776.0,
-            "theoreticalWins": 26,
-            "theoreticalLosses": 36,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 4.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 7.0,
-            "totalRank": 17.0,
-            "wins": 3,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 785.0,
-            "theoreticalWins": 33,
-            "theoreticalLosses": 30,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 4.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 6.0,
-            "totalRank": 17.0,
-            "wins": 3,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 808.0,
-            "theoreticalWins": 31,
-            "theoreticalLosses": 30,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 7.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 4.0,
-            "totalRank": 13.5,
-            "wins": 4,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 675.0,
-            "theoreticalWins": 28,
-            "theoreticalLosses": 35,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 4.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 5.0,
-            "totalRank": 13.0,
-            "wins": 3,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 770.0,
-            "theoreticalWins": 29,
-            "theoreticalLosses": 33,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 4.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 6.0,
-            "wins": 3,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 670.0,
-            "theoreticalWins": 17,
-            "theoreticalLosses": 45,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 1.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 2.0,
-            "totalRank": 6.0,
-            "wins": 2,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 692.0,
-            "theoreticalWins": 25,
-            "theoreticalLosses": 38,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 8,
-        "managers": [
-          {
-            "manager": "Peter",
-            "recordRank": 8.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 9.0,
-            "totalRank": 27.0,
-            "wins": 5,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 945.0,
-            "theoreticalWins": 46,
-            "theoreticalLosses": 25,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "John",
-            "recordRank": 8.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 22.0,
-            "wins": 5,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 912.0,
-            "theoreticalWins": 41,
-            "theoreticalLosses": 31,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 3.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 10.0,
-            "totalRank": 22.0,
-            "wins": 3,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 942.0,
-            "theoreticalWins": 48,
-            "theoreticalLosses": 24,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 5.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 21.5,
-            "wins": 4,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 920.0,
-            "theoreticalWins": 42,
-            "theoreticalLosses": 30,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 10.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 3.0,
-            "totalRank": 18.0,
-            "wins": 6,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 860.0,
-            "theoreticalWins": 29,
-            "theoreticalLosses": 42,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 8.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 5.0,
-            "totalRank": 16.0,
-            "wins": 5,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 793.0,
-            "theoreticalWins": 35,
-            "theoreticalLosses": 37,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 3.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 15.0,
-            "wins": 3,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 897.0,
-            "theoreticalWins": 36,
-            "theoreticalLosses": 34,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 3.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 11.0,
-            "wins": 3,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 850.0,
-            "theoreticalWins": 30,
-            "theoreticalLosses": 41,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 5.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 7.5,
-            "wins": 4,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 773.0,
-            "theoreticalWins": 23,
-            "theoreticalLosses": 48,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 1.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 5.0,
-            "wins": 2,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 775.0,
-            "theoreticalWins": 27,
-            "theoreticalLosses": 45,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 9,
-        "managers": [
-          {
-            "manager": "Peter",
-            "recordRank": 9.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 9.0,
-            "totalRank": 28.0,
-            "wins": 6,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1129.0,
-            "theoreticalWins": 55,
-            "theoreticalLosses": 25,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 7.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 23.0,
-            "wins": 5,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1048.0,
-            "theoreticalWins": 49,
-            "theoreticalLosses": 32,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 4.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 10.0,
-            "totalRank": 23.0,
-            "wins": 4,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1080.0,
-            "theoreticalWins": 56,
-            "theoreticalLosses": 25,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 7.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 21.0,
-            "wins": 5,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1004.0,
-            "theoreticalWins": 45,
-            "theoreticalLosses": 36,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 10.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 3.5,
-            "totalRank": 19.5,
-            "wins": 7,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 984.0,
-            "theoreticalWins": 35,
-            "theoreticalLosses": 45,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 7.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 6.0,
-            "totalRank": 16.0,
-            "wins": 5,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 870.0,
-            "theoreticalWins": 37,
-            "theoreticalLosses": 44,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 2.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 12.0,
-            "wins": 3,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 959.0,
-            "theoreticalWins": 36,
-            "theoreticalLosses": 43,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 4.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 3.5,
-            "totalRank": 11.5,
-            "wins": 4,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 949.0,
-            "theoreticalWins": 35,
-            "theoreticalLosses": 45,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 4.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 6.0,
-            "wins": 4,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 842.0,
-            "theoreticalWins": 24,
-            "theoreticalLosses": 56,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 1.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 5.0,
-            "wins": 2,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 861.0,
-            "theoreticalWins": 30,
-            "theoreticalLosses": 51,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 10,
-        "managers": [
-          {
-            "manager": "Peter",
-            "recordRank": 8.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.0,
-            "wins": 6,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1248.0,
-            "theoreticalWins": 59,
-            "theoreticalLosses": 30,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 8.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 24.0,
-            "wins": 6,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1170.0,
-            "theoreticalWins": 54,
-            "theoreticalLosses": 36,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 5.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 23.5,
-            "wins": 5,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1190.0,
-            "theoreticalWins": 58,
-            "theoreticalLosses": 32,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 8.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 22.0,
-            "wins": 6,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1147.0,
-            "theoreticalWins": 53,
-            "theoreticalLosses": 37,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 10.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 4.0,
-            "totalRank": 19.0,
-            "wins": 7,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1084.0,
-            "theoreticalWins": 36,
-            "theoreticalLosses": 53,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 3.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 15.0,
-            "wins": 4,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1114.0,
-            "theoreticalWins": 45,
-            "theoreticalLosses": 43,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 5.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 5.0,
-            "totalRank": 13.5,
-            "wins": 5,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 998.0,
-            "theoreticalWins": 43,
-            "theoreticalLosses": 47,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 3.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 3.0,
-            "totalRank": 10.0,
-            "wins": 4,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1032.0,
-            "theoreticalWins": 35,
-            "theoreticalLosses": 54,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 3.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 1.0,
-            "totalRank": 6.0,
-            "wins": 4,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 977.0,
-            "theoreticalWins": 31,
-            "theoreticalLosses": 58,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 2.0,
-            "totalRank": 4.0,
-            "wins": 3,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 973.0,
-            "theoreticalWins": 33,
-            "theoreticalLosses": 57,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 11,
-        "managers": [
-          {
-            "manager": "Peter",
-            "recordRank": 9.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 9.0,
-            "totalRank": 28.0,
-            "wins": 7,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1372.0,
-            "theoreticalWins": 64,
-            "theoreticalLosses": 33,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 9.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 25.0,
-            "wins": 7,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1291.0,
-            "theoreticalWins": 58,
-            "theoreticalLosses": 41,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 6.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 10.0,
-            "totalRank": 25.0,
-            "wins": 6,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1370.0,
-            "theoreticalWins": 67,
-            "theoreticalLosses": 32,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 6.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 7.0,
-            "totalRank": 19.0,
-            "wins": 6,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1242.0,
-            "theoreticalWins": 53,
-            "theoreticalLosses": 46,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 4.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 6.0,
-            "totalRank": 17.0,
-            "wins": 5,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1266.0,
-            "theoreticalWins": 52,
-            "theoreticalLosses": 45,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 9.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 3.0,
-            "totalRank": 17.0,
-            "wins": 7,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1192.0,
-            "theoreticalWins": 38,
-            "theoreticalLosses": 60,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 6.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 5.0,
-            "totalRank": 14.0,
-            "wins": 6,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1151.0,
-            "theoreticalWins": 51,
-            "theoreticalLosses": 48,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 2.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 10.5,
-            "wins": 4,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1156.0,
-            "theoreticalWins": 40,
-            "theoreticalLosses": 57,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 1.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 5.0,
-            "wins": 3,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1087.0,
-            "theoreticalWins": 36,
-            "theoreticalLosses": 63,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 2.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 4.5,
-            "wins": 4,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1081.0,
-            "theoreticalWins": 32,
-            "theoreticalLosses": 66,
-            "theoreticalTies": 1
-          }
-        ]
-      },
-      {
-        "week": 12,
-        "managers": [
-          {
-            "manager": "Peter",
-            "recordRank": 9.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 9.0,
-            "totalRank": 28.5,
-            "wins": 8,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1496.0,
-            "theoreticalWins": 71,
-            "theoreticalLosses": 35,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 6.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 10.0,
-            "totalRank": 25.5,
-            "wins": 7,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1489.0,
-            "theoreticalWins": 73,
-            "theoreticalLosses": 35,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 9.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 7.5,
-            "totalRank": 25.0,
-            "wins": 8,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1392.0,
-            "theoreticalWins": 62,
-            "theoreticalLosses": 46,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 6.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.5,
-            "totalRank": 21.0,
-            "wins": 7,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1381.0,
-            "theoreticalWins": 62,
-            "theoreticalLosses": 46,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 6.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 6.0,
-            "totalRank": 17.5,
-            "wins": 7,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1283.0,
-            "theoreticalWins": 59,
-            "theoreticalLosses": 49,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 4.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 5.0,
-            "totalRank": 15.0,
-            "wins": 5,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1372.0,
-            "theoreticalWins": 57,
-            "theoreticalLosses": 49,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 6.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 3.0,
-            "totalRank": 13.5,
-            "wins": 7,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1281.0,
-            "theoreticalWins": 40,
-            "theoreticalLosses": 67,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 2.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 4.0,
-            "totalRank": 9.5,
-            "wins": 4,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1251.0,
-            "theoreticalWins": 43,
-            "theoreticalLosses": 63,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 1.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 5.0,
-            "wins": 3,
-            "losses": 9,
-            "ties": 0,
-            "totalPoints": 1174.0,
-            "theoreticalWins": 37,
-            "theoreticalLosses": 71,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 2.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 4.5,
-            "wins": 4,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1167.0,
-            "theoreticalWins": 32,
-            "theoreticalLosses": 75,
-            "theoreticalTies": 1
-          }
-        ]
-      },
-      {
-        "week": 13,
-        "managers": [
-          {
-            "manager": "Peter",
-            "recordRank": 10.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 9.0,
-            "totalRank": 29.0,
-            "wins": 9,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1613.0,
-            "theoreticalWins": 79,
-            "theoreticalLosses": 36,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 7.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 10.0,
-            "totalRank": 26.5,
-            "wins": 8,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1601.0,
-            "theoreticalWins": 80,
-            "theoreticalLosses": 37,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 7.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 23.5,
-            "wins": 8,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1554.0,
-            "theoreticalWins": 71,
-            "theoreticalLosses": 46,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 7.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 21.5,
-            "wins": 8,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1493.0,
-            "theoreticalWins": 67,
-            "theoreticalLosses": 50,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 7.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 3.0,
-            "totalRank": 15.5,
-            "wins": 8,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1383.0,
-            "theoreticalWins": 46,
-            "theoreticalLosses": 70,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 5.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 6.0,
-            "totalRank": 15.0,
-            "wins": 7,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1355.0,
-            "theoreticalWins": 59,
-            "theoreticalLosses": 58,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 4.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 5.0,
-            "totalRank": 15.0,
-            "wins": 5,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1454.0,
-            "theoreticalWins": 58,
-            "theoreticalLosses": 57,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 2.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 4.0,
-            "totalRank": 9.0,
-            "wins": 4,
-            "losses": 9,
-            "ties": 0,
-            "totalPoints": 1350.0,
-            "theoreticalWins": 47,
-            "theoreticalLosses": 68,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 2.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 1.0,
-            "totalRank": 5.0,
-            "wins": 4,
-            "losses": 9,
-            "ties": 0,
-            "totalPoints": 1261.0,
-            "theoreticalWins": 35,
-            "theoreticalLosses": 81,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 2.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 2.0,
-            "totalRank": 5.0,
-            "wins": 4,
-            "losses": 9,
-            "ties": 0,
-            "totalPoints": 1260.0,
-            "theoreticalWins": 39,
-            "theoreticalLosses": 78,
-            "theoreticalTies": 0
-          }
-        ]
-      }
-    ],
-    "finalWeek": 13,
-    "finalRankings": [
-      {
-        "manager": "Peter",
-        "recordRank": 10.0,
-        "pointsRank": 10.0,
-        "breakdownRank": 9.0,
-        "totalRank": 29.0,
-        "wins": 9,
-        "losses": 4,
-        "ties": 0,
-        "totalPoints": 1613.0,
-        "theoreticalWins": 79,
-        "theoreticalLosses": 36,
-        "theoreticalTies": 2
-      },
-      {
-        "manager": "Joey",
-        "recordRank": 7.5,
-        "pointsRank": 9.0,
-        "breakdownRank": 10.0,
-        "totalRank": 26.5,
-        "wins": 8,
-        "losses": 5,
-        "ties": 0,
-        "totalPoints": 1601.0,
-        "theoreticalWins": 80,
-        "theoreticalLosses": 37,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "John",
-        "recordRank": 7.5,
-        "pointsRank": 8.0,
-        "breakdownRank": 8.0,
-        "totalRank": 23.5,
-        "wins": 8,
-        "losses": 5,
-        "ties": 0,
-        "totalPoints": 1554.0,
-        "theoreticalWins": 71,
-        "theoreticalLosses": 46,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Matt",
-        "recordRank": 7.5,
-        "pointsRank": 7.0,
-        "breakdownRank": 7.0,
-        "totalRank": 21.5,
-        "wins": 8,
-        "losses": 5,
-        "ties": 0,
-        "totalPoints": 1493.0,
-        "theoreticalWins": 67,
-        "theoreticalLosses": 50,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Ben",
-        "recordRank": 7.5,
-        "pointsRank": 5.0,
-        "breakdownRank": 3.0,
-        "totalRank": 15.5,
-        "wins": 8,
-        "losses": 5,
-        "ties": 0,
-        "totalPoints": 1383.0,
-        "theoreticalWins": 46,
-        "theoreticalLosses": 70,
-        "theoreticalTies": 1
-      },
-      {
-        "manager": "Vernon",
-        "recordRank": 5.0,
-        "pointsRank": 4.0,
-        "breakdownRank": 6.0,
-        "totalRank": 15.0,
-        "wins": 7,
-        "losses": 6,
-        "ties": 0,
-        "totalPoints": 1355.0,
-        "theoreticalWins": 59,
-        "theoreticalLosses": 58,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Tyler",
-        "recordRank": 4.0,
-        "pointsRank": 6.0,
-        "breakdownRank": 5.0,
-        "totalRank": 15.0,
-        "wins": 5,
-        "losses": 8,
-        "ties": 0,
-        "totalPoints": 1454.0,
-        "theoreticalWins": 58,
-        "theoreticalLosses": 57,
-        "theoreticalTies": 2
-      },
-      {
-        "manager": "Ted",
-        "recordRank": 2.0,
-        "pointsRank": 3.0,
-        "breakdownRank": 4.0,
-        "totalRank": 9.0,
-        "wins": 4,
-        "losses": 9,
-        "ties": 0,
-        "totalPoints": 1350.0,
-        "theoreticalWins": 47,
-        "theoreticalLosses": 68,
-        "theoreticalTies": 2
-      },
-      {
-        "manager": "Ty",
-        "recordRank": 2.0,
-        "pointsRank": 2.0,
-        "breakdownRank": 1.0,
-        "totalRank": 5.0,
-        "wins": 4,
-        "losses": 9,
-        "ties": 0,
-        "totalPoints": 1261.0,
-        "theoreticalWins": 35,
-        "theoreticalLosses": 81,
-        "theoreticalTies": 1
-      },
-      {
-        "manager": "Lanny",
-        "recordRank": 2.0,
-        "pointsRank": 1.0,
-        "breakdownRank": 2.0,
-        "totalRank": 5.0,
-        "wins": 4,
-        "losses": 9,
-        "ties": 0,
-        "totalPoints": 1260.0,
-        "theoreticalWins": 39,
-        "theoreticalLosses": 78,
-        "theoreticalTies": 0
-      }
-    ]
-  },
-  "2011": {
-    "weeks": [
-      {
-        "week": 1,
-        "managers": [
-          {
-            "manager": "Tyler",
-            "recordRank": 8.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 159.0,
-            "theoreticalWins": 9,
-            "theoreticalLosses": 0,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 8.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 26.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 151.0,
-            "theoreticalWins": 8,
-            "theoreticalLosses": 1,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 8.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 24.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 130.0,
-            "theoreticalWins": 7,
-            "theoreticalLosses": 2,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 8.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 20.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 125.0,
-            "theoreticalWins": 5,
-            "theoreticalLosses": 4,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 3.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 17.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 126.0,
-            "theoreticalWins": 6,
-            "theoreticalLosses": 3,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 3.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 13.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 122.0,
-            "theoreticalWins": 4,
-            "theoreticalLosses": 5,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 8.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 12.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 109.0,
-            "theoreticalWins": 1,
-            "theoreticalLosses": 8,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 3.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 11.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 117.0,
-            "theoreticalWins": 3,
-            "theoreticalLosses": 6,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 3.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 9.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 114.0,
-            "theoreticalWins": 2,
-            "theoreticalLosses": 7,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 3.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 5.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 85.0,
-            "theoreticalWins": 0,
-            "theoreticalLosses": 9,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 2,
-        "managers": [
-          {
-            "manager": "Joey",
-            "recordRank": 9.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.0,
-            "wins": 2,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 318.0,
-            "theoreticalWins": 17,
-            "theoreticalLosses": 1,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 5.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 7.5,
-            "totalRank": 22.0,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 272.0,
-            "theoreticalWins": 10,
-            "theoreticalLosses": 8,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 9.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 6.0,
-            "totalRank": 22.0,
-            "wins": 2,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 266.0,
-            "theoreticalWins": 9,
-            "theoreticalLosses": 9,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 5.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 7.5,
-            "totalRank": 21.0,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 268.0,
-            "theoreticalWins": 10,
-            "theoreticalLosses": 8,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 5.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 9.0,
-            "totalRank": 20.5,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 265.0,
-            "theoreticalWins": 12,
-            "theoreticalLosses": 6,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 9.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 3.5,
-            "totalRank": 16.5,
-            "wins": 2,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 237.0,
-            "theoreticalWins": 7,
-            "theoreticalLosses": 10,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 2.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 12.0,
-            "wins": 0,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 238.0,
-            "theoreticalWins": 8,
-            "theoreticalLosses": 9,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 5.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.5,
-            "totalRank": 12.0,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 236.0,
-            "theoreticalWins": 7,
-            "theoreticalLosses": 11,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 2.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 6.0,
-            "wins": 0,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 233.0,
-            "theoreticalWins": 6,
-            "theoreticalLosses": 12,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 2.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 4.0,
-            "wins": 0,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 223.0,
-            "theoreticalWins": 3,
-            "theoreticalLosses": 15,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 3,
-        "managers": [
-          {
-            "manager": "Joey",
-            "recordRank": 9.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.0,
-            "wins": 3,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 460.0,
-            "theoreticalWins": 26,
-            "theoreticalLosses": 1,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 9.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 6.5,
-            "totalRank": 23.5,
-            "wins": 3,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 383.0,
-            "theoreticalWins": 13,
-            "theoreticalLosses": 13,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 7.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 9.0,
-            "totalRank": 22.0,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 375.0,
-            "theoreticalWins": 15,
-            "theoreticalLosses": 12,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 4.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 6.5,
-            "totalRank": 20.0,
-            "wins": 1,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 387.0,
-            "theoreticalWins": 13,
-            "theoreticalLosses": 14,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 4.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 4.5,
-            "totalRank": 16.0,
-            "wins": 1,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 378.0,
-            "theoreticalWins": 12,
-            "theoreticalLosses": 15,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 9.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 3.0,
-            "totalRank": 16.0,
-            "wins": 3,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 354.0,
-            "theoreticalWins": 11,
-            "theoreticalLosses": 14,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 1.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 8.0,
-            "totalRank": 14.5,
-            "wins": 0,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 363.0,
-            "theoreticalWins": 14,
-            "theoreticalLosses": 12,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 4.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 4.5,
-            "totalRank": 11.0,
-            "wins": 1,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 349.0,
-            "theoreticalWins": 12,
-            "theoreticalLosses": 15,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 4.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 2.0,
-            "totalRank": 9.5,
-            "wins": 1,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 352.0,
-            "theoreticalWins": 10,
-            "theoreticalLosses": 17,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 1.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.5,
-            "wins": 0,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 334.0,
-            "theoreticalWins": 7,
-            "theoreticalLosses": 20,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 4,
-        "managers": [
-          {
-            "manager": "Joey",
-            "recordRank": 7.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 27.5,
-            "wins": 3,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 562.0,
-            "theoreticalWins": 29,
-            "theoreticalLosses": 7,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 9.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 25.5,
-            "wins": 4,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 542.0,
-            "theoreticalWins": 21,
-            "theoreticalLosses": 14,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 3.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 21.5,
-            "wins": 1,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 544.0,
-            "theoreticalWins": 23,
-            "theoreticalLosses": 12,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 9.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 5.5,
-            "totalRank": 21.0,
-            "wins": 4,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 502.0,
-            "theoreticalWins": 18,
-            "theoreticalLosses": 16,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 7.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 7.0,
-            "totalRank": 19.5,
-            "wins": 3,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 491.0,
-            "theoreticalWins": 19,
-            "theoreticalLosses": 17,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 6.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 5.5,
-            "totalRank": 18.5,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 516.0,
-            "theoreticalWins": 18,
-            "theoreticalLosses": 18,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 3.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 11.5,
-            "wins": 1,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 478.0,
-            "theoreticalWins": 17,
-            "theoreticalLosses": 19,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 3.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 9.5,
-            "wins": 1,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 459.0,
-            "theoreticalWins": 13,
-            "theoreticalLosses": 23,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 3.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 7.5,
-            "wins": 1,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 446.0,
-            "theoreticalWins": 11,
-            "theoreticalLosses": 24,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 0,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 428.0,
-            "theoreticalWins": 8,
-            "theoreticalLosses": 27,
-            "theoreticalTies": 1
-          }
-        ]
-      },
-      {
-        "week": 5,
-        "managers": [
-          {
-            "manager": "Ben",
-            "recordRank": 10.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 8.5,
-            "totalRank": 28.5,
-            "wins": 5,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 677.0,
-            "theoreticalWins": 28,
-            "theoreticalLosses": 16,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 6.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 10.0,
-            "totalRank": 25.5,
-            "wins": 3,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 671.0,
-            "theoreticalWins": 33,
-            "theoreticalLosses": 12,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 5.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.5,
-            "totalRank": 21.5,
-            "wins": 2,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 661.0,
-            "theoreticalWins": 28,
-            "theoreticalLosses": 16,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 8.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 7.0,
-            "totalRank": 21.5,
-            "wins": 4,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 629.0,
-            "theoreticalWins": 27,
-            "theoreticalLosses": 18,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 8.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 6.0,
-            "totalRank": 21.5,
-            "wins": 4,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 635.0,
-            "theoreticalWins": 24,
-            "theoreticalLosses": 19,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 6.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 16.5,
-            "wins": 3,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 621.0,
-            "theoreticalWins": 21,
-            "theoreticalLosses": 24,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 2.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 3.5,
-            "totalRank": 10.0,
-            "wins": 1,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 574.0,
-            "theoreticalWins": 17,
-            "theoreticalLosses": 27,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 2.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.5,
-            "totalRank": 9.0,
-            "wins": 1,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 567.0,
-            "theoreticalWins": 17,
-            "theoreticalLosses": 27,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 2.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 6.5,
-            "wins": 1,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 549.0,
-            "theoreticalWins": 15,
-            "theoreticalLosses": 30,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 2.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 4.5,
-            "wins": 1,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 535.0,
-            "theoreticalWins": 11,
-            "theoreticalLosses": 32,
-            "theoreticalTies": 2
-          }
-        ]
-      },
-      {
-        "week": 6,
-        "managers": [
-          {
-            "manager": "Joey",
-            "recordRank": 7.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 27.0,
-            "wins": 4,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 818.0,
-            "theoreticalWins": 42,
-            "theoreticalLosses": 12,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 9.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 8.0,
-            "totalRank": 26.5,
-            "wins": 5,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 790.0,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 19,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 9.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 7.0,
-            "totalRank": 22.5,
-            "wins": 5,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 729.0,
-            "theoreticalWins": 30,
-            "theoreticalLosses": 24,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 4.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 9.0,
-            "totalRank": 21.0,
-            "wins": 2,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 781.0,
-            "theoreticalWins": 35,
-            "theoreticalLosses": 18,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 7.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 6.0,
-            "totalRank": 20.0,
-            "wins": 4,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 734.0,
-            "theoreticalWins": 26,
-            "theoreticalLosses": 26,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 7.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 3.5,
-            "totalRank": 15.5,
-            "wins": 4,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 718.0,
-            "theoreticalWins": 22,
-            "theoreticalLosses": 32,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 4.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 5.0,
-            "totalRank": 13.0,
-            "wins": 2,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 699.0,
-            "theoreticalWins": 25,
-            "theoreticalLosses": 28,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 4.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.5,
-            "totalRank": 10.5,
-            "wins": 2,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 675.0,
-            "theoreticalWins": 22,
-            "theoreticalLosses": 31,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 1.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 5.5,
-            "wins": 1,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 650.0,
-            "theoreticalWins": 19,
-            "theoreticalLosses": 35,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 1.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.5,
-            "wins": 1,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 624.0,
-            "theoreticalWins": 11,
-            "theoreticalLosses": 41,
-            "theoreticalTies": 2
-          }
-        ]
-      },
-      {
-        "week": 7,
-        "managers": [
-          {
-            "manager": "Joey",
-            "recordRank": 9.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.0,
-            "wins": 5,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 938.0,
-            "theoreticalWins": 48,
-            "theoreticalLosses": 15,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 9.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 8.0,
-            "totalRank": 24.0,
-            "wins": 5,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 862.0,
-            "theoreticalWins": 36,
-            "theoreticalLosses": 26,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 4.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 9.0,
-            "totalRank": 23.5,
-            "wins": 3,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 939.0,
-            "theoreticalWins": 44,
-            "theoreticalLosses": 18,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 6.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 7.0,
-            "totalRank": 21.5,
-            "wins": 4,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 876.0,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 27,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 9.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 21.0,
-            "wins": 5,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 822.0,
-            "theoreticalWins": 33,
-            "theoreticalLosses": 30,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 4.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 14.5,
-            "wins": 3,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 807.0,
-            "theoreticalWins": 29,
-            "theoreticalLosses": 33,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 6.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 2.0,
-            "totalRank": 12.5,
-            "wins": 4,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 772.0,
-            "theoreticalWins": 23,
-            "theoreticalLosses": 40,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 2.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 8.0,
-            "wins": 2,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 748.0,
-            "theoreticalWins": 24,
-            "theoreticalLosses": 39,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 2.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 4.0,
-            "totalRank": 8.0,
-            "wins": 2,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 738.0,
-            "theoreticalWins": 25,
-            "theoreticalLosses": 37,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "John",
-            "recordRank": 2.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 4.0,
-            "wins": 2,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 721.0,
-            "theoreticalWins": 15,
-            "theoreticalLosses": 46,
-            "theoreticalTies": 2
-          }
-        ]
-      },
-      {
-        "week": 8,
-        "managers": [
-          {
-            "manager": "Joey",
-            "recordRank": 9.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.5,
-            "wins": 6,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1104.0,
-            "theoreticalWins": 57,
-            "theoreticalLosses": 15,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 9.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.5,
-            "totalRank": 24.0,
-            "wins": 6,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 981.0,
-            "theoreticalWins": 41,
-            "theoreticalLosses": 30,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 4.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 22.0,
-            "wins": 3,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1018.0,
-            "theoreticalWins": 44,
-            "theoreticalLosses": 27,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 7.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 6.0,
-            "totalRank": 21.0,
-            "wins": 5,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 998.0,
-            "theoreticalWins": 40,
-            "theoreticalLosses": 30,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 7.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 7.5,
-            "totalRank": 20.5,
-            "wins": 5,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 957.0,
-            "theoreticalWins": 41,
-            "theoreticalLosses": 31,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 7.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 15.0,
-            "wins": 5,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 895.0,
-            "theoreticalWins": 30,
-            "theoreticalLosses": 42,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 5.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 15.0,
-            "wins": 4,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 907.0,
-            "theoreticalWins": 33,
-            "theoreticalLosses": 38,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 2.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 8.0,
-            "wins": 2,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 834.0,
-            "theoreticalWins": 28,
-            "theoreticalLosses": 43,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 2.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 6.0,
-            "wins": 2,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 833.0,
-            "theoreticalWins": 26,
-            "theoreticalLosses": 46,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 2.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 4.0,
-            "wins": 2,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 802.0,
-            "theoreticalWins": 16,
-            "theoreticalLosses": 54,
-            "theoreticalTies": 2
-          }
-        ]
-      },
-      {
-        "week": 9,
-        "managers": [
-          {
-            "manager": "Joey",
-            "recordRank": 10.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 30.0,
-            "wins": 7,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1233.0,
-            "theoreticalWins": 64,
-            "theoreticalLosses": 17,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 8.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 7.5,
-            "totalRank": 23.5,
-            "wins": 6,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1119.0,
-            "theoreticalWins": 46,
-            "theoreticalLosses": 33,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 4.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 22.0,
-            "wins": 4,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1150.0,
-            "theoreticalWins": 53,
-            "theoreticalLosses": 27,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 8.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 6.0,
-            "totalRank": 21.0,
-            "wins": 6,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1084.0,
-            "theoreticalWins": 43,
-            "theoreticalLosses": 36,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 5.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 7.5,
-            "totalRank": 19.0,
-            "wins": 5,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1074.0,
-            "theoreticalWins": 46,
-            "theoreticalLosses": 35,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 8.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 16.0,
-            "wins": 6,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1007.0,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 47,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 5.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 15.5,
-            "wins": 5,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1038.0,
-            "theoreticalWins": 41,
-            "theoreticalLosses": 39,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 2.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 2.0,
-            "totalRank": 7.0,
-            "wins": 2,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 936.0,
-            "theoreticalWins": 28,
-            "theoreticalLosses": 52,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 2.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 3.0,
-            "totalRank": 7.0,
-            "wins": 2,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 933.0,
-            "theoreticalWins": 29,
-            "theoreticalLosses": 51,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "John",
-            "recordRank": 2.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 4.0,
-            "wins": 2,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 886.0,
-            "theoreticalWins": 16,
-            "theoreticalLosses": 63,
-            "theoreticalTies": 2
-          }
-        ]
-      },
-      {
-        "week": 10,
-        "managers": [
-          {
-            "manager": "Joey",
-            "recordRank": 10.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 30.0,
-            "wins": 8,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1334.0,
-            "theoreticalWins": 67,
-            "theoreticalLosses": 23,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 9.0,
-            "pointsRank": 8.5,
-            "breakdownRank": 8.0,
-            "totalRank": 25.5,
-            "wins": 7,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1257.0,
-            "theoreticalWins": 55,
-            "theoreticalLosses": 33,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 4.0,
-            "pointsRank": 8.5,
-            "breakdownRank": 9.0,
-            "totalRank": 21.5,
-            "wins": 4,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1257.0,
-            "theoreticalWins": 57,
-            "theoreticalLosses": 32,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 6.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 20.5,
-            "wins": 6,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1208.0,
-            "theoreticalWins": 54,
-            "theoreticalLosses": 36,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 6.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 5.0,
-            "totalRank": 17.5,
-            "wins": 6,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1182.0,
-            "theoreticalWins": 45,
-            "theoreticalLosses": 43,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 6.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 6.0,
-            "totalRank": 17.5,
-            "wins": 6,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1162.0,
-            "theoreticalWins": 48,
-            "theoreticalLosses": 41,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 6.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 3.5,
-            "totalRank": 14.0,
-            "wins": 6,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1088.0,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 55,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 1.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.5,
-            "totalRank": 8.0,
-            "wins": 2,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1052.0,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 55,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 1.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 5.5,
-            "wins": 2,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1017.0,
-            "theoreticalWins": 28,
-            "theoreticalLosses": 60,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "John",
-            "recordRank": 3.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 5.0,
-            "wins": 3,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1007.0,
-            "theoreticalWins": 22,
-            "theoreticalLosses": 66,
-            "theoreticalTies": 2
-          }
-        ]
-      },
-      {
-        "week": 11,
-        "managers": [
-          {
-            "manager": "Joey",
-            "recordRank": 9.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.5,
-            "wins": 8,
-            "losses": 2,
-            "ties": 1,
-            "totalPoints": 1449.0,
-            "theoreticalWins": 72,
-            "theoreticalLosses": 26,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 9.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 27.5,
-            "wins": 8,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1386.0,
-            "theoreticalWins": 64,
-            "theoreticalLosses": 33,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 7.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 6.5,
-            "totalRank": 21.0,
-            "wins": 7,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1299.0,
-            "theoreticalWins": 56,
-            "theoreticalLosses": 43,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 3.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 19.5,
-            "wins": 4,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1362.0,
-            "theoreticalWins": 60,
-            "theoreticalLosses": 38,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 5.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 6.5,
-            "totalRank": 17.0,
-            "wins": 6,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1285.0,
-            "theoreticalWins": 56,
-            "theoreticalLosses": 42,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 5.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 5.0,
-            "totalRank": 16.5,
-            "wins": 6,
-            "losses": 4,
-            "ties": 1,
-            "totalPoints": 1297.0,
-            "theoreticalWins": 50,
-            "theoreticalLosses": 46,
-            "theoreticalTies": 3
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 7.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 15.5,
-            "wins": 7,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1202.0,
-            "theoreticalWins": 38,
-            "theoreticalLosses": 60,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 1.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 7.5,
-            "wins": 2,
-            "losses": 9,
-            "ties": 0,
-            "totalPoints": 1132.0,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 63,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "John",
-            "recordRank": 3.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 7.5,
-            "wins": 4,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1123.0,
-            "theoreticalWins": 29,
-            "theoreticalLosses": 68,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 1.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.5,
-            "wins": 2,
-            "losses": 9,
-            "ties": 0,
-            "totalPoints": 1097.0,
-            "theoreticalWins": 28,
-            "theoreticalLosses": 68,
-            "theoreticalTies": 3
-          }
-        ]
-      },
-      {
-        "week": 12,
-        "managers": [
-          {
-            "manager": "Lanny",
-            "recordRank": 10.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 28.0,
-            "wins": 9,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1523.0,
-            "theoreticalWins": 72,
-            "theoreticalLosses": 34,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 8.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.0,
-            "wins": 8,
-            "losses": 3,
-            "ties": 1,
-            "totalPoints": 1575.0,
-            "theoreticalWins": 79,
-            "theoreticalLosses": 28,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 8.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.5,
-            "totalRank": 22.5,
-            "wins": 8,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1421.0,
-            "theoreticalWins": 62,
-            "theoreticalLosses": 46,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 3.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 7.5,
-            "totalRank": 19.0,
-            "wins": 4,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1468.0,
-            "theoreticalWins": 62,
-            "theoreticalLosses": 45,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 6.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 5.0,
-            "totalRank": 17.0,
-            "wins": 7,
-            "losses": 4,
-            "ties": 1,
-            "totalPoints": 1412.0,
-            "theoreticalWins": 54,
-            "theoreticalLosses": 51,
-            "theoreticalTies": 3
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 8.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 16.0,
-            "wins": 8,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1350.0,
-            "theoreticalWins": 47,
-            "theoreticalLosses": 60,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 5.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 6.0,
-            "totalRank": 16.0,
-            "wins": 6,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1406.0,
-            "theoreticalWins": 61,
-            "theoreticalLosses": 46,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "John",
-            "recordRank": 3.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 1.0,
-            "totalRank": 7.5,
-            "wins": 4,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1225.0,
-            "theoreticalWins": 30,
-            "theoreticalLosses": 76,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 1.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 3.0,
-            "totalRank": 6.0,
-            "wins": 2,
-            "losses": 10,
-            "ties": 0,
-            "totalPoints": 1216.0,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 72,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 2.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 2.0,
-            "totalRank": 5.0,
-            "wins": 3,
-            "losses": 9,
-            "ties": 0,
-            "totalPoints": 1211.0,
-            "theoreticalWins": 31,
-            "theoreticalLosses": 74,
-            "theoreticalTies": 3
-          }
-        ]
-      },
-      {
-        "week": 13,
-        "managers": [
-          {
-            "manager": "Joey",
-            "recordRank": 8.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.5,
-            "wins": 9,
-            "losses": 3,
-            "ties": 1,
-            "totalPoints": 1726.0,
-            "theoreticalWins": 87,
-            "theoreticalLosses": 29,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 10.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 28.0,
-            "wins": 10,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1677.0,
-            "theoreticalWins": 81,
-            "theoreticalLosses": 34,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 8.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 8.0,
-            "totalRank": 23.5,
-            "wins": 9,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1545.0,
-            "theoreticalWins": 67,
-            "theoreticalLosses": 50,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 3.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 7.0,
-            "totalRank": 18.0,
-            "wins": 4,
-            "losses": 9,
-            "ties": 0,
-            "totalPoints": 1573.0,
-            "theoreticalWins": 65,
-            "theoreticalLosses": 51,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 6.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 5.0,
-            "totalRank": 17.5,
-            "wins": 8,
-            "losses": 4,
-            "ties": 1,
-            "totalPoints": 1518.0,
-            "theoreticalWins": 58,
-            "theoreticalLosses": 56,
-            "theoreticalTies": 3
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 5.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 6.0,
-            "totalRank": 16.0,
-            "wins": 6,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1499.0,
-            "theoreticalWins": 62,
-            "theoreticalLosses": 54,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 6.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 14.5,
-            "wins": 8,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1498.0,
-            "theoreticalWins": 54,
-            "theoreticalLosses": 62,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 1.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 7.0,
-            "wins": 2,
-            "losses": 11,
-            "ties": 0,
-            "totalPoints": 1359.0,
-            "theoreticalWins": 40,
-            "theoreticalLosses": 75,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 3.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 2.0,
-            "totalRank": 6.0,
-            "wins": 4,
-            "losses": 9,
-            "ties": 0,
-            "totalPoints": 1308.0,
-            "theoreticalWins": 33,
-            "theoreticalLosses": 81,
-            "theoreticalTies": 3
-          },
-          {
-            "manager": "John",
-            "recordRank": 3.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 1.0,
-            "totalRank": 6.0,
-            "wins": 4,
-            "losses": 9,
-            "ties": 0,
-            "totalPoints": 1313.0,
-            "theoreticalWins": 30,
-            "theoreticalLosses": 85,
-            "theoreticalTies": 2
-          }
-        ]
-      }
-    ],
-    "finalWeek": 13,
-    "finalRankings": [
-      {
-        "manager": "Joey",
-        "recordRank": 8.5,
-        "pointsRank": 10.0,
-        "breakdownRank": 10.0,
-        "totalRank": 28.5,
-        "wins": 9,
-        "losses": 3,
-        "ties": 1,
-        "totalPoints": 1726.0,
-        "theoreticalWins": 87,
-        "theoreticalLosses": 29,
-        "theoreticalTies": 1
-      },
-      {
-        "manager": "Lanny",
-        "recordRank": 10.0,
-        "pointsRank": 9.0,
-        "breakdownRank": 9.0,
-        "totalRank": 28.0,
-        "wins": 10,
-        "losses": 3,
-        "ties": 0,
-        "totalPoints": 1677.0,
-        "theoreticalWins": 81,
-        "theoreticalLosses": 34,
-        "theoreticalTies": 2
-      },
-      {
-        "manager": "Vernon",
-        "recordRank": 8.5,
-        "pointsRank": 7.0,
-        "breakdownRank": 8.0,
-        "totalRank": 23.5,
-        "wins": 9,
-        "losses": 4,
-        "ties": 0,
-        "totalPoints": 1545.0,
-        "theoreticalWins": 67,
-        "theoreticalLosses": 50,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Matt",
-        "recordRank": 3.0,
-        "pointsRank": 8.0,
-        "breakdownRank": 7.0,
-        "totalRank": 18.0,
-        "wins": 4,
-        "losses": 9,
-        "ties": 0,
-        "totalPoints": 1573.0,
-        "theoreticalWins": 65,
-        "theoreticalLosses": 51,
-        "theoreticalTies": 1
-      },
-      {
-        "manager": "Ben",
-        "recordRank": 6.5,
-        "pointsRank": 6.0,
-        "breakdownRank": 5.0,
-        "totalRank": 17.5,
-        "wins": 8,
-        "losses": 4,
-        "ties": 1,
-        "totalPoints": 1518.0,
-        "theoreticalWins": 58,
-        "theoreticalLosses": 56,
-        "theoreticalTies": 3
-      },
-      {
-        "manager": "Peter",
-        "recordRank": 5.0,
-        "pointsRank": 5.0,
-        "breakdownRank": 6.0,
-        "totalRank": 16.0,
-        "wins": 6,
-        "losses": 7,
-        "ties": 0,
-        "totalPoints": 1499.0,
-        "theoreticalWins": 62,
-        "theoreticalLosses": 54,
-        "theoreticalTies": 1
-      },
-      {
-        "manager": "Tyler",
-        "recordRank": 6.5,
-        "pointsRank": 4.0,
-        "breakdownRank": 4.0,
-        "totalRank": 14.5,
-        "wins": 8,
-        "losses": 5,
-        "ties": 0,
-        "totalPoints": 1498.0,
-        "theoreticalWins": 54,
-        "theoreticalLosses": 62,
-        "theoreticalTies": 1
-      },
-      {
-        "manager": "Ty",
-        "recordRank": 1.0,
-        "pointsRank": 3.0,
-        "breakdownRank": 3.0,
-        "totalRank": 7.0,
-        "wins": 2,
-        "losses": 11,
-        "ties": 0,
-        "totalPoints": 1359.0,
-        "theoreticalWins": 40,
-        "theoreticalLosses": 75,
-        "theoreticalTies": 2
-      },
-      {
-        "manager": "Ted",
-        "recordRank": 3.0,
-        "pointsRank": 1.0,
-        "breakdownRank": 2.0,
-        "totalRank": 6.0,
-        "wins": 4,
-        "losses": 9,
-        "ties": 0,
-        "totalPoints": 1308.0,
-        "theoreticalWins": 33,
-        "theoreticalLosses": 81,
-        "theoreticalTies": 3
-      },
-      {
-        "manager": "John",
-        "recordRank": 3.0,
-        "pointsRank": 2.0,
-        "breakdownRank": 1.0,
-        "totalRank": 6.0,
-        "wins": 4,
-        "losses": 9,
-        "ties": 0,
-        "totalPoints": 1313.0,
-        "theoreticalWins": 30,
-        "theoreticalLosses": 85,
-        "theoreticalTies": 2
-      }
-    ]
-  },
-  "2012": {
-    "weeks": [
-      {
-        "week": 1,
-        "managers": [
-          {
-            "manager": "Ted",
-            "recordRank": 8.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 159.0,
-            "theoreticalWins": 9,
-            "theoreticalLosses": 0,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 8.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 26.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 140.0,
-            "theoreticalWins": 8,
-            "theoreticalLosses": 1,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 8.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 24.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 134.0,
-            "theoreticalWins": 7,
-            "theoreticalLosses": 2,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 8.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 20.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 128.0,
-            "theoreticalWins": 5,
-            "theoreticalLosses": 4,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 8.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 18.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 124.0,
-            "theoreticalWins": 4,
-            "theoreticalLosses": 5,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 3.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 17.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 131.0,
-            "theoreticalWins": 6,
-            "theoreticalLosses": 3,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 3.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 11.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 123.0,
-            "theoreticalWins": 3,
-            "theoreticalLosses": 6,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 3.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 9.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 109.0,
-            "theoreticalWins": 2,
-            "theoreticalLosses": 7,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 3.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 7.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 98.0,
-            "theoreticalWins": 1,
-            "theoreticalLosses": 8,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 3.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 5.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 93.0,
-            "theoreticalWins": 0,
-            "theoreticalLosses": 9,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 2,
-        "managers": [
-          {
-            "manager": "Ted",
-            "recordRank": 9.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.0,
-            "wins": 2,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 287.0,
-            "theoreticalWins": 15,
-            "theoreticalLosses": 3,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 9.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 27.0,
-            "wins": 2,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 282.0,
-            "theoreticalWins": 14,
-            "theoreticalLosses": 4,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 9.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 25.0,
-            "wins": 2,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 259.0,
-            "theoreticalWins": 12,
-            "theoreticalLosses": 6,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 5.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 19.5,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 244.0,
-            "theoreticalWins": 9,
-            "theoreticalLosses": 9,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 5.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 3.5,
-            "totalRank": 14.0,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 232.0,
-            "theoreticalWins": 7,
-            "theoreticalLosses": 11,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 5.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 3.5,
-            "totalRank": 13.0,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 230.0,
-            "theoreticalWins": 7,
-            "theoreticalLosses": 11,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 2.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 3.5,
-            "totalRank": 11.5,
-            "wins": 0,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 235.0,
-            "theoreticalWins": 7,
-            "theoreticalLosses": 11,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 5.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 3.5,
-            "totalRank": 11.0,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 225.0,
-            "theoreticalWins": 7,
-            "theoreticalLosses": 11,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 2.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 6.0,
-            "totalRank": 11.0,
-            "wins": 0,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 228.0,
-            "theoreticalWins": 8,
-            "theoreticalLosses": 10,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 2.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 4.0,
-            "wins": 0,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 219.0,
-            "theoreticalWins": 4,
-            "theoreticalLosses": 14,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 3,
-        "managers": [
-          {
-            "manager": "Ted",
-            "recordRank": 9.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.5,
-            "wins": 3,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 398.0,
-            "theoreticalWins": 21,
-            "theoreticalLosses": 6,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 9.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 9.0,
-            "totalRank": 26.5,
-            "wins": 3,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 385.0,
-            "theoreticalWins": 17,
-            "theoreticalLosses": 10,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 7.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 8.0,
-            "totalRank": 24.0,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 393.0,
-            "theoreticalWins": 16,
-            "theoreticalLosses": 11,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 7.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 6.0,
-            "totalRank": 17.0,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 349.0,
-            "theoreticalWins": 14,
-            "theoreticalLosses": 13,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 4.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 4.0,
-            "totalRank": 15.0,
-            "wins": 1,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 364.0,
-            "theoreticalWins": 12,
-            "theoreticalLosses": 15,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 1.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 7.0,
-            "totalRank": 14.5,
-            "wins": 0,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 353.0,
-            "theoreticalWins": 15,
-            "theoreticalLosses": 12,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 4.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 14.0,
-            "wins": 1,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 351.0,
-            "theoreticalWins": 13,
-            "theoreticalLosses": 13,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "John",
-            "recordRank": 7.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 13.0,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 332.0,
-            "theoreticalWins": 11,
-            "theoreticalLosses": 15,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 4.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 6.0,
-            "wins": 1,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 304.0,
-            "theoreticalWins": 7,
-            "theoreticalLosses": 20,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 1.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 5.5,
-            "wins": 0,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 321.0,
-            "theoreticalWins": 8,
-            "theoreticalLosses": 19,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 4,
-        "managers": [
-          {
-            "manager": "Vernon",
-            "recordRank": 10.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 30.0,
-            "wins": 4,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 545.0,
-            "theoreticalWins": 26,
-            "theoreticalLosses": 10,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 8.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 26.5,
-            "wins": 3,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 525.0,
-            "theoreticalWins": 24,
-            "theoreticalLosses": 12,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 8.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 6.0,
-            "totalRank": 19.5,
-            "wins": 3,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 489.0,
-            "theoreticalWins": 18,
-            "theoreticalLosses": 18,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 5.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 6.0,
-            "totalRank": 19.5,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 513.0,
-            "theoreticalWins": 18,
-            "theoreticalLosses": 18,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 5.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 17.5,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 498.0,
-            "theoreticalWins": 18,
-            "theoreticalLosses": 17,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 2.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 8.0,
-            "totalRank": 17.5,
-            "wins": 1,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 502.0,
-            "theoreticalWins": 22,
-            "theoreticalLosses": 14,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 5.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 4.0,
-            "totalRank": 11.5,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 462.0,
-            "theoreticalWins": 15,
-            "theoreticalLosses": 21,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 2.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 2.0,
-            "totalRank": 8.5,
-            "wins": 1,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 475.0,
-            "theoreticalWins": 13,
-            "theoreticalLosses": 23,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 5.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 7.5,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 405.0,
-            "theoreticalWins": 11,
-            "theoreticalLosses": 24,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 1.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 7.0,
-            "wins": 0,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 469.0,
-            "theoreticalWins": 14,
-            "theoreticalLosses": 22,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 5,
-        "managers": [
-          {
-            "manager": "Vernon",
-            "recordRank": 10.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 30.0,
-            "wins": 5,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 708.0,
-            "theoreticalWins": 35,
-            "theoreticalLosses": 10,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 7.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 7.5,
-            "totalRank": 23.5,
-            "wins": 3,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 668.0,
-            "theoreticalWins": 26,
-            "theoreticalLosses": 19,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 9.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 6.0,
-            "totalRank": 22.0,
-            "wins": 4,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 632.0,
-            "theoreticalWins": 25,
-            "theoreticalLosses": 20,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 7.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 7.5,
-            "totalRank": 20.5,
-            "wins": 3,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 626.0,
-            "theoreticalWins": 26,
-            "theoreticalLosses": 19,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 2.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 9.0,
-            "totalRank": 19.0,
-            "wins": 1,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 641.0,
-            "theoreticalWins": 28,
-            "theoreticalLosses": 17,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 7.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 5.0,
-            "totalRank": 16.0,
-            "wins": 3,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 598.0,
-            "theoreticalWins": 19,
-            "theoreticalLosses": 25,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 2.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 3.5,
-            "totalRank": 10.5,
-            "wins": 1,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 600.0,
-            "theoreticalWins": 18,
-            "theoreticalLosses": 27,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 2.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.5,
-            "totalRank": 8.5,
-            "wins": 1,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 576.0,
-            "theoreticalWins": 18,
-            "theoreticalLosses": 27,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 4.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 8.5,
-            "wins": 2,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 557.0,
-            "theoreticalWins": 15,
-            "theoreticalLosses": 30,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 4.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 6.5,
-            "wins": 2,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 510.0,
-            "theoreticalWins": 14,
-            "theoreticalLosses": 30,
-            "theoreticalTies": 1
-          }
-        ]
-      },
-      {
-        "week": 6,
-        "managers": [
-          {
-            "manager": "Vernon",
-            "recordRank": 10.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 30.0,
-            "wins": 5,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 794.0,
-            "theoreticalWins": 37,
-            "theoreticalLosses": 17,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 7.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.5,
-            "totalRank": 24.0,
-            "wins": 4,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 773.0,
-            "theoreticalWins": 35,
-            "theoreticalLosses": 19,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 7.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 21.5,
-            "wins": 4,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 758.0,
-            "theoreticalWins": 29,
-            "theoreticalLosses": 25,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 3.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 8.5,
-            "totalRank": 21.0,
-            "wins": 2,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 781.0,
-            "theoreticalWins": 35,
-            "theoreticalLosses": 19,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 7.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 5.0,
-            "totalRank": 18.5,
-            "wins": 4,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 723.0,
-            "theoreticalWins": 25,
-            "theoreticalLosses": 28,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 7.5,
-            "pointsRank": 3.5,
-            "breakdownRank": 6.0,
-            "totalRank": 17.0,
-            "wins": 4,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 699.0,
-            "theoreticalWins": 26,
-            "theoreticalLosses": 28,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 5.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.5,
-            "totalRank": 9.5,
-            "wins": 3,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 653.0,
-            "theoreticalWins": 22,
-            "theoreticalLosses": 31,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 1.5,
-            "pointsRank": 3.5,
-            "breakdownRank": 4.0,
-            "totalRank": 9.0,
-            "wins": 1,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 699.0,
-            "theoreticalWins": 23,
-            "theoreticalLosses": 31,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 1.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 2.5,
-            "totalRank": 9.0,
-            "wins": 1,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 703.0,
-            "theoreticalWins": 22,
-            "theoreticalLosses": 32,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 3.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 5.5,
-            "wins": 2,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 621.0,
-            "theoreticalWins": 15,
-            "theoreticalLosses": 39,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 7,
-        "managers": [
-          {
-            "manager": "Vernon",
-            "recordRank": 10.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 30.0,
-            "wins": 6,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 919.0,
-            "theoreticalWins": 44,
-            "theoreticalLosses": 18,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 8.5,
-            "pointsRank": 8.5,
-            "breakdownRank": 7.0,
-            "totalRank": 24.0,
-            "wins": 5,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 883.0,
-            "theoreticalWins": 36,
-            "theoreticalLosses": 26,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 6.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 8.5,
-            "totalRank": 22.0,
-            "wins": 4,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 875.0,
-            "theoreticalWins": 38,
-            "theoreticalLosses": 24,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 8.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 20.5,
-            "wins": 5,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 871.0,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 28,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 2.5,
-            "pointsRank": 8.5,
-            "breakdownRank": 8.5,
-            "totalRank": 19.5,
-            "wins": 2,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 883.0,
-            "theoreticalWins": 38,
-            "theoreticalLosses": 24,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 6.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 4.0,
-            "totalRank": 13.5,
-            "wins": 4,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 761.0,
-            "theoreticalWins": 26,
-            "theoreticalLosses": 37,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 2.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 12.5,
-            "wins": 2,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 820.0,
-            "theoreticalWins": 29,
-            "theoreticalLosses": 34,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 4.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 3.0,
-            "totalRank": 8.5,
-            "wins": 3,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 732.0,
-            "theoreticalWins": 24,
-            "theoreticalLosses": 38,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 4.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 1.0,
-            "totalRank": 7.5,
-            "wins": 3,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 734.0,
-            "theoreticalWins": 20,
-            "theoreticalLosses": 43,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 1.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 2.0,
-            "totalRank": 7.0,
-            "wins": 1,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 778.0,
-            "theoreticalWins": 23,
-            "theoreticalLosses": 40,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 8,
-        "managers": [
-          {
-            "manager": "Vernon",
-            "recordRank": 9.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.5,
-            "wins": 6,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1031.0,
-            "theoreticalWins": 49,
-            "theoreticalLosses": 22,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 9.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 8.5,
-            "totalRank": 27.0,
-            "wins": 6,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1005.0,
-            "theoreticalWins": 44,
-            "theoreticalLosses": 27,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 7.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 6.5,
-            "totalRank": 20.5,
-            "wins": 5,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 991.0,
-            "theoreticalWins": 41,
-            "theoreticalLosses": 30,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 4.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.5,
-            "totalRank": 20.5,
-            "wins": 3,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 999.0,
-            "theoreticalWins": 44,
-            "theoreticalLosses": 27,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 7.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.5,
-            "totalRank": 19.5,
-            "wins": 5,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 981.0,
-            "theoreticalWins": 41,
-            "theoreticalLosses": 30,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 7.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 13.0,
-            "wins": 5,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 869.0,
-            "theoreticalWins": 30,
-            "theoreticalLosses": 42,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 1.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 11.5,
-            "wins": 2,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 914.0,
-            "theoreticalWins": 32,
-            "theoreticalLosses": 40,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 1.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 9.5,
-            "wins": 2,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 901.0,
-            "theoreticalWins": 31,
-            "theoreticalLosses": 41,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 4.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 1.0,
-            "totalRank": 7.0,
-            "wins": 3,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 804.0,
-            "theoreticalWins": 21,
-            "theoreticalLosses": 51,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 4.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 2.0,
-            "totalRank": 7.0,
-            "wins": 3,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 798.0,
-            "theoreticalWins": 24,
-            "theoreticalLosses": 47,
-            "theoreticalTies": 1
-          }
-        ]
-      },
-      {
-        "week": 9,
-        "managers": [
-          {
-            "manager": "Ty",
-            "recordRank": 10.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 30.0,
-            "wins": 7,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1143.0,
-            "theoreticalWins": 51,
-            "theoreticalLosses": 29,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 8.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.5,
-            "totalRank": 24.5,
-            "wins": 6,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1133.0,
-            "theoreticalWins": 50,
-            "theoreticalLosses": 30,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 8.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 7.0,
-            "totalRank": 24.0,
-            "wins": 6,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1135.0,
-            "theoreticalWins": 49,
-            "theoreticalLosses": 31,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 3.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 8.5,
-            "totalRank": 18.5,
-            "wins": 3,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1130.0,
-            "theoreticalWins": 50,
-            "theoreticalLosses": 30,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 6.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 18.0,
-            "wins": 5,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1089.0,
-            "theoreticalWins": 43,
-            "theoreticalLosses": 37,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 8.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 4.0,
-            "totalRank": 15.0,
-            "wins": 6,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 995.0,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 47,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 1.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 11.5,
-            "wins": 2,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1026.0,
-            "theoreticalWins": 35,
-            "theoreticalLosses": 46,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 4.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.5,
-            "totalRank": 9.0,
-            "wins": 4,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 938.0,
-            "theoreticalWins": 32,
-            "theoreticalLosses": 48,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 1.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 2.5,
-            "totalRank": 8.0,
-            "wins": 2,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1007.0,
-            "theoreticalWins": 32,
-            "theoreticalLosses": 49,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 4.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 6.5,
-            "wins": 4,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 932.0,
-            "theoreticalWins": 26,
-            "theoreticalLosses": 55,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 10,
-        "managers": [
-          {
-            "manager": "Vernon",
-            "recordRank": 9.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 9.0,
-            "totalRank": 25.5,
-            "wins": 7,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1254.0,
-            "theoreticalWins": 55,
-            "theoreticalLosses": 34,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 9.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 25.5,
-            "wins": 7,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1255.0,
-            "theoreticalWins": 53,
-            "theoreticalLosses": 35,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 2.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 22.5,
-            "wins": 3,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1262.0,
-            "theoreticalWins": 58,
-            "theoreticalLosses": 31,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 7.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 6.5,
-            "totalRank": 22.5,
-            "wins": 6,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1257.0,
-            "theoreticalWins": 52,
-            "theoreticalLosses": 37,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 7.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.5,
-            "totalRank": 19.5,
-            "wins": 6,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1245.0,
-            "theoreticalWins": 52,
-            "theoreticalLosses": 36,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 7.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 13.0,
-            "wins": 6,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1091.0,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 56,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 2.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 4.5,
-            "totalRank": 12.0,
-            "wins": 3,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1139.0,
-            "theoreticalWins": 39,
-            "theoreticalLosses": 51,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 4.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 4.5,
-            "totalRank": 11.0,
-            "wins": 5,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1060.0,
-            "theoreticalWins": 39,
-            "theoreticalLosses": 50,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 1.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 2.0,
-            "totalRank": 7.0,
-            "wins": 2,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1109.0,
-            "theoreticalWins": 33,
-            "theoreticalLosses": 57,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 4.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 6.5,
-            "wins": 5,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1047.0,
-            "theoreticalWins": 31,
-            "theoreticalLosses": 59,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 11,
-        "managers": [
-          {
-            "manager": "Lanny",
-            "recordRank": 8.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.0,
-            "wins": 7,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1388.0,
-            "theoreticalWins": 61,
-            "theoreticalLosses": 36,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 8.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 8.5,
-            "totalRank": 25.5,
-            "wins": 7,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1381.0,
-            "theoreticalWins": 60,
-            "theoreticalLosses": 38,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 8.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.5,
-            "totalRank": 24.5,
-            "wins": 7,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1357.0,
-            "theoreticalWins": 60,
-            "theoreticalLosses": 38,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 8.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 20.0,
-            "wins": 7,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1347.0,
-            "theoreticalWins": 54,
-            "theoreticalLosses": 42,
-            "theoreticalTies": 3
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 3.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 17.0,
-            "wins": 4,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1354.0,
-            "theoreticalWins": 59,
-            "theoreticalLosses": 38,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 8.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 3.0,
-            "totalRank": 15.0,
-            "wins": 7,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1213.0,
-            "theoreticalWins": 41,
-            "theoreticalLosses": 58,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 1.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 11.5,
-            "wins": 3,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1258.0,
-            "theoreticalWins": 45,
-            "theoreticalLosses": 54,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 4.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 4.0,
-            "totalRank": 10.5,
-            "wins": 5,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1157.0,
-            "theoreticalWins": 43,
-            "theoreticalLosses": 55,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 1.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 2.0,
-            "totalRank": 6.5,
-            "wins": 3,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1204.0,
-            "theoreticalWins": 36,
-            "theoreticalLosses": 63,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 4.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 6.5,
-            "wins": 5,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1133.0,
-            "theoreticalWins": 31,
-            "theoreticalLosses": 68,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 12,
-        "managers": [
-          {
-            "manager": "Ted",
-            "recordRank": 9.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.0,
-            "wins": 8,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1546.0,
-            "theoreticalWins": 69,
-            "theoreticalLosses": 38,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 9.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 27.0,
-            "wins": 8,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1515.0,
-            "theoreticalWins": 68,
-            "theoreticalLosses": 38,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 9.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 23.0,
-            "wins": 8,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1461.0,
-            "theoreticalWins": 61,
-            "theoreticalLosses": 46,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 2.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 18.5,
-            "wins": 4,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1478.0,
-            "theoreticalWins": 65,
-            "theoreticalLosses": 41,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 6.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 18.5,
-            "wins": 7,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1450.0,
-            "theoreticalWins": 54,
-            "theoreticalLosses": 51,
-            "theoreticalTies": 3
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 6.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 3.0,
-            "totalRank": 13.5,
-            "wins": 7,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1322.0,
-            "theoreticalWins": 44,
-            "theoreticalLosses": 64,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 2.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 12.5,
-            "wins": 4,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1393.0,
-            "theoreticalWins": 53,
-            "theoreticalLosses": 55,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 4.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 4.0,
-            "totalRank": 10.0,
-            "wins": 5,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1268.0,
-            "theoreticalWins": 47,
-            "theoreticalLosses": 60,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 5.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 7.0,
-            "wins": 6,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1247.0,
-            "theoreticalWins": 36,
-            "theoreticalLosses": 72,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 1.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 2.0,
-            "totalRank": 6.0,
-            "wins": 3,
-            "losses": 9,
-            "ties": 0,
-            "totalPoints": 1309.0,
-            "theoreticalWins": 38,
-            "theoreticalLosses": 70,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 13,
-        "managers": [
-          {
-            "manager": "Lanny",
-            "recordRank": 10.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.0,
-            "wins": 9,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1656.0,
-            "theoreticalWins": 76,
-            "theoreticalLosses": 39,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 8.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 24.5,
-            "wins": 8,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1650.0,
-            "theoreticalWins": 71,
-            "theoreticalLosses": 44,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 8.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 22.5,
-            "wins": 8,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1553.0,
-            "theoreticalWins": 61,
-            "theoreticalLosses": 55,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 2.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 9.0,
-            "totalRank": 21.5,
-            "wins": 5,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1657.0,
-            "theoreticalWins": 74,
-            "theoreticalLosses": 41,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 6.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 5.0,
-            "totalRank": 17.0,
-            "wins": 7,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1550.0,
-            "theoreticalWins": 55,
-            "theoreticalLosses": 59,
-            "theoreticalTies": 3
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 2.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 6.0,
-            "totalRank": 13.5,
-            "wins": 5,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1516.0,
-            "theoreticalWins": 60,
-            "theoreticalLosses": 57,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 6.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 3.0,
-            "totalRank": 13.0,
-            "wins": 7,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1426.0,
-            "theoreticalWins": 46,
-            "theoreticalLosses": 70,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "John",
-            "recordRank": 4.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 4.0,
-            "totalRank": 10.0,
-            "wins": 6,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1381.0,
-            "theoreticalWins": 52,
-            "theoreticalLosses": 63,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 6.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 8.0,
-            "wins": 7,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1352.0,
-            "theoreticalWins": 40,
-            "theoreticalLosses": 77,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 1.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 2.0,
-            "totalRank": 6.0,
-            "wins": 3,
-            "losses": 10,
-            "ties": 0,
-            "totalPoints": 1422.0,
-            "theoreticalWins": 43,
-            "theoreticalLosses": 73,
-            "theoreticalTies": 1
-          }
-        ]
-      }
-    ],
-    "finalWeek": 13,
-    "finalRankings": [
-      {
-        "manager": "Lanny",
-        "recordRank": 10.0,
-        "pointsRank": 9.0,
-        "breakdownRank": 10.0,
-        "totalRank": 29.0,
-        "wins": 9,
-        "losses": 4,
-        "ties": 0,
-        "totalPoints": 1656.0,
-        "theoreticalWins": 76,
-        "theoreticalLosses": 39,
-        "theoreticalTies": 2
-      },
-      {
-        "manager": "Ted",
-        "recordRank": 8.5,
-        "pointsRank": 8.0,
-        "breakdownRank": 8.0,
-        "totalRank": 24.5,
-        "wins": 8,
-        "losses": 5,
-        "ties": 0,
-        "totalPoints": 1650.0,
-        "theoreticalWins": 71,
-        "theoreticalLosses": 44,
-        "theoreticalTies": 2
-      },
-      {
-        "manager": "Vernon",
-        "recordRank": 8.5,
-        "pointsRank": 7.0,
-        "breakdownRank": 7.0,
-        "totalRank": 22.5,
-        "wins": 8,
-        "losses": 5,
-        "ties": 0,
-        "totalPoints": 1553.0,
-        "theoreticalWins": 61,
-        "theoreticalLosses": 55,
-        "theoreticalTies": 1
-      },
-      {
-        "manager": "Joey",
-        "recordRank": 2.5,
-        "pointsRank": 10.0,
-        "breakdownRank": 9.0,
-        "totalRank": 21.5,
-        "wins": 5,
-        "losses": 8,
-        "ties": 0,
-        "totalPoints": 1657.0,
-        "theoreticalWins": 74,
-        "theoreticalLosses": 41,
-        "theoreticalTies": 2
-      },
-      {
-        "manager": "Ty",
-        "recordRank": 6.0,
-        "pointsRank": 6.0,
-        "breakdownRank": 5.0,
-        "totalRank": 17.0,
-        "wins": 7,
-        "losses": 6,
-        "ties": 0,
-        "totalPoints": 1550.0,
-        "theoreticalWins": 55,
-        "theoreticalLosses": 59,
-        "theoreticalTies": 3
-      },
-      {
-        "manager": "Peter",
-        "recordRank": 2.5,
-        "pointsRank": 5.0,
-        "breakdownRank": 6.0,
-        "totalRank": 13.5,
-        "wins": 5,
-        "losses": 8,
-        "ties": 0,
-        "totalPoints": 1516.0,
-        "theoreticalWins": 60,
-        "theoreticalLosses": 57,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Matt",
-        "recordRank": 6.0,
-        "pointsRank": 4.0,
-        "breakdownRank": 3.0,
-        "totalRank": 13.0,
-        "wins": 7,
-        "losses": 6,
-        "ties": 0,
-        "totalPoints": 1426.0,
-        "theoreticalWins": 46,
-        "theoreticalLosses": 70,
-        "theoreticalTies": 1
-      },
-      {
-        "manager": "John",
-        "recordRank": 4.0,
-        "pointsRank": 2.0,
-        "breakdownRank": 4.0,
-        "totalRank": 10.0,
-        "wins": 6,
-        "losses": 7,
-        "ties": 0,
-        "totalPoints": 1381.0,
-        "theoreticalWins": 52,
-        "theoreticalLosses": 63,
-        "theoreticalTies": 2
-      },
-      {
-        "manager": "Ben",
-        "recordRank": 6.0,
-        "pointsRank": 1.0,
-        "breakdownRank": 1.0,
-        "totalRank": 8.0,
-        "wins": 7,
-        "losses": 6,
-        "ties": 0,
-        "totalPoints": 1352.0,
-        "theoreticalWins": 40,
-        "theoreticalLosses": 77,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Tyler",
-        "recordRank": 1.0,
-        "pointsRank": 3.0,
-        "breakdownRank": 2.0,
-        "totalRank": 6.0,
-        "wins": 3,
-        "losses": 10,
-        "ties": 0,
-        "totalPoints": 1422.0,
-        "theoreticalWins": 43,
-        "theoreticalLosses": 73,
-        "theoreticalTies": 1
-      }
-    ]
-  },
-  "2013": {
-    "weeks": [
-      {
-        "week": 1,
-        "managers": [
-          {
-            "manager": "Ted",
-            "recordRank": 8.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 167.0,
-            "theoreticalWins": 9,
-            "theoreticalLosses": 0,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 8.0,
-            "pointsRank": 8.5,
-            "breakdownRank": 8.5,
-            "totalRank": 25.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 150.0,
-            "theoreticalWins": 7,
-            "theoreticalLosses": 1,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 8.0,
-            "pointsRank": 8.5,
-            "breakdownRank": 8.5,
-            "totalRank": 25.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 150.0,
-            "theoreticalWins": 7,
-            "theoreticalLosses": 1,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 8.0,
-            "pointsRank": 6.5,
-            "breakdownRank": 6.5,
-            "totalRank": 21.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 136.0,
-            "theoreticalWins": 5,
-            "theoreticalLosses": 3,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 8.0,
-            "pointsRank": 6.5,
-            "breakdownRank": 6.5,
-            "totalRank": 21.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 136.0,
-            "theoreticalWins": 5,
-            "theoreticalLosses": 3,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "John",
-            "recordRank": 3.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 13.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 135.0,
-            "theoreticalWins": 4,
-            "theoreticalLosses": 5,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 3.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 11.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 131.0,
-            "theoreticalWins": 3,
-            "theoreticalLosses": 6,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 3.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 9.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 117.0,
-            "theoreticalWins": 2,
-            "theoreticalLosses": 7,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 3.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 7.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 115.0,
-            "theoreticalWins": 1,
-            "theoreticalLosses": 8,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 3.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 5.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 96.0,
-            "theoreticalWins": 0,
-            "theoreticalLosses": 9,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 2,
-        "managers": [
-          {
-            "manager": "Ted",
-            "recordRank": 5.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 8.5,
-            "totalRank": 24.0,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 282.0,
-            "theoreticalWins": 11,
-            "theoreticalLosses": 7,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 5.5,
-            "pointsRank": 8.5,
-            "breakdownRank": 10.0,
-            "totalRank": 24.0,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 278.0,
-            "theoreticalWins": 12,
-            "theoreticalLosses": 5,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 5.5,
-            "pointsRank": 8.5,
-            "breakdownRank": 8.5,
-            "totalRank": 22.5,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 278.0,
-            "theoreticalWins": 11,
-            "theoreticalLosses": 7,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 9.5,
-            "pointsRank": 4.5,
-            "breakdownRank": 5.0,
-            "totalRank": 19.0,
-            "wins": 2,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 264.0,
-            "theoreticalWins": 9,
-            "theoreticalLosses": 8,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 5.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 7.0,
-            "totalRank": 18.5,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 271.0,
-            "theoreticalWins": 10,
-            "theoreticalLosses": 7,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 9.5,
-            "pointsRank": 4.5,
-            "breakdownRank": 3.0,
-            "totalRank": 17.0,
-            "wins": 2,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 264.0,
-            "theoreticalWins": 8,
-            "theoreticalLosses": 9,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "John",
-            "recordRank": 1.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 5.0,
-            "totalRank": 13.5,
-            "wins": 0,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 273.0,
-            "theoreticalWins": 9,
-            "theoreticalLosses": 9,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 5.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 5.0,
-            "totalRank": 12.5,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 247.0,
-            "theoreticalWins": 9,
-            "theoreticalLosses": 9,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 5.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 2.0,
-            "totalRank": 10.5,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 254.0,
-            "theoreticalWins": 7,
-            "theoreticalLosses": 11,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 1.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.5,
-            "wins": 0,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 214.0,
-            "theoreticalWins": 2,
-            "theoreticalLosses": 16,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 3,
-        "managers": [
-          {
-            "manager": "Tyler",
-            "recordRank": 7.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 8.0,
-            "totalRank": 25.5,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 394.0,
-            "theoreticalWins": 16,
-            "theoreticalLosses": 10,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 10.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 6.0,
-            "totalRank": 25.0,
-            "wins": 3,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 390.0,
-            "theoreticalWins": 15,
-            "theoreticalLosses": 11,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 7.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 23.5,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 389.0,
-            "theoreticalWins": 16,
-            "theoreticalLosses": 11,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 3.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 10.0,
-            "totalRank": 19.5,
-            "wins": 1,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 375.0,
-            "theoreticalWins": 17,
-            "theoreticalLosses": 10,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 3.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 8.0,
-            "totalRank": 18.5,
-            "wins": 1,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 379.0,
-            "theoreticalWins": 16,
-            "theoreticalLosses": 10,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 7.5,
-            "pointsRank": 4.5,
-            "breakdownRank": 4.5,
-            "totalRank": 16.5,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 372.0,
-            "theoreticalWins": 12,
-            "theoreticalLosses": 15,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 7.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 4.5,
-            "totalRank": 15.0,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 364.0,
-            "theoreticalWins": 12,
-            "theoreticalLosses": 14,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 3.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.5,
-            "totalRank": 8.0,
-            "wins": 1,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 346.0,
-            "theoreticalWins": 11,
-            "theoreticalLosses": 16,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 1.0,
-            "pointsRank": 4.5,
-            "breakdownRank": 2.5,
-            "totalRank": 8.0,
-            "wins": 0,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 372.0,
-            "theoreticalWins": 11,
-            "theoreticalLosses": 16,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 3.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 5.5,
-            "wins": 1,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 321.0,
-            "theoreticalWins": 7,
-            "theoreticalLosses": 20,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 4,
-        "managers": [
-          {
-            "manager": "Tyler",
-            "recordRank": 8.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.5,
-            "wins": 3,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 566.0,
-            "theoreticalWins": 25,
-            "theoreticalLosses": 10,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 10.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 8.5,
-            "totalRank": 27.5,
-            "wins": 4,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 547.0,
-            "theoreticalWins": 23,
-            "theoreticalLosses": 12,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 8.5,
-            "pointsRank": 7.5,
-            "breakdownRank": 7.0,
-            "totalRank": 23.0,
-            "wins": 3,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 527.0,
-            "theoreticalWins": 22,
-            "theoreticalLosses": 14,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 2.5,
-            "pointsRank": 7.5,
-            "breakdownRank": 8.5,
-            "totalRank": 18.5,
-            "wins": 1,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 527.0,
-            "theoreticalWins": 23,
-            "theoreticalLosses": 12,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 5.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 6.0,
-            "totalRank": 16.5,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 490.0,
-            "theoreticalWins": 20,
-            "theoreticalLosses": 16,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 5.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 5.0,
-            "totalRank": 16.5,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 509.0,
-            "theoreticalWins": 17,
-            "theoreticalLosses": 19,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 5.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 11.5,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 449.0,
-            "theoreticalWins": 12,
-            "theoreticalLosses": 22,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 5.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 1.5,
-            "totalRank": 9.0,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 439.0,
-            "theoreticalWins": 11,
-            "theoreticalLosses": 25,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 1.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 9.0,
-            "wins": 0,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 463.0,
-            "theoreticalWins": 13,
-            "theoreticalLosses": 23,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 2.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.5,
-            "totalRank": 5.0,
-            "wins": 1,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 431.0,
-            "theoreticalWins": 11,
-            "theoreticalLosses": 24,
-            "theoreticalTies": 1
-          }
-        ]
-      },
-      {
-        "week": 5,
-        "managers": [
-          {
-            "manager": "Tyler",
-            "recordRank": 9.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.5,
-            "wins": 4,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 733.0,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 10,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 9.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 8.0,
-            "totalRank": 26.5,
-            "wins": 4,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 676.0,
-            "theoreticalWins": 28,
-            "theoreticalLosses": 16,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 7.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 21.0,
-            "wins": 3,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 633.0,
-            "theoreticalWins": 27,
-            "theoreticalLosses": 18,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 3.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 9.0,
-            "totalRank": 20.5,
-            "wins": 2,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 664.0,
-            "theoreticalWins": 29,
-            "theoreticalLosses": 15,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 7.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 6.0,
-            "totalRank": 18.0,
-            "wins": 3,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 608.0,
-            "theoreticalWins": 22,
-            "theoreticalLosses": 23,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 3.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 4.5,
-            "totalRank": 14.0,
-            "wins": 2,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 613.0,
-            "theoreticalWins": 19,
-            "theoreticalLosses": 26,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 3.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.5,
-            "totalRank": 12.0,
-            "wins": 2,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 577.0,
-            "theoreticalWins": 19,
-            "theoreticalLosses": 25,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 7.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.5,
-            "totalRank": 11.5,
-            "wins": 3,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 565.0,
-            "theoreticalWins": 15,
-            "theoreticalLosses": 30,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 3.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 2.5,
-            "totalRank": 9.0,
-            "wins": 2,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 567.0,
-            "theoreticalWins": 15,
-            "theoreticalLosses": 28,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "John",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 0,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 559.0,
-            "theoreticalWins": 14,
-            "theoreticalLosses": 31,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 6,
-        "managers": [
-          {
-            "manager": "Tyler",
-            "recordRank": 9.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.5,
-            "wins": 5,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 854.0,
-            "theoreticalWins": 41,
-            "theoreticalLosses": 12,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 9.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 27.5,
-            "wins": 5,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 778.0,
-            "theoreticalWins": 32,
-            "theoreticalLosses": 21,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 6.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 22.0,
-            "wins": 3,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 759.0,
-            "theoreticalWins": 31,
-            "theoreticalLosses": 22,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 6.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 7.0,
-            "totalRank": 19.0,
-            "wins": 3,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 727.0,
-            "theoreticalWins": 28,
-            "theoreticalLosses": 26,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 8.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.5,
-            "totalRank": 18.5,
-            "wins": 4,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 713.0,
-            "theoreticalWins": 27,
-            "theoreticalLosses": 27,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 3.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 5.5,
-            "totalRank": 15.5,
-            "wins": 2,
-            "losses": 3,
-            "ties": 1,
-            "totalPoints": 755.0,
-            "theoreticalWins": 27,
-            "theoreticalLosses": 26,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 6.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 14.0,
-            "wins": 3,
-            "losses": 2,
-            "ties": 1,
-            "totalPoints": 707.0,
-            "theoreticalWins": 23,
-            "theoreticalLosses": 30,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "John",
-            "recordRank": 1.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 7.0,
-            "wins": 0,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 678.0,
-            "theoreticalWins": 20,
-            "theoreticalLosses": 34,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 3.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 1.0,
-            "totalRank": 6.0,
-            "wins": 2,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 663.0,
-            "theoreticalWins": 18,
-            "theoreticalLosses": 34,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 3.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 2.0,
-            "totalRank": 6.0,
-            "wins": 2,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 661.0,
-            "theoreticalWins": 19,
-            "theoreticalLosses": 34,
-            "theoreticalTies": 1
-          }
-        ]
-      },
-      {
-        "week": 7,
-        "managers": [
-          {
-            "manager": "Tyler",
-            "recordRank": 8.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.5,
-            "wins": 5,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 949.0,
-            "theoreticalWins": 43,
-            "theoreticalLosses": 18,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 10.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 26.0,
-            "wins": 6,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 893.0,
-            "theoreticalWins": 39,
-            "theoreticalLosses": 23,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 6.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 24.5,
-            "wins": 4,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 901.0,
-            "theoreticalWins": 40,
-            "theoreticalLosses": 22,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 6.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 18.5,
-            "wins": 4,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 839.0,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 29,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 8.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 18.5,
-            "wins": 5,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 821.0,
-            "theoreticalWins": 32,
-            "theoreticalLosses": 31,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 4.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 18.5,
-            "wins": 3,
-            "losses": 3,
-            "ties": 1,
-            "totalPoints": 881.0,
-            "theoreticalWins": 35,
-            "theoreticalLosses": 27,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 4.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 3.5,
-            "totalRank": 12.0,
-            "wins": 3,
-            "losses": 3,
-            "ties": 1,
-            "totalPoints": 792.0,
-            "theoreticalWins": 23,
-            "theoreticalLosses": 39,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 2.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 3.5,
-            "totalRank": 8.0,
-            "wins": 2,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 762.0,
-            "theoreticalWins": 23,
-            "theoreticalLosses": 39,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "John",
-            "recordRank": 1.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 2.0,
-            "totalRank": 6.0,
-            "wins": 0,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 772.0,
-            "theoreticalWins": 21,
-            "theoreticalLosses": 42,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 2.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 4.5,
-            "wins": 2,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 758.0,
-            "theoreticalWins": 20,
-            "theoreticalLosses": 40,
-            "theoreticalTies": 3
-          }
-        ]
-      },
-      {
-        "week": 8,
-        "managers": [
-          {
-            "manager": "Tyler",
-            "recordRank": 8.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 9.5,
-            "totalRank": 28.0,
-            "wins": 6,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1058.0,
-            "theoreticalWins": 47,
-            "theoreticalLosses": 23,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 10.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 26.0,
-            "wins": 7,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 1028.0,
-            "theoreticalWins": 44,
-            "theoreticalLosses": 27,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 6.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.5,
-            "totalRank": 25.0,
-            "wins": 4,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1038.0,
-            "theoreticalWins": 47,
-            "theoreticalLosses": 24,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 8.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 7.0,
-            "totalRank": 21.5,
-            "wins": 6,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 959.0,
-            "theoreticalWins": 40,
-            "theoreticalLosses": 32,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 6.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.5,
-            "totalRank": 17.0,
-            "wins": 4,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 941.0,
-            "theoreticalWins": 37,
-            "theoreticalLosses": 35,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 4.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 5.5,
-            "totalRank": 16.5,
-            "wins": 3,
-            "losses": 4,
-            "ties": 1,
-            "totalPoints": 973.0,
-            "theoreticalWins": 37,
-            "theoreticalLosses": 34,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 4.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 3.0,
-            "totalRank": 11.0,
-            "wins": 3,
-            "losses": 4,
-            "ties": 1,
-            "totalPoints": 928.0,
-            "theoreticalWins": 29,
-            "theoreticalLosses": 42,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 4.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 8.0,
-            "wins": 3,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 836.0,
-            "theoreticalWins": 24,
-            "theoreticalLosses": 47,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "John",
-            "recordRank": 1.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 4.0,
-            "totalRank": 8.0,
-            "wins": 1,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 924.0,
-            "theoreticalWins": 30,
-            "theoreticalLosses": 42,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 2.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 4.0,
-            "wins": 2,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 819.0,
-            "theoreticalWins": 20,
-            "theoreticalLosses": 49,
-            "theoreticalTies": 3
-          }
-        ]
-      },
-      {
-        "week": 9,
-        "managers": [
-          {
-            "manager": "Ben",
-            "recordRank": 10.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 8.5,
-            "totalRank": 28.5,
-            "wins": 8,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 1201.0,
-            "theoreticalWins": 53,
-            "theoreticalLosses": 27,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 8.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 10.0,
-            "totalRank": 27.0,
-            "wins": 6,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1196.0,
-            "theoreticalWins": 54,
-            "theoreticalLosses": 25,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 6.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.5,
-            "totalRank": 22.5,
-            "wins": 4,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1172.0,
-            "theoreticalWins": 53,
-            "theoreticalLosses": 27,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 9.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 7.0,
-            "totalRank": 22.0,
-            "wins": 7,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1084.0,
-            "theoreticalWins": 45,
-            "theoreticalLosses": 36,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 3.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 6.0,
-            "totalRank": 16.0,
-            "wins": 3,
-            "losses": 5,
-            "ties": 1,
-            "totalPoints": 1091.0,
-            "theoreticalWins": 40,
-            "theoreticalLosses": 40,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 6.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.5,
-            "totalRank": 14.5,
-            "wins": 4,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1043.0,
-            "theoreticalWins": 38,
-            "theoreticalLosses": 43,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 1.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 4.5,
-            "totalRank": 10.5,
-            "wins": 2,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1076.0,
-            "theoreticalWins": 38,
-            "theoreticalLosses": 43,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 6.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 10.0,
-            "wins": 4,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 958.0,
-            "theoreticalWins": 28,
-            "theoreticalLosses": 52,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 3.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 9.0,
-            "wins": 3,
-            "losses": 5,
-            "ties": 1,
-            "totalPoints": 1006.0,
-            "theoreticalWins": 29,
-            "theoreticalLosses": 51,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 3.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 5.0,
-            "wins": 3,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 925.0,
-            "theoreticalWins": 22,
-            "theoreticalLosses": 56,
-            "theoreticalTies": 3
-          }
-        ]
-      },
-      {
-        "week": 10,
-        "managers": [
-          {
-            "manager": "Tyler",
-            "recordRank": 8.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 9.5,
-            "totalRank": 27.5,
-            "wins": 6,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1308.0,
-            "theoreticalWins": 60,
-            "theoreticalLosses": 28,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 9.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 8.0,
-            "totalRank": 26.5,
-            "wins": 8,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1299.0,
-            "theoreticalWins": 55,
-            "theoreticalLosses": 34,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 6.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 9.5,
-            "totalRank": 24.0,
-            "wins": 5,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1286.0,
-            "theoreticalWins": 60,
-            "theoreticalLosses": 29,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 9.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 23.5,
-            "wins": 8,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1203.0,
-            "theoreticalWins": 54,
-            "theoreticalLosses": 36,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 2.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 14.0,
-            "wins": 3,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1191.0,
-            "theoreticalWins": 46,
-            "theoreticalLosses": 44,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 4.5,
-            "pointsRank": 3.5,
-            "breakdownRank": 4.0,
-            "totalRank": 12.0,
-            "wins": 4,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1115.0,
-            "theoreticalWins": 39,
-            "theoreticalLosses": 51,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 2.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 12.0,
-            "wins": 3,
-            "losses": 6,
-            "ties": 1,
-            "totalPoints": 1155.0,
-            "theoreticalWins": 40,
-            "theoreticalLosses": 49,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 4.5,
-            "pointsRank": 3.5,
-            "breakdownRank": 3.0,
-            "totalRank": 11.0,
-            "wins": 4,
-            "losses": 5,
-            "ties": 1,
-            "totalPoints": 1115.0,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 55,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 6.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 10.5,
-            "wins": 5,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1057.0,
-            "theoreticalWins": 31,
-            "theoreticalLosses": 58,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 2.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 4.0,
-            "wins": 3,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1027.0,
-            "theoreticalWins": 26,
-            "theoreticalLosses": 61,
-            "theoreticalTies": 3
-          }
-        ]
-      },
-      {
-        "week": 11,
-        "managers": [
-          {
-            "manager": "Tyler",
-            "recordRank": 8.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.0,
-            "wins": 6,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1416.0,
-            "theoreticalWins": 63,
-            "theoreticalLosses": 34,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 10.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 7.0,
-            "totalRank": 26.0,
-            "wins": 9,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1414.0,
-            "theoreticalWins": 59,
-            "theoreticalLosses": 38,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 9.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 8.0,
-            "totalRank": 24.0,
-            "wins": 8,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1329.0,
-            "theoreticalWins": 60,
-            "theoreticalLosses": 39,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 6.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 9.0,
-            "totalRank": 23.0,
-            "wins": 5,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1375.0,
-            "theoreticalWins": 62,
-            "theoreticalLosses": 36,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "John",
-            "recordRank": 2.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 14.5,
-            "wins": 4,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1306.0,
-            "theoreticalWins": 50,
-            "theoreticalLosses": 48,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 6.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 14.0,
-            "wins": 5,
-            "losses": 5,
-            "ties": 1,
-            "totalPoints": 1247.0,
-            "theoreticalWins": 41,
-            "theoreticalLosses": 57,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 2.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 12.5,
-            "wins": 4,
-            "losses": 6,
-            "ties": 1,
-            "totalPoints": 1298.0,
-            "theoreticalWins": 49,
-            "theoreticalLosses": 49,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 2.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 8.5,
-            "wins": 4,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1202.0,
-            "theoreticalWins": 40,
-            "theoreticalLosses": 59,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 6.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 8.0,
-            "wins": 5,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1142.0,
-            "theoreticalWins": 31,
-            "theoreticalLosses": 67,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 2.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 6.5,
-            "wins": 4,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1164.0,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 62,
-            "theoreticalTies": 3
-          }
-        ]
-      },
-      {
-        "week": 12,
-        "managers": [
-          {
-            "manager": "Tyler",
-            "recordRank": 8.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.0,
-            "wins": 7,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1564.0,
-            "theoreticalWins": 71,
-            "theoreticalLosses": 34,
-            "theoreticalTies": 3
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 7.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 25.0,
-            "wins": 6,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1523.0,
-            "theoreticalWins": 70,
-            "theoreticalLosses": 36,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 9.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 8.0,
-            "totalRank": 24.5,
-            "wins": 9,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1427.0,
-            "theoreticalWins": 63,
-            "theoreticalLosses": 44,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 9.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 7.0,
-            "totalRank": 24.5,
-            "wins": 9,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1507.0,
-            "theoreticalWins": 61,
-            "theoreticalLosses": 45,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "John",
-            "recordRank": 4.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 16.5,
-            "wins": 5,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1424.0,
-            "theoreticalWins": 57,
-            "theoreticalLosses": 50,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 4.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 12.5,
-            "wins": 5,
-            "losses": 6,
-            "ties": 1,
-            "totalPoints": 1362.0,
-            "theoreticalWins": 47,
-            "theoreticalLosses": 60,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 1.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 11.5,
-            "wins": 4,
-            "losses": 7,
-            "ties": 1,
-            "totalPoints": 1384.0,
-            "theoreticalWins": 50,
-            "theoreticalLosses": 57,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 4.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 10.5,
-            "wins": 5,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1300.0,
-            "theoreticalWins": 43,
-            "theoreticalLosses": 64,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 4.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 8.5,
-            "wins": 5,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1245.0,
-            "theoreticalWins": 36,
-            "theoreticalLosses": 71,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 1.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.5,
-            "wins": 4,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1224.0,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 71,
-            "theoreticalTies": 3
-          }
-        ]
-      },
-      {
-        "week": 13,
-        "managers": [
-          {
-            "manager": "Tyler",
-            "recordRank": 7.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 27.5,
-            "wins": 7,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1699.0,
-            "theoreticalWins": 77,
-            "theoreticalLosses": 37,
-            "theoreticalTies": 3
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 10.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 8.0,
-            "totalRank": 27.0,
-            "wins": 10,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1649.0,
-            "theoreticalWins": 69,
-            "theoreticalLosses": 46,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 7.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 9.0,
-            "totalRank": 24.5,
-            "wins": 7,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1646.0,
-            "theoreticalWins": 73,
-            "theoreticalLosses": 42,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 9.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 23.0,
-            "wins": 9,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1555.0,
-            "theoreticalWins": 68,
-            "theoreticalLosses": 48,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "John",
-            "recordRank": 3.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 15.0,
-            "wins": 5,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1536.0,
-            "theoreticalWins": 59,
-            "theoreticalLosses": 57,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 5.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.5,
-            "totalRank": 14.0,
-            "wins": 6,
-            "losses": 6,
-            "ties": 1,
-            "totalPoints": 1500.0,
-            "theoreticalWins": 54,
-            "theoreticalLosses": 62,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 3.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 4.5,
-            "totalRank": 12.5,
-            "wins": 5,
-            "losses": 7,
-            "ties": 1,
-            "totalPoints": 1509.0,
-            "theoreticalWins": 54,
-            "theoreticalLosses": 62,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 5.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 11.5,
-            "wins": 6,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1412.0,
-            "theoreticalWins": 45,
-            "theoreticalLosses": 71,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 3.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 7.0,
-            "wins": 5,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1411.0,
-            "theoreticalWins": 44,
-            "theoreticalLosses": 72,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 4,
-            "losses": 9,
-            "ties": 0,
-            "totalPoints": 1311.0,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 80,
-            "theoreticalTies": 3
-          }
-        ]
-      }
-    ],
-    "finalWeek": 13,
-    "finalRankings": [
-      {
-        "manager": "Tyler",
-        "recordRank": 7.5,
-        "pointsRank": 10.0,
-        "breakdownRank": 10.0,
-        "totalRank": 27.5,
-        "wins": 7,
-        "losses": 6,
-        "ties": 0,
-        "totalPoints": 1699.0,
-        "theoreticalWins": 77,
-        "theoreticalLosses": 37,
-        "theoreticalTies": 3
-      },
-      {
-        "manager": "Ben",
-        "recordRank": 10.0,
-        "pointsRank": 9.0,
-        "breakdownRank": 8.0,
-        "totalRank": 27.0,
-        "wins": 10,
-        "losses": 3,
-        "ties": 0,
-        "totalPoints": 1649.0,
-        "theoreticalWins": 69,
-        "theoreticalLosses": 46,
-        "theoreticalTies": 2
-      },
-      {
-        "manager": "Joey",
-        "recordRank": 7.5,
-        "pointsRank": 8.0,
-        "breakdownRank": 9.0,
-        "totalRank": 24.5,
-        "wins": 7,
-        "losses": 6,
-        "ties": 0,
-        "totalPoints": 1646.0,
-        "theoreticalWins": 73,
-        "theoreticalLosses": 42,
-        "theoreticalTies": 2
-      },
-      {
-        "manager": "Vernon",
-        "recordRank": 9.0,
-        "pointsRank": 7.0,
-        "breakdownRank": 7.0,
-        "totalRank": 23.0,
-        "wins": 9,
-        "losses": 4,
-        "ties": 0,
-        "totalPoints": 1555.0,
-        "theoreticalWins": 68,
-        "theoreticalLosses": 48,
-        "theoreticalTies": 1
-      },
-      {
-        "manager": "John",
-        "recordRank": 3.0,
-        "pointsRank": 6.0,
-        "breakdownRank": 6.0,
-        "totalRank": 15.0,
-        "wins": 5,
-        "losses": 8,
-        "ties": 0,
-        "totalPoints": 1536.0,
-        "theoreticalWins": 59,
-        "theoreticalLosses": 57,
-        "theoreticalTies": 1
-      },
-      {
-        "manager": "Peter",
-        "recordRank": 5.5,
-        "pointsRank": 4.0,
-        "breakdownRank": 4.5,
-        "totalRank": 14.0,
-        "wins": 6,
-        "losses": 6,
-        "ties": 1,
-        "totalPoints": 1500.0,
-        "theoreticalWins": 54,
-        "theoreticalLosses": 62,
-        "theoreticalTies": 1
-      },
-      {
-        "manager": "Ted",
-        "recordRank": 3.0,
-        "pointsRank": 5.0,
-        "breakdownRank": 4.5,
-        "totalRank": 12.5,
-        "wins": 5,
-        "losses": 7,
-        "ties": 1,
-        "totalPoints": 1509.0,
-        "theoreticalWins": 54,
-        "theoreticalLosses": 62,
-        "theoreticalTies": 1
-      },
-      {
-        "manager": "Lanny",
-        "recordRank": 5.5,
-        "pointsRank": 3.0,
-        "breakdownRank": 3.0,
-        "totalRank": 11.5,
-        "wins": 6,
-        "losses": 7,
-        "ties": 0,
-        "totalPoints": 1412.0,
-        "theoreticalWins": 45,
-        "theoreticalLosses": 71,
-        "theoreticalTies": 1
-      },
-      {
-        "manager": "Matt",
-        "recordRank": 3.0,
-        "pointsRank": 2.0,
-        "breakdownRank": 2.0,
-        "totalRank": 7.0,
-        "wins": 5,
-        "losses": 8,
-        "ties": 0,
-        "totalPoints": 1411.0,
-        "theoreticalWins": 44,
-        "theoreticalLosses": 72,
-        "theoreticalTies": 1
-      },
-      {
-        "manager": "Ty",
-        "recordRank": 1.0,
-        "pointsRank": 1.0,
-        "breakdownRank": 1.0,
-        "totalRank": 3.0,
-        "wins": 4,
-        "losses": 9,
-        "ties": 0,
-        "totalPoints": 1311.0,
-        "theoreticalWins": 34,
-        "theoreticalLosses": 80,
-        "theoreticalTies": 3
-      }
-    ]
-  },
-  "2014": {
-    "weeks": [
-      {
-        "week": 1,
-        "managers": [
-          {
-            "manager": "Ben",
-            "recordRank": 8.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 167.0,
-            "theoreticalWins": 9,
-            "theoreticalLosses": 0,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 8.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 26.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 154.0,
-            "theoreticalWins": 8,
-            "theoreticalLosses": 1,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 8.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 24.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 146.0,
-            "theoreticalWins": 7,
-            "theoreticalLosses": 2,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 8.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 20.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 106.0,
-            "theoreticalWins": 5,
-            "theoreticalLosses": 4,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 3.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 17.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 141.0,
-            "theoreticalWins": 6,
-            "theoreticalLosses": 3,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 3.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 13.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 103.0,
-            "theoreticalWins": 4,
-            "theoreticalLosses": 5,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 8.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 12.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 88.0,
-            "theoreticalWins": 1,
-            "theoreticalLosses": 8,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 3.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 11.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 94.0,
-            "theoreticalWins": 3,
-            "theoreticalLosses": 6,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 3.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 9.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 91.0,
-            "theoreticalWins": 2,
-            "theoreticalLosses": 7,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 3.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 5.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 86.0,
-            "theoreticalWins": 0,
-            "theoreticalLosses": 9,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 2,
-        "managers": [
-          {
-            "manager": "Ben",
-            "recordRank": 8.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.5,
-            "wins": 2,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 284.0,
-            "theoreticalWins": 16,
-            "theoreticalLosses": 2,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 5.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 8.5,
-            "totalRank": 23.0,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 252.0,
-            "theoreticalWins": 11,
-            "theoreticalLosses": 7,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 8.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 6.0,
-            "totalRank": 22.5,
-            "wins": 2,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 241.0,
-            "theoreticalWins": 10,
-            "theoreticalLosses": 8,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 8.5,
-            "pointsRank": 6.5,
-            "breakdownRank": 6.0,
-            "totalRank": 21.0,
-            "wins": 2,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 230.0,
-            "theoreticalWins": 10,
-            "theoreticalLosses": 8,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 8.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 8.5,
-            "totalRank": 21.0,
-            "wins": 2,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 218.0,
-            "theoreticalWins": 11,
-            "theoreticalLosses": 7,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 2.5,
-            "pointsRank": 6.5,
-            "breakdownRank": 6.0,
-            "totalRank": 15.0,
-            "wins": 0,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 230.0,
-            "theoreticalWins": 10,
-            "theoreticalLosses": 8,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 5.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 4.0,
-            "totalRank": 12.5,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 202.0,
-            "theoreticalWins": 8,
-            "theoreticalLosses": 10,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 2.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 2.5,
-            "totalRank": 10.0,
-            "wins": 0,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 223.0,
-            "theoreticalWins": 7,
-            "theoreticalLosses": 11,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 2.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.5,
-            "totalRank": 7.0,
-            "wins": 0,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 193.0,
-            "theoreticalWins": 7,
-            "theoreticalLosses": 11,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 2.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 4.5,
-            "wins": 0,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 167.0,
-            "theoreticalWins": 0,
-            "theoreticalLosses": 18,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 3,
-        "managers": [
-          {
-            "manager": "Ben",
-            "recordRank": 9.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.0,
-            "wins": 3,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 393.0,
-            "theoreticalWins": 21,
-            "theoreticalLosses": 6,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 9.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 7.5,
-            "totalRank": 24.5,
-            "wins": 3,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 357.0,
-            "theoreticalWins": 16,
-            "theoreticalLosses": 11,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 7.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 9.0,
-            "totalRank": 23.0,
-            "wins": 2,
-            "losses": 0,
-            "ties": 1,
-            "totalPoints": 349.0,
-            "theoreticalWins": 17,
-            "theoreticalLosses": 9,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 5.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 7.5,
-            "totalRank": 21.5,
-            "wins": 1,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 386.0,
-            "theoreticalWins": 16,
-            "theoreticalLosses": 11,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 9.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 5.5,
-            "totalRank": 17.5,
-            "wins": 3,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 310.0,
-            "theoreticalWins": 15,
-            "theoreticalLosses": 12,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 5.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.5,
-            "totalRank": 15.5,
-            "wins": 1,
-            "losses": 1,
-            "ties": 1,
-            "totalPoints": 321.0,
-            "theoreticalWins": 15,
-            "theoreticalLosses": 11,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 5.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 4.0,
-            "totalRank": 15.0,
-            "wins": 1,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 343.0,
-            "theoreticalWins": 14,
-            "theoreticalLosses": 13,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 2.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 3.0,
-            "totalRank": 9.0,
-            "wins": 0,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 320.0,
-            "theoreticalWins": 12,
-            "theoreticalLosses": 15,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 2.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 6.0,
-            "wins": 0,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 282.0,
-            "theoreticalWins": 8,
-            "theoreticalLosses": 19,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 2.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 4.0,
-            "wins": 0,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 246.0,
-            "theoreticalWins": 0,
-            "theoreticalLosses": 27,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 4,
-        "managers": [
-          {
-            "manager": "Ben",
-            "recordRank": 9.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.5,
-            "wins": 4,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 548.0,
-            "theoreticalWins": 29,
-            "theoreticalLosses": 7,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 7.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 25.5,
-            "wins": 3,
-            "losses": 0,
-            "ties": 1,
-            "totalPoints": 511.0,
-            "theoreticalWins": 26,
-            "theoreticalLosses": 9,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 9.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.5,
-            "totalRank": 24.0,
-            "wins": 4,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 482.0,
-            "theoreticalWins": 22,
-            "theoreticalLosses": 14,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 4.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 7.5,
-            "totalRank": 17.5,
-            "wins": 1,
-            "losses": 2,
-            "ties": 1,
-            "totalPoints": 474.0,
-            "theoreticalWins": 22,
-            "theoreticalLosses": 13,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 7.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 6.0,
-            "totalRank": 17.5,
-            "wins": 3,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 425.0,
-            "theoreticalWins": 19,
-            "theoreticalLosses": 17,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 4.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 5.0,
-            "totalRank": 17.0,
-            "wins": 1,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 496.0,
-            "theoreticalWins": 18,
-            "theoreticalLosses": 18,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 4.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 4.0,
-            "totalRank": 13.0,
-            "wins": 1,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 432.0,
-            "theoreticalWins": 15,
-            "theoreticalLosses": 21,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 4.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 10.0,
-            "wins": 1,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 406.0,
-            "theoreticalWins": 14,
-            "theoreticalLosses": 22,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 4.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 6.0,
-            "wins": 1,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 370.0,
-            "theoreticalWins": 5,
-            "theoreticalLosses": 31,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 1.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 5.0,
-            "wins": 0,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 391.0,
-            "theoreticalWins": 9,
-            "theoreticalLosses": 27,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 5,
-        "managers": [
-          {
-            "manager": "Ben",
-            "recordRank": 9.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 9.0,
-            "totalRank": 28.0,
-            "wins": 4,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 671.0,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 11,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 9.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.0,
-            "wins": 4,
-            "losses": 0,
-            "ties": 1,
-            "totalPoints": 650.0,
-            "theoreticalWins": 35,
-            "theoreticalLosses": 9,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 9.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 5.5,
-            "totalRank": 20.5,
-            "wins": 4,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 556.0,
-            "theoreticalWins": 22,
-            "theoreticalLosses": 23,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 5.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 8.0,
-            "totalRank": 20.0,
-            "wins": 2,
-            "losses": 2,
-            "ties": 1,
-            "totalPoints": 599.0,
-            "theoreticalWins": 28,
-            "theoreticalLosses": 16,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 5.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 7.0,
-            "totalRank": 20.0,
-            "wins": 2,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 622.0,
-            "theoreticalWins": 25,
-            "theoreticalLosses": 20,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 5.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 5.5,
-            "totalRank": 14.5,
-            "wins": 2,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 542.0,
-            "theoreticalWins": 22,
-            "theoreticalLosses": 23,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 7.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 4.0,
-            "totalRank": 14.0,
-            "wins": 3,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 524.0,
-            "theoreticalWins": 21,
-            "theoreticalLosses": 24,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 2.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 3.0,
-            "totalRank": 10.0,
-            "wins": 1,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 543.0,
-            "theoreticalWins": 18,
-            "theoreticalLosses": 27,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 2.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 6.0,
-            "wins": 1,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 511.0,
-            "theoreticalWins": 13,
-            "theoreticalLosses": 32,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 2.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 4.0,
-            "wins": 1,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 467.0,
-            "theoreticalWins": 6,
-            "theoreticalLosses": 39,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 6,
-        "managers": [
-          {
-            "manager": "Lanny",
-            "recordRank": 9.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.5,
-            "wins": 5,
-            "losses": 0,
-            "ties": 1,
-            "totalPoints": 811.0,
-            "theoreticalWins": 44,
-            "theoreticalLosses": 9,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 8.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 26.0,
-            "wins": 4,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 789.0,
-            "theoreticalWins": 39,
-            "theoreticalLosses": 15,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 9.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 7.0,
-            "totalRank": 22.5,
-            "wins": 5,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 679.0,
-            "theoreticalWins": 28,
-            "theoreticalLosses": 26,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 6.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 8.0,
-            "totalRank": 21.5,
-            "wins": 3,
-            "losses": 2,
-            "ties": 1,
-            "totalPoints": 715.0,
-            "theoreticalWins": 30,
-            "theoreticalLosses": 22,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 3.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 5.5,
-            "totalRank": 17.0,
-            "wins": 2,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 729.0,
-            "theoreticalWins": 25,
-            "theoreticalLosses": 29,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 6.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 5.5,
-            "totalRank": 14.0,
-            "wins": 3,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 641.0,
-            "theoreticalWins": 25,
-            "theoreticalLosses": 29,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 3.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 3.0,
-            "totalRank": 10.5,
-            "wins": 2,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 658.0,
-            "theoreticalWins": 21,
-            "theoreticalLosses": 33,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 3.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 4.0,
-            "totalRank": 10.5,
-            "wins": 2,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 655.0,
-            "theoreticalWins": 23,
-            "theoreticalLosses": 31,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 1.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 2.0,
-            "totalRank": 8.0,
-            "wins": 1,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 659.0,
-            "theoreticalWins": 20,
-            "theoreticalLosses": 33,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 3.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 5.5,
-            "wins": 2,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 592.0,
-            "theoreticalWins": 13,
-            "theoreticalLosses": 41,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 7,
-        "managers": [
-          {
-            "manager": "Lanny",
-            "recordRank": 9.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.5,
-            "wins": 6,
-            "losses": 0,
-            "ties": 1,
-            "totalPoints": 945.0,
-            "theoreticalWins": 53,
-            "theoreticalLosses": 9,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 7.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 25.5,
-            "wins": 4,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 881.0,
-            "theoreticalWins": 40,
-            "theoreticalLosses": 23,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 7.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 8.0,
-            "totalRank": 22.5,
-            "wins": 4,
-            "losses": 2,
-            "ties": 1,
-            "totalPoints": 824.0,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 27,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 9.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 6.0,
-            "totalRank": 18.5,
-            "wins": 6,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 782.0,
-            "theoreticalWins": 30,
-            "theoreticalLosses": 32,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 2.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 6.0,
-            "totalRank": 16.5,
-            "wins": 2,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 844.0,
-            "theoreticalWins": 30,
-            "theoreticalLosses": 33,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 5.5,
-            "pointsRank": 4.5,
-            "breakdownRank": 6.0,
-            "totalRank": 16.0,
-            "wins": 3,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 783.0,
-            "theoreticalWins": 30,
-            "theoreticalLosses": 33,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 2.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 4.0,
-            "totalRank": 12.5,
-            "wins": 2,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 788.0,
-            "theoreticalWins": 28,
-            "theoreticalLosses": 34,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 2.5,
-            "pointsRank": 4.5,
-            "breakdownRank": 3.0,
-            "totalRank": 10.0,
-            "wins": 2,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 783.0,
-            "theoreticalWins": 27,
-            "theoreticalLosses": 36,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 5.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 9.5,
-            "wins": 3,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 730.0,
-            "theoreticalWins": 25,
-            "theoreticalLosses": 38,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 2.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 4.5,
-            "wins": 2,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 695.0,
-            "theoreticalWins": 15,
-            "theoreticalLosses": 47,
-            "theoreticalTies": 1
-          }
-        ]
-      },
-      {
-        "week": 8,
-        "managers": [
-          {
-            "manager": "Lanny",
-            "recordRank": 10.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 30.0,
-            "wins": 7,
-            "losses": 0,
-            "ties": 1,
-            "totalPoints": 1157.0,
-            "theoreticalWins": 62,
-            "theoreticalLosses": 9,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 6.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 24.0,
-            "wins": 4,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1009.0,
-            "theoreticalWins": 44,
-            "theoreticalLosses": 28,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 8.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 8.0,
-            "totalRank": 23.0,
-            "wins": 5,
-            "losses": 2,
-            "ties": 1,
-            "totalPoints": 958.0,
-            "theoreticalWins": 41,
-            "theoreticalLosses": 29,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 6.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 7.0,
-            "totalRank": 19.0,
-            "wins": 4,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 924.0,
-            "theoreticalWins": 38,
-            "theoreticalLosses": 34,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 2.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 6.0,
-            "totalRank": 16.0,
-            "wins": 2,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 965.0,
-            "theoreticalWins": 33,
-            "theoreticalLosses": 39,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 9.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 15.0,
-            "wins": 6,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 881.0,
-            "theoreticalWins": 30,
-            "theoreticalLosses": 41,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 4.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 14.0,
-            "wins": 3,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 913.0,
-            "theoreticalWins": 32,
-            "theoreticalLosses": 39,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 6.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 3.0,
-            "totalRank": 11.0,
-            "wins": 4,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 860.0,
-            "theoreticalWins": 30,
-            "theoreticalLosses": 41,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "John",
-            "recordRank": 2.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 3.0,
-            "totalRank": 9.0,
-            "wins": 2,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 905.0,
-            "theoreticalWins": 30,
-            "theoreticalLosses": 41,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 2.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 4.0,
-            "wins": 2,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 796.0,
-            "theoreticalWins": 16,
-            "theoreticalLosses": 55,
-            "theoreticalTies": 1
-          }
-        ]
-      },
-      {
-        "week": 9,
-        "managers": [
-          {
-            "manager": "Lanny",
-            "recordRank": 10.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 30.0,
-            "wins": 8,
-            "losses": 0,
-            "ties": 1,
-            "totalPoints": 1270.0,
-            "theoreticalWins": 66,
-            "theoreticalLosses": 14,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 4.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 8.5,
-            "totalRank": 22.0,
-            "wins": 4,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1116.0,
-            "theoreticalWins": 46,
-            "theoreticalLosses": 34,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 7.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 8.5,
-            "totalRank": 21.5,
-            "wins": 5,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1065.0,
-            "theoreticalWins": 46,
-            "theoreticalLosses": 35,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 7.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 7.0,
-            "totalRank": 19.0,
-            "wins": 5,
-            "losses": 3,
-            "ties": 1,
-            "totalPoints": 1051.0,
-            "theoreticalWins": 42,
-            "theoreticalLosses": 37,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 4.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 6.0,
-            "totalRank": 17.5,
-            "wins": 4,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1067.0,
-            "theoreticalWins": 41,
-            "theoreticalLosses": 39,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 9.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 17.0,
-            "wins": 7,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1020.0,
-            "theoreticalWins": 36,
-            "theoreticalLosses": 43,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 2.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 5.0,
-            "totalRank": 15.0,
-            "wins": 2,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1104.0,
-            "theoreticalWins": 39,
-            "theoreticalLosses": 41,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 7.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 3.0,
-            "totalRank": 12.0,
-            "wins": 5,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 989.0,
-            "theoreticalWins": 35,
-            "theoreticalLosses": 45,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "John",
-            "recordRank": 2.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 2.0,
-            "totalRank": 7.0,
-            "wins": 2,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 994.0,
-            "theoreticalWins": 30,
-            "theoreticalLosses": 50,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 2.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 4.0,
-            "wins": 2,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 903.0,
-            "theoreticalWins": 18,
-            "theoreticalLosses": 61,
-            "theoreticalTies": 2
-          }
-        ]
-      },
-      {
-        "week": 10,
-        "managers": [
-          {
-            "manager": "Lanny",
-            "recordRank": 10.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 30.0,
-            "wins": 9,
-            "losses": 0,
-            "ties": 1,
-            "totalPoints": 1421.0,
-            "theoreticalWins": 75,
-            "theoreticalLosses": 14,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 4.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 9.0,
-            "totalRank": 21.0,
-            "wins": 4,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1229.0,
-            "theoreticalWins": 48,
-            "theoreticalLosses": 41,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 6.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 8.0,
-            "totalRank": 20.0,
-            "wins": 5,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1164.0,
-            "theoreticalWins": 47,
-            "theoreticalLosses": 43,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 6.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 6.0,
-            "totalRank": 19.0,
-            "wins": 5,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1189.0,
-            "theoreticalWins": 45,
-            "theoreticalLosses": 44,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 9.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 19.0,
-            "wins": 8,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1162.0,
-            "theoreticalWins": 44,
-            "theoreticalLosses": 44,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 1.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 7.0,
-            "totalRank": 17.5,
-            "wins": 2,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1242.0,
-            "theoreticalWins": 46,
-            "theoreticalLosses": 43,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 6.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 14.0,
-            "wins": 5,
-            "losses": 4,
-            "ties": 1,
-            "totalPoints": 1147.0,
-            "theoreticalWins": 42,
-            "theoreticalLosses": 46,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 8.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 3.0,
-            "totalRank": 13.0,
-            "wins": 6,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1124.0,
-            "theoreticalWins": 40,
-            "theoreticalLosses": 49,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "John",
-            "recordRank": 3.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 2.0,
-            "totalRank": 8.0,
-            "wins": 3,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1131.0,
-            "theoreticalWins": 36,
-            "theoreticalLosses": 53,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 1.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.5,
-            "wins": 2,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1018.0,
-            "theoreticalWins": 21,
-            "theoreticalLosses": 67,
-            "theoreticalTies": 2
-          }
-        ]
-      },
-      {
-        "week": 11,
-        "managers": [
-          {
-            "manager": "Lanny",
-            "recordRank": 9.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.5,
-            "wins": 9,
-            "losses": 1,
-            "ties": 1,
-            "totalPoints": 1527.0,
-            "theoreticalWins": 77,
-            "theoreticalLosses": 21,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 3.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.5,
-            "totalRank": 20.0,
-            "wins": 4,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1344.0,
-            "theoreticalWins": 53,
-            "theoreticalLosses": 45,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 6.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 8.5,
-            "totalRank": 20.0,
-            "wins": 6,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1285.0,
-            "theoreticalWins": 53,
-            "theoreticalLosses": 46,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 8.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 5.0,
-            "totalRank": 20.0,
-            "wins": 7,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1305.0,
-            "theoreticalWins": 49,
-            "theoreticalLosses": 49,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 6.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 6.5,
-            "totalRank": 17.0,
-            "wins": 6,
-            "losses": 4,
-            "ties": 1,
-            "totalPoints": 1277.0,
-            "theoreticalWins": 50,
-            "theoreticalLosses": 47,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 1.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 6.5,
-            "totalRank": 17.0,
-            "wins": 2,
-            "losses": 9,
-            "ties": 0,
-            "totalPoints": 1354.0,
-            "theoreticalWins": 50,
-            "theoreticalLosses": 48,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 9.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 15.5,
-            "wins": 9,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1255.0,
-            "theoreticalWins": 45,
-            "theoreticalLosses": 52,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 5.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 4.0,
-            "totalRank": 15.0,
-            "wins": 5,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1299.0,
-            "theoreticalWins": 48,
-            "theoreticalLosses": 50,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "John",
-            "recordRank": 3.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 7.5,
-            "wins": 4,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1253.0,
-            "theoreticalWins": 43,
-            "theoreticalLosses": 55,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 1.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.5,
-            "wins": 2,
-            "losses": 9,
-            "ties": 0,
-            "totalPoints": 1071.0,
-            "theoreticalWins": 21,
-            "theoreticalLosses": 76,
-            "theoreticalTies": 2
-          }
-        ]
-      },
-      {
-        "week": 12,
-        "managers": [
-          {
-            "manager": "Lanny",
-            "recordRank": 9.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.5,
-            "wins": 9,
-            "losses": 2,
-            "ties": 1,
-            "totalPoints": 1649.0,
-            "theoreticalWins": 84,
-            "theoreticalLosses": 23,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 8.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 24.0,
-            "wins": 8,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1450.0,
-            "theoreticalWins": 57,
-            "theoreticalLosses": 50,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 7.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 9.0,
-            "totalRank": 23.0,
-            "wins": 7,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1439.0,
-            "theoreticalWins": 62,
-            "theoreticalLosses": 46,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 5.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 6.5,
-            "totalRank": 17.0,
-            "wins": 6,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1420.0,
-            "theoreticalWins": 54,
-            "theoreticalLosses": 53,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 5.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 6.5,
-            "totalRank": 16.0,
-            "wins": 6,
-            "losses": 5,
-            "ties": 1,
-            "totalPoints": 1394.0,
-            "theoreticalWins": 54,
-            "theoreticalLosses": 51,
-            "theoreticalTies": 3
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 2.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 4.5,
-            "totalRank": 15.5,
-            "wins": 3,
-            "losses": 9,
-            "ties": 0,
-            "totalPoints": 1467.0,
-            "theoreticalWins": 53,
-            "theoreticalLosses": 54,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 9.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 15.5,
-            "wins": 9,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1372.0,
-            "theoreticalWins": 49,
-            "theoreticalLosses": 56,
-            "theoreticalTies": 3
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 3.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 4.5,
-            "totalRank": 13.5,
-            "wins": 4,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1429.0,
-            "theoreticalWins": 53,
-            "theoreticalLosses": 54,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "John",
-            "recordRank": 4.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 8.0,
-            "wins": 5,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1365.0,
-            "theoreticalWins": 45,
-            "theoreticalLosses": 62,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 2,
-            "losses": 10,
-            "ties": 0,
-            "totalPoints": 1175.0,
-            "theoreticalWins": 22,
-            "theoreticalLosses": 84,
-            "theoreticalTies": 2
-          }
-        ]
-      },
-      {
-        "week": 13,
-        "managers": [
-          {
-            "manager": "Lanny",
-            "recordRank": 8.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.5,
-            "wins": 9,
-            "losses": 3,
-            "ties": 1,
-            "totalPoints": 1789.0,
-            "theoreticalWins": 91,
-            "theoreticalLosses": 25,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 8.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 24.5,
-            "wins": 9,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1584.0,
-            "theoreticalWins": 62,
-            "theoreticalLosses": 54,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 6.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 9.0,
-            "totalRank": 22.5,
-            "wins": 7,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1560.0,
-            "theoreticalWins": 66,
-            "theoreticalLosses": 51,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 10.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 5.0,
-            "totalRank": 19.0,
-            "wins": 10,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1528.0,
-            "theoreticalWins": 58,
-            "theoreticalLosses": 56,
-            "theoreticalTies": 3
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 6.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 18.5,
-            "wins": 7,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1557.0,
-            "theoreticalWins": 60,
-            "theoreticalLosses": 56,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 2.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 7.0,
-            "totalRank": 18.5,
-            "wins": 4,
-            "losses": 9,
-            "ties": 0,
-            "totalPoints": 1616.0,
-            "theoreticalWins": 61,
-            "theoreticalLosses": 55,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 4.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.5,
-            "totalRank": 11.0,
-            "wins": 6,
-            "losses": 6,
-            "ties": 1,
-            "totalPoints": 1499.0,
-            "theoreticalWins": 54,
-            "theoreticalLosses": 60,
-            "theoreticalTies": 3
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 2.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 3.5,
-            "totalRank": 11.0,
-            "wins": 4,
-            "losses": 9,
-            "ties": 0,
-            "totalPoints": 1537.0,
-            "theoreticalWins": 54,
-            "theoreticalLosses": 62,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "John",
-            "recordRank": 4.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 8.5,
-            "wins": 6,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1475.0,
-            "theoreticalWins": 47,
-            "theoreticalLosses": 69,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 2,
-            "losses": 11,
-            "ties": 0,
-            "totalPoints": 1289.0,
-            "theoreticalWins": 25,
-            "theoreticalLosses": 90,
-            "theoreticalTies": 2
-          }
-        ]
-      }
-    ],
-    "finalWeek": 13,
-    "finalRankings": [
-      {
-        "manager": "Lanny",
-        "recordRank": 8.5,
-        "pointsRank": 10.0,
-        "breakdownRank": 10.0,
-        "totalRank": 28.5,
-        "wins": 9,
-        "losses": 3,
-        "ties": 1,
-        "totalPoints": 1789.0,
-        "theoreticalWins": 91,
-        "theoreticalLosses": 25,
-        "theoreticalTies": 1
-      },
-      {
-        "manager": "Joey",
-        "recordRank": 8.5,
-        "pointsRank": 8.0,
-        "breakdownRank": 8.0,
-        "totalRank": 24.5,
-        "wins": 9,
-        "losses": 4,
-        "ties": 0,
-        "totalPoints": 1584.0,
-        "theoreticalWins": 62,
-        "theoreticalLosses": 54,
-        "theoreticalTies": 1
-      },
-      {
-        "manager": "Peter",
-        "recordRank": 6.5,
-        "pointsRank": 7.0,
-        "breakdownRank": 9.0,
-        "totalRank": 22.5,
-        "wins": 7,
-        "losses": 6,
-        "ties": 0,
-        "totalPoints": 1560.0,
-        "theoreticalWins": 66,
-        "theoreticalLosses": 51,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Tyler",
-        "recordRank": 10.0,
-        "pointsRank": 4.0,
-        "breakdownRank": 5.0,
-        "totalRank": 19.0,
-        "wins": 10,
-        "losses": 3,
-        "ties": 0,
-        "totalPoints": 1528.0,
-        "theoreticalWins": 58,
-        "theoreticalLosses": 56,
-        "theoreticalTies": 3
-      },
-      {
-        "manager": "Matt",
-        "recordRank": 6.5,
-        "pointsRank": 6.0,
-        "breakdownRank": 6.0,
-        "totalRank": 18.5,
-        "wins": 7,
-        "losses": 6,
-        "ties": 0,
-        "totalPoints": 1557.0,
-        "theoreticalWins": 60,
-        "theoreticalLosses": 56,
-        "theoreticalTies": 1
-      },
-      {
-        "manager": "Vernon",
-        "recordRank": 2.5,
-        "pointsRank": 9.0,
-        "breakdownRank": 7.0,
-        "totalRank": 18.5,
-        "wins": 4,
-        "losses": 9,
-        "ties": 0,
-        "totalPoints": 1616.0,
-        "theoreticalWins": 61,
-        "theoreticalLosses": 55,
-        "theoreticalTies": 1
-      },
-      {
-        "manager": "Ted",
-        "recordRank": 4.5,
-        "pointsRank": 3.0,
-        "breakdownRank": 3.5,
-        "totalRank": 11.0,
-        "wins": 6,
-        "losses": 6,
-        "ties": 1,
-        "totalPoints": 1499.0,
-        "theoreticalWins": 54,
-        "theoreticalLosses": 60,
-        "theoreticalTies": 3
-      },
-      {
-        "manager": "Ben",
-        "recordRank": 2.5,
-        "pointsRank": 5.0,
-        "breakdownRank": 3.5,
-        "totalRank": 11.0,
-        "wins": 4,
-        "losses": 9,
-        "ties": 0,
-        "totalPoints": 1537.0,
-        "theoreticalWins": 54,
-        "theoreticalLosses": 62,
-        "theoreticalTies": 1
-      },
-      {
-        "manager": "John",
-        "recordRank": 4.5,
-        "pointsRank": 2.0,
-        "breakdownRank": 2.0,
-        "totalRank": 8.5,
-        "wins": 6,
-        "losses": 7,
-        "ties": 0,
-        "totalPoints": 1475.0,
-        "theoreticalWins": 47,
-        "theoreticalLosses": 69,
-        "theoreticalTies": 1
-      },
-      {
-        "manager": "Ty",
-        "recordRank": 1.0,
-        "pointsRank": 1.0,
-        "breakdownRank": 1.0,
-        "totalRank": 3.0,
-        "wins": 2,
-        "losses": 11,
-        "ties": 0,
-        "totalPoints": 1289.0,
-        "theoreticalWins": 25,
-        "theoreticalLosses": 90,
-        "theoreticalTies": 2
-      }
-    ]
-  },
-  "2015": {
-    "weeks": [
-      {
-        "week": 1,
-        "managers": [
-          {
-            "manager": "Ben",
-            "recordRank": 8.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 152.0,
-            "theoreticalWins": 9,
-            "theoreticalLosses": 0,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 8.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 26.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 136.0,
-            "theoreticalWins": 8,
-            "theoreticalLosses": 1,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 8.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 24.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 134.0,
-            "theoreticalWins": 7,
-            "theoreticalLosses": 2,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 8.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 22.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 129.0,
-            "theoreticalWins": 6,
-            "theoreticalLosses": 3,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 8.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 20.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 117.0,
-            "theoreticalWins": 5,
-            "theoreticalLosses": 4,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 3.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 13.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 111.0,
-            "theoreticalWins": 4,
-            "theoreticalLosses": 5,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 3.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 11.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 104.0,
-            "theoreticalWins": 3,
-            "theoreticalLosses": 6,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 3.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 9.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 99.0,
-            "theoreticalWins": 2,
-            "theoreticalLosses": 7,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 3.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 7.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 91.0,
-            "theoreticalWins": 1,
-            "theoreticalLosses": 8,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 3.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 5.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 82.0,
-            "theoreticalWins": 0,
-            "theoreticalLosses": 9,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 2,
-        "managers": [
-          {
-            "manager": "Ben",
-            "recordRank": 9.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.0,
-            "wins": 2,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 286.0,
-            "theoreticalWins": 18,
-            "theoreticalLosses": 0,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 9.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 9.0,
-            "totalRank": 25.0,
-            "wins": 2,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 244.0,
-            "theoreticalWins": 12,
-            "theoreticalLosses": 6,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 5.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 8.0,
-            "totalRank": 22.5,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 249.0,
-            "theoreticalWins": 11,
-            "theoreticalLosses": 7,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 9.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 5.5,
-            "totalRank": 22.5,
-            "wins": 2,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 248.0,
-            "theoreticalWins": 9,
-            "theoreticalLosses": 9,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 5.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 7.0,
-            "totalRank": 17.5,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 231.0,
-            "theoreticalWins": 10,
-            "theoreticalLosses": 8,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 5.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 5.5,
-            "totalRank": 17.0,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 233.0,
-            "theoreticalWins": 9,
-            "theoreticalLosses": 9,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 5.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 11.5,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 213.0,
-            "theoreticalWins": 7,
-            "theoreticalLosses": 11,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 2.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 10.0,
-            "wins": 0,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 229.0,
-            "theoreticalWins": 8,
-            "theoreticalLosses": 10,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 2.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 1.5,
-            "totalRank": 5.5,
-            "wins": 0,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 199.0,
-            "theoreticalWins": 3,
-            "theoreticalLosses": 15,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 2.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.5,
-            "totalRank": 4.5,
-            "wins": 0,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 189.0,
-            "theoreticalWins": 3,
-            "theoreticalLosses": 15,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 3,
-        "managers": [
-          {
-            "manager": "Ben",
-            "recordRank": 10.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 30.0,
-            "wins": 3,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 455.0,
-            "theoreticalWins": 25,
-            "theoreticalLosses": 2,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 6.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 24.5,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 404.0,
-            "theoreticalWins": 17,
-            "theoreticalLosses": 10,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 6.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 7.0,
-            "totalRank": 21.5,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 400.0,
-            "theoreticalWins": 16,
-            "theoreticalLosses": 11,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 6.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 20.5,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 380.0,
-            "theoreticalWins": 16,
-            "theoreticalLosses": 11,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 6.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 7.0,
-            "totalRank": 19.5,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 371.0,
-            "theoreticalWins": 16,
-            "theoreticalLosses": 11,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 6.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 3.5,
-            "totalRank": 15.0,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 357.0,
-            "theoreticalWins": 11,
-            "theoreticalLosses": 16,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 6.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 5.0,
-            "totalRank": 14.5,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 326.0,
-            "theoreticalWins": 13,
-            "theoreticalLosses": 14,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 2.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 3.5,
-            "totalRank": 9.5,
-            "wins": 0,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 343.0,
-            "theoreticalWins": 11,
-            "theoreticalLosses": 16,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 2.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 6.0,
-            "wins": 0,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 306.0,
-            "theoreticalWins": 7,
-            "theoreticalLosses": 20,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 2.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 4.0,
-            "wins": 0,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 278.0,
-            "theoreticalWins": 3,
-            "theoreticalLosses": 24,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 4,
-        "managers": [
-          {
-            "manager": "Ben",
-            "recordRank": 10.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 30.0,
-            "wins": 4,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 587.0,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 2,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 7.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 8.0,
-            "totalRank": 24.5,
-            "wins": 3,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 521.0,
-            "theoreticalWins": 22,
-            "theoreticalLosses": 13,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "John",
-            "recordRank": 7.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 9.0,
-            "totalRank": 23.5,
-            "wins": 3,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 497.0,
-            "theoreticalWins": 24,
-            "theoreticalLosses": 12,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 4.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 7.0,
-            "totalRank": 19.5,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 503.0,
-            "theoreticalWins": 21,
-            "theoreticalLosses": 15,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 7.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 6.0,
-            "totalRank": 17.5,
-            "wins": 3,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 447.0,
-            "theoreticalWins": 19,
-            "theoreticalLosses": 16,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 7.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 3.0,
-            "totalRank": 15.5,
-            "wins": 3,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 454.0,
-            "theoreticalWins": 14,
-            "theoreticalLosses": 22,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 4.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 4.5,
-            "totalRank": 15.0,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 463.0,
-            "theoreticalWins": 16,
-            "theoreticalLosses": 20,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 2.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 4.5,
-            "totalRank": 9.5,
-            "wins": 0,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 444.0,
-            "theoreticalWins": 16,
-            "theoreticalLosses": 20,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 2.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 6.0,
-            "wins": 0,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 390.0,
-            "theoreticalWins": 8,
-            "theoreticalLosses": 27,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 2.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 4.0,
-            "wins": 0,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 362.0,
-            "theoreticalWins": 4,
-            "theoreticalLosses": 31,
-            "theoreticalTies": 1
-          }
-        ]
-      },
-      {
-        "week": 5,
-        "managers": [
-          {
-            "manager": "Ben",
-            "recordRank": 10.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 30.0,
-            "wins": 5,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 720.0,
-            "theoreticalWins": 41,
-            "theoreticalLosses": 4,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 9.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 8.0,
-            "totalRank": 26.0,
-            "wins": 4,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 650.0,
-            "theoreticalWins": 27,
-            "theoreticalLosses": 17,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 6.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 22.0,
-            "wins": 3,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 634.0,
-            "theoreticalWins": 27,
-            "theoreticalLosses": 18,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 6.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 8.0,
-            "totalRank": 21.0,
-            "wins": 3,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 618.0,
-            "theoreticalWins": 27,
-            "theoreticalLosses": 18,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 6.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 16.0,
-            "wins": 3,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 598.0,
-            "theoreticalWins": 24,
-            "theoreticalLosses": 21,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 3.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 15.0,
-            "wins": 1,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 599.0,
-            "theoreticalWins": 25,
-            "theoreticalLosses": 20,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 6.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 3.0,
-            "totalRank": 13.0,
-            "wins": 3,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 546.0,
-            "theoreticalWins": 15,
-            "theoreticalLosses": 30,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 6.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 4.0,
-            "totalRank": 13.0,
-            "wins": 3,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 545.0,
-            "theoreticalWins": 21,
-            "theoreticalLosses": 23,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 1.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 1.5,
-            "totalRank": 5.0,
-            "wins": 0,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 485.0,
-            "theoreticalWins": 8,
-            "theoreticalLosses": 36,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 1.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.5,
-            "totalRank": 4.0,
-            "wins": 0,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 480.0,
-            "theoreticalWins": 8,
-            "theoreticalLosses": 36,
-            "theoreticalTies": 1
-          }
-        ]
-      },
-      {
-        "week": 6,
-        "managers": [
-          {
-            "manager": "Ben",
-            "recordRank": 10.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 30.0,
-            "wins": 6,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 880.0,
-            "theoreticalWins": 48,
-            "theoreticalLosses": 6,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 9.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 27.0,
-            "wins": 5,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 814.0,
-            "theoreticalWins": 36,
-            "theoreticalLosses": 17,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 5.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 21.0,
-            "wins": 3,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 795.0,
-            "theoreticalWins": 35,
-            "theoreticalLosses": 19,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 5.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 6.5,
-            "totalRank": 18.5,
-            "wins": 3,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 728.0,
-            "theoreticalWins": 30,
-            "theoreticalLosses": 24,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 7.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 17.5,
-            "wins": 4,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 700.0,
-            "theoreticalWins": 26,
-            "theoreticalLosses": 28,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 7.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 15.5,
-            "wins": 4,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 665.0,
-            "theoreticalWins": 25,
-            "theoreticalLosses": 28,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 2.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.5,
-            "totalRank": 15.0,
-            "wins": 1,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 725.0,
-            "theoreticalWins": 30,
-            "theoreticalLosses": 24,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 5.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 11.0,
-            "wins": 3,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 618.0,
-            "theoreticalWins": 16,
-            "theoreticalLosses": 38,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 2.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 6.5,
-            "wins": 1,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 612.0,
-            "theoreticalWins": 14,
-            "theoreticalLosses": 39,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 0,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 550.0,
-            "theoreticalWins": 8,
-            "theoreticalLosses": 45,
-            "theoreticalTies": 1
-          }
-        ]
-      },
-      {
-        "week": 7,
-        "managers": [
-          {
-            "manager": "Ben",
-            "recordRank": 9.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.5,
-            "wins": 6,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 985.0,
-            "theoreticalWins": 49,
-            "theoreticalLosses": 14,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 9.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 25.5,
-            "wins": 6,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 927.0,
-            "theoreticalWins": 39,
-            "theoreticalLosses": 23,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 5.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 23.5,
-            "wins": 4,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 946.0,
-            "theoreticalWins": 44,
-            "theoreticalLosses": 19,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 5.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 19.5,
-            "wins": 4,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 844.0,
-            "theoreticalWins": 35,
-            "theoreticalLosses": 28,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 8.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 4.0,
-            "totalRank": 17.0,
-            "wins": 5,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 815.0,
-            "theoreticalWins": 30,
-            "theoreticalLosses": 33,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 5.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 6.0,
-            "totalRank": 15.5,
-            "wins": 4,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 808.0,
-            "theoreticalWins": 33,
-            "theoreticalLosses": 29,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 2.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 5.0,
-            "totalRank": 13.5,
-            "wins": 1,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 834.0,
-            "theoreticalWins": 32,
-            "theoreticalLosses": 31,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 5.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 11.5,
-            "wins": 4,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 758.0,
-            "theoreticalWins": 23,
-            "theoreticalLosses": 40,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 2.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 6.5,
-            "wins": 1,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 735.0,
-            "theoreticalWins": 20,
-            "theoreticalLosses": 42,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 0,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 609.0,
-            "theoreticalWins": 8,
-            "theoreticalLosses": 54,
-            "theoreticalTies": 1
-          }
-        ]
-      },
-      {
-        "week": 8,
-        "managers": [
-          {
-            "manager": "Ben",
-            "recordRank": 9.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 9.5,
-            "totalRank": 28.5,
-            "wins": 6,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1082.0,
-            "theoreticalWins": 50,
-            "theoreticalLosses": 22,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 9.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 25.0,
-            "wins": 6,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1066.0,
-            "theoreticalWins": 47,
-            "theoreticalLosses": 24,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 6.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.5,
-            "totalRank": 24.5,
-            "wins": 5,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1079.0,
-            "theoreticalWins": 50,
-            "theoreticalLosses": 22,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 9.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 21.0,
-            "wins": 6,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 952.0,
-            "theoreticalWins": 37,
-            "theoreticalLosses": 35,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 6.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 20.0,
-            "wins": 5,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1044.0,
-            "theoreticalWins": 44,
-            "theoreticalLosses": 28,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 3.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 13.0,
-            "wins": 2,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 933.0,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 37,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 6.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 12.0,
-            "wins": 5,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 870.0,
-            "theoreticalWins": 28,
-            "theoreticalLosses": 44,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 4.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 12.0,
-            "wins": 4,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 885.0,
-            "theoreticalWins": 33,
-            "theoreticalLosses": 38,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 2.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 6.0,
-            "wins": 1,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 836.0,
-            "theoreticalWins": 24,
-            "theoreticalLosses": 47,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 0,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 708.0,
-            "theoreticalWins": 10,
-            "theoreticalLosses": 60,
-            "theoreticalTies": 2
-          }
-        ]
-      },
-      {
-        "week": 9,
-        "managers": [
-          {
-            "manager": "Matt",
-            "recordRank": 7.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 27.5,
-            "wins": 6,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1221.0,
-            "theoreticalWins": 57,
-            "theoreticalLosses": 24,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 7.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 9.0,
-            "totalRank": 24.5,
-            "wins": 6,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1187.0,
-            "theoreticalWins": 53,
-            "theoreticalLosses": 27,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 7.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 8.0,
-            "totalRank": 24.5,
-            "wins": 6,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1193.0,
-            "theoreticalWins": 52,
-            "theoreticalLosses": 29,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 10.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 22.0,
-            "wins": 7,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1107.0,
-            "theoreticalWins": 45,
-            "theoreticalLosses": 36,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 5.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 19.0,
-            "wins": 5,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1157.0,
-            "theoreticalWins": 47,
-            "theoreticalLosses": 33,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 7.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 5.0,
-            "totalRank": 16.5,
-            "wins": 6,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1033.0,
-            "theoreticalWins": 37,
-            "theoreticalLosses": 44,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 2.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 4.0,
-            "totalRank": 11.5,
-            "wins": 2,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1038.0,
-            "theoreticalWins": 35,
-            "theoreticalLosses": 45,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 4.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 10.0,
-            "wins": 4,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 963.0,
-            "theoreticalWins": 33,
-            "theoreticalLosses": 47,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 2.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 6.5,
-            "wins": 2,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 949.0,
-            "theoreticalWins": 27,
-            "theoreticalLosses": 52,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 1,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 826.0,
-            "theoreticalWins": 15,
-            "theoreticalLosses": 64,
-            "theoreticalTies": 2
-          }
-        ]
-      },
-      {
-        "week": 10,
-        "managers": [
-          {
-            "manager": "Ted",
-            "recordRank": 9.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.0,
-            "wins": 7,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1315.0,
-            "theoreticalWins": 61,
-            "theoreticalLosses": 28,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 7.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 9.0,
-            "totalRank": 26.0,
-            "wins": 6,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1322.0,
-            "theoreticalWins": 60,
-            "theoreticalLosses": 30,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 10.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.5,
-            "totalRank": 24.5,
-            "wins": 8,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1270.0,
-            "theoreticalWins": 54,
-            "theoreticalLosses": 36,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 7.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 7.5,
-            "totalRank": 22.5,
-            "wins": 6,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1290.0,
-            "theoreticalWins": 54,
-            "theoreticalLosses": 36,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 4.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 16.5,
-            "wins": 5,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1233.0,
-            "theoreticalWins": 47,
-            "theoreticalLosses": 42,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 7.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 5.0,
-            "totalRank": 16.0,
-            "wins": 6,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1145.0,
-            "theoreticalWins": 44,
-            "theoreticalLosses": 46,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 3.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 4.0,
-            "totalRank": 12.0,
-            "wins": 3,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1149.0,
-            "theoreticalWins": 41,
-            "theoreticalLosses": 48,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 4.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 10.5,
-            "wins": 5,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1072.0,
-            "theoreticalWins": 38,
-            "theoreticalLosses": 51,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 1.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 5.5,
-            "wins": 2,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1033.0,
-            "theoreticalWins": 28,
-            "theoreticalLosses": 60,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 1.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.5,
-            "wins": 2,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 929.0,
-            "theoreticalWins": 19,
-            "theoreticalLosses": 69,
-            "theoreticalTies": 2
-          }
-        ]
-      },
-      {
-        "week": 11,
-        "managers": [
-          {
-            "manager": "Ted",
-            "recordRank": 9.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.5,
-            "wins": 8,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1445.0,
-            "theoreticalWins": 69,
-            "theoreticalLosses": 28,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 7.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 25.5,
-            "wins": 7,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1420.0,
-            "theoreticalWins": 64,
-            "theoreticalLosses": 35,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 9.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 23.5,
-            "wins": 8,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1345.0,
-            "theoreticalWins": 55,
-            "theoreticalLosses": 44,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 5.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 21.5,
-            "wins": 6,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1403.0,
-            "theoreticalWins": 61,
-            "theoreticalLosses": 38,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 7.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.5,
-            "totalRank": 18.0,
-            "wins": 7,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1275.0,
-            "theoreticalWins": 52,
-            "theoreticalLosses": 46,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "John",
-            "recordRank": 5.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 5.5,
-            "totalRank": 17.0,
-            "wins": 6,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1335.0,
-            "theoreticalWins": 52,
-            "theoreticalLosses": 45,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 3.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 3.5,
-            "totalRank": 10.5,
-            "wins": 4,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1231.0,
-            "theoreticalWins": 43,
-            "theoreticalLosses": 55,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 4.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.5,
-            "totalRank": 10.5,
-            "wins": 5,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1174.0,
-            "theoreticalWins": 43,
-            "theoreticalLosses": 54,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 1.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 5.5,
-            "wins": 2,
-            "losses": 9,
-            "ties": 0,
-            "totalPoints": 1106.0,
-            "theoreticalWins": 28,
-            "theoreticalLosses": 69,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 1.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.5,
-            "wins": 2,
-            "losses": 9,
-            "ties": 0,
-            "totalPoints": 1013.0,
-            "theoreticalWins": 22,
-            "theoreticalLosses": 75,
-            "theoreticalTies": 2
-          }
-        ]
-      },
-      {
-        "week": 12,
-        "managers": [
-          {
-            "manager": "Ted",
-            "recordRank": 8.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.5,
-            "wins": 8,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1567.0,
-            "theoreticalWins": 75,
-            "theoreticalLosses": 31,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 6.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 8.0,
-            "totalRank": 23.5,
-            "wins": 7,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1533.0,
-            "theoreticalWins": 65,
-            "theoreticalLosses": 43,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 6.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 9.0,
-            "totalRank": 23.5,
-            "wins": 7,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1528.0,
-            "theoreticalWins": 68,
-            "theoreticalLosses": 40,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 10.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 6.0,
-            "totalRank": 23.0,
-            "wins": 9,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1460.0,
-            "theoreticalWins": 57,
-            "theoreticalLosses": 51,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 8.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 7.0,
-            "totalRank": 20.5,
-            "wins": 8,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1412.0,
-            "theoreticalWins": 60,
-            "theoreticalLosses": 47,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "John",
-            "recordRank": 4.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 4.5,
-            "totalRank": 15.0,
-            "wins": 6,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1436.0,
-            "theoreticalWins": 52,
-            "theoreticalLosses": 54,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 4.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 4.5,
-            "totalRank": 12.0,
-            "wins": 6,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1314.0,
-            "theoreticalWins": 52,
-            "theoreticalLosses": 54,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 3.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 3.0,
-            "totalRank": 10.0,
-            "wins": 5,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1351.0,
-            "theoreticalWins": 48,
-            "theoreticalLosses": 59,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 1.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 5.5,
-            "wins": 2,
-            "losses": 10,
-            "ties": 0,
-            "totalPoints": 1225.0,
-            "theoreticalWins": 32,
-            "theoreticalLosses": 74,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 1.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.5,
-            "wins": 2,
-            "losses": 10,
-            "ties": 0,
-            "totalPoints": 1130.0,
-            "theoreticalWins": 25,
-            "theoreticalLosses": 81,
-            "theoreticalTies": 2
-          }
-        ]
-      },
-      {
-        "week": 13,
-        "managers": [
-          {
-            "manager": "Ted",
-            "recordRank": 9.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.0,
-            "wins": 9,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1698.0,
-            "theoreticalWins": 82,
-            "theoreticalLosses": 33,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 6.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 9.0,
-            "totalRank": 25.5,
-            "wins": 8,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1704.0,
-            "theoreticalWins": 77,
-            "theoreticalLosses": 40,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 6.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 22.5,
-            "wins": 8,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1662.0,
-            "theoreticalWins": 71,
-            "theoreticalLosses": 46,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 9.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 6.0,
-            "totalRank": 22.0,
-            "wins": 9,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1578.0,
-            "theoreticalWins": 60,
-            "theoreticalLosses": 57,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 9.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 7.0,
-            "totalRank": 21.0,
-            "wins": 9,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1551.0,
-            "theoreticalWins": 68,
-            "theoreticalLosses": 48,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "John",
-            "recordRank": 4.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 5.0,
-            "totalRank": 15.0,
-            "wins": 6,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1552.0,
-            "theoreticalWins": 54,
-            "theoreticalLosses": 61,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 4.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 3.0,
-            "totalRank": 11.0,
-            "wins": 6,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1478.0,
-            "theoreticalWins": 52,
-            "theoreticalLosses": 64,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 4.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 4.0,
-            "totalRank": 11.0,
-            "wins": 6,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1416.0,
-            "theoreticalWins": 53,
-            "theoreticalLosses": 62,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 1.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 5.5,
-            "wins": 2,
-            "losses": 11,
-            "ties": 0,
-            "totalPoints": 1298.0,
-            "theoreticalWins": 32,
-            "theoreticalLosses": 83,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 1.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.5,
-            "wins": 2,
-            "losses": 11,
-            "ties": 0,
-            "totalPoints": 1258.0,
-            "theoreticalWins": 30,
-            "theoreticalLosses": 85,
-            "theoreticalTies": 2
-          }
-        ]
-      }
-    ],
-    "finalWeek": 13,
-    "finalRankings": [
-      {
-        "manager": "Ted",
-        "recordRank": 9.0,
-        "pointsRank": 9.0,
-        "breakdownRank": 10.0,
-        "totalRank": 28.0,
-        "wins": 9,
-        "losses": 4,
-        "ties": 0,
-        "totalPoints": 1698.0,
-        "theoreticalWins": 82,
-        "theoreticalLosses": 33,
-        "theoreticalTies": 2
-      },
-      {
-        "manager": "Ben",
-        "recordRank": 6.5,
-        "pointsRank": 10.0,
-        "breakdownRank": 9.0,
-        "totalRank": 25.5,
-        "wins": 8,
-        "losses": 5,
-        "ties": 0,
-        "totalPoints": 1704.0,
-        "theoreticalWins": 77,
-        "theoreticalLosses": 40,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Matt",
-        "recordRank": 6.5,
-        "pointsRank": 8.0,
-        "breakdownRank": 8.0,
-        "totalRank": 22.5,
-        "wins": 8,
-        "losses": 5,
-        "ties": 0,
-        "totalPoints": 1662.0,
-        "theoreticalWins": 71,
-        "theoreticalLosses": 46,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Tyler",
-        "recordRank": 9.0,
-        "pointsRank": 7.0,
-        "breakdownRank": 6.0,
-        "totalRank": 22.0,
-        "wins": 9,
-        "losses": 4,
-        "ties": 0,
-        "totalPoints": 1578.0,
-        "theoreticalWins": 60,
-        "theoreticalLosses": 57,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Peter",
-        "recordRank": 9.0,
-        "pointsRank": 5.0,
-        "breakdownRank": 7.0,
-        "totalRank": 21.0,
-        "wins": 9,
-        "losses": 4,
-        "ties": 0,
-        "totalPoints": 1551.0,
-        "theoreticalWins": 68,
-        "theoreticalLosses": 48,
-        "theoreticalTies": 1
-      },
-      {
-        "manager": "John",
-        "recordRank": 4.0,
-        "pointsRank": 6.0,
-        "breakdownRank": 5.0,
-        "totalRank": 15.0,
-        "wins": 6,
-        "losses": 7,
-        "ties": 0,
-        "totalPoints": 1552.0,
-        "theoreticalWins": 54,
-        "theoreticalLosses": 61,
-        "theoreticalTies": 2
-      },
-      {
-        "manager": "Joey",
-        "recordRank": 4.0,
-        "pointsRank": 4.0,
-        "breakdownRank": 3.0,
-        "totalRank": 11.0,
-        "wins": 6,
-        "losses": 7,
-        "ties": 0,
-        "totalPoints": 1478.0,
-        "theoreticalWins": 52,
-        "theoreticalLosses": 64,
-        "theoreticalTies": 1
-      },
-      {
-        "manager": "Ty",
-        "recordRank": 4.0,
-        "pointsRank": 3.0,
-        "breakdownRank": 4.0,
-        "totalRank": 11.0,
-        "wins": 6,
-        "losses": 7,
-        "ties": 0,
-        "totalPoints": 1416.0,
-        "theoreticalWins": 53,
-        "theoreticalLosses": 62,
-        "theoreticalTies": 2
-      },
-      {
-        "manager": "Lanny",
-        "recordRank": 1.5,
-        "pointsRank": 2.0,
-        "breakdownRank": 2.0,
-        "totalRank": 5.5,
-        "wins": 2,
-        "losses": 11,
-        "ties": 0,
-        "totalPoints": 1298.0,
-        "theoreticalWins": 32,
-        "theoreticalLosses": 83,
-        "theoreticalTies": 2
-      },
-      {
-        "manager": "Vernon",
-        "recordRank": 1.5,
-        "pointsRank": 1.0,
-        "breakdownRank": 1.0,
-        "totalRank": 3.5,
-        "wins": 2,
-        "losses": 11,
-        "ties": 0,
-        "totalPoints": 1258.0,
-        "theoreticalWins": 30,
-        "theoreticalLosses": 85,
-        "theoreticalTies": 2
-      }
-    ]
-  },
-  "2016": {
-    "weeks": [
-      {
-        "week": 1,
-        "managers": [
-          {
-            "manager": "John",
-            "recordRank": 8.0,
-            "pointsRank": 9.5,
-            "breakdownRank": 9.5,
-            "totalRank": 27.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 162.0,
-            "theoreticalWins": 8,
-            "theoreticalLosses": 0,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 8.0,
-            "pointsRank": 9.5,
-            "breakdownRank": 9.5,
-            "totalRank": 27.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 162.0,
-            "theoreticalWins": 8,
-            "theoreticalLosses": 0,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 8.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 22.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 132.0,
-            "theoreticalWins": 6,
-            "theoreticalLosses": 3,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 8.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 20.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 121.0,
-            "theoreticalWins": 5,
-            "theoreticalLosses": 4,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 3.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 19.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 136.0,
-            "theoreticalWins": 7,
-            "theoreticalLosses": 2,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 8.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 16.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 113.0,
-            "theoreticalWins": 3,
-            "theoreticalLosses": 6,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 3.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 13.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 114.0,
-            "theoreticalWins": 4,
-            "theoreticalLosses": 5,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 3.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 9.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 110.0,
-            "theoreticalWins": 2,
-            "theoreticalLosses": 7,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 3.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 7.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 98.0,
-            "theoreticalWins": 1,
-            "theoreticalLosses": 8,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 3.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 5.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 94.0,
-            "theoreticalWins": 0,
-            "theoreticalLosses": 9,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 2,
-        "managers": [
-          {
-            "manager": "Ben",
-            "recordRank": 9.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.0,
-            "wins": 2,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 293.0,
-            "theoreticalWins": 15,
-            "theoreticalLosses": 3,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 9.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 8.5,
-            "totalRank": 26.5,
-            "wins": 2,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 277.0,
-            "theoreticalWins": 13,
-            "theoreticalLosses": 4,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 5.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 19.5,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 249.0,
-            "theoreticalWins": 11,
-            "theoreticalLosses": 7,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 2.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.5,
-            "totalRank": 18.5,
-            "wins": 0,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 260.0,
-            "theoreticalWins": 13,
-            "theoreticalLosses": 5,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 5.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 5.5,
-            "totalRank": 17.0,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 239.0,
-            "theoreticalWins": 8,
-            "theoreticalLosses": 9,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 5.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.5,
-            "totalRank": 16.0,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 238.0,
-            "theoreticalWins": 8,
-            "theoreticalLosses": 10,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 9.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 15.0,
-            "wins": 2,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 214.0,
-            "theoreticalWins": 6,
-            "theoreticalLosses": 12,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 5.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 3.0,
-            "totalRank": 10.5,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 204.0,
-            "theoreticalWins": 6,
-            "theoreticalLosses": 12,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 2.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 3.0,
-            "totalRank": 9.0,
-            "wins": 0,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 218.0,
-            "theoreticalWins": 6,
-            "theoreticalLosses": 12,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 2.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 4.0,
-            "wins": 0,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 194.0,
-            "theoreticalWins": 3,
-            "theoreticalLosses": 15,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 3,
-        "managers": [
-          {
-            "manager": "John",
-            "recordRank": 8.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.0,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 452.0,
-            "theoreticalWins": 21,
-            "theoreticalLosses": 5,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 8.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 24.0,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 383.0,
-            "theoreticalWins": 16,
-            "theoreticalLosses": 11,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 8.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 7.0,
-            "totalRank": 21.0,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 372.0,
-            "theoreticalWins": 15,
-            "theoreticalLosses": 12,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 3.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 9.0,
-            "totalRank": 19.0,
-            "wins": 1,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 374.0,
-            "theoreticalWins": 19,
-            "theoreticalLosses": 8,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 8.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 4.5,
-            "totalRank": 17.5,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 352.0,
-            "theoreticalWins": 12,
-            "theoreticalLosses": 13,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 3.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 4.5,
-            "totalRank": 16.5,
-            "wins": 1,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 396.0,
-            "theoreticalWins": 12,
-            "theoreticalLosses": 15,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 3.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 6.0,
-            "totalRank": 13.0,
-            "wins": 1,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 347.0,
-            "theoreticalWins": 13,
-            "theoreticalLosses": 14,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 8.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 10.0,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 300.0,
-            "theoreticalWins": 6,
-            "theoreticalLosses": 21,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 3.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 2.0,
-            "totalRank": 8.0,
-            "wins": 1,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 326.0,
-            "theoreticalWins": 9,
-            "theoreticalLosses": 18,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 3.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 3.0,
-            "totalRank": 8.0,
-            "wins": 1,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 317.0,
-            "theoreticalWins": 10,
-            "theoreticalLosses": 16,
-            "theoreticalTies": 1
-          }
-        ]
-      },
-      {
-        "week": 4,
-        "managers": [
-          {
-            "manager": "John",
-            "recordRank": 9.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 9.0,
-            "totalRank": 28.5,
-            "wins": 3,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 553.0,
-            "theoreticalWins": 24,
-            "theoreticalLosses": 11,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 9.5,
-            "pointsRank": 8.5,
-            "breakdownRank": 8.0,
-            "totalRank": 26.0,
-            "wins": 3,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 513.0,
-            "theoreticalWins": 23,
-            "theoreticalLosses": 13,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 5.5,
-            "pointsRank": 8.5,
-            "breakdownRank": 10.0,
-            "totalRank": 24.0,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 513.0,
-            "theoreticalWins": 26,
-            "theoreticalLosses": 10,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 5.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 5.5,
-            "totalRank": 18.0,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 502.0,
-            "theoreticalWins": 18,
-            "theoreticalLosses": 18,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 5.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 7.0,
-            "totalRank": 17.5,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 469.0,
-            "theoreticalWins": 19,
-            "theoreticalLosses": 16,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 5.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 5.5,
-            "totalRank": 17.0,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 475.0,
-            "theoreticalWins": 18,
-            "theoreticalLosses": 18,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 1.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 9.5,
-            "wins": 1,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 449.0,
-            "theoreticalWins": 17,
-            "theoreticalLosses": 19,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 5.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 9.5,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 429.0,
-            "theoreticalWins": 12,
-            "theoreticalLosses": 22,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 5.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 7.5,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 390.0,
-            "theoreticalWins": 7,
-            "theoreticalLosses": 29,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 1.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 7.5,
-            "wins": 1,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 431.0,
-            "theoreticalWins": 14,
-            "theoreticalLosses": 22,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 5,
-        "managers": [
-          {
-            "manager": "John",
-            "recordRank": 10.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 30.0,
-            "wins": 4,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 700.0,
-            "theoreticalWins": 33,
-            "theoreticalLosses": 11,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 7.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 7.5,
-            "totalRank": 23.0,
-            "wins": 3,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 618.0,
-            "theoreticalWins": 25,
-            "theoreticalLosses": 20,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 3.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 21.5,
-            "wins": 2,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 628.0,
-            "theoreticalWins": 30,
-            "theoreticalLosses": 15,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 7.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 5.0,
-            "totalRank": 19.5,
-            "wins": 3,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 613.0,
-            "theoreticalWins": 21,
-            "theoreticalLosses": 24,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 7.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 6.0,
-            "totalRank": 18.5,
-            "wins": 3,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 591.0,
-            "theoreticalWins": 24,
-            "theoreticalLosses": 20,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 3.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 7.5,
-            "totalRank": 17.0,
-            "wins": 2,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 592.0,
-            "theoreticalWins": 25,
-            "theoreticalLosses": 20,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 7.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 13.5,
-            "wins": 3,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 563.0,
-            "theoreticalWins": 18,
-            "theoreticalLosses": 25,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 3.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 11.5,
-            "wins": 2,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 571.0,
-            "theoreticalWins": 19,
-            "theoreticalLosses": 26,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 3.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 1.5,
-            "totalRank": 7.0,
-            "wins": 2,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 530.0,
-            "theoreticalWins": 14,
-            "theoreticalLosses": 31,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.5,
-            "totalRank": 3.5,
-            "wins": 1,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 502.0,
-            "theoreticalWins": 14,
-            "theoreticalLosses": 31,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 6,
-        "managers": [
-          {
-            "manager": "John",
-            "recordRank": 10.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 30.0,
-            "wins": 5,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 858.0,
-            "theoreticalWins": 41,
-            "theoreticalLosses": 12,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 8.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 5.5,
-            "totalRank": 23.0,
-            "wins": 4,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 720.0,
-            "theoreticalWins": 25,
-            "theoreticalLosses": 29,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 8.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 5.5,
-            "totalRank": 21.0,
-            "wins": 4,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 716.0,
-            "theoreticalWins": 25,
-            "theoreticalLosses": 27,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 5.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 8.0,
-            "totalRank": 19.5,
-            "wins": 3,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 714.0,
-            "theoreticalWins": 28,
-            "theoreticalLosses": 26,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 2.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 9.0,
-            "totalRank": 19.5,
-            "wins": 2,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 719.0,
-            "theoreticalWins": 32,
-            "theoreticalLosses": 22,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 5.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 7.0,
-            "totalRank": 15.5,
-            "wins": 3,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 675.0,
-            "theoreticalWins": 26,
-            "theoreticalLosses": 28,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 5.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 2.0,
-            "totalRank": 12.5,
-            "wins": 3,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 692.0,
-            "theoreticalWins": 23,
-            "theoreticalLosses": 31,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 5.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 3.5,
-            "totalRank": 11.0,
-            "wins": 3,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 672.0,
-            "theoreticalWins": 24,
-            "theoreticalLosses": 29,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 2.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 3.5,
-            "totalRank": 10.0,
-            "wins": 2,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 691.0,
-            "theoreticalWins": 24,
-            "theoreticalLosses": 30,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 1,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 635.0,
-            "theoreticalWins": 20,
-            "theoreticalLosses": 34,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 7,
-        "managers": [
-          {
-            "manager": "John",
-            "recordRank": 10.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 30.0,
-            "wins": 6,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 1001.0,
-            "theoreticalWins": 49,
-            "theoreticalLosses": 13,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 7.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 25.0,
-            "wins": 4,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 867.0,
-            "theoreticalWins": 37,
-            "theoreticalLosses": 26,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 9.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 4.0,
-            "totalRank": 20.0,
-            "wins": 5,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 831.0,
-            "theoreticalWins": 28,
-            "theoreticalLosses": 35,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 4.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 20.0,
-            "wins": 3,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 834.0,
-            "theoreticalWins": 36,
-            "theoreticalLosses": 26,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 7.0,
-            "pointsRank": 4.5,
-            "breakdownRank": 5.0,
-            "totalRank": 16.5,
-            "wins": 4,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 813.0,
-            "theoreticalWins": 29,
-            "theoreticalLosses": 34,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 2.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 7.0,
-            "totalRank": 15.0,
-            "wins": 2,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 816.0,
-            "theoreticalWins": 31,
-            "theoreticalLosses": 32,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 7.0,
-            "pointsRank": 4.5,
-            "breakdownRank": 3.0,
-            "totalRank": 14.5,
-            "wins": 4,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 813.0,
-            "theoreticalWins": 27,
-            "theoreticalLosses": 34,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 4.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 6.0,
-            "totalRank": 13.0,
-            "wins": 3,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 790.0,
-            "theoreticalWins": 30,
-            "theoreticalLosses": 32,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 4.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 8.0,
-            "wins": 3,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 749.0,
-            "theoreticalWins": 24,
-            "theoreticalLosses": 38,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 1,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 730.0,
-            "theoreticalWins": 21,
-            "theoreticalLosses": 42,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 8,
-        "managers": [
-          {
-            "manager": "John",
-            "recordRank": 9.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.5,
-            "wins": 6,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1101.0,
-            "theoreticalWins": 50,
-            "theoreticalLosses": 21,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 8.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 26.0,
-            "wins": 5,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 989.0,
-            "theoreticalWins": 43,
-            "theoreticalLosses": 29,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 9.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 7.5,
-            "totalRank": 25.0,
-            "wins": 6,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 972.0,
-            "theoreticalWins": 36,
-            "theoreticalLosses": 36,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 5.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 2.5,
-            "totalRank": 15.0,
-            "wins": 4,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 926.0,
-            "theoreticalWins": 31,
-            "theoreticalLosses": 39,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 5.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 6.0,
-            "totalRank": 14.5,
-            "wins": 4,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 909.0,
-            "theoreticalWins": 35,
-            "theoreticalLosses": 36,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 2.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 7.5,
-            "totalRank": 14.0,
-            "wins": 3,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 915.0,
-            "theoreticalWins": 36,
-            "theoreticalLosses": 35,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 2.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 5.0,
-            "totalRank": 13.5,
-            "wins": 3,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 920.0,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 38,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 5.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 2.5,
-            "totalRank": 13.0,
-            "wins": 4,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 916.0,
-            "theoreticalWins": 31,
-            "theoreticalLosses": 41,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 5.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 4.0,
-            "totalRank": 11.5,
-            "wins": 4,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 893.0,
-            "theoreticalWins": 33,
-            "theoreticalLosses": 38,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 1,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 869.0,
-            "theoreticalWins": 28,
-            "theoreticalLosses": 44,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 9,
-        "managers": [
-          {
-            "manager": "John",
-            "recordRank": 9.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.5,
-            "wins": 7,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1231.0,
-            "theoreticalWins": 57,
-            "theoreticalLosses": 23,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 9.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 25.5,
-            "wins": 7,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1088.0,
-            "theoreticalWins": 42,
-            "theoreticalLosses": 39,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 7.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 25.0,
-            "wins": 5,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1133.0,
-            "theoreticalWins": 51,
-            "theoreticalLosses": 30,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 2.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 7.0,
-            "totalRank": 15.5,
-            "wins": 3,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1035.0,
-            "theoreticalWins": 38,
-            "theoreticalLosses": 42,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 7.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 1.0,
-            "totalRank": 15.0,
-            "wins": 5,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1036.0,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 45,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 7.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 4.5,
-            "totalRank": 14.5,
-            "wins": 5,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1016.0,
-            "theoreticalWins": 36,
-            "theoreticalLosses": 44,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 4.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 2.5,
-            "totalRank": 12.0,
-            "wins": 4,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1031.0,
-            "theoreticalWins": 35,
-            "theoreticalLosses": 45,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 1.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 6.0,
-            "totalRank": 11.0,
-            "wins": 2,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1021.0,
-            "theoreticalWins": 37,
-            "theoreticalLosses": 44,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 2.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 4.5,
-            "totalRank": 9.0,
-            "wins": 3,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1008.0,
-            "theoreticalWins": 36,
-            "theoreticalLosses": 44,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 4.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 2.5,
-            "totalRank": 8.0,
-            "wins": 4,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1001.0,
-            "theoreticalWins": 35,
-            "theoreticalLosses": 45,
-            "theoreticalTies": 1
-          }
-        ]
-      },
-      {
-        "week": 10,
-        "managers": [
-          {
-            "manager": "John",
-            "recordRank": 9.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.5,
-            "wins": 8,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1370.0,
-            "theoreticalWins": 65,
-            "theoreticalLosses": 24,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 8.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 26.0,
-            "wins": 6,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1253.0,
-            "theoreticalWins": 54,
-            "theoreticalLosses": 36,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 9.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 25.5,
-            "wins": 8,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1222.0,
-            "theoreticalWins": 49,
-            "theoreticalLosses": 41,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 5.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 7.0,
-            "totalRank": 16.5,
-            "wins": 5,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1141.0,
-            "theoreticalWins": 44,
-            "theoreticalLosses": 45,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 5.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 3.5,
-            "totalRank": 16.0,
-            "wins": 5,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1152.0,
-            "theoreticalWins": 39,
-            "theoreticalLosses": 50,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 5.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 15.5,
-            "wins": 5,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1143.0,
-            "theoreticalWins": 41,
-            "theoreticalLosses": 48,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 1.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 13.0,
-            "wins": 2,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1151.0,
-            "theoreticalWins": 43,
-            "theoreticalLosses": 47,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 5.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 1.5,
-            "totalRank": 10.0,
-            "wins": 5,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1137.0,
-            "theoreticalWins": 36,
-            "theoreticalLosses": 52,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 2.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 3.5,
-            "totalRank": 8.0,
-            "wins": 3,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1134.0,
-            "theoreticalWins": 39,
-            "theoreticalLosses": 50,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 2.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.5,
-            "totalRank": 5.0,
-            "wins": 3,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1101.0,
-            "theoreticalWins": 36,
-            "theoreticalLosses": 53,
-            "theoreticalTies": 1
-          }
-        ]
-      },
-      {
-        "week": 11,
-        "managers": [
-          {
-            "manager": "John",
-            "recordRank": 10.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 30.0,
-            "wins": 9,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1479.0,
-            "theoreticalWins": 70,
-            "theoreticalLosses": 28,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 9.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 8.5,
-            "totalRank": 26.5,
-            "wins": 8,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1351.0,
-            "theoreticalWins": 56,
-            "theoreticalLosses": 43,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 8.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.5,
-            "totalRank": 24.5,
-            "wins": 7,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1347.0,
-            "theoreticalWins": 56,
-            "theoreticalLosses": 43,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 6.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 6.0,
-            "totalRank": 19.5,
-            "wins": 6,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1310.0,
-            "theoreticalWins": 48,
-            "theoreticalLosses": 50,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 6.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 3.0,
-            "totalRank": 15.5,
-            "wins": 6,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1267.0,
-            "theoreticalWins": 44,
-            "theoreticalLosses": 53,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 2.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 7.0,
-            "totalRank": 14.0,
-            "wins": 3,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1261.0,
-            "theoreticalWins": 49,
-            "theoreticalLosses": 50,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 4.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.5,
-            "totalRank": 13.0,
-            "wins": 5,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1247.0,
-            "theoreticalWins": 45,
-            "theoreticalLosses": 53,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 4.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 4.5,
-            "totalRank": 12.0,
-            "wins": 5,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1226.0,
-            "theoreticalWins": 45,
-            "theoreticalLosses": 53,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 2.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 1.5,
-            "totalRank": 5.5,
-            "wins": 3,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1210.0,
-            "theoreticalWins": 39,
-            "theoreticalLosses": 59,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 2.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.5,
-            "totalRank": 4.5,
-            "wins": 3,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1200.0,
-            "theoreticalWins": 39,
-            "theoreticalLosses": 59,
-            "theoreticalTies": 1
-          }
-        ]
-      },
-      {
-        "week": 12,
-        "managers": [
-          {
-            "manager": "John",
-            "recordRank": 10.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 30.0,
-            "wins": 10,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1630.0,
-            "theoreticalWins": 78,
-            "theoreticalLosses": 29,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 9.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 27.0,
-            "wins": 9,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1515.0,
-            "theoreticalWins": 65,
-            "theoreticalLosses": 43,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 7.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 23.5,
-            "wins": 7,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1452.0,
-            "theoreticalWins": 57,
-            "theoreticalLosses": 50,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 7.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 21.5,
-            "wins": 7,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1422.0,
-            "theoreticalWins": 53,
-            "theoreticalLosses": 54,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 5.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 4.0,
-            "totalRank": 15.5,
-            "wins": 6,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1376.0,
-            "theoreticalWins": 48,
-            "theoreticalLosses": 58,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 4.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.5,
-            "totalRank": 14.5,
-            "wins": 5,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1375.0,
-            "theoreticalWins": 52,
-            "theoreticalLosses": 55,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 5.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 11.5,
-            "wins": 6,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1352.0,
-            "theoreticalWins": 46,
-            "theoreticalLosses": 60,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 1.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 5.5,
-            "totalRank": 11.0,
-            "wins": 3,
-            "losses": 9,
-            "ties": 0,
-            "totalPoints": 1368.0,
-            "theoreticalWins": 52,
-            "theoreticalLosses": 56,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 3.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 7.0,
-            "wins": 4,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1341.0,
-            "theoreticalWins": 45,
-            "theoreticalLosses": 62,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 1.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.5,
-            "wins": 3,
-            "losses": 9,
-            "ties": 0,
-            "totalPoints": 1297.0,
-            "theoreticalWins": 39,
-            "theoreticalLosses": 68,
-            "theoreticalTies": 1
-          }
-        ]
-      },
-      {
-        "week": 13,
-        "managers": [
-          {
-            "manager": "John",
-            "recordRank": 10.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 30.0,
-            "wins": 11,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1780.0,
-            "theoreticalWins": 87,
-            "theoreticalLosses": 29,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 9.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 27.0,
-            "wins": 9,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1629.0,
-            "theoreticalWins": 70,
-            "theoreticalLosses": 47,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 7.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 23.5,
-            "wins": 8,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1571.0,
-            "theoreticalWins": 63,
-            "theoreticalLosses": 53,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 7.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 21.5,
-            "wins": 8,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1532.0,
-            "theoreticalWins": 57,
-            "theoreticalLosses": 59,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 6.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 18.0,
-            "wins": 7,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1509.0,
-            "theoreticalWins": 56,
-            "theoreticalLosses": 59,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Ty",
-            "recordRank": 4.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 14.0,
-            "wins": 5,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1484.0,
-            "theoreticalWins": 55,
-            "theoreticalLosses": 61,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 5.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 11.0,
-            "wins": 6,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1449.0,
-            "theoreticalWins": 47,
-            "theoreticalLosses": 68,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 2.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 10.5,
-            "wins": 4,
-            "losses": 9,
-            "ties": 0,
-            "totalPoints": 1466.0,
-            "theoreticalWins": 54,
-            "theoreticalLosses": 63,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 2.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 1.0,
-            "totalRank": 5.5,
-            "wins": 4,
-            "losses": 9,
-            "ties": 0,
-            "totalPoints": 1424.0,
-            "theoreticalWins": 45,
-            "theoreticalLosses": 71,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 2.0,
-            "totalRank": 4.0,
-            "wins": 3,
-            "losses": 10,
-            "ties": 0,
-            "totalPoints": 1422.0,
-            "theoreticalWins": 46,
-            "theoreticalLosses": 70,
-            "theoreticalTies": 1
-          }
-        ]
-      }
-    ],
-    "finalWeek": 13,
-    "finalRankings": [
-      {
-        "manager": "John",
-        "recordRank": 10.0,
-        "pointsRank": 10.0,
-        "breakdownRank": 10.0,
-        "totalRank": 30.0,
-        "wins": 11,
-        "losses": 2,
-        "ties": 0,
-        "totalPoints": 1780.0,
-        "theoreticalWins": 87,
-        "theoreticalLosses": 29,
-        "theoreticalTies": 1
-      },
-      {
-        "manager": "Lanny",
-        "recordRank": 9.0,
-        "pointsRank": 9.0,
-        "breakdownRank": 9.0,
-        "totalRank": 27.0,
-        "wins": 9,
-        "losses": 4,
-        "ties": 0,
-        "totalPoints": 1629.0,
-        "theoreticalWins": 70,
-        "theoreticalLosses": 47,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Ted",
-        "recordRank": 7.5,
-        "pointsRank": 8.0,
-        "breakdownRank": 8.0,
-        "totalRank": 23.5,
-        "wins": 8,
-        "losses": 5,
-        "ties": 0,
-        "totalPoints": 1571.0,
-        "theoreticalWins": 63,
-        "theoreticalLosses": 53,
-        "theoreticalTies": 1
-      },
-      {
-        "manager": "Matt",
-        "recordRank": 7.5,
-        "pointsRank": 7.0,
-        "breakdownRank": 7.0,
-        "totalRank": 21.5,
-        "wins": 8,
-        "losses": 5,
-        "ties": 0,
-        "totalPoints": 1532.0,
-        "theoreticalWins": 57,
-        "theoreticalLosses": 59,
-        "theoreticalTies": 1
-      },
-      {
-        "manager": "Peter",
-        "recordRank": 6.0,
-        "pointsRank": 6.0,
-        "breakdownRank": 6.0,
-        "totalRank": 18.0,
-        "wins": 7,
-        "losses": 6,
-        "ties": 0,
-        "totalPoints": 1509.0,
-        "theoreticalWins": 56,
-        "theoreticalLosses": 59,
-        "theoreticalTies": 2
-      },
-      {
-        "manager": "Ty",
-        "recordRank": 4.0,
-        "pointsRank": 5.0,
-        "breakdownRank": 5.0,
-        "totalRank": 14.0,
-        "wins": 5,
-        "losses": 8,
-        "ties": 0,
-        "totalPoints": 1484.0,
-        "theoreticalWins": 55,
-        "theoreticalLosses": 61,
-        "theoreticalTies": 1
-      },
-      {
-        "manager": "Vernon",
-        "recordRank": 5.0,
-        "pointsRank": 3.0,
-        "breakdownRank": 3.0,
-        "totalRank": 11.0,
-        "wins": 6,
-        "losses": 7,
-        "ties": 0,
-        "totalPoints": 1449.0,
-        "theoreticalWins": 47,
-        "theoreticalLosses": 68,
-        "theoreticalTies": 2
-      },
-      {
-        "manager": "Tyler",
-        "recordRank": 2.5,
-        "pointsRank": 4.0,
-        "breakdownRank": 4.0,
-        "totalRank": 10.5,
-        "wins": 4,
-        "losses": 9,
-        "ties": 0,
-        "totalPoints": 1466.0,
-        "theoreticalWins": 54,
-        "theoreticalLosses": 63,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Ben",
-        "recordRank": 2.5,
-        "pointsRank": 2.0,
-        "breakdownRank": 1.0,
-        "totalRank": 5.5,
-        "wins": 4,
-        "losses": 9,
-        "ties": 0,
-        "totalPoints": 1424.0,
-        "theoreticalWins": 45,
-        "theoreticalLosses": 71,
-        "theoreticalTies": 1
-      },
-      {
-        "manager": "Joey",
-        "recordRank": 1.0,
-        "pointsRank": 1.0,
-        "breakdownRank": 2.0,
-        "totalRank": 4.0,
-        "wins": 3,
-        "losses": 10,
-        "ties": 0,
-        "totalPoints": 1422.0,
-        "theoreticalWins": 46,
-        "theoreticalLosses": 70,
-        "theoreticalTies": 1
-      }
-    ]
-  },
-  "2017": {
-    "weeks": [
-      {
-        "week": 1,
-        "managers": [
-          {
-            "manager": "Tyler",
-            "recordRank": 8.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 141.0,
-            "theoreticalWins": 9,
-            "theoreticalLosses": 0,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 8.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 24.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 107.0,
-            "theoreticalWins": 7,
-            "theoreticalLosses": 2,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 8.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 22.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 99.0,
-            "theoreticalWins": 6,
-            "theoreticalLosses": 3,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 3.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 21.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 123.0,
-            "theoreticalWins": 8,
-            "theoreticalLosses": 1,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 8.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 20.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 87.0,
-            "theoreticalWins": 5,
-            "theoreticalLosses": 4,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 3.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 13.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 86.0,
-            "theoreticalWins": 4,
-            "theoreticalLosses": 5,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 8.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 12.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 61.0,
-            "theoreticalWins": 1,
-            "theoreticalLosses": 8,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 3.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 11.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 81.0,
-            "theoreticalWins": 3,
-            "theoreticalLosses": 6,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 3.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 9.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 71.0,
-            "theoreticalWins": 2,
-            "theoreticalLosses": 7,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 3.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 5.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 57.0,
-            "theoreticalWins": 0,
-            "theoreticalLosses": 9,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 2,
-        "managers": [
-          {
-            "manager": "Tyler",
-            "recordRank": 8.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 9.0,
-            "totalRank": 27.5,
-            "wins": 2,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 248.0,
-            "theoreticalWins": 14,
-            "theoreticalLosses": 4,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 8.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 10.0,
-            "totalRank": 27.5,
-            "wins": 2,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 239.0,
-            "theoreticalWins": 16,
-            "theoreticalLosses": 2,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 8.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.5,
-            "totalRank": 23.0,
-            "wins": 2,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 212.0,
-            "theoreticalWins": 12,
-            "theoreticalLosses": 5,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 8.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 7.5,
-            "totalRank": 22.0,
-            "wins": 2,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 211.0,
-            "theoreticalWins": 12,
-            "theoreticalLosses": 6,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 2.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 5.5,
-            "totalRank": 16.0,
-            "wins": 0,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 215.0,
-            "theoreticalWins": 10,
-            "theoreticalLosses": 8,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 5.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.5,
-            "totalRank": 16.0,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 206.0,
-            "theoreticalWins": 10,
-            "theoreticalLosses": 7,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 2.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 10.5,
-            "wins": 0,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 177.0,
-            "theoreticalWins": 6,
-            "theoreticalLosses": 12,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 2.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 8.5,
-            "wins": 0,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 173.0,
-            "theoreticalWins": 5,
-            "theoreticalLosses": 13,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 5.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 7.5,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 141.0,
-            "theoreticalWins": 1,
-            "theoreticalLosses": 17,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 2.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 6.5,
-            "wins": 0,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 152.0,
-            "theoreticalWins": 3,
-            "theoreticalLosses": 15,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 3,
-        "managers": [
-          {
-            "manager": "Tyler",
-            "recordRank": 9.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 9.5,
-            "totalRank": 28.5,
-            "wins": 3,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 389.0,
-            "theoreticalWins": 21,
-            "theoreticalLosses": 6,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 9.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.5,
-            "totalRank": 27.5,
-            "wins": 3,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 383.0,
-            "theoreticalWins": 21,
-            "theoreticalLosses": 5,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 9.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 7.5,
-            "totalRank": 24.5,
-            "wins": 3,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 363.0,
-            "theoreticalWins": 20,
-            "theoreticalLosses": 7,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 7.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.5,
-            "totalRank": 21.5,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 343.0,
-            "theoreticalWins": 20,
-            "theoreticalLosses": 7,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 5.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 6.0,
-            "totalRank": 15.0,
-            "wins": 1,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 313.0,
-            "theoreticalWins": 15,
-            "theoreticalLosses": 11,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 5.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 4.5,
-            "totalRank": 14.5,
-            "wins": 1,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 317.0,
-            "theoreticalWins": 12,
-            "theoreticalLosses": 15,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 2.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 4.5,
-            "totalRank": 12.5,
-            "wins": 0,
-            "losses": 2,
-            "ties": 1,
-            "totalPoints": 318.0,
-            "theoreticalWins": 12,
-            "theoreticalLosses": 14,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 2.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 8.0,
-            "wins": 0,
-            "losses": 2,
-            "ties": 1,
-            "totalPoints": 276.0,
-            "theoreticalWins": 7,
-            "theoreticalLosses": 19,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 5.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 1.0,
-            "totalRank": 8.0,
-            "wins": 1,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 242.0,
-            "theoreticalWins": 2,
-            "theoreticalLosses": 25,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 2.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 2.0,
-            "totalRank": 5.0,
-            "wins": 0,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 240.0,
-            "theoreticalWins": 3,
-            "theoreticalLosses": 24,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 4,
-        "managers": [
-          {
-            "manager": "Tyler",
-            "recordRank": 10.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 30.0,
-            "wins": 4,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 521.0,
-            "theoreticalWins": 29,
-            "theoreticalLosses": 7,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 8.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 26.5,
-            "wins": 3,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 497.0,
-            "theoreticalWins": 28,
-            "theoreticalLosses": 7,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "John",
-            "recordRank": 5.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 21.5,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 473.0,
-            "theoreticalWins": 24,
-            "theoreticalLosses": 11,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 8.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 6.0,
-            "totalRank": 21.5,
-            "wins": 3,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 447.0,
-            "theoreticalWins": 20,
-            "theoreticalLosses": 16,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 5.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 7.0,
-            "totalRank": 18.5,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 442.0,
-            "theoreticalWins": 23,
-            "theoreticalLosses": 13,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 5.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 15.5,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 426.0,
-            "theoreticalWins": 17,
-            "theoreticalLosses": 19,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 3.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 11.0,
-            "wins": 1,
-            "losses": 2,
-            "ties": 1,
-            "totalPoints": 420.0,
-            "theoreticalWins": 16,
-            "theoreticalLosses": 19,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 5.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 9.5,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 355.0,
-            "theoreticalWins": 8,
-            "theoreticalLosses": 28,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 1.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 7.5,
-            "wins": 0,
-            "losses": 3,
-            "ties": 1,
-            "totalPoints": 373.0,
-            "theoreticalWins": 9,
-            "theoreticalLosses": 26,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 1.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.5,
-            "wins": 0,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 332.0,
-            "theoreticalWins": 4,
-            "theoreticalLosses": 32,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 5,
-        "managers": [
-          {
-            "manager": "Ben",
-            "recordRank": 9.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.0,
-            "wins": 4,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 628.0,
-            "theoreticalWins": 36,
-            "theoreticalLosses": 8,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 10.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 28.0,
-            "wins": 5,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 619.0,
-            "theoreticalWins": 32,
-            "theoreticalLosses": 13,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 5.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 21.0,
-            "wins": 2,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 573.0,
-            "theoreticalWins": 28,
-            "theoreticalLosses": 16,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 7.5,
-            "pointsRank": 4.5,
-            "breakdownRank": 5.5,
-            "totalRank": 17.5,
-            "wins": 3,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 512.0,
-            "theoreticalWins": 21,
-            "theoreticalLosses": 24,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 5.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 7.0,
-            "totalRank": 15.0,
-            "wins": 2,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 497.0,
-            "theoreticalWins": 23,
-            "theoreticalLosses": 22,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 2.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 5.5,
-            "totalRank": 14.5,
-            "wins": 1,
-            "losses": 3,
-            "ties": 1,
-            "totalPoints": 533.0,
-            "theoreticalWins": 21,
-            "theoreticalLosses": 23,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 5.0,
-            "pointsRank": 4.5,
-            "breakdownRank": 4.0,
-            "totalRank": 13.5,
-            "wins": 2,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 512.0,
-            "theoreticalWins": 19,
-            "theoreticalLosses": 26,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 7.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 11.5,
-            "wins": 3,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 480.0,
-            "theoreticalWins": 15,
-            "theoreticalLosses": 30,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 2.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 3.0,
-            "totalRank": 11.0,
-            "wins": 1,
-            "losses": 3,
-            "ties": 1,
-            "totalPoints": 515.0,
-            "theoreticalWins": 18,
-            "theoreticalLosses": 26,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 2.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 4.0,
-            "wins": 1,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 454.0,
-            "theoreticalWins": 10,
-            "theoreticalLosses": 35,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 6,
-        "managers": [
-          {
-            "manager": "Ben",
-            "recordRank": 9.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.0,
-            "wins": 5,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 747.0,
-            "theoreticalWins": 41,
-            "theoreticalLosses": 12,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 10.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 28.0,
-            "wins": 6,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 714.0,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 20,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 7.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 8.0,
-            "totalRank": 22.0,
-            "wins": 3,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 690.0,
-            "theoreticalWins": 32,
-            "theoreticalLosses": 21,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 3.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 7.0,
-            "totalRank": 18.5,
-            "wins": 2,
-            "losses": 3,
-            "ties": 1,
-            "totalPoints": 699.0,
-            "theoreticalWins": 30,
-            "theoreticalLosses": 23,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 7.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 6.0,
-            "totalRank": 18.0,
-            "wins": 3,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 632.0,
-            "theoreticalWins": 27,
-            "theoreticalLosses": 27,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 3.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 4.5,
-            "totalRank": 14.0,
-            "wins": 2,
-            "losses": 3,
-            "ties": 1,
-            "totalPoints": 639.0,
-            "theoreticalWins": 26,
-            "theoreticalLosses": 27,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 7.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 13.0,
-            "wins": 3,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 601.0,
-            "theoreticalWins": 22,
-            "theoreticalLosses": 32,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 3.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.5,
-            "totalRank": 12.0,
-            "wins": 2,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 606.0,
-            "theoreticalWins": 26,
-            "theoreticalLosses": 28,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 3.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 7.5,
-            "wins": 2,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 575.0,
-            "theoreticalWins": 19,
-            "theoreticalLosses": 35,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 1,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 546.0,
-            "theoreticalWins": 11,
-            "theoreticalLosses": 43,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 7,
-        "managers": [
-          {
-            "manager": "Ben",
-            "recordRank": 9.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.0,
-            "wins": 5,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 841.0,
-            "theoreticalWins": 42,
-            "theoreticalLosses": 20,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 10.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 8.5,
-            "totalRank": 27.5,
-            "wins": 7,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 840.0,
-            "theoreticalWins": 41,
-            "theoreticalLosses": 22,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 8.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.5,
-            "totalRank": 24.5,
-            "wins": 4,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 818.0,
-            "theoreticalWins": 41,
-            "theoreticalLosses": 21,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 5.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 19.5,
-            "wins": 3,
-            "losses": 3,
-            "ties": 1,
-            "totalPoints": 809.0,
-            "theoreticalWins": 33,
-            "theoreticalLosses": 29,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 5.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 5.5,
-            "totalRank": 17.0,
-            "wins": 3,
-            "losses": 3,
-            "ties": 1,
-            "totalPoints": 763.0,
-            "theoreticalWins": 32,
-            "theoreticalLosses": 30,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 5.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.5,
-            "totalRank": 16.0,
-            "wins": 3,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 750.0,
-            "theoreticalWins": 32,
-            "theoreticalLosses": 31,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 2.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 10.0,
-            "wins": 2,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 723.0,
-            "theoreticalWins": 30,
-            "theoreticalLosses": 33,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 5.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 3.0,
-            "totalRank": 9.5,
-            "wins": 3,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 671.0,
-            "theoreticalWins": 22,
-            "theoreticalLosses": 41,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 2.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 2.0,
-            "totalRank": 7.0,
-            "wins": 2,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 679.0,
-            "theoreticalWins": 21,
-            "theoreticalLosses": 42,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 2.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 1.0,
-            "totalRank": 5.0,
-            "wins": 2,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 673.0,
-            "theoreticalWins": 19,
-            "theoreticalLosses": 44,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 8,
-        "managers": [
-          {
-            "manager": "John",
-            "recordRank": 8.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.5,
-            "wins": 5,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 992.0,
-            "theoreticalWins": 50,
-            "theoreticalLosses": 21,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 8.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 26.5,
-            "wins": 5,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 958.0,
-            "theoreticalWins": 48,
-            "theoreticalLosses": 23,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 10.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 26.0,
-            "wins": 7,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 932.0,
-            "theoreticalWins": 44,
-            "theoreticalLosses": 28,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 6.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 7.0,
-            "totalRank": 19.0,
-            "wins": 4,
-            "losses": 3,
-            "ties": 1,
-            "totalPoints": 908.0,
-            "theoreticalWins": 40,
-            "theoreticalLosses": 31,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 6.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 5.5,
-            "totalRank": 18.5,
-            "wins": 4,
-            "losses": 3,
-            "ties": 1,
-            "totalPoints": 909.0,
-            "theoreticalWins": 37,
-            "theoreticalLosses": 34,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 6.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.5,
-            "totalRank": 16.5,
-            "wins": 4,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 851.0,
-            "theoreticalWins": 37,
-            "theoreticalLosses": 35,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 3.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 9.5,
-            "wins": 3,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 802.0,
-            "theoreticalWins": 26,
-            "theoreticalLosses": 46,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 1.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 9.5,
-            "wins": 2,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 812.0,
-            "theoreticalWins": 31,
-            "theoreticalLosses": 41,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 3.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 7.5,
-            "wins": 3,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 762.0,
-            "theoreticalWins": 24,
-            "theoreticalLosses": 48,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 1.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.5,
-            "wins": 2,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 744.0,
-            "theoreticalWins": 21,
-            "theoreticalLosses": 51,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 9,
-        "managers": [
-          {
-            "manager": "John",
-            "recordRank": 9.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.0,
-            "wins": 6,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1105.0,
-            "theoreticalWins": 55,
-            "theoreticalLosses": 25,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 10.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 8.0,
-            "totalRank": 27.0,
-            "wins": 7,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1044.0,
-            "theoreticalWins": 48,
-            "theoreticalLosses": 33,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 6.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 9.0,
-            "totalRank": 23.5,
-            "wins": 5,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1043.0,
-            "theoreticalWins": 50,
-            "theoreticalLosses": 30,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 6.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 7.0,
-            "totalRank": 19.5,
-            "wins": 5,
-            "losses": 3,
-            "ties": 1,
-            "totalPoints": 1023.0,
-            "theoreticalWins": 46,
-            "theoreticalLosses": 34,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 6.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 6.0,
-            "totalRank": 19.5,
-            "wins": 5,
-            "losses": 3,
-            "ties": 1,
-            "totalPoints": 1039.0,
-            "theoreticalWins": 45,
-            "theoreticalLosses": 35,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 6.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 16.5,
-            "wins": 5,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 978.0,
-            "theoreticalWins": 44,
-            "theoreticalLosses": 37,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 4.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 10.0,
-            "wins": 4,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 897.0,
-            "theoreticalWins": 33,
-            "theoreticalLosses": 48,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 1.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 9.5,
-            "wins": 2,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 915.0,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 47,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 3.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 7.0,
-            "wins": 3,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 866.0,
-            "theoreticalWins": 26,
-            "theoreticalLosses": 55,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 1.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.5,
-            "wins": 2,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 826.0,
-            "theoreticalWins": 22,
-            "theoreticalLosses": 59,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 10,
-        "managers": [
-          {
-            "manager": "John",
-            "recordRank": 9.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.0,
-            "wins": 7,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1249.0,
-            "theoreticalWins": 64,
-            "theoreticalLosses": 25,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 8.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 24.0,
-            "wins": 6,
-            "losses": 3,
-            "ties": 1,
-            "totalPoints": 1161.0,
-            "theoreticalWins": 53,
-            "theoreticalLosses": 35,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 10.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 22.0,
-            "wins": 8,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1143.0,
-            "theoreticalWins": 51,
-            "theoreticalLosses": 39,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 5.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 7.0,
-            "totalRank": 21.5,
-            "wins": 5,
-            "losses": 4,
-            "ties": 1,
-            "totalPoints": 1177.0,
-            "theoreticalWins": 52,
-            "theoreticalLosses": 36,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 5.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 9.0,
-            "totalRank": 21.5,
-            "wins": 5,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1147.0,
-            "theoreticalWins": 54,
-            "theoreticalLosses": 35,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 5.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 15.5,
-            "wins": 5,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1060.0,
-            "theoreticalWins": 45,
-            "theoreticalLosses": 45,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 5.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 11.5,
-            "wins": 5,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 980.0,
-            "theoreticalWins": 35,
-            "theoreticalLosses": 55,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 1.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 9.0,
-            "wins": 2,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1032.0,
-            "theoreticalWins": 40,
-            "theoreticalLosses": 50,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 2.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 2.0,
-            "totalRank": 5.5,
-            "wins": 3,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 942.0,
-            "theoreticalWins": 27,
-            "theoreticalLosses": 63,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 2.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 1.0,
-            "totalRank": 5.5,
-            "wins": 3,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 946.0,
-            "theoreticalWins": 26,
-            "theoreticalLosses": 64,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 11,
-        "managers": [
-          {
-            "manager": "John",
-            "recordRank": 9.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.5,
-            "wins": 8,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1393.0,
-            "theoreticalWins": 73,
-            "theoreticalLosses": 25,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 7.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 25.5,
-            "wins": 6,
-            "losses": 4,
-            "ties": 1,
-            "totalPoints": 1310.0,
-            "theoreticalWins": 59,
-            "theoreticalLosses": 38,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 9.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 7.5,
-            "totalRank": 25.0,
-            "wins": 8,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1275.0,
-            "theoreticalWins": 57,
-            "theoreticalLosses": 42,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 7.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 19.5,
-            "wins": 6,
-            "losses": 4,
-            "ties": 1,
-            "totalPoints": 1248.0,
-            "theoreticalWins": 54,
-            "theoreticalLosses": 43,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 5.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.5,
-            "totalRank": 19.5,
-            "wins": 5,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1267.0,
-            "theoreticalWins": 57,
-            "theoreticalLosses": 41,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 5.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 15.0,
-            "wins": 5,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1170.0,
-            "theoreticalWins": 47,
-            "theoreticalLosses": 52,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 5.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 3.0,
-            "totalRank": 9.0,
-            "wins": 5,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1050.0,
-            "theoreticalWins": 35,
-            "theoreticalLosses": 64,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 1.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 9.0,
-            "wins": 3,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1163.0,
-            "theoreticalWins": 45,
-            "theoreticalLosses": 54,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 2.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 2.0,
-            "totalRank": 7.5,
-            "wins": 4,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1088.0,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 65,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 2.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 1.0,
-            "totalRank": 5.5,
-            "wins": 4,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1068.0,
-            "theoreticalWins": 31,
-            "theoreticalLosses": 68,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 12,
-        "managers": [
-          {
-            "manager": "John",
-            "recordRank": 10.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 30.0,
-            "wins": 9,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1510.0,
-            "theoreticalWins": 77,
-            "theoreticalLosses": 30,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 9.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 9.0,
-            "totalRank": 26.0,
-            "wins": 8,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1405.0,
-            "theoreticalWins": 63,
-            "theoreticalLosses": 45,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 8.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.5,
-            "totalRank": 22.5,
-            "wins": 7,
-            "losses": 4,
-            "ties": 1,
-            "totalPoints": 1392.0,
-            "theoreticalWins": 62,
-            "theoreticalLosses": 44,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 6.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 6.0,
-            "totalRank": 21.0,
-            "wins": 6,
-            "losses": 5,
-            "ties": 1,
-            "totalPoints": 1420.0,
-            "theoreticalWins": 61,
-            "theoreticalLosses": 44,
-            "theoreticalTies": 3
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 6.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 7.5,
-            "totalRank": 19.5,
-            "wins": 6,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1391.0,
-            "theoreticalWins": 62,
-            "theoreticalLosses": 45,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 6.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 16.0,
-            "wins": 6,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1331.0,
-            "theoreticalWins": 56,
-            "theoreticalLosses": 52,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 2.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 10.0,
-            "wins": 4,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1303.0,
-            "theoreticalWins": 52,
-            "theoreticalLosses": 56,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 2.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 2.5,
-            "totalRank": 7.5,
-            "wins": 4,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1180.0,
-            "theoreticalWins": 35,
-            "theoreticalLosses": 73,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 4.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 2.5,
-            "totalRank": 7.5,
-            "wins": 5,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1113.0,
-            "theoreticalWins": 35,
-            "theoreticalLosses": 73,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 2.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 1.0,
-            "totalRank": 5.0,
-            "wins": 4,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1178.0,
-            "theoreticalWins": 33,
-            "theoreticalLosses": 74,
-            "theoreticalTies": 1
-          }
-        ]
-      },
-      {
-        "week": 13,
-        "managers": [
-          {
-            "manager": "John",
-            "recordRank": 10.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 30.0,
-            "wins": 10,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1651.0,
-            "theoreticalWins": 84,
-            "theoreticalLosses": 31,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 7.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 9.0,
-            "totalRank": 24.0,
-            "wins": 7,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1532.0,
-            "theoreticalWins": 69,
-            "theoreticalLosses": 46,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 9.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 23.0,
-            "wins": 9,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1510.0,
-            "theoreticalWins": 66,
-            "theoreticalLosses": 51,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 5.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 7.0,
-            "totalRank": 21.0,
-            "wins": 6,
-            "losses": 6,
-            "ties": 1,
-            "totalPoints": 1544.0,
-            "theoreticalWins": 66,
-            "theoreticalLosses": 48,
-            "theoreticalTies": 3
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 7.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 7.0,
-            "totalRank": 20.0,
-            "wins": 7,
-            "losses": 5,
-            "ties": 1,
-            "totalPoints": 1502.0,
-            "theoreticalWins": 66,
-            "theoreticalLosses": 49,
-            "theoreticalTies": 2
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 7.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 17.0,
-            "wins": 7,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1478.0,
-            "theoreticalWins": 65,
-            "theoreticalLosses": 52,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 1.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 9.5,
-            "wins": 4,
-            "losses": 9,
-            "ties": 0,
-            "totalPoints": 1400.0,
-            "theoreticalWins": 54,
-            "theoreticalLosses": 63,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 3.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 1.0,
-            "totalRank": 7.5,
-            "wins": 5,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1274.0,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 82,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 3.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 3.0,
-            "totalRank": 7.5,
-            "wins": 5,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1238.0,
-            "theoreticalWins": 41,
-            "theoreticalLosses": 76,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 1.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 5.5,
-            "wins": 4,
-            "losses": 9,
-            "ties": 0,
-            "totalPoints": 1267.0,
-            "theoreticalWins": 35,
-            "theoreticalLosses": 82,
-            "theoreticalTies": 0
-          }
-        ]
-      }
-    ],
-    "finalWeek": 13,
-    "finalRankings": [
-      {
-        "manager": "John",
-        "recordRank": 10.0,
-        "pointsRank": 10.0,
-        "breakdownRank": 10.0,
-        "totalRank": 30.0,
-        "wins": 10,
-        "losses": 3,
-        "ties": 0,
-        "totalPoints": 1651.0,
-        "theoreticalWins": 84,
-        "theoreticalLosses": 31,
-        "theoreticalTies": 2
-      },
-      {
-        "manager": "Ben",
-        "recordRank": 7.0,
-        "pointsRank": 8.0,
-        "breakdownRank": 9.0,
-        "totalRank": 24.0,
-        "wins": 7,
-        "losses": 6,
-        "ties": 0,
-        "totalPoints": 1532.0,
-        "theoreticalWins": 69,
-        "theoreticalLosses": 46,
-        "theoreticalTies": 2
-      },
-      {
-        "manager": "Tyler",
-        "recordRank": 9.0,
-        "pointsRank": 7.0,
-        "breakdownRank": 7.0,
-        "totalRank": 23.0,
-        "wins": 9,
-        "losses": 4,
-        "ties": 0,
-        "totalPoints": 1510.0,
-        "theoreticalWins": 66,
-        "theoreticalLosses": 51,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Vernon",
-        "recordRank": 5.0,
-        "pointsRank": 9.0,
-        "breakdownRank": 7.0,
-        "totalRank": 21.0,
-        "wins": 6,
-        "losses": 6,
-        "ties": 1,
-        "totalPoints": 1544.0,
-        "theoreticalWins": 66,
-        "theoreticalLosses": 48,
-        "theoreticalTies": 3
-      },
-      {
-        "manager": "Matt",
-        "recordRank": 7.0,
-        "pointsRank": 6.0,
-        "breakdownRank": 7.0,
-        "totalRank": 20.0,
-        "wins": 7,
-        "losses": 5,
-        "ties": 1,
-        "totalPoints": 1502.0,
-        "theoreticalWins": 66,
-        "theoreticalLosses": 49,
-        "theoreticalTies": 2
-      },
-      {
-        "manager": "Peter",
-        "recordRank": 7.0,
-        "pointsRank": 5.0,
-        "breakdownRank": 5.0,
-        "totalRank": 17.0,
-        "wins": 7,
-        "losses": 6,
-        "ties": 0,
-        "totalPoints": 1478.0,
-        "theoreticalWins": 65,
-        "theoreticalLosses": 52,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Joey",
-        "recordRank": 1.5,
-        "pointsRank": 4.0,
-        "breakdownRank": 4.0,
-        "totalRank": 9.5,
-        "wins": 4,
-        "losses": 9,
-        "ties": 0,
-        "totalPoints": 1400.0,
-        "theoreticalWins": 54,
-        "theoreticalLosses": 63,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Ted",
-        "recordRank": 3.5,
-        "pointsRank": 3.0,
-        "breakdownRank": 1.0,
-        "totalRank": 7.5,
-        "wins": 5,
-        "losses": 8,
-        "ties": 0,
-        "totalPoints": 1274.0,
-        "theoreticalWins": 34,
-        "theoreticalLosses": 82,
-        "theoreticalTies": 1
-      },
-      {
-        "manager": "Lanny",
-        "recordRank": 3.5,
-        "pointsRank": 1.0,
-        "breakdownRank": 3.0,
-        "totalRank": 7.5,
-        "wins": 5,
-        "losses": 8,
-        "ties": 0,
-        "totalPoints": 1238.0,
-        "theoreticalWins": 41,
-        "theoreticalLosses": 76,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Jason",
-        "recordRank": 1.5,
-        "pointsRank": 2.0,
-        "breakdownRank": 2.0,
-        "totalRank": 5.5,
-        "wins": 4,
-        "losses": 9,
-        "ties": 0,
-        "totalPoints": 1267.0,
-        "theoreticalWins": 35,
-        "theoreticalLosses": 82,
-        "theoreticalTies": 0
-      }
-    ]
-  },
-  "2018": {
-    "weeks": [
-      {
-        "week": 1,
-        "managers": [
-          {
-            "manager": "Tyler",
-            "recordRank": 8.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 205.4,
-            "theoreticalWins": 9,
-            "theoreticalLosses": 0,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 8.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 26.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 165.12,
-            "theoreticalWins": 8,
-            "theoreticalLosses": 1,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 8.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 24.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 155.84,
-            "theoreticalWins": 7,
-            "theoreticalLosses": 2,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 8.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 22.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 152.42,
-            "theoreticalWins": 6,
-            "theoreticalLosses": 3,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 8.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 18.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 119.42,
-            "theoreticalWins": 4,
-            "theoreticalLosses": 5,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 3.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 15.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 121.18,
-            "theoreticalWins": 5,
-            "theoreticalLosses": 4,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 3.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 11.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 117.96,
-            "theoreticalWins": 3,
-            "theoreticalLosses": 6,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 3.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 9.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 116.32,
-            "theoreticalWins": 2,
-            "theoreticalLosses": 7,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 3.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 7.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 109.18,
-            "theoreticalWins": 1,
-            "theoreticalLosses": 8,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 3.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 5.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 100.02,
-            "theoreticalWins": 0,
-            "theoreticalLosses": 9,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 2,
-        "managers": [
-          {
-            "manager": "Tyler",
-            "recordRank": 9.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.5,
-            "wins": 2,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 336.88,
-            "theoreticalWins": 15,
-            "theoreticalLosses": 3,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 9.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 9.0,
-            "totalRank": 22.5,
-            "wins": 2,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 253.9,
-            "theoreticalWins": 11,
-            "theoreticalLosses": 7,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 5.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 7.0,
-            "totalRank": 21.5,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 291.86,
-            "theoreticalWins": 10,
-            "theoreticalLosses": 8,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 5.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 7.0,
-            "totalRank": 20.5,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 281.44,
-            "theoreticalWins": 10,
-            "theoreticalLosses": 8,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 5.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 7.0,
-            "totalRank": 18.5,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 262.26,
-            "theoreticalWins": 10,
-            "theoreticalLosses": 8,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 5.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 4.5,
-            "totalRank": 17.0,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 271.6,
-            "theoreticalWins": 9,
-            "theoreticalLosses": 9,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 5.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 4.5,
-            "totalRank": 15.0,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 261.54,
-            "theoreticalWins": 9,
-            "theoreticalLosses": 9,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 5.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 11.5,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 247.26,
-            "theoreticalWins": 8,
-            "theoreticalLosses": 10,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 1.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 2.0,
-            "totalRank": 4.5,
-            "wins": 0,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 210.6,
-            "theoreticalWins": 5,
-            "theoreticalLosses": 13,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 1.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 1.0,
-            "totalRank": 4.5,
-            "wins": 0,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 227.04,
-            "theoreticalWins": 3,
-            "theoreticalLosses": 15,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 3,
-        "managers": [
-          {
-            "manager": "Tyler",
-            "recordRank": 7.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 27.5,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 484.92,
-            "theoreticalWins": 20,
-            "theoreticalLosses": 7,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 7.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 6.5,
-            "totalRank": 22.0,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 430.12,
-            "theoreticalWins": 16,
-            "theoreticalLosses": 11,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 3.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 21.5,
-            "wins": 1,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 448.42,
-            "theoreticalWins": 18,
-            "theoreticalLosses": 9,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 7.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 8.0,
-            "totalRank": 21.5,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 406.96,
-            "theoreticalWins": 17,
-            "theoreticalLosses": 10,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 7.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 6.5,
-            "totalRank": 21.0,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 421.86,
-            "theoreticalWins": 16,
-            "theoreticalLosses": 11,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 10.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 20.0,
-            "wins": 3,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 364.62,
-            "theoreticalWins": 15,
-            "theoreticalLosses": 12,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 3.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 11.5,
-            "wins": 1,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 361.96,
-            "theoreticalWins": 12,
-            "theoreticalLosses": 15,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 3.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 9.5,
-            "wins": 1,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 354.38,
-            "theoreticalWins": 10,
-            "theoreticalLosses": 17,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 3.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 7.5,
-            "wins": 1,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 320.64,
-            "theoreticalWins": 8,
-            "theoreticalLosses": 19,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 0,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 295.3,
-            "theoreticalWins": 3,
-            "theoreticalLosses": 24,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 4,
-        "managers": [
-          {
-            "manager": "Peter",
-            "recordRank": 8.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.5,
-            "wins": 3,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 616.22,
-            "theoreticalWins": 26,
-            "theoreticalLosses": 10,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 10.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 9.0,
-            "totalRank": 24.0,
-            "wins": 4,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 531.0,
-            "theoreticalWins": 23,
-            "theoreticalLosses": 13,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 5.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 21.5,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 584.28,
-            "theoreticalWins": 21,
-            "theoreticalLosses": 15,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 5.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 6.0,
-            "totalRank": 20.5,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 590.34,
-            "theoreticalWins": 20,
-            "theoreticalLosses": 16,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 8.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 20.5,
-            "wins": 3,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 573.42,
-            "theoreticalWins": 20,
-            "theoreticalLosses": 16,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 2.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 6.0,
-            "totalRank": 15.5,
-            "wins": 1,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 577.06,
-            "theoreticalWins": 20,
-            "theoreticalLosses": 16,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 5.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 13.5,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 522.2,
-            "theoreticalWins": 19,
-            "theoreticalLosses": 17,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 5.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 3.0,
-            "totalRank": 10.5,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 476.48,
-            "theoreticalWins": 14,
-            "theoreticalLosses": 22,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 2.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 2.0,
-            "totalRank": 7.5,
-            "wins": 1,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 503.64,
-            "theoreticalWins": 13,
-            "theoreticalLosses": 23,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 0,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 403.9,
-            "theoreticalWins": 4,
-            "theoreticalLosses": 32,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 5,
-        "managers": [
-          {
-            "manager": "Peter",
-            "recordRank": 9.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.5,
-            "totalRank": 27.5,
-            "wins": 4,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 743.32,
-            "theoreticalWins": 30,
-            "theoreticalLosses": 15,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 6.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 9.5,
-            "totalRank": 25.5,
-            "wins": 3,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 753.42,
-            "theoreticalWins": 30,
-            "theoreticalLosses": 15,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 9.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 23.0,
-            "wins": 4,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 717.32,
-            "theoreticalWins": 28,
-            "theoreticalLosses": 17,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 9.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 8.0,
-            "totalRank": 22.0,
-            "wins": 4,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 672.44,
-            "theoreticalWins": 29,
-            "theoreticalLosses": 16,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 6.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 6.0,
-            "totalRank": 20.0,
-            "wins": 3,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 733.38,
-            "theoreticalWins": 27,
-            "theoreticalLosses": 18,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 6.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 5.0,
-            "totalRank": 15.0,
-            "wins": 3,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 657.46,
-            "theoreticalWins": 24,
-            "theoreticalLosses": 21,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 2.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 4.0,
-            "totalRank": 12.5,
-            "wins": 1,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 684.84,
-            "theoreticalWins": 22,
-            "theoreticalLosses": 23,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 4.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 3.0,
-            "totalRank": 9.0,
-            "wins": 2,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 577.7,
-            "theoreticalWins": 15,
-            "theoreticalLosses": 30,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 2.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 2.0,
-            "totalRank": 7.5,
-            "wins": 1,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 595.3,
-            "theoreticalWins": 13,
-            "theoreticalLosses": 32,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 0,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 521.78,
-            "theoreticalWins": 7,
-            "theoreticalLosses": 38,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 6,
-        "managers": [
-          {
-            "manager": "Peter",
-            "recordRank": 9.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 27.5,
-            "wins": 5,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 885.2,
-            "theoreticalWins": 37,
-            "theoreticalLosses": 17,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 9.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 10.0,
-            "totalRank": 26.5,
-            "wins": 5,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 868.64,
-            "theoreticalWins": 38,
-            "theoreticalLosses": 16,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 7.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 8.0,
-            "totalRank": 25.0,
-            "wins": 4,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 913.16,
-            "theoreticalWins": 35,
-            "theoreticalLosses": 19,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 7.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 7.0,
-            "totalRank": 22.0,
-            "wins": 4,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 883.74,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 20,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 7.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 19.0,
-            "wins": 4,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 810.08,
-            "theoreticalWins": 28,
-            "theoreticalLosses": 26,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 4.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 5.0,
-            "totalRank": 13.5,
-            "wins": 3,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 782.12,
-            "theoreticalWins": 26,
-            "theoreticalLosses": 28,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 2.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 4.0,
-            "totalRank": 11.5,
-            "wins": 1,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 796.34,
-            "theoreticalWins": 23,
-            "theoreticalLosses": 31,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 4.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 3.0,
-            "totalRank": 9.5,
-            "wins": 3,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 718.04,
-            "theoreticalWins": 21,
-            "theoreticalLosses": 33,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 2.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 2.0,
-            "totalRank": 7.5,
-            "wins": 1,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 731.54,
-            "theoreticalWins": 18,
-            "theoreticalLosses": 36,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 0,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 647.86,
-            "theoreticalWins": 10,
-            "theoreticalLosses": 44,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 7,
-        "managers": [
-          {
-            "manager": "Peter",
-            "recordRank": 10.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 30.0,
-            "wins": 6,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 1047.6,
-            "theoreticalWins": 46,
-            "theoreticalLosses": 17,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 8.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 8.0,
-            "totalRank": 25.0,
-            "wins": 5,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1032.96,
-            "theoreticalWins": 39,
-            "theoreticalLosses": 24,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 8.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 9.0,
-            "totalRank": 24.0,
-            "wins": 5,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 993.44,
-            "theoreticalWins": 43,
-            "theoreticalLosses": 20,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 5.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 7.0,
-            "totalRank": 20.5,
-            "wins": 4,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 996.36,
-            "theoreticalWins": 37,
-            "theoreticalLosses": 26,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 8.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 5.5,
-            "totalRank": 17.5,
-            "wins": 5,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 938.46,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 29,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 5.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.5,
-            "totalRank": 16.0,
-            "wins": 4,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 943.02,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 29,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 3.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 4.0,
-            "totalRank": 13.0,
-            "wins": 2,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 954.58,
-            "theoreticalWins": 30,
-            "theoreticalLosses": 33,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 4.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 3.0,
-            "totalRank": 9.0,
-            "wins": 3,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 821.58,
-            "theoreticalWins": 23,
-            "theoreticalLosses": 40,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 2.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 2.0,
-            "totalRank": 7.0,
-            "wins": 1,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 824.1,
-            "theoreticalWins": 18,
-            "theoreticalLosses": 45,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 0,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 741.2,
-            "theoreticalWins": 11,
-            "theoreticalLosses": 52,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 8,
-        "managers": [
-          {
-            "manager": "Peter",
-            "recordRank": 10.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.0,
-            "wins": 7,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 1179.7,
-            "theoreticalWins": 50,
-            "theoreticalLosses": 22,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 8.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 8.0,
-            "totalRank": 26.0,
-            "wins": 6,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1201.34,
-            "theoreticalWins": 46,
-            "theoreticalLosses": 26,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 8.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 9.0,
-            "totalRank": 25.0,
-            "wins": 6,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1140.38,
-            "theoreticalWins": 49,
-            "theoreticalLosses": 23,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 8.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 7.0,
-            "totalRank": 20.0,
-            "wins": 6,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1121.44,
-            "theoreticalWins": 43,
-            "theoreticalLosses": 29,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 6.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 5.5,
-            "totalRank": 18.5,
-            "wins": 5,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1128.62,
-            "theoreticalWins": 42,
-            "theoreticalLosses": 30,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 5.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 5.5,
-            "totalRank": 16.5,
-            "wins": 4,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1124.78,
-            "theoreticalWins": 42,
-            "theoreticalLosses": 30,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 3.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 11.0,
-            "wins": 2,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1074.16,
-            "theoreticalWins": 33,
-            "theoreticalLosses": 39,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 4.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 10.0,
-            "wins": 3,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 940.78,
-            "theoreticalWins": 25,
-            "theoreticalLosses": 47,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 2.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 6.0,
-            "wins": 1,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 916.72,
-            "theoreticalWins": 18,
-            "theoreticalLosses": 54,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 0,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 854.04,
-            "theoreticalWins": 12,
-            "theoreticalLosses": 60,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 9,
-        "managers": [
-          {
-            "manager": "Peter",
-            "recordRank": 10.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.0,
-            "wins": 8,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 1341.04,
-            "theoreticalWins": 59,
-            "theoreticalLosses": 22,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 9.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 9.0,
-            "totalRank": 28.0,
-            "wins": 7,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1357.6,
-            "theoreticalWins": 54,
-            "theoreticalLosses": 27,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 7.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 8.0,
-            "totalRank": 22.0,
-            "wins": 6,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1256.84,
-            "theoreticalWins": 53,
-            "theoreticalLosses": 28,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 7.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 7.0,
-            "totalRank": 22.0,
-            "wins": 6,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1263.32,
-            "theoreticalWins": 48,
-            "theoreticalLosses": 33,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 7.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 19.0,
-            "wins": 6,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1229.16,
-            "theoreticalWins": 45,
-            "theoreticalLosses": 36,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 5.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 15.0,
-            "wins": 4,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1222.1,
-            "theoreticalWins": 42,
-            "theoreticalLosses": 39,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 3.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 11.5,
-            "wins": 3,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1220.94,
-            "theoreticalWins": 40,
-            "theoreticalLosses": 41,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 3.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 9.5,
-            "wins": 3,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1069.2,
-            "theoreticalWins": 30,
-            "theoreticalLosses": 51,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 2.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 6.0,
-            "wins": 2,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1030.48,
-            "theoreticalWins": 21,
-            "theoreticalLosses": 60,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 0,
-            "losses": 9,
-            "ties": 0,
-            "totalPoints": 953.62,
-            "theoreticalWins": 13,
-            "theoreticalLosses": 68,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 10,
-        "managers": [
-          {
-            "manager": "Tyler",
-            "recordRank": 9.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 9.0,
-            "totalRank": 28.5,
-            "wins": 8,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1513.12,
-            "theoreticalWins": 60,
-            "theoreticalLosses": 30,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 9.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.5,
-            "wins": 8,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1474.06,
-            "theoreticalWins": 61,
-            "theoreticalLosses": 29,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 7.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 23.0,
-            "wins": 7,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1410.16,
-            "theoreticalWins": 58,
-            "theoreticalLosses": 32,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 7.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 6.0,
-            "totalRank": 20.0,
-            "wins": 7,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1397.84,
-            "theoreticalWins": 51,
-            "theoreticalLosses": 39,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 7.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 7.0,
-            "totalRank": 19.0,
-            "wins": 7,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1390.94,
-            "theoreticalWins": 53,
-            "theoreticalLosses": 37,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 4.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 5.0,
-            "totalRank": 15.5,
-            "wins": 4,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1396.56,
-            "theoreticalWins": 49,
-            "theoreticalLosses": 41,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 4.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 12.5,
-            "wins": 4,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1296.58,
-            "theoreticalWins": 42,
-            "theoreticalLosses": 48,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 3.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 3.0,
-            "totalRank": 8.0,
-            "wins": 3,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1182.24,
-            "theoreticalWins": 31,
-            "theoreticalLosses": 59,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 2.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 2.0,
-            "totalRank": 7.0,
-            "wins": 2,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1190.92,
-            "theoreticalWins": 28,
-            "theoreticalLosses": 62,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 0,
-            "losses": 10,
-            "ties": 0,
-            "totalPoints": 1101.06,
-            "theoreticalWins": 17,
-            "theoreticalLosses": 73,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 11,
-        "managers": [
-          {
-            "manager": "Tyler",
-            "recordRank": 9.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 9.0,
-            "totalRank": 28.5,
-            "wins": 9,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1669.84,
-            "theoreticalWins": 67,
-            "theoreticalLosses": 32,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 9.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.5,
-            "wins": 9,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1648.58,
-            "theoreticalWins": 70,
-            "theoreticalLosses": 29,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 8.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 8.0,
-            "totalRank": 21.0,
-            "wins": 8,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1531.48,
-            "theoreticalWins": 62,
-            "theoreticalLosses": 37,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 6.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 7.0,
-            "totalRank": 19.5,
-            "wins": 7,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1543.32,
-            "theoreticalWins": 59,
-            "theoreticalLosses": 40,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 5.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 6.0,
-            "totalRank": 19.0,
-            "wins": 5,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1566.98,
-            "theoreticalWins": 57,
-            "theoreticalLosses": 42,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 6.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 5.0,
-            "totalRank": 18.5,
-            "wins": 7,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1547.44,
-            "theoreticalWins": 56,
-            "theoreticalLosses": 43,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 4.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 12.0,
-            "wins": 4,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1404.92,
-            "theoreticalWins": 44,
-            "theoreticalLosses": 55,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 2.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 2.5,
-            "totalRank": 8.0,
-            "wins": 3,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1307.74,
-            "theoreticalWins": 31,
-            "theoreticalLosses": 68,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 2.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.5,
-            "totalRank": 7.0,
-            "wins": 3,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1274.32,
-            "theoreticalWins": 31,
-            "theoreticalLosses": 68,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 0,
-            "losses": 11,
-            "ties": 0,
-            "totalPoints": 1202.32,
-            "theoreticalWins": 18,
-            "theoreticalLosses": 81,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 12,
-        "managers": [
-          {
-            "manager": "Tyler",
-            "recordRank": 10.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 30.0,
-            "wins": 10,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1821.42,
-            "theoreticalWins": 75,
-            "theoreticalLosses": 33,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 9.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 27.0,
-            "wins": 9,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1763.52,
-            "theoreticalWins": 71,
-            "theoreticalLosses": 37,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 7.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 23.5,
-            "wins": 8,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1706.8,
-            "theoreticalWins": 68,
-            "theoreticalLosses": 40,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 7.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 7.0,
-            "totalRank": 19.5,
-            "wins": 8,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1670.04,
-            "theoreticalWins": 67,
-            "theoreticalLosses": 41,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 5.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 6.0,
-            "totalRank": 18.0,
-            "wins": 6,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1706.2,
-            "theoreticalWins": 63,
-            "theoreticalLosses": 45,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 6.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 5.0,
-            "totalRank": 17.0,
-            "wins": 7,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1680.26,
-            "theoreticalWins": 60,
-            "theoreticalLosses": 48,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 3.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 11.5,
-            "wins": 4,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1522.28,
-            "theoreticalWins": 46,
-            "theoreticalLosses": 62,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 3.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 3.0,
-            "totalRank": 8.5,
-            "wins": 4,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1392.0,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 74,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 2.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 2.0,
-            "totalRank": 7.0,
-            "wins": 3,
-            "losses": 9,
-            "ties": 0,
-            "totalPoints": 1414.9,
-            "theoreticalWins": 31,
-            "theoreticalLosses": 77,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 1,
-            "losses": 11,
-            "ties": 0,
-            "totalPoints": 1352.42,
-            "theoreticalWins": 25,
-            "theoreticalLosses": 83,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 13,
-        "managers": [
-          {
-            "manager": "Tyler",
-            "recordRank": 10.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 30.0,
-            "wins": 11,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1958.6,
-            "theoreticalWins": 84,
-            "theoreticalLosses": 33,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 8.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 8.0,
-            "totalRank": 25.0,
-            "wins": 9,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1884.26,
-            "theoreticalWins": 75,
-            "theoreticalLosses": 42,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 8.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 9.0,
-            "totalRank": 25.0,
-            "wins": 9,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1843.24,
-            "theoreticalWins": 76,
-            "theoreticalLosses": 41,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 8.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 7.0,
-            "totalRank": 21.0,
-            "wins": 9,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1798.78,
-            "theoreticalWins": 74,
-            "theoreticalLosses": 43,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 5.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 6.0,
-            "totalRank": 18.0,
-            "wins": 6,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1821.14,
-            "theoreticalWins": 66,
-            "theoreticalLosses": 51,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 6.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 16.0,
-            "wins": 7,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1763.34,
-            "theoreticalWins": 60,
-            "theoreticalLosses": 57,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 2.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 10.5,
-            "wins": 4,
-            "losses": 9,
-            "ties": 0,
-            "totalPoints": 1630.12,
-            "theoreticalWins": 48,
-            "theoreticalLosses": 69,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 4.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 3.0,
-            "totalRank": 9.0,
-            "wins": 5,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1515.86,
-            "theoreticalWins": 40,
-            "theoreticalLosses": 77,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 2.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 2.0,
-            "totalRank": 7.5,
-            "wins": 4,
-            "losses": 9,
-            "ties": 0,
-            "totalPoints": 1536.94,
-            "theoreticalWins": 36,
-            "theoreticalLosses": 81,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 1,
-            "losses": 12,
-            "ties": 0,
-            "totalPoints": 1446.14,
-            "theoreticalWins": 26,
-            "theoreticalLosses": 91,
-            "theoreticalTies": 0
-          }
-        ]
-      }
-    ],
-    "finalWeek": 13,
-    "finalRankings": [
-      {
-        "manager": "Tyler",
-        "recordRank": 10.0,
-        "pointsRank": 10.0,
-        "breakdownRank": 10.0,
-        "totalRank": 30.0,
-        "wins": 11,
-        "losses": 2,
-        "ties": 0,
-        "totalPoints": 1958.6,
-        "theoreticalWins": 84,
-        "theoreticalLosses": 33,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Peter",
-        "recordRank": 8.0,
-        "pointsRank": 9.0,
-        "breakdownRank": 8.0,
-        "totalRank": 25.0,
-        "wins": 9,
-        "losses": 4,
-        "ties": 0,
-        "totalPoints": 1884.26,
-        "theoreticalWins": 75,
-        "theoreticalLosses": 42,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Ted",
-        "recordRank": 8.0,
-        "pointsRank": 8.0,
-        "breakdownRank": 9.0,
-        "totalRank": 25.0,
-        "wins": 9,
-        "losses": 4,
-        "ties": 0,
-        "totalPoints": 1843.24,
-        "theoreticalWins": 76,
-        "theoreticalLosses": 41,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Matt",
-        "recordRank": 8.0,
-        "pointsRank": 6.0,
-        "breakdownRank": 7.0,
-        "totalRank": 21.0,
-        "wins": 9,
-        "losses": 4,
-        "ties": 0,
-        "totalPoints": 1798.78,
-        "theoreticalWins": 74,
-        "theoreticalLosses": 43,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Jason",
-        "recordRank": 5.0,
-        "pointsRank": 7.0,
-        "breakdownRank": 6.0,
-        "totalRank": 18.0,
-        "wins": 6,
-        "losses": 7,
-        "ties": 0,
-        "totalPoints": 1821.14,
-        "theoreticalWins": 66,
-        "theoreticalLosses": 51,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "John",
-        "recordRank": 6.0,
-        "pointsRank": 5.0,
-        "breakdownRank": 5.0,
-        "totalRank": 16.0,
-        "wins": 7,
-        "losses": 6,
-        "ties": 0,
-        "totalPoints": 1763.34,
-        "theoreticalWins": 60,
-        "theoreticalLosses": 57,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Vernon",
-        "recordRank": 2.5,
-        "pointsRank": 4.0,
-        "breakdownRank": 4.0,
-        "totalRank": 10.5,
-        "wins": 4,
-        "losses": 9,
-        "ties": 0,
-        "totalPoints": 1630.12,
-        "theoreticalWins": 48,
-        "theoreticalLosses": 69,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Ben",
-        "recordRank": 4.0,
-        "pointsRank": 2.0,
-        "breakdownRank": 3.0,
-        "totalRank": 9.0,
-        "wins": 5,
-        "losses": 8,
-        "ties": 0,
-        "totalPoints": 1515.86,
-        "theoreticalWins": 40,
-        "theoreticalLosses": 77,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Lanny",
-        "recordRank": 2.5,
-        "pointsRank": 3.0,
-        "breakdownRank": 2.0,
-        "totalRank": 7.5,
-        "wins": 4,
-        "losses": 9,
-        "ties": 0,
-        "totalPoints": 1536.94,
-        "theoreticalWins": 36,
-        "theoreticalLosses": 81,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Joey",
-        "recordRank": 1.0,
-        "pointsRank": 1.0,
-        "breakdownRank": 1.0,
-        "totalRank": 3.0,
-        "wins": 1,
-        "losses": 12,
-        "ties": 0,
-        "totalPoints": 1446.14,
-        "theoreticalWins": 26,
-        "theoreticalLosses": 91,
-        "theoreticalTies": 0
-      }
-    ]
-  },
-  "2019": {
-    "weeks": [
-      {
-        "week": 1,
-        "managers": [
-          {
-            "manager": "Ted",
-            "recordRank": 8.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 185.96,
-            "theoreticalWins": 9,
-            "theoreticalLosses": 0,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 8.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 26.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 143.24,
-            "theoreticalWins": 8,
-            "theoreticalLosses": 1,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 8.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 22.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 137.34,
-            "theoreticalWins": 6,
-            "theoreticalLosses": 3,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 8.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 20.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 135.46,
-            "theoreticalWins": 5,
-            "theoreticalLosses": 4,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 3.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 19.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 141.96,
-            "theoreticalWins": 7,
-            "theoreticalLosses": 2,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 8.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 18.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 129.88,
-            "theoreticalWins": 4,
-            "theoreticalLosses": 5,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 3.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 11.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 122.08,
-            "theoreticalWins": 3,
-            "theoreticalLosses": 6,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 3.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 9.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 112.74,
-            "theoreticalWins": 2,
-            "theoreticalLosses": 7,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 3.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 7.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 99.42,
-            "theoreticalWins": 1,
-            "theoreticalLosses": 8,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 3.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 5.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 94.48,
-            "theoreticalWins": 0,
-            "theoreticalLosses": 9,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 2,
-        "managers": [
-          {
-            "manager": "Vernon",
-            "recordRank": 5.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 25.5,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 314.52,
-            "theoreticalWins": 16,
-            "theoreticalLosses": 2,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 9.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 25.0,
-            "wins": 2,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 292.14,
-            "theoreticalWins": 13,
-            "theoreticalLosses": 5,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 5.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 23.5,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 304.5,
-            "theoreticalWins": 14,
-            "theoreticalLosses": 4,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 9.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 23.0,
-            "wins": 2,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 258.42,
-            "theoreticalWins": 12,
-            "theoreticalLosses": 6,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 9.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 5.0,
-            "totalRank": 20.0,
-            "wins": 2,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 233.42,
-            "theoreticalWins": 7,
-            "theoreticalLosses": 11,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 5.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 15.5,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 228.14,
-            "theoreticalWins": 7,
-            "theoreticalLosses": 11,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 5.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 3.0,
-            "totalRank": 12.5,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 222.44,
-            "theoreticalWins": 6,
-            "theoreticalLosses": 12,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 2.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 5.0,
-            "totalRank": 10.0,
-            "wins": 0,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 219.08,
-            "theoreticalWins": 7,
-            "theoreticalLosses": 11,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 2.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 1.5,
-            "totalRank": 5.5,
-            "wins": 0,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 214.64,
-            "theoreticalWins": 4,
-            "theoreticalLosses": 14,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 2.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.5,
-            "totalRank": 4.5,
-            "wins": 0,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 212.92,
-            "theoreticalWins": 4,
-            "theoreticalLosses": 14,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 3,
-        "managers": [
-          {
-            "manager": "Peter",
-            "recordRank": 9.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.5,
-            "wins": 3,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 463.48,
-            "theoreticalWins": 22,
-            "theoreticalLosses": 5,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 7.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 25.0,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 442.72,
-            "theoreticalWins": 21,
-            "theoreticalLosses": 6,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 9.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 8.0,
-            "totalRank": 24.5,
-            "wins": 3,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 401.64,
-            "theoreticalWins": 19,
-            "theoreticalLosses": 8,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 4.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 7.0,
-            "totalRank": 19.0,
-            "wins": 1,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 429.52,
-            "theoreticalWins": 17,
-            "theoreticalLosses": 10,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 7.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 19.0,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 383.5,
-            "theoreticalWins": 15,
-            "theoreticalLosses": 12,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 7.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 17.0,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 361.06,
-            "theoreticalWins": 11,
-            "theoreticalLosses": 16,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 4.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 12.0,
-            "wins": 1,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 351.7,
-            "theoreticalWins": 10,
-            "theoreticalLosses": 17,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 4.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 2.5,
-            "totalRank": 9.5,
-            "wins": 1,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 328.68,
-            "theoreticalWins": 7,
-            "theoreticalLosses": 20,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 1.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 2.5,
-            "totalRank": 5.0,
-            "wins": 0,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 314.8,
-            "theoreticalWins": 7,
-            "theoreticalLosses": 20,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 1.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 1.0,
-            "totalRank": 4.5,
-            "wins": 0,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 327.42,
-            "theoreticalWins": 6,
-            "theoreticalLosses": 21,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 4,
-        "managers": [
-          {
-            "manager": "Peter",
-            "recordRank": 10.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 30.0,
-            "wins": 4,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 591.5,
-            "theoreticalWins": 28,
-            "theoreticalLosses": 8,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 5.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 9.0,
-            "totalRank": 22.5,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 532.52,
-            "theoreticalWins": 23,
-            "theoreticalLosses": 13,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 8.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 6.0,
-            "totalRank": 21.0,
-            "wins": 3,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 512.68,
-            "theoreticalWins": 19,
-            "theoreticalLosses": 17,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 3.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 8.0,
-            "totalRank": 20.0,
-            "wins": 1,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 548.0,
-            "theoreticalWins": 22,
-            "theoreticalLosses": 14,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 8.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 6.0,
-            "totalRank": 19.0,
-            "wins": 3,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 474.66,
-            "theoreticalWins": 19,
-            "theoreticalLosses": 17,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 5.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 17.5,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 507.68,
-            "theoreticalWins": 19,
-            "theoreticalLosses": 17,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 8.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 16.0,
-            "wins": 3,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 474.44,
-            "theoreticalWins": 18,
-            "theoreticalLosses": 18,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 3.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 9.0,
-            "wins": 1,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 457.5,
-            "theoreticalWins": 14,
-            "theoreticalLosses": 22,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 3.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 7.0,
-            "wins": 1,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 428.48,
-            "theoreticalWins": 11,
-            "theoreticalLosses": 25,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 0,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 413.06,
-            "theoreticalWins": 7,
-            "theoreticalLosses": 29,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 5,
-        "managers": [
-          {
-            "manager": "Peter",
-            "recordRank": 9.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 9.0,
-            "totalRank": 26.5,
-            "wins": 4,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 711.52,
-            "theoreticalWins": 31,
-            "theoreticalLosses": 14,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 6.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 24.5,
-            "wins": 3,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 733.84,
-            "theoreticalWins": 31,
-            "theoreticalLosses": 14,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 3.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 9.0,
-            "totalRank": 22.5,
-            "wins": 2,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 756.98,
-            "theoreticalWins": 31,
-            "theoreticalLosses": 14,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 6.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 20.5,
-            "wins": 3,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 658.56,
-            "theoreticalWins": 25,
-            "theoreticalLosses": 20,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 9.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 6.0,
-            "totalRank": 20.5,
-            "wins": 4,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 620.34,
-            "theoreticalWins": 23,
-            "theoreticalLosses": 22,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 6.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 4.5,
-            "totalRank": 14.0,
-            "wins": 3,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 590.84,
-            "theoreticalWins": 21,
-            "theoreticalLosses": 24,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 3.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 4.5,
-            "totalRank": 14.0,
-            "wins": 2,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 628.14,
-            "theoreticalWins": 21,
-            "theoreticalLosses": 24,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 6.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 3.0,
-            "totalRank": 13.5,
-            "wins": 3,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 615.24,
-            "theoreticalWins": 20,
-            "theoreticalLosses": 25,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 2.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 6.0,
-            "wins": 1,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 550.82,
-            "theoreticalWins": 15,
-            "theoreticalLosses": 30,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 0,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 497.96,
-            "theoreticalWins": 7,
-            "theoreticalLosses": 38,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 6,
-        "managers": [
-          {
-            "manager": "Vernon",
-            "recordRank": 8.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 10.0,
-            "totalRank": 27.0,
-            "wins": 4,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 903.4,
-            "theoreticalWins": 40,
-            "theoreticalLosses": 14,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 8.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 24.0,
-            "wins": 4,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 828.64,
-            "theoreticalWins": 35,
-            "theoreticalLosses": 19,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 4.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 9.0,
-            "totalRank": 23.5,
-            "wins": 3,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 909.32,
-            "theoreticalWins": 37,
-            "theoreticalLosses": 17,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 8.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 22.0,
-            "wins": 4,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 797.82,
-            "theoreticalWins": 30,
-            "theoreticalLosses": 24,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 8.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 20.0,
-            "wins": 4,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 768.88,
-            "theoreticalWins": 27,
-            "theoreticalLosses": 27,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 8.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.5,
-            "totalRank": 16.5,
-            "wins": 4,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 714.86,
-            "theoreticalWins": 24,
-            "theoreticalLosses": 30,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 4.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 4.5,
-            "totalRank": 12.0,
-            "wins": 3,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 695.8,
-            "theoreticalWins": 24,
-            "theoreticalLosses": 30,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 3.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 3.0,
-            "totalRank": 11.0,
-            "wins": 2,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 729.8,
-            "theoreticalWins": 23,
-            "theoreticalLosses": 31,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 1.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 1.5,
-            "totalRank": 5.0,
-            "wins": 1,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 655.06,
-            "theoreticalWins": 15,
-            "theoreticalLosses": 39,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 1.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.5,
-            "totalRank": 4.0,
-            "wins": 1,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 622.28,
-            "theoreticalWins": 15,
-            "theoreticalLosses": 39,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 7,
-        "managers": [
-          {
-            "manager": "Vernon",
-            "recordRank": 8.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.5,
-            "wins": 5,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1017.42,
-            "theoreticalWins": 46,
-            "theoreticalLosses": 17,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 8.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 9.0,
-            "totalRank": 25.5,
-            "wins": 5,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1004.22,
-            "theoreticalWins": 44,
-            "theoreticalLosses": 19,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 5.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 8.0,
-            "totalRank": 22.5,
-            "wins": 4,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1013.46,
-            "theoreticalWins": 39,
-            "theoreticalLosses": 24,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 8.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 7.0,
-            "totalRank": 21.5,
-            "wins": 5,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 905.42,
-            "theoreticalWins": 35,
-            "theoreticalLosses": 28,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 8.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 6.0,
-            "totalRank": 21.5,
-            "wins": 5,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 906.42,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 29,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 5.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 13.5,
-            "wins": 4,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 820.64,
-            "theoreticalWins": 27,
-            "theoreticalLosses": 36,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 3.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 13.0,
-            "wins": 2,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 850.24,
-            "theoreticalWins": 30,
-            "theoreticalLosses": 33,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 4.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 10.0,
-            "wins": 3,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 780.6,
-            "theoreticalWins": 24,
-            "theoreticalLosses": 39,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 1.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 5.5,
-            "wins": 1,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 768.2,
-            "theoreticalWins": 20,
-            "theoreticalLosses": 43,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 1.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.5,
-            "wins": 1,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 720.9,
-            "theoreticalWins": 16,
-            "theoreticalLosses": 47,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 8,
-        "managers": [
-          {
-            "manager": "Vernon",
-            "recordRank": 7.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 9.5,
-            "totalRank": 26.5,
-            "wins": 5,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1165.3,
-            "theoreticalWins": 51,
-            "theoreticalLosses": 21,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 7.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 9.5,
-            "totalRank": 24.5,
-            "wins": 5,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1152.4,
-            "theoreticalWins": 51,
-            "theoreticalLosses": 21,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 7.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 8.0,
-            "totalRank": 24.0,
-            "wins": 5,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1163.7,
-            "theoreticalWins": 47,
-            "theoreticalLosses": 25,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 10.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.5,
-            "totalRank": 22.5,
-            "wins": 6,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1040.42,
-            "theoreticalWins": 38,
-            "theoreticalLosses": 34,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 7.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 6.5,
-            "totalRank": 20.5,
-            "wins": 5,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1048.9,
-            "theoreticalWins": 38,
-            "theoreticalLosses": 34,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 7.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 5.0,
-            "totalRank": 16.0,
-            "wins": 5,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 971.06,
-            "theoreticalWins": 36,
-            "theoreticalLosses": 36,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 3.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 4.0,
-            "totalRank": 12.5,
-            "wins": 3,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 982.24,
-            "theoreticalWins": 32,
-            "theoreticalLosses": 40,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 3.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 9.5,
-            "wins": 3,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 890.88,
-            "theoreticalWins": 24,
-            "theoreticalLosses": 48,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 2.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 2.0,
-            "totalRank": 5.0,
-            "wins": 2,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 868.84,
-            "theoreticalWins": 22,
-            "theoreticalLosses": 50,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 1.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 1.0,
-            "totalRank": 4.0,
-            "wins": 1,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 880.2,
-            "theoreticalWins": 21,
-            "theoreticalLosses": 51,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 9,
-        "managers": [
-          {
-            "manager": "Peter",
-            "recordRank": 8.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 10.0,
-            "totalRank": 27.0,
-            "wins": 6,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1310.7,
-            "theoreticalWins": 60,
-            "theoreticalLosses": 21,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 8.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 8.5,
-            "totalRank": 26.5,
-            "wins": 6,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1318.66,
-            "theoreticalWins": 54,
-            "theoreticalLosses": 27,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 10.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 6.0,
-            "totalRank": 23.0,
-            "wins": 7,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1154.88,
-            "theoreticalWins": 40,
-            "theoreticalLosses": 41,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 5.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.5,
-            "totalRank": 22.0,
-            "wins": 5,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1280.54,
-            "theoreticalWins": 54,
-            "theoreticalLosses": 27,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 8.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 7.0,
-            "totalRank": 19.0,
-            "wins": 6,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1111.66,
-            "theoreticalWins": 42,
-            "theoreticalLosses": 39,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 5.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 5.0,
-            "totalRank": 16.5,
-            "wins": 5,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1137.6,
-            "theoreticalWins": 39,
-            "theoreticalLosses": 42,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 3.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 4.0,
-            "totalRank": 12.0,
-            "wins": 3,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1117.32,
-            "theoreticalWins": 37,
-            "theoreticalLosses": 44,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 4.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 10.0,
-            "wins": 4,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1046.26,
-            "theoreticalWins": 32,
-            "theoreticalLosses": 49,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 1.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 5.0,
-            "wins": 1,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 998.86,
-            "theoreticalWins": 25,
-            "theoreticalLosses": 56,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 2.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 4.0,
-            "wins": 2,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 945.9,
-            "theoreticalWins": 22,
-            "theoreticalLosses": 59,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 10,
-        "managers": [
-          {
-            "manager": "Peter",
-            "recordRank": 8.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 10.0,
-            "totalRank": 27.0,
-            "wins": 7,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1439.78,
-            "theoreticalWins": 65,
-            "theoreticalLosses": 24,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 8.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 9.0,
-            "totalRank": 27.0,
-            "wins": 7,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1481.66,
-            "theoreticalWins": 63,
-            "theoreticalLosses": 27,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 10.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 4.5,
-            "totalRank": 21.5,
-            "wins": 8,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1264.5,
-            "theoreticalWins": 42,
-            "theoreticalLosses": 48,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 5.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 21.5,
-            "wins": 5,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1404.9,
-            "theoreticalWins": 58,
-            "theoreticalLosses": 32,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 8.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 7.0,
-            "totalRank": 19.0,
-            "wins": 7,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1250.22,
-            "theoreticalWins": 50,
-            "theoreticalLosses": 40,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 5.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 4.5,
-            "totalRank": 16.0,
-            "wins": 5,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1255.88,
-            "theoreticalWins": 42,
-            "theoreticalLosses": 48,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 3.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 6.0,
-            "totalRank": 14.5,
-            "wins": 4,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1251.08,
-            "theoreticalWins": 44,
-            "theoreticalLosses": 46,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 3.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 9.5,
-            "wins": 4,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1144.16,
-            "theoreticalWins": 32,
-            "theoreticalLosses": 58,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 2.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 2.0,
-            "totalRank": 5.0,
-            "wins": 2,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1074.98,
-            "theoreticalWins": 27,
-            "theoreticalLosses": 62,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 1.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 1.0,
-            "totalRank": 4.0,
-            "wins": 1,
-            "losses": 9,
-            "ties": 0,
-            "totalPoints": 1107.28,
-            "theoreticalWins": 26,
-            "theoreticalLosses": 64,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 11,
-        "managers": [
-          {
-            "manager": "Peter",
-            "recordRank": 8.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.5,
-            "wins": 8,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1566.9,
-            "theoreticalWins": 72,
-            "theoreticalLosses": 26,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 7.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 25.0,
-            "wins": 7,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1566.72,
-            "theoreticalWins": 64,
-            "theoreticalLosses": 35,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 10.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 6.0,
-            "totalRank": 23.0,
-            "wins": 9,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1417.86,
-            "theoreticalWins": 51,
-            "theoreticalLosses": 48,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 8.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 7.0,
-            "totalRank": 21.5,
-            "wins": 8,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1371.72,
-            "theoreticalWins": 56,
-            "theoreticalLosses": 43,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 5.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 21.0,
-            "wins": 5,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1515.9,
-            "theoreticalWins": 62,
-            "theoreticalLosses": 37,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 5.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 13.0,
-            "wins": 5,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1343.26,
-            "theoreticalWins": 44,
-            "theoreticalLosses": 55,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 3.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 13.0,
-            "wins": 4,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1354.14,
-            "theoreticalWins": 47,
-            "theoreticalLosses": 52,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 5.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 11.0,
-            "wins": 5,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1261.62,
-            "theoreticalWins": 37,
-            "theoreticalLosses": 62,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 2.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 6.0,
-            "wins": 3,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1204.7,
-            "theoreticalWins": 35,
-            "theoreticalLosses": 63,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 1,
-            "losses": 10,
-            "ties": 0,
-            "totalPoints": 1191.26,
-            "theoreticalWins": 26,
-            "theoreticalLosses": 73,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 12,
-        "managers": [
-          {
-            "manager": "Peter",
-            "recordRank": 8.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.0,
-            "wins": 8,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1691.6,
-            "theoreticalWins": 78,
-            "theoreticalLosses": 29,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 7.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 25.0,
-            "wins": 7,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1690.3,
-            "theoreticalWins": 68,
-            "theoreticalLosses": 40,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 10.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 6.0,
-            "totalRank": 23.0,
-            "wins": 10,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1564.24,
-            "theoreticalWins": 58,
-            "theoreticalLosses": 50,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 9.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 7.0,
-            "totalRank": 21.0,
-            "wins": 9,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1484.92,
-            "theoreticalWins": 59,
-            "theoreticalLosses": 49,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 4.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 20.0,
-            "wins": 5,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1592.62,
-            "theoreticalWins": 62,
-            "theoreticalLosses": 46,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 4.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 5.0,
-            "totalRank": 15.0,
-            "wins": 5,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1529.38,
-            "theoreticalWins": 56,
-            "theoreticalLosses": 52,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 6.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 14.0,
-            "wins": 6,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1467.26,
-            "theoreticalWins": 49,
-            "theoreticalLosses": 59,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 4.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 2.0,
-            "totalRank": 9.0,
-            "wins": 5,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1359.86,
-            "theoreticalWins": 38,
-            "theoreticalLosses": 70,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 2.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 3.0,
-            "totalRank": 7.0,
-            "wins": 4,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1355.54,
-            "theoreticalWins": 43,
-            "theoreticalLosses": 64,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 1,
-            "losses": 11,
-            "ties": 0,
-            "totalPoints": 1298.68,
-            "theoreticalWins": 28,
-            "theoreticalLosses": 80,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 13,
-        "managers": [
-          {
-            "manager": "Peter",
-            "recordRank": 7.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 10.0,
-            "totalRank": 26.5,
-            "wins": 8,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1819.98,
-            "theoreticalWins": 83,
-            "theoreticalLosses": 33,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 7.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 9.0,
-            "totalRank": 26.5,
-            "wins": 8,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1851.6,
-            "theoreticalWins": 77,
-            "theoreticalLosses": 40,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 10.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 24.0,
-            "wins": 10,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1692.84,
-            "theoreticalWins": 64,
-            "theoreticalLosses": 53,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 3.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 19.0,
-            "wins": 5,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1707.1,
-            "theoreticalWins": 65,
-            "theoreticalLosses": 52,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 9.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 6.0,
-            "totalRank": 19.0,
-            "wins": 9,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1583.14,
-            "theoreticalWins": 60,
-            "theoreticalLosses": 57,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 6.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 4.5,
-            "totalRank": 15.5,
-            "wins": 7,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1596.58,
-            "theoreticalWins": 56,
-            "theoreticalLosses": 61,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 3.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 4.5,
-            "totalRank": 13.5,
-            "wins": 5,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1615.5,
-            "theoreticalWins": 56,
-            "theoreticalLosses": 61,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 3.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 9.0,
-            "wins": 5,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1473.3,
-            "theoreticalWins": 47,
-            "theoreticalLosses": 69,
-            "theoreticalTies": 1
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 5.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 9.0,
-            "wins": 6,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1472.46,
-            "theoreticalWins": 40,
-            "theoreticalLosses": 77,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 2,
-            "losses": 11,
-            "ties": 0,
-            "totalPoints": 1428.7,
-            "theoreticalWins": 36,
-            "theoreticalLosses": 81,
-            "theoreticalTies": 0
-          }
-        ]
-      }
-    ],
-    "finalWeek": 13,
-    "finalRankings": [
-      {
-        "manager": "Peter",
-        "recordRank": 7.5,
-        "pointsRank": 9.0,
-        "breakdownRank": 10.0,
-        "totalRank": 26.5,
-        "wins": 8,
-        "losses": 5,
-        "ties": 0,
-        "totalPoints": 1819.98,
-        "theoreticalWins": 83,
-        "theoreticalLosses": 33,
-        "theoreticalTies": 1
-      },
-      {
-        "manager": "Ted",
-        "recordRank": 7.5,
-        "pointsRank": 10.0,
-        "breakdownRank": 9.0,
-        "totalRank": 26.5,
-        "wins": 8,
-        "losses": 5,
-        "ties": 0,
-        "totalPoints": 1851.6,
-        "theoreticalWins": 77,
-        "theoreticalLosses": 40,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Jason",
-        "recordRank": 10.0,
-        "pointsRank": 7.0,
-        "breakdownRank": 7.0,
-        "totalRank": 24.0,
-        "wins": 10,
-        "losses": 3,
-        "ties": 0,
-        "totalPoints": 1692.84,
-        "theoreticalWins": 64,
-        "theoreticalLosses": 53,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Vernon",
-        "recordRank": 3.0,
-        "pointsRank": 8.0,
-        "breakdownRank": 8.0,
-        "totalRank": 19.0,
-        "wins": 5,
-        "losses": 8,
-        "ties": 0,
-        "totalPoints": 1707.1,
-        "theoreticalWins": 65,
-        "theoreticalLosses": 52,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Joey",
-        "recordRank": 9.0,
-        "pointsRank": 4.0,
-        "breakdownRank": 6.0,
-        "totalRank": 19.0,
-        "wins": 9,
-        "losses": 4,
-        "ties": 0,
-        "totalPoints": 1583.14,
-        "theoreticalWins": 60,
-        "theoreticalLosses": 57,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Ben",
-        "recordRank": 6.0,
-        "pointsRank": 5.0,
-        "breakdownRank": 4.5,
-        "totalRank": 15.5,
-        "wins": 7,
-        "losses": 6,
-        "ties": 0,
-        "totalPoints": 1596.58,
-        "theoreticalWins": 56,
-        "theoreticalLosses": 61,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "John",
-        "recordRank": 3.0,
-        "pointsRank": 6.0,
-        "breakdownRank": 4.5,
-        "totalRank": 13.5,
-        "wins": 5,
-        "losses": 8,
-        "ties": 0,
-        "totalPoints": 1615.5,
-        "theoreticalWins": 56,
-        "theoreticalLosses": 61,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Matt",
-        "recordRank": 3.0,
-        "pointsRank": 3.0,
-        "breakdownRank": 3.0,
-        "totalRank": 9.0,
-        "wins": 5,
-        "losses": 8,
-        "ties": 0,
-        "totalPoints": 1473.3,
-        "theoreticalWins": 47,
-        "theoreticalLosses": 69,
-        "theoreticalTies": 1
-      },
-      {
-        "manager": "Tyler",
-        "recordRank": 5.0,
-        "pointsRank": 2.0,
-        "breakdownRank": 2.0,
-        "totalRank": 9.0,
-        "wins": 6,
-        "losses": 7,
-        "ties": 0,
-        "totalPoints": 1472.46,
-        "theoreticalWins": 40,
-        "theoreticalLosses": 77,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Lanny",
-        "recordRank": 1.0,
-        "pointsRank": 1.0,
-        "breakdownRank": 1.0,
-        "totalRank": 3.0,
-        "wins": 2,
-        "losses": 11,
-        "ties": 0,
-        "totalPoints": 1428.7,
-        "theoreticalWins": 36,
-        "theoreticalLosses": 81,
-        "theoreticalTies": 0
-      }
-    ]
-  },
-  "2020": {
-    "weeks": [
-      {
-        "week": 1,
-        "managers": [
-          {
-            "manager": "Tyler",
-            "recordRank": 8.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 167.4,
-            "theoreticalWins": 9,
-            "theoreticalLosses": 0,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 8.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 24.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 156.36,
-            "theoreticalWins": 7,
-            "theoreticalLosses": 2,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 8.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 22.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 143.16,
-            "theoreticalWins": 6,
-            "theoreticalLosses": 3,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 3.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 21.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 158.5,
-            "theoreticalWins": 8,
-            "theoreticalLosses": 1,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 8.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 18.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 119.68,
-            "theoreticalWins": 4,
-            "theoreticalLosses": 5,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 8.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 16.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 116.76,
-            "theoreticalWins": 3,
-            "theoreticalLosses": 6,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 3.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 15.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 125.26,
-            "theoreticalWins": 5,
-            "theoreticalLosses": 4,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 3.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 9.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 110.94,
-            "theoreticalWins": 2,
-            "theoreticalLosses": 7,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 3.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 7.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 107.06,
-            "theoreticalWins": 1,
-            "theoreticalLosses": 8,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 3.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 5.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 99.4,
-            "theoreticalWins": 0,
-            "theoreticalLosses": 9,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 2,
-        "managers": [
-          {
-            "manager": "Ben",
-            "recordRank": 9.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.5,
-            "wins": 2,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 335.52,
-            "theoreticalWins": 16,
-            "theoreticalLosses": 2,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 5.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 8.5,
-            "totalRank": 21.0,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 284.08,
-            "theoreticalWins": 12,
-            "theoreticalLosses": 6,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 5.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 7.0,
-            "totalRank": 20.5,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 290.44,
-            "theoreticalWins": 11,
-            "theoreticalLosses": 7,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 1.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 8.5,
-            "totalRank": 19.0,
-            "wins": 0,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 300.76,
-            "theoreticalWins": 12,
-            "theoreticalLosses": 6,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 9.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 17.5,
-            "wins": 2,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 253.88,
-            "theoreticalWins": 7,
-            "theoreticalLosses": 11,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 5.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 17.5,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 273.08,
-            "theoreticalWins": 9,
-            "theoreticalLosses": 9,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 5.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 15.5,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 265.1,
-            "theoreticalWins": 8,
-            "theoreticalLosses": 10,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 5.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 3.0,
-            "totalRank": 10.5,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 244.18,
-            "theoreticalWins": 6,
-            "theoreticalLosses": 12,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 5.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 7.5,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 235.52,
-            "theoreticalWins": 4,
-            "theoreticalLosses": 14,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 1.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 2.0,
-            "totalRank": 6.5,
-            "wins": 0,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 253.16,
-            "theoreticalWins": 5,
-            "theoreticalLosses": 13,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 3,
-        "managers": [
-          {
-            "manager": "Ben",
-            "recordRank": 9.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.5,
-            "wins": 3,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 514.96,
-            "theoreticalWins": 25,
-            "theoreticalLosses": 2,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 7.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 8.0,
-            "totalRank": 24.0,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 447.0,
-            "theoreticalWins": 16,
-            "theoreticalLosses": 11,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 7.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 23.0,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 440.12,
-            "theoreticalWins": 16,
-            "theoreticalLosses": 11,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 9.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 5.5,
-            "totalRank": 21.0,
-            "wins": 3,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 420.46,
-            "theoreticalWins": 13,
-            "theoreticalLosses": 14,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 1.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 8.0,
-            "totalRank": 16.5,
-            "wins": 0,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 430.84,
-            "theoreticalWins": 16,
-            "theoreticalLosses": 11,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 4.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 5.5,
-            "totalRank": 13.5,
-            "wins": 1,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 397.4,
-            "theoreticalWins": 13,
-            "theoreticalLosses": 14,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 4.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 4.0,
-            "totalRank": 11.0,
-            "wins": 1,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 365.62,
-            "theoreticalWins": 12,
-            "theoreticalLosses": 15,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 7.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 11.0,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 362.88,
-            "theoreticalWins": 9,
-            "theoreticalLosses": 18,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 1.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 3.0,
-            "totalRank": 9.5,
-            "wins": 0,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 406.38,
-            "theoreticalWins": 10,
-            "theoreticalLosses": 17,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 4.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 6.0,
-            "wins": 1,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 333.54,
-            "theoreticalWins": 5,
-            "theoreticalLosses": 22,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 4,
-        "managers": [
-          {
-            "manager": "Ben",
-            "recordRank": 9.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.5,
-            "wins": 4,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 667.12,
-            "theoreticalWins": 33,
-            "theoreticalLosses": 3,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 9.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 27.5,
-            "wins": 4,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 606.54,
-            "theoreticalWins": 22,
-            "theoreticalLosses": 14,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 2.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 7.5,
-            "totalRank": 18.0,
-            "wins": 1,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 574.24,
-            "theoreticalWins": 19,
-            "theoreticalLosses": 17,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 6.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 5.0,
-            "totalRank": 17.5,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 545.0,
-            "theoreticalWins": 17,
-            "theoreticalLosses": 19,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 6.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 7.5,
-            "totalRank": 17.0,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 515.5,
-            "theoreticalWins": 19,
-            "theoreticalLosses": 17,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 6.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 14.5,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 526.3,
-            "theoreticalWins": 16,
-            "theoreticalLosses": 20,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 2.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 6.0,
-            "totalRank": 13.5,
-            "wins": 1,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 541.82,
-            "theoreticalWins": 18,
-            "theoreticalLosses": 18,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 2.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 3.0,
-            "totalRank": 12.5,
-            "wins": 1,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 549.86,
-            "theoreticalWins": 14,
-            "theoreticalLosses": 22,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 6.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.5,
-            "totalRank": 9.0,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 463.6,
-            "theoreticalWins": 11,
-            "theoreticalLosses": 25,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 2.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 1.5,
-            "totalRank": 6.0,
-            "wins": 1,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 480.98,
-            "theoreticalWins": 11,
-            "theoreticalLosses": 25,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 5,
-        "managers": [
-          {
-            "manager": "Ben",
-            "recordRank": 9.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.5,
-            "wins": 4,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 761.24,
-            "theoreticalWins": 33,
-            "theoreticalLosses": 12,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 9.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 6.5,
-            "totalRank": 25.0,
-            "wins": 4,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 718.06,
-            "theoreticalWins": 24,
-            "theoreticalLosses": 21,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 7.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 8.5,
-            "totalRank": 22.0,
-            "wins": 3,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 684.82,
-            "theoreticalWins": 25,
-            "theoreticalLosses": 20,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 7.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 8.5,
-            "totalRank": 21.0,
-            "wins": 3,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 670.22,
-            "theoreticalWins": 25,
-            "theoreticalLosses": 20,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 4.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 4.5,
-            "totalRank": 16.5,
-            "wins": 2,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 688.04,
-            "theoreticalWins": 22,
-            "theoreticalLosses": 23,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 4.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 3.0,
-            "totalRank": 14.0,
-            "wins": 2,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 686.1,
-            "theoreticalWins": 21,
-            "theoreticalLosses": 24,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 4.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 6.5,
-            "totalRank": 13.5,
-            "wins": 2,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 646.72,
-            "theoreticalWins": 24,
-            "theoreticalLosses": 21,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 4.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.5,
-            "totalRank": 12.5,
-            "wins": 2,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 669.18,
-            "theoreticalWins": 22,
-            "theoreticalLosses": 23,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 4.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 8.0,
-            "wins": 2,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 599.34,
-            "theoreticalWins": 17,
-            "theoreticalLosses": 28,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 1,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 587.96,
-            "theoreticalWins": 12,
-            "theoreticalLosses": 33,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 6,
-        "managers": [
-          {
-            "manager": "Ben",
-            "recordRank": 9.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.0,
-            "wins": 4,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 876.94,
-            "theoreticalWins": 39,
-            "theoreticalLosses": 15,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 9.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 7.0,
-            "totalRank": 25.0,
-            "wins": 4,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 831.26,
-            "theoreticalWins": 28,
-            "theoreticalLosses": 26,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 5.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.5,
-            "totalRank": 22.0,
-            "wins": 3,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 800.0,
-            "theoreticalWins": 30,
-            "theoreticalLosses": 24,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 9.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 8.5,
-            "totalRank": 21.5,
-            "wins": 4,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 783.46,
-            "theoreticalWins": 30,
-            "theoreticalLosses": 24,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 5.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 5.0,
-            "totalRank": 17.5,
-            "wins": 3,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 794.78,
-            "theoreticalWins": 25,
-            "theoreticalLosses": 29,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 5.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 6.0,
-            "totalRank": 16.5,
-            "wins": 3,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 789.14,
-            "theoreticalWins": 26,
-            "theoreticalLosses": 28,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 2.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 2.0,
-            "totalRank": 10.0,
-            "wins": 2,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 791.6,
-            "theoreticalWins": 23,
-            "theoreticalLosses": 31,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 5.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 3.5,
-            "totalRank": 10.0,
-            "wins": 3,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 729.5,
-            "theoreticalWins": 24,
-            "theoreticalLosses": 30,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 2.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.5,
-            "totalRank": 8.5,
-            "wins": 2,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 738.78,
-            "theoreticalWins": 24,
-            "theoreticalLosses": 30,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 2.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 1.0,
-            "totalRank": 5.0,
-            "wins": 2,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 737.82,
-            "theoreticalWins": 21,
-            "theoreticalLosses": 33,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 7,
-        "managers": [
-          {
-            "manager": "Ben",
-            "recordRank": 9.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.5,
-            "wins": 5,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1017.42,
-            "theoreticalWins": 44,
-            "theoreticalLosses": 19,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 9.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 9.0,
-            "totalRank": 26.5,
-            "wins": 5,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 950.52,
-            "theoreticalWins": 38,
-            "theoreticalLosses": 25,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 8.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 7.0,
-            "totalRank": 24.0,
-            "wins": 4,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 967.44,
-            "theoreticalWins": 32,
-            "theoreticalLosses": 31,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 4.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 8.0,
-            "totalRank": 18.0,
-            "wins": 3,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 915.64,
-            "theoreticalWins": 33,
-            "theoreticalLosses": 30,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 4.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 5.0,
-            "totalRank": 16.0,
-            "wins": 3,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 943.44,
-            "theoreticalWins": 30,
-            "theoreticalLosses": 33,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 4.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 5.0,
-            "totalRank": 12.0,
-            "wins": 3,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 893.28,
-            "theoreticalWins": 30,
-            "theoreticalLosses": 33,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 4.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 3.0,
-            "totalRank": 11.0,
-            "wins": 3,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 903.46,
-            "theoreticalWins": 29,
-            "theoreticalLosses": 34,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 4.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 5.0,
-            "totalRank": 11.0,
-            "wins": 3,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 876.84,
-            "theoreticalWins": 30,
-            "theoreticalLosses": 33,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 4.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 2.0,
-            "totalRank": 11.0,
-            "wins": 3,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 908.04,
-            "theoreticalWins": 27,
-            "theoreticalLosses": 36,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 4.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 6.0,
-            "wins": 3,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 840.46,
-            "theoreticalWins": 22,
-            "theoreticalLosses": 41,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 8,
-        "managers": [
-          {
-            "manager": "Ben",
-            "recordRank": 8.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.5,
-            "wins": 5,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1148.82,
-            "theoreticalWins": 50,
-            "theoreticalLosses": 22,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 10.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.5,
-            "totalRank": 26.5,
-            "wins": 6,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1068.8,
-            "theoreticalWins": 41,
-            "theoreticalLosses": 31,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 8.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 8.5,
-            "totalRank": 26.0,
-            "wins": 5,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1103.06,
-            "theoreticalWins": 41,
-            "theoreticalLosses": 31,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 6.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 18.0,
-            "wins": 4,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1038.44,
-            "theoreticalWins": 37,
-            "theoreticalLosses": 35,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 6.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 4.5,
-            "totalRank": 17.5,
-            "wins": 4,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1042.44,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 38,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 2.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 7.0,
-            "totalRank": 14.5,
-            "wins": 3,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1035.62,
-            "theoreticalWins": 38,
-            "theoreticalLosses": 34,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 6.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 4.5,
-            "totalRank": 13.5,
-            "wins": 4,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 996.48,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 38,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 2.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 2.0,
-            "totalRank": 8.5,
-            "wins": 3,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 998.34,
-            "theoreticalWins": 30,
-            "theoreticalLosses": 42,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 2.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 3.0,
-            "totalRank": 7.5,
-            "wins": 3,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 972.26,
-            "theoreticalWins": 31,
-            "theoreticalLosses": 41,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 2.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 4.5,
-            "wins": 3,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 937.46,
-            "theoreticalWins": 24,
-            "theoreticalLosses": 48,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 9,
-        "managers": [
-          {
-            "manager": "Ben",
-            "recordRank": 9.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.0,
-            "wins": 6,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1306.52,
-            "theoreticalWins": 58,
-            "theoreticalLosses": 23,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 9.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 8.0,
-            "totalRank": 26.0,
-            "wins": 6,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1226.0,
-            "theoreticalWins": 46,
-            "theoreticalLosses": 35,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 9.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 23.0,
-            "wins": 6,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1190.56,
-            "theoreticalWins": 44,
-            "theoreticalLosses": 37,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 4.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 9.0,
-            "totalRank": 21.5,
-            "wins": 4,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1197.2,
-            "theoreticalWins": 47,
-            "theoreticalLosses": 34,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 7.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 19.0,
-            "wins": 5,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1168.94,
-            "theoreticalWins": 43,
-            "theoreticalLosses": 38,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 4.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 5.0,
-            "totalRank": 13.5,
-            "wins": 4,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1144.78,
-            "theoreticalWins": 37,
-            "theoreticalLosses": 44,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 4.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 4.0,
-            "totalRank": 11.5,
-            "wins": 4,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1111.0,
-            "theoreticalWins": 36,
-            "theoreticalLosses": 45,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 4.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 2.0,
-            "totalRank": 11.5,
-            "wins": 4,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1145.24,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 47,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 1.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 3.0,
-            "totalRank": 6.5,
-            "wins": 3,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1094.42,
-            "theoreticalWins": 35,
-            "theoreticalLosses": 46,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 1.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.5,
-            "wins": 3,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1043.14,
-            "theoreticalWins": 25,
-            "theoreticalLosses": 56,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 10,
-        "managers": [
-          {
-            "manager": "Ben",
-            "recordRank": 9.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.0,
-            "wins": 7,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1415.14,
-            "theoreticalWins": 64,
-            "theoreticalLosses": 26,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 9.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 27.0,
-            "wins": 7,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1372.72,
-            "theoreticalWins": 55,
-            "theoreticalLosses": 35,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 6.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 22.5,
-            "wins": 5,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1308.24,
-            "theoreticalWins": 54,
-            "theoreticalLosses": 36,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 9.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 21.0,
-            "wins": 7,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1282.14,
-            "theoreticalWins": 46,
-            "theoreticalLosses": 44,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 6.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 20.5,
-            "wins": 5,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1302.04,
-            "theoreticalWins": 51,
-            "theoreticalLosses": 39,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 3.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 13.5,
-            "wins": 4,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1241.82,
-            "theoreticalWins": 42,
-            "theoreticalLosses": 48,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 3.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 4.0,
-            "totalRank": 9.5,
-            "wins": 4,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1190.8,
-            "theoreticalWins": 39,
-            "theoreticalLosses": 51,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 3.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 9.5,
-            "wins": 4,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1195.0,
-            "theoreticalWins": 37,
-            "theoreticalLosses": 53,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 3.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 2.0,
-            "totalRank": 9.5,
-            "wins": 4,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1223.98,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 56,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 3,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1136.74,
-            "theoreticalWins": 28,
-            "theoreticalLosses": 62,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 11,
-        "managers": [
-          {
-            "manager": "Ben",
-            "recordRank": 9.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.0,
-            "wins": 8,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1539.76,
-            "theoreticalWins": 69,
-            "theoreticalLosses": 30,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 9.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 27.0,
-            "wins": 8,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1518.22,
-            "theoreticalWins": 63,
-            "theoreticalLosses": 36,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 7.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 23.0,
-            "wins": 6,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1453.06,
-            "theoreticalWins": 60,
-            "theoreticalLosses": 39,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 9.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 21.0,
-            "wins": 8,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1404.78,
-            "theoreticalWins": 49,
-            "theoreticalLosses": 50,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 5.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 19.5,
-            "wins": 5,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1432.44,
-            "theoreticalWins": 58,
-            "theoreticalLosses": 41,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 5.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 2.0,
-            "totalRank": 11.5,
-            "wins": 5,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1345.28,
-            "theoreticalWins": 36,
-            "theoreticalLosses": 63,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 3.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 5.0,
-            "totalRank": 11.0,
-            "wins": 4,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1330.24,
-            "theoreticalWins": 46,
-            "theoreticalLosses": 53,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 3.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 3.0,
-            "totalRank": 11.0,
-            "wins": 4,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1346.82,
-            "theoreticalWins": 42,
-            "theoreticalLosses": 57,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 3.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 4.0,
-            "totalRank": 9.0,
-            "wins": 4,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1319.84,
-            "theoreticalWins": 43,
-            "theoreticalLosses": 56,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 3,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1250.22,
-            "theoreticalWins": 29,
-            "theoreticalLosses": 70,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 12,
-        "managers": [
-          {
-            "manager": "Ben",
-            "recordRank": 9.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.0,
-            "wins": 9,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1663.64,
-            "theoreticalWins": 72,
-            "theoreticalLosses": 36,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 9.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 27.0,
-            "wins": 9,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1657.58,
-            "theoreticalWins": 71,
-            "theoreticalLosses": 37,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 6.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 7.0,
-            "totalRank": 21.5,
-            "wins": 6,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1575.82,
-            "theoreticalWins": 62,
-            "theoreticalLosses": 46,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 9.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 21.0,
-            "wins": 9,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1559.04,
-            "theoreticalWins": 58,
-            "theoreticalLosses": 50,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 4.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 8.0,
-            "totalRank": 19.5,
-            "wins": 5,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1566.84,
-            "theoreticalWins": 64,
-            "theoreticalLosses": 44,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 4.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 5.0,
-            "totalRank": 12.5,
-            "wins": 5,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1456.28,
-            "theoreticalWins": 50,
-            "theoreticalLosses": 58,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 6.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 2.0,
-            "totalRank": 12.5,
-            "wins": 6,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1473.16,
-            "theoreticalWins": 40,
-            "theoreticalLosses": 68,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 2.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 3.5,
-            "totalRank": 11.0,
-            "wins": 4,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1478.26,
-            "theoreticalWins": 47,
-            "theoreticalLosses": 61,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 2.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 3.5,
-            "totalRank": 8.0,
-            "wins": 4,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1444.58,
-            "theoreticalWins": 47,
-            "theoreticalLosses": 61,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 3,
-            "losses": 9,
-            "ties": 0,
-            "totalPoints": 1335.78,
-            "theoreticalWins": 29,
-            "theoreticalLosses": 79,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 13,
-        "managers": [
-          {
-            "manager": "Ben",
-            "recordRank": 9.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.0,
-            "wins": 10,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1826.88,
-            "theoreticalWins": 81,
-            "theoreticalLosses": 36,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 9.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 27.0,
-            "wins": 10,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1791.46,
-            "theoreticalWins": 77,
-            "theoreticalLosses": 40,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 9.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 21.0,
-            "wins": 10,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1674.66,
-            "theoreticalWins": 62,
-            "theoreticalLosses": 55,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 5.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 8.0,
-            "totalRank": 20.5,
-            "wins": 6,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1707.42,
-            "theoreticalWins": 71,
-            "theoreticalLosses": 46,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 5.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 7.0,
-            "totalRank": 20.5,
-            "wins": 6,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1738.16,
-            "theoreticalWins": 70,
-            "theoreticalLosses": 47,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 7.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 2.0,
-            "totalRank": 13.0,
-            "wins": 7,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1572.06,
-            "theoreticalWins": 41,
-            "theoreticalLosses": 76,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 2.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 12.5,
-            "wins": 4,
-            "losses": 9,
-            "ties": 0,
-            "totalPoints": 1596.98,
-            "theoreticalWins": 52,
-            "theoreticalLosses": 65,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 4.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 3.5,
-            "totalRank": 9.5,
-            "wins": 5,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1541.7,
-            "theoreticalWins": 50,
-            "theoreticalLosses": 67,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 2.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.5,
-            "totalRank": 9.0,
-            "wins": 4,
-            "losses": 9,
-            "ties": 0,
-            "totalPoints": 1559.22,
-            "theoreticalWins": 50,
-            "theoreticalLosses": 67,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 3,
-            "losses": 10,
-            "ties": 0,
-            "totalPoints": 1447.54,
-            "theoreticalWins": 31,
-            "theoreticalLosses": 86,
-            "theoreticalTies": 0
-          }
-        ]
-      }
-    ],
-    "finalWeek": 13,
-    "finalRankings": [
-      {
-        "manager": "Ben",
-        "recordRank": 9.0,
-        "pointsRank": 10.0,
-        "breakdownRank": 10.0,
-        "totalRank": 29.0,
-        "wins": 10,
-        "losses": 3,
-        "ties": 0,
-        "totalPoints": 1826.88,
-        "theoreticalWins": 81,
-        "theoreticalLosses": 36,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Vernon",
-        "recordRank": 9.0,
-        "pointsRank": 9.0,
-        "breakdownRank": 9.0,
-        "totalRank": 27.0,
-        "wins": 10,
-        "losses": 3,
-        "ties": 0,
-        "totalPoints": 1791.46,
-        "theoreticalWins": 77,
-        "theoreticalLosses": 40,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Jason",
-        "recordRank": 9.0,
-        "pointsRank": 6.0,
-        "breakdownRank": 6.0,
-        "totalRank": 21.0,
-        "wins": 10,
-        "losses": 3,
-        "ties": 0,
-        "totalPoints": 1674.66,
-        "theoreticalWins": 62,
-        "theoreticalLosses": 55,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Ted",
-        "recordRank": 5.5,
-        "pointsRank": 7.0,
-        "breakdownRank": 8.0,
-        "totalRank": 20.5,
-        "wins": 6,
-        "losses": 7,
-        "ties": 0,
-        "totalPoints": 1707.42,
-        "theoreticalWins": 71,
-        "theoreticalLosses": 46,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Lanny",
-        "recordRank": 5.5,
-        "pointsRank": 8.0,
-        "breakdownRank": 7.0,
-        "totalRank": 20.5,
-        "wins": 6,
-        "losses": 7,
-        "ties": 0,
-        "totalPoints": 1738.16,
-        "theoreticalWins": 70,
-        "theoreticalLosses": 47,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Joey",
-        "recordRank": 7.0,
-        "pointsRank": 4.0,
-        "breakdownRank": 2.0,
-        "totalRank": 13.0,
-        "wins": 7,
-        "losses": 6,
-        "ties": 0,
-        "totalPoints": 1572.06,
-        "theoreticalWins": 41,
-        "theoreticalLosses": 76,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "John",
-        "recordRank": 2.5,
-        "pointsRank": 5.0,
-        "breakdownRank": 5.0,
-        "totalRank": 12.5,
-        "wins": 4,
-        "losses": 9,
-        "ties": 0,
-        "totalPoints": 1596.98,
-        "theoreticalWins": 52,
-        "theoreticalLosses": 65,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Peter",
-        "recordRank": 4.0,
-        "pointsRank": 2.0,
-        "breakdownRank": 3.5,
-        "totalRank": 9.5,
-        "wins": 5,
-        "losses": 8,
-        "ties": 0,
-        "totalPoints": 1541.7,
-        "theoreticalWins": 50,
-        "theoreticalLosses": 67,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Tyler",
-        "recordRank": 2.5,
-        "pointsRank": 3.0,
-        "breakdownRank": 3.5,
-        "totalRank": 9.0,
-        "wins": 4,
-        "losses": 9,
-        "ties": 0,
-        "totalPoints": 1559.22,
-        "theoreticalWins": 50,
-        "theoreticalLosses": 67,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Matt",
-        "recordRank": 1.0,
-        "pointsRank": 1.0,
-        "breakdownRank": 1.0,
-        "totalRank": 3.0,
-        "wins": 3,
-        "losses": 10,
-        "ties": 0,
-        "totalPoints": 1447.54,
-        "theoreticalWins": 31,
-        "theoreticalLosses": 86,
-        "theoreticalTies": 0
-      }
-    ]
-  },
-  "2021": {
-    "weeks": [
-      {
-        "week": 1,
-        "managers": [
-          {
-            "manager": "Ted",
-            "recordRank": 8.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 171.02,
-            "theoreticalWins": 9,
-            "theoreticalLosses": 0,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 8.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 24.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 145.16,
-            "theoreticalWins": 7,
-            "theoreticalLosses": 2,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 8.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 22.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 144.86,
-            "theoreticalWins": 6,
-            "theoreticalLosses": 3,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 3.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 21.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 155.08,
-            "theoreticalWins": 8,
-            "theoreticalLosses": 1,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 8.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 18.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 124.76,
-            "theoreticalWins": 4,
-            "theoreticalLosses": 5,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 3.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 15.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 138.2,
-            "theoreticalWins": 5,
-            "theoreticalLosses": 4,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 8.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 14.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 108.06,
-            "theoreticalWins": 2,
-            "theoreticalLosses": 7,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 3.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 11.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 121.94,
-            "theoreticalWins": 3,
-            "theoreticalLosses": 6,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 3.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 7.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 107.22,
-            "theoreticalWins": 1,
-            "theoreticalLosses": 8,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 3.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 5.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 105.88,
-            "theoreticalWins": 0,
-            "theoreticalLosses": 9,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 2,
-        "managers": [
-          {
-            "manager": "Ted",
-            "recordRank": 9.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.0,
-            "wins": 2,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 313.46,
-            "theoreticalWins": 16,
-            "theoreticalLosses": 2,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 9.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.5,
-            "totalRank": 25.5,
-            "wins": 2,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 283.36,
-            "theoreticalWins": 12,
-            "theoreticalLosses": 6,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 5.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 8.5,
-            "totalRank": 23.0,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 287.46,
-            "theoreticalWins": 12,
-            "theoreticalLosses": 6,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 5.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 7.0,
-            "totalRank": 17.5,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 269.56,
-            "theoreticalWins": 10,
-            "theoreticalLosses": 8,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 9.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 4.5,
-            "totalRank": 16.5,
-            "wins": 2,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 247.72,
-            "theoreticalWins": 8,
-            "theoreticalLosses": 10,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 2.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 6.0,
-            "totalRank": 15.0,
-            "wins": 0,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 273.52,
-            "theoreticalWins": 9,
-            "theoreticalLosses": 9,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 5.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 3.0,
-            "totalRank": 12.5,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 263.12,
-            "theoreticalWins": 7,
-            "theoreticalLosses": 11,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 2.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 4.5,
-            "totalRank": 12.5,
-            "wins": 0,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 272.72,
-            "theoreticalWins": 8,
-            "theoreticalLosses": 10,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 5.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 9.5,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 243.52,
-            "theoreticalWins": 6,
-            "theoreticalLosses": 12,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 2.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 4.0,
-            "wins": 0,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 224.6,
-            "theoreticalWins": 2,
-            "theoreticalLosses": 16,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 3,
-        "managers": [
-          {
-            "manager": "Ted",
-            "recordRank": 9.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.5,
-            "wins": 3,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 442.38,
-            "theoreticalWins": 20,
-            "theoreticalLosses": 7,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 9.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 27.5,
-            "wins": 3,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 420.88,
-            "theoreticalWins": 18,
-            "theoreticalLosses": 9,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 6.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 8.0,
-            "totalRank": 20.5,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 407.5,
-            "theoreticalWins": 17,
-            "theoreticalLosses": 10,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 6.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 6.5,
-            "totalRank": 18.0,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 405.56,
-            "theoreticalWins": 16,
-            "theoreticalLosses": 11,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 4.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 5.0,
-            "totalRank": 17.0,
-            "wins": 1,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 415.58,
-            "theoreticalWins": 15,
-            "theoreticalLosses": 12,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 2.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 6.5,
-            "totalRank": 15.5,
-            "wins": 0,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 412.02,
-            "theoreticalWins": 16,
-            "theoreticalLosses": 11,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 6.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.5,
-            "totalRank": 13.0,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 374.56,
-            "theoreticalWins": 11,
-            "theoreticalLosses": 16,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 6.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 10.5,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 342.28,
-            "theoreticalWins": 8,
-            "theoreticalLosses": 19,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 2.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 3.5,
-            "totalRank": 9.5,
-            "wins": 0,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 390.56,
-            "theoreticalWins": 11,
-            "theoreticalLosses": 16,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 2.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 4.0,
-            "wins": 0,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 324.96,
-            "theoreticalWins": 3,
-            "theoreticalLosses": 24,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 4,
-        "managers": [
-          {
-            "manager": "Ted",
-            "recordRank": 9.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.5,
-            "wins": 4,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 595.26,
-            "theoreticalWins": 28,
-            "theoreticalLosses": 8,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 5.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 23.5,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 567.82,
-            "theoreticalWins": 22,
-            "theoreticalLosses": 14,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 9.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 5.0,
-            "totalRank": 20.5,
-            "wins": 4,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 533.5,
-            "theoreticalWins": 19,
-            "theoreticalLosses": 17,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 5.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.5,
-            "totalRank": 20.0,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 541.22,
-            "theoreticalWins": 20,
-            "theoreticalLosses": 16,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 3.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 7.5,
-            "totalRank": 18.5,
-            "wins": 1,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 553.3,
-            "theoreticalWins": 20,
-            "theoreticalLosses": 16,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 5.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 5.0,
-            "totalRank": 14.5,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 523.62,
-            "theoreticalWins": 19,
-            "theoreticalLosses": 17,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 8.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 12.0,
-            "wins": 3,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 486.38,
-            "theoreticalWins": 14,
-            "theoreticalLosses": 22,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 5.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 11.5,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 514.46,
-            "theoreticalWins": 16,
-            "theoreticalLosses": 20,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 1.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 11.5,
-            "wins": 0,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 531.26,
-            "theoreticalWins": 19,
-            "theoreticalLosses": 17,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 1.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.5,
-            "wins": 0,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 413.8,
-            "theoreticalWins": 3,
-            "theoreticalLosses": 33,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 5,
-        "managers": [
-          {
-            "manager": "Ted",
-            "recordRank": 9.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.5,
-            "wins": 5,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 755.06,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 11,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 6.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 9.0,
-            "totalRank": 25.5,
-            "wins": 3,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 776.08,
-            "theoreticalWins": 31,
-            "theoreticalLosses": 14,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 9.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 25.5,
-            "wins": 5,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 713.2,
-            "theoreticalWins": 27,
-            "theoreticalLosses": 18,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 6.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 5.5,
-            "totalRank": 18.0,
-            "wins": 3,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 679.26,
-            "theoreticalWins": 23,
-            "theoreticalLosses": 22,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 1.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 15.5,
-            "wins": 0,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 684.4,
-            "theoreticalWins": 24,
-            "theoreticalLosses": 21,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 4.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 5.5,
-            "totalRank": 14.0,
-            "wins": 2,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 666.6,
-            "theoreticalWins": 23,
-            "theoreticalLosses": 22,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 8.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 12.0,
-            "wins": 4,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 621.88,
-            "theoreticalWins": 17,
-            "theoreticalLosses": 28,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 3.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 4.0,
-            "totalRank": 12.0,
-            "wins": 1,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 676.94,
-            "theoreticalWins": 22,
-            "theoreticalLosses": 23,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 4.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 10.5,
-            "wins": 2,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 663.7,
-            "theoreticalWins": 21,
-            "theoreticalLosses": 24,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 1.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.5,
-            "wins": 0,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 515.7,
-            "theoreticalWins": 3,
-            "theoreticalLosses": 42,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 6,
-        "managers": [
-          {
-            "manager": "Lanny",
-            "recordRank": 7.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 27.5,
-            "wins": 4,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 957.34,
-            "theoreticalWins": 40,
-            "theoreticalLosses": 14,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 9.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 9.0,
-            "totalRank": 26.5,
-            "wins": 5,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 852.8,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 20,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 5.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 8.0,
-            "totalRank": 22.0,
-            "wins": 3,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 855.3,
-            "theoreticalWins": 31,
-            "theoreticalLosses": 23,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 9.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 5.0,
-            "totalRank": 20.5,
-            "wins": 5,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 813.44,
-            "theoreticalWins": 28,
-            "theoreticalLosses": 26,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 5.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 19.0,
-            "wins": 3,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 826.04,
-            "theoreticalWins": 30,
-            "theoreticalLosses": 24,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 3.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 13.0,
-            "wins": 2,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 812.44,
-            "theoreticalWins": 28,
-            "theoreticalLosses": 26,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 7.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 11.5,
-            "wins": 4,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 725.22,
-            "theoreticalWins": 19,
-            "theoreticalLosses": 35,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 5.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 11.0,
-            "wins": 3,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 790.9,
-            "theoreticalWins": 26,
-            "theoreticalLosses": 28,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 2.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 5.0,
-            "totalRank": 11.0,
-            "wins": 1,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 798.34,
-            "theoreticalWins": 28,
-            "theoreticalLosses": 26,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 0,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 622.54,
-            "theoreticalWins": 6,
-            "theoreticalLosses": 48,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 7,
-        "managers": [
-          {
-            "manager": "Lanny",
-            "recordRank": 9.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.0,
-            "wins": 5,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1120.12,
-            "theoreticalWins": 48,
-            "theoreticalLosses": 15,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 9.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 25.0,
-            "wins": 5,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 970.28,
-            "theoreticalWins": 37,
-            "theoreticalLosses": 26,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 6.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 24.0,
-            "wins": 4,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1028.86,
-            "theoreticalWins": 40,
-            "theoreticalLosses": 23,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 9.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 6.0,
-            "totalRank": 22.0,
-            "wins": 5,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 960.96,
-            "theoreticalWins": 35,
-            "theoreticalLosses": 28,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 6.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 7.0,
-            "totalRank": 19.0,
-            "wins": 4,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 957.02,
-            "theoreticalWins": 36,
-            "theoreticalLosses": 27,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 3.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 13.5,
-            "wins": 3,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 942.28,
-            "theoreticalWins": 33,
-            "theoreticalLosses": 30,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 6.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 10.0,
-            "wins": 4,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 844.9,
-            "theoreticalWins": 23,
-            "theoreticalLosses": 40,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 2.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 10.0,
-            "wins": 2,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 900.14,
-            "theoreticalWins": 30,
-            "theoreticalLosses": 33,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 3.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 9.5,
-            "wins": 3,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 869.62,
-            "theoreticalWins": 26,
-            "theoreticalLosses": 37,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 0,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 702.44,
-            "theoreticalWins": 7,
-            "theoreticalLosses": 56,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 8,
-        "managers": [
-          {
-            "manager": "Lanny",
-            "recordRank": 7.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 27.5,
-            "wins": 5,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1224.02,
-            "theoreticalWins": 49,
-            "theoreticalLosses": 23,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 10.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 9.0,
-            "totalRank": 27.0,
-            "wins": 6,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1100.24,
-            "theoreticalWins": 44,
-            "theoreticalLosses": 28,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 4.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 7.5,
-            "totalRank": 20.5,
-            "wins": 4,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1135.82,
-            "theoreticalWins": 42,
-            "theoreticalLosses": 30,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 7.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 6.0,
-            "totalRank": 20.5,
-            "wins": 5,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1090.88,
-            "theoreticalWins": 41,
-            "theoreticalLosses": 31,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 4.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 7.5,
-            "totalRank": 17.5,
-            "wins": 4,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1076.92,
-            "theoreticalWins": 42,
-            "theoreticalLosses": 30,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 7.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 17.5,
-            "wins": 5,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1071.02,
-            "theoreticalWins": 40,
-            "theoreticalLosses": 32,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 7.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.5,
-            "totalRank": 12.0,
-            "wins": 5,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 978.48,
-            "theoreticalWins": 31,
-            "theoreticalLosses": 41,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 2.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 10.0,
-            "wins": 2,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1011.46,
-            "theoreticalWins": 33,
-            "theoreticalLosses": 39,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 4.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 2.5,
-            "totalRank": 9.5,
-            "wins": 4,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 993.62,
-            "theoreticalWins": 31,
-            "theoreticalLosses": 41,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 0,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 793.38,
-            "theoreticalWins": 7,
-            "theoreticalLosses": 65,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 9,
-        "managers": [
-          {
-            "manager": "Ted",
-            "recordRank": 10.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.0,
-            "wins": 7,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1218.96,
-            "theoreticalWins": 52,
-            "theoreticalLosses": 29,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 5.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 8.0,
-            "totalRank": 23.5,
-            "wins": 5,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1309.26,
-            "theoreticalWins": 50,
-            "theoreticalLosses": 31,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 5.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 23.5,
-            "wins": 5,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1279.42,
-            "theoreticalWins": 51,
-            "theoreticalLosses": 30,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 8.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 22.5,
-            "wins": 6,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1208.56,
-            "theoreticalWins": 48,
-            "theoreticalLosses": 33,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 8.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.5,
-            "totalRank": 19.0,
-            "wins": 6,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1174.16,
-            "theoreticalWins": 45,
-            "theoreticalLosses": 36,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 5.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 5.5,
-            "totalRank": 17.0,
-            "wins": 5,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1175.94,
-            "theoreticalWins": 45,
-            "theoreticalLosses": 36,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 5.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 9.5,
-            "wins": 5,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1071.86,
-            "theoreticalWins": 33,
-            "theoreticalLosses": 48,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 3.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.5,
-            "totalRank": 9.5,
-            "wins": 4,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1102.7,
-            "theoreticalWins": 37,
-            "theoreticalLosses": 44,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 2.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 3.5,
-            "totalRank": 9.5,
-            "wins": 2,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1113.62,
-            "theoreticalWins": 37,
-            "theoreticalLosses": 44,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 0,
-            "losses": 9,
-            "ties": 0,
-            "totalPoints": 864.68,
-            "theoreticalWins": 7,
-            "theoreticalLosses": 74,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 10,
-        "managers": [
-          {
-            "manager": "Lanny",
-            "recordRank": 7.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 9.0,
-            "totalRank": 26.0,
-            "wins": 6,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1431.42,
-            "theoreticalWins": 58,
-            "theoreticalLosses": 32,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 7.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 10.0,
-            "totalRank": 26.0,
-            "wins": 6,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1422.32,
-            "theoreticalWins": 60,
-            "theoreticalLosses": 30,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 9.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 25.5,
-            "wins": 7,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1327.3,
-            "theoreticalWins": 55,
-            "theoreticalLosses": 35,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 7.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 21.0,
-            "wins": 6,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1317.8,
-            "theoreticalWins": 52,
-            "theoreticalLosses": 38,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 9.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 19.5,
-            "wins": 7,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1284.62,
-            "theoreticalWins": 50,
-            "theoreticalLosses": 40,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 4.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 16.0,
-            "wins": 5,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1287.98,
-            "theoreticalWins": 51,
-            "theoreticalLosses": 39,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 4.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 12.0,
-            "wins": 5,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1216.52,
-            "theoreticalWins": 44,
-            "theoreticalLosses": 46,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 4.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 8.0,
-            "wins": 5,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1161.14,
-            "theoreticalWins": 33,
-            "theoreticalLosses": 57,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 2.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 8.0,
-            "wins": 2,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1210.96,
-            "theoreticalWins": 38,
-            "theoreticalLosses": 52,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 1,
-            "losses": 9,
-            "ties": 0,
-            "totalPoints": 965.16,
-            "theoreticalWins": 9,
-            "theoreticalLosses": 81,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 11,
-        "managers": [
-          {
-            "manager": "John",
-            "recordRank": 7.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 27.5,
-            "wins": 7,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1591.9,
-            "theoreticalWins": 69,
-            "theoreticalLosses": 30,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 9.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 25.5,
-            "wins": 8,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1457.3,
-            "theoreticalWins": 61,
-            "theoreticalLosses": 38,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 7.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 25.5,
-            "wins": 7,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1582.42,
-            "theoreticalWins": 65,
-            "theoreticalLosses": 34,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 9.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 23.5,
-            "wins": 8,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1442.74,
-            "theoreticalWins": 58,
-            "theoreticalLosses": 41,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 5.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 17.5,
-            "wins": 6,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1432.9,
-            "theoreticalWins": 54,
-            "theoreticalLosses": 45,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 5.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 13.5,
-            "wins": 6,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1338.92,
-            "theoreticalWins": 48,
-            "theoreticalLosses": 51,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 3.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 13.5,
-            "wins": 5,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1371.42,
-            "theoreticalWins": 51,
-            "theoreticalLosses": 48,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 2.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 8.0,
-            "wins": 2,
-            "losses": 9,
-            "ties": 0,
-            "totalPoints": 1337.08,
-            "theoreticalWins": 43,
-            "theoreticalLosses": 56,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 3.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 7.5,
-            "wins": 5,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1249.52,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 65,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 1,
-            "losses": 10,
-            "ties": 0,
-            "totalPoints": 1085.7,
-            "theoreticalWins": 12,
-            "theoreticalLosses": 87,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 12,
-        "managers": [
-          {
-            "manager": "John",
-            "recordRank": 6.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 26.5,
-            "wins": 7,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1708.88,
-            "theoreticalWins": 73,
-            "theoreticalLosses": 35,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 8.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 26.0,
-            "wins": 8,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1694.18,
-            "theoreticalWins": 68,
-            "theoreticalLosses": 40,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 9.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 25.5,
-            "wins": 9,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1582.7,
-            "theoreticalWins": 67,
-            "theoreticalLosses": 41,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 9.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 23.5,
-            "wins": 9,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1571.12,
-            "theoreticalWins": 65,
-            "theoreticalLosses": 43,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 4.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 6.0,
-            "totalRank": 15.5,
-            "wins": 6,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1526.38,
-            "theoreticalWins": 60,
-            "theoreticalLosses": 48,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 6.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.5,
-            "totalRank": 15.0,
-            "wins": 7,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1475.6,
-            "theoreticalWins": 56,
-            "theoreticalLosses": 52,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 4.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 4.5,
-            "totalRank": 15.0,
-            "wins": 6,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1542.54,
-            "theoreticalWins": 56,
-            "theoreticalLosses": 52,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 2.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 8.0,
-            "wins": 2,
-            "losses": 10,
-            "ties": 0,
-            "totalPoints": 1460.78,
-            "theoreticalWins": 48,
-            "theoreticalLosses": 60,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 3.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 7.0,
-            "wins": 5,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1332.04,
-            "theoreticalWins": 35,
-            "theoreticalLosses": 73,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 1,
-            "losses": 11,
-            "ties": 0,
-            "totalPoints": 1165.26,
-            "theoreticalWins": 12,
-            "theoreticalLosses": 96,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 13,
-        "managers": [
-          {
-            "manager": "Ben",
-            "recordRank": 9.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.5,
-            "totalRank": 26.0,
-            "wins": 10,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1757.04,
-            "theoreticalWins": 74,
-            "theoreticalLosses": 43,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 5.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 25.5,
-            "wins": 7,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1875.4,
-            "theoreticalWins": 81,
-            "theoreticalLosses": 36,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 9.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 8.5,
-            "totalRank": 25.0,
-            "wins": 10,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1726.44,
-            "theoreticalWins": 74,
-            "theoreticalLosses": 43,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 7.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 7.0,
-            "totalRank": 23.5,
-            "wins": 8,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1783.8,
-            "theoreticalWins": 69,
-            "theoreticalLosses": 48,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 5.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 5.0,
-            "totalRank": 16.5,
-            "wins": 7,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1682.58,
-            "theoreticalWins": 62,
-            "theoreticalLosses": 55,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 4.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 6.0,
-            "totalRank": 15.0,
-            "wins": 6,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1646.36,
-            "theoreticalWins": 63,
-            "theoreticalLosses": 54,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 7.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 4.0,
-            "totalRank": 14.5,
-            "wins": 8,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1577.06,
-            "theoreticalWins": 58,
-            "theoreticalLosses": 59,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 2.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 3.0,
-            "totalRank": 9.0,
-            "wins": 3,
-            "losses": 10,
-            "ties": 0,
-            "totalPoints": 1585.78,
-            "theoreticalWins": 52,
-            "theoreticalLosses": 65,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 3.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 7.0,
-            "wins": 5,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1399.64,
-            "theoreticalWins": 35,
-            "theoreticalLosses": 82,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 1,
-            "losses": 12,
-            "ties": 0,
-            "totalPoints": 1294.28,
-            "theoreticalWins": 17,
-            "theoreticalLosses": 100,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 14,
-        "managers": [
-          {
-            "manager": "Ben",
-            "recordRank": 10.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 28.0,
-            "wins": 11,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1907.46,
-            "theoreticalWins": 81,
-            "theoreticalLosses": 45,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 4.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 24.5,
-            "wins": 7,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1979.82,
-            "theoreticalWins": 82,
-            "theoreticalLosses": 44,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 9.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 8.0,
-            "totalRank": 24.0,
-            "wins": 10,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1852.78,
-            "theoreticalWins": 78,
-            "theoreticalLosses": 48,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 6.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 6.0,
-            "totalRank": 20.5,
-            "wins": 8,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1900.94,
-            "theoreticalWins": 71,
-            "theoreticalLosses": 55,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 6.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 5.0,
-            "totalRank": 17.5,
-            "wins": 8,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1830.48,
-            "theoreticalWins": 68,
-            "theoreticalLosses": 58,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 4.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 7.0,
-            "totalRank": 16.5,
-            "wins": 7,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1820.0,
-            "theoreticalWins": 72,
-            "theoreticalLosses": 54,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 8.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 16.0,
-            "wins": 9,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1739.48,
-            "theoreticalWins": 66,
-            "theoreticalLosses": 60,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 2.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 8.0,
-            "wins": 4,
-            "losses": 10,
-            "ties": 0,
-            "totalPoints": 1730.56,
-            "theoreticalWins": 57,
-            "theoreticalLosses": 69,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 3.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 7.0,
-            "wins": 5,
-            "losses": 9,
-            "ties": 0,
-            "totalPoints": 1487.36,
-            "theoreticalWins": 35,
-            "theoreticalLosses": 91,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 1,
-            "losses": 13,
-            "ties": 0,
-            "totalPoints": 1413.1,
-            "theoreticalWins": 20,
-            "theoreticalLosses": 106,
-            "theoreticalTies": 0
-          }
-        ]
-      }
-    ],
-    "finalWeek": 14,
-    "finalRankings": [
-      {
-        "manager": "Ben",
-        "recordRank": 10.0,
-        "pointsRank": 9.0,
-        "breakdownRank": 9.0,
-        "totalRank": 28.0,
-        "wins": 11,
-        "losses": 3,
-        "ties": 0,
-        "totalPoints": 1907.46,
-        "theoreticalWins": 81,
-        "theoreticalLosses": 45,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "John",
-        "recordRank": 4.5,
-        "pointsRank": 10.0,
-        "breakdownRank": 10.0,
-        "totalRank": 24.5,
-        "wins": 7,
-        "losses": 7,
-        "ties": 0,
-        "totalPoints": 1979.82,
-        "theoreticalWins": 82,
-        "theoreticalLosses": 44,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Ted",
-        "recordRank": 9.0,
-        "pointsRank": 7.0,
-        "breakdownRank": 8.0,
-        "totalRank": 24.0,
-        "wins": 10,
-        "losses": 4,
-        "ties": 0,
-        "totalPoints": 1852.78,
-        "theoreticalWins": 78,
-        "theoreticalLosses": 48,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Lanny",
-        "recordRank": 6.5,
-        "pointsRank": 8.0,
-        "breakdownRank": 6.0,
-        "totalRank": 20.5,
-        "wins": 8,
-        "losses": 6,
-        "ties": 0,
-        "totalPoints": 1900.94,
-        "theoreticalWins": 71,
-        "theoreticalLosses": 55,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Peter",
-        "recordRank": 6.5,
-        "pointsRank": 6.0,
-        "breakdownRank": 5.0,
-        "totalRank": 17.5,
-        "wins": 8,
-        "losses": 6,
-        "ties": 0,
-        "totalPoints": 1830.48,
-        "theoreticalWins": 68,
-        "theoreticalLosses": 58,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Tyler",
-        "recordRank": 4.5,
-        "pointsRank": 5.0,
-        "breakdownRank": 7.0,
-        "totalRank": 16.5,
-        "wins": 7,
-        "losses": 7,
-        "ties": 0,
-        "totalPoints": 1820.0,
-        "theoreticalWins": 72,
-        "theoreticalLosses": 54,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Vernon",
-        "recordRank": 8.0,
-        "pointsRank": 4.0,
-        "breakdownRank": 4.0,
-        "totalRank": 16.0,
-        "wins": 9,
-        "losses": 5,
-        "ties": 0,
-        "totalPoints": 1739.48,
-        "theoreticalWins": 66,
-        "theoreticalLosses": 60,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Joey",
-        "recordRank": 2.0,
-        "pointsRank": 3.0,
-        "breakdownRank": 3.0,
-        "totalRank": 8.0,
-        "wins": 4,
-        "losses": 10,
-        "ties": 0,
-        "totalPoints": 1730.56,
-        "theoreticalWins": 57,
-        "theoreticalLosses": 69,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Matt",
-        "recordRank": 3.0,
-        "pointsRank": 2.0,
-        "breakdownRank": 2.0,
-        "totalRank": 7.0,
-        "wins": 5,
-        "losses": 9,
-        "ties": 0,
-        "totalPoints": 1487.36,
-        "theoreticalWins": 35,
-        "theoreticalLosses": 91,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Jason",
-        "recordRank": 1.0,
-        "pointsRank": 1.0,
-        "breakdownRank": 1.0,
-        "totalRank": 3.0,
-        "wins": 1,
-        "losses": 13,
-        "ties": 0,
-        "totalPoints": 1413.1,
-        "theoreticalWins": 20,
-        "theoreticalLosses": 106,
-        "theoreticalTies": 0
-      }
-    ]
-  },
-  "2022": {
-    "weeks": [
-      {
-        "week": 1,
-        "managers": [
-          {
-            "manager": "John",
-            "recordRank": 8.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 173.84,
-            "theoreticalWins": 9,
-            "theoreticalLosses": 0,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 8.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 26.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 139.7,
-            "theoreticalWins": 8,
-            "theoreticalLosses": 1,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 8.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 22.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 128.58,
-            "theoreticalWins": 6,
-            "theoreticalLosses": 3,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 8.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 20.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 125.9,
-            "theoreticalWins": 5,
-            "theoreticalLosses": 4,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 3.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 19.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 130.52,
-            "theoreticalWins": 7,
-            "theoreticalLosses": 2,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 8.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 14.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 113.44,
-            "theoreticalWins": 2,
-            "theoreticalLosses": 7,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 3.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 13.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 115.12,
-            "theoreticalWins": 4,
-            "theoreticalLosses": 5,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 3.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 11.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 113.78,
-            "theoreticalWins": 3,
-            "theoreticalLosses": 6,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 3.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 7.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 105.48,
-            "theoreticalWins": 1,
-            "theoreticalLosses": 8,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 3.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 5.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 88.66,
-            "theoreticalWins": 0,
-            "theoreticalLosses": 9,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 2,
-        "managers": [
-          {
-            "manager": "John",
-            "recordRank": 8.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 9.0,
-            "totalRank": 27.5,
-            "wins": 2,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 324.44,
-            "theoreticalWins": 15,
-            "theoreticalLosses": 3,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 8.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 10.0,
-            "totalRank": 27.5,
-            "wins": 2,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 301.62,
-            "theoreticalWins": 17,
-            "theoreticalLosses": 1,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 8.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 22.5,
-            "wins": 2,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 286.34,
-            "theoreticalWins": 13,
-            "theoreticalLosses": 5,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 5.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 21.5,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 290.1,
-            "theoreticalWins": 14,
-            "theoreticalLosses": 4,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 8.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 20.5,
-            "wins": 2,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 277.46,
-            "theoreticalWins": 11,
-            "theoreticalLosses": 7,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 2.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 12.5,
-            "wins": 0,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 256.16,
-            "theoreticalWins": 8,
-            "theoreticalLosses": 10,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 2.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 10.5,
-            "wins": 0,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 246.54,
-            "theoreticalWins": 6,
-            "theoreticalLosses": 12,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 2.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 8.5,
-            "wins": 0,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 227.76,
-            "theoreticalWins": 3,
-            "theoreticalLosses": 15,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 5.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 2.0,
-            "totalRank": 8.5,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 164.98,
-            "theoreticalWins": 2,
-            "theoreticalLosses": 16,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 2.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 1.0,
-            "totalRank": 5.5,
-            "wins": 0,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 170.22,
-            "theoreticalWins": 1,
-            "theoreticalLosses": 17,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 3,
-        "managers": [
-          {
-            "manager": "Matt",
-            "recordRank": 7.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 10.0,
-            "totalRank": 26.5,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 421.64,
-            "theoreticalWins": 22,
-            "theoreticalLosses": 5,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 7.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 9.0,
-            "totalRank": 26.5,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 443.98,
-            "theoreticalWins": 21,
-            "theoreticalLosses": 6,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 10.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 26.0,
-            "wins": 3,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 413.36,
-            "theoreticalWins": 20,
-            "theoreticalLosses": 7,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 7.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 21.5,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 392.16,
-            "theoreticalWins": 16,
-            "theoreticalLosses": 11,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 7.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 17.5,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 368.08,
-            "theoreticalWins": 13,
-            "theoreticalLosses": 14,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 3.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 15.5,
-            "wins": 1,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 388.96,
-            "theoreticalWins": 15,
-            "theoreticalLosses": 12,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 3.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 11.5,
-            "wins": 1,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 355.72,
-            "theoreticalWins": 10,
-            "theoreticalLosses": 17,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 3.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 7.5,
-            "wins": 1,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 282.14,
-            "theoreticalWins": 5,
-            "theoreticalLosses": 22,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 1.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 7.0,
-            "wins": 0,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 337.98,
-            "theoreticalWins": 9,
-            "theoreticalLosses": 18,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 3.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 5.5,
-            "wins": 1,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 252.36,
-            "theoreticalWins": 4,
-            "theoreticalLosses": 23,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 4,
-        "managers": [
-          {
-            "manager": "John",
-            "recordRank": 9.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.0,
-            "wins": 3,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 584.7,
-            "theoreticalWins": 27,
-            "theoreticalLosses": 9,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 9.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 8.5,
-            "totalRank": 26.5,
-            "wins": 3,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 537.14,
-            "theoreticalWins": 22,
-            "theoreticalLosses": 14,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 5.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 8.5,
-            "totalRank": 20.5,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 502.7,
-            "theoreticalWins": 22,
-            "theoreticalLosses": 14,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 9.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 5.5,
-            "totalRank": 18.5,
-            "wins": 3,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 494.22,
-            "theoreticalWins": 17,
-            "theoreticalLosses": 19,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 2.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 7.0,
-            "totalRank": 17.0,
-            "wins": 1,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 522.48,
-            "theoreticalWins": 20,
-            "theoreticalLosses": 16,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 5.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 5.5,
-            "totalRank": 16.5,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 496.84,
-            "theoreticalWins": 17,
-            "theoreticalLosses": 19,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 5.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 4.0,
-            "totalRank": 14.0,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 495.08,
-            "theoreticalWins": 16,
-            "theoreticalLosses": 20,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 5.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 3.0,
-            "totalRank": 10.0,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 447.2,
-            "theoreticalWins": 14,
-            "theoreticalLosses": 22,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 5.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 7.0,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 407.2,
-            "theoreticalWins": 12,
-            "theoreticalLosses": 24,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 1.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 2.0,
-            "totalRank": 6.0,
-            "wins": 0,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 471.04,
-            "theoreticalWins": 13,
-            "theoreticalLosses": 23,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 5,
-        "managers": [
-          {
-            "manager": "John",
-            "recordRank": 10.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 30.0,
-            "wins": 4,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 762.46,
-            "theoreticalWins": 36,
-            "theoreticalLosses": 9,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 7.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 23.0,
-            "wins": 3,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 667.1,
-            "theoreticalWins": 26,
-            "theoreticalLosses": 19,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 3.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 21.0,
-            "wins": 2,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 672.04,
-            "theoreticalWins": 27,
-            "theoreticalLosses": 18,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 7.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 6.5,
-            "totalRank": 20.5,
-            "wins": 3,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 644.04,
-            "theoreticalWins": 22,
-            "theoreticalLosses": 23,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 7.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 2.5,
-            "totalRank": 14.5,
-            "wins": 3,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 600.2,
-            "theoreticalWins": 19,
-            "theoreticalLosses": 26,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 7.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 4.5,
-            "totalRank": 14.5,
-            "wins": 3,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 575.9,
-            "theoreticalWins": 20,
-            "theoreticalLosses": 25,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 7.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 2.5,
-            "totalRank": 13.5,
-            "wins": 3,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 577.44,
-            "theoreticalWins": 19,
-            "theoreticalLosses": 26,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 3.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 4.5,
-            "totalRank": 13.5,
-            "wins": 2,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 612.82,
-            "theoreticalWins": 20,
-            "theoreticalLosses": 25,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 3.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 6.5,
-            "totalRank": 11.5,
-            "wins": 2,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 563.76,
-            "theoreticalWins": 22,
-            "theoreticalLosses": 23,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 0,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 553.3,
-            "theoreticalWins": 14,
-            "theoreticalLosses": 31,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 6,
-        "managers": [
-          {
-            "manager": "John",
-            "recordRank": 10.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 30.0,
-            "wins": 5,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 879.08,
-            "theoreticalWins": 42,
-            "theoreticalLosses": 12,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 8.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 24.5,
-            "wins": 4,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 790.38,
-            "theoreticalWins": 33,
-            "theoreticalLosses": 21,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 5.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 23.5,
-            "wins": 3,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 815.72,
-            "theoreticalWins": 36,
-            "theoreticalLosses": 18,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 8.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 7.0,
-            "totalRank": 20.5,
-            "wins": 4,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 710.14,
-            "theoreticalWins": 28,
-            "theoreticalLosses": 26,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 5.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 3.0,
-            "totalRank": 15.5,
-            "wins": 3,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 719.84,
-            "theoreticalWins": 22,
-            "theoreticalLosses": 32,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 5.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.5,
-            "totalRank": 14.0,
-            "wins": 3,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 707.42,
-            "theoreticalWins": 23,
-            "theoreticalLosses": 31,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 2.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 4.5,
-            "totalRank": 13.0,
-            "wins": 2,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 718.1,
-            "theoreticalWins": 23,
-            "theoreticalLosses": 31,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 2.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 6.0,
-            "totalRank": 11.5,
-            "wins": 2,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 679.7,
-            "theoreticalWins": 27,
-            "theoreticalLosses": 27,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 5.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 9.5,
-            "wins": 3,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 670.28,
-            "theoreticalWins": 20,
-            "theoreticalLosses": 34,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 1,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 652.7,
-            "theoreticalWins": 16,
-            "theoreticalLosses": 38,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 7,
-        "managers": [
-          {
-            "manager": "John",
-            "recordRank": 10.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.0,
-            "wins": 6,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 1002.16,
-            "theoreticalWins": 50,
-            "theoreticalLosses": 13,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 7.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 9.0,
-            "totalRank": 26.0,
-            "wins": 4,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1003.3,
-            "theoreticalWins": 45,
-            "theoreticalLosses": 18,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 7.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 23.0,
-            "wins": 4,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 899.78,
-            "theoreticalWins": 37,
-            "theoreticalLosses": 26,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 7.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 21.0,
-            "wins": 4,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 828.88,
-            "theoreticalWins": 35,
-            "theoreticalLosses": 28,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 7.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 2.5,
-            "totalRank": 14.5,
-            "wins": 4,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 818.8,
-            "theoreticalWins": 23,
-            "theoreticalLosses": 40,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 7.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 4.0,
-            "totalRank": 14.0,
-            "wins": 4,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 786.46,
-            "theoreticalWins": 25,
-            "theoreticalLosses": 38,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 2.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 5.0,
-            "totalRank": 13.0,
-            "wins": 2,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 824.54,
-            "theoreticalWins": 26,
-            "theoreticalLosses": 37,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 4.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 2.5,
-            "totalRank": 10.5,
-            "wins": 3,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 792.64,
-            "theoreticalWins": 23,
-            "theoreticalLosses": 40,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 2.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 6.0,
-            "totalRank": 10.0,
-            "wins": 2,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 779.46,
-            "theoreticalWins": 29,
-            "theoreticalLosses": 34,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 2.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 4.0,
-            "wins": 2,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 769.3,
-            "theoreticalWins": 22,
-            "theoreticalLosses": 41,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 8,
-        "managers": [
-          {
-            "manager": "John",
-            "recordRank": 10.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 30.0,
-            "wins": 7,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 1147.42,
-            "theoreticalWins": 56,
-            "theoreticalLosses": 16,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 8.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 24.5,
-            "wins": 5,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1060.24,
-            "theoreticalWins": 45,
-            "theoreticalLosses": 27,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 6.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 24.0,
-            "wins": 4,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1140.94,
-            "theoreticalWins": 49,
-            "theoreticalLosses": 23,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 6.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.5,
-            "totalRank": 18.5,
-            "wins": 4,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 956.8,
-            "theoreticalWins": 38,
-            "theoreticalLosses": 34,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 3.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 6.5,
-            "totalRank": 16.5,
-            "wins": 3,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 967.04,
-            "theoreticalWins": 38,
-            "theoreticalLosses": 34,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 8.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 5.0,
-            "totalRank": 16.5,
-            "wins": 5,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 928.12,
-            "theoreticalWins": 30,
-            "theoreticalLosses": 42,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 6.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 2.0,
-            "totalRank": 12.0,
-            "wins": 4,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 936.1,
-            "theoreticalWins": 25,
-            "theoreticalLosses": 47,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 3.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 4.0,
-            "totalRank": 9.0,
-            "wins": 3,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 926.32,
-            "theoreticalWins": 29,
-            "theoreticalLosses": 43,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 1.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 3.0,
-            "totalRank": 9.0,
-            "wins": 2,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 940.24,
-            "theoreticalWins": 27,
-            "theoreticalLosses": 45,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 3.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 5.0,
-            "wins": 3,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 883.84,
-            "theoreticalWins": 23,
-            "theoreticalLosses": 49,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 9,
-        "managers": [
-          {
-            "manager": "John",
-            "recordRank": 10.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 30.0,
-            "wins": 8,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 1340.18,
-            "theoreticalWins": 65,
-            "theoreticalLosses": 16,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 7.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 25.0,
-            "wins": 5,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1252.98,
-            "theoreticalWins": 54,
-            "theoreticalLosses": 27,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 7.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 23.0,
-            "wins": 5,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1169.02,
-            "theoreticalWins": 48,
-            "theoreticalLosses": 33,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 7.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 19.0,
-            "wins": 5,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1076.28,
-            "theoreticalWins": 44,
-            "theoreticalLosses": 37,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 2.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 16.5,
-            "wins": 3,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1118.54,
-            "theoreticalWins": 46,
-            "theoreticalLosses": 35,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 9.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 4.0,
-            "totalRank": 16.0,
-            "wins": 6,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1034.54,
-            "theoreticalWins": 32,
-            "theoreticalLosses": 49,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 4.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 14.5,
-            "wins": 4,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1065.08,
-            "theoreticalWins": 36,
-            "theoreticalLosses": 45,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 4.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 3.0,
-            "totalRank": 11.5,
-            "wins": 4,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1047.64,
-            "theoreticalWins": 29,
-            "theoreticalLosses": 52,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 1.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 5.0,
-            "wins": 2,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1012.0,
-            "theoreticalWins": 27,
-            "theoreticalLosses": 54,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 2.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 4.5,
-            "wins": 3,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 977.56,
-            "theoreticalWins": 24,
-            "theoreticalLosses": 57,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 10,
-        "managers": [
-          {
-            "manager": "John",
-            "recordRank": 10.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 30.0,
-            "wins": 9,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 1522.2,
-            "theoreticalWins": 74,
-            "theoreticalLosses": 16,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 6.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 8.5,
-            "totalRank": 23.5,
-            "wins": 5,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1328.86,
-            "theoreticalWins": 54,
-            "theoreticalLosses": 36,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 6.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.5,
-            "totalRank": 22.5,
-            "wins": 5,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1284.9,
-            "theoreticalWins": 54,
-            "theoreticalLosses": 36,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 8.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 20.5,
-            "wins": 6,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1191.56,
-            "theoreticalWins": 49,
-            "theoreticalLosses": 41,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 3.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 17.0,
-            "wins": 4,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1232.64,
-            "theoreticalWins": 50,
-            "theoreticalLosses": 40,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 6.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 4.5,
-            "totalRank": 15.5,
-            "wins": 5,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1187.46,
-            "theoreticalWins": 37,
-            "theoreticalLosses": 53,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 8.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 14.5,
-            "wins": 6,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1130.34,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 56,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 3.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.5,
-            "totalRank": 11.5,
-            "wins": 4,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1154.34,
-            "theoreticalWins": 37,
-            "theoreticalLosses": 53,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 3.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 2.0,
-            "totalRank": 6.0,
-            "wins": 4,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1113.66,
-            "theoreticalWins": 31,
-            "theoreticalLosses": 59,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 1.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 1.0,
-            "totalRank": 4.0,
-            "wins": 2,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1123.24,
-            "theoreticalWins": 30,
-            "theoreticalLosses": 60,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 11,
-        "managers": [
-          {
-            "manager": "John",
-            "recordRank": 10.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 30.0,
-            "wins": 10,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 1697.48,
-            "theoreticalWins": 83,
-            "theoreticalLosses": 16,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 5.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 23.5,
-            "wins": 5,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1478.64,
-            "theoreticalWins": 62,
-            "theoreticalLosses": 37,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 8.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 7.5,
-            "totalRank": 22.0,
-            "wins": 7,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1322.68,
-            "theoreticalWins": 56,
-            "theoreticalLosses": 43,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 5.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 7.5,
-            "totalRank": 21.0,
-            "wins": 5,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1392.32,
-            "theoreticalWins": 56,
-            "theoreticalLosses": 43,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 5.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 6.0,
-            "totalRank": 18.5,
-            "wins": 5,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1347.5,
-            "theoreticalWins": 54,
-            "theoreticalLosses": 45,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 8.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 3.5,
-            "totalRank": 16.0,
-            "wins": 7,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1242.84,
-            "theoreticalWins": 37,
-            "theoreticalLosses": 62,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 5.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 15.5,
-            "wins": 5,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1308.28,
-            "theoreticalWins": 43,
-            "theoreticalLosses": 56,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 2.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 3.5,
-            "totalRank": 8.0,
-            "wins": 4,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1231.5,
-            "theoreticalWins": 37,
-            "theoreticalLosses": 62,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 1.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 2.0,
-            "totalRank": 6.0,
-            "wins": 3,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1241.66,
-            "theoreticalWins": 35,
-            "theoreticalLosses": 64,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 2.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 4.5,
-            "wins": 4,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1219.02,
-            "theoreticalWins": 32,
-            "theoreticalLosses": 67,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 12,
-        "managers": [
-          {
-            "manager": "John",
-            "recordRank": 10.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 30.0,
-            "wins": 11,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 1815.04,
-            "theoreticalWins": 85,
-            "theoreticalLosses": 23,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 6.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 24.5,
-            "wins": 6,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1629.48,
-            "theoreticalWins": 70,
-            "theoreticalLosses": 38,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 8.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 7.0,
-            "totalRank": 20.0,
-            "wins": 7,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1447.42,
-            "theoreticalWins": 61,
-            "theoreticalLosses": 47,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 4.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 20.0,
-            "wins": 5,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1524.66,
-            "theoreticalWins": 63,
-            "theoreticalLosses": 45,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 6.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 5.0,
-            "totalRank": 18.5,
-            "wins": 6,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1466.28,
-            "theoreticalWins": 52,
-            "theoreticalLosses": 56,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 9.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 17.0,
-            "wins": 8,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1371.3,
-            "theoreticalWins": 43,
-            "theoreticalLosses": 65,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 4.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 16.0,
-            "wins": 5,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1462.28,
-            "theoreticalWins": 55,
-            "theoreticalLosses": 53,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 4.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 1.0,
-            "totalRank": 7.0,
-            "wins": 5,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1341.44,
-            "theoreticalWins": 36,
-            "theoreticalLosses": 72,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 1.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 7.0,
-            "wins": 3,
-            "losses": 9,
-            "ties": 0,
-            "totalPoints": 1361.8,
-            "theoreticalWins": 38,
-            "theoreticalLosses": 70,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 2.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 2.0,
-            "totalRank": 5.0,
-            "wins": 4,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1329.22,
-            "theoreticalWins": 37,
-            "theoreticalLosses": 71,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 13,
-        "managers": [
-          {
-            "manager": "John",
-            "recordRank": 10.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 30.0,
-            "wins": 12,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 1962.72,
-            "theoreticalWins": 93,
-            "theoreticalLosses": 24,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 7.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 25.5,
-            "wins": 7,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1764.36,
-            "theoreticalWins": 76,
-            "theoreticalLosses": 41,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 7.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 7.0,
-            "totalRank": 19.5,
-            "wins": 7,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1522.36,
-            "theoreticalWins": 61,
-            "theoreticalLosses": 56,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 3.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 19.5,
-            "wins": 5,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1625.32,
-            "theoreticalWins": 65,
-            "theoreticalLosses": 52,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 5.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 17.5,
-            "wins": 6,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1585.48,
-            "theoreticalWins": 59,
-            "theoreticalLosses": 58,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 5.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 5.0,
-            "totalRank": 17.5,
-            "wins": 6,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1596.32,
-            "theoreticalWins": 57,
-            "theoreticalLosses": 60,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 9.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 17.0,
-            "wins": 9,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1519.08,
-            "theoreticalWins": 52,
-            "theoreticalLosses": 65,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 3.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 7.5,
-            "wins": 5,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1443.08,
-            "theoreticalWins": 39,
-            "theoreticalLosses": 78,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 1.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 7.5,
-            "wins": 4,
-            "losses": 9,
-            "ties": 0,
-            "totalPoints": 1500.34,
-            "theoreticalWins": 45,
-            "theoreticalLosses": 72,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 1.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.5,
-            "wins": 4,
-            "losses": 9,
-            "ties": 0,
-            "totalPoints": 1428.68,
-            "theoreticalWins": 38,
-            "theoreticalLosses": 79,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 14,
-        "managers": [
-          {
-            "manager": "John",
-            "recordRank": 10.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 30.0,
-            "wins": 12,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 2069.2,
-            "theoreticalWins": 96,
-            "theoreticalLosses": 30,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 8.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 26.0,
-            "wins": 8,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1907.78,
-            "theoreticalWins": 84,
-            "theoreticalLosses": 42,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 6.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 6.5,
-            "totalRank": 20.0,
-            "wins": 7,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1742.16,
-            "theoreticalWins": 66,
-            "theoreticalLosses": 60,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 4.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 20.0,
-            "wins": 6,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1760.24,
-            "theoreticalWins": 72,
-            "theoreticalLosses": 54,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 6.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 6.5,
-            "totalRank": 18.0,
-            "wins": 7,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1642.46,
-            "theoreticalWins": 66,
-            "theoreticalLosses": 60,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 9.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 17.0,
-            "wins": 10,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1626.0,
-            "theoreticalWins": 56,
-            "theoreticalLosses": 70,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 4.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 5.0,
-            "totalRank": 15.0,
-            "wins": 6,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1718.46,
-            "theoreticalWins": 65,
-            "theoreticalLosses": 61,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 4.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 8.0,
-            "wins": 6,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1525.06,
-            "theoreticalWins": 41,
-            "theoreticalLosses": 85,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 1.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 7.5,
-            "wins": 4,
-            "losses": 10,
-            "ties": 0,
-            "totalPoints": 1579.84,
-            "theoreticalWins": 45,
-            "theoreticalLosses": 81,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 1.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.5,
-            "wins": 4,
-            "losses": 10,
-            "ties": 0,
-            "totalPoints": 1508.72,
-            "theoreticalWins": 39,
-            "theoreticalLosses": 87,
-            "theoreticalTies": 0
-          }
-        ]
-      }
-    ],
-    "finalWeek": 14,
-    "finalRankings": [
-      {
-        "manager": "John",
-        "recordRank": 10.0,
-        "pointsRank": 10.0,
-        "breakdownRank": 10.0,
-        "totalRank": 30.0,
-        "wins": 12,
-        "losses": 2,
-        "ties": 0,
-        "totalPoints": 2069.2,
-        "theoreticalWins": 96,
-        "theoreticalLosses": 30,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Jason",
-        "recordRank": 8.0,
-        "pointsRank": 9.0,
-        "breakdownRank": 9.0,
-        "totalRank": 26.0,
-        "wins": 8,
-        "losses": 6,
-        "ties": 0,
-        "totalPoints": 1907.78,
-        "theoreticalWins": 84,
-        "theoreticalLosses": 42,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Vernon",
-        "recordRank": 6.5,
-        "pointsRank": 7.0,
-        "breakdownRank": 6.5,
-        "totalRank": 20.0,
-        "wins": 7,
-        "losses": 7,
-        "ties": 0,
-        "totalPoints": 1742.16,
-        "theoreticalWins": 66,
-        "theoreticalLosses": 60,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Joey",
-        "recordRank": 4.0,
-        "pointsRank": 8.0,
-        "breakdownRank": 8.0,
-        "totalRank": 20.0,
-        "wins": 6,
-        "losses": 8,
-        "ties": 0,
-        "totalPoints": 1760.24,
-        "theoreticalWins": 72,
-        "theoreticalLosses": 54,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Peter",
-        "recordRank": 6.5,
-        "pointsRank": 5.0,
-        "breakdownRank": 6.5,
-        "totalRank": 18.0,
-        "wins": 7,
-        "losses": 7,
-        "ties": 0,
-        "totalPoints": 1642.46,
-        "theoreticalWins": 66,
-        "theoreticalLosses": 60,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Tyler",
-        "recordRank": 9.0,
-        "pointsRank": 4.0,
-        "breakdownRank": 4.0,
-        "totalRank": 17.0,
-        "wins": 10,
-        "losses": 4,
-        "ties": 0,
-        "totalPoints": 1626.0,
-        "theoreticalWins": 56,
-        "theoreticalLosses": 70,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Matt",
-        "recordRank": 4.0,
-        "pointsRank": 6.0,
-        "breakdownRank": 5.0,
-        "totalRank": 15.0,
-        "wins": 6,
-        "losses": 8,
-        "ties": 0,
-        "totalPoints": 1718.46,
-        "theoreticalWins": 65,
-        "theoreticalLosses": 61,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Ben",
-        "recordRank": 4.0,
-        "pointsRank": 2.0,
-        "breakdownRank": 2.0,
-        "totalRank": 8.0,
-        "wins": 6,
-        "losses": 8,
-        "ties": 0,
-        "totalPoints": 1525.06,
-        "theoreticalWins": 41,
-        "theoreticalLosses": 85,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Lanny",
-        "recordRank": 1.5,
-        "pointsRank": 3.0,
-        "breakdownRank": 3.0,
-        "totalRank": 7.5,
-        "wins": 4,
-        "losses": 10,
-        "ties": 0,
-        "totalPoints": 1579.84,
-        "theoreticalWins": 45,
-        "theoreticalLosses": 81,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Ted",
-        "recordRank": 1.5,
-        "pointsRank": 1.0,
-        "breakdownRank": 1.0,
-        "totalRank": 3.5,
-        "wins": 4,
-        "losses": 10,
-        "ties": 0,
-        "totalPoints": 1508.72,
-        "theoreticalWins": 39,
-        "theoreticalLosses": 87,
-        "theoreticalTies": 0
-      }
-    ]
-  },
-  "2023": {
-    "weeks": [
-      {
-        "week": 1,
-        "managers": [
-          {
-            "manager": "Ted",
-            "recordRank": 8.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 136.38,
-            "theoreticalWins": 9,
-            "theoreticalLosses": 0,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 8.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 26.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 128.46,
-            "theoreticalWins": 8,
-            "theoreticalLosses": 1,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 8.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 24.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 120.92,
-            "theoreticalWins": 7,
-            "theoreticalLosses": 2,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 8.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 22.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 113.88,
-            "theoreticalWins": 6,
-            "theoreticalLosses": 3,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 8.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 16.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 97.4,
-            "theoreticalWins": 3,
-            "theoreticalLosses": 6,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 3.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 15.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 106.34,
-            "theoreticalWins": 5,
-            "theoreticalLosses": 4,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 3.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 13.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 103.72,
-            "theoreticalWins": 4,
-            "theoreticalLosses": 5,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 3.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 9.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 94.8,
-            "theoreticalWins": 2,
-            "theoreticalLosses": 7,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 3.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 7.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 91.68,
-            "theoreticalWins": 1,
-            "theoreticalLosses": 8,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 3.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 5.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 82.36,
-            "theoreticalWins": 0,
-            "theoreticalLosses": 9,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 2,
-        "managers": [
-          {
-            "manager": "Ted",
-            "recordRank": 9.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.5,
-            "wins": 2,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 268.82,
-            "theoreticalWins": 15,
-            "theoreticalLosses": 3,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 9.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 9.0,
-            "totalRank": 25.5,
-            "wins": 2,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 247.2,
-            "theoreticalWins": 13,
-            "theoreticalLosses": 5,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 5.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 7.5,
-            "totalRank": 21.0,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 257.58,
-            "theoreticalWins": 12,
-            "theoreticalLosses": 6,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 5.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 6.0,
-            "totalRank": 20.5,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 260.58,
-            "theoreticalWins": 10,
-            "theoreticalLosses": 8,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 5.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 7.5,
-            "totalRank": 19.0,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 245.08,
-            "theoreticalWins": 12,
-            "theoreticalLosses": 6,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 5.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 4.0,
-            "totalRank": 14.5,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 225.18,
-            "theoreticalWins": 7,
-            "theoreticalLosses": 11,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 5.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 13.5,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 219.86,
-            "theoreticalWins": 7,
-            "theoreticalLosses": 11,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 5.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 9.5,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 206.26,
-            "theoreticalWins": 4,
-            "theoreticalLosses": 14,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 1.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 4.0,
-            "totalRank": 8.5,
-            "wins": 0,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 215.32,
-            "theoreticalWins": 7,
-            "theoreticalLosses": 11,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 1.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.5,
-            "wins": 0,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 201.22,
-            "theoreticalWins": 3,
-            "theoreticalLosses": 15,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 3,
-        "managers": [
-          {
-            "manager": "Jason",
-            "recordRank": 8.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 9.0,
-            "totalRank": 27.0,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 431.72,
-            "theoreticalWins": 19,
-            "theoreticalLosses": 8,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 8.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 10.0,
-            "totalRank": 27.0,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 410.58,
-            "theoreticalWins": 20,
-            "theoreticalLosses": 7,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 8.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 22.0,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 391.3,
-            "theoreticalWins": 18,
-            "theoreticalLosses": 9,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 8.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 7.0,
-            "totalRank": 21.0,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 386.12,
-            "theoreticalWins": 18,
-            "theoreticalLosses": 9,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 8.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 18.0,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 362.56,
-            "theoreticalWins": 14,
-            "theoreticalLosses": 13,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 3.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 7.0,
-            "totalRank": 18.0,
-            "wins": 1,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 399.76,
-            "theoreticalWins": 18,
-            "theoreticalLosses": 9,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 3.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 2.5,
-            "totalRank": 9.5,
-            "wins": 1,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 333.3,
-            "theoreticalWins": 7,
-            "theoreticalLosses": 20,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 3.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 4.0,
-            "totalRank": 9.0,
-            "wins": 1,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 328.14,
-            "theoreticalWins": 8,
-            "theoreticalLosses": 19,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 3.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 1.0,
-            "totalRank": 7.0,
-            "wins": 1,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 328.5,
-            "theoreticalWins": 6,
-            "theoreticalLosses": 21,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 3.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 2.5,
-            "totalRank": 6.5,
-            "wins": 1,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 322.72,
-            "theoreticalWins": 7,
-            "theoreticalLosses": 20,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 4,
-        "managers": [
-          {
-            "manager": "Ted",
-            "recordRank": 9.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.5,
-            "wins": 3,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 588.18,
-            "theoreticalWins": 27,
-            "theoreticalLosses": 9,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 5.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 23.5,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 529.02,
-            "theoreticalWins": 24,
-            "theoreticalLosses": 12,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 9.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 5.5,
-            "totalRank": 21.0,
-            "wins": 3,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 490.74,
-            "theoreticalWins": 19,
-            "theoreticalLosses": 17,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 5.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 8.0,
-            "totalRank": 20.5,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 501.78,
-            "theoreticalWins": 21,
-            "theoreticalLosses": 15,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 5.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 5.5,
-            "totalRank": 19.0,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 510.02,
-            "theoreticalWins": 19,
-            "theoreticalLosses": 17,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 5.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 7.0,
-            "totalRank": 17.5,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 480.6,
-            "theoreticalWins": 20,
-            "theoreticalLosses": 16,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 5.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 13.5,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 470.94,
-            "theoreticalWins": 15,
-            "theoreticalLosses": 21,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 5.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 7.5,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 429.12,
-            "theoreticalWins": 10,
-            "theoreticalLosses": 26,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 1.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 7.5,
-            "wins": 1,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 459.8,
-            "theoreticalWins": 13,
-            "theoreticalLosses": 23,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 1.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 5.5,
-            "wins": 1,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 456.3,
-            "theoreticalWins": 12,
-            "theoreticalLosses": 24,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 5,
-        "managers": [
-          {
-            "manager": "Ted",
-            "recordRank": 7.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 27.5,
-            "wins": 3,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 709.02,
-            "theoreticalWins": 30,
-            "theoreticalLosses": 15,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 7.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 9.0,
-            "totalRank": 24.5,
-            "wins": 3,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 643.3,
-            "theoreticalWins": 28,
-            "theoreticalLosses": 17,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 7.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 7.0,
-            "totalRank": 23.5,
-            "wins": 3,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 653.78,
-            "theoreticalWins": 26,
-            "theoreticalLosses": 19,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 7.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 8.0,
-            "totalRank": 22.5,
-            "wins": 3,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 640.0,
-            "theoreticalWins": 27,
-            "theoreticalLosses": 18,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 7.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 5.0,
-            "totalRank": 16.5,
-            "wins": 3,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 614.64,
-            "theoreticalWins": 23,
-            "theoreticalLosses": 22,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 3.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 6.0,
-            "totalRank": 14.0,
-            "wins": 2,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 627.54,
-            "theoreticalWins": 24,
-            "theoreticalLosses": 21,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 3.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 4.0,
-            "totalRank": 13.0,
-            "wins": 2,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 639.24,
-            "theoreticalWins": 21,
-            "theoreticalLosses": 24,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 7.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 11.5,
-            "wins": 3,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 587.22,
-            "theoreticalWins": 17,
-            "theoreticalLosses": 28,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 1.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 7.0,
-            "wins": 1,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 591.4,
-            "theoreticalWins": 18,
-            "theoreticalLosses": 27,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 3.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 5.0,
-            "wins": 2,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 537.94,
-            "theoreticalWins": 11,
-            "theoreticalLosses": 34,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 6,
-        "managers": [
-          {
-            "manager": "Jason",
-            "recordRank": 9.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.0,
-            "wins": 4,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 805.16,
-            "theoreticalWins": 35,
-            "theoreticalLosses": 19,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 9.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.5,
-            "totalRank": 25.5,
-            "wins": 4,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 764.2,
-            "theoreticalWins": 33,
-            "theoreticalLosses": 21,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 5.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 8.5,
-            "totalRank": 24.0,
-            "wins": 3,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 811.8,
-            "theoreticalWins": 33,
-            "theoreticalLosses": 21,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 9.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 7.0,
-            "totalRank": 22.0,
-            "wins": 4,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 742.12,
-            "theoreticalWins": 31,
-            "theoreticalLosses": 23,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 5.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 5.5,
-            "totalRank": 18.0,
-            "wins": 3,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 763.12,
-            "theoreticalWins": 28,
-            "theoreticalLosses": 26,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 5.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 13.5,
-            "wins": 3,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 729.58,
-            "theoreticalWins": 27,
-            "theoreticalLosses": 27,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 2.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.5,
-            "totalRank": 12.5,
-            "wins": 2,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 732.16,
-            "theoreticalWins": 28,
-            "theoreticalLosses": 26,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 5.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 9.5,
-            "wins": 3,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 684.46,
-            "theoreticalWins": 19,
-            "theoreticalLosses": 35,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 2.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 8.0,
-            "wins": 2,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 712.98,
-            "theoreticalWins": 24,
-            "theoreticalLosses": 30,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 2.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 4.0,
-            "wins": 2,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 629.26,
-            "theoreticalWins": 12,
-            "theoreticalLosses": 42,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 7,
-        "managers": [
-          {
-            "manager": "Jason",
-            "recordRank": 9.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.5,
-            "wins": 5,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 942.58,
-            "theoreticalWins": 43,
-            "theoreticalLosses": 20,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 9.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 8.0,
-            "totalRank": 22.5,
-            "wins": 5,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 854.52,
-            "theoreticalWins": 37,
-            "theoreticalLosses": 26,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 4.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 8.0,
-            "totalRank": 21.0,
-            "wins": 3,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 921.04,
-            "theoreticalWins": 37,
-            "theoreticalLosses": 26,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 4.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 20.0,
-            "wins": 3,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 876.32,
-            "theoreticalWins": 37,
-            "theoreticalLosses": 26,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 7.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 19.5,
-            "wins": 4,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 859.62,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 29,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 7.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 5.0,
-            "totalRank": 16.5,
-            "wins": 4,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 839.08,
-            "theoreticalWins": 32,
-            "theoreticalLosses": 31,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 4.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 3.0,
-            "totalRank": 14.0,
-            "wins": 3,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 862.22,
-            "theoreticalWins": 30,
-            "theoreticalLosses": 33,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 4.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 4.0,
-            "totalRank": 11.0,
-            "wins": 3,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 838.44,
-            "theoreticalWins": 31,
-            "theoreticalLosses": 32,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 4.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 8.0,
-            "wins": 3,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 777.72,
-            "theoreticalWins": 19,
-            "theoreticalLosses": 44,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 2,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 734.5,
-            "theoreticalWins": 15,
-            "theoreticalLosses": 48,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 8,
-        "managers": [
-          {
-            "manager": "Tyler",
-            "recordRank": 10.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 9.0,
-            "totalRank": 27.0,
-            "wins": 6,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1000.3,
-            "theoreticalWins": 45,
-            "theoreticalLosses": 27,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 6.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 26.0,
-            "wins": 4,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1068.96,
-            "theoreticalWins": 46,
-            "theoreticalLosses": 26,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 9.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 8.0,
-            "totalRank": 26.0,
-            "wins": 5,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1045.66,
-            "theoreticalWins": 44,
-            "theoreticalLosses": 28,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 6.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 6.0,
-            "totalRank": 17.0,
-            "wins": 4,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 982.26,
-            "theoreticalWins": 38,
-            "theoreticalLosses": 34,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 2.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 7.0,
-            "totalRank": 15.0,
-            "wins": 3,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 992.6,
-            "theoreticalWins": 40,
-            "theoreticalLosses": 32,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 6.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 14.0,
-            "wins": 4,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 961.92,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 38,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 6.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 4.0,
-            "totalRank": 13.0,
-            "wins": 4,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 947.18,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 38,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 2.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 4.0,
-            "totalRank": 13.0,
-            "wins": 3,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 999.76,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 38,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 6.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 10.0,
-            "wins": 4,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 916.14,
-            "theoreticalWins": 25,
-            "theoreticalLosses": 47,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 2.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 4.0,
-            "wins": 3,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 872.7,
-            "theoreticalWins": 20,
-            "theoreticalLosses": 52,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 9,
-        "managers": [
-          {
-            "manager": "Tyler",
-            "recordRank": 10.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.0,
-            "wins": 7,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1125.54,
-            "theoreticalWins": 52,
-            "theoreticalLosses": 29,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 8.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 7.5,
-            "totalRank": 24.5,
-            "wins": 5,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1135.46,
-            "theoreticalWins": 46,
-            "theoreticalLosses": 35,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 4.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 9.0,
-            "totalRank": 23.0,
-            "wins": 4,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1148.36,
-            "theoreticalWins": 47,
-            "theoreticalLosses": 34,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 8.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 7.5,
-            "totalRank": 21.5,
-            "wins": 5,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1111.26,
-            "theoreticalWins": 46,
-            "theoreticalLosses": 35,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 4.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 5.0,
-            "totalRank": 16.0,
-            "wins": 4,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1124.54,
-            "theoreticalWins": 40,
-            "theoreticalLosses": 41,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 8.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 2.5,
-            "totalRank": 15.5,
-            "wins": 5,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1090.34,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 47,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 4.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 4.0,
-            "totalRank": 11.0,
-            "wins": 4,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1042.48,
-            "theoreticalWins": 38,
-            "theoreticalLosses": 43,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 1.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 6.0,
-            "totalRank": 11.0,
-            "wins": 3,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1087.58,
-            "theoreticalWins": 43,
-            "theoreticalLosses": 38,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 4.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.5,
-            "totalRank": 8.5,
-            "wins": 4,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1028.72,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 47,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 4.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 6.0,
-            "wins": 4,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 981.92,
-            "theoreticalWins": 25,
-            "theoreticalLosses": 56,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 10,
-        "managers": [
-          {
-            "manager": "Tyler",
-            "recordRank": 10.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.0,
-            "wins": 8,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1242.24,
-            "theoreticalWins": 54,
-            "theoreticalLosses": 36,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 6.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 8.5,
-            "totalRank": 24.0,
-            "wins": 5,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1267.38,
-            "theoreticalWins": 51,
-            "theoreticalLosses": 39,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 6.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 6.5,
-            "totalRank": 23.0,
-            "wins": 5,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1290.64,
-            "theoreticalWins": 49,
-            "theoreticalLosses": 41,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 6.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 5.0,
-            "totalRank": 18.5,
-            "wins": 5,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1241.7,
-            "theoreticalWins": 47,
-            "theoreticalLosses": 43,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 9.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 2.0,
-            "totalRank": 17.0,
-            "wins": 6,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1235.48,
-            "theoreticalWins": 40,
-            "theoreticalLosses": 50,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 6.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 6.5,
-            "totalRank": 17.0,
-            "wins": 5,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1229.74,
-            "theoreticalWins": 49,
-            "theoreticalLosses": 41,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 2.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 8.5,
-            "totalRank": 16.0,
-            "wins": 4,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1233.74,
-            "theoreticalWins": 51,
-            "theoreticalLosses": 39,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 2.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 4.0,
-            "totalRank": 8.5,
-            "wins": 4,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1169.74,
-            "theoreticalWins": 43,
-            "theoreticalLosses": 47,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 2.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 8.5,
-            "wins": 4,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1174.76,
-            "theoreticalWins": 41,
-            "theoreticalLosses": 49,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 2.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 4.5,
-            "wins": 4,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1056.5,
-            "theoreticalWins": 25,
-            "theoreticalLosses": 65,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 11,
-        "managers": [
-          {
-            "manager": "Joey",
-            "recordRank": 8.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 8.0,
-            "totalRank": 26.0,
-            "wins": 6,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1414.4,
-            "theoreticalWins": 55,
-            "theoreticalLosses": 44,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 10.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 9.0,
-            "totalRank": 24.0,
-            "wins": 9,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1353.88,
-            "theoreticalWins": 56,
-            "theoreticalLosses": 43,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 5.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 10.0,
-            "totalRank": 23.0,
-            "wins": 5,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1375.02,
-            "theoreticalWins": 60,
-            "theoreticalLosses": 39,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 5.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 7.0,
-            "totalRank": 21.0,
-            "wins": 5,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1379.54,
-            "theoreticalWins": 54,
-            "theoreticalLosses": 45,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 9.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 2.5,
-            "totalRank": 18.5,
-            "wins": 7,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1365.14,
-            "theoreticalWins": 47,
-            "theoreticalLosses": 52,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 5.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 17.0,
-            "wins": 5,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1363.12,
-            "theoreticalWins": 52,
-            "theoreticalLosses": 47,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 5.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.5,
-            "totalRank": 13.5,
-            "wins": 5,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1306.3,
-            "theoreticalWins": 49,
-            "theoreticalLosses": 50,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 5.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 4.5,
-            "totalRank": 12.5,
-            "wins": 5,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1305.78,
-            "theoreticalWins": 49,
-            "theoreticalLosses": 50,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 1.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.5,
-            "totalRank": 6.0,
-            "wins": 4,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1282.42,
-            "theoreticalWins": 47,
-            "theoreticalLosses": 52,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 1.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.5,
-            "wins": 4,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1166.74,
-            "theoreticalWins": 26,
-            "theoreticalLosses": 73,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 12,
-        "managers": [
-          {
-            "manager": "Joey",
-            "recordRank": 8.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 8.5,
-            "totalRank": 26.5,
-            "wins": 7,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1573.22,
-            "theoreticalWins": 63,
-            "theoreticalLosses": 45,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 10.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 8.5,
-            "totalRank": 24.5,
-            "wins": 10,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1494.96,
-            "theoreticalWins": 63,
-            "theoreticalLosses": 45,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 9.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 6.0,
-            "totalRank": 24.0,
-            "wins": 8,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1553.04,
-            "theoreticalWins": 56,
-            "theoreticalLosses": 52,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 7.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 7.0,
-            "totalRank": 22.0,
-            "wins": 6,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1517.24,
-            "theoreticalWins": 60,
-            "theoreticalLosses": 48,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 4.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 10.0,
-            "totalRank": 21.0,
-            "wins": 5,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1505.26,
-            "theoreticalWins": 65,
-            "theoreticalLosses": 43,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 4.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 5.0,
-            "totalRank": 13.0,
-            "wins": 5,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1435.18,
-            "theoreticalWins": 53,
-            "theoreticalLosses": 55,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 4.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 3.5,
-            "totalRank": 12.5,
-            "wins": 5,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1475.44,
-            "theoreticalWins": 52,
-            "theoreticalLosses": 56,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 4.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.5,
-            "totalRank": 10.5,
-            "wins": 5,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1424.76,
-            "theoreticalWins": 52,
-            "theoreticalLosses": 56,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 4.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 8.0,
-            "wins": 5,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1396.06,
-            "theoreticalWins": 48,
-            "theoreticalLosses": 60,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 4,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1283.98,
-            "theoreticalWins": 28,
-            "theoreticalLosses": 80,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 13,
-        "managers": [
-          {
-            "manager": "Tyler",
-            "recordRank": 10.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 9.0,
-            "totalRank": 26.0,
-            "wins": 11,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1653.7,
-            "theoreticalWins": 71,
-            "theoreticalLosses": 46,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 8.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 8.0,
-            "totalRank": 26.0,
-            "wins": 7,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1714.26,
-            "theoreticalWins": 68,
-            "theoreticalLosses": 49,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 5.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 10.0,
-            "totalRank": 24.5,
-            "wins": 6,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1662.48,
-            "theoreticalWins": 72,
-            "theoreticalLosses": 45,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 9.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 5.0,
-            "totalRank": 22.0,
-            "wins": 8,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1662.32,
-            "theoreticalWins": 57,
-            "theoreticalLosses": 60,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 5.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 7.0,
-            "totalRank": 18.5,
-            "wins": 6,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1642.92,
-            "theoreticalWins": 61,
-            "theoreticalLosses": 56,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 5.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 6.0,
-            "totalRank": 16.5,
-            "wins": 6,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1594.78,
-            "theoreticalWins": 60,
-            "theoreticalLosses": 57,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 5.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 13.5,
-            "wins": 6,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1558.08,
-            "theoreticalWins": 56,
-            "theoreticalLosses": 61,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 2.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 8.0,
-            "wins": 5,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1544.66,
-            "theoreticalWins": 54,
-            "theoreticalLosses": 63,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 2.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 6.0,
-            "wins": 5,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1521.5,
-            "theoreticalWins": 52,
-            "theoreticalLosses": 65,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 2.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 4.0,
-            "wins": 5,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1426.44,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 83,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 14,
-        "managers": [
-          {
-            "manager": "Joey",
-            "recordRank": 8.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 9.0,
-            "totalRank": 27.5,
-            "wins": 8,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1858.56,
-            "theoreticalWins": 77,
-            "theoreticalLosses": 49,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 10.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 8.0,
-            "totalRank": 24.0,
-            "wins": 12,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1757.96,
-            "theoreticalWins": 73,
-            "theoreticalLosses": 53,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 4.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 10.0,
-            "totalRank": 23.0,
-            "wins": 6,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1797.94,
-            "theoreticalWins": 79,
-            "theoreticalLosses": 47,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 7.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 7.0,
-            "totalRank": 22.0,
-            "wins": 7,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1784.94,
-            "theoreticalWins": 69,
-            "theoreticalLosses": 57,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 8.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 5.0,
-            "totalRank": 20.5,
-            "wins": 8,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1773.68,
-            "theoreticalWins": 60,
-            "theoreticalLosses": 66,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 4.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 6.0,
-            "totalRank": 15.0,
-            "wins": 6,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1706.44,
-            "theoreticalWins": 64,
-            "theoreticalLosses": 62,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 4.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 3.5,
-            "totalRank": 11.5,
-            "wins": 6,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1656.58,
-            "theoreticalWins": 57,
-            "theoreticalLosses": 69,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 4.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.5,
-            "totalRank": 10.5,
-            "wins": 6,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1639.66,
-            "theoreticalWins": 57,
-            "theoreticalLosses": 69,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 4.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 6.0,
-            "wins": 6,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1547.94,
-            "theoreticalWins": 40,
-            "theoreticalLosses": 86,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 1.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 5.0,
-            "wins": 5,
-            "losses": 9,
-            "ties": 0,
-            "totalPoints": 1634.64,
-            "theoreticalWins": 54,
-            "theoreticalLosses": 72,
-            "theoreticalTies": 0
-          }
-        ]
-      }
-    ],
-    "finalWeek": 14,
-    "finalRankings": [
-      {
-        "manager": "Joey",
-        "recordRank": 8.5,
-        "pointsRank": 10.0,
-        "breakdownRank": 9.0,
-        "totalRank": 27.5,
-        "wins": 8,
-        "losses": 6,
-        "ties": 0,
-        "totalPoints": 1858.56,
-        "theoreticalWins": 77,
-        "theoreticalLosses": 49,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Tyler",
-        "recordRank": 10.0,
-        "pointsRank": 6.0,
-        "breakdownRank": 8.0,
-        "totalRank": 24.0,
-        "wins": 12,
-        "losses": 2,
-        "ties": 0,
-        "totalPoints": 1757.96,
-        "theoreticalWins": 73,
-        "theoreticalLosses": 53,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Peter",
-        "recordRank": 4.0,
-        "pointsRank": 9.0,
-        "breakdownRank": 10.0,
-        "totalRank": 23.0,
-        "wins": 6,
-        "losses": 8,
-        "ties": 0,
-        "totalPoints": 1797.94,
-        "theoreticalWins": 79,
-        "theoreticalLosses": 47,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Jason",
-        "recordRank": 7.0,
-        "pointsRank": 8.0,
-        "breakdownRank": 7.0,
-        "totalRank": 22.0,
-        "wins": 7,
-        "losses": 7,
-        "ties": 0,
-        "totalPoints": 1784.94,
-        "theoreticalWins": 69,
-        "theoreticalLosses": 57,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Matt",
-        "recordRank": 8.5,
-        "pointsRank": 7.0,
-        "breakdownRank": 5.0,
-        "totalRank": 20.5,
-        "wins": 8,
-        "losses": 6,
-        "ties": 0,
-        "totalPoints": 1773.68,
-        "theoreticalWins": 60,
-        "theoreticalLosses": 66,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Ted",
-        "recordRank": 4.0,
-        "pointsRank": 5.0,
-        "breakdownRank": 6.0,
-        "totalRank": 15.0,
-        "wins": 6,
-        "losses": 8,
-        "ties": 0,
-        "totalPoints": 1706.44,
-        "theoreticalWins": 64,
-        "theoreticalLosses": 62,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Ben",
-        "recordRank": 4.0,
-        "pointsRank": 4.0,
-        "breakdownRank": 3.5,
-        "totalRank": 11.5,
-        "wins": 6,
-        "losses": 8,
-        "ties": 0,
-        "totalPoints": 1656.58,
-        "theoreticalWins": 57,
-        "theoreticalLosses": 69,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Lanny",
-        "recordRank": 4.0,
-        "pointsRank": 3.0,
-        "breakdownRank": 3.5,
-        "totalRank": 10.5,
-        "wins": 6,
-        "losses": 8,
-        "ties": 0,
-        "totalPoints": 1639.66,
-        "theoreticalWins": 57,
-        "theoreticalLosses": 69,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Vernon",
-        "recordRank": 4.0,
-        "pointsRank": 1.0,
-        "breakdownRank": 1.0,
-        "totalRank": 6.0,
-        "wins": 6,
-        "losses": 8,
-        "ties": 0,
-        "totalPoints": 1547.94,
-        "theoreticalWins": 40,
-        "theoreticalLosses": 86,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "John",
-        "recordRank": 1.0,
-        "pointsRank": 2.0,
-        "breakdownRank": 2.0,
-        "totalRank": 5.0,
-        "wins": 5,
-        "losses": 9,
-        "ties": 0,
-        "totalPoints": 1634.64,
-        "theoreticalWins": 54,
-        "theoreticalLosses": 72,
-        "theoreticalTies": 0
-      }
-    ]
-  },
-  "2024": {
-    "weeks": [
-      {
-        "week": 1,
-        "managers": [
-          {
-            "manager": "Vernon",
-            "recordRank": 8.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 133.94,
-            "theoreticalWins": 9,
-            "theoreticalLosses": 0,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 8.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 26.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 132.28,
-            "theoreticalWins": 8,
-            "theoreticalLosses": 1,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 8.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 24.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 126.76,
-            "theoreticalWins": 7,
-            "theoreticalLosses": 2,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 8.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 20.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 119.7,
-            "theoreticalWins": 5,
-            "theoreticalLosses": 4,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 3.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 17.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 121.26,
-            "theoreticalWins": 6,
-            "theoreticalLosses": 3,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 8.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 16.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 105.42,
-            "theoreticalWins": 3,
-            "theoreticalLosses": 6,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 3.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 13.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 105.98,
-            "theoreticalWins": 4,
-            "theoreticalLosses": 5,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 3.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 9.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 104.74,
-            "theoreticalWins": 2,
-            "theoreticalLosses": 7,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 3.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 7.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 96.2,
-            "theoreticalWins": 1,
-            "theoreticalLosses": 8,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 3.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 5.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 92.94,
-            "theoreticalWins": 0,
-            "theoreticalLosses": 9,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 2,
-        "managers": [
-          {
-            "manager": "Peter",
-            "recordRank": 8.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 9.5,
-            "totalRank": 26.0,
-            "wins": 2,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 253.48,
-            "theoreticalWins": 13,
-            "theoreticalLosses": 5,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 8.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 7.5,
-            "totalRank": 26.0,
-            "wins": 2,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 261.38,
-            "theoreticalWins": 12,
-            "theoreticalLosses": 6,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 5.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.5,
-            "totalRank": 24.0,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 255.42,
-            "theoreticalWins": 13,
-            "theoreticalLosses": 5,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 8.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.5,
-            "totalRank": 23.0,
-            "wins": 2,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 253.2,
-            "theoreticalWins": 12,
-            "theoreticalLosses": 6,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 8.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 20.5,
-            "wins": 2,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 250.42,
-            "theoreticalWins": 11,
-            "theoreticalLosses": 7,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 5.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 15.5,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 222.9,
-            "theoreticalWins": 9,
-            "theoreticalLosses": 9,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 2.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 10.5,
-            "wins": 0,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 222.44,
-            "theoreticalWins": 8,
-            "theoreticalLosses": 10,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 2.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 2.5,
-            "totalRank": 8.0,
-            "wins": 0,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 216.7,
-            "theoreticalWins": 5,
-            "theoreticalLosses": 13,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 2.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.5,
-            "totalRank": 7.0,
-            "wins": 0,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 212.7,
-            "theoreticalWins": 5,
-            "theoreticalLosses": 13,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 2.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 4.5,
-            "wins": 0,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 196.86,
-            "theoreticalWins": 2,
-            "theoreticalLosses": 16,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 3,
-        "managers": [
-          {
-            "manager": "Matt",
-            "recordRank": 7.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 27.5,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 399.64,
-            "theoreticalWins": 19,
-            "theoreticalLosses": 8,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 9.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 8.5,
-            "totalRank": 27.0,
-            "wins": 3,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 383.72,
-            "theoreticalWins": 17,
-            "theoreticalLosses": 10,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 9.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.5,
-            "totalRank": 26.0,
-            "wins": 3,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 373.84,
-            "theoreticalWins": 17,
-            "theoreticalLosses": 10,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 7.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 6.5,
-            "totalRank": 19.0,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 361.36,
-            "theoreticalWins": 14,
-            "theoreticalLosses": 13,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 4.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 4.5,
-            "totalRank": 15.5,
-            "wins": 1,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 371.02,
-            "theoreticalWins": 13,
-            "theoreticalLosses": 14,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 4.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 6.5,
-            "totalRank": 14.5,
-            "wins": 1,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 356.52,
-            "theoreticalWins": 14,
-            "theoreticalLosses": 13,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 4.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 3.0,
-            "totalRank": 13.0,
-            "wins": 1,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 367.4,
-            "theoreticalWins": 11,
-            "theoreticalLosses": 16,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 4.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 4.5,
-            "totalRank": 9.5,
-            "wins": 1,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 323.14,
-            "theoreticalWins": 13,
-            "theoreticalLosses": 14,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 4.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 8.0,
-            "wins": 1,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 324.54,
-            "theoreticalWins": 10,
-            "theoreticalLosses": 17,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 1.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 1.0,
-            "totalRank": 5.0,
-            "wins": 0,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 326.38,
-            "theoreticalWins": 7,
-            "theoreticalLosses": 20,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 4,
-        "managers": [
-          {
-            "manager": "Joey",
-            "recordRank": 10.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 28.0,
-            "wins": 4,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 513.68,
-            "theoreticalWins": 24,
-            "theoreticalLosses": 12,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 5.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 25.5,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 535.58,
-            "theoreticalWins": 27,
-            "theoreticalLosses": 9,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 8.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 24.5,
-            "wins": 3,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 507.66,
-            "theoreticalWins": 23,
-            "theoreticalLosses": 13,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 8.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 22.5,
-            "wins": 3,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 492.9,
-            "theoreticalWins": 22,
-            "theoreticalLosses": 14,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 5.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 17.5,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 491.1,
-            "theoreticalWins": 19,
-            "theoreticalLosses": 17,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 5.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.5,
-            "totalRank": 14.0,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 454.12,
-            "theoreticalWins": 16,
-            "theoreticalLosses": 20,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 5.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 3.0,
-            "totalRank": 13.5,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 477.48,
-            "theoreticalWins": 15,
-            "theoreticalLosses": 21,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 2.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 4.5,
-            "totalRank": 10.0,
-            "wins": 1,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 427.22,
-            "theoreticalWins": 16,
-            "theoreticalLosses": 20,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 2.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 2.0,
-            "totalRank": 5.5,
-            "wins": 1,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 418.82,
-            "theoreticalWins": 10,
-            "theoreticalLosses": 26,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 1.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 1.0,
-            "totalRank": 4.0,
-            "wins": 0,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 422.82,
-            "theoreticalWins": 8,
-            "theoreticalLosses": 28,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 5,
-        "managers": [
-          {
-            "manager": "Matt",
-            "recordRank": 7.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 27.0,
-            "wins": 3,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 675.32,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 11,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 9.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 8.5,
-            "totalRank": 25.0,
-            "wins": 4,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 621.1,
-            "theoreticalWins": 27,
-            "theoreticalLosses": 18,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 7.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.5,
-            "totalRank": 23.5,
-            "wins": 3,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 627.16,
-            "theoreticalWins": 27,
-            "theoreticalLosses": 18,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 7.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 6.0,
-            "totalRank": 22.0,
-            "wins": 3,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 652.2,
-            "theoreticalWins": 24,
-            "theoreticalLosses": 21,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 9.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 6.0,
-            "totalRank": 20.5,
-            "wins": 4,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 602.12,
-            "theoreticalWins": 24,
-            "theoreticalLosses": 21,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 4.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 4.0,
-            "totalRank": 14.0,
-            "wins": 2,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 609.8,
-            "theoreticalWins": 22,
-            "theoreticalLosses": 23,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 4.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 6.0,
-            "totalRank": 14.0,
-            "wins": 2,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 576.62,
-            "theoreticalWins": 24,
-            "theoreticalLosses": 21,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 4.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 10.0,
-            "wins": 2,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 559.58,
-            "theoreticalWins": 17,
-            "theoreticalLosses": 28,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 1.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 5.5,
-            "wins": 1,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 556.04,
-            "theoreticalWins": 14,
-            "theoreticalLosses": 31,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 1.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.5,
-            "wins": 1,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 535.36,
-            "theoreticalWins": 12,
-            "theoreticalLosses": 33,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 6,
-        "managers": [
-          {
-            "manager": "Peter",
-            "recordRank": 9.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 9.5,
-            "totalRank": 27.0,
-            "wins": 5,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 762.16,
-            "theoreticalWins": 35,
-            "theoreticalLosses": 19,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 8.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 6.5,
-            "totalRank": 24.5,
-            "wins": 4,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 792.3,
-            "theoreticalWins": 30,
-            "theoreticalLosses": 24,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 5.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.5,
-            "totalRank": 24.0,
-            "wins": 3,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 781.5,
-            "theoreticalWins": 35,
-            "theoreticalLosses": 19,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 5.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 8.0,
-            "totalRank": 20.5,
-            "wins": 3,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 752.0,
-            "theoreticalWins": 31,
-            "theoreticalLosses": 23,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 5.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.5,
-            "totalRank": 18.0,
-            "wins": 3,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 738.84,
-            "theoreticalWins": 30,
-            "theoreticalLosses": 24,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 9.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 17.5,
-            "wins": 5,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 711.74,
-            "theoreticalWins": 26,
-            "theoreticalLosses": 28,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 3.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 13.0,
-            "wins": 2,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 711.98,
-            "theoreticalWins": 29,
-            "theoreticalLosses": 25,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 5.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 11.5,
-            "wins": 3,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 700.06,
-            "theoreticalWins": 24,
-            "theoreticalLosses": 30,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 1.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 2.0,
-            "totalRank": 4.5,
-            "wins": 1,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 656.16,
-            "theoreticalWins": 16,
-            "theoreticalLosses": 38,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 1.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 1.0,
-            "totalRank": 4.5,
-            "wins": 1,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 660.92,
-            "theoreticalWins": 14,
-            "theoreticalLosses": 40,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 7,
-        "managers": [
-          {
-            "manager": "Peter",
-            "recordRank": 10.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 9.0,
-            "totalRank": 27.0,
-            "wins": 6,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 904.86,
-            "theoreticalWins": 42,
-            "theoreticalLosses": 21,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 6.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 26.0,
-            "wins": 4,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 940.48,
-            "theoreticalWins": 44,
-            "theoreticalLosses": 19,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 6.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 8.0,
-            "totalRank": 23.0,
-            "wins": 4,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 930.42,
-            "theoreticalWins": 36,
-            "theoreticalLosses": 27,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 6.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 20.0,
-            "wins": 4,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 865.8,
-            "theoreticalWins": 35,
-            "theoreticalLosses": 28,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 6.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 6.0,
-            "totalRank": 17.0,
-            "wins": 4,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 832.94,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 29,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 6.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 5.0,
-            "totalRank": 17.0,
-            "wins": 4,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 842.96,
-            "theoreticalWins": 32,
-            "theoreticalLosses": 31,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 9.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 15.0,
-            "wins": 5,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 783.2,
-            "theoreticalWins": 26,
-            "theoreticalLosses": 37,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 3.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 11.0,
-            "wins": 2,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 789.68,
-            "theoreticalWins": 30,
-            "theoreticalLosses": 33,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 1.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 5.5,
-            "wins": 1,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 782.48,
-            "theoreticalWins": 20,
-            "theoreticalLosses": 43,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 1.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.5,
-            "wins": 1,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 739.72,
-            "theoreticalWins": 16,
-            "theoreticalLosses": 47,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 8,
-        "managers": [
-          {
-            "manager": "Peter",
-            "recordRank": 10.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 28.0,
-            "wins": 7,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 1056.64,
-            "theoreticalWins": 46,
-            "theoreticalLosses": 26,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 5.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 25.0,
-            "wins": 4,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1065.18,
-            "theoreticalWins": 47,
-            "theoreticalLosses": 25,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 8.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 8.0,
-            "totalRank": 23.0,
-            "wins": 5,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1026.78,
-            "theoreticalWins": 43,
-            "theoreticalLosses": 29,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 8.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 7.0,
-            "totalRank": 21.0,
-            "wins": 5,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1004.08,
-            "theoreticalWins": 41,
-            "theoreticalLosses": 31,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 5.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 6.0,
-            "totalRank": 19.0,
-            "wins": 4,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1042.68,
-            "theoreticalWins": 38,
-            "theoreticalLosses": 34,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 8.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 3.0,
-            "totalRank": 15.0,
-            "wins": 5,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 938.62,
-            "theoreticalWins": 32,
-            "theoreticalLosses": 40,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 3.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 13.0,
-            "wins": 3,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 945.38,
-            "theoreticalWins": 37,
-            "theoreticalLosses": 35,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 5.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 4.0,
-            "totalRank": 11.0,
-            "wins": 4,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 923.64,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 38,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 2.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 2.0,
-            "totalRank": 7.0,
-            "wins": 2,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 936.5,
-            "theoreticalWins": 25,
-            "theoreticalLosses": 47,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 1,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 842.12,
-            "theoreticalWins": 17,
-            "theoreticalLosses": 55,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 9,
-        "managers": [
-          {
-            "manager": "Matt",
-            "recordRank": 6.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 26.0,
-            "wins": 5,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1191.34,
-            "theoreticalWins": 52,
-            "theoreticalLosses": 29,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 8.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 9.0,
-            "totalRank": 25.5,
-            "wins": 6,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1162.38,
-            "theoreticalWins": 50,
-            "theoreticalLosses": 31,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 10.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 6.0,
-            "totalRank": 23.0,
-            "wins": 7,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1159.9,
-            "theoreticalWins": 46,
-            "theoreticalLosses": 35,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 6.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 6.0,
-            "totalRank": 21.0,
-            "wins": 5,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1186.26,
-            "theoreticalWins": 46,
-            "theoreticalLosses": 35,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 6.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 8.0,
-            "totalRank": 20.0,
-            "wins": 5,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1136.7,
-            "theoreticalWins": 47,
-            "theoreticalLosses": 34,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 3.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 6.0,
-            "totalRank": 14.5,
-            "wins": 4,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1091.18,
-            "theoreticalWins": 46,
-            "theoreticalLosses": 35,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 8.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 14.5,
-            "wins": 6,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1050.44,
-            "theoreticalWins": 33,
-            "theoreticalLosses": 48,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 3.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 4.0,
-            "totalRank": 9.5,
-            "wins": 4,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1039.96,
-            "theoreticalWins": 36,
-            "theoreticalLosses": 45,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 2.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 2.0,
-            "totalRank": 8.0,
-            "wins": 2,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1059.2,
-            "theoreticalWins": 29,
-            "theoreticalLosses": 52,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 1,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 962.82,
-            "theoreticalWins": 20,
-            "theoreticalLosses": 61,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 10,
-        "managers": [
-          {
-            "manager": "Peter",
-            "recordRank": 10.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 8.0,
-            "totalRank": 27.0,
-            "wins": 8,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1298.14,
-            "theoreticalWins": 54,
-            "theoreticalLosses": 36,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 7.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 9.0,
-            "totalRank": 26.0,
-            "wins": 6,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1330.32,
-            "theoreticalWins": 55,
-            "theoreticalLosses": 35,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 7.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 10.0,
-            "totalRank": 25.0,
-            "wins": 6,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1296.92,
-            "theoreticalWins": 56,
-            "theoreticalLosses": 34,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 7.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 6.5,
-            "totalRank": 20.5,
-            "wins": 6,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1259.1,
-            "theoreticalWins": 51,
-            "theoreticalLosses": 39,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 5.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 5.0,
-            "totalRank": 16.0,
-            "wins": 5,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1236.08,
-            "theoreticalWins": 49,
-            "theoreticalLosses": 41,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 9.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.5,
-            "totalRank": 15.5,
-            "wins": 7,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1174.36,
-            "theoreticalWins": 39,
-            "theoreticalLosses": 51,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 3.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 6.5,
-            "totalRank": 15.0,
-            "wins": 4,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1207.32,
-            "theoreticalWins": 51,
-            "theoreticalLosses": 39,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 3.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 3.5,
-            "totalRank": 9.0,
-            "wins": 4,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1145.34,
-            "theoreticalWins": 39,
-            "theoreticalLosses": 51,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 2.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 2.0,
-            "totalRank": 8.0,
-            "wins": 3,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1193.54,
-            "theoreticalWins": 36,
-            "theoreticalLosses": 54,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 1,
-            "losses": 9,
-            "ties": 0,
-            "totalPoints": 1031.9,
-            "theoreticalWins": 20,
-            "theoreticalLosses": 70,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 11,
-        "managers": [
-          {
-            "manager": "Matt",
-            "recordRank": 8.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 10.0,
-            "totalRank": 27.5,
-            "wins": 7,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1470.76,
-            "theoreticalWins": 65,
-            "theoreticalLosses": 34,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 10.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 26.0,
-            "wins": 8,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1434.34,
-            "theoreticalWins": 59,
-            "theoreticalLosses": 40,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 6.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 9.0,
-            "totalRank": 25.0,
-            "wins": 6,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1473.8,
-            "theoreticalWins": 61,
-            "theoreticalLosses": 38,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 6.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 20.0,
-            "wins": 6,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1388.48,
-            "theoreticalWins": 56,
-            "theoreticalLosses": 43,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 6.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 5.0,
-            "totalRank": 17.0,
-            "wins": 6,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1369.98,
-            "theoreticalWins": 52,
-            "theoreticalLosses": 47,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 3.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 6.0,
-            "totalRank": 13.5,
-            "wins": 5,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1335.0,
-            "theoreticalWins": 54,
-            "theoreticalLosses": 45,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 8.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 2.0,
-            "totalRank": 13.5,
-            "wins": 7,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1298.22,
-            "theoreticalWins": 41,
-            "theoreticalLosses": 58,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 2.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 4.0,
-            "totalRank": 11.0,
-            "wins": 4,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1347.7,
-            "theoreticalWins": 44,
-            "theoreticalLosses": 55,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 3.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 3.0,
-            "totalRank": 8.5,
-            "wins": 5,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1279.5,
-            "theoreticalWins": 43,
-            "theoreticalLosses": 56,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 1,
-            "losses": 10,
-            "ties": 0,
-            "totalPoints": 1108.26,
-            "theoreticalWins": 20,
-            "theoreticalLosses": 79,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 12,
-        "managers": [
-          {
-            "manager": "Ted",
-            "recordRank": 7.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 27.5,
-            "wins": 7,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1627.72,
-            "theoreticalWins": 69,
-            "theoreticalLosses": 39,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 9.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 27.5,
-            "wins": 8,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1573.24,
-            "theoreticalWins": 67,
-            "theoreticalLosses": 41,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 9.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 25.5,
-            "wins": 8,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1564.1,
-            "theoreticalWins": 64,
-            "theoreticalLosses": 44,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 4.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 6.0,
-            "totalRank": 17.5,
-            "wins": 6,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1503.9,
-            "theoreticalWins": 59,
-            "theoreticalLosses": 49,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 4.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 7.0,
-            "totalRank": 16.5,
-            "wins": 6,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1472.02,
-            "theoreticalWins": 60,
-            "theoreticalLosses": 48,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 4.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 5.0,
-            "totalRank": 13.5,
-            "wins": 6,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1468.66,
-            "theoreticalWins": 53,
-            "theoreticalLosses": 55,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 4.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 4.0,
-            "totalRank": 11.5,
-            "wins": 6,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1443.48,
-            "theoreticalWins": 52,
-            "theoreticalLosses": 56,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 7.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 11.5,
-            "wins": 7,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1417.64,
-            "theoreticalWins": 45,
-            "theoreticalLosses": 63,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 2.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 3.0,
-            "totalRank": 11.0,
-            "wins": 5,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1488.48,
-            "theoreticalWins": 51,
-            "theoreticalLosses": 57,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 1,
-            "losses": 11,
-            "ties": 0,
-            "totalPoints": 1194.32,
-            "theoreticalWins": 20,
-            "theoreticalLosses": 88,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 13,
-        "managers": [
-          {
-            "manager": "Ted",
-            "recordRank": 8.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.0,
-            "wins": 8,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1788.72,
-            "theoreticalWins": 77,
-            "theoreticalLosses": 40,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 8.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 26.0,
-            "wins": 8,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1713.16,
-            "theoreticalWins": 71,
-            "theoreticalLosses": 46,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 10.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 26.0,
-            "wins": 9,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1710.54,
-            "theoreticalWins": 70,
-            "theoreticalLosses": 47,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 6.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 20.0,
-            "wins": 7,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1631.32,
-            "theoreticalWins": 61,
-            "theoreticalLosses": 56,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 8.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 14.0,
-            "wins": 8,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1580.98,
-            "theoreticalWins": 54,
-            "theoreticalLosses": 63,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 4.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 5.0,
-            "totalRank": 13.0,
-            "wins": 6,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1595.72,
-            "theoreticalWins": 59,
-            "theoreticalLosses": 58,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 4.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 4.0,
-            "totalRank": 13.0,
-            "wins": 6,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1602.24,
-            "theoreticalWins": 56,
-            "theoreticalLosses": 61,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 4.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 6.0,
-            "totalRank": 12.0,
-            "wins": 6,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1580.84,
-            "theoreticalWins": 60,
-            "theoreticalLosses": 57,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 2.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 2.0,
-            "totalRank": 10.0,
-            "wins": 5,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1615.8,
-            "theoreticalWins": 52,
-            "theoreticalLosses": 65,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 2,
-            "losses": 11,
-            "ties": 0,
-            "totalPoints": 1337.16,
-            "theoreticalWins": 25,
-            "theoreticalLosses": 92,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 14,
-        "managers": [
-          {
-            "manager": "Peter",
-            "recordRank": 9.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 27.5,
-            "wins": 9,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1841.32,
-            "theoreticalWins": 75,
-            "theoreticalLosses": 51,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 7.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 27.0,
-            "wins": 8,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1912.68,
-            "theoreticalWins": 80,
-            "theoreticalLosses": 46,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 7.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 21.0,
-            "wins": 8,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1792.4,
-            "theoreticalWins": 68,
-            "theoreticalLosses": 58,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 7.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 8.0,
-            "totalRank": 20.0,
-            "wins": 8,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1772.76,
-            "theoreticalWins": 71,
-            "theoreticalLosses": 55,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 4.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 16.5,
-            "wins": 7,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1778.72,
-            "theoreticalWins": 67,
-            "theoreticalLosses": 59,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 2.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 4.0,
-            "totalRank": 14.5,
-            "wins": 6,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1807.08,
-            "theoreticalWins": 61,
-            "theoreticalLosses": 65,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 9.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.5,
-            "totalRank": 14.0,
-            "wins": 9,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1710.16,
-            "theoreticalWins": 58,
-            "theoreticalLosses": 68,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 4.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 5.0,
-            "totalRank": 12.5,
-            "wins": 7,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1720.12,
-            "theoreticalWins": 66,
-            "theoreticalLosses": 60,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 2.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 2.5,
-            "totalRank": 9.0,
-            "wins": 6,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1722.4,
-            "theoreticalWins": 58,
-            "theoreticalLosses": 68,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 2,
-            "losses": 12,
-            "ties": 0,
-            "totalPoints": 1422.02,
-            "theoreticalWins": 26,
-            "theoreticalLosses": 100,
-            "theoreticalTies": 0
-          }
-        ]
-      }
-    ],
-    "finalWeek": 14,
-    "finalRankings": [
-      {
-        "manager": "Peter",
-        "recordRank": 9.5,
-        "pointsRank": 9.0,
-        "breakdownRank": 9.0,
-        "totalRank": 27.5,
-        "wins": 9,
-        "losses": 5,
-        "ties": 0,
-        "totalPoints": 1841.32,
-        "theoreticalWins": 75,
-        "theoreticalLosses": 51,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Ted",
-        "recordRank": 7.0,
-        "pointsRank": 10.0,
-        "breakdownRank": 10.0,
-        "totalRank": 27.0,
-        "wins": 8,
-        "losses": 6,
-        "ties": 0,
-        "totalPoints": 1912.68,
-        "theoreticalWins": 80,
-        "theoreticalLosses": 46,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Lanny",
-        "recordRank": 7.0,
-        "pointsRank": 7.0,
-        "breakdownRank": 7.0,
-        "totalRank": 21.0,
-        "wins": 8,
-        "losses": 6,
-        "ties": 0,
-        "totalPoints": 1792.4,
-        "theoreticalWins": 68,
-        "theoreticalLosses": 58,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Matt",
-        "recordRank": 7.0,
-        "pointsRank": 5.0,
-        "breakdownRank": 8.0,
-        "totalRank": 20.0,
-        "wins": 8,
-        "losses": 6,
-        "ties": 0,
-        "totalPoints": 1772.76,
-        "theoreticalWins": 71,
-        "theoreticalLosses": 55,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Jason",
-        "recordRank": 4.5,
-        "pointsRank": 6.0,
-        "breakdownRank": 6.0,
-        "totalRank": 16.5,
-        "wins": 7,
-        "losses": 7,
-        "ties": 0,
-        "totalPoints": 1778.72,
-        "theoreticalWins": 67,
-        "theoreticalLosses": 59,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Vernon",
-        "recordRank": 2.5,
-        "pointsRank": 8.0,
-        "breakdownRank": 4.0,
-        "totalRank": 14.5,
-        "wins": 6,
-        "losses": 8,
-        "ties": 0,
-        "totalPoints": 1807.08,
-        "theoreticalWins": 61,
-        "theoreticalLosses": 65,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Joey",
-        "recordRank": 9.5,
-        "pointsRank": 2.0,
-        "breakdownRank": 2.5,
-        "totalRank": 14.0,
-        "wins": 9,
-        "losses": 5,
-        "ties": 0,
-        "totalPoints": 1710.16,
-        "theoreticalWins": 58,
-        "theoreticalLosses": 68,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Tyler",
-        "recordRank": 4.5,
-        "pointsRank": 3.0,
-        "breakdownRank": 5.0,
-        "totalRank": 12.5,
-        "wins": 7,
-        "losses": 7,
-        "ties": 0,
-        "totalPoints": 1720.12,
-        "theoreticalWins": 66,
-        "theoreticalLosses": 60,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Ben",
-        "recordRank": 2.5,
-        "pointsRank": 4.0,
-        "breakdownRank": 2.5,
-        "totalRank": 9.0,
-        "wins": 6,
-        "losses": 8,
-        "ties": 0,
-        "totalPoints": 1722.4,
-        "theoreticalWins": 58,
-        "theoreticalLosses": 68,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "John",
-        "recordRank": 1.0,
-        "pointsRank": 1.0,
-        "breakdownRank": 1.0,
-        "totalRank": 3.0,
-        "wins": 2,
-        "losses": 12,
-        "ties": 0,
-        "totalPoints": 1422.02,
-        "theoreticalWins": 26,
-        "theoreticalLosses": 100,
-        "theoreticalTies": 0
-      }
-    ]
-  },
-  "2025": {
-    "weeks": [
-      {
-        "week": 1,
-        "managers": [
-          {
-            "manager": "Jason",
-            "recordRank": 8.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 148.14,
-            "theoreticalWins": 9,
-            "theoreticalLosses": 0,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 8.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 26.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 135.8,
-            "theoreticalWins": 8,
-            "theoreticalLosses": 1,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 8.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 24.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 121.62,
-            "theoreticalWins": 7,
-            "theoreticalLosses": 2,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 8.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 22.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 108.44,
-            "theoreticalWins": 6,
-            "theoreticalLosses": 3,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 3.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 15.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 106.14,
-            "theoreticalWins": 5,
-            "theoreticalLosses": 4,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 8.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 14.0,
-            "wins": 1,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 102.88,
-            "theoreticalWins": 2,
-            "theoreticalLosses": 7,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 3.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 13.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 105.64,
-            "theoreticalWins": 4,
-            "theoreticalLosses": 5,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 3.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 11.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 104.72,
-            "theoreticalWins": 3,
-            "theoreticalLosses": 6,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 3.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 7.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 99.32,
-            "theoreticalWins": 1,
-            "theoreticalLosses": 8,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 3.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 5.0,
-            "wins": 0,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 93.6,
-            "theoreticalWins": 0,
-            "theoreticalLosses": 9,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 2,
-        "managers": [
-          {
-            "manager": "Tyler",
-            "recordRank": 8.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.5,
-            "wins": 2,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 303.36,
-            "theoreticalWins": 16,
-            "theoreticalLosses": 2,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 8.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 26.5,
-            "wins": 2,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 253.76,
-            "theoreticalWins": 14,
-            "theoreticalLosses": 4,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 8.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 22.5,
-            "wins": 2,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 244.08,
-            "theoreticalWins": 11,
-            "theoreticalLosses": 7,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 5.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 21.5,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 250.64,
-            "theoreticalWins": 12,
-            "theoreticalLosses": 6,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 5.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.5,
-            "totalRank": 16.0,
-            "wins": 1,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 231.14,
-            "theoreticalWins": 9,
-            "theoreticalLosses": 9,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 8.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.5,
-            "totalRank": 15.0,
-            "wins": 2,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 217.64,
-            "theoreticalWins": 6,
-            "theoreticalLosses": 12,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 2.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 5.5,
-            "totalRank": 14.0,
-            "wins": 0,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 241.78,
-            "theoreticalWins": 9,
-            "theoreticalLosses": 9,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 2.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 2.0,
-            "totalRank": 8.5,
-            "wins": 0,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 228.98,
-            "theoreticalWins": 5,
-            "theoreticalLosses": 13,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 2.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 3.5,
-            "totalRank": 8.0,
-            "wins": 0,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 208.68,
-            "theoreticalWins": 6,
-            "theoreticalLosses": 12,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 2.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 4.5,
-            "wins": 0,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 194.0,
-            "theoreticalWins": 2,
-            "theoreticalLosses": 16,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 3,
-        "managers": [
-          {
-            "manager": "Peter",
-            "recordRank": 9.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 10.0,
-            "totalRank": 27.5,
-            "wins": 3,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 390.86,
-            "theoreticalWins": 22,
-            "theoreticalLosses": 5,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 7.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 9.0,
-            "totalRank": 26.0,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 415.34,
-            "theoreticalWins": 21,
-            "theoreticalLosses": 6,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 7.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 21.0,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 361.78,
-            "theoreticalWins": 15,
-            "theoreticalLosses": 12,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 4.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 8.0,
-            "totalRank": 21.0,
-            "wins": 1,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 395.36,
-            "theoreticalWins": 18,
-            "theoreticalLosses": 9,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 9.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 5.5,
-            "totalRank": 19.0,
-            "wins": 3,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 346.34,
-            "theoreticalWins": 13,
-            "theoreticalLosses": 14,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 7.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 5.5,
-            "totalRank": 18.5,
-            "wins": 2,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 355.2,
-            "theoreticalWins": 13,
-            "theoreticalLosses": 14,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 1.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 4.0,
-            "totalRank": 10.5,
-            "wins": 0,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 346.82,
-            "theoreticalWins": 11,
-            "theoreticalLosses": 16,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 4.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 10.0,
-            "wins": 1,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 316.14,
-            "theoreticalWins": 9,
-            "theoreticalLosses": 18,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 4.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 1.0,
-            "totalRank": 7.0,
-            "wins": 1,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 305.66,
-            "theoreticalWins": 6,
-            "theoreticalLosses": 21,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 1.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 2.0,
-            "totalRank": 4.5,
-            "wins": 0,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 304.84,
-            "theoreticalWins": 7,
-            "theoreticalLosses": 20,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 4,
-        "managers": [
-          {
-            "manager": "Peter",
-            "recordRank": 9.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.5,
-            "wins": 4,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 543.0,
-            "theoreticalWins": 30,
-            "theoreticalLosses": 6,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 7.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 25.5,
-            "wins": 3,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 538.28,
-            "theoreticalWins": 25,
-            "theoreticalLosses": 11,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 7.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 23.5,
-            "wins": 3,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 529.8,
-            "theoreticalWins": 22,
-            "theoreticalLosses": 14,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 9.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 6.0,
-            "totalRank": 20.5,
-            "wins": 4,
-            "losses": 0,
-            "ties": 0,
-            "totalPoints": 478.76,
-            "theoreticalWins": 18,
-            "theoreticalLosses": 18,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 3.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 17.5,
-            "wins": 1,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 517.54,
-            "theoreticalWins": 21,
-            "theoreticalLosses": 15,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 3.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 5.0,
-            "totalRank": 14.5,
-            "wins": 1,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 485.76,
-            "theoreticalWins": 17,
-            "theoreticalLosses": 19,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 6.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 14.0,
-            "wins": 2,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 464.38,
-            "theoreticalWins": 16,
-            "theoreticalLosses": 20,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 3.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 9.5,
-            "wins": 1,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 454.4,
-            "theoreticalWins": 13,
-            "theoreticalLosses": 23,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 3.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.5,
-            "totalRank": 6.0,
-            "wins": 1,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 403.4,
-            "theoreticalWins": 9,
-            "theoreticalLosses": 27,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 1.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 1.5,
-            "totalRank": 4.5,
-            "wins": 0,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 419.84,
-            "theoreticalWins": 9,
-            "theoreticalLosses": 27,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 5,
-        "managers": [
-          {
-            "manager": "Tyler",
-            "recordRank": 8.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.5,
-            "wins": 4,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 692.94,
-            "theoreticalWins": 33,
-            "theoreticalLosses": 12,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 8.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 8.0,
-            "totalRank": 25.5,
-            "wins": 4,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 671.94,
-            "theoreticalWins": 29,
-            "theoreticalLosses": 16,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 8.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 9.0,
-            "totalRank": 24.5,
-            "wins": 4,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 653.18,
-            "theoreticalWins": 30,
-            "theoreticalLosses": 15,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 4.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 7.0,
-            "totalRank": 19.5,
-            "wins": 2,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 654.4,
-            "theoreticalWins": 26,
-            "theoreticalLosses": 19,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 8.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 4.5,
-            "totalRank": 18.0,
-            "wins": 4,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 594.82,
-            "theoreticalWins": 19,
-            "theoreticalLosses": 26,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 4.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 16.5,
-            "wins": 2,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 639.34,
-            "theoreticalWins": 23,
-            "theoreticalLosses": 22,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 4.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.5,
-            "totalRank": 13.0,
-            "wins": 2,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 593.64,
-            "theoreticalWins": 19,
-            "theoreticalLosses": 26,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 4.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 10.5,
-            "wins": 2,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 587.88,
-            "theoreticalWins": 18,
-            "theoreticalLosses": 27,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 2.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 2.0,
-            "totalRank": 5.0,
-            "wins": 1,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 541.24,
-            "theoreticalWins": 15,
-            "theoreticalLosses": 30,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 1.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 1.0,
-            "totalRank": 4.0,
-            "wins": 0,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 552.28,
-            "theoreticalWins": 13,
-            "theoreticalLosses": 32,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 6,
-        "managers": [
-          {
-            "manager": "Ted",
-            "recordRank": 9.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 9.0,
-            "totalRank": 28.0,
-            "wins": 5,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 804.52,
-            "theoreticalWins": 35,
-            "theoreticalLosses": 19,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 9.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.0,
-            "wins": 5,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 791.2,
-            "theoreticalWins": 38,
-            "theoreticalLosses": 16,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Tyler",
-            "recordRank": 7.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 23.0,
-            "wins": 4,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 788.92,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 20,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 9.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.5,
-            "totalRank": 21.5,
-            "wins": 5,
-            "losses": 1,
-            "ties": 0,
-            "totalPoints": 740.14,
-            "theoreticalWins": 28,
-            "theoreticalLosses": 26,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 3.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 6.5,
-            "totalRank": 17.0,
-            "wins": 2,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 770.72,
-            "theoreticalWins": 28,
-            "theoreticalLosses": 26,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 6.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 14.0,
-            "wins": 3,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 724.76,
-            "theoreticalWins": 25,
-            "theoreticalLosses": 29,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 3.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 13.5,
-            "wins": 2,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 735.18,
-            "theoreticalWins": 26,
-            "theoreticalLosses": 28,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 3.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 9.5,
-            "wins": 2,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 713.68,
-            "theoreticalWins": 22,
-            "theoreticalLosses": 32,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 3.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 7.5,
-            "wins": 2,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 672.46,
-            "theoreticalWins": 19,
-            "theoreticalLosses": 35,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 0,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 670.58,
-            "theoreticalWins": 15,
-            "theoreticalLosses": 39,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 7,
-        "managers": [
-          {
-            "manager": "Tyler",
-            "recordRank": 8.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.5,
-            "wins": 5,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 944.46,
-            "theoreticalWins": 42,
-            "theoreticalLosses": 21,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 8.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 8.0,
-            "totalRank": 25.5,
-            "wins": 5,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 922.34,
-            "theoreticalWins": 38,
-            "theoreticalLosses": 25,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 8.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 9.0,
-            "totalRank": 25.5,
-            "wins": 5,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 908.96,
-            "theoreticalWins": 40,
-            "theoreticalLosses": 23,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 8.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 22.5,
-            "wins": 5,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 891.6,
-            "theoreticalWins": 35,
-            "theoreticalLosses": 28,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 6.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 6.0,
-            "totalRank": 17.0,
-            "wins": 4,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 889.46,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 29,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 4.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 5.0,
-            "totalRank": 15.5,
-            "wins": 3,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 890.14,
-            "theoreticalWins": 33,
-            "theoreticalLosses": 30,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 4.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.5,
-            "totalRank": 11.0,
-            "wins": 3,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 831.88,
-            "theoreticalWins": 26,
-            "theoreticalLosses": 37,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 2.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 3.5,
-            "totalRank": 10.0,
-            "wins": 2,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 837.36,
-            "theoreticalWins": 26,
-            "theoreticalLosses": 37,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 1.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 5.0,
-            "wins": 1,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 804.7,
-            "theoreticalWins": 21,
-            "theoreticalLosses": 42,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 2.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 4.5,
-            "wins": 2,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 780.88,
-            "theoreticalWins": 20,
-            "theoreticalLosses": 43,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 8,
-        "managers": [
-          {
-            "manager": "Tyler",
-            "recordRank": 9.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.0,
-            "wins": 6,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1130.44,
-            "theoreticalWins": 51,
-            "theoreticalLosses": 21,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 9.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 7.5,
-            "totalRank": 24.5,
-            "wins": 6,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1033.14,
-            "theoreticalWins": 42,
-            "theoreticalLosses": 30,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 6.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 7.5,
-            "totalRank": 23.0,
-            "wins": 5,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1047.06,
-            "theoreticalWins": 42,
-            "theoreticalLosses": 30,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 9.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 9.0,
-            "totalRank": 23.0,
-            "wins": 6,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1016.14,
-            "theoreticalWins": 43,
-            "theoreticalLosses": 29,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 6.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 18.5,
-            "wins": 5,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1016.42,
-            "theoreticalWins": 40,
-            "theoreticalLosses": 32,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 5.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 5.0,
-            "totalRank": 17.0,
-            "wins": 4,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1026.38,
-            "theoreticalWins": 39,
-            "theoreticalLosses": 33,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 2.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 10.5,
-            "wins": 2,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 968.84,
-            "theoreticalWins": 31,
-            "theoreticalLosses": 41,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 4.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 10.0,
-            "wins": 3,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 911.86,
-            "theoreticalWins": 26,
-            "theoreticalLosses": 46,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 2.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 6.5,
-            "wins": 2,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 909.52,
-            "theoreticalWins": 24,
-            "theoreticalLosses": 48,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 1,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 897.98,
-            "theoreticalWins": 22,
-            "theoreticalLosses": 50,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 9,
-        "managers": [
-          {
-            "manager": "Tyler",
-            "recordRank": 9.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.0,
-            "wins": 7,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1293.8,
-            "theoreticalWins": 60,
-            "theoreticalLosses": 21,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 9.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 9.0,
-            "totalRank": 25.0,
-            "wins": 7,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1144.78,
-            "theoreticalWins": 50,
-            "theoreticalLosses": 31,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 9.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 7.5,
-            "totalRank": 24.5,
-            "wins": 7,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1156.7,
-            "theoreticalWins": 46,
-            "theoreticalLosses": 35,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 6.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 6.0,
-            "totalRank": 21.0,
-            "wins": 5,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1167.22,
-            "theoreticalWins": 45,
-            "theoreticalLosses": 36,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 7.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 7.5,
-            "totalRank": 20.5,
-            "wins": 6,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1143.18,
-            "theoreticalWins": 46,
-            "theoreticalLosses": 35,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 5.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 15.0,
-            "wins": 4,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1124.36,
-            "theoreticalWins": 40,
-            "theoreticalLosses": 41,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 2.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 10.0,
-            "wins": 2,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1094.18,
-            "theoreticalWins": 36,
-            "theoreticalLosses": 45,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 3.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 9.5,
-            "wins": 3,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1044.12,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 47,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 3.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 7.5,
-            "wins": 3,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1020.48,
-            "theoreticalWins": 26,
-            "theoreticalLosses": 55,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 1,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 991.94,
-            "theoreticalWins": 22,
-            "theoreticalLosses": 59,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 10,
-        "managers": [
-          {
-            "manager": "Tyler",
-            "recordRank": 8.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.0,
-            "wins": 7,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1412.0,
-            "theoreticalWins": 62,
-            "theoreticalLosses": 28,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 9.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 27.5,
-            "wins": 8,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1311.62,
-            "theoreticalWins": 58,
-            "theoreticalLosses": 32,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 9.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 8.0,
-            "totalRank": 24.5,
-            "wins": 8,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1288.32,
-            "theoreticalWins": 53,
-            "theoreticalLosses": 37,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 5.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 7.0,
-            "totalRank": 20.5,
-            "wins": 5,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1303.16,
-            "theoreticalWins": 49,
-            "theoreticalLosses": 41,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 5.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 17.5,
-            "wins": 5,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1286.14,
-            "theoreticalWins": 48,
-            "theoreticalLosses": 42,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 7.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 17.0,
-            "wins": 6,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1258.14,
-            "theoreticalWins": 47,
-            "theoreticalLosses": 43,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 3.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 11.0,
-            "wins": 3,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1224.62,
-            "theoreticalWins": 42,
-            "theoreticalLosses": 48,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 3.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 2.0,
-            "totalRank": 8.0,
-            "wins": 3,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1150.64,
-            "theoreticalWins": 31,
-            "theoreticalLosses": 59,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 3.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 3.0,
-            "totalRank": 7.0,
-            "wins": 3,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1110.68,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 56,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 1.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 1.0,
-            "totalRank": 4.0,
-            "wins": 2,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1119.2,
-            "theoreticalWins": 26,
-            "theoreticalLosses": 64,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 11,
-        "managers": [
-          {
-            "manager": "Tyler",
-            "recordRank": 8.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 28.0,
-            "wins": 8,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1547.64,
-            "theoreticalWins": 69,
-            "theoreticalLosses": 30,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 9.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 8.0,
-            "totalRank": 26.5,
-            "wins": 9,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1435.82,
-            "theoreticalWins": 62,
-            "theoreticalLosses": 37,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 9.5,
-            "pointsRank": 8.0,
-            "breakdownRank": 9.0,
-            "totalRank": 26.5,
-            "wins": 9,
-            "losses": 2,
-            "ties": 0,
-            "totalPoints": 1428.54,
-            "theoreticalWins": 63,
-            "theoreticalLosses": 36,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 6.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 7.0,
-            "totalRank": 19.5,
-            "wins": 6,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1400.78,
-            "theoreticalWins": 55,
-            "theoreticalLosses": 44,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 6.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 6.0,
-            "totalRank": 19.5,
-            "wins": 6,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1406.12,
-            "theoreticalWins": 53,
-            "theoreticalLosses": 46,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 5.0,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 15.0,
-            "wins": 5,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1385.54,
-            "theoreticalWins": 51,
-            "theoreticalLosses": 48,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 2.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 10.5,
-            "wins": 3,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1318.74,
-            "theoreticalWins": 43,
-            "theoreticalLosses": 56,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 4.0,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 10.0,
-            "wins": 4,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1277.52,
-            "theoreticalWins": 37,
-            "theoreticalLosses": 62,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 2.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 2.0,
-            "totalRank": 5.5,
-            "wins": 3,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1166.36,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 65,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 1.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 1.0,
-            "totalRank": 4.0,
-            "wins": 2,
-            "losses": 9,
-            "ties": 0,
-            "totalPoints": 1214.82,
-            "theoreticalWins": 28,
-            "theoreticalLosses": 71,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 12,
-        "managers": [
-          {
-            "manager": "Tyler",
-            "recordRank": 9.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.0,
-            "wins": 9,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1683.86,
-            "theoreticalWins": 77,
-            "theoreticalLosses": 31,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 9.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.5,
-            "totalRank": 25.5,
-            "wins": 9,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1550.08,
-            "theoreticalWins": 65,
-            "theoreticalLosses": 43,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 9.0,
-            "pointsRank": 7.0,
-            "breakdownRank": 8.5,
-            "totalRank": 24.5,
-            "wins": 9,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1534.48,
-            "theoreticalWins": 65,
-            "theoreticalLosses": 43,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 6.5,
-            "pointsRank": 9.0,
-            "breakdownRank": 7.0,
-            "totalRank": 22.5,
-            "wins": 7,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1555.66,
-            "theoreticalWins": 64,
-            "theoreticalLosses": 44,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 6.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 18.5,
-            "wins": 7,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1522.84,
-            "theoreticalWins": 58,
-            "theoreticalLosses": 50,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 4.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 14.5,
-            "wins": 5,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1501.06,
-            "theoreticalWins": 55,
-            "theoreticalLosses": 53,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 4.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.5,
-            "totalRank": 11.0,
-            "wins": 5,
-            "losses": 7,
-            "ties": 0,
-            "totalPoints": 1403.9,
-            "theoreticalWins": 44,
-            "theoreticalLosses": 64,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 2.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 3.5,
-            "totalRank": 9.5,
-            "wins": 3,
-            "losses": 9,
-            "ties": 0,
-            "totalPoints": 1413.22,
-            "theoreticalWins": 44,
-            "theoreticalLosses": 64,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 2.0,
-            "pointsRank": 2.0,
-            "breakdownRank": 1.5,
-            "totalRank": 5.5,
-            "wins": 3,
-            "losses": 9,
-            "ties": 0,
-            "totalPoints": 1338.92,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 74,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 2.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.5,
-            "totalRank": 4.5,
-            "wins": 3,
-            "losses": 9,
-            "ties": 0,
-            "totalPoints": 1250.54,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 74,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 13,
-        "managers": [
-          {
-            "manager": "Tyler",
-            "recordRank": 9.5,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 29.5,
-            "wins": 10,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1805.04,
-            "theoreticalWins": 82,
-            "theoreticalLosses": 35,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 9.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 9.0,
-            "totalRank": 25.5,
-            "wins": 10,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1679.38,
-            "theoreticalWins": 74,
-            "theoreticalLosses": 43,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 7.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 7.5,
-            "totalRank": 23.5,
-            "wins": 8,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1691.82,
-            "theoreticalWins": 72,
-            "theoreticalLosses": 45,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 8.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 7.5,
-            "totalRank": 23.5,
-            "wins": 9,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1680.66,
-            "theoreticalWins": 72,
-            "theoreticalLosses": 45,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 6.0,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 18.0,
-            "wins": 7,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1635.64,
-            "theoreticalWins": 62,
-            "theoreticalLosses": 55,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 4.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 5.0,
-            "totalRank": 14.5,
-            "wins": 5,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1594.1,
-            "theoreticalWins": 56,
-            "theoreticalLosses": 61,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 4.5,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.0,
-            "totalRank": 12.5,
-            "wins": 5,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1532.14,
-            "theoreticalWins": 50,
-            "theoreticalLosses": 67,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 2.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 3.0,
-            "totalRank": 8.5,
-            "wins": 4,
-            "losses": 9,
-            "ties": 0,
-            "totalPoints": 1513.4,
-            "theoreticalWins": 46,
-            "theoreticalLosses": 71,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 2.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 6.5,
-            "wins": 4,
-            "losses": 9,
-            "ties": 0,
-            "totalPoints": 1442.8,
-            "theoreticalWins": 37,
-            "theoreticalLosses": 80,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 1.0,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.0,
-            "wins": 3,
-            "losses": 10,
-            "ties": 0,
-            "totalPoints": 1339.8,
-            "theoreticalWins": 34,
-            "theoreticalLosses": 83,
-            "theoreticalTies": 0
-          }
-        ]
-      },
-      {
-        "week": 14,
-        "managers": [
-          {
-            "manager": "Tyler",
-            "recordRank": 10.0,
-            "pointsRank": 10.0,
-            "breakdownRank": 10.0,
-            "totalRank": 30.0,
-            "wins": 11,
-            "losses": 3,
-            "ties": 0,
-            "totalPoints": 1899.76,
-            "theoreticalWins": 84,
-            "theoreticalLosses": 42,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Matt",
-            "recordRank": 8.0,
-            "pointsRank": 9.0,
-            "breakdownRank": 9.0,
-            "totalRank": 26.0,
-            "wins": 9,
-            "losses": 5,
-            "ties": 0,
-            "totalPoints": 1831.06,
-            "theoreticalWins": 80,
-            "theoreticalLosses": 46,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Peter",
-            "recordRank": 9.0,
-            "pointsRank": 8.0,
-            "breakdownRank": 8.0,
-            "totalRank": 25.0,
-            "wins": 10,
-            "losses": 4,
-            "ties": 0,
-            "totalPoints": 1777.48,
-            "theoreticalWins": 77,
-            "theoreticalLosses": 49,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ted",
-            "recordRank": 6.5,
-            "pointsRank": 7.0,
-            "breakdownRank": 7.0,
-            "totalRank": 20.5,
-            "wins": 8,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1755.86,
-            "theoreticalWins": 73,
-            "theoreticalLosses": 53,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Joey",
-            "recordRank": 6.5,
-            "pointsRank": 6.0,
-            "breakdownRank": 6.0,
-            "totalRank": 18.5,
-            "wins": 8,
-            "losses": 6,
-            "ties": 0,
-            "totalPoints": 1742.24,
-            "theoreticalWins": 66,
-            "theoreticalLosses": 60,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Jason",
-            "recordRank": 5.0,
-            "pointsRank": 4.0,
-            "breakdownRank": 4.5,
-            "totalRank": 13.5,
-            "wins": 6,
-            "losses": 8,
-            "ties": 0,
-            "totalPoints": 1669.34,
-            "theoreticalWins": 56,
-            "theoreticalLosses": 70,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Vernon",
-            "recordRank": 3.5,
-            "pointsRank": 5.0,
-            "breakdownRank": 3.0,
-            "totalRank": 11.5,
-            "wins": 5,
-            "losses": 9,
-            "ties": 0,
-            "totalPoints": 1685.2,
-            "theoreticalWins": 55,
-            "theoreticalLosses": 71,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "John",
-            "recordRank": 3.5,
-            "pointsRank": 3.0,
-            "breakdownRank": 4.5,
-            "totalRank": 11.0,
-            "wins": 5,
-            "losses": 9,
-            "ties": 0,
-            "totalPoints": 1655.38,
-            "theoreticalWins": 56,
-            "theoreticalLosses": 70,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Ben",
-            "recordRank": 1.5,
-            "pointsRank": 2.0,
-            "breakdownRank": 2.0,
-            "totalRank": 5.5,
-            "wins": 4,
-            "losses": 10,
-            "ties": 0,
-            "totalPoints": 1556.3,
-            "theoreticalWins": 42,
-            "theoreticalLosses": 84,
-            "theoreticalTies": 0
-          },
-          {
-            "manager": "Lanny",
-            "recordRank": 1.5,
-            "pointsRank": 1.0,
-            "breakdownRank": 1.0,
-            "totalRank": 3.5,
-            "wins": 4,
-            "losses": 10,
-            "ties": 0,
-            "totalPoints": 1480.42,
-            "theoreticalWins": 41,
-            "theoreticalLosses": 85,
-            "theoreticalTies": 0
-          }
-        ]
-      }
-    ],
-    "finalWeek": 14,
-    "finalRankings": [
-      {
-        "manager": "Tyler",
-        "recordRank": 10.0,
-        "pointsRank": 10.0,
-        "breakdownRank": 10.0,
-        "totalRank": 30.0,
-        "wins": 11,
-        "losses": 3,
-        "ties": 0,
-        "totalPoints": 1899.76,
-        "theoreticalWins": 84,
-        "theoreticalLosses": 42,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Matt",
-        "recordRank": 8.0,
-        "pointsRank": 9.0,
-        "breakdownRank": 9.0,
-        "totalRank": 26.0,
-        "wins": 9,
-        "losses": 5,
-        "ties": 0,
-        "totalPoints": 1831.06,
-        "theoreticalWins": 80,
-        "theoreticalLosses": 46,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Peter",
-        "recordRank": 9.0,
-        "pointsRank": 8.0,
-        "breakdownRank": 8.0,
-        "totalRank": 25.0,
-        "wins": 10,
-        "losses": 4,
-        "ties": 0,
-        "totalPoints": 1777.48,
-        "theoreticalWins": 77,
-        "theoreticalLosses": 49,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Ted",
-        "recordRank": 6.5,
-        "pointsRank": 7.0,
-        "breakdownRank": 7.0,
-        "totalRank": 20.5,
-        "wins": 8,
-        "losses": 6,
-        "ties": 0,
-        "totalPoints": 1755.86,
-        "theoreticalWins": 73,
-        "theoreticalLosses": 53,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Joey",
-        "recordRank": 6.5,
-        "pointsRank": 6.0,
-        "breakdownRank": 6.0,
-        "totalRank": 18.5,
-        "wins": 8,
-        "losses": 6,
-        "ties": 0,
-        "totalPoints": 1742.24,
-        "theoreticalWins": 66,
-        "theoreticalLosses": 60,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Jason",
-        "recordRank": 5.0,
-        "pointsRank": 4.0,
-        "breakdownRank": 4.5,
-        "totalRank": 13.5,
-        "wins": 6,
-        "losses": 8,
-        "ties": 0,
-        "totalPoints": 1669.34,
-        "theoreticalWins": 56,
-        "theoreticalLosses": 70,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Vernon",
-        "recordRank": 3.5,
-        "pointsRank": 5.0,
-        "breakdownRank": 3.0,
-        "totalRank": 11.5,
-        "wins": 5,
-        "losses": 9,
-        "ties": 0,
-        "totalPoints": 1685.2,
-        "theoreticalWins": 55,
-        "theoreticalLosses": 71,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "John",
-        "recordRank": 3.5,
-        "pointsRank": 3.0,
-        "breakdownRank": 4.5,
-        "totalRank": 11.0,
-        "wins": 5,
-        "losses": 9,
-        "ties": 0,
-        "totalPoints": 1655.38,
-        "theoreticalWins": 56,
-        "theoreticalLosses": 70,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Ben",
-        "recordRank": 1.5,
-        "pointsRank": 2.0,
-        "breakdownRank": 2.0,
-        "totalRank": 5.5,
-        "wins": 4,
-        "losses": 10,
-        "ties": 0,
-        "totalPoints": 1556.3,
-        "theoreticalWins": 42,
-        "theoreticalLosses": 84,
-        "theoreticalTies": 0
-      },
-      {
-        "manager": "Lanny",
-        "recordRank": 1.5,
-        "pointsRank": 1.0,
-        "breakdownRank": 1.0,
-        "totalRank": 3.5,
-        "wins": 4,
-        "losses": 10,
-        "ties": 0,
-        "totalPoints": 1480.42,
-        "theoreticalWins": 41,
-        "theoreticalLosses": 85,
-        "theoreticalTies": 0
-      }
-    ]
-  }
-};
@@ -0,0 +1,5 @@
+// JBS FFL Power Rankings Seasons
+// Generated from CSV files - Do not edit manually
+// Each season's rankings are in powerRankings/YYYY.json
+
+export const powerRankingSeasons = [2009, 2010, 2011, 2012, 2013, 2014, 2015, 2016, 2017, 2018, 2019, 2020, 2021, 2022, 2023, 2024, 2025];
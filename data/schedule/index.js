@@ -0,0 +1,5 @@
+// JBS FFL Schedule Seasons
+// Generated by scripts/standings_schedule.py - Do not edit manually
+// Each season is in schedule/YYYY.json
+
+export const scheduleSeasons = [2009, 2010, 2011, 2012, 2013, 2014, 2015, 2016, 2017, 2018, 2019, 2020, 2021, 2022, 2023, 2024, 2025];
@@ -0,0 +1,4 @@
+// JBS FFL Schedule Luck
+// Generated from ESPN scraped data - Do not edit manually
+
+export const scheduleLuck = {"2009":{"weeks":[1,2,3,4,5,6,7,8,9,10,11,12,13],"managers":["Ben","Joey","John","Lanny","Matt","Peter","Ted","Ty","Tyler","Vernon"],"scheduleRecords":{"wins":[[4,4,6,3,7,6,6,8,5,8],[5,6,8,8,8,6,8,8,8,8],[4,6,7,4,7,7,8,6,5,6],[7,9,9,6,8,8,10,10,7,10],[8,9,8,6,10,7,9,5,9,8],[6,8,9,9,9,7,8,9,6,9],[4,5,6,5,5,5,7,7,5,9],[2,5,3,2,4,3,4,2,3,6],[3,2,6,3,2,4,3,4,4,4],[6,9,8,5,7,9,9,10,9,9]],"losses":[[8,9,7,10,6,6,7,5,7,5],[8,7,5,5,5,7,5,5,5,5],[9,7,4,9,6,6,5,7,7,6],[6,4,4,7,5,5,3,3,6,3],[5,4,5,7,3,5,3,8,4,4],[6,5,4,4,4,5,5,4,7,4],[9,8,7,8,8,8,6,6,8,4],[11,8,10,11,9,10,9,11,10,6],[10,11,5,10,11,9,10,9,8,9],[7,4,4,8,6,4,4,3,4,3]],"ties":[[1,0,0,0,0,1,0,0,1,0],[0,0,0,0,0,0,0,0,0,0],[0,0,2,0,0,0,0,0,1,1],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,1,1,0,0,1],[1,0,0,0,0,1,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,1],[0,0,2,0,0,0,0,0,1,0],[0,0,1,0,0,0,0,0,0,1]]},"distributions":[{"manager":"Ben","actualWins":4.5,"expectedWins":6.0,"luck":-1.5,"worseSchedules":0.1332,"betterSchedules":0.8301,"bestScheduleWins":8.0,"worstScheduleWins":3.0,"winDistribution":[[1.0,0.0002],[1.5,0.0002],[2.0,0.0038],[2.5,0.0027],[3.0,0.0255],[3.5,0.0142],[4.0,0.0866],[4.5,0.0367],[5.0,0.1726],[5.5,0.0544],[6.0,0.2152],[6.5,0.0493],[7.0,0.1728],[7.5,0.0279],[8.0,0.0897],[8.5,0.0098],[9.0,0.0295],[9.5,0.002],[10.0,0.0059],[10.5,0.0002],[11.0,0.0006]]},{"manager":"Joey","actualWins":6.0,"expectedWins":7.444,"luck":-1.444,"worseSchedules":0.0824,"betterSchedules":0.7564,"bestScheduleWins":8.0,"worstScheduleWins":5.0,"winDistribution":[[2.0,0.0002],[3.0,0.0024],[4.0,0.016],[5.0,0.0638],[6.0,0.1613],[7.0,0.2617],[8.0,0.2681],[9.0,0.1645],[10.0,0.0541],[11.0,0.0076],[12.0,0.0004]]},{"manager":"John","actualWins":8.0,"expectedWins":6.0,"luck":2.0,"worseSchedules":0.878,"betterSchedules":0.0408,"bestScheduleWins":8.0,"worstScheduleWins":4.0,"winDistribution":[[1.0,0.0003],[1.5,0.0001],[2.0,0.0043],[2.5,0.0013],[3.0,0.0263],[3.5,0.008],[4.0,0.0887],[4.5,0.0258],[5.0,0.1793],[5.5,0.0488],[6.0,0.2251],[6.5,0.0561],[7.0,0.1752],[7.5,0.0387],[8.0,0.0811],[8.5,0.0153],[9.0,0.0202],[9.5,0.0031],[10.0,0.002],[10.5,0.0002]]},{"manager":"Lanny","actualWins":6.0,"expectedWins":8.667,"luck":-2.667,"worseSchedules":0.0037,"betterSchedules":0.969,"bestScheduleWins":10.0,"worstScheduleWins":6.0,"winDistribution":[[4.0,0.0002],[5.0,0.0034],[6.0,0.0274],[7.0,0.1199],[8.0,0.2822],[9.0,0.3339],[10.0,0.1852],[11.0,0.0432],[12.0,0.0044],[13.0,0.0002]]},{"manager":"Matt","actualWins":10.0,"expectedWins":7.833,"luck":2.167,"worseSchedules":0.9266,"betterSchedules":0.0173,"bestScheduleWins":10.0,"worstScheduleWins":5.0,"winDistribution":[[3.0,0.0003],[3.5,0.0003],[4.0,0.0035],[4.5,0.0027],[5.0,0.0222],[5.5,0.0151],[6.0,0.0818],[6.5,0.0459],[7.0,0.1781],[7.5,0.0786],[8.0,0.2263],[8.5,0.0745],[9.0,0.1597],[9.5,0.0377],[10.0,0.0561],[10.5,0.0093],[11.0,0.0072],[11.5,0.0009]]},{"manager":"Peter","actualWins":7.5,"expectedWins":8.167,"luck":-0.667,"worseSchedules":0.312,"betterSchedules":0.6607,"bestScheduleWins":9.0,"worstScheduleWins":6.0,"winDistribution":[[2.0,0.0001],[3.0,0.001],[3.5,0.0003],[4.0,0.0067],[4.5,0.0018],[5.0,0.0291],[5.5,0.0068],[6.0,0.0839],[6.5,0.0167],[7.0,0.1656],[7.5,0.0273],[8.0,0.224],[8.5,0.0291],[9.0,0.2047],[9.5,0.0196],[10.0,0.1216],[10.5,0.0078],[11.0,0.0436],[11.5,0.0016],[12.0,0.0081],[12.5,0.0001],[13.0,0.0005]]},{"manager":"Ted","actualWins":7.0,"expectedWins":5.667,"luck":1.333,"worseSchedules":0.701,"betterSchedules":0.1296,"bestScheduleWins":9.0,"worstScheduleWins":4.0,"winDistribution":[[1.0,0.002],[2.0,0.0173],[3.0,0.0673],[4.0,0.1532],[5.0,0.2277],[6.0,0.2334],[7.0,0.1694],[8.0,0.0877],[9.0,0.0322],[10.0,0.0082],[11.0,0.0014],[12.0,0.0001]]},{"manager":"Ty","actualWins":2.0,"expectedWins":3.611,"luck":-1.611,"worseSchedules":0.0591,"betterSchedules":0.8065,"bestScheduleWins":6.5,"worstScheduleWins":2.0,"winDistribution":[[0.0,0.0052],[0.5,0.0017],[1.0,0.0412],[1.5,0.0108],[2.0,0.1344],[2.5,0.0267],[3.0,0.2362],[3.5,0.0342],[4.0,0.2447],[4.5,0.0246],[5.0,0.1539],[5.5,0.0103],[6.0,0.0586],[6.5,0.0024],[7.0,0.013],[7.5,0.0003],[8.0,0.0015],[9.0,0.0001]]},{"manager":"Tyler","actualWins":4.5,"expectedWins":3.556,"luck":0.944,"worseSchedules":0.768,"betterSchedules":0.1751,"bestScheduleWins":7.0,"worstScheduleWins":2.0,"winDistribution":[[1.0,0.0226],[1.5,0.0056],[2.0,0.139],[2.5,0.0347],[3.0,0.268],[3.5,0.0665],[4.0,0.2317],[4.5,0.0569],[5.0,0.1075],[5.5,0.026],[6.0,0.0288],[6.5,0.0068],[7.0,0.0045],[7.5,0.001],[8.0,0.0004],[8.5,0.0001]]},{"manager":"Vernon","actualWins":9.5,"expectedWins":8.056,"luck":1.444,"worseSchedules":0.8482,"betterSchedules":0.1315,"bestScheduleWins":10.0,"worstScheduleWins":5.0,"winDistribution":[[3.0,0.0002],[4.0,0.003],[4.5,0.0006],[5.0,0.0215],[5.5,0.004],[6.0,0.0857],[6.5,0.0148],[7.0,0.1957],[7.5,0.0303],[8.0,0.2576],[8.5,0.0334],[9.0,0.2014],[9.5,0.0203],[10.0,0.0943],[10.5,0.0067],[11.0,0.0256],[11.5,0.0011],[12.0,0.0036],[12.5,0.0001],[13.0,0.0002]]}]},"2010":{"weeks":[1,2,3,4,5,6,7,8,9,10,11,12,13],"managers":["Ben","Joey","John","Lanny","Matt","Peter","Ted","Ty","Tyler","Vernon"],"scheduleRecords":{"wins":[[8,5,5,5,4,5,5,6,6,5],[10,8,9,10,8,11,10,8,7,7],[9,7,8,6,8,9,9,8,8,7],[6,3,4,4,4,6,4,4,3,5],[8,8,9,7,8,9,7,5,5,9],[10,9,10,11,9,9,8,7,7,8],[6,6,6,4,3,7,4,3,6,6],[6,1,3,3,4,6,5,4,4,3],[8,4,6,5,6,7,7,7,5,8],[6,7,8,6,5,10,6,7,4,7]],"losses":[[5,8,8,8,9,8,7,7,7,8],[3,5,4,3,5,2,3,5,6,6],[4,6,5,7,5,4,4,5,5,6],[7,10,9,9,9,7,9,9,10,8],[5,5,4,6,5,4,6,8,8,4],[3,4,3,2,4,4,5,6,6,3],[7,7,7,8,9,6,9,10,7,7],[7,11,10,10,9,7,8,9,9,10],[5,9,7,8,6,5,6,6,8,5],[7,6,5,7,8,3,7,6,9,6]],"ties":[[0,0,0,0,0,0,1,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,2],[0,0,0,1,1,0,0,0,0,0],[0,1,0,0,0,0,0,0,0,0],[0,0,0,0,1,1,0,0,0,0],[0,0,0,0,0,0,0,0,0,0]]},"distributions":[{"manager":"Ben","actualWins":8.0,"expectedWins":5.167,"luck":2.833,"worseSchedules":0.9407,"betterSchedules":0.017,"bestScheduleWins":8.0,"worstScheduleWins":4.0,"winDistribution":[[1.0,0.003],[1.5,0.0006],[2.0,0.0256],[2.5,0.0047],[3.0,0.0915],[3.5,0.0155],[4.0,0.1835],[4.5,0.0274],[5.0,0.2301],[5.5,0.0296],[6.0,0.1911],[6.5,0.0205],[7.0,0.1082],[7.5,0.0094],[8.0,0.0422],[8.5,0.0028],[9.0,0.0113],[9.5,0.0006],[10.0,0.002],[10.5,0.0001],[11.0,0.0002]]},{"manager":"Joey","actualWins":8.0,"expectedWins":8.889,"luck":-0.889,"worseSchedules":0.16,"betterSchedules":0.6153,"bestScheduleWins":11.0,"worstScheduleWins":7.0,"winDistribution":[[3.0,0.0001],[4.0,0.0009],[5.0,0.0075],[6.0,0.037],[7.0,0.1146],[8.0,0.2246],[9.0,0.2783],[10.0,0.2139],[11.0,0.0973],[12.0,0.0236],[13.0,0.0023]]},{"manager":"John","actualWins":8.0,"expectedWins":7.889,"luck":0.111,"worseSchedules":0.3454,"betterSchedules":0.2825,"bestScheduleWins":9.0,"worstScheduleWins":6.0,"winDistribution":[[4.0,0.0005],[5.0,0.01],[6.0,0.0776],[7.0,0.2574],[8.0,0.3721],[9.0,0.2319],[10.0,0.0506]]},{"manager":"Lanny","actualWins":4.0,"expectedWins":4.333,"luck":-0.333,"worseSchedules":0.2806,"betterSchedules":0.4369,"bestScheduleWins":6.0,"worstScheduleWins":3.0,"winDistribution":[[0.0,0.0005],[1.0,0.0107],[2.0,0.0722],[3.0,0.1972],[4.0,0.2825],[5.0,0.2422],[6.0,0.1329],[7.0,0.0482],[8.0,0.0116],[9.0,0.0018],[10.0,0.0002]]},{"manager":"Matt","actualWins":8.0,"expectedWins":7.444,"luck":0.556,"worseSchedules":0.511,"betterSchedules":0.2612,"bestScheduleWins":9.0,"worstScheduleWins":5.0,"winDistribution":[[2.0,0.0008],[3.0,0.0062],[4.0,0.028],[5.0,0.082],[6.0,0.164],[7.0,0.2299],[8.0,0.2278],[9.0,0.1583],[10.0,0.0753],[11.0,0.0232],[12.0,0.0041],[13.0,0.0003]]},{"manager":"Peter","actualWins":9.0,"expectedWins":8.889,"luck":0.111,"worseSchedules":0.4017,"betterSchedules":0.3612,"bestScheduleWins":11.0,"worstScheduleWins":7.0,"winDistribution":[[4.0,0.0005],[4.5,0.0003],[5.0,0.0048],[5.5,0.0022],[6.0,0.0256],[6.5,0.0108],[7.0,0.0861],[7.5,0.0322],[8.0,0.1821],[8.5,0.0572],[9.0,0.2371],[9.5,0.0579],[10.0,0.1809],[10.5,0.0305],[11.0,0.0733],[11.5,0.0064],[12.0,0.0121]]},{"manager":"Ted","actualWins":4.0,"expectedWins":5.333,"luck":-1.333,"worseSchedules":0.1122,"betterSchedules":0.7427,"bestScheduleWins":7.0,"worstScheduleWins":3.0,"winDistribution":[[1.0,0.0014],[1.5,0.001],[2.0,0.0143],[2.5,0.0078],[3.0,0.0609],[3.5,0.0269],[4.0,0.1451],[4.5,0.0502],[5.0,0.2126],[5.5,0.0556],[6.0,0.1981],[6.5,0.0374],[7.0,0.1173],[7.5,0.015],[8.0,0.0428],[8.5,0.0034],[9.0,0.009],[9.5,0.0004],[10.0,0.001]]},{"manager":"Ty","actualWins":4.0,"expectedWins":3.944,"luck":0.056,"worseSchedules":0.3852,"betterSchedules":0.3415,"bestScheduleWins":6.0,"worstScheduleWins":1.5,"winDistribution":[[0.0,0.0016],[0.5,0.0008],[1.0,0.0186],[1.5,0.007],[2.0,0.0878],[2.5,0.0231],[3.0,0.2104],[3.5,0.036],[4.0,0.2733],[4.5,0.0285],[5.0,0.1957],[5.5,0.0123],[6.0,0.0799],[6.5,0.003],[7.0,0.0189],[7.5,0.0004],[8.0,0.0025],[9.0,0.0002]]},{"manager":"Tyler","actualWins":5.0,"expectedWins":6.556,"luck":-1.556,"worseSchedules":0.0776,"betterSchedules":0.8011,"bestScheduleWins":8.0,"worstScheduleWins":4.0,"winDistribution":[[2.0,0.0006],[2.5,0.0005],[3.0,0.0078],[3.5,0.0052],[4.0,0.0419],[4.5,0.0217],[5.0,0.1213],[5.5,0.0473],[6.0,0.2081],[6.5,0.0588],[7.0,0.2184],[7.5,0.0424],[8.0,0.1397],[8.5,0.0174],[9.0,0.0526],[9.5,0.0038],[10.0,0.011],[10.5,0.0004],[11.0,0.0011]]},{"manager":"Vernon","actualWins":7.0,"expectedWins":6.556,"luck":0.444,"worseSchedules":0.4744,"betterSchedules":0.2384,"bestScheduleWins":10.0,"worstScheduleWins":4.0,"winDistribution":[[1.0,0.0001],[2.0,0.0012],[3.0,0.0102],[4.0,0.0495],[5.0,0.1469],[6.0,0.2665],[7.0,0.2872],[8.0,0.1742],[9.0,0.0553],[10.0,0.0084],[11.0,0.0005]]}]},"2011":{"weeks":[1,2,3,4,5,6,7,8,9,10,11,12,13],"managers":["Ben","Joey","John","Lanny","Matt","Peter","Ted","Ty","Tyler","Vernon"],"scheduleRecords":{"wins":[[8,6,9,6,4,5,9,4,6,9],[9,9,10,8,9,8,12,10,10,11],[4,4,4,3,1,2,4,3,3,6],[10,9,11,10,7,8,9,8,10,9],[6,6,7,8,4,5,9,7,6,11],[7,6,9,6,5,6,9,5,7,8],[4,5,5,3,2,3,4,3,2,6],[6,6,4,4,2,5,4,2,3,6],[7,6,7,6,6,5,7,5,8,5],[8,6,9,7,7,5,9,6,10,9]],"losses":[[4,6,4,6,9,8,3,9,7,4],[3,3,3,5,4,5,1,3,3,2],[9,9,9,10,11,11,9,9,10,7],[3,3,2,3,6,5,4,4,3,4],[7,7,5,5,9,8,4,6,7,2],[6,7,4,7,7,7,4,8,6,5],[9,8,8,10,11,10,9,10,9,6],[7,7,9,9,11,8,9,11,10,5],[6,6,6,7,7,8,6,8,5,8],[5,7,4,6,6,8,4,7,3,4]],"ties":[[1,1,0,1,0,0,1,0,0,0],[1,1,0,0,0,0,0,0,0,0],[0,0,0,0,1,0,0,1,0,0],[0,1,0,0,0,0,0,1,0,0],[0,0,1,0,0,0,0,0,0,0],[0,0,0,0,1,0,0,0,0,0],[0,0,0,0,0,0,0,0,2,1],[0,0,0,0,0,0,0,0,0,2],[0,1,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0]]},"distributions":[{"manager":"Ben","actualWins":8.5,"expectedWins":6.611,"luck":1.889,"worseSchedules":0.8722,"betterSchedules":0.0947,"bestScheduleWins":9.5,"worstScheduleWins":4.0,"winDistribution":[[1.0,0.0002],[1.5,0.0001],[2.0,0.0021],[2.5,0.0014],[3.0,0.0131],[3.5,0.008],[4.0,0.0479],[4.5,0.026],[5.0,0.112],[5.5,0.0529],[6.0,0.1732],[6.5,0.0693],[7.0,0.1802],[7.5,0.0594],[8.0,0.1263],[8.5,0.0331],[9.0,0.0588],[9.5,0.0117],[10.0,0.0177],[10.5,0.0025],[11.0,0.0033],[11.5,0.0003],[12.0,0.0003]]},{"manager":"Joey","actualWins":9.5,"expectedWins":9.722,"luck":-0.222,"worseSchedules":0.4052,"betterSchedules":0.559,"bestScheduleWins":12.0,"worstScheduleWins":8.0,"winDistribution":[[5.0,0.0005],[5.5,0.0001],[6.0,0.0054],[6.5,0.0016],[7.0,0.0324],[7.5,0.0082],[8.0,0.1105],[8.5,0.0232],[9.0,0.2233],[9.5,0.0358],[10.0,0.2659],[10.5,0.029],[11.0,0.1795],[11.5,0.0115],[12.0,0.0627],[12.5,0.0017],[13.0,0.0087]]},{"manager":"John","actualWins":4.0,"expectedWins":3.444,"luck":0.556,"worseSchedules":0.5568,"betterSchedules":0.2099,"bestScheduleWins":6.0,"worstScheduleWins":1.5,"winDistribution":[[0.0,0.0033],[0.5,0.0009],[1.0,0.0357],[1.5,0.0095],[2.0,0.142],[2.5,0.0371],[3.0,0.2616],[3.5,0.0666],[4.0,0.2334],[4.5,0.0565],[5.0,0.1024],[5.5,0.0225],[6.0,0.0218],[6.5,0.004],[7.0,0.0022],[7.5,0.0003],[8.0,0.0001]]},{"manager":"Lanny","actualWins":10.0,"expectedWins":9.111,"luck":0.889,"worseSchedules":0.6332,"betterSchedules":0.174,"bestScheduleWins":11.0,"worstScheduleWins":7.0,"winDistribution":[[4.0,0.0003],[4.5,0.0001],[5.0,0.0034],[5.5,0.0013],[6.0,0.0206],[6.5,0.0076],[7.0,0.0741],[7.5,0.0251],[8.0,0.1642],[8.5,0.0499],[9.0,0.2276],[9.5,0.059],[10.0,0.1928],[10.5,0.0396],[11.0,0.094],[11.5,0.0133],[12.0,0.0232],[12.5,0.0017],[13.0,0.0022]]},{"manager":"Matt","actualWins":4.0,"expectedWins":7.278,"luck":-3.278,"worseSchedules":0.0016,"betterSchedules":0.9827,"bestScheduleWins":11.0,"worstScheduleWins":4.0,"winDistribution":[[3.0,0.0014],[3.5,0.0002],[4.0,0.0157],[4.5,0.0025],[5.0,0.0714],[5.5,0.0111],[6.0,0.1735],[6.5,0.0252],[7.0,0.2484],[7.5,0.033],[8.0,0.2174],[8.5,0.0252],[9.0,0.1168],[9.5,0.0111],[10.0,0.0373],[10.5,0.0025],[11.0,0.0065],[11.5,0.0002],[12.0,0.0005]]},{"manager":"Peter","actualWins":6.0,"expectedWins":6.944,"luck":-0.944,"worseSchedules":0.1638,"betterSchedules":0.641,"bestScheduleWins":9.0,"worstScheduleWins":5.0,"winDistribution":[[1.0,0.0001],[2.0,0.001],[2.5,0.0001],[3.0,0.0076],[3.5,0.001],[4.0,0.0348],[4.5,0.0044],[5.0,0.102],[5.5,0.0128],[6.0,0.1953],[6.5,0.0244],[7.0,0.2435],[7.5,0.0304],[8.0,0.1922],[8.5,0.024],[9.0,0.0897],[9.5,0.0112],[10.0,0.0211],[10.5,0.0026],[11.0,0.0016],[11.5,0.0002]]},{"manager":"Ted","actualWins":4.0,"expectedWins":3.833,"luck":0.167,"worseSchedules":0.4561,"betterSchedules":0.3532,"bestScheduleWins":6.5,"worstScheduleWins":2.0,"winDistribution":[[0.0,0.005],[0.5,0.0021],[1.0,0.0357],[1.5,0.0145],[2.0,0.1074],[2.5,0.0421],[3.0,0.1811],[3.5,0.0681],[4.0,0.1907],[4.5,0.0682],[5.0,0.1318],[5.5,0.0443],[6.0,0.0608],[6.5,0.019],[7.0,0.0186],[7.5,0.0053],[8.0,0.0036],[8.5,0.0009],[9.0,0.0004],[9.5,0.0001]]},{"manager":"Ty","actualWins":2.0,"expectedWins":4.556,"luck":-2.556,"worseSchedules":0.0033,"betterSchedules":0.9624,"bestScheduleWins":7.0,"worstScheduleWins":2.0,"winDistribution":[[1.0,0.0026],[1.5,0.0007],[2.0,0.0343],[2.5,0.0091],[3.0,0.1358],[3.5,0.0355],[4.0,0.2436],[4.5,0.062],[5.0,0.228],[5.5,0.0555],[6.0,0.1179],[6.5,0.0267],[7.0,0.0342],[7.5,0.007],[8.0,0.0055],[8.5,0.001],[9.0,0.0005],[9.5,0.0001]]},{"manager":"Tyler","actualWins":8.0,"expectedWins":6.056,"luck":1.944,"worseSchedules":0.8746,"betterSchedules":0.0393,"bestScheduleWins":8.0,"worstScheduleWins":5.0,"winDistribution":[[2.0,0.0016],[2.5,0.0002],[3.0,0.0193],[3.5,0.0024],[4.0,0.0889],[4.5,0.0111],[5.0,0.2063],[5.5,0.0258],[6.0,0.2646],[6.5,0.0331],[7.0,0.1967],[7.5,0.0246],[8.0,0.0861],[8.5,0.0108],[9.0,0.022],[9.5,0.0027],[10.0,0.0032],[10.5,0.0004],[11.0,0.0002]]},{"manager":"Vernon","actualWins":9.0,"expectedWins":7.444,"luck":1.556,"worseSchedules":0.7641,"betterSchedules":0.0752,"bestScheduleWins":10.0,"worstScheduleWins":5.0,"winDistribution":[[2.0,0.0003],[3.0,0.0031],[4.0,0.0185],[5.0,0.0688],[6.0,0.1645],[7.0,0.2546],[8.0,0.2543],[9.0,0.1607],[10.0,0.0613],[11.0,0.0128],[12.0,0.0011]]}]},"2012":{"weeks":[1,2,3,4,5,6,7,8,9,10,11,12,13],"managers":["Ben","Joey","John","Lanny","Matt","Peter","Ted","Ty","Tyler","Vernon"],"scheduleRecords":{"wins":[[7,3,3,5,5,7,3,5,3,6],[12,5,5,10,9,5,7,9,7,10],[8,5,6,6,6,4,4,7,6,6],[10,8,8,9,8,9,8,8,5,12],[7,4,4,6,7,3,5,8,4,5],[8,6,5,9,8,5,6,6,5,7],[10,7,6,10,10,6,8,7,6,9],[7,5,3,9,6,7,5,7,5,8],[7,5,1,5,5,5,4,7,3,4],[8,6,6,6,8,6,5,9,7,8]],"losses":[[6,10,10,8,8,6,10,8,10,7],[1,8,8,3,4,8,6,3,5,3],[5,8,7,6,7,9,8,6,7,7],[3,5,4,4,5,4,5,5,7,1],[6,9,8,7,6,10,8,5,9,8],[5,7,8,4,5,8,7,7,8,6],[2,6,7,3,3,7,5,6,6,4],[4,8,9,4,7,6,8,6,8,5],[6,8,12,8,8,8,8,6,10,9],[5,7,7,7,5,7,7,4,6,5]],"ties":[[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,1,1,0],[0,0,0,1,0,0,1,0,0,0],[0,0,1,0,0,0,0,0,1,0],[0,0,1,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[1,0,0,0,0,0,0,0,1,0],[2,0,1,0,0,0,0,0,0,0],[0,0,0,0,0,0,1,0,0,0],[0,0,0,0,0,0,1,0,0,0]]},"distributions":[{"manager":"Ben","actualWins":7.0,"expectedWins":4.444,"luck":2.556,"worseSchedules":0.9549,"betterSchedules":0.0033,"bestScheduleWins":7.0,"worstScheduleWins":3.0,"winDistribution":[[0.0,0.0005],[1.0,0.0083],[2.0,0.0524],[3.0,0.1642],[4.0,0.2858],[5.0,0.2857],[6.0,0.158],[7.0,0.0418],[8.0,0.0033]]},{"manager":"Joey","actualWins":5.0,"expectedWins":8.333,"luck":-3.333,"worseSchedules":0.007,"betterSchedules":0.9715,"bestScheduleWins":12.0,"worstScheduleWins":5.0,"winDistribution":[[3.0,0.0006],[3.5,0.0002],[4.0,0.0046],[4.5,0.0015],[5.0,0.0214],[5.5,0.0067],[6.0,0.0666],[6.5,0.02],[7.0,0.1412],[7.5,0.04],[8.0,0.2039],[8.5,0.0535],[9.0,0.1958],[9.5,0.0458],[10.0,0.1188],[10.5,0.0232],[11.0,0.0417],[11.5,0.006],[12.0,0.0072],[12.5,0.0006],[13.0,0.0005]]},{"manager":"John","actualWins":6.0,"expectedWins":5.889,"luck":0.111,"worseSchedules":0.4138,"betterSchedules":0.3583,"bestScheduleWins":8.0,"worstScheduleWins":4.0,"winDistribution":[[1.0,0.0004],[1.5,0.0002],[2.0,0.0046],[2.5,0.0023],[3.0,0.0268],[3.5,0.0123],[4.0,0.0906],[4.5,0.0353],[5.0,0.1837],[5.5,0.0575],[6.0,0.2279],[6.5,0.0536],[7.0,0.1722],[7.5,0.028],[8.0,0.0765],[8.5,0.0075],[9.0,0.0181],[9.5,0.0008],[10.0,0.0017]]},{"manager":"Lanny","actualWins":9.0,"expectedWins":8.556,"luck":0.444,"worseSchedules":0.5068,"betterSchedules":0.2569,"bestScheduleWins":12.0,"worstScheduleWins":5.5,"winDistribution":[[4.0,0.0006],[4.5,0.0002],[5.0,0.0065],[5.5,0.0025],[6.0,0.0373],[6.5,0.0136],[7.0,0.1199],[7.5,0.0397],[8.0,0.2228],[8.5,0.0636],[9.0,0.2363],[9.5,0.0534],[10.0,0.1358],[10.5,0.021],[11.0,0.0383],[11.5,0.0032],[12.0,0.0048],[12.5,0.0002],[13.0,0.0002]]},{"manager":"Matt","actualWins":7.0,"expectedWins":5.167,"luck":1.833,"worseSchedules":0.8335,"betterSchedules":0.0587,"bestScheduleWins":8.0,"worstScheduleWins":3.0,"winDistribution":[[0.0,0.0002],[1.0,0.0031],[1.5,0.0005],[2.0,0.023],[2.5,0.0037],[3.0,0.086],[3.5,0.0131],[4.0,0.1834],[4.5,0.0262],[5.0,0.2399],[5.5,0.0313],[6.0,0.2002],[6.5,0.0229],[7.0,0.1077],[7.5,0.0103],[8.0,0.0368],[8.5,0.0027],[9.0,0.0076],[9.5,0.0004],[10.0,0.0009]]},{"manager":"Peter","actualWins":5.0,"expectedWins":6.667,"luck":-1.667,"worseSchedules":0.0619,"betterSchedules":0.7932,"bestScheduleWins":9.0,"worstScheduleWins":5.0,"winDistribution":[[2.0,0.001],[3.0,0.0101],[4.0,0.0508],[5.0,0.1449],[6.0,0.2487],[7.0,0.266],[8.0,0.1797],[9.0,0.0761],[10.0,0.0196],[11.0,0.0029],[12.0,0.0002]]},{"manager":"Ted","actualWins":8.0,"expectedWins":8.0,"luck":0.0,"worseSchedules":0.3871,"betterSchedules":0.3756,"bestScheduleWins":10.5,"worstScheduleWins":6.0,"winDistribution":[[4.0,0.0012],[4.5,0.0005],[5.0,0.0179],[5.5,0.0063],[6.0,0.0849],[6.5,0.0279],[7.0,0.1921],[7.5,0.0563],[8.0,0.2372],[8.5,0.059],[9.0,0.1719],[9.5,0.0343],[10.0,0.075],[10.5,0.0112],[11.0,0.0194],[11.5,0.0019],[12.0,0.0027],[12.5,0.0001],[13.0,0.0002]]},{"manager":"Ty","actualWins":7.0,"expectedWins":6.278,"luck":0.722,"worseSchedules":0.6126,"betterSchedules":0.2028,"bestScheduleWins":9.0,"worstScheduleWins":3.5,"winDistribution":[[2.0,0.0008],[2.5,0.0008],[3.0,0.0091],[3.5,0.0074],[4.0,0.0511],[4.5,0.0311],[5.0,0.1467],[5.5,0.067],[6.0,0.2195],[6.5,0.079],[7.0,0.1846],[7.5,0.0533],[8.0,0.0915],[8.5,0.0209],[9.0,0.0269],[9.5,0.0046],[10.0,0.0046],[10.5,0.0005],[11.0,0.0004]]},{"manager":"Tyler","actualWins":3.0,"expectedWins":4.833,"luck":-1.833,"worseSchedules":0.0683,"betterSchedules":0.8137,"bestScheduleWins":7.0,"worstScheduleWins":1.0,"winDistribution":[[0.0,0.0009],[0.5,0.0003],[1.0,0.0096],[1.5,0.0027],[2.0,0.0445],[2.5,0.0103],[3.0,0.118],[3.5,0.0221],[4.0,0.1983],[4.5,0.0292],[5.0,0.2214],[5.5,0.0251],[6.0,0.1682],[6.5,0.0143],[7.0,0.0877],[7.5,0.0054],[8.0,0.0313],[8.5,0.0014],[9.0,0.0076],[9.5,0.0002],[10.0,0.0012],[11.0,0.0001]]},{"manager":"Vernon","actualWins":8.0,"expectedWins":6.833,"luck":1.167,"worseSchedules":0.7148,"betterSchedules":0.0944,"bestScheduleWins":9.0,"worstScheduleWins":5.5,"winDistribution":[[3.0,0.0015],[3.5,0.0015],[4.0,0.0205],[4.5,0.01],[5.0,0.0963],[5.5,0.0265],[6.0,0.221],[6.5,0.0357],[7.0,0.2759],[7.5,0.0259],[8.0,0.1909],[8.5,0.0098],[9.0,0.07],[9.5,0.0017],[10.0,0.0121],[10.5,0.0001],[11.0,0.0007]]}]},"2013":{"weeks":[1,2,3,4,5,6,7,8,9,10,11,12,13],"managers":["Ben","Joey","John","Lanny","Matt","Peter","Ted","Ty","Tyler","Vernon"],"scheduleRecords":{"wins":[[10,9,7,7,8,9,7,9,6,7],[9,7,7,9,8,7,9,9,7,8],[10,7,5,5,7,6,7,8,3,6],[6,4,4,6,4,5,6,6,4,6],[4,6,5,5,5,5,4,6,3,6],[7,7,5,7,7,6,5,7,5,4],[6,6,5,7,6,6,5,8,3,7],[5,5,1,4,3,4,4,4,4,4],[12,8,10,8,8,9,7,9,7,6],[9,7,8,7,9,6,7,10,5,9]],"losses":[[3,4,6,6,3,4,6,4,7,6],[4,6,6,3,5,5,4,4,6,5],[3,5,8,8,6,7,6,5,10,7],[7,9,9,7,8,8,7,7,9,7],[9,7,8,8,8,8,9,6,10,7],[6,6,8,6,6,6,7,6,8,9],[7,7,8,6,7,6,7,5,10,6],[8,7,11,9,10,8,9,9,9,9],[1,5,3,4,5,4,5,4,6,6],[4,6,5,6,4,7,5,3,8,4]],"ties":[[0,0,0,0,2,0,0,0,0,0],[0,0,0,1,0,1,0,0,0,0],[0,1,0,0,0,0,0,0,0,0],[0,0,0,0,1,0,0,0,0,0],[0,0,0,0,0,0,0,1,0,0],[0,0,0,0,0,1,1,0,0,0],[0,0,0,0,0,1,1,0,0,0],[0,1,1,0,0,1,0,0,0,0],[0,0,0,1,0,0,1,0,0,1],[0,0,0,0,0,0,1,0,0,0]]},"distributions":[{"manager":"Ben","actualWins":10.0,"expectedWins":7.778,"luck":2.222,"worseSchedules":0.8983,"betterSchedules":0.029,"bestScheduleWins":10.0,"worstScheduleWins":6.0,"winDistribution":[[2.0,0.0001],[2.5,0.0001],[3.0,0.0009],[3.5,0.0008],[4.0,0.0073],[4.5,0.0048],[5.0,0.0343],[5.5,0.0177],[6.0,0.1003],[6.5,0.0398],[7.0,0.1857],[7.5,0.0555],[8.0,0.2184],[8.5,0.0473],[9.0,0.1615],[9.5,0.0239],[10.0,0.0727],[10.5,0.0067],[11.0,0.0187],[11.5,0.0009],[12.0,0.0025],[13.0,0.0001]]},{"manager":"Joey","actualWins":7.0,"expectedWins":8.222,"luck":-1.222,"worseSchedules":0.1388,"betterSchedules":0.7165,"bestScheduleWins":9.5,"worstScheduleWins":7.0,"winDistribution":[[2.5,0.0001],[3.0,0.0004],[3.5,0.0006],[4.0,0.0038],[4.5,0.0034],[5.0,0.0199],[5.5,0.0129],[6.0,0.0664],[6.5,0.0314],[7.0,0.1448],[7.5,0.0501],[8.0,0.2081],[8.5,0.0515],[9.0,0.195],[9.5,0.0328],[10.0,0.1153],[10.5,0.0123],[11.0,0.0406],[11.5,0.0024],[12.0,0.0076],[12.5,0.0002],[13.0,0.0006]]},{"manager":"John","actualWins":5.0,"expectedWins":6.611,"luck":-1.611,"worseSchedules":0.0704,"betterSchedules":0.7951,"bestScheduleWins":10.0,"worstScheduleWins":3.0,"winDistribution":[[2.0,0.001],[2.5,0.0002],[3.0,0.0095],[3.5,0.0022],[4.0,0.0477],[4.5,0.0098],[5.0,0.1345],[5.5,0.0238],[6.0,0.2264],[6.5,0.0328],[7.0,0.2355],[7.5,0.0261],[8.0,0.1534],[8.5,0.0122],[9.0,0.0625],[9.5,0.0034],[10.0,0.0157],[10.5,0.0005],[11.0,0.0023],[12.0,0.0002]]},{"manager":"Lanny","actualWins":6.0,"expectedWins":5.056,"luck":0.944,"worseSchedules":0.6635,"betterSchedules":0.1321,"bestScheduleWins":6.0,"worstScheduleWins":4.0,"winDistribution":[[1.0,0.0006],[1.5,0.0001],[2.0,0.0119],[2.5,0.0015],[3.0,0.0796],[3.5,0.0099],[4.0,0.2134],[4.5,0.0267],[5.0,0.2843],[5.5,0.0355],[6.0,0.2044],[6.5,0.0256],[7.0,0.079],[7.5,0.0099],[8.0,0.0148],[8.5,0.0018],[9.0,0.001],[9.5,0.0001]]},{"manager":"Matt","actualWins":5.0,"expectedWins":4.944,"luck":0.056,"worseSchedules":0.3901,"betterSchedules":0.3392,"bestScheduleWins":6.5,"worstScheduleWins":3.0,"winDistribution":[[1.0,0.0011],[1.5,0.0002],[2.0,0.0177],[2.5,0.0034],[3.0,0.0937],[3.5,0.0167],[4.0,0.2227],[4.5,0.0345],[5.0,0.2707],[5.5,0.0334],[6.0,0.1854],[6.5,0.017],[7.0,0.0756],[7.5,0.0049],[8.0,0.0188],[8.5,0.0008],[9.0,0.0029],[9.5,0.0001],[10.0,0.0003]]},{"manager":"Peter","actualWins":6.5,"expectedWins":6.056,"luck":0.444,"worseSchedules":0.6038,"betterSchedules":0.3698,"bestScheduleWins":7.0,"worstScheduleWins":4.0,"winDistribution":[[1.0,0.0002],[1.5,0.0004],[2.0,0.0036],[2.5,0.0029],[3.0,0.0231],[3.5,0.0104],[4.0,0.0828],[4.5,0.0225],[5.0,0.1803],[5.5,0.0308],[6.0,0.2467],[6.5,0.0264],[7.0,0.2111],[7.5,0.0135],[8.0,0.1081],[8.5,0.0037],[9.0,0.0297],[9.5,0.0004],[10.0,0.0032]]},{"manager":"Ted","actualWins":5.5,"expectedWins":6.056,"luck":-0.556,"worseSchedules":0.3212,"betterSchedules":0.6436,"bestScheduleWins":8.0,"worstScheduleWins":3.0,"winDistribution":[[2.5,0.0008],[3.0,0.006],[3.5,0.0088],[4.0,0.0705],[4.5,0.0261],[5.0,0.209],[5.5,0.0352],[6.0,0.2819],[6.5,0.0258],[7.0,0.2066],[7.5,0.0111],[8.0,0.0886],[8.5,0.0028],[9.0,0.0227],[9.5,0.0004],[10.0,0.0034],[11.0,0.0003]]},{"manager":"Ty","actualWins":4.0,"expectedWins":3.944,"luck":0.056,"worseSchedules":0.4189,"betterSchedules":0.3722,"bestScheduleWins":5.5,"worstScheduleWins":1.5,"winDistribution":[[0.0,0.0016],[0.5,0.001],[1.0,0.0211],[1.5,0.0121],[2.0,0.0882],[2.5,0.0426],[3.0,0.1794],[3.5,0.073],[4.0,0.2089],[4.5,0.0721],[5.0,0.149],[5.5,0.0436],[6.0,0.0663],[6.5,0.0163],[7.0,0.0179],[7.5,0.0036],[8.0,0.0027],[8.5,0.0004],[9.0,0.0002]]},{"manager":"Tyler","actualWins":7.0,"expectedWins":8.722,"luck":-1.722,"worseSchedules":0.0739,"betterSchedules":0.832,"bestScheduleWins":12.0,"worstScheduleWins":6.5,"winDistribution":[[3.5,0.0001],[4.0,0.0007],[4.5,0.0013],[5.0,0.0065],[5.5,0.0076],[6.0,0.0319],[6.5,0.0256],[7.0,0.0941],[7.5,0.0542],[8.0,0.1739],[8.5,0.0728],[9.0,0.2028],[9.5,0.0616],[10.0,0.1466],[10.5,0.0316],[11.0,0.0628],[11.5,0.0089],[12.0,0.0144],[12.5,0.001],[13.0,0.0014]]},{"manager":"Vernon","actualWins":9.0,"expectedWins":7.611,"luck":1.389,"worseSchedules":0.7412,"betterSchedules":0.0987,"bestScheduleWins":10.0,"worstScheduleWins":5.0,"winDistribution":[[2.0,0.0001],[3.0,0.0016],[3.5,0.0003],[4.0,0.0121],[4.5,0.0022],[5.0,0.0512],[5.5,0.0089],[6.0,0.1318],[6.5,0.021],[7.0,0.2181],[7.5,0.031],[8.0,0.2345],[8.5,0.0283],[9.0,0.1601],[9.5,0.015],[10.0,0.065],[10.5,0.004],[11.0,0.0135],[11.5,0.0003],[12.0,0.0009]]}]},"2014":{"weeks":[1,2,3,4,5,6,7,8,9,10,11,12,13],"managers":["Ben","Joey","John","Lanny","Matt","Peter","Ted","Ty","Tyler","Vernon"],"scheduleRecords":{"wins":[[4,7,5,5,7,7,6,5,7,5],[4,9,7,8,6,9,9,6,6,7],[4,4,6,7,5,5,7,6,3,6],[10,10,10,9,9,10,10,12,10,10],[5,7,7,6,7,9,8,7,6,5],[6,10,8,8,5,7,9,6,9,5],[4,8,5,6,4,6,6,7,7,7],[1,2,4,4,5,2,3,2,3,1],[5,7,8,6,5,7,6,8,10,6],[3,7,8,7,5,9,7,8,7,4]],"losses":[[9,6,8,8,6,5,7,8,6,8],[9,4,6,5,7,4,4,7,6,6],[9,9,7,6,8,7,6,7,10,7],[3,3,3,3,4,3,2,1,3,3],[8,6,6,7,6,4,5,6,7,7],[7,3,5,5,8,6,4,7,4,8],[9,5,8,6,9,6,6,6,5,6],[12,10,9,9,8,11,10,11,9,12],[8,6,5,7,6,6,6,5,3,7],[9,6,5,6,8,4,6,5,6,9]],"ties":[[0,0,0,0,0,1,0,0,0,0],[0,0,0,0,0,0,0,0,1,0],[0,0,0,0,0,1,0,0,0,0],[0,0,0,1,0,0,1,0,0,0],[0,0,0,0,0,0,0,0,0,1],[0,0,0,0,0,0,0,0,0,0],[0,0,0,1,0,1,1,0,1,0],[0,1,0,0,0,0,0,0,1,0],[0,0,0,0,2,0,1,0,0,0],[1,0,0,0,0,0,0,0,0,0]]},"distributions":[{"manager":"Ben","actualWins":4.0,"expectedWins":6.056,"luck":-2.056,"worseSchedules":0.0362,"betterSchedules":0.8695,"bestScheduleWins":7.5,"worstScheduleWins":4.0,"winDistribution":[[1.0,0.0002],[2.0,0.004],[2.5,0.0007],[3.0,0.0271],[3.5,0.0043],[4.0,0.0943],[4.5,0.0143],[5.0,0.1922],[5.5,0.0273],[6.0,0.2431],[6.5,0.0314],[7.0,0.1945],[7.5,0.0219],[8.0,0.0978],[8.5,0.009],[9.0,0.03],[9.5,0.002],[10.0,0.0053],[10.5,0.0002],[11.0,0.0005]]},{"manager":"Joey","actualWins":9.0,"expectedWins":6.944,"luck":2.056,"worseSchedules":0.8481,"betterSchedules":0.0511,"bestScheduleWins":9.0,"worstScheduleWins":4.0,"winDistribution":[[1.0,0.0001],[2.0,0.0012],[2.5,0.0004],[3.0,0.0095],[3.5,0.0025],[4.0,0.0399],[4.5,0.0091],[5.0,0.1052],[5.5,0.0199],[6.0,0.1847],[6.5,0.0283],[7.0,0.2217],[7.5,0.0267],[8.0,0.1824],[8.5,0.0164],[9.0,0.1008],[9.5,0.0063],[10.0,0.0355],[10.5,0.0014],[11.0,0.0071],[11.5,0.0001],[12.0,0.0006]]},{"manager":"John","actualWins":6.0,"expectedWins":5.278,"luck":0.722,"worseSchedules":0.5871,"betterSchedules":0.2067,"bestScheduleWins":7.0,"worstScheduleWins":3.0,"winDistribution":[[0.0,0.0001],[1.0,0.0019],[1.5,0.0003],[2.0,0.0171],[2.5,0.0027],[3.0,0.0753],[3.5,0.0116],[4.0,0.1777],[4.5,0.0257],[5.0,0.2427],[5.5,0.0319],[6.0,0.2062],[6.5,0.0237],[7.0,0.1141],[7.5,0.0111],[8.0,0.0419],[8.5,0.0033],[9.0,0.0102],[9.5,0.0006],[10.0,0.0016],[10.5,0.0001],[11.0,0.0001]]},{"manager":"Lanny","actualWins":9.5,"expectedWins":10.167,"luck":-0.667,"worseSchedules":0.2191,"betterSchedules":0.7364,"bestScheduleWins":12.0,"worstScheduleWins":9.0,"winDistribution":[[7.0,0.0021],[7.5,0.0021],[8.0,0.0321],[8.5,0.0173],[9.0,0.1656],[9.5,0.0444],[10.0,0.3478],[10.5,0.0367],[11.0,0.2667],[11.5,0.0098],[12.0,0.0695],[12.5,0.0007],[13.0,0.0052]]},{"manager":"Matt","actualWins":7.0,"expectedWins":6.722,"luck":0.278,"worseSchedules":0.4581,"betterSchedules":0.3189,"bestScheduleWins":9.0,"worstScheduleWins":5.0,"winDistribution":[[1.0,0.0001],[2.0,0.0016],[2.5,0.0005],[3.0,0.0121],[3.5,0.0032],[4.0,0.0494],[4.5,0.0111],[5.0,0.1241],[5.5,0.0229],[6.0,0.2034],[6.5,0.0297],[7.0,0.223],[7.5,0.0249],[8.0,0.1644],[8.5,0.0134],[9.0,0.0804],[9.5,0.0045],[10.0,0.0252],[10.5,0.0009],[11.0,0.0047],[11.5,0.0001],[12.0,0.0005]]},{"manager":"Peter","actualWins":7.0,"expectedWins":7.333,"luck":-0.333,"worseSchedules":0.2595,"betterSchedules":0.4557,"bestScheduleWins":10.0,"worstScheduleWins":5.0,"winDistribution":[[2.0,0.0001],[3.0,0.0019],[4.0,0.0146],[5.0,0.0658],[6.0,0.1771],[7.0,0.2847],[8.0,0.268],[9.0,0.1426],[10.0,0.0398],[11.0,0.0051],[12.0,0.0002]]},{"manager":"Ted","actualWins":6.5,"expectedWins":6.167,"luck":0.333,"worseSchedules":0.5516,"betterSchedules":0.3748,"bestScheduleWins":8.0,"worstScheduleWins":4.0,"winDistribution":[[1.0,0.0003],[1.5,0.0003],[2.0,0.0029],[2.5,0.0026],[3.0,0.0178],[3.5,0.0129],[4.0,0.0646],[4.5,0.0375],[5.0,0.1441],[5.5,0.0669],[6.0,0.2016],[6.5,0.0736],[7.0,0.1764],[7.5,0.0488],[8.0,0.094],[8.5,0.0184],[9.0,0.0287],[9.5,0.0035],[10.0,0.0044],[10.5,0.0002],[11.0,0.0003]]},{"manager":"Ty","actualWins":2.0,"expectedWins":2.889,"luck":-0.889,"worseSchedules":0.1412,"betterSchedules":0.6403,"bestScheduleWins":5.0,"worstScheduleWins":1.0,"winDistribution":[[0.0,0.0137],[0.5,0.0046],[1.0,0.0934],[1.5,0.0295],[2.0,0.2184],[2.5,0.0622],[3.0,0.2476],[3.5,0.0603],[4.0,0.1563],[4.5,0.0308],[5.0,0.0582],[5.5,0.0087],[6.0,0.0129],[6.5,0.0013],[7.0,0.0017],[7.5,0.0001],[8.0,0.0001]]},{"manager":"Tyler","actualWins":10.0,"expectedWins":6.611,"luck":3.389,"worseSchedules":0.9925,"betterSchedules":0.0007,"bestScheduleWins":10.0,"worstScheduleWins":5.0,"winDistribution":[[2.0,0.0006],[2.5,0.0005],[3.0,0.006],[3.5,0.0045],[4.0,0.0331],[4.5,0.0212],[5.0,0.104],[5.5,0.0551],[6.0,0.194],[6.5,0.0817],[7.0,0.2136],[7.5,0.0674],[8.0,0.1332],[8.5,0.0286],[9.0,0.0436],[9.5,0.0055],[10.0,0.0068],[10.5,0.0003],[11.0,0.0004]]},{"manager":"Vernon","actualWins":4.0,"expectedWins":6.833,"luck":-2.833,"worseSchedules":0.0105,"betterSchedules":0.9544,"bestScheduleWins":9.0,"worstScheduleWins":3.5,"winDistribution":[[2.0,0.0007],[2.5,0.0003],[3.0,0.0069],[3.5,0.0025],[4.0,0.0352],[4.5,0.0101],[5.0,0.1072],[5.5,0.0233],[6.0,0.2033],[6.5,0.0318],[7.0,0.2432],[7.5,0.0262],[8.0,0.1826],[8.5,0.0128],[9.0,0.084],[9.5,0.0036],[10.0,0.0224],[10.5,0.0005],[11.0,0.0031],[12.0,0.0002]]}]},"2015":{"weeks":[1,2,3,4,5,6,7,8,9,10,11,12,13],"managers":["Ben","Joey","John","Lanny","Matt","Peter","Ted","Ty","Tyler","Vernon"],"scheduleRecords":{"wins":[[8,9,8,8,8,8,8,7,10,11],[7,6,5,3,7,8,5,7,6,4],[7,5,6,6,7,7,6,4,7,5],[4,5,1,2,4,5,1,3,6,3],[8,9,7,8,8,9,6,6,10,8],[7,8,7,7,9,9,8,8,7,7],[10,10,6,9,10,10,9,9,9,9],[7,6,7,6,5,6,5,6,7,4],[7,7,6,5,8,8,7,6,9,6],[3,5,2,2,6,4,2,3,3,2]],"losses":[[5,4,5,5,5,5,5,6,3,2],[6,7,8,10,6,4,8,6,7,9],[5,8,7,7,6,6,6,9,6,8],[9,8,12,11,8,8,11,10,7,10],[5,4,6,5,5,4,7,7,3,5],[6,5,6,6,4,4,5,4,6,6],[2,3,7,4,3,3,4,4,3,4],[6,7,6,7,8,7,8,7,6,7],[6,6,7,8,5,5,6,7,4,7],[10,8,11,11,7,8,11,9,10,11]],"ties":[[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,1,0,0,0,0],[1,0,0,0,0,0,1,0,0,0],[0,0,0,0,1,0,1,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,1,0,0],[1,0,0,0,0,0,0,0,1,0],[0,0,0,0,0,0,0,0,0,2],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,1,0,1,0,0]]},"distributions":[{"manager":"Ben","actualWins":8.0,"expectedWins":8.556,"luck":-0.556,"worseSchedules":0.1787,"betterSchedules":0.5279,"bestScheduleWins":11.0,"worstScheduleWins":7.0,"winDistribution":[[4.0,0.0003],[5.0,0.0047],[6.0,0.0355],[7.0,0.1382],[8.0,0.2933],[9.0,0.3233],[10.0,0.1617],[11.0,0.0385],[12.0,0.0042],[13.0,0.0002]]},{"manager":"Joey","actualWins":6.0,"expectedWins":5.833,"luck":0.167,"worseSchedules":0.4368,"betterSchedules":0.348,"bestScheduleWins":8.5,"worstScheduleWins":3.0,"winDistribution":[[1.0,0.0012],[1.5,0.0002],[2.0,0.0116],[2.5,0.0019],[3.0,0.0495],[3.5,0.0076],[4.0,0.1228],[4.5,0.0179],[5.0,0.1972],[5.5,0.0269],[6.0,0.2153],[6.5,0.0269],[7.0,0.1635],[7.5,0.0183],[8.0,0.0868],[8.5,0.0084],[9.0,0.0318],[9.5,0.0025],[10.0,0.0078],[10.5,0.0005],[11.0,0.0012],[12.0,0.0001]]},{"manager":"John","actualWins":6.0,"expectedWins":6.111,"luck":-0.111,"worseSchedules":0.364,"betterSchedules":0.422,"bestScheduleWins":7.5,"worstScheduleWins":4.0,"winDistribution":[[1.0,0.0002],[1.5,0.0001],[2.0,0.0036],[2.5,0.0018],[3.0,0.0234],[3.5,0.0102],[4.0,0.08],[4.5,0.0297],[5.0,0.1642],[5.5,0.0508],[6.0,0.2141],[6.5,0.0535],[7.0,0.1806],[7.5,0.0348],[8.0,0.0976],[8.5,0.0136],[9.0,0.0324],[9.5,0.0029],[10.0,0.006],[10.5,0.0002],[11.0,0.0005]]},{"manager":"Lanny","actualWins":2.0,"expectedWins":3.667,"luck":-1.667,"worseSchedules":0.0569,"betterSchedules":0.8207,"bestScheduleWins":6.0,"worstScheduleWins":1.0,"winDistribution":[[0.0,0.0049],[0.5,0.0017],[1.0,0.038],[1.5,0.0123],[2.0,0.1224],[2.5,0.0367],[3.0,0.2127],[3.5,0.0576],[4.0,0.2196],[4.5,0.052],[5.0,0.1388],[5.5,0.0276],[6.0,0.0531],[6.5,0.0083],[7.0,0.0116],[7.5,0.0013],[8.0,0.0013],[8.5,0.0001],[9.0,0.0001]]},{"manager":"Matt","actualWins":8.0,"expectedWins":7.889,"luck":0.111,"worseSchedules":0.3863,"betterSchedules":0.3382,"bestScheduleWins":10.0,"worstScheduleWins":6.0,"winDistribution":[[2.0,0.0001],[3.0,0.001],[4.0,0.0079],[5.0,0.0382],[6.0,0.1156],[7.0,0.2235],[8.0,0.2756],[9.0,0.2124],[10.0,0.0979],[11.0,0.0248],[12.0,0.003],[13.0,0.0001]]},{"manager":"Peter","actualWins":9.0,"expectedWins":7.611,"luck":1.389,"worseSchedules":0.7617,"betterSchedules":0.0761,"bestScheduleWins":9.0,"worstScheduleWins":7.0,"winDistribution":[[2.5,0.0001],[3.0,0.0005],[3.5,0.0007],[4.0,0.0058],[4.5,0.0044],[5.0,0.0351],[5.5,0.015],[6.0,0.1199],[6.5,0.0295],[7.0,0.2357],[7.5,0.0327],[8.0,0.262],[8.5,0.0203],[9.0,0.1623],[9.5,0.007],[10.0,0.056],[10.5,0.0013],[11.0,0.0106],[11.5,0.0001],[12.0,0.001]]},{"manager":"Ted","actualWins":9.0,"expectedWins":9.222,"luck":-0.222,"worseSchedules":0.3158,"betterSchedules":0.4598,"bestScheduleWins":10.5,"worstScheduleWins":6.0,"winDistribution":[[4.0,0.0002],[4.5,0.0003],[5.0,0.0021],[5.5,0.0025],[6.0,0.0141],[6.5,0.0113],[7.0,0.0567],[7.5,0.0316],[8.0,0.1424],[8.5,0.0545],[9.0,0.2244],[9.5,0.0562],[10.0,0.2152],[10.5,0.032],[11.0,0.1158],[11.5,0.0084],[12.0,0.0293],[12.5,0.0006],[13.0,0.0022]]},{"manager":"Ty","actualWins":6.0,"expectedWins":6.0,"luck":0.0,"worseSchedules":0.3813,"betterSchedules":0.3839,"bestScheduleWins":7.0,"worstScheduleWins":5.0,"winDistribution":[[1.0,0.0001],[1.5,0.0001],[2.0,0.0025],[2.5,0.0018],[3.0,0.0193],[3.5,0.0114],[4.0,0.077],[4.5,0.0353],[5.0,0.1748],[5.5,0.0589],[6.0,0.2348],[6.5,0.0546],[7.0,0.1867],[7.5,0.0275],[8.0,0.0846],[8.5,0.007],[9.0,0.0202],[9.5,0.0008],[10.0,0.0023],[11.0,0.0001]]},{"manager":"Tyler","actualWins":9.0,"expectedWins":6.667,"luck":2.333,"worseSchedules":0.919,"betterSchedules":0.0153,"bestScheduleWins":9.0,"worstScheduleWins":5.0,"winDistribution":[[2.0,0.0005],[3.0,0.0063],[4.0,0.0402],[5.0,0.1388],[6.0,0.2661],[7.0,0.2874],[8.0,0.1796],[9.0,0.0657],[10.0,0.0138],[11.0,0.0015],[12.0,0.0001]]},{"manager":"Vernon","actualWins":2.0,"expectedWins":3.444,"luck":-1.444,"worseSchedules":0.0863,"betterSchedules":0.7643,"bestScheduleWins":6.0,"worstScheduleWins":2.0,"winDistribution":[[0.0,0.0094],[0.5,0.0029],[1.0,0.0571],[1.5,0.0169],[2.0,0.1494],[2.5,0.0417],[3.0,0.2194],[3.5,0.0569],[4.0,0.1989],[4.5,0.0468],[5.0,0.1152],[5.5,0.0238],[6.0,0.0424],[6.5,0.0072],[7.0,0.0095],[7.5,0.0012],[8.0,0.0011],[8.5,0.0001],[9.0,0.0001]]}]},"2016":{"weeks":[1,2,3,4,5,6,7,8,9,10,11,12,13],"managers":["Ben","Joey","John","Lanny","Matt","Peter","Ted","Ty","Tyler","Vernon"],"scheduleRecords":{"wins":[[4,6,5,5,7,4,3,6,4,5],[5,3,3,5,6,7,5,6,4,5],[8,10,11,9,11,11,7,11,9,11],[5,8,9,9,9,10,7,9,5,8],[6,7,6,5,8,9,5,8,6,5],[7,7,5,4,8,7,5,8,5,7],[7,5,6,5,8,9,8,10,4,9],[7,6,5,5,7,7,5,5,7,6],[5,7,6,4,8,7,5,6,4,6],[3,7,3,3,7,8,5,7,4,6]],"losses":[[9,7,7,8,6,9,10,7,9,8],[8,10,9,8,7,6,8,7,9,8],[5,3,2,4,2,2,5,2,4,2],[8,5,4,4,4,3,6,4,8,5],[7,6,7,7,5,4,8,5,7,8],[6,5,8,9,5,6,7,5,8,6],[6,7,7,8,5,4,5,3,9,4],[5,7,8,8,6,6,8,8,6,7],[8,6,7,9,5,6,8,7,9,7],[9,6,10,10,6,5,8,6,8,7]],"ties":[[0,0,1,0,0,0,0,0,0,0],[0,0,1,0,0,0,0,0,0,0],[0,0,0,0,0,0,1,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,1,0,0,0,0,0,0],[0,1,0,0,0,0,1,0,0,0],[0,1,0,0,0,0,0,0,0,0],[1,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[1,0,0,0,0,0,0,0,1,0]]},"distributions":[{"manager":"Ben","actualWins":4.0,"expectedWins":5.056,"luck":-1.056,"worseSchedules":0.128,"betterSchedules":0.6755,"bestScheduleWins":7.0,"worstScheduleWins":3.0,"winDistribution":[[1.0,0.0018],[1.5,0.0004],[2.0,0.0194],[2.5,0.0044],[3.0,0.0851],[3.5,0.0169],[4.0,0.1965],[4.5,0.0322],[5.0,0.2603],[5.5,0.0328],[6.0,0.2034],[6.5,0.018],[7.0,0.0935],[7.5,0.0054],[8.0,0.0249],[8.5,0.0009],[9.0,0.0037],[9.5,0.0001],[10.0,0.0003]]},{"manager":"Joey","actualWins":3.0,"expectedWins":5.167,"luck":-2.167,"worseSchedules":0.0268,"betterSchedules":0.8981,"bestScheduleWins":7.0,"worstScheduleWins":3.0,"winDistribution":[[0.0,0.0002],[1.0,0.0027],[1.5,0.0006],[2.0,0.0191],[2.5,0.0042],[3.0,0.0751],[3.5,0.0146],[4.0,0.1758],[4.5,0.0293],[5.0,0.2524],[5.5,0.0338],[6.0,0.22],[6.5,0.0212],[7.0,0.1113],[7.5,0.0066],[8.0,0.0294],[8.5,0.0008],[9.0,0.0031]]},{"manager":"John","actualWins":11.0,"expectedWins":9.722,"luck":1.278,"worseSchedules":0.7424,"betterSchedules":0.0667,"bestScheduleWins":11.0,"worstScheduleWins":7.5,"winDistribution":[[5.0,0.0004],[5.5,0.0005],[6.0,0.0039],[6.5,0.0031],[7.0,0.025],[7.5,0.0122],[8.0,0.0974],[8.5,0.028],[9.0,0.2239],[9.5,0.036],[10.0,0.288],[10.5,0.0239],[11.0,0.1909],[11.5,0.0069],[12.0,0.0549],[12.5,0.0005],[13.0,0.0044]]},{"manager":"Lanny","actualWins":9.0,"expectedWins":7.778,"luck":1.222,"worseSchedules":0.6908,"betterSchedules":0.1138,"bestScheduleWins":10.0,"worstScheduleWins":5.0,"winDistribution":[[3.0,0.001],[4.0,0.0094],[5.0,0.0453],[6.0,0.1305],[7.0,0.2351],[8.0,0.2694],[9.0,0.1954],[10.0,0.0876],[11.0,0.0229],[12.0,0.0031],[13.0,0.0002]]},{"manager":"Matt","actualWins":8.0,"expectedWins":6.389,"luck":1.611,"worseSchedules":0.7918,"betterSchedules":0.0765,"bestScheduleWins":9.0,"worstScheduleWins":5.0,"winDistribution":[[2.0,0.0014],[2.5,0.0003],[3.0,0.0149],[3.5,0.0034],[4.0,0.066],[4.5,0.0131],[5.0,0.1592],[5.5,0.0267],[6.0,0.2336],[6.5,0.0317],[7.0,0.2185],[7.5,0.0229],[8.0,0.1318],[8.5,0.01],[9.0,0.0504],[9.5,0.0026],[10.0,0.0116],[10.5,0.0003],[11.0,0.0014],[12.0,0.0001]]},{"manager":"Peter","actualWins":7.0,"expectedWins":6.333,"luck":0.667,"worseSchedules":0.5752,"betterSchedules":0.2175,"bestScheduleWins":8.0,"worstScheduleWins":4.0,"winDistribution":[[1.5,0.0002],[2.0,0.0012],[2.5,0.0016],[3.0,0.0113],[3.5,0.009],[4.0,0.0538],[4.5,0.0281],[5.0,0.1423],[5.5,0.0513],[6.0,0.2207],[6.5,0.0557],[7.0,0.2074],[7.5,0.0358],[8.0,0.1184],[8.5,0.0132],[9.0,0.0397],[9.5,0.0025],[10.0,0.0071],[10.5,0.0002],[11.0,0.0005]]},{"manager":"Ted","actualWins":8.0,"expectedWins":7.056,"luck":0.944,"worseSchedules":0.6469,"betterSchedules":0.151,"bestScheduleWins":10.0,"worstScheduleWins":4.0,"winDistribution":[[2.0,0.0002],[3.0,0.0032],[3.5,0.0004],[4.0,0.022],[4.5,0.0031],[5.0,0.0864],[5.5,0.0119],[6.0,0.1971],[6.5,0.0265],[7.0,0.2624],[7.5,0.0337],[8.0,0.2021],[8.5,0.0241],[9.0,0.0899],[9.5,0.0094],[10.0,0.0225],[10.5,0.0019],[11.0,0.0029],[11.5,0.0001],[12.0,0.0001]]},{"manager":"Ty","actualWins":5.0,"expectedWins":6.167,"luck":-1.167,"worseSchedules":0.0883,"betterSchedules":0.7206,"bestScheduleWins":7.5,"worstScheduleWins":5.0,"winDistribution":[[3.0,0.008],[3.5,0.002],[4.0,0.0642],[4.5,0.0141],[5.0,0.1912],[5.5,0.0337],[6.0,0.2814],[6.5,0.0366],[7.0,0.2233],[7.5,0.0192],[8.0,0.0964],[8.5,0.0049],[9.0,0.0219],[9.5,0.0006],[10.0,0.0024],[11.0,0.0001]]},{"manager":"Tyler","actualWins":4.0,"expectedWins":6.0,"luck":-2.0,"worseSchedules":0.0429,"betterSchedules":0.8449,"bestScheduleWins":8.0,"worstScheduleWins":4.0,"winDistribution":[[1.0,0.0005],[2.0,0.0064],[3.0,0.036],[4.0,0.1121],[5.0,0.2146],[6.0,0.2638],[7.0,0.2115],[8.0,0.1103],[9.0,0.0366],[10.0,0.0073],[11.0,0.0008]]},{"manager":"Vernon","actualWins":6.0,"expectedWins":5.333,"luck":0.667,"worseSchedules":0.5745,"betterSchedules":0.2411,"bestScheduleWins":8.0,"worstScheduleWins":3.0,"winDistribution":[[0.0,0.0002],[0.5,0.0001],[1.0,0.0029],[1.5,0.0011],[2.0,0.0198],[2.5,0.007],[3.0,0.0704],[3.5,0.0228],[4.0,0.1499],[4.5,0.0436],[5.0,0.2044],[5.5,0.0524],[6.0,0.1845],[6.5,0.041],[7.0,0.1115],[7.5,0.021],[8.0,0.0449],[8.5,0.007],[9.0,0.0119],[9.5,0.0015],[10.0,0.002],[10.5,0.0002],[11.0,0.0002]]}]},"2017":{"weeks":[1,2,3,4,5,6,7,8,9,10,11,12,13],"managers":["Ben","Jason","Joey","John","Lanny","Matt","Peter","Ted","Tyler","Vernon"],"scheduleRecords":{"wins":[[7,9,10,6,8,3,9,10,7,7],[4,4,5,4,4,4,2,3,5,4],[5,5,4,4,8,6,7,8,5,6],[12,8,10,10,9,8,10,10,9,8],[4,7,5,3,5,2,4,5,6,5],[7,8,9,6,8,7,6,8,8,6],[7,8,9,7,7,6,7,7,7,7],[5,5,4,1,3,2,4,5,6,4],[6,6,8,9,9,5,9,8,9,6],[7,7,8,6,8,7,8,7,8,6]],"losses":[[6,4,3,7,5,9,4,3,6,5],[9,9,8,9,9,9,11,10,8,9],[8,8,9,9,5,7,6,5,8,7],[1,4,3,3,4,5,3,3,4,4],[9,6,8,10,8,11,9,8,7,8],[6,5,4,6,5,5,7,5,5,6],[6,5,4,6,6,7,6,6,6,6],[8,8,8,12,10,11,9,8,7,9],[7,7,5,4,4,8,4,5,4,7],[6,6,4,6,5,5,5,6,5,6]],"ties":[[0,0,0,0,0,1,0,0,0,1],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,1,0,0,0,0,0,0,0,1],[0,0,0,0,0,0,0,0,0,0],[0,0,0,1,0,1,0,0,0,1],[0,0,0,0,0,0,0,0,0,0],[0,0,1,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,1,1,0,1,0,0,0,1]]},"distributions":[{"manager":"Ben","actualWins":7.0,"expectedWins":7.778,"luck":-0.778,"worseSchedules":0.2155,"betterSchedules":0.6052,"bestScheduleWins":10.0,"worstScheduleWins":3.5,"winDistribution":[[2.0,0.0001],[2.5,0.0001],[3.0,0.0011],[3.5,0.0012],[4.0,0.008],[4.5,0.0067],[5.0,0.0354],[5.5,0.0215],[6.0,0.0989],[6.5,0.0426],[7.0,0.1793],[7.5,0.0537],[8.0,0.2126],[8.5,0.0431],[9.0,0.1632],[9.5,0.0214],[10.0,0.0785],[10.5,0.0062],[11.0,0.0221],[11.5,0.0009],[12.0,0.0032],[13.0,0.0002]]},{"manager":"Jason","actualWins":4.0,"expectedWins":3.889,"luck":0.111,"worseSchedules":0.3467,"betterSchedules":0.2715,"bestScheduleWins":5.0,"worstScheduleWins":2.0,"winDistribution":[[0.0,0.0004],[1.0,0.0096],[2.0,0.0762],[3.0,0.2604],[4.0,0.3819],[5.0,0.2162],[6.0,0.0501],[7.0,0.0051],[8.0,0.0002]]},{"manager":"Joey","actualWins":4.0,"expectedWins":6.0,"luck":-2.0,"worseSchedules":0.0432,"betterSchedules":0.8434,"bestScheduleWins":8.0,"worstScheduleWins":4.0,"winDistribution":[[1.0,0.0005],[2.0,0.0064],[3.0,0.0363],[4.0,0.1134],[5.0,0.2152],[6.0,0.262],[7.0,0.2095],[8.0,0.1104],[9.0,0.0375],[10.0,0.0078],[11.0,0.0009]]},{"manager":"John","actualWins":10.0,"expectedWins":9.444,"luck":0.556,"worseSchedules":0.5445,"betterSchedules":0.2293,"bestScheduleWins":12.0,"worstScheduleWins":8.0,"winDistribution":[[5.0,0.0003],[5.5,0.0006],[6.0,0.0057],[6.5,0.0069],[7.0,0.0396],[7.5,0.0277],[8.0,0.1275],[8.5,0.0543],[9.0,0.2232],[9.5,0.0588],[10.0,0.2262],[10.5,0.036],[11.0,0.1328],[11.5,0.0117],[12.0,0.0418],[12.5,0.0016],[13.0,0.0055]]},{"manager":"Lanny","actualWins":5.0,"expectedWins":4.556,"luck":0.444,"worseSchedules":0.4783,"betterSchedules":0.1986,"bestScheduleWins":7.0,"worstScheduleWins":2.0,"winDistribution":[[1.0,0.0026],[2.0,0.031],[3.0,0.1404],[4.0,0.3043],[5.0,0.3231],[6.0,0.1575],[7.0,0.0369],[8.0,0.004],[9.0,0.0002]]},{"manager":"Matt","actualWins":7.5,"expectedWins":7.444,"luck":0.056,"worseSchedules":0.4857,"betterSchedules":0.4571,"bestScheduleWins":9.0,"worstScheduleWins":6.0,"winDistribution":[[2.0,0.0001],[2.5,0.0001],[3.0,0.0012],[3.5,0.001],[4.0,0.0102],[4.5,0.0062],[5.0,0.0479],[5.5,0.0221],[6.0,0.1325],[6.5,0.046],[7.0,0.2183],[7.5,0.0572],[8.0,0.2149],[8.5,0.0423],[9.0,0.1256],[9.5,0.018],[10.0,0.0427],[10.5,0.0041],[11.0,0.0081],[11.5,0.0005],[12.0,0.0008]]},{"manager":"Peter","actualWins":7.0,"expectedWins":7.222,"luck":-0.222,"worseSchedules":0.2898,"betterSchedules":0.4238,"bestScheduleWins":9.0,"worstScheduleWins":6.0,"winDistribution":[[2.0,0.0001],[3.0,0.0023],[4.0,0.0183],[5.0,0.0775],[6.0,0.1916],[7.0,0.2864],[8.0,0.2562],[9.0,0.1299],[10.0,0.0336],[11.0,0.004],[12.0,0.0002]]},{"manager":"Ted","actualWins":5.0,"expectedWins":3.833,"luck":1.167,"worseSchedules":0.6984,"betterSchedules":0.1347,"bestScheduleWins":6.0,"worstScheduleWins":1.0,"winDistribution":[[0.0,0.005],[0.5,0.0008],[1.0,0.038],[1.5,0.006],[2.0,0.121],[2.5,0.0182],[3.0,0.2148],[3.5,0.0298],[4.0,0.2354],[4.5,0.0293],[5.0,0.1669],[5.5,0.018],[6.0,0.0781],[6.5,0.007],[7.0,0.0242],[7.5,0.0017],[8.0,0.0048],[8.5,0.0002],[9.0,0.0006]]},{"manager":"Tyler","actualWins":9.0,"expectedWins":7.333,"luck":1.667,"worseSchedules":0.7734,"betterSchedules":0.0803,"bestScheduleWins":9.0,"worstScheduleWins":5.0,"winDistribution":[[2.0,0.0005],[3.0,0.0051],[4.0,0.0268],[5.0,0.0857],[6.0,0.1778],[7.0,0.2464],[8.0,0.231],[9.0,0.1463],[10.0,0.0614],[11.0,0.0163],[12.0,0.0025],[13.0,0.0002]]},{"manager":"Vernon","actualWins":6.5,"expectedWins":7.5,"luck":-1.0,"worseSchedules":0.2243,"betterSchedules":0.7198,"bestScheduleWins":8.5,"worstScheduleWins":6.5,"winDistribution":[[2.0,0.0001],[2.5,0.0002],[3.0,0.0018],[3.5,0.0016],[4.0,0.0126],[4.5,0.0089],[5.0,0.05],[5.5,0.0283],[6.0,0.1209],[6.5,0.0559],[7.0,0.1848],[7.5,0.0707],[8.0,0.1832],[8.5,0.0578],[9.0,0.1183],[9.5,0.0301],[10.0,0.0491],[10.5,0.0095],[11.0,0.0125],[11.5,0.0017],[12.0,0.0018],[12.5,0.0001],[13.0,0.0001]]}]},"2018":{"weeks":[1,2,3,4,5,6,7,8,9,10,11,12,13],"managers":["Ben","Jason","Joey","John","Lanny","Matt","Peter","Ted","Tyler","Vernon"],"scheduleRecords":{"wins":[[5,5,2,6,5,5,5,5,4,3],[7,6,7,7,6,9,8,7,9,6],[1,3,1,3,1,2,4,3,5,4],[4,8,6,7,7,7,7,6,9,6],[3,4,3,4,4,5,4,6,5,2],[8,7,7,7,9,9,8,9,10,9],[9,7,7,9,6,9,9,9,11,8],[8,9,7,8,7,9,8,9,11,9],[8,10,9,8,8,10,11,9,11,11],[6,7,4,5,5,5,5,5,6,4]],"losses":[[8,8,11,7,8,8,8,8,9,10],[6,7,6,6,7,4,5,6,4,7],[12,10,12,10,12,11,9,10,8,9],[9,5,7,6,6,6,6,7,4,7],[10,9,10,9,9,8,9,7,8,11],[5,6,6,6,4,4,5,4,3,4],[4,6,6,4,7,4,4,4,2,5],[5,4,6,5,6,4,5,4,2,4],[5,3,4,5,5,3,2,4,2,2],[7,6,9,8,8,8,8,8,7,9]],"ties":[[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0]]},"distributions":[{"manager":"Ben","actualWins":5.0,"expectedWins":4.444,"luck":0.556,"worseSchedules":0.5196,"betterSchedules":0.2324,"bestScheduleWins":6.0,"worstScheduleWins":2.0,"winDistribution":[[0.0,0.0016],[1.0,0.016],[2.0,0.0705],[3.0,0.1725],[4.0,0.259],[5.0,0.248],[6.0,0.1535],[7.0,0.0611],[8.0,0.0153],[9.0,0.0023],[10.0,0.0002]]},{"manager":"Jason","actualWins":6.0,"expectedWins":7.333,"luck":-1.333,"worseSchedules":0.0772,"betterSchedules":0.7393,"bestScheduleWins":9.0,"worstScheduleWins":6.0,"winDistribution":[[3.0,0.0012],[4.0,0.0121],[5.0,0.0639],[6.0,0.1835],[7.0,0.2933],[8.0,0.2625],[9.0,0.1353],[10.0,0.0406],[11.0,0.0069],[12.0,0.0006]]},{"manager":"Joey","actualWins":1.0,"expectedWins":2.889,"luck":-1.889,"worseSchedules":0.018,"betterSchedules":0.8638,"bestScheduleWins":5.0,"worstScheduleWins":1.0,"winDistribution":[[0.0,0.018],[1.0,0.1182],[2.0,0.2632],[3.0,0.2968],[4.0,0.1962],[5.0,0.0814],[6.0,0.0219],[7.0,0.0039],[8.0,0.0004]]},{"manager":"John","actualWins":7.0,"expectedWins":6.667,"luck":0.333,"worseSchedules":0.4578,"betterSchedules":0.3037,"bestScheduleWins":9.0,"worstScheduleWins":4.0,"winDistribution":[[1.0,0.0002],[2.0,0.0033],[3.0,0.0191],[4.0,0.0654],[5.0,0.1462],[6.0,0.2236],[7.0,0.2385],[8.0,0.1774],[9.0,0.0902],[10.0,0.0298],[11.0,0.0058],[12.0,0.0005]]},{"manager":"Lanny","actualWins":4.0,"expectedWins":4.0,"luck":0.0,"worseSchedules":0.3506,"betterSchedules":0.3423,"bestScheduleWins":6.0,"worstScheduleWins":2.0,"winDistribution":[[0.0,0.0011],[1.0,0.018],[2.0,0.0959],[3.0,0.2356],[4.0,0.3071],[5.0,0.225],[6.0,0.0936],[7.0,0.0212],[8.0,0.0023],[9.0,0.0001]]},{"manager":"Matt","actualWins":9.0,"expectedWins":8.222,"luck":0.778,"worseSchedules":0.562,"betterSchedules":0.2166,"bestScheduleWins":10.0,"worstScheduleWins":7.0,"winDistribution":[[2.0,0.0001],[3.0,0.0015],[4.0,0.009],[5.0,0.0359],[6.0,0.0964],[7.0,0.1805],[8.0,0.2385],[9.0,0.2214],[10.0,0.1414],[11.0,0.0591],[12.0,0.0145],[13.0,0.0016]]},{"manager":"Peter","actualWins":9.0,"expectedWins":8.333,"luck":0.667,"worseSchedules":0.5581,"betterSchedules":0.18,"bestScheduleWins":11.0,"worstScheduleWins":6.0,"winDistribution":[[5.0,0.0078],[6.0,0.0629],[7.0,0.1908],[8.0,0.2965],[9.0,0.262],[10.0,0.1348],[11.0,0.0391],[12.0,0.0057],[13.0,0.0003]]},{"manager":"Ted","actualWins":9.0,"expectedWins":8.444,"luck":0.556,"worseSchedules":0.5055,"betterSchedules":0.2064,"bestScheduleWins":11.0,"worstScheduleWins":7.0,"winDistribution":[[3.0,0.0001],[4.0,0.0014],[5.0,0.0113],[6.0,0.0543],[7.0,0.1585],[8.0,0.2799],[9.0,0.2881],[10.0,0.16],[11.0,0.0423],[12.0,0.0041]]},{"manager":"Tyler","actualWins":11.0,"expectedWins":9.333,"luck":1.667,"worseSchedules":0.8085,"betterSchedules":0.0363,"bestScheduleWins":11.0,"worstScheduleWins":8.0,"winDistribution":[[4.0,0.0003],[5.0,0.0028],[6.0,0.017],[7.0,0.0661],[8.0,0.1682],[9.0,0.2758],[10.0,0.2782],[11.0,0.1553],[12.0,0.0363]]},{"manager":"Vernon","actualWins":4.0,"expectedWins":5.333,"luck":-1.333,"worseSchedules":0.0747,"betterSchedules":0.7368,"bestScheduleWins":7.0,"worstScheduleWins":4.0,"winDistribution":[[1.0,0.0009],[2.0,0.0108],[3.0,0.0629],[4.0,0.1886],[5.0,0.296],[6.0,0.2577],[7.0,0.1327],[8.0,0.0417],[9.0,0.0079],[10.0,0.0008]]}]},"2019":{"weeks":[1,2,3,4,5,6,7,8,9,10,11,12,13],"managers":["Ben","Jason","Joey","John","Lanny","Matt","Peter","Ted","Tyler","Vernon"],"scheduleRecords":{"wins":[[7,6,7,6,7,5,6,5,7,7],[8,10,7,6,9,6,7,6,8,7],[6,5,9,6,6,10,7,6,7,7],[4,8,6,5,7,6,7,6,6,6],[3,4,3,3,2,6,4,4,5,4],[6,5,5,6,5,5,5,4,6,5],[8,10,9,9,11,10,8,10,9,7],[10,8,10,6,8,9,6,8,10,10],[3,5,6,4,5,5,4,3,6,5],[5,9,7,5,6,10,9,6,8,5]],"losses":[[6,7,6,7,6,8,7,8,6,6],[5,3,6,7,4,7,6,7,5,6],[7,8,4,7,7,3,6,7,6,6],[9,5,7,8,6,7,6,7,7,7],[10,9,10,10,11,7,9,9,8,9],[7,8,8,7,8,8,8,9,6,8],[5,3,3,4,2,3,5,3,4,6],[3,5,3,7,5,4,7,5,3,3],[10,8,7,9,8,8,9,10,7,8],[8,4,6,8,7,3,4,7,5,8]],"ties":[[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,1,0],[0,0,1,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0]]},"distributions":[{"manager":"Ben","actualWins":7.0,"expectedWins":6.222,"luck":0.778,"worseSchedules":0.5739,"betterSchedules":0.2047,"bestScheduleWins":7.0,"worstScheduleWins":5.0,"winDistribution":[[1.0,0.0004],[2.0,0.0055],[3.0,0.0306],[4.0,0.0965],[5.0,0.191],[6.0,0.2499],[7.0,0.2214],[8.0,0.1334],[9.0,0.0542],[10.0,0.0145],[11.0,0.0024],[12.0,0.0002]]},{"manager":"Jason","actualWins":10.0,"expectedWins":7.111,"luck":2.889,"worseSchedules":0.9509,"betterSchedules":0.009,"bestScheduleWins":10.0,"worstScheduleWins":6.0,"winDistribution":[[2.0,0.0004],[3.0,0.0048],[4.0,0.0286],[5.0,0.0983],[6.0,0.2057],[7.0,0.2691],[8.0,0.2243],[9.0,0.1196],[10.0,0.0401],[11.0,0.0081],[12.0,0.0009]]},{"manager":"Joey","actualWins":9.0,"expectedWins":6.667,"luck":2.333,"worseSchedules":0.9109,"betterSchedules":0.0174,"bestScheduleWins":10.0,"worstScheduleWins":5.0,"winDistribution":[[2.0,0.0008],[3.0,0.0087],[4.0,0.0466],[5.0,0.1407],[6.0,0.2535],[7.0,0.2772],[8.0,0.1833],[9.0,0.0717],[10.0,0.0156],[11.0,0.0017],[12.0,0.0001]]},{"manager":"John","actualWins":5.0,"expectedWins":6.222,"luck":-1.222,"worseSchedules":0.0986,"betterSchedules":0.7089,"bestScheduleWins":8.0,"worstScheduleWins":4.0,"winDistribution":[[1.0,0.0001],[2.0,0.0024],[3.0,0.0185],[4.0,0.0776],[5.0,0.1925],[6.0,0.2871],[7.0,0.2535],[8.0,0.1279],[9.0,0.0352],[10.0,0.0048],[11.0,0.0002]]},{"manager":"Lanny","actualWins":2.0,"expectedWins":4.0,"luck":-2.0,"worseSchedules":0.0158,"betterSchedules":0.8866,"bestScheduleWins":6.0,"worstScheduleWins":2.0,"winDistribution":[[0.0,0.0008],[1.0,0.0151],[2.0,0.0976],[3.0,0.245],[4.0,0.3061],[5.0,0.2157],[6.0,0.0914],[7.0,0.024],[8.0,0.0039],[9.0,0.0004]]},{"manager":"Matt","actualWins":5.0,"expectedWins":5.278,"luck":-0.278,"worseSchedules":0.2939,"betterSchedules":0.4545,"bestScheduleWins":6.5,"worstScheduleWins":4.0,"winDistribution":[[0.0,0.0001],[1.0,0.0015],[1.5,0.0005],[2.0,0.014],[2.5,0.0039],[3.0,0.0641],[3.5,0.0149],[4.0,0.1649],[4.5,0.0301],[5.0,0.2516],[5.5,0.0336],[6.0,0.2301],[6.5,0.0206],[7.0,0.1227],[7.5,0.0065],[8.0,0.0352],[8.5,0.0009],[9.0,0.0046],[10.0,0.0002]]},{"manager":"Peter","actualWins":8.0,"expectedWins":9.278,"luck":-1.278,"worseSchedules":0.1171,"betterSchedules":0.7244,"bestScheduleWins":11.0,"worstScheduleWins":7.0,"winDistribution":[[4.0,0.0004],[4.5,0.0001],[5.0,0.0037],[5.5,0.001],[6.0,0.0206],[6.5,0.0051],[7.0,0.071],[7.5,0.0151],[8.0,0.1585],[8.5,0.0276],[9.0,0.2326],[9.5,0.0314],[10.0,0.2216],[10.5,0.0215],[11.0,0.1311],[11.5,0.0079],[12.0,0.0434],[12.5,0.0012],[13.0,0.0061]]},{"manager":"Ted","actualWins":8.0,"expectedWins":8.556,"luck":-0.556,"worseSchedules":0.2087,"betterSchedules":0.5179,"bestScheduleWins":10.0,"worstScheduleWins":6.0,"winDistribution":[[4.0,0.0004],[5.0,0.0074],[6.0,0.0477],[7.0,0.1532],[8.0,0.2734],[9.0,0.2831],[10.0,0.1695],[11.0,0.0558],[12.0,0.009],[13.0,0.0005]]},{"manager":"Tyler","actualWins":6.0,"expectedWins":4.444,"luck":1.556,"worseSchedules":0.8081,"betterSchedules":0.0458,"bestScheduleWins":6.0,"worstScheduleWins":3.0,"winDistribution":[[0.0,0.0002],[1.0,0.0055],[2.0,0.0455],[3.0,0.1683],[4.0,0.3029],[5.0,0.2857],[6.0,0.1461],[7.0,0.0401],[8.0,0.0054],[9.0,0.0003]]},{"manager":"Vernon","actualWins":5.0,"expectedWins":7.222,"luck":-2.222,"worseSchedules":0.027,"betterSchedules":0.885,"bestScheduleWins":10.0,"worstScheduleWins":5.0,"winDistribution":[[2.0,0.0002],[3.0,0.0033],[4.0,0.0235],[5.0,0.088],[6.0,0.1939],[7.0,0.2674],[8.0,0.2361],[9.0,0.1327],[10.0,0.0456],[11.0,0.0087],[12.0,0.0007]]}]},"2020":{"weeks":[1,2,3,4,5,6,7,8,9,10,11,12,13],"managers":["Ben","Jason","Joey","John","Lanny","Matt","Peter","Ted","Tyler","Vernon"],"scheduleRecords":{"wins":[[10,11,11,8,7,11,9,10,7,7],[5,10,9,6,6,8,8,5,7,8],[3,4,7,3,4,6,7,4,5,5],[5,5,8,4,6,5,8,6,4,5],[8,7,9,6,6,8,9,8,8,7],[3,4,4,3,2,3,4,2,4,5],[7,6,6,5,2,6,5,5,7,6],[8,9,10,7,6,9,8,6,6,8],[7,6,8,5,3,3,5,6,4,7],[9,9,8,7,9,10,8,8,9,10]],"losses":[[3,2,2,5,6,2,4,3,6,6],[8,3,4,7,7,5,5,8,6,5],[10,9,6,10,9,7,6,9,8,8],[8,8,5,9,7,8,5,7,9,8],[5,6,4,7,7,5,4,5,5,6],[10,9,9,10,11,10,9,11,9,8],[6,7,7,8,11,7,8,8,6,7],[5,4,3,6,7,4,5,7,7,5],[6,7,5,8,10,10,8,7,9,6],[4,4,5,6,4,3,5,5,4,3]],"ties":[[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0]]},"distributions":[{"manager":"Ben","actualWins":10.0,"expectedWins":9.0,"luck":1.0,"worseSchedules":0.6357,"betterSchedules":0.1243,"bestScheduleWins":11.0,"worstScheduleWins":7.0,"winDistribution":[[4.0,0.0004],[5.0,0.0044],[6.0,0.0268],[7.0,0.0966],[8.0,0.2141],[9.0,0.2935],[10.0,0.24],[11.0,0.1056],[12.0,0.0187]]},{"manager":"Jason","actualWins":10.0,"expectedWins":6.889,"luck":3.111,"worseSchedules":0.9709,"betterSchedules":0.004,"bestScheduleWins":10.0,"worstScheduleWins":5.0,"winDistribution":[[2.0,0.0002],[3.0,0.004],[4.0,0.0323],[5.0,0.1192],[6.0,0.2383],[7.0,0.2809],[8.0,0.204],[9.0,0.092],[10.0,0.0251],[11.0,0.0038],[12.0,0.0002]]},{"manager":"Joey","actualWins":7.0,"expectedWins":4.556,"luck":2.444,"worseSchedules":0.9087,"betterSchedules":0.0226,"bestScheduleWins":7.0,"worstScheduleWins":3.0,"winDistribution":[[0.0,0.0007],[1.0,0.0109],[2.0,0.0607],[3.0,0.1647],[4.0,0.2573],[5.0,0.2525],[6.0,0.162],[7.0,0.0687],[8.0,0.019],[9.0,0.0033],[10.0,0.0003]]},{"manager":"John","actualWins":4.0,"expectedWins":5.778,"luck":-1.778,"worseSchedules":0.0611,"betterSchedules":0.8088,"bestScheduleWins":8.0,"worstScheduleWins":4.0,"winDistribution":[[0.0,0.0001],[1.0,0.0015],[2.0,0.0112],[3.0,0.0484],[4.0,0.1301],[5.0,0.2281],[6.0,0.2639],[7.0,0.1985],[8.0,0.0923],[9.0,0.0236],[10.0,0.0025]]},{"manager":"Lanny","actualWins":6.0,"expectedWins":7.778,"luck":-1.778,"worseSchedules":0.0342,"betterSchedules":0.8528,"bestScheduleWins":9.0,"worstScheduleWins":6.0,"winDistribution":[[3.0,0.0004],[4.0,0.0045],[5.0,0.0292],[6.0,0.113],[7.0,0.2561],[8.0,0.3188],[9.0,0.2011],[10.0,0.0651],[11.0,0.0109],[12.0,0.0009]]},{"manager":"Matt","actualWins":3.0,"expectedWins":3.444,"luck":-0.444,"worseSchedules":0.2352,"betterSchedules":0.4571,"bestScheduleWins":5.0,"worstScheduleWins":2.0,"winDistribution":[[1.0,0.0442],[2.0,0.191],[3.0,0.3076],[4.0,0.2626],[5.0,0.1363],[6.0,0.046],[7.0,0.0104],[8.0,0.0016],[9.0,0.0002]]},{"manager":"Peter","actualWins":5.0,"expectedWins":5.556,"luck":-0.556,"worseSchedules":0.2328,"betterSchedules":0.5182,"bestScheduleWins":7.0,"worstScheduleWins":2.0,"winDistribution":[[0.0,0.0001],[1.0,0.0021],[2.0,0.015],[3.0,0.0613],[4.0,0.1543],[5.0,0.249],[6.0,0.259],[7.0,0.1711],[8.0,0.0695],[9.0,0.0164],[10.0,0.002],[11.0,0.0001]]},{"manager":"Ted","actualWins":6.0,"expectedWins":7.889,"luck":-1.889,"worseSchedules":0.0441,"betterSchedules":0.8443,"bestScheduleWins":10.0,"worstScheduleWins":6.0,"winDistribution":[[3.0,0.0008],[4.0,0.0072],[5.0,0.036],[6.0,0.1116],[7.0,0.2219],[8.0,0.2827],[9.0,0.2227],[10.0,0.0984],[11.0,0.0186]]},{"manager":"Tyler","actualWins":4.0,"expectedWins":5.556,"luck":-1.556,"worseSchedules":0.0678,"betterSchedules":0.7699,"bestScheduleWins":8.0,"worstScheduleWins":3.0,"winDistribution":[[1.0,0.0006],[2.0,0.0099],[3.0,0.0573],[4.0,0.1623],[5.0,0.2618],[6.0,0.2594],[7.0,0.1635],[8.0,0.0659],[9.0,0.0167],[10.0,0.0025],[11.0,0.0002]]},{"manager":"Vernon","actualWins":10.0,"expectedWins":8.556,"luck":1.444,"worseSchedules":0.7465,"betterSchedules":0.0826,"bestScheduleWins":10.0,"worstScheduleWins":7.0,"winDistribution":[[3.0,0.0001],[4.0,0.0013],[5.0,0.0124],[6.0,0.0581],[7.0,0.1557],[8.0,0.2553],[9.0,0.2636],[10.0,0.1709],[11.0,0.067],[12.0,0.0143],[13.0,0.0013]]}]},"2021":{"weeks":[1,2,3,4,5,6,7,8,9,10,11,12,13,14],"managers":["Ben","Jason","Joey","John","Lanny","Matt","Peter","Ted","Tyler","Vernon"],"scheduleRecords":{"wins":[[11,10,6,7,11,11,9,8,10,9],[4,1,2,1,2,1,2,2,3,3],[8,6,4,5,6,6,6,5,8,7],[9,10,6,7,9,11,10,9,10,8],[10,7,5,8,8,8,8,8,9,8],[7,3,2,3,6,5,3,4,5,2],[11,8,6,7,7,8,8,7,8,6],[10,9,5,10,8,9,10,10,8,9],[9,7,6,8,10,10,7,9,7,6],[9,7,5,7,8,8,7,6,9,9]],"losses":[[3,4,8,7,3,3,5,6,4,5],[10,13,12,13,12,13,12,12,11,11],[6,8,10,9,8,8,8,9,6,7],[5,4,8,7,5,3,4,5,4,6],[4,7,9,6,6,6,6,6,5,6],[7,11,12,11,8,9,11,10,9,12],[3,6,8,7,7,6,6,7,6,8],[4,5,9,4,6,5,4,4,6,5],[5,7,8,6,4,4,7,5,7,8],[5,7,9,7,6,6,7,8,5,5]],"ties":[[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0]]},"distributions":[{"manager":"Ben","actualWins":11.0,"expectedWins":9.0,"luck":2.0,"worseSchedules":0.8263,"betterSchedules":0.0532,"bestScheduleWins":11.0,"worstScheduleWins":6.0,"winDistribution":[[3.0,0.0003],[4.0,0.0024],[5.0,0.0125],[6.0,0.0449],[7.0,0.1123],[8.0,0.1982],[9.0,0.2455],[10.0,0.2102],[11.0,0.1205],[12.0,0.0436],[13.0,0.0089],[14.0,0.0008]]},{"manager":"Jason","actualWins":1.0,"expectedWins":2.222,"luck":-1.222,"worseSchedules":0.0629,"betterSchedules":0.7123,"bestScheduleWins":4.0,"worstScheduleWins":1.0,"winDistribution":[[0.0,0.0629],[1.0,0.2248],[2.0,0.3225],[3.0,0.246],[4.0,0.1096],[5.0,0.0292],[6.0,0.0045],[7.0,0.0004]]},{"manager":"Joey","actualWins":4.0,"expectedWins":6.333,"luck":-2.333,"worseSchedules":0.037,"betterSchedules":0.8722,"bestScheduleWins":8.0,"worstScheduleWins":4.0,"winDistribution":[[1.0,0.0006],[2.0,0.0061],[3.0,0.0303],[4.0,0.0908],[5.0,0.1777],[6.0,0.2376],[7.0,0.2218],[8.0,0.1451],[9.0,0.0658],[10.0,0.02],[11.0,0.0038],[12.0,0.0004]]},{"manager":"John","actualWins":7.0,"expectedWins":9.111,"luck":-2.111,"worseSchedules":0.021,"betterSchedules":0.8932,"bestScheduleWins":11.0,"worstScheduleWins":6.0,"winDistribution":[[4.0,0.0001],[5.0,0.002],[6.0,0.0189],[7.0,0.0858],[8.0,0.2113],[9.0,0.2976],[10.0,0.2429],[11.0,0.1115],[12.0,0.0268],[13.0,0.003],[14.0,0.0001]]},{"manager":"Lanny","actualWins":8.0,"expectedWins":7.889,"luck":0.111,"worseSchedules":0.3862,"betterSchedules":0.3096,"bestScheduleWins":10.0,"worstScheduleWins":5.0,"winDistribution":[[3.0,0.0001],[4.0,0.0025],[5.0,0.0237],[6.0,0.1081],[7.0,0.2519],[8.0,0.3042],[9.0,0.2059],[10.0,0.0817],[11.0,0.0192],[12.0,0.0026],[13.0,0.0002]]},{"manager":"Matt","actualWins":5.0,"expectedWins":3.889,"luck":1.111,"worseSchedules":0.688,"betterSchedules":0.1085,"bestScheduleWins":7.0,"worstScheduleWins":2.0,"winDistribution":[[0.0,0.0017],[1.0,0.0245],[2.0,0.1142],[3.0,0.2509],[4.0,0.2967],[5.0,0.2035],[6.0,0.0841],[7.0,0.0211],[8.0,0.0031],[9.0,0.0002]]},{"manager":"Peter","actualWins":8.0,"expectedWins":7.556,"luck":0.444,"worseSchedules":0.4812,"betterSchedules":0.2745,"bestScheduleWins":11.0,"worstScheduleWins":6.0,"winDistribution":[[2.0,0.0005],[3.0,0.0042],[4.0,0.0208],[5.0,0.0684],[6.0,0.153],[7.0,0.2342],[8.0,0.2444],[9.0,0.1708],[10.0,0.0776],[11.0,0.022],[12.0,0.0037],[13.0,0.0003]]},{"manager":"Ted","actualWins":10.0,"expectedWins":8.667,"luck":1.333,"worseSchedules":0.703,"betterSchedules":0.11,"bestScheduleWins":10.0,"worstScheduleWins":5.0,"winDistribution":[[3.0,0.0004],[4.0,0.0031],[5.0,0.0164],[6.0,0.0581],[7.0,0.1398],[8.0,0.2298],[9.0,0.2554],[10.0,0.187],[11.0,0.0856],[12.0,0.022],[13.0,0.0024]]},{"manager":"Tyler","actualWins":7.0,"expectedWins":8.0,"luck":-1.0,"worseSchedules":0.141,"betterSchedules":0.6356,"bestScheduleWins":10.0,"worstScheduleWins":6.0,"winDistribution":[[4.0,0.0033],[5.0,0.0291],[6.0,0.1086],[7.0,0.2234],[8.0,0.2779],[9.0,0.2163],[10.0,0.1053],[11.0,0.0309],[12.0,0.005],[13.0,0.0003]]},{"manager":"Vernon","actualWins":9.0,"expectedWins":7.333,"luck":1.667,"worseSchedules":0.7867,"betterSchedules":0.0661,"bestScheduleWins":9.0,"worstScheduleWins":5.0,"winDistribution":[[2.0,0.0003],[3.0,0.0036],[4.0,0.022],[5.0,0.0788],[6.0,0.1779],[7.0,0.2592],[8.0,0.2449],[9.0,0.1471],[10.0,0.0538],[11.0,0.0111],[12.0,0.0011]]}]},"2022":{"weeks":[1,2,3,4,5,6,7,8,9,10,11,12,13,14],"managers":["Ben","Jason","Joey","John","Lanny","Matt","Peter","Ted","Tyler","Vernon"],"scheduleRecords":{"wins":[[6,6,4,4,3,7,3,4,5,5],[8,8,7,10,11,9,10,10,10,9],[8,10,6,7,6,9,6,7,11,8],[11,9,10,12,11,11,10,12,12,10],[6,4,3,5,4,5,3,5,6,8],[9,9,6,6,6,6,7,6,9,7],[8,7,7,6,9,9,7,7,7,6],[5,4,4,2,4,6,3,4,5,6],[7,8,5,6,6,8,5,5,10,6],[8,7,6,6,7,9,8,5,10,7]],"losses":[[8,8,10,10,11,7,11,10,9,9],[6,6,7,4,3,5,4,4,4,5],[6,4,8,7,8,5,8,7,3,6],[3,5,4,2,3,3,4,2,2,4],[8,10,11,9,10,9,11,9,8,6],[5,5,8,8,8,8,7,8,5,7],[6,7,7,8,5,5,7,7,7,8],[9,10,10,12,10,8,11,10,9,8],[7,6,9,8,8,6,9,9,4,8],[6,7,8,8,7,5,6,9,4,7]],"ties":[[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0]]},"distributions":[{"manager":"Ben","actualWins":6.0,"expectedWins":4.556,"luck":1.444,"worseSchedules":0.7401,"betterSchedules":0.0964,"bestScheduleWins":7.0,"worstScheduleWins":3.0,"winDistribution":[[0.0,0.0013],[1.0,0.0141],[2.0,0.0645],[3.0,0.1621],[4.0,0.2497],[5.0,0.2485],[6.0,0.1635],[7.0,0.0715],[8.0,0.0206],[9.0,0.0038],[10.0,0.0004]]},{"manager":"Jason","actualWins":8.0,"expectedWins":9.333,"luck":-1.333,"worseSchedules":0.0893,"betterSchedules":0.7335,"bestScheduleWins":11.0,"worstScheduleWins":7.0,"winDistribution":[[4.0,0.0002],[5.0,0.0023],[6.0,0.0167],[7.0,0.0701],[8.0,0.1772],[9.0,0.2751],[10.0,0.2615],[11.0,0.147],[12.0,0.0445],[13.0,0.0056]]},{"manager":"Joey","actualWins":6.0,"expectedWins":8.0,"luck":-2.0,"worseSchedules":0.0503,"betterSchedules":0.8367,"bestScheduleWins":11.0,"worstScheduleWins":6.0,"winDistribution":[[2.0,0.0001],[3.0,0.0012],[4.0,0.009],[5.0,0.04],[6.0,0.1129],[7.0,0.2087],[8.0,0.2556],[9.0,0.2088],[10.0,0.1133],[11.0,0.0402],[12.0,0.0089],[13.0,0.0011],[14.0,0.0001]]},{"manager":"John","actualWins":12.0,"expectedWins":10.667,"luck":1.333,"worseSchedules":0.734,"betterSchedules":0.0713,"bestScheduleWins":12.0,"worstScheduleWins":9.0,"winDistribution":[[6.0,0.0007],[7.0,0.0075],[8.0,0.0414],[9.0,0.1324],[10.0,0.2557],[11.0,0.2963],[12.0,0.1947],[13.0,0.0636],[14.0,0.0077]]},{"manager":"Lanny","actualWins":4.0,"expectedWins":5.0,"luck":-1.0,"worseSchedules":0.1557,"betterSchedules":0.6259,"bestScheduleWins":8.0,"worstScheduleWins":3.0,"winDistribution":[[0.0,0.0004],[1.0,0.0058],[2.0,0.0353],[3.0,0.1141],[4.0,0.2184],[5.0,0.2629],[6.0,0.2069],[7.0,0.1084],[8.0,0.0378],[9.0,0.0086],[10.0,0.0012],[11.0,0.0001]]},{"manager":"Matt","actualWins":6.0,"expectedWins":7.222,"luck":-1.222,"worseSchedules":0.111,"betterSchedules":0.6984,"bestScheduleWins":9.0,"worstScheduleWins":6.0,"winDistribution":[[2.0,0.0003],[3.0,0.0037],[4.0,0.0229],[5.0,0.0841],[6.0,0.1906],[7.0,0.2718],[8.0,0.2436],[9.0,0.1337],[10.0,0.0422],[11.0,0.0067],[12.0,0.0004]]},{"manager":"Peter","actualWins":7.0,"expectedWins":7.333,"luck":-0.333,"worseSchedules":0.2805,"betterSchedules":0.4614,"bestScheduleWins":9.0,"worstScheduleWins":6.0,"winDistribution":[[2.0,0.0005],[3.0,0.0042],[4.0,0.0227],[5.0,0.078],[6.0,0.175],[7.0,0.2581],[8.0,0.2473],[9.0,0.1494],[10.0,0.0536],[11.0,0.0103],[12.0,0.0008]]},{"manager":"Ted","actualWins":4.0,"expectedWins":4.333,"luck":-0.333,"worseSchedules":0.2781,"betterSchedules":0.4452,"bestScheduleWins":6.0,"worstScheduleWins":2.0,"winDistribution":[[0.0,0.0012],[1.0,0.015],[2.0,0.0737],[3.0,0.1882],[4.0,0.2767],[5.0,0.2469],[6.0,0.1375],[7.0,0.0484],[8.0,0.0108],[9.0,0.0015],[10.0,0.0001]]},{"manager":"Tyler","actualWins":10.0,"expectedWins":6.222,"luck":3.778,"worseSchedules":0.9862,"betterSchedules":0.0019,"bestScheduleWins":10.0,"worstScheduleWins":5.0,"winDistribution":[[2.0,0.0029],[3.0,0.025],[4.0,0.0932],[5.0,0.1973],[6.0,0.2616],[7.0,0.2268],[8.0,0.1303],[9.0,0.0492],[10.0,0.0119],[11.0,0.0017],[12.0,0.0001]]},{"manager":"Vernon","actualWins":7.0,"expectedWins":7.333,"luck":-0.333,"worseSchedules":0.2689,"betterSchedules":0.4536,"bestScheduleWins":10.0,"worstScheduleWins":5.0,"winDistribution":[[2.0,0.0001],[3.0,0.0017],[4.0,0.0155],[5.0,0.0706],[6.0,0.1811],[7.0,0.2775],[8.0,0.2581],[9.0,0.1433],[10.0,0.0448],[11.0,0.007],[12.0,0.0004]]}]},"2023":{"weeks":[1,2,3,4,5,6,7,8,9,10,11,12,13,14],"managers":["Ben","Jason","Joey","John","Lanny","Matt","Peter","Ted","Tyler","Vernon"],"scheduleRecords":{"wins":[[6,8,7,5,7,5,5,5,8,7],[7,7,8,7,7,9,7,6,9,9],[8,7,8,9,7,8,11,8,10,9],[6,8,5,5,6,5,6,6,7,5],[9,7,5,5,6,5,6,4,9,7],[6,6,6,7,8,8,5,8,7,7],[7,10,8,7,10,10,6,8,9,10],[7,7,7,7,7,7,6,6,8,8],[7,8,8,6,9,10,9,8,12,8],[5,4,3,6,5,3,4,4,6,6]],"losses":[[8,6,7,9,7,9,9,9,6,7],[7,7,6,7,7,5,7,8,5,5],[6,7,6,5,7,6,3,6,4,5],[8,6,9,9,8,9,8,8,7,9],[5,7,9,9,8,9,8,10,5,7],[8,8,8,7,6,6,9,6,7,7],[7,4,6,7,4,4,8,6,5,4],[7,7,7,7,7,7,8,8,6,6],[7,6,6,8,5,4,5,6,2,6],[9,10,11,8,9,11,10,10,8,8]],"ties":[[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0]]},"distributions":[{"manager":"Ben","actualWins":6.0,"expectedWins":6.333,"luck":-0.333,"worseSchedules":0.2929,"betterSchedules":0.4559,"bestScheduleWins":8.0,"worstScheduleWins":5.0,"winDistribution":[[1.0,0.0004],[2.0,0.0045],[3.0,0.025],[4.0,0.0837],[5.0,0.1791],[6.0,0.2513],[7.0,0.234],[8.0,0.1449],[9.0,0.059],[10.0,0.0153],[11.0,0.0024],[12.0,0.0002]]},{"manager":"Jason","actualWins":7.0,"expectedWins":7.667,"luck":-0.667,"worseSchedules":0.1203,"betterSchedules":0.5649,"bestScheduleWins":9.0,"worstScheduleWins":6.0,"winDistribution":[[4.0,0.0007],[5.0,0.0143],[6.0,0.1054],[7.0,0.3148],[8.0,0.3661],[9.0,0.1631],[10.0,0.0326],[11.0,0.003],[12.0,0.0001]]},{"manager":"Joey","actualWins":8.0,"expectedWins":8.556,"luck":-0.556,"worseSchedules":0.2339,"betterSchedules":0.5165,"bestScheduleWins":11.0,"worstScheduleWins":7.0,"winDistribution":[[3.0,0.0001],[4.0,0.0018],[5.0,0.0145],[6.0,0.0615],[7.0,0.1559],[8.0,0.2496],[9.0,0.2574],[10.0,0.1701],[11.0,0.0699],[12.0,0.0168],[13.0,0.0021],[14.0,0.0001]]},{"manager":"John","actualWins":5.0,"expectedWins":6.0,"luck":-1.0,"worseSchedules":0.1365,"betterSchedules":0.6453,"bestScheduleWins":8.0,"worstScheduleWins":5.0,"winDistribution":[[1.0,0.0004],[2.0,0.0048],[3.0,0.029],[4.0,0.1023],[5.0,0.2182],[6.0,0.2847],[7.0,0.225],[8.0,0.1046],[9.0,0.0272],[10.0,0.0036],[11.0,0.0002]]},{"manager":"Lanny","actualWins":6.0,"expectedWins":6.333,"luck":-0.333,"worseSchedules":0.2999,"betterSchedules":0.4573,"bestScheduleWins":9.0,"worstScheduleWins":4.0,"winDistribution":[[1.0,0.0005],[2.0,0.0054],[3.0,0.0281],[4.0,0.0879],[5.0,0.1779],[6.0,0.2428],[7.0,0.2273],[8.0,0.146],[9.0,0.0631],[10.0,0.0177],[11.0,0.003],[12.0,0.0003]]},{"manager":"Matt","actualWins":8.0,"expectedWins":6.667,"luck":1.333,"worseSchedules":0.734,"betterSchedules":0.0865,"bestScheduleWins":8.0,"worstScheduleWins":5.0,"winDistribution":[[2.0,0.0004],[3.0,0.0066],[4.0,0.0434],[5.0,0.1428],[6.0,0.2613],[7.0,0.2796],[8.0,0.1795],[9.0,0.0692],[10.0,0.0154],[11.0,0.0018],[12.0,0.0001]]},{"manager":"Peter","actualWins":6.0,"expectedWins":8.778,"luck":-2.778,"worseSchedules":0.0131,"betterSchedules":0.939,"bestScheduleWins":10.0,"worstScheduleWins":6.0,"winDistribution":[[3.0,0.0001],[4.0,0.0016],[5.0,0.0113],[6.0,0.0479],[7.0,0.1293],[8.0,0.2285],[9.0,0.265],[10.0,0.1983],[11.0,0.0916],[12.0,0.0236],[13.0,0.0026]]},{"manager":"Ted","actualWins":6.0,"expectedWins":7.111,"luck":-1.111,"worseSchedules":0.1351,"betterSchedules":0.6553,"bestScheduleWins":8.0,"worstScheduleWins":6.0,"winDistribution":[[3.0,0.0033],[4.0,0.0285],[5.0,0.1033],[6.0,0.2096],[7.0,0.265],[8.0,0.2186],[9.0,0.1191],[10.0,0.0422],[11.0,0.0092],[12.0,0.0011],[13.0,0.0001]]},{"manager":"Tyler","actualWins":12.0,"expectedWins":8.111,"luck":3.889,"worseSchedules":0.9928,"betterSchedules":0.0005,"bestScheduleWins":12.0,"worstScheduleWins":6.0,"winDistribution":[[2.0,0.0001],[3.0,0.0011],[4.0,0.0073],[5.0,0.0323],[6.0,0.0966],[7.0,0.1953],[8.0,0.2635],[9.0,0.2308],[10.0,0.1257],[11.0,0.0401],[12.0,0.0068],[13.0,0.0005]]},{"manager":"Vernon","actualWins":6.0,"expectedWins":4.444,"luck":1.556,"worseSchedules":0.7622,"betterSchedules":0.0857,"bestScheduleWins":6.0,"worstScheduleWins":3.0,"winDistribution":[[0.0,0.0018],[1.0,0.0179],[2.0,0.0743],[3.0,0.1738],[4.0,0.2535],[5.0,0.2409],[6.0,0.1522],[7.0,0.0642],[8.0,0.0179],[9.0,0.0032],[10.0,0.0004]]}]},"2024":{"weeks":[1,2,3,4,5,6,7,8,9,10,11,12,13,14],"managers":["Ben","Jason","Joey","John","Lanny","Matt","Peter","Ted","Tyler","Vernon"],"scheduleRecords":{"wins":[[6,8,10,3,5,7,7,6,6,6],[7,7,11,7,7,6,11,6,6,6],[4,8,9,4,7,6,7,7,7,8],[4,2,5,2,2,3,5,1,2,2],[9,7,10,6,8,7,7,9,5,8],[8,7,10,7,7,8,10,8,6,8],[7,8,10,7,10,8,9,8,8,9],[8,9,9,8,8,9,9,8,9,11],[7,10,7,5,8,7,7,8,7,7],[5,6,9,5,5,8,11,5,7,6]],"losses":[[8,6,4,11,9,7,7,8,8,8],[7,7,3,7,7,8,3,8,8,8],[10,6,5,10,7,8,7,7,7,6],[10,12,9,12,12,11,9,13,12,12],[5,7,4,8,6,7,7,5,9,6],[6,7,4,7,7,6,4,6,8,6],[7,6,4,7,4,6,5,6,6,5],[6,5,5,6,6,5,5,6,5,3],[7,4,7,9,6,7,7,6,7,7],[9,8,5,9,9,6,3,9,7,8]],"ties":[[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0]]},"distributions":[{"manager":"Ben","actualWins":6.0,"expectedWins":6.444,"luck":-0.444,"worseSchedules":0.2654,"betterSchedules":0.4768,"bestScheduleWins":10.0,"worstScheduleWins":3.0,"winDistribution":[[1.0,0.0001],[2.0,0.0018],[3.0,0.0162],[4.0,0.0719],[5.0,0.1755],[6.0,0.2579],[7.0,0.2424],[8.0,0.1507],[9.0,0.0628],[10.0,0.0174],[11.0,0.0031],[12.0,0.0004]]},{"manager":"Jason","actualWins":7.0,"expectedWins":7.444,"luck":-0.444,"worseSchedules":0.2563,"betterSchedules":0.4793,"bestScheduleWins":11.0,"worstScheduleWins":6.0,"winDistribution":[[2.0,0.0001],[3.0,0.0015],[4.0,0.0143],[5.0,0.0672],[6.0,0.1733],[7.0,0.2643],[8.0,0.2512],[9.0,0.1526],[10.0,0.0593],[11.0,0.0142],[12.0,0.0019],[13.0,0.0001]]},{"manager":"Joey","actualWins":9.0,"expectedWins":6.444,"luck":2.556,"worseSchedules":0.9195,"betterSchedules":0.017,"bestScheduleWins":9.0,"worstScheduleWins":4.0,"winDistribution":[[1.0,0.0002],[2.0,0.0028],[3.0,0.0191],[4.0,0.0719],[5.0,0.1674],[6.0,0.2518],[7.0,0.248],[8.0,0.1584],[9.0,0.0635],[10.0,0.015],[11.0,0.0019],[12.0,0.0001]]},{"manager":"John","actualWins":2.0,"expectedWins":2.889,"luck":-0.889,"worseSchedules":0.1296,"betterSchedules":0.6115,"bestScheduleWins":5.0,"worstScheduleWins":1.0,"winDistribution":[[0.0,0.0186],[1.0,0.1109],[2.0,0.259],[3.0,0.3081],[4.0,0.2042],[5.0,0.0788],[6.0,0.0179],[7.0,0.0023],[8.0,0.0002]]},{"manager":"Lanny","actualWins":8.0,"expectedWins":7.556,"luck":0.444,"worseSchedules":0.4839,"betterSchedules":0.2642,"bestScheduleWins":10.0,"worstScheduleWins":5.0,"winDistribution":[[2.0,0.0003],[3.0,0.0028],[4.0,0.0172],[5.0,0.0643],[6.0,0.155],[7.0,0.2444],[8.0,0.2519],[9.0,0.1684],[10.0,0.0725],[11.0,0.0197],[12.0,0.0033],[13.0,0.0003]]},{"manager":"Matt","actualWins":8.0,"expectedWins":7.889,"luck":0.111,"worseSchedules":0.3909,"betterSchedules":0.3333,"bestScheduleWins":10.0,"worstScheduleWins":6.0,"winDistribution":[[3.0,0.0006],[4.0,0.0065],[5.0,0.0365],[6.0,0.1181],[7.0,0.2293],[8.0,0.2758],[9.0,0.2075],[10.0,0.096],[11.0,0.0259],[12.0,0.0036],[13.0,0.0002]]},{"manager":"Peter","actualWins":9.0,"expectedWins":8.333,"luck":0.667,"worseSchedules":0.5315,"betterSchedules":0.2432,"bestScheduleWins":10.0,"worstScheduleWins":7.0,"winDistribution":[[2.0,0.0002],[3.0,0.0016],[4.0,0.0089],[5.0,0.0335],[6.0,0.0886],[7.0,0.1683],[8.0,0.2304],[9.0,0.2253],[10.0,0.1534],[11.0,0.0691],[12.0,0.0185],[13.0,0.0022]]},{"manager":"Ted","actualWins":8.0,"expectedWins":8.889,"luck":-0.889,"worseSchedules":0.1464,"betterSchedules":0.6184,"bestScheduleWins":11.0,"worstScheduleWins":8.0,"winDistribution":[[4.0,0.0004],[5.0,0.0047],[6.0,0.0305],[7.0,0.1109],[8.0,0.2352],[9.0,0.2943],[10.0,0.2144],[11.0,0.0882],[12.0,0.0194],[13.0,0.0021],[14.0,0.0001]]},{"manager":"Tyler","actualWins":7.0,"expectedWins":7.333,"luck":-0.333,"worseSchedules":0.2754,"betterSchedules":0.456,"bestScheduleWins":10.0,"worstScheduleWins":5.0,"winDistribution":[[2.0,0.0001],[3.0,0.0024],[4.0,0.0183],[5.0,0.0747],[6.0,0.1798],[7.0,0.2686],[8.0,0.252],[9.0,0.1459],[10.0,0.0492],[11.0,0.0085],[12.0,0.0005]]},{"manager":"Vernon","actualWins":6.0,"expectedWins":6.778,"luck":-0.778,"worseSchedules":0.1676,"betterSchedules":0.5816,"bestScheduleWins":11.0,"worstScheduleWins":5.0,"winDistribution":[[2.0,0.0003],[3.0,0.0049],[4.0,0.0355],[5.0,0.1269],[6.0,0.2508],[7.0,0.2886],[8.0,0.1966],[9.0,0.0777],[10.0,0.0168],[11.0,0.0018],[12.0,0.0001]]}]},"2025":{"weeks":[1,2,3,4,5,6,7,8,9,10,11,12,13,14],"managers":["Ben","Jason","Joey","John","Lanny","Matt","Peter","Ted","Tyler","Vernon"],"scheduleRecords":{"wins":[[4,4,6,5,2,4,4,6,5,6],[7,6,8,6,5,3,8,6,6,7],[7,9,8,8,5,6,8,8,8,7],[8,5,6,5,5,6,8,3,8,7],[5,5,5,5,4,4,6,6,3,2],[11,9,11,9,7,9,8,9,10,6],[8,10,11,6,8,9,10,9,9,7],[8,8,8,10,6,7,9,8,9,8],[10,10,10,10,10,8,9,7,11,10],[8,6,6,4,5,8,7,5,6,5]],"losses":[[10,10,8,9,12,10,10,8,9,8],[7,8,6,8,9,11,6,8,8,7],[7,5,6,6,9,8,6,6,6,7],[6,9,8,9,9,8,6,11,6,7],[9,9,9,9,10,10,8,8,11,12],[3,5,3,5,7,5,6,5,4,8],[6,4,3,8,6,5,4,5,5,7],[6,6,6,4,8,7,5,6,5,6],[4,4,4,4,4,6,5,7,3,4],[6,8,8,10,9,6,7,9,8,9]],"ties":[[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0],[0,0,0,0,0,0,0,0,0,0]]},"distributions":[{"manager":"Ben","actualWins":4.0,"expectedWins":4.667,"luck":-0.667,"worseSchedules":0.2346,"betterSchedules":0.5331,"bestScheduleWins":6.0,"worstScheduleWins":2.0,"winDistribution":[[0.0,0.0016],[1.0,0.0156],[2.0,0.0645],[3.0,0.153],[4.0,0.2323],[5.0,0.2384],[6.0,0.1701],[7.0,0.0855],[8.0,0.0303],[9.0,0.0075],[10.0,0.0012],[11.0,0.0001]]},{"manager":"Jason","actualWins":6.0,"expectedWins":6.222,"luck":-0.222,"worseSchedules":0.3045,"betterSchedules":0.4281,"bestScheduleWins":8.0,"worstScheduleWins":3.0,"winDistribution":[[1.0,0.0003],[2.0,0.0038],[3.0,0.0243],[4.0,0.0863],[5.0,0.1898],[6.0,0.2674],[7.0,0.2414],[8.0,0.1353],[9.0,0.0439],[10.0,0.0071],[11.0,0.0004]]},{"manager":"Joey","actualWins":8.0,"expectedWins":7.333,"luck":0.667,"worseSchedules":0.5433,"betterSchedules":0.2353,"bestScheduleWins":9.0,"worstScheduleWins":5.0,"winDistribution":[[2.0,0.0005],[3.0,0.0059],[4.0,0.0304],[5.0,0.0912],[6.0,0.1779],[7.0,0.2373],[8.0,0.2214],[9.0,0.145],[10.0,0.0659],[11.0,0.0201],[12.0,0.0039],[13.0,0.0004]]},{"manager":"John","actualWins":5.0,"expectedWins":6.222,"luck":-1.222,"worseSchedules":0.1159,"betterSchedules":0.6869,"bestScheduleWins":8.0,"worstScheduleWins":3.0,"winDistribution":[[1.0,0.0002],[2.0,0.0031],[3.0,0.0233],[4.0,0.0894],[5.0,0.1972],[6.0,0.2672],[7.0,0.2312],[8.0,0.1296],[9.0,0.0468],[10.0,0.0106],[11.0,0.0014],[12.0,0.0001]]},{"manager":"Lanny","actualWins":4.0,"expectedWins":4.556,"luck":-0.556,"worseSchedules":0.2069,"betterSchedules":0.5156,"bestScheduleWins":6.0,"worstScheduleWins":2.0,"winDistribution":[[0.0,0.0004],[1.0,0.0067],[2.0,0.0459],[3.0,0.154],[4.0,0.2775],[5.0,0.2835],[6.0,0.1672],[7.0,0.0552],[8.0,0.0091],[9.0,0.0005]]},{"manager":"Matt","actualWins":9.0,"expectedWins":8.889,"luck":0.111,"worseSchedules":0.3902,"betterSchedules":0.3435,"bestScheduleWins":11.0,"worstScheduleWins":6.0,"winDistribution":[[3.0,0.0001],[4.0,0.0014],[5.0,0.0097],[6.0,0.0419],[7.0,0.1181],[8.0,0.219],[9.0,0.2663],[10.0,0.2086],[11.0,0.1016],[12.0,0.0288],[13.0,0.0042],[14.0,0.0002]]},{"manager":"Peter","actualWins":10.0,"expectedWins":8.556,"luck":1.444,"worseSchedules":0.7531,"betterSchedules":0.0743,"bestScheduleWins":11.0,"worstScheduleWins":6.0,"winDistribution":[[3.0,0.0001],[4.0,0.0017],[5.0,0.0121],[6.0,0.0536],[7.0,0.1498],[8.0,0.2603],[9.0,0.2753],[10.0,0.1726],[11.0,0.0618],[12.0,0.0116],[13.0,0.0009]]},{"manager":"Ted","actualWins":8.0,"expectedWins":8.111,"luck":-0.111,"worseSchedules":0.3259,"betterSchedules":0.386,"bestScheduleWins":10.0,"worstScheduleWins":6.0,"winDistribution":[[3.0,0.0002],[4.0,0.0032],[5.0,0.0227],[6.0,0.0901],[7.0,0.2097],[8.0,0.2881],[9.0,0.2339],[10.0,0.1134],[11.0,0.0327],[12.0,0.0054],[13.0,0.0005]]},{"manager":"Tyler","actualWins":11.0,"expectedWins":9.333,"luck":1.667,"worseSchedules":0.809,"betterSchedules":0.0482,"bestScheduleWins":11.0,"worstScheduleWins":7.0,"winDistribution":[[4.0,0.0001],[5.0,0.002],[6.0,0.0153],[7.0,0.0676],[8.0,0.1781],[9.0,0.2816],[10.0,0.2643],[11.0,0.1428],[12.0,0.0419],[13.0,0.006],[14.0,0.0003]]},{"manager":"Vernon","actualWins":5.0,"expectedWins":6.111,"luck":-1.111,"worseSchedules":0.1115,"betterSchedules":0.6789,"bestScheduleWins":8.0,"worstScheduleWins":4.0,"winDistribution":[[2.0,0.002],[3.0,0.0206],[4.0,0.0889],[5.0,0.2097],[6.0,0.2916],[7.0,0.2414],[8.0,0.1142],[9.0,0.0282],[10.0,0.0033],[11.0,0.0001]]}]}};
@@ -0,0 +1,4 @@
+// JBS FFL Scoring Analytics
+// Generated from ESPN scraped data - Do not edit manually
+
+export const scoringAnalytics = {"2009":{"weeks":[1,2,3,4,5,6,7,8,9,10,11,12,13],"managers":[{"manager":"Matt","games":13,"wins":10,"losses":3,"ties":0,"pointsFor":1583.0,"pointsAgainst":1369.0,"mean":121.77,"median":129.0,"stdDev":28.52,"percentiles":{"p10":80.6,"p25":105.0,"p75":138.0,"p90":153.4},"expectedWins":7.833,"luck":2.167,"averageZScore":0.362,"weeklyZScores":[0.631,1.172,-0.804,-1.689,-1.119,0.499,1.655,-0.08,0.445,-0.181,0.917,2.487,0.772]},{"manager":"John","games":13,"wins":7,"losses":4,"ties":2,"pointsFor":1391.0,"pointsAgainst":1387.0,"mean":107.0,"median":100.0,"stdDev":21.97,"percentiles":{"p10":80.4,"p25":93.0,"p75":123.0,"p90":129.0},"expectedWins":6.0,"luck":2.0,"averageZScore":-0.161,"weeklyZScores":[-0.283,1.866,-1.384,-0.241,-0.261,-1.457,-1.519,0.555,-0.849,0.898,0.182,0.173,0.229]},{"manager":"Vernon","games":13,"wins":9,"losses":3,"ties":1,"pointsFor":1573.0,"pointsAgainst":1309.0,"mean":121.0,"median":125.0,"stdDev":19.26,"percentiles":{"p10":100.8,"p25":105.0,"p75":134.0,"p90":143.6},"expectedWins":8.056,"luck":1.444,"averageZScore":0.383,"weeklyZScores":[1.545,0.608,1.319,-0.241,1.699,-0.609,0.786,0.622,-0.43,1.071,-0.078,-0.752,-0.555]},{"manager":"Ted","games":13,"wins":7,"losses":6,"ties":0,"pointsFor":1388.0,"pointsAgainst":1450.0,"mean":106.77,"median":105.0,"stdDev":18.21,"percentiles":{"p10":90.6,"p25":93.0,"p75":116.0,"p90":133.4},"expectedWins":5.667,"luck":1.333,"averageZScore":-0.15,"weeklyZScores":[-0.832,-0.781,-0.161,1.93,-0.588,0.433,0.068,-0.448,-0.392,-0.656,0.009,-0.52,-0.012]},{"manager":"Tyler","games":13,"wins":4,"losses":8,"ties":1,"pointsFor":1181.0,"pointsAgainst":1458.0,"mean":90.85,"median":86.0,"stdDev":23.02,"percentiles":{"p10":68.6,"p25":77.0,"p75":103.0,"p90":110.4},"expectedWins":3.556,"luck":0.944,"averageZScore":-0.757,"weeklyZScores":[-1.137,-0.868,-1.384,-0.097,-1.119,-0.642,-0.99,-1.451,-1.801,-1.217,-1.505,0.212,2.161]},{"manager":"Peter","games":13,"wins":7,"losses":5,"ties":1,"pointsFor":1566.0,"pointsAgainst":1418.0,"mean":120.46,"median":120.0,"stdDev":16.12,"percentiles":{"p10":101.0,"p25":109.0,"p75":125.0,"p90":143.8},"expectedWins":8.167,"luck":-0.667,"averageZScore":0.359,"weeklyZScores":[0.509,0.391,0.998,0.579,0.188,-0.055,1.126,0.053,1.093,-0.484,1.479,-0.058,-1.159]},{"manager":"Joey","games":13,"wins":6,"losses":7,"ties":0,"pointsFor":1487.0,"pointsAgainst":1454.0,"mean":114.38,"median":122.0,"stdDev":22.34,"percentiles":{"p10":77.6,"p25":103.0,"p75":128.0,"p90":134.6},"expectedWins":7.444,"luck":-1.444,"averageZScore":0.163,"weeklyZScores":[-1.167,-0.347,0.933,1.11,0.351,0.401,0.333,-1.184,1.283,0.855,0.398,0.559,-1.4]},{"manager":"Ben","games":13,"wins":4,"losses":8,"ties":1,"pointsFor":1447.0,"pointsAgainst":1566.0,"mean":111.31,"median":103.0,"stdDev":29.73,"percentiles":{"p10":82.4,"p25":96.0,"p75":121.0,"p90":143.4},"expectedWins":6.0,"luck":-1.5,"averageZScore":-0.068,"weeklyZScores":[0.631,0.391,-0.29,-0.434,0.106,2.063,-1.292,-0.415,1.207,-1.865,-0.77,-0.328,0.109]},{"manager":"Ty","games":13,"wins":2,"losses":11,"ties":0,"pointsFor":1226.0,"pointsAgainst":1544.0,"mean":94.31,"median":100.0,"stdDev":18.75,"percentiles":{"p10":70.6,"p25":80.0,"p75":109.0,"p90":115.8},"expectedWins":3.611,"luck":-1.611,"averageZScore":-0.673,"weeklyZScores":[-1.198,-1.345,-0.483,0.29,-0.997,-1.326,-0.461,0.02,0.445,0.337,-1.678,-1.561,-0.797]},{"manager":"Lanny","games":13,"wins":6,"losses":7,"ties":0,"pointsFor":1633.0,"pointsAgainst":1520.0,"mean":125.62,"median":130.0,"stdDev":28.04,"percentiles":{"p10":86.6,"p25":101.0,"p75":145.0,"p90":150.2},"expectedWins":8.667,"luck":-2.667,"averageZScore":0.542,"weeklyZScores":[1.301,-1.085,1.255,-1.206,1.74,0.694,0.295,2.327,-1.001,1.243,1.047,-0.212,0.652]}]},"2010":{"weeks":[1,2,3,4,5,6,7,8,9,10,11,12,13],"managers":[{"manager":"Ben","games":13,"wins":8,"losses":5,"ties":0,"pointsFor":1383.0,"pointsAgainst":1314.0,"mean":106.38,"median":102.0,"stdDev":16.2,"percentiles":{"p10":91.0,"p25":100.0,"p75":108.0,"p90":121.8},"expectedWins":5.167,"luck":2.833,"averageZScore":-0.222,"weeklyZScores":[0.302,-0.372,-0.667,0.512,1.407,-0.302,-0.638,-0.726,0.508,-1.038,-0.78,-1.016,-0.068]},{"manager":"Matt","games":13,"wins":8,"losses":5,"ties":0,"pointsFor":1493.0,"pointsAgainst":1413.0,"mean":114.85,"median":120.0,"stdDev":15.85,"percentiles":{"p10":97.0,"p25":101.0,"p75":125.0,"p90":133.6},"expectedWins":7.444,"luck":0.556,"averageZScore":0.191,"weeklyZScores":[-0.577,0.243,1.039,-0.088,-0.026,-0.105,0.337,1.71,0.62,0.065,-0.26,-0.368,-0.106]},{"manager":"Vernon","games":13,"wins":7,"losses":6,"ties":0,"pointsFor":1355.0,"pointsAgainst":1425.0,"mean":104.23,"median":114.0,"stdDev":32.42,"percentiles":{"p10":68.8,"p25":77.0,"p75":128.0,"p90":140.8},"expectedWins":6.556,"luck":0.444,"averageZScore":-0.093,"weeklyZScores":[-2.143,-1.016,0.186,-1.078,1.016,0.486,-0.232,0.898,-0.811,0.366,1.02,1.308,-1.205]},{"manager":"John","games":13,"wins":8,"losses":5,"ties":0,"pointsFor":1554.0,"pointsAgainst":1387.0,"mean":119.54,"median":124.0,"stdDev":32.07,"percentiles":{"p10":81.6,"p25":95.0,"p75":143.0,"p90":150.6},"expectedWins":7.889,"luck":0.111,"averageZScore":0.424,"weeklyZScores":[1.027,1.151,1.591,-1.467,0.886,0.026,-0.476,-0.965,-0.39,1.118,-1.301,1.687,2.622]},{"manager":"Peter","games":13,"wins":9,"losses":4,"ties":0,"pointsFor":1613.0,"pointsAgainst":1285.0,"mean":124.08,"median":124.0,"stdDev":23.75,"percentiles":{"p10":106.4,"p25":117.0,"p75":130.0,"p90":136.4},"expectedWins":8.889,"luck":0.111,"averageZScore":0.538,"weeklyZScores":[0.302,0.419,-0.266,1.113,-2.111,1.998,0.541,1.662,2.191,-0.085,-0.14,0.876,0.5]},{"manager":"Ty","games":13,"wins":4,"losses":9,"ties":0,"pointsFor":1261.0,"pointsAgainst":1553.0,"mean":97.0,"median":94.0,"stdDev":21.34,"percentiles":{"p10":71.0,"p25":86.0,"p75":104.0,"p90":126.2},"expectedWins":3.944,"luck":0.056,"averageZScore":-0.566,"weeklyZScores":[-1.455,-0.577,-1.471,0.866,0.321,-1.814,-0.598,0.181,-1.035,0.717,-0.94,-1.179,-0.371]},{"manager":"Lanny","games":13,"wins":4,"losses":9,"ties":0,"pointsFor":1260.0,"pointsAgainst":1448.0,"mean":96.92,"median":91.0,"stdDev":23.23,"percentiles":{"p10":65.4,"p25":86.0,"p75":114.0,"p90":120.2},"expectedWins":4.333,"luck":-0.333,"averageZScore":-0.494,"weeklyZScores":[0.913,-1.484,1.29,-1.431,-1.242,-0.368,0.012,-0.774,-0.558,-0.436,-0.54,-1.124,-0.675]},{"manager":"Joey","games":13,"wins":8,"losses":5,"ties":0,"pointsFor":1601.0,"pointsAgainst":1466.0,"mean":123.15,"median":118.0,"stdDev":22.45,"percentiles":{"p10":103.6,"p25":112.0,"p75":132.0,"p90":148.4},"expectedWins":8.889,"luck":-0.889,"averageZScore":0.511,"weeklyZScores":[0.569,-0.284,0.035,1.184,-0.069,1.012,1.394,-0.583,0.901,-0.537,2.101,0.605,0.311]},{"manager":"Ted","games":13,"wins":4,"losses":9,"ties":0,"pointsFor":1350.0,"pointsAgainst":1512.0,"mean":103.85,"median":99.0,"stdDev":28.23,"percentiles":{"p10":80.6,"p25":85.0,"p75":111.0,"p90":123.6},"expectedWins":5.333,"luck":-1.333,"averageZScore":-0.377,"weeklyZScores":[0.531,2.146,-1.37,-0.477,0.104,0.158,-1.98,-0.917,-0.194,-1.891,-0.14,-0.692,-0.182]},{"manager":"Tyler","games":13,"wins":5,"losses":8,"ties":0,"pointsFor":1454.0,"pointsAgainst":1521.0,"mean":111.85,"median":110.0,"stdDev":27.89,"percentiles":{"p10":83.4,"p25":90.0,"p75":123.0,"p90":154.4},"expectedWins":6.556,"luck":-1.556,"averageZScore":0.086,"weeklyZScores":[0.531,-0.225,-0.366,0.866,-0.287,-1.091,1.638,-0.487,-1.232,1.72,0.98,-0.097,-0.826]}]},"2011":{"weeks":[1,2,3,4,5,6,7,8,9,10,11,12,13],"managers":[{"manager":"Tyler","games":13,"wins":8,"losses":5,"ties":0,"pointsFor":1498.0,"pointsAgainst":1478.0,"mean":115.23,"median":112.0,"stdDev":27.84,"percentiles":{"p10":84.2,"p25":105.0,"p75":138.0,"p90":148.0},"expectedWins":6.056,"luck":1.944,"averageZScore":0.025,"weeklyZScores":[1.784,-1.05,-0.48,0.458,-0.485,-0.797,-1.278,0.473,-0.073,-1.534,0.437,1.782,1.094]},{"manager":"Ben","games":13,"wins":8,"losses":4,"ties":1,"pointsFor":1518.0,"pointsAgainst":1440.0,"mean":116.77,"median":115.0,"stdDev":22.33,"percentiles":{"p10":99.0,"p25":106.0,"p75":119.0,"p90":152.6},"expectedWins":6.611,"luck":1.889,"averageZScore":0.045,"weeklyZScores":[-0.75,1.16,-0.055,1.111,0.956,0.192,-0.783,0.32,-0.672,-0.647,0.498,-0.146,-0.601]},{"manager":"Vernon","games":13,"wins":9,"losses":4,"ties":0,"pointsFor":1545.0,"pointsAgainst":1378.0,"mean":118.85,"median":122.0,"stdDev":20.17,"percentiles":{"p10":91.4,"p25":100.0,"p75":135.0,"p90":138.8},"expectedWins":7.444,"luck":1.556,"averageZScore":0.162,"weeklyZScores":[-1.966,0.884,1.282,-0.227,1.1,-0.612,-0.206,0.931,0.259,1.232,-0.959,0.263,0.125]},{"manager":"Lanny","games":13,"wins":10,"losses":3,"ties":0,"pointsFor":1677.0,"pointsAgainst":1551.0,"mean":129.0,"median":129.0,"stdDev":14.62,"percentiles":{"p10":113.0,"p25":121.0,"p75":138.0,"p90":146.8},"expectedWins":9.111,"luck":0.889,"averageZScore":0.57,"weeklyZScores":[0.061,-0.912,-0.055,0.769,0.86,-0.674,1.141,0.435,0.526,1.44,1.347,1.139,1.336]},{"manager":"John","games":13,"wins":4,"losses":9,"ties":0,"pointsFor":1313.0,"pointsAgainst":1461.0,"mean":101.0,"median":97.0,"stdDev":14.94,"percentiles":{"p10":84.8,"p25":89.0,"p75":116.0,"p90":120.2},"expectedWins":3.444,"luck":0.556,"averageZScore":-0.661,"weeklyZScores":[-0.345,-1.188,0.675,-0.912,-1.254,-1.291,-0.096,-1.129,-1.936,0.553,0.558,-0.906,-1.328]},{"manager":"Ted","games":13,"wins":4,"losses":9,"ties":0,"pointsFor":1308.0,"pointsAgainst":1403.0,"mean":100.62,"median":98.0,"stdDev":20.18,"percentiles":{"p10":80.2,"p25":85.0,"p75":114.0,"p90":120.6},"expectedWins":3.833,"luck":0.167,"averageZScore":-0.679,"weeklyZScores":[-0.091,0.838,-0.176,-1.597,-1.206,-0.55,-0.069,-0.976,-0.672,-1.534,-1.626,-0.205,-0.964]},{"manager":"Joey","games":13,"wins":9,"losses":3,"ties":1,"pointsFor":1726.0,"pointsAgainst":1458.0,"mean":132.77,"median":129.0,"stdDev":21.99,"percentiles":{"p10":103.4,"p25":115.0,"p75":151.0,"p90":163.0},"expectedWins":9.722,"luck":-0.222,"averageZScore":0.864,"weeklyZScores":[1.378,1.621,1.465,-0.663,-0.293,2.293,0.536,2.113,1.058,-0.491,0.498,0.497,1.215]},{"manager":"Peter","games":13,"wins":6,"losses":7,"ties":0,"pointsFor":1499.0,"pointsAgainst":1576.0,"mean":115.31,"median":123.0,"stdDev":17.41,"percentiles":{"p10":89.8,"p25":100.0,"p75":130.0,"p90":131.8},"expectedWins":6.944,"luck":-0.944,"averageZScore":-0.028,"weeklyZScores":[0.314,0.147,-2.06,0.177,-1.254,-0.117,0.866,-0.404,1.191,0.71,0.983,0.205,-1.126]},{"manager":"Ty","games":13,"wins":2,"losses":11,"ties":0,"pointsFor":1359.0,"pointsAgainst":1634.0,"mean":104.54,"median":101.0,"stdDev":27.28,"percentiles":{"p10":80.8,"p25":94.0,"p75":119.0,"p90":139.4},"expectedWins":4.556,"luck":-2.556,"averageZScore":-0.464,"weeklyZScores":[-0.497,-0.589,-1.027,-0.912,1.485,0.933,-1.691,-0.557,-0.938,0.449,-1.626,-1.958,0.892]},{"manager":"Matt","games":13,"wins":4,"losses":9,"ties":0,"pointsFor":1573.0,"pointsAgainst":1637.0,"mean":121.0,"median":117.0,"stdDev":24.69,"percentiles":{"p10":105.0,"p25":106.0,"p75":126.0,"p90":152.8},"expectedWins":7.278,"luck":-3.278,"averageZScore":0.167,"weeklyZScores":[0.111,-0.912,0.432,1.796,0.091,0.624,1.581,-1.205,1.258,-0.177,-0.109,-0.672,-0.642]}]},"2012":{"weeks":[1,2,3,4,5,6,7,8,9,10,11,12,13],"managers":[{"manager":"Ben","games":13,"wins":7,"losses":6,"ties":0,"pointsFor":1352.0,"pointsAgainst":1408.0,"mean":104.0,"median":105.0,"stdDev":26.41,"percentiles":{"p10":70.8,"p25":86.0,"p75":115.0,"p90":135.2},"expectedWins":4.444,"luck":2.556,"averageZScore":-0.551,"weeklyZScores":[-1.65,0.809,-1.461,0.979,-1.19,-1.516,0.308,-1.513,0.321,-0.218,-1.209,-0.313,-0.511]},{"manager":"Matt","games":13,"wins":7,"losses":6,"ties":0,"pointsFor":1426.0,"pointsAgainst":1487.0,"mean":109.69,"median":109.0,"stdDev":25.05,"percentiles":{"p10":71.6,"p25":96.0,"p75":126.0,"p90":140.0},"expectedWins":5.167,"luck":1.833,"averageZScore":-0.247,"weeklyZScores":[0.859,-0.058,-0.827,0.266,0.828,-1.415,-1.706,0.193,0.178,-1.227,0.834,-0.587,-0.552]},{"manager":"Vernon","games":13,"wins":8,"losses":5,"ties":0,"pointsFor":1553.0,"pointsAgainst":1419.0,"mean":119.46,"median":112.0,"stdDev":24.47,"percentiles":{"p10":94.2,"p25":103.0,"p75":128.0,"p90":158.8},"expectedWins":6.833,"luck":1.167,"averageZScore":0.084,"weeklyZScores":[0.219,1.628,-0.313,1.058,1.669,-0.772,0.782,0.373,-1.391,-0.005,-0.244,-0.861,-1.047]},{"manager":"Ty","games":13,"wins":7,"losses":6,"ties":0,"pointsFor":1550.0,"pointsAgainst":1463.0,"mean":119.23,"median":120.0,"stdDev":21.21,"percentiles":{"p10":93.6,"p25":103.0,"p75":125.0,"p90":151.6},"expectedWins":6.278,"luck":0.722,"averageZScore":0.102,"weeklyZScores":[0.005,-0.588,1.983,-0.527,1.332,-0.636,0.782,0.822,1.034,-0.377,-0.868,-0.916,-0.717]},{"manager":"Lanny","games":13,"wins":9,"losses":4,"ties":0,"pointsFor":1656.0,"pointsAgainst":1381.0,"mean":127.38,"median":127.0,"stdDev":17.81,"percentiles":{"p10":101.4,"p25":112.0,"p75":143.0,"p90":146.8},"expectedWins":8.556,"luck":0.444,"averageZScore":0.506,"weeklyZScores":[-1.383,1.243,-0.154,0.543,-0.979,0.548,1.69,0.732,1.319,-0.377,2.026,0.401,0.973]},{"manager":"John","games":13,"wins":6,"losses":7,"ties":0,"pointsFor":1381.0,"pointsAgainst":1633.0,"mean":106.23,"median":107.0,"stdDev":23.8,"percentiles":{"p10":74.2,"p25":91.0,"p75":122.0,"p90":138.8},"expectedWins":5.889,"luck":0.111,"averageZScore":-0.436,"weeklyZScores":[0.539,-1.406,-0.154,-2.39,-0.769,1.158,-1.035,-1.693,1.177,0.154,-0.585,-0.477,-0.181]},{"manager":"Ted","games":13,"wins":8,"losses":5,"ties":0,"pointsFor":1650.0,"pointsAgainst":1500.0,"mean":126.92,"median":124.0,"stdDev":23.93,"percentiles":{"p10":102.4,"p25":106.0,"p75":147.0,"p90":163.8},"expectedWins":8.0,"luck":0.0,"averageZScore":0.516,"weeklyZScores":[1.874,0.376,0.004,-0.25,-0.937,1.293,-0.126,0.103,-1.105,2.596,0.948,2.485,-0.552]},{"manager":"Peter","games":13,"wins":5,"losses":8,"ties":0,"pointsFor":1516.0,"pointsAgainst":1623.0,"mean":116.62,"median":119.0,"stdDev":17.73,"percentiles":{"p10":97.4,"p25":111.0,"p75":125.0,"p90":135.8},"expectedWins":6.667,"luck":-1.667,"averageZScore":-0.002,"weeklyZScores":[-0.048,-1.165,1.35,-0.884,0.071,-0.196,-1.193,1.45,-0.82,-0.324,0.664,0.839,0.231]},{"manager":"Tyler","games":13,"wins":3,"losses":10,"ties":0,"pointsFor":1422.0,"pointsAgainst":1619.0,"mean":109.38,"median":107.0,"stdDev":16.99,"percentiles":{"p10":87.8,"p25":102.0,"p75":121.0,"p90":125.4},"expectedWins":4.833,"luck":-1.833,"averageZScore":-0.412,"weeklyZScores":[-0.795,0.279,-0.986,0.583,-0.685,0.481,0.624,-1.019,-1.248,-0.908,-0.698,-0.807,-0.181]},{"manager":"Joey","games":13,"wins":5,"losses":8,"ties":0,"pointsFor":1657.0,"pointsAgainst":1630.0,"mean":127.46,"median":131.0,"stdDev":22.26,"percentiles":{"p10":98.0,"p25":116.0,"p75":139.0,"p90":147.2},"expectedWins":8.333,"luck":-3.333,"averageZScore":0.439,"weeklyZScores":[0.379,-1.117,0.558,0.622,0.66,1.056,-0.126,0.552,0.535,0.685,-0.868,0.236,2.54]}]},"2013":{"weeks":[1,2,3,4,5,6,7,8,9,10,11,12,13],"managers":[{"manager":"Ben","games":13,"wins":10,"losses":3,"ties":0,"pointsFor":1649.0,"pointsAgainst":1423.0,"mean":126.85,"median":126.0,"stdDev":23.07,"percentiles":{"p10":98.8,"p25":114.0,"p75":142.0,"p90":155.6},"expectedWins":7.778,"luck":2.222,"averageZScore":0.384,"weeklyZScores":[0.867,-0.931,0.939,1.106,0.176,-0.416,0.473,0.733,1.899,-0.136,0.064,-0.534,0.75]},{"manager":"Vernon","games":13,"wins":9,"losses":4,"ties":0,"pointsFor":1555.0,"pointsAgainst":1497.0,"mean":119.62,"median":125.0,"stdDev":17.0,"percentiles":{"p10":99.4,"p25":108.0,"p75":135.0,"p90":138.0},"expectedWins":7.611,"luck":1.389,"averageZScore":0.133,"weeklyZScores":[-0.95,0.6,1.401,0.458,-1.791,-0.26,0.043,0.835,0.008,1.057,0.61,-0.339,0.059]},{"manager":"Lanny","games":13,"wins":6,"losses":7,"ties":0,"pointsFor":1412.0,"pointsAgainst":1520.0,"mean":108.62,"median":101.0,"stdDev":30.01,"percentiles":{"p10":76.0,"p25":85.0,"p75":131.0,"p90":146.8},"expectedWins":5.056,"luck":0.944,"averageZScore":-0.34,"weeklyZScores":[-0.119,1.09,-2.038,-1.352,0.873,-1.353,-0.387,-1.356,-0.11,-0.08,-1.423,-0.144,1.983]},{"manager":"Peter","games":13,"wins":6,"losses":6,"ties":1,"pointsFor":1500.0,"pointsAgainst":1533.0,"mean":115.38,"median":117.0,"stdDev":19.24,"percentiles":{"p10":87.4,"p25":107.0,"p75":132.0,"p90":137.6},"expectedWins":6.056,"luck":0.444,"averageZScore":-0.118,"weeklyZScores":[-0.846,-1.971,-0.036,-0.225,0.053,1.665,-1.369,0.767,-1.844,0.489,0.907,0.324,0.552]},{"manager":"Matt","games":13,"wins":5,"losses":8,"ties":0,"pointsFor":1411.0,"pointsAgainst":1490.0,"mean":108.54,"median":102.0,"stdDev":21.11,"percentiles":{"p10":88.4,"p25":96.0,"p75":115.0,"p90":140.0},"expectedWins":4.944,"luck":0.056,"averageZScore":-0.387,"weeklyZScores":[-1.937,1.335,1.042,-0.328,0.75,-0.833,0.289,-0.397,-0.898,-1.614,-1.323,-0.339,-0.779]},{"manager":"Ty","games":13,"wins":4,"losses":9,"ties":0,"pointsFor":1311.0,"pointsAgainst":1437.0,"mean":100.85,"median":100.0,"stdDev":23.79,"percentiles":{"p10":65.8,"p25":87.0,"p75":118.0,"p90":134.4},"expectedWins":3.944,"luck":0.056,"averageZScore":-0.655,"weeklyZScores":[0.14,-0.073,-0.395,-1.352,-0.275,-0.729,-0.755,-1.801,-0.741,0.091,1.155,-1.822,-1.963]},{"manager":"Ted","games":13,"wins":5,"losses":7,"ties":1,"pointsFor":1509.0,"pointsAgainst":1581.0,"mean":116.08,"median":118.0,"stdDev":27.22,"percentiles":{"p10":86.8,"p25":92.0,"p75":137.0,"p90":142.8},"expectedWins":6.056,"luck":-0.556,"averageZScore":-0.012,"weeklyZScores":[1.75,-0.869,-0.908,0.423,-0.848,1.665,1.148,-0.739,-0.268,-2.069,1.452,-0.808,-0.089]},{"manager":"Joey","games":13,"wins":7,"losses":6,"ties":0,"pointsFor":1646.0,"pointsAgainst":1494.0,"mean":126.62,"median":136.0,"stdDev":19.59,"percentiles":{"p10":96.2,"p25":114.0,"p75":142.0,"p90":146.8},"expectedWins":8.222,"luck":-1.222,"averageZScore":0.413,"weeklyZScores":[0.14,0.784,-0.344,0.799,0.504,-0.781,2.131,0.801,0.363,0.773,-1.224,1.611,-0.187]},{"manager":"John","games":13,"wins":5,"losses":8,"ties":0,"pointsFor":1536.0,"pointsAgainst":1593.0,"mean":118.15,"median":115.0,"stdDev":20.01,"percentiles":{"p10":94.4,"p25":99.0,"p75":135.0,"p90":149.2},"expectedWins":6.611,"luck":-1.611,"averageZScore":0.039,"weeklyZScores":[0.088,0.539,-0.447,-1.147,-1.176,0.468,-0.817,1.314,1.072,0.83,0.064,0.441,-0.73]},{"manager":"Tyler","games":13,"wins":7,"losses":6,"ties":0,"pointsFor":1699.0,"pointsAgainst":1660.0,"mean":130.69,"median":123.0,"stdDev":22.57,"percentiles":{"p10":108.2,"p25":112.0,"p75":148.0,"p90":163.6},"expectedWins":8.722,"luck":-1.722,"averageZScore":0.544,"weeklyZScores":[0.867,-0.502,0.785,1.618,1.733,0.572,-0.755,-0.157,0.52,0.659,-0.283,1.611,0.404]}]},"2014":{"weeks":[1,2,3,4,5,6,7,8,9,10,11,12,13],"managers":[{"manager":"Tyler","games":13,"wins":10,"losses":3,"ties":0,"pointsFor":1528.0,"pointsAgainst":1442.0,"mean":117.54,"median":117.0,"stdDev":24.72,"percentiles":{"p10":88.2,"p25":99.0,"p75":139.0,"p90":151.6},"expectedWins":6.611,"luck":3.389,"averageZScore":-0.039,"weeklyZScores":[1.241,-0.929,0.401,0.08,-2.16,-0.082,-0.639,-1.083,0.847,0.969,-0.706,-0.109,1.657]},{"manager":"Joey","games":13,"wins":9,"losses":4,"ties":0,"pointsFor":1584.0,"pointsAgainst":1430.0,"mean":121.85,"median":117.0,"stdDev":23.83,"percentiles":{"p10":93.4,"p25":106.0,"p75":134.0,"p90":143.0},"expectedWins":6.944,"luck":2.056,"averageZScore":0.077,"weeklyZScores":[-0.395,0.268,-0.633,-0.283,-0.843,-0.46,-1.562,-0.044,0.374,0.575,2.211,1.413,0.382]},{"manager":"John","games":13,"wins":6,"losses":7,"ties":0,"pointsFor":1475.0,"pointsAgainst":1517.0,"mean":113.46,"median":112.0,"stdDev":15.73,"percentiles":{"p10":90.2,"p25":110.0,"p75":122.0,"p90":135.4},"expectedWins":5.278,"luck":0.722,"averageZScore":-0.197,"weeklyZScores":[-0.907,1.561,-0.72,-0.392,-0.211,-0.523,1.074,-0.479,-1.519,0.688,0.255,-0.38,-1.008]},{"manager":"Ted","games":13,"wins":6,"losses":6,"ties":1,"pointsFor":1499.0,"pointsAgainst":1510.0,"mean":115.31,"median":116.0,"stdDev":16.69,"percentiles":{"p10":94.4,"p25":105.0,"p75":125.0,"p90":133.2},"expectedWins":6.167,"luck":0.333,"averageZScore":-0.238,"weeklyZScores":[-0.804,0.077,0.53,1.095,0.527,-0.523,-0.244,0.091,-1.33,-1.623,0.52,-0.109,-1.298]},{"manager":"Matt","games":13,"wins":7,"losses":6,"ties":0,"pointsFor":1557.0,"pointsAgainst":1599.0,"mean":119.77,"median":121.0,"stdDev":18.96,"percentiles":{"p10":92.6,"p25":109.0,"p75":130.0,"p90":145.0},"expectedWins":6.722,"luck":0.278,"averageZScore":0.141,"weeklyZScores":[-0.498,-0.785,-0.763,-0.501,0.263,1.429,0.811,-0.044,1.557,-0.158,-0.143,0.109,0.556]},{"manager":"Peter","games":13,"wins":7,"losses":6,"ties":0,"pointsFor":1560.0,"pointsAgainst":1488.0,"mean":120.0,"median":121.0,"stdDev":24.51,"percentiles":{"p10":92.6,"p25":106.0,"p75":141.0,"p90":145.0},"expectedWins":7.333,"luck":-0.333,"averageZScore":0.082,"weeklyZScores":[0.968,-0.019,-0.676,-2.169,1.106,-0.712,1.008,0.325,0.942,-1.454,0.222,1.902,-0.371]},{"manager":"Lanny","games":13,"wins":9,"losses":3,"ties":1,"pointsFor":1789.0,"pointsAgainst":1491.0,"mean":137.62,"median":139.0,"stdDev":29.81,"percentiles":{"p10":107.4,"p25":119.0,"p75":151.0,"p90":161.8},"expectedWins":10.167,"luck":-0.667,"averageZScore":0.926,"weeklyZScores":[-1.009,1.704,0.53,1.422,1.264,2.311,1.404,2.705,-0.383,1.477,-0.275,0.163,0.73]},{"manager":"Ty","games":13,"wins":2,"losses":11,"ties":0,"pointsFor":1289.0,"pointsAgainst":1607.0,"mean":99.15,"median":103.0,"stdDev":19.42,"percentiles":{"p10":79.4,"p25":86.0,"p75":114.0,"p90":122.2},"expectedWins":2.889,"luck":-0.889,"averageZScore":-0.834,"weeklyZScores":[-1.077,-1.216,-1.194,0.044,-0.948,0.044,-0.639,-1.016,-0.667,-0.552,-2.032,-0.815,-0.776]},{"manager":"Ben","games":13,"wins":4,"losses":9,"ties":0,"pointsFor":1537.0,"pointsAgainst":1725.0,"mean":118.23,"median":115.0,"stdDev":21.48,"percentiles":{"p10":95.0,"p25":108.0,"p75":123.0,"p90":149.6},"expectedWins":6.056,"luck":-2.056,"averageZScore":-0.175,"weeklyZScores":[1.684,0.508,0.099,1.168,0.421,-0.397,-1.364,-0.111,-0.667,-0.665,0.023,-1.847,-1.124]},{"manager":"Vernon","games":13,"wins":4,"losses":9,"ties":0,"pointsFor":1616.0,"pointsAgainst":1625.0,"mean":124.31,"median":121.0,"stdDev":20.5,"percentiles":{"p10":107.6,"p25":112.0,"p75":139.0,"p90":147.4},"expectedWins":6.833,"luck":-2.833,"averageZScore":0.256,"weeklyZScores":[0.798,-1.168,2.426,-0.464,0.579,-1.089,0.152,-0.345,0.847,0.744,-0.076,-0.326,1.251]}]},"2015":{"weeks":[1,2,3,4,5,6,7,8,9,10,11,12,13],"managers":[{"manager":"Tyler","games":13,"wins":9,"losses":4,"ties":0,"pointsFor":1578.0,"pointsAgainst":1430.0,"mean":121.38,"median":118.0,"stdDev":25.96,"percentiles":{"p10":86.2,"p25":102.0,"p75":137.0,"p90":153.8},"expectedWins":6.667,"luck":2.333,"averageZScore":0.148,"weeklyZScores":[-0.784,1.068,0.537,-1.226,0.716,-0.592,-0.098,0.533,1.387,2.384,-1.21,-0.549,-0.237]},{"manager":"Peter","games":13,"wins":9,"losses":4,"ties":0,"pointsFor":1551.0,"pointsAgainst":1442.0,"mean":119.31,"median":114.0,"stdDev":23.35,"percentiles":{"p10":93.0,"p25":109.0,"p75":137.0,"p90":139.8},"expectedWins":7.611,"luck":1.389,"averageZScore":0.229,"weeklyZScores":[0.879,-0.18,-0.588,-0.439,-1.436,-1.517,0.924,-0.224,1.722,0.157,1.574,1.498,0.606]},{"manager":"Joey","games":13,"wins":6,"losses":7,"ties":0,"pointsFor":1478.0,"pointsAgainst":1492.0,"mean":113.69,"median":111.0,"stdDev":16.61,"percentiles":{"p10":99.4,"p25":105.0,"p75":120.0,"p90":126.8},"expectedWins":5.833,"luck":0.167,"averageZScore":-0.099,"weeklyZScores":[-0.214,0.097,-0.447,-0.214,1.716,0.148,-0.343,-0.618,-0.708,0.114,-0.855,-0.084,0.124]},{"manager":"Matt","games":13,"wins":8,"losses":5,"ties":0,"pointsFor":1662.0,"pointsAgainst":1487.0,"mean":127.85,"median":131.0,"stdDev":23.89,"percentiles":{"p10":98.2,"p25":101.0,"p75":142.0,"p90":159.0},"expectedWins":7.889,"luck":0.111,"averageZScore":0.301,"weeklyZScores":[0.974,-1.359,1.156,-0.326,0.515,1.227,1.373,0.412,0.842,-0.323,-0.046,-0.735,0.205]},{"manager":"Ty","games":13,"wins":6,"losses":7,"ties":0,"pointsFor":1416.0,"pointsAgainst":1573.0,"mean":108.92,"median":109.0,"stdDev":20.94,"percentiles":{"p10":78.8,"p25":98.0,"p75":121.0,"p90":137.4},"expectedWins":6.0,"luck":0.0,"averageZScore":-0.139,"weeklyZScores":[0.071,0.721,-1.347,0.911,-1.136,-0.037,1.046,-1.284,-1.84,0.026,0.157,1.777,-0.879]},{"manager":"John","games":13,"wins":6,"losses":7,"ties":0,"pointsFor":1552.0,"pointsAgainst":1562.0,"mean":119.38,"median":116.0,"stdDev":26.77,"percentiles":{"p10":101.2,"p25":110.0,"p75":122.0,"p90":128.4},"expectedWins":6.111,"luck":-0.111,"averageZScore":0.008,"weeklyZScores":[0.642,0.236,-0.222,1.192,0.015,-0.345,-0.057,2.441,-0.373,-1.415,0.157,-1.852,-0.317]},{"manager":"Ted","games":13,"wins":9,"losses":4,"ties":0,"pointsFor":1698.0,"pointsAgainst":1574.0,"mean":130.62,"median":128.0,"stdDev":22.51,"percentiles":{"p10":114.6,"p25":121.0,"p75":131.0,"p90":159.0},"expectedWins":9.222,"luck":-0.222,"averageZScore":0.512,"weeklyZScores":[-1.164,0.374,1.606,0.911,0.415,1.32,-0.18,0.594,-0.038,0.856,1.574,0.102,0.285]},{"manager":"Ben","games":13,"wins":8,"losses":5,"ties":0,"pointsFor":1704.0,"pointsAgainst":1477.0,"mean":131.08,"median":132.0,"stdDev":25.59,"percentiles":{"p10":98.6,"p25":111.0,"p75":152.0,"p90":167.2},"expectedWins":8.556,"luck":-0.556,"averageZScore":0.648,"weeklyZScores":[1.735,1.206,1.099,1.529,0.615,1.197,-0.507,-0.678,-0.457,-0.498,0.714,0.382,2.09]},{"manager":"Vernon","games":13,"wins":2,"losses":11,"ties":0,"pointsFor":1258.0,"pointsAgainst":1573.0,"mean":96.77,"median":99.0,"stdDev":19.6,"percentiles":{"p10":72.8,"p25":84.0,"p75":117.0,"p90":117.8},"expectedWins":3.444,"luck":-1.444,"averageZScore":-0.903,"weeklyZScores":[-0.547,-2.191,-0.363,-1.169,-1.536,-1.579,-2.386,-0.618,-0.163,-0.236,-0.754,-0.363,0.164]},{"manager":"Lanny","games":13,"wins":2,"losses":11,"ties":0,"pointsFor":1298.0,"pointsAgainst":1585.0,"mean":99.85,"median":101.0,"stdDev":20.27,"percentiles":{"p10":74.2,"p25":82.0,"p75":119.0,"p90":123.0},"expectedWins":3.667,"luck":-1.667,"averageZScore":-0.705,"weeklyZScores":[-1.592,0.028,-1.431,-1.169,0.115,0.179,0.229,-0.557,-0.373,-1.065,-1.311,-0.177,-2.042]}]},"2016":{"weeks":[1,2,3,4,5,6,7,8,9,10,11,12,13],"managers":[{"manager":"Matt","games":13,"wins":8,"losses":5,"ties":0,"pointsFor":1532.0,"pointsAgainst":1378.0,"mean":117.85,"median":113.0,"stdDev":22.35,"percentiles":{"p10":92.2,"p25":103.0,"p75":121.0,"p90":154.4},"expectedWins":6.389,"luck":1.611,"averageZScore":0.021,"weeklyZScores":[-0.496,-0.525,-1.049,-0.869,0.953,1.46,0.272,-0.699,-0.235,0.037,2.12,-0.487,-0.208]},{"manager":"John","games":13,"wins":11,"losses":2,"ties":0,"pointsFor":1780.0,"pointsAgainst":1522.0,"mean":136.92,"median":143.0,"stdDev":23.2,"percentiles":{"p10":102.6,"p25":115.0,"p75":151.0,"p90":161.2},"expectedWins":9.722,"luck":1.278,"averageZScore":0.829,"weeklyZScores":[1.674,0.024,1.453,-0.403,1.261,1.326,1.304,-0.854,0.646,1.146,-0.017,1.24,1.978]},{"manager":"Lanny","games":13,"wins":9,"losses":4,"ties":0,"pointsFor":1629.0,"pointsAgainst":1634.0,"mean":125.31,"median":114.0,"stdDev":28.62,"percentiles":{"p10":99.6,"p25":107.0,"p75":134.0,"p90":159.4},"expectedWins":7.778,"luck":1.222,"averageZScore":0.295,"weeklyZScores":[-1.16,-0.721,2.212,-0.191,-0.326,-0.382,-0.197,1.255,-0.176,0.838,0.855,1.815,0.011]},{"manager":"Ted","games":13,"wins":8,"losses":5,"ties":0,"pointsFor":1571.0,"pointsAgainst":1582.0,"mean":120.85,"median":120.0,"stdDev":20.1,"percentiles":{"p10":94.4,"p25":105.0,"p75":141.0,"p90":144.0},"expectedWins":7.056,"luck":0.944,"averageZScore":0.183,"weeklyZScores":[-1.338,1.16,0.301,1.293,-0.591,-0.75,1.773,0.278,1.469,-0.025,-0.672,-0.797,0.284]},{"manager":"Peter","games":13,"wins":7,"losses":6,"ties":0,"pointsFor":1509.0,"pointsAgainst":1433.0,"mean":116.08,"median":113.0,"stdDev":24.85,"percentiles":{"p10":81.0,"p25":101.0,"p75":133.0,"p90":149.2},"expectedWins":6.333,"luck":0.667,"averageZScore":-0.084,"weeklyZScores":[1.674,-1.466,-0.29,-1.42,0.688,1.159,-0.853,-0.185,-0.529,-1.195,0.899,-0.62,1.049]},{"manager":"Vernon","games":13,"wins":6,"losses":7,"ties":0,"pointsFor":1449.0,"pointsAgainst":1509.0,"mean":111.46,"median":107.0,"stdDev":15.87,"percentiles":{"p10":97.2,"p25":102.0,"p75":119.0,"p90":133.4},"expectedWins":5.333,"luck":0.667,"averageZScore":-0.227,"weeklyZScores":[-0.452,0.807,-0.711,-0.36,1.085,-1.186,-0.009,0.123,-0.705,0.406,-0.236,-0.797,-0.918]},{"manager":"Ben","games":13,"wins":4,"losses":9,"ties":0,"pointsFor":1424.0,"pointsAgainst":1587.0,"mean":109.54,"median":104.0,"stdDev":22.93,"percentiles":{"p10":84.4,"p25":92.0,"p75":125.0,"p90":131.8},"expectedWins":5.056,"luck":-1.056,"averageZScore":-0.385,"weeklyZScores":[0.345,1.827,-0.936,-0.784,-0.988,0.054,0.46,-0.648,-0.235,-1.318,-1.457,0.354,-1.683]},{"manager":"Ty","games":13,"wins":5,"losses":8,"ties":0,"pointsFor":1484.0,"pointsAgainst":1433.0,"mean":114.15,"median":113.0,"stdDev":25.84,"percentiles":{"p10":81.4,"p25":85.0,"p75":140.0,"p90":148.0},"expectedWins":6.167,"luck":-1.167,"averageZScore":-0.076,"weeklyZScores":[-0.142,-1.231,-0.29,1.76,0.159,-1.252,-1.791,1.409,-0.646,1.207,-1.064,1.151,-0.262]},{"manager":"Tyler","games":13,"wins":4,"losses":9,"ties":0,"pointsFor":1466.0,"pointsAgainst":1631.0,"mean":112.77,"median":108.0,"stdDev":20.32,"percentiles":{"p10":95.6,"p25":105.0,"p75":130.0,"p90":137.8},"expectedWins":6.0,"luck":-2.0,"averageZScore":-0.15,"weeklyZScores":[-0.629,-0.251,-0.43,-0.233,-2.091,0.489,-0.947,1.152,1.938,0.591,0.026,-0.708,-0.863]},{"manager":"Joey","games":13,"wins":3,"losses":10,"ties":0,"pointsFor":1422.0,"pointsAgainst":1557.0,"mean":109.38,"median":114.0,"stdDev":17.69,"percentiles":{"p10":91.4,"p25":93.0,"p75":124.0,"p90":133.8},"expectedWins":5.167,"luck":-2.167,"averageZScore":-0.405,"weeklyZScores":[0.523,0.376,-0.261,1.208,-0.15,-0.918,-0.009,-1.83,-1.527,-1.688,-0.454,-1.151,0.612]}]},"2017":{"weeks":[1,2,3,4,5,6,7,8,9,10,11,12,13],"managers":[{"manager":"Tyler","games":13,"wins":9,"losses":4,"ties":0,"pointsFor":1510.0,"pointsAgainst":1345.0,"mean":116.15,"median":112.0,"stdDev":17.33,"percentiles":{"p10":95.6,"p25":99.0,"p75":132.0,"p90":139.2},"expectedWins":7.333,"luck":1.667,"averageZScore":0.249,"weeklyZScores":[1.958,0.054,0.764,1.044,-0.211,-0.697,0.815,-0.608,0.246,-0.479,0.547,0.412,-0.608]},{"manager":"Ted","games":13,"wins":5,"losses":8,"ties":0,"pointsFor":1274.0,"pointsAgainst":1392.0,"mean":98.0,"median":104.0,"stdDev":22.67,"percentiles":{"p10":66.2,"p25":82.0,"p75":110.0,"p90":124.0},"expectedWins":3.833,"luck":1.167,"averageZScore":-0.514,"weeklyZScores":[-0.8,-0.006,0.726,-0.057,-0.654,-1.965,-0.448,-1.505,-1.122,0.254,0.285,-0.344,-1.052]},{"manager":"John","games":13,"wins":10,"losses":3,"ties":0,"pointsFor":1651.0,"pointsAgainst":1490.0,"mean":127.0,"median":125.0,"stdDev":24.37,"percentiles":{"p10":101.4,"p25":113.0,"p75":144.0,"p90":156.8},"expectedWins":9.444,"luck":0.556,"averageZScore":0.737,"weeklyZScores":[-0.406,1.132,-0.535,2.384,-0.137,0.174,0.93,2.116,0.292,1.462,1.073,-0.079,1.171]},{"manager":"Lanny","games":13,"wins":5,"losses":8,"ties":0,"pointsFor":1238.0,"pointsAgainst":1477.0,"mean":95.23,"median":91.0,"stdDev":25.19,"percentiles":{"p10":64.4,"p25":70.0,"p75":121.0,"p90":125.0},"expectedWins":4.556,"luck":0.444,"averageZScore":-0.699,"weeklyZScores":[-1.194,-1.563,-0.764,0.134,0.787,0.333,-2.398,-0.641,1.295,-1.168,-2.167,-2.119,0.38]},{"manager":"Jason","games":13,"wins":4,"losses":9,"ties":0,"pointsFor":1267.0,"pointsAgainst":1461.0,"mean":97.46,"median":92.0,"stdDev":24.51,"percentiles":{"p10":67.2,"p25":87.0,"p75":122.0,"p90":128.6},"expectedWins":3.889,"luck":0.111,"averageZScore":-0.582,"weeklyZScores":[-1.352,-0.665,-1.261,-0.871,0.677,-0.816,0.872,0.621,-1.942,-1.298,0.985,-1.024,-1.497]},{"manager":"Matt","games":13,"wins":7,"losses":5,"ties":1,"pointsFor":1502.0,"pointsAgainst":1493.0,"mean":115.54,"median":115.0,"stdDev":21.59,"percentiles":{"p10":87.0,"p25":97.0,"p75":138.0,"p90":143.6},"expectedWins":7.444,"luck":0.056,"averageZScore":0.138,"weeklyZScores":[-0.209,-1.144,-0.688,-0.632,1.416,0.452,0.7,1.153,0.383,1.203,-1.423,0.941,-0.361]},{"manager":"Peter","games":13,"wins":7,"losses":6,"ties":0,"pointsFor":1478.0,"pointsAgainst":1434.0,"mean":113.69,"median":112.0,"stdDev":27.32,"percentiles":{"p10":82.4,"p25":99.0,"p75":127.0,"p90":151.0},"expectedWins":7.222,"luck":-0.222,"averageZScore":0.142,"weeklyZScores":[0.303,0.353,1.185,-1.254,-1.431,0.293,0.356,-0.309,0.93,-1.212,-0.416,1.583,1.467]},{"manager":"Ben","games":13,"wins":7,"losses":6,"ties":0,"pointsFor":1532.0,"pointsAgainst":1444.0,"mean":117.85,"median":119.0,"stdDev":22.25,"percentiles":{"p10":88.4,"p25":104.0,"p75":125.0,"p90":139.0},"expectedWins":7.778,"luck":-0.778,"averageZScore":0.281,"weeklyZScores":[-0.169,1.132,1.911,0.182,1.009,0.253,-1.021,0.223,-0.985,-0.263,0.022,0.185,1.171]},{"manager":"Vernon","games":13,"wins":6,"losses":6,"ties":1,"pointsFor":1544.0,"pointsAgainst":1469.0,"mean":118.77,"median":113.0,"stdDev":19.14,"percentiles":{"p10":100.4,"p25":103.0,"p75":130.0,"p90":137.0},"expectedWins":7.5,"luck":-1.0,"averageZScore":0.322,"weeklyZScores":[1.249,-0.844,-0.688,-0.393,0.344,2.115,-0.103,-0.342,1.067,1.203,0.591,-0.344,0.331]},{"manager":"Joey","games":13,"wins":4,"losses":9,"ties":0,"pointsFor":1400.0,"pointsAgainst":1391.0,"mean":107.69,"median":107.0,"stdDev":20.95,"percentiles":{"p10":90.6,"p25":99.0,"p75":117.0,"p90":131.8},"expectedWins":6.0,"luck":-2.0,"averageZScore":-0.073,"weeklyZScores":[0.619,1.551,-0.65,-0.536,-1.8,-0.143,0.298,-0.708,-0.164,0.298,0.504,0.79,-1.003]}]},"2018":{"weeks":[1,2,3,4,5,6,7,8,9,10,11,12,13],"managers":[{"manager":"Tyler","games":13,"wins":11,"losses":2,"ties":0,"pointsFor":1958.6,"pointsAgainst":1573.78,"mean":150.66,"median":151.58,"stdDev":24.6,"percentiles":{"p10":122.14,"p25":137.18,"p75":156.72,"p90":177.5},"expectedWins":9.333,"luck":1.667,"averageZScore":0.73,"weeklyZScores":[2.237,0.136,0.775,-1.53,0.683,1.452,-0.23,1.019,1.374,0.525,0.791,1.037,1.217]},{"manager":"Matt","games":13,"wins":9,"losses":4,"ties":0,"pointsFor":1798.78,"pointsAgainst":1640.28,"mean":138.37,"median":134.48,"stdDev":22.57,"percentiles":{"p10":117.05,"p25":121.32,"p75":146.94,"p90":163.77},"expectedWins":8.222,"luck":0.778,"averageZScore":0.254,"weeklyZScores":[-0.546,0.258,-0.452,0.613,0.611,2.023,-0.034,0.279,-0.447,0.446,-0.46,0.299,0.711]},{"manager":"Peter","games":13,"wins":9,"losses":4,"ties":0,"pointsFor":1884.26,"pointsAgainst":1689.92,"mean":144.94,"median":133.02,"stdDev":26.16,"percentiles":{"p10":118.52,"p25":127.1,"p75":161.34,"p90":172.1},"expectedWins":8.333,"luck":0.667,"averageZScore":0.46,"weeklyZScores":[-0.593,0.047,1.158,2.121,-0.033,0.136,1.442,-0.234,1.607,-0.284,1.42,-1.041,0.232]},{"manager":"Ben","games":13,"wins":5,"losses":8,"ties":0,"pointsFor":1515.86,"pointsAgainst":1813.98,"mean":116.6,"median":117.68,"stdDev":17.82,"percentiles":{"p10":93.91,"p25":103.54,"p75":123.86,"p90":137.96},"expectedWins":4.444,"luck":0.556,"averageZScore":-0.602,"weeklyZScores":[-0.489,-1.581,-0.475,0.243,-1.196,0.082,-0.868,-0.679,0.1,-1.003,-1.494,-0.885,0.419]},{"manager":"Ted","games":13,"wins":9,"losses":4,"ties":0,"pointsFor":1843.24,"pointsAgainst":1674.46,"mean":141.79,"median":150.26,"stdDev":24.02,"percentiles":{"p10":109.33,"p25":128.38,"p75":155.84,"p90":163.14},"expectedWins":8.444,"luck":0.556,"averageZScore":0.406,"weeklyZScores":[0.633,-0.506,0.848,0.092,0.721,-1.571,0.107,1.523,-0.847,0.751,0.637,1.712,1.172]},{"manager":"John","games":13,"wins":7,"losses":6,"ties":0,"pointsFor":1763.34,"pointsAgainst":1680.8,"mean":135.64,"median":134.52,"stdDev":20.56,"percentiles":{"p10":115.9,"p25":130.32,"p75":149.6,"p90":153.81},"expectedWins":6.667,"luck":0.333,"averageZScore":0.08,"weeklyZScores":[0.522,0.035,0.796,0.184,1.855,-0.266,-0.512,-0.228,0.388,-0.23,0.539,-0.027,-2.022]},{"manager":"Lanny","games":13,"wins":4,"losses":9,"ties":0,"pointsFor":1536.94,"pointsAgainst":1816.24,"mean":118.23,"median":113.76,"stdDev":25.67,"percentiles":{"p10":92.57,"p25":92.84,"p75":136.24,"p90":158.2},"expectedWins":4.0,"luck":0.0,"averageZScore":-0.587,"weeklyZScores":[0.933,-1.295,-1.04,0.011,-1.626,-0.06,-1.299,-1.597,-0.571,0.702,-0.619,-1.482,0.31]},{"manager":"Jason","games":13,"wins":6,"losses":7,"ties":0,"pointsFor":1821.14,"pointsAgainst":1713.46,"mean":140.09,"median":139.22,"stdDev":25.79,"percentiles":{"p10":109.64,"p25":114.94,"p75":158.24,"p90":174.58},"expectedWins":7.333,"luck":-1.333,"averageZScore":0.32,"weeklyZScores":[-0.877,2.225,1.055,-0.714,-0.901,-0.92,1.278,-0.666,0.94,1.249,1.275,0.336,-0.115]},{"manager":"Vernon","games":13,"wins":4,"losses":9,"ties":0,"pointsFor":1630.12,"pointsAgainst":1765.0,"mean":125.39,"median":117.36,"stdDev":29.03,"percentiles":{"p10":97.8,"p25":107.84,"p75":145.94,"p90":160.77},"expectedWins":5.333,"luck":-1.333,"averageZScore":-0.283,"weeklyZScores":[-0.646,0.726,-0.815,0.398,0.333,-0.463,1.383,1.481,-1.323,-2.39,-0.919,-0.904,-0.54]},{"manager":"Joey","games":13,"wins":1,"losses":12,"ties":0,"pointsFor":1446.14,"pointsAgainst":1830.5,"mean":111.24,"median":108.6,"stdDev":21.8,"percentiles":{"p10":93.42,"p25":99.58,"p75":126.08,"p90":143.36},"expectedWins":2.889,"luck":-1.889,"averageZScore":-0.777,"weeklyZScores":[-1.174,-0.046,-1.849,-1.419,-0.448,-0.413,-1.268,-0.899,-1.22,0.235,-1.169,0.953,-1.385]}]},"2019":{"weeks":[1,2,3,4,5,6,7,8,9,10,11,12,13],"managers":[{"manager":"Jason","games":13,"wins":10,"losses":3,"ties":0,"pointsFor":1692.84,"pointsAgainst":1591.7,"mean":130.22,"median":129.88,"stdDev":17.6,"percentiles":{"p10":104.76,"p25":114.46,"p75":146.38,"p90":153.01},"expectedWins":7.111,"luck":2.889,"averageZScore":0.236,"weeklyZScores":[-0.015,-0.614,-0.13,1.416,-1.019,0.888,0.863,-0.182,-0.426,-0.896,1.936,0.836,0.409]},{"manager":"Joey","games":13,"wins":9,"losses":4,"ties":0,"pointsFor":1583.14,"pointsAgainst":1549.44,"mean":121.78,"median":121.5,"stdDev":22.58,"percentiles":{"p10":94.49,"p25":98.22,"p75":140.6,"p90":149.52},"expectedWins":6.667,"luck":2.333,"averageZScore":-0.069,"weeklyZScores":[-1.45,0.526,1.164,-0.844,0.09,-1.022,-0.44,0.879,0.553,0.767,0.446,-0.405,-1.161]},{"manager":"Tyler","games":13,"wins":6,"losses":7,"ties":0,"pointsFor":1472.46,"pointsAgainst":1591.0,"mean":113.27,"median":112.6,"stdDev":22.48,"percentiles":{"p10":87.42,"p25":98.24,"p75":117.46,"p90":143.24},"expectedWins":4.444,"luck":1.556,"averageZScore":-0.517,"weeklyZScores":[0.526,-0.174,0.597,-1.511,-0.67,-0.685,-1.328,-1.883,1.106,-1.569,0.257,-0.965,-0.418]},{"manager":"Ben","games":13,"wins":7,"losses":6,"ties":0,"pointsFor":1596.58,"pointsAgainst":1676.66,"mean":122.81,"median":124.0,"stdDev":21.43,"percentiles":{"p10":91.34,"p25":108.6,"p75":139.26,"p90":149.2},"expectedWins":6.222,"luck":0.778,"averageZScore":-0.103,"weeklyZScores":[-0.71,-0.676,0.31,1.578,0.218,0.423,-0.32,0.333,-1.391,-0.398,-1.15,-0.001,0.446]},{"manager":"Matt","games":13,"wins":5,"losses":8,"ties":0,"pointsFor":1473.3,"pointsAgainst":1593.08,"mean":113.33,"median":117.76,"stdDev":23.29,"percentiles":{"p10":80.79,"p25":98.62,"p75":129.08,"p90":144.3},"expectedWins":5.278,"luck":-0.278,"averageZScore":-0.393,"weeklyZScores":[-1.25,-0.004,-1.62,0.003,-0.513,-1.768,-0.743,0.709,-1.827,0.223,0.83,1.003,-0.151]},{"manager":"Ted","games":13,"wins":8,"losses":5,"ties":0,"pointsFor":1851.6,"pointsAgainst":1680.66,"mean":142.43,"median":150.24,"stdDev":32.79,"percentiles":{"p10":107.01,"p25":118.54,"p75":161.3,"p90":181.37},"expectedWins":8.556,"luck":-0.556,"averageZScore":0.703,"weeklyZScores":[2.257,-0.046,-0.253,0.182,1.705,0.846,-0.509,0.867,1.09,2.172,-1.258,-0.017,2.099]},{"manager":"John","games":13,"wins":5,"losses":8,"ties":0,"pointsFor":1615.5,"pointsAgainst":1753.56,"mean":124.27,"median":128.82,"stdDev":27.03,"percentiles":{"p10":89.23,"p25":103.06,"p75":135.08,"p90":163.98},"expectedWins":6.222,"luck":-1.222,"averageZScore":-0.101,"weeklyZScores":[0.287,-1.312,-1.129,0.567,0.723,-0.792,0.181,-0.388,0.346,0.492,-0.416,1.917,-1.786]},{"manager":"Peter","games":13,"wins":8,"losses":5,"ties":0,"pointsFor":1819.98,"pointsAgainst":1570.6,"mean":140.0,"median":129.08,"stdDev":18.95,"percentiles":{"p10":120.96,"p25":127.12,"p75":156.68,"p90":168.73},"expectedWins":9.278,"luck":-1.278,"averageZScore":0.692,"weeklyZScores":[0.211,1.397,1.91,0.537,-0.572,-0.292,2.516,0.725,1.216,0.223,0.709,0.025,0.398]},{"manager":"Lanny","games":13,"wins":2,"losses":11,"ties":0,"pointsFor":1428.7,"pointsAgainst":1675.06,"mean":109.9,"median":112.0,"stdDev":19.91,"percentiles":{"p10":85.05,"p25":90.84,"p75":118.66,"p90":128.43},"expectedWins":4.0,"luck":-2.0,"averageZScore":-0.635,"weeklyZScores":[-0.331,-1.094,-0.744,-1.041,-1.471,1.0,-0.128,-1.764,-0.269,-0.965,-1.309,-0.622,0.483]},{"manager":"Vernon","games":13,"wins":5,"losses":8,"ties":0,"pointsFor":1707.1,"pointsAgainst":1559.44,"mean":131.32,"median":124.36,"stdDev":33.36,"percentiles":{"p10":94.04,"p25":114.02,"p75":147.88,"p90":171.96},"expectedWins":7.222,"luck":-2.222,"averageZScore":0.186,"weeklyZScores":[0.474,1.997,-0.104,-0.886,1.508,1.402,-0.091,0.704,-0.397,-0.049,-0.045,-1.771,-0.32]}]},"2020":{"weeks":[1,2,3,4,5,6,7,8,9,10,11,12,13],"managers":[{"manager":"Jason","games":13,"wins":10,"losses":3,"ties":0,"pointsFor":1674.66,"pointsAgainst":1608.06,"mean":128.82,"median":121.76,"stdDev":26.68,"percentiles":{"p10":95.45,"p25":113.24,"p75":154.16,"p90":164.5},"expectedWins":6.889,"luck":3.111,"averageZScore":0.114,"weeklyZScores":[-0.855,0.486,1.076,-1.687,1.271,-0.185,1.243,0.223,-0.353,-0.614,-0.339,1.581,-0.368]},{"manager":"Joey","games":13,"wins":7,"losses":6,"ties":0,"pointsFor":1572.06,"pointsAgainst":1536.14,"mean":120.93,"median":121.3,"stdDev":20.74,"percentiles":{"p10":99.68,"p25":106.74,"p75":134.4,"p90":143.17},"expectedWins":4.556,"luck":2.444,"averageZScore":-0.308,"weeklyZScores":[1.229,-0.038,-0.243,0.283,-0.658,-0.597,-0.8,0.845,-1.33,-1.244,-0.439,0.049,-1.06]},{"manager":"Vernon","games":13,"wins":10,"losses":3,"ties":0,"pointsFor":1791.46,"pointsAgainst":1592.64,"mean":137.8,"median":135.62,"stdDev":19.96,"percentiles":{"p10":114.5,"p25":122.94,"p75":145.5,"p90":162.61},"expectedWins":8.556,"luck":1.444,"averageZScore":0.458,"weeklyZScores":[-0.472,-0.393,0.829,1.752,-0.803,-0.188,0.07,0.893,-0.292,2.093,1.36,0.716,0.388]},{"manager":"Ben","games":13,"wins":10,"losses":3,"ties":0,"pointsFor":1826.88,"pointsAgainst":1590.98,"mean":140.53,"median":140.48,"stdDev":25.73,"percentiles":{"p10":110.04,"p25":123.88,"p75":157.7,"p90":175.98},"expectedWins":9.0,"luck":1.0,"averageZScore":0.499,"weeklyZScores":[1.135,1.587,1.206,0.585,-1.917,-0.029,0.234,0.73,1.499,0.223,-0.192,-0.183,1.604]},{"manager":"Matt","games":13,"wins":3,"losses":10,"ties":0,"pointsFor":1447.54,"pointsAgainst":1656.4,"mean":111.35,"median":106.98,"stdDev":18.32,"percentiles":{"p10":94.28,"p25":98.02,"p75":116.76,"p90":141.7},"expectedWins":3.444,"luck":-0.444,"averageZScore":-0.681,"weeklyZScores":[-0.6,-1.073,-1.184,0.422,-1.094,2.137,-1.204,-0.6,-1.181,-0.515,-1.02,-2.408,-0.528]},{"manager":"Peter","games":13,"wins":5,"losses":8,"ties":0,"pointsFor":1541.7,"pointsAgainst":1595.0,"mean":118.59,"median":119.64,"stdDev":19.92,"percentiles":{"p10":88.48,"p25":101.02,"p75":135.74,"p90":141.82},"expectedWins":5.556,"luck":-0.556,"averageZScore":-0.278,"weeklyZScores":[0.557,-1.854,-0.577,-1.186,0.747,0.888,0.494,0.275,-0.726,-0.986,-0.176,0.546,-1.618]},{"manager":"Tyler","games":13,"wins":4,"losses":9,"ties":0,"pointsFor":1559.22,"pointsAgainst":1711.5,"mean":119.94,"median":122.16,"stdDev":22.52,"percentiles":{"p10":93.9,"p25":106.96,"p75":130.82,"p90":143.42},"expectedWins":5.556,"luck":-1.556,"averageZScore":-0.195,"weeklyZScores":[1.619,-0.884,-0.921,0.318,0.21,0.93,-1.559,-1.296,-0.332,-0.378,0.909,-0.737,-0.409]},{"manager":"John","games":13,"wins":4,"losses":9,"ties":0,"pointsFor":1596.98,"pointsAgainst":1729.6,"mean":122.84,"median":131.44,"stdDev":28.32,"percentiles":{"p10":97.51,"p25":105.0,"p75":146.44,"p90":152.94},"expectedWins":5.778,"luck":-1.778,"averageZScore":-0.207,"weeklyZScores":[-1.361,0.469,0.436,0.286,0.779,-0.676,0.665,-2.226,0.919,-0.346,-1.65,0.256,-0.24]},{"manager":"Lanny","games":13,"wins":6,"losses":7,"ties":0,"pointsFor":1738.16,"pointsAgainst":1780.72,"mean":133.7,"median":133.1,"stdDev":23.49,"percentiles":{"p10":104.87,"p25":114.32,"p75":151.02,"p90":165.28},"expectedWins":7.778,"luck":-1.778,"averageZScore":0.363,"weeklyZScores":[-1.025,1.009,1.044,-1.28,1.008,-0.751,-0.76,0.868,0.097,1.424,1.77,-0.248,1.566]},{"manager":"Ted","games":13,"wins":6,"losses":7,"ties":0,"pointsFor":1707.42,"pointsAgainst":1655.04,"mean":131.34,"median":131.22,"stdDev":26.07,"percentiles":{"p10":95.86,"p25":119.98,"p75":149.88,"p90":161.03},"expectedWins":7.889,"luck":-1.889,"averageZScore":0.234,"weeklyZScores":[-0.228,0.692,-1.667,0.506,0.458,-1.528,1.616,0.288,1.699,0.342,-0.223,0.428,0.665]}]},"2021":{"weeks":[1,2,3,4,5,6,7,8,9,10,11,12,13,14],"managers":[{"manager":"Ben","games":14,"wins":11,"losses":3,"ties":0,"pointsFor":1907.46,"pointsAgainst":1604.88,"mean":136.25,"median":134.46,"stdDev":21.88,"percentiles":{"p10":111.52,"p25":118.19,"p75":149.1,"p90":159.04},"expectedWins":9.0,"luck":2.0,"averageZScore":0.337,"weeklyZScores":[0.613,-0.711,0.775,-0.755,-0.213,0.972,0.223,-0.281,-0.063,-0.011,1.2,0.524,1.77,0.667]},{"manager":"Vernon","games":14,"wins":9,"losses":5,"ties":0,"pointsFor":1739.48,"pointsAgainst":1715.52,"mean":124.25,"median":123.24,"stdDev":19.78,"percentiles":{"p10":103.75,"p25":114.93,"p75":136.43,"p90":144.13},"expectedWins":7.333,"luck":1.667,"averageZScore":0.017,"weeklyZScores":[0.599,-1.097,1.06,0.149,-0.911,-0.098,-1.505,0.435,0.252,0.231,-0.154,0.905,-0.763,1.136]},{"manager":"Ted","games":14,"wins":10,"losses":4,"ties":0,"pointsFor":1852.78,"pointsAgainst":1742.74,"mean":132.34,"median":129.44,"stdDev":19.25,"percentiles":{"p10":111.08,"p25":120.39,"p75":143.42,"p90":157.72},"expectedWins":8.667,"luck":1.333,"averageZScore":0.335,"weeklyZScores":[1.838,0.425,0.203,0.947,0.36,-1.076,-0.223,0.861,0.763,-0.163,0.134,0.388,0.505,-0.274]},{"manager":"Matt","games":14,"wins":5,"losses":9,"ties":0,"pointsFor":1487.36,"pointsAgainst":1746.06,"mean":106.24,"median":98.95,"stdDev":23.38,"percentiles":{"p10":84.08,"p25":88.6,"p75":130.11,"p90":138.41},"expectedWins":3.889,"luck":1.111,"averageZScore":-0.816,"weeklyZScores":[-1.145,0.25,-1.976,0.54,-0.467,-0.89,-0.15,1.12,-0.58,-1.535,-1.444,-1.581,-1.778,-1.784]},{"manager":"Peter","games":14,"wins":8,"losses":6,"ties":0,"pointsFor":1830.48,"pointsAgainst":1750.28,"mean":130.75,"median":127.34,"stdDev":21.55,"percentiles":{"p10":109.36,"p25":113.24,"p75":145.65,"p90":155.39},"expectedWins":7.556,"luck":0.444,"averageZScore":0.243,"weeklyZScores":[-0.353,1.443,0.748,-0.917,1.038,-0.993,0.77,0.858,0.707,-0.098,-0.431,-0.336,0.394,0.568]},{"manager":"Lanny","games":14,"wins":8,"losses":6,"ties":0,"pointsFor":1900.94,"pointsAgainst":1732.56,"mean":135.78,"median":125.14,"stdDev":34.33,"percentiles":{"p10":93.9,"p25":113.11,"p75":160.15,"p90":176.54},"expectedWins":7.889,"luck":0.111,"averageZScore":0.371,"weeklyZScores":[-0.487,1.879,0.152,0.917,2.011,1.696,1.275,-1.003,-1.012,0.832,0.93,-0.239,-1.118,-0.634]},{"manager":"Tyler","games":14,"wins":7,"losses":7,"ties":0,"pointsFor":1820.0,"pointsAgainst":1750.78,"mean":130.0,"median":132.24,"stdDev":23.15,"percentiles":{"p10":102.93,"p25":117.78,"p75":137.52,"p90":160.41},"expectedWins":8.0,"luck":-1.0,"averageZScore":0.222,"weeklyZScores":[0.283,-0.023,-0.551,1.403,-0.871,0.177,0.186,1.196,-0.282,0.103,-1.631,1.744,-0.207,1.575]},{"manager":"Jason","games":14,"wins":1,"losses":13,"ties":0,"pointsFor":1413.1,"pointsAgainst":1817.32,"mean":100.94,"median":101.19,"stdDev":16.68,"percentiles":{"p10":79.66,"p25":89.37,"p75":115.75,"p90":120.02},"expectedWins":2.222,"luck":-1.222,"averageZScore":-1.189,"weeklyZScores":[-1.248,-1.068,-1.609,-2.019,-1.612,-0.774,-1.466,-1.93,-1.751,-0.729,-0.225,-1.717,0.064,-0.568]},{"manager":"John","games":14,"wins":7,"losses":7,"ties":0,"pointsFor":1979.82,"pointsAgainst":1888.6,"mean":141.42,"median":141.4,"stdDev":24.88,"percentiles":{"p10":107.04,"p25":120.5,"p75":166.09,"p90":172.37},"expectedWins":9.111,"luck":-2.111,"averageZScore":0.61,"weeklyZScores":[-1.184,0.039,0.337,0.346,0.531,1.523,1.631,-0.784,2.081,2.325,1.634,0.001,1.188,-1.131]},{"manager":"Joey","games":14,"wins":4,"losses":10,"ties":0,"pointsFor":1730.56,"pointsAgainst":1913.24,"mean":123.61,"median":121.47,"stdDev":17.91,"percentiles":{"p10":101.91,"p25":111.97,"p75":136.0,"p90":150.63},"expectedWins":6.333,"luck":-2.333,"averageZScore":-0.129,"weeklyZScores":[1.083,-1.136,0.861,-0.611,0.134,-0.538,-0.742,-0.472,-0.115,-0.955,-0.013,0.309,-0.057,0.446]}]},"2022":{"weeks":[1,2,3,4,5,6,7,8,9,10,11,12,13,14],"managers":[{"manager":"Tyler","games":14,"wins":10,"losses":4,"ties":0,"pointsFor":1626.0,"pointsAgainst":1589.26,"mean":116.14,"median":112.21,"stdDev":23.17,"percentiles":{"p10":89.91,"p25":98.45,"p75":129.8,"p90":145.94},"expectedWins":6.222,"luck":3.778,"averageZScore":-0.195,"weeklyZScores":[-1.61,-1.412,0.042,1.509,0.091,-0.985,-0.001,0.136,-0.449,-0.765,-0.348,0.107,1.203,-0.253]},{"manager":"Ben","games":14,"wins":6,"losses":8,"ties":0,"pointsFor":1525.06,"pointsAgainst":1691.02,"mean":108.93,"median":105.67,"stdDev":18.7,"percentiles":{"p10":87.01,"p25":95.7,"p75":120.49,"p90":133.84},"expectedWins":4.556,"luck":1.444,"averageZScore":-0.519,"weeklyZScores":[0.235,0.508,0.18,-1.22,-0.602,-0.223,-1.186,-1.827,-0.848,0.654,-0.632,-0.259,-0.787,-1.256]},{"manager":"John","games":14,"wins":12,"losses":2,"ties":0,"pointsFor":2069.2,"pointsAgainst":1658.3,"mean":147.8,"median":146.47,"stdDev":27.51,"percentiles":{"p10":116.9,"p25":120.43,"p75":174.92,"p90":180.74},"expectedWins":10.667,"luck":1.333,"averageZScore":0.934,"weeklyZScores":[2.326,0.558,0.421,0.455,1.45,0.275,0.264,0.276,2.269,2.27,2.144,-0.553,1.199,-0.271]},{"manager":"Peter","games":14,"wins":7,"losses":7,"ties":0,"pointsFor":1642.46,"pointsAgainst":1764.56,"mean":117.32,"median":119.79,"stdDev":28.96,"percentiles":{"p10":78.67,"p25":113.9,"p75":130.32,"p90":148.66},"expectedWins":7.333,"luck":-0.333,"averageZScore":-0.161,"weeklyZScores":[-0.465,-2.269,-1.177,1.066,1.191,1.208,0.097,-0.399,-0.038,-0.08,0.391,-0.119,-1.938,0.277]},{"manager":"Ted","games":14,"wins":4,"losses":10,"ties":0,"pointsFor":1508.72,"pointsAgainst":1787.46,"mean":107.77,"median":99.43,"stdDev":25.18,"percentiles":{"p10":80.57,"p25":84.01,"p75":128.94,"p90":140.36},"expectedWins":4.333,"luck":-0.333,"averageZScore":-0.625,"weeklyZScores":[-0.387,0.285,-1.454,0.123,-1.28,-0.637,0.015,0.733,0.569,-0.996,-1.751,-1.755,-0.881,-1.334]},{"manager":"Vernon","games":14,"wins":7,"losses":7,"ties":0,"pointsFor":1742.16,"pointsAgainst":1597.82,"mean":124.44,"median":126.45,"stdDev":25.11,"percentiles":{"p10":86.91,"p25":112.98,"p75":144.34,"p90":155.29},"expectedWins":7.333,"luck":-0.333,"averageZScore":0.053,"weeklyZScores":[0.111,0.838,-1.458,-0.14,0.626,-1.887,-0.66,-0.812,-0.288,0.785,-0.018,1.895,0.438,1.312]},{"manager":"Lanny","games":14,"wins":4,"losses":10,"ties":0,"pointsFor":1579.84,"pointsAgainst":1760.08,"mean":112.85,"median":115.84,"stdDev":18.58,"percentiles":{"p10":87.23,"p25":105.72,"p75":121.75,"p90":135.37},"expectedWins":5.0,"luck":-1.0,"averageZScore":-0.32,"weeklyZScores":[-0.833,-0.251,0.839,0.472,-0.316,-0.326,-0.374,-0.874,-1.539,-0.222,-0.113,-0.397,0.805,-1.356]},{"manager":"Matt","games":14,"wins":6,"losses":8,"ties":0,"pointsFor":1718.46,"pointsAgainst":1683.6,"mean":122.75,"median":119.57,"stdDev":30.41,"percentiles":{"p10":86.67,"p25":114.27,"p75":132.62,"p90":157.16},"expectedWins":7.222,"luck":-1.222,"averageZScore":0.034,"weeklyZScores":[0.324,0.814,1.017,-2.13,-1.886,0.239,-0.629,1.922,0.97,-0.121,-0.255,-0.722,0.143,0.795]},{"manager":"Jason","games":14,"wins":8,"losses":6,"ties":0,"pointsFor":1907.78,"pointsAgainst":1694.46,"mean":136.27,"median":140.03,"stdDev":24.07,"percentiles":{"p10":112.56,"p25":132.95,"p75":148.09,"p90":150.52},"expectedWins":9.333,"luck":-1.333,"averageZScore":0.649,"weeklyZScores":[-0.449,0.049,1.557,0.143,0.644,1.708,2.734,-0.021,-0.272,-1.467,1.132,1.462,0.647,1.215]},{"manager":"Joey","games":14,"wins":6,"losses":8,"ties":0,"pointsFor":1760.24,"pointsAgainst":1853.36,"mean":125.73,"median":123.53,"stdDev":18.28,"percentiles":{"p10":107.83,"p25":109.98,"p75":134.27,"p90":154.23},"expectedWins":8.0,"luck":-2.0,"averageZScore":0.15,"weeklyZScores":[0.749,0.881,0.033,-0.279,0.083,0.628,-0.26,0.867,-0.374,-0.058,-0.55,0.341,-0.829,0.873]}]},"2023":{"weeks":[1,2,3,4,5,6,7,8,9,10,11,12,13,14],"managers":[{"manager":"Tyler","games":14,"wins":12,"losses":2,"ties":0,"pointsFor":1757.96,"pointsAgainst":1542.98,"mean":125.57,"median":124.57,"stdDev":16.23,"percentiles":{"p10":106.47,"p25":113.48,"p75":137.86,"p90":144.86},"expectedWins":8.111,"luck":3.889,"averageZScore":0.117,"weeklyZScores":[0.818,-1.494,0.371,0.19,-0.368,0.784,-0.044,1.005,0.559,-0.403,-0.322,0.286,1.037,-0.774]},{"manager":"Vernon","games":14,"wins":6,"losses":8,"ties":0,"pointsFor":1547.94,"pointsAgainst":1682.48,"mean":110.57,"median":109.02,"stdDev":17.87,"percentiles":{"p10":92.36,"p25":99.47,"p75":120.44,"p90":135.85},"expectedWins":4.444,"luck":1.556,"averageZScore":-0.544,"weeklyZScores":[-0.785,0.173,-1.738,-0.501,-0.994,-1.184,-0.479,0.573,0.012,-2.121,-0.405,-0.778,0.401,0.217]},{"manager":"Matt","games":14,"wins":8,"losses":6,"ties":0,"pointsFor":1773.68,"pointsAgainst":1683.08,"mean":126.69,"median":124.26,"stdDev":28.41,"percentiles":{"p10":94.45,"p25":109.8,"p75":138.22,"p90":165.48},"expectedWins":6.667,"luck":1.333,"averageZScore":0.076,"weeklyZScores":[-1.549,-0.438,-0.125,0.491,-0.684,-0.862,-1.208,0.585,2.231,0.758,0.751,2.375,-0.895,-0.366]},{"manager":"Ben","games":14,"wins":6,"losses":8,"ties":0,"pointsFor":1656.58,"pointsAgainst":1783.78,"mean":118.33,"median":122.57,"stdDev":16.98,"percentiles":{"p10":97.73,"p25":111.27,"p75":129.3,"p90":131.51},"expectedWins":6.333,"luck":-0.333,"averageZScore":-0.258,"weeklyZScores":[-0.626,-0.968,-0.585,0.289,-0.048,0.463,0.751,0.893,0.687,-0.33,-2.441,-0.236,-0.363,-1.105]},{"manager":"Lanny","games":14,"wins":6,"losses":8,"ties":0,"pointsFor":1639.66,"pointsAgainst":1706.98,"mean":117.12,"median":113.16,"stdDev":20.36,"percentiles":{"p10":92.43,"p25":104.81,"p75":126.81,"p90":140.42},"expectedWins":6.333,"luck":-0.333,"averageZScore":-0.237,"weeklyZScores":[-0.238,0.756,1.436,-0.983,0.227,-1.278,-0.22,-1.142,-0.464,0.028,-0.26,-0.939,-0.264,0.025]},{"manager":"Joey","games":14,"wins":8,"losses":6,"ties":0,"pointsFor":1858.56,"pointsAgainst":1721.8,"mean":132.75,"median":126.47,"stdDev":23.26,"percentiles":{"p10":107.13,"p25":115.55,"p75":143.49,"p90":163.92},"expectedWins":8.556,"luck":-0.556,"averageZScore":0.428,"weeklyZScores":[-0.077,-0.962,-1.025,0.19,2.083,0.588,-0.853,0.535,0.543,1.613,0.4,1.077,0.345,1.529]},{"manager":"Jason","games":14,"wins":7,"losses":7,"ties":0,"pointsFor":1784.94,"pointsAgainst":1673.8,"mean":127.5,"median":129.42,"stdDev":30.24,"percentiles":{"p10":90.36,"p25":103.87,"p75":149.47,"p90":168.47},"expectedWins":7.667,"luck":-0.667,"averageZScore":0.335,"weeklyZScores":[-0.977,2.216,1.699,-1.393,0.457,2.084,1.478,-1.428,-0.651,-0.83,0.261,-0.998,1.378,1.398]},{"manager":"John","games":14,"wins":5,"losses":9,"ties":0,"pointsFor":1634.64,"pointsAgainst":1879.44,"mean":116.76,"median":119.18,"stdDev":24.44,"percentiles":{"p10":91.33,"p25":97.14,"p75":132.88,"p90":143.9},"expectedWins":6.0,"luck":-1.0,"averageZScore":-0.245,"weeklyZScores":[0.386,0.329,0.194,-0.879,1.243,0.426,-1.077,-1.472,-1.437,0.794,0.863,-0.724,-0.48,-1.595]},{"manager":"Ted","games":14,"wins":6,"losses":8,"ties":0,"pointsFor":1706.44,"pointsAgainst":1726.38,"mean":121.89,"median":119.93,"stdDev":28.51,"percentiles":{"p10":86.41,"p25":109.84,"p75":135.39,"p90":144.85},"expectedWins":7.111,"luck":-1.111,"averageZScore":-0.019,"weeklyZScores":[1.767,0.282,-0.573,2.371,-0.495,-0.56,-0.236,1.127,-1.007,-0.308,-0.291,0.135,-2.135,-0.349]},{"manager":"Peter","games":14,"wins":6,"losses":8,"ties":0,"pointsFor":1797.94,"pointsAgainst":1757.62,"mean":128.42,"median":129.75,"stdDev":17.98,"percentiles":{"p10":100.35,"p25":119.33,"p75":141.96,"p90":145.56},"expectedWins":8.778,"luck":-2.778,"averageZScore":0.347,"weeklyZScores":[1.281,0.106,0.347,0.225,-1.421,-0.46,1.889,-0.676,-0.474,0.799,1.443,-0.198,0.977,1.02]}]},"2024":{"weeks":[1,2,3,4,5,6,7,8,9,10,11,12,13,14],"managers":[{"manager":"Joey","games":14,"wins":9,"losses":5,"ties":0,"pointsFor":1710.16,"pointsAgainst":1577.7,"mean":122.15,"median":123.1,"stdDev":22.81,"percentiles":{"p10":94.79,"p25":113.72,"p75":129.77,"p90":151.3},"expectedWins":6.444,"luck":2.556,"averageZScore":-0.065,"weeklyZScores":[0.412,1.072,-0.066,0.856,-1.714,-1.026,-1.358,0.728,-1.08,0.492,-0.373,-0.225,1.453,-0.082]},{"manager":"Peter","games":14,"wins":9,"losses":5,"ties":0,"pointsFor":1841.32,"pointsAgainst":1614.5,"mean":131.52,"median":130.27,"stdDev":12.12,"percentiles":{"p10":119.45,"p25":126.73,"p75":140.36,"p90":145.32},"expectedWins":8.333,"luck":0.667,"averageZScore":0.282,"weeklyZScores":[0.916,0.31,-0.136,0.216,0.036,1.039,0.89,0.585,-1.739,1.154,0.114,0.211,0.388,-0.04]},{"manager":"Lanny","games":14,"wins":8,"losses":6,"ties":0,"pointsFor":1792.4,"pointsAgainst":1810.12,"mean":128.03,"median":130.02,"stdDev":21.38,"percentiles":{"p10":99.92,"p25":107.95,"p75":142.3,"p90":158.48},"expectedWins":7.556,"luck":0.444,"averageZScore":0.064,"weeklyZScores":[0.524,-0.991,0.349,-1.044,-0.965,1.001,0.897,0.953,0.521,-0.643,0.754,-0.394,-0.811,0.75]},{"manager":"Matt","games":14,"wins":8,"losses":6,"ties":0,"pointsFor":1772.76,"pointsAgainst":1788.68,"mean":126.63,"median":129.22,"stdDev":26.87,"percentiles":{"p10":103.41,"p25":109.87,"p75":139.88,"p90":155.22},"expectedWins":7.889,"luck":0.111,"averageZScore":0.138,"weeklyZScores":[1.31,0.015,0.786,1.207,0.543,-1.251,1.404,-0.48,0.023,-0.356,1.6,-0.94,-0.023,-1.897]},{"manager":"Tyler","games":14,"wins":7,"losses":7,"ties":0,"pointsFor":1720.12,"pointsAgainst":1759.06,"mean":122.87,"median":131.52,"stdDev":26.22,"percentiles":{"p10":85.61,"p25":106.69,"p75":144.17,"p90":149.43},"expectedWins":7.333,"luck":-0.333,"averageZScore":-0.028,"weeklyZScores":[-0.567,1.468,-1.996,-0.663,0.968,0.665,-1.161,0.739,1.535,0.132,-0.222,0.518,-1.984,0.182]},{"manager":"Ben","games":14,"wins":6,"losses":8,"ties":0,"pointsFor":1722.4,"pointsAgainst":1825.9,"mean":123.03,"median":119.83,"stdDev":18.49,"percentiles":{"p10":100.7,"p25":110.89,"p75":135.09,"p90":145.91},"expectedWins":6.444,"luck":-0.444,"averageZScore":-0.047,"weeklyZScores":[-0.607,1.241,-0.469,1.815,-0.347,-0.89,0.394,0.947,0.75,-0.766,-0.885,-1.101,-0.423,-0.317]},{"manager":"Jason","games":14,"wins":7,"losses":7,"ties":0,"pointsFor":1778.72,"pointsAgainst":1702.5,"mean":127.05,"median":119.39,"stdDev":28.53,"percentiles":{"p10":94.91,"p25":106.02,"p75":149.73,"p90":162.28},"expectedWins":7.444,"luck":-0.444,"averageZScore":0.05,"weeklyZScores":[-0.655,-0.645,1.206,0.276,-0.382,1.114,-1.059,-1.818,-0.734,-0.365,0.034,1.656,0.753,1.322]},{"manager":"Vernon","games":14,"wins":6,"losses":8,"ties":0,"pointsFor":1807.08,"pointsAgainst":1666.3,"mean":129.08,"median":126.82,"stdDev":25.58,"percentiles":{"p10":96.49,"p25":117.61,"p75":139.17,"p90":154.12},"expectedWins":6.778,"luck":-0.778,"averageZScore":0.072,"weeklyZScores":[1.428,-1.613,-0.797,-1.239,-0.477,-0.291,0.373,0.673,-0.243,0.974,0.823,0.677,-0.818,1.538]},{"manager":"John","games":14,"wins":2,"losses":12,"ties":0,"pointsFor":1422.02,"pointsAgainst":1917.84,"mean":101.57,"median":99.42,"stdDev":21.5,"percentiles":{"p10":77.09,"p25":85.16,"p75":117.95,"p90":130.38},"expectedWins":2.889,"luck":-0.889,"averageZScore":-0.995,"weeklyZScores":[-1.497,0.16,-0.513,-1.112,0.256,-1.337,-1.126,-1.358,-0.397,-2.044,-2.247,-1.634,0.161,-1.238]},{"manager":"Ted","games":14,"wins":8,"losses":6,"ties":0,"pointsFor":1912.68,"pointsAgainst":1817.06,"mean":136.62,"median":141.79,"stdDev":23.97,"percentiles":{"p10":103.49,"p25":115.19,"p75":151.45,"p90":167.68},"expectedWins":8.889,"luck":-0.889,"averageZScore":0.528,"weeklyZScores":[-1.265,-1.017,1.637,-0.311,2.082,0.976,0.746,-0.97,1.364,1.423,0.402,1.231,1.305,-0.218]}]},"2025":{"weeks":[1,2,3,4,5,6,7,8,9,10,11,12,13,14],"managers":[{"manager":"Tyler","games":14,"wins":11,"losses":3,"ties":0,"pointsFor":1899.76,"pointsAgainst":1627.84,"mean":135.7,"median":129.29,"stdDev":27.86,"percentiles":{"p10":100.78,"p25":118.95,"p75":155.32,"p90":176.23},"expectedWins":9.333,"luck":1.667,"averageZScore":0.616,"weeklyZScores":[0.549,2.038,-0.239,-0.279,1.203,-1.409,1.311,1.955,2.232,-0.355,0.903,0.991,0.285,-0.555]},{"manager":"Peter","games":14,"wins":10,"losses":4,"ties":0,"pointsFor":1777.48,"pointsAgainst":1602.3,"mean":126.96,"median":123.2,"stdDev":19.98,"percentiles":{"p10":106.31,"p25":108.88,"p75":143.18,"p90":150.09},"expectedWins":8.556,"luck":1.444,"averageZScore":0.222,"weeklyZScores":[-0.256,0.735,1.112,0.93,-1.471,0.779,-0.552,-0.596,0.345,1.34,0.196,-0.592,1.594,-0.457]},{"manager":"Joey","games":14,"wins":8,"losses":6,"ties":0,"pointsFor":1742.24,"pointsAgainst":1561.22,"mean":124.45,"median":120.61,"stdDev":21.13,"percentiles":{"p10":103.49,"p25":108.15,"p75":135.03,"p90":148.62},"expectedWins":7.333,"luck":0.667,"averageZScore":0.062,"weeklyZScores":[-0.483,0.439,1.998,-0.311,-0.773,0.434,-0.471,0.344,-1.322,1.757,-0.332,-0.029,-0.178,-0.21]},{"manager":"Matt","games":14,"wins":9,"losses":5,"ties":0,"pointsFor":1831.06,"pointsAgainst":1777.74,"mean":130.79,"median":131.1,"stdDev":14.65,"percentiles":{"p10":114.41,"p25":117.94,"p75":144.38,"p90":149.53},"expectedWins":8.889,"luck":0.111,"averageZScore":0.338,"weeklyZScores":[-0.595,-0.358,0.66,0.113,-1.118,1.159,1.109,0.516,0.069,0.113,1.351,-0.157,0.804,1.062]},{"manager":"Ted","games":14,"wins":8,"losses":6,"ties":0,"pointsFor":1755.86,"pointsAgainst":1694.86,"mean":125.42,"median":129.67,"stdDev":26.12,"percentiles":{"p10":98.34,"p25":112.08,"p75":140.64,"p90":151.21},"expectedWins":8.111,"luck":-0.111,"averageZScore":0.311,"weeklyZScores":[1.414,-0.59,-0.285,1.861,0.45,0.496,-0.549,-1.021,0.243,-0.467,1.168,1.966,1.112,-1.445]},{"manager":"Jason","games":14,"wins":6,"losses":8,"ties":0,"pointsFor":1669.34,"pointsAgainst":1655.94,"mean":119.24,"median":127.56,"stdDev":20.25,"percentiles":{"p10":85.68,"p25":109.06,"p75":130.95,"p90":137.65},"expectedWins":6.222,"luck":-0.222,"averageZScore":-0.087,"weeklyZScores":[2.167,-1.494,-1.69,-1.757,0.192,0.425,-1.013,0.098,-0.616,0.062,0.572,0.476,0.675,0.679]},{"manager":"Lanny","games":14,"wins":4,"losses":10,"ties":0,"pointsFor":1480.42,"pointsAgainst":1804.72,"mean":105.74,"median":108.64,"stdDev":26.48,"percentiles":{"p10":70.59,"p25":85.45,"p75":126.95,"p90":138.11},"expectedWins":4.556,"luck":-0.556,"averageZScore":-0.696,"weeklyZScores":[-0.396,0.706,-0.284,-1.122,-0.324,-0.157,-0.531,-1.477,0.542,-2.154,-2.118,-1.73,-1.478,0.778]},{"manager":"Ben","games":14,"wins":4,"losses":10,"ties":0,"pointsFor":1556.3,"pointsAgainst":1719.38,"mean":111.16,"median":109.57,"stdDev":13.91,"percentiles":{"p10":94.46,"p25":97.88,"p75":122.65,"p90":130.89},"expectedWins":4.667,"luck":-0.667,"averageZScore":-0.47,"weeklyZScores":[-0.427,-0.778,-1.09,-0.608,-0.133,-0.247,0.254,-1.046,-1.541,-0.039,-0.609,0.357,-0.67,-0.009]},{"manager":"Vernon","games":14,"wins":5,"losses":9,"ties":0,"pointsFor":1685.2,"pointsAgainst":1780.38,"mean":120.37,"median":121.59,"stdDev":26.97,"percentiles":{"p10":93.76,"p25":95.91,"p75":134.41,"p90":159.73},"expectedWins":6.111,"luck":-1.111,"averageZScore":-0.173,"weeklyZScores":[-1.162,0.379,0.076,0.383,2.043,-2.201,-1.321,0.19,0.165,0.072,-0.666,-1.191,-0.875,1.683]},{"manager":"John","games":14,"wins":5,"losses":9,"ties":0,"pointsFor":1655.38,"pointsAgainst":1828.66,"mean":118.24,"median":117.22,"stdDev":27.28,"percentiles":{"p10":93.53,"p25":99.34,"p75":136.03,"p90":154.94},"expectedWins":6.222,"luck":-1.222,"averageZScore":-0.122,"weeklyZScores":[-0.812,-1.077,-0.256,0.789,-0.07,0.72,1.762,1.036,-0.116,-0.33,-0.466,-0.091,-1.269,-1.525]}]}};
@@ -0,0 +1,145 @@
+// Season range queries over the head-to-head cube generated by scripts/process_data.py
+
+export interface HeadToHeadCube {
+  seasons: number[];
+  managers: string[];
+  // Prefix sums over seasons: wins[k] is a flattened managers x managers matrix
+  // of games won in seasons[0..k-1]
+  wins: number[][];
+  ties: number[][];
+}
+
+export interface HeadToHeadRecord {
+  manager1: string;
+  manager2: string;
+  manager1Wins: number;
+  manager2Wins: number;
+  ties: number;
+  record: string;
+}
+
+export interface ManagerRecord {
+  opponent: string;
+  wins: number;
+  losses: number;
+  ties?: number;
+  record: string;
+}
+
+export interface ManagerData {
+  manager: string;
+  records: ManagerRecord[];
+  totalWins: number;
+  totalLosses: number;
+  totalTies: number;
+  totalGames: number;
+  winPercentage: number;
+}
+
+// First index in sorted seasons that is >= season
+const lowerBound = (seasons: number[], season: number) => {
+  let lo = 0;
+  let hi = seasons.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >> 1;
+    if (seasons[mid] < season) lo = mid + 1;
+    else hi = mid;
+  }
+  return lo;
+};
+
+// Head-to-head records for an inclusive season range, same shape as headToHeadRecords
+export const recordsForSeasonRange = (
+  cube: HeadToHeadCube,
+  startSeason: number,
+  endSeason: number
+): HeadToHeadRecord[] => {
+  const { seasons, managers, wins, ties } = cube;
+  const start = lowerBound(seasons, startSeason);
+  const end = lowerBound(seasons, endSeason + 1);
+  if (start >= end) return [];
+
+  const size = managers.length;
+  const winsEnd = wins[end];
+  const winsStart = wins[start];
+  const tiesEnd = ties[end];
+  const tiesStart = ties[start];
+  const records: HeadToHeadRecord[] = [];
+
+  for (let i = 0; i < size; i++) {
+    for (let j = i + 1; j < size; j++) {
+      const ij = i * size + j;
+      const ji = j * size + i;
+      const manager1Wins = winsEnd[ij] - winsStart[ij];
+      const manager2Wins = winsEnd[ji] - winsStart[ji];
+      const pairTies = tiesEnd[ij] - tiesStart[ij];
+      if (manager1Wins + manager2Wins + pairTies === 0) continue;
+
+      records.push({
+        manager1: managers[i],
+        manager2: managers[j],
+        manager1Wins,
+        manager2Wins,
+        ties: pairTies,
+        record:
+          pairTies > 0
+            ? `${manager1Wins}-${manager2Wins}-${pairTies}`
+            : `${manager1Wins}-${manager2Wins}`,
+      });
+    }
+  }
+
+  // Most games played first, matching headToHead.js
+  records.sort(
+    (a, b) =>
+      b.manager1Wins + b.manager2Wins + b.ties - (a.manager1Wins + a.manager2Wins + a.ties)
+  );
+  return records;
+};
+
+// Group pair records per manager, same shape and ordering as headToHeadByManager
+export const groupByManager = (records: HeadToHeadRecord[]): ManagerData[] => {
+  const managerDataMap = new Map<string, ManagerData>();
+
+  const addRecord = (manager: string, opponent: string, wins: number, losses: number, ties: number) => {
+    if (!managerDataMap.has(manager)) {
+      managerDataMap.set(manager, {
+        manager,
+        records: [],
+        totalWins: 0,
+        totalLosses: 0,
+        totalTies: 0,
+        totalGames: 0,
+        winPercentage: 0,
+      });
+    }
+    const data = managerDataMap.get(manager)!;
+    data.records.push({
+      opponent,
+      wins,
+      losses,
+      ties,
+      record: ties > 0 ? `${wins}-${losses}-${ties}` : `${wins}-${losses}`,
+    });
+    data.totalWins += wins;
+    data.totalLosses += losses;
+    data.totalTies += ties;
+    data.totalGames += wins + losses + ties;
+  };
+
+  records.forEach(({ manager1, manager2, manager1Wins, manager2Wins, ties }) => {
+    addRecord(manager1, manager2, manager1Wins, manager2Wins, ties);
+    addRecord(manager2, manager1, manager2Wins, manager1Wins, ties);
+  });
+
+  const managerData = Array.from(managerDataMap.values()).map((data) => {
+    data.winPercentage = data.totalGames > 0 ? (data.totalWins / data.totalGames) * 100 : 0;
+    // Most played opponents first
+    data.records.sort((a, b) => b.wins + b.losses - (a.wins + a.losses));
+    return data;
+  });
+
+  // Best win percentage first
+  managerData.sort((a, b) => b.winPercentage - a.winPercentage);
+  return managerData;
+};
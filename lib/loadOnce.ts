@@ -0,0 +1,17 @@
+// Per-key promise cache for the lazily imported JSON data files
+
+// Load a key's file once; a failed load is forgotten so it can be retried
+export const loadOnce = <K, T>(cache: Map<K, Promise<T>>, key: K, load: () => Promise<{ default?: T }>): Promise<T> => {
+  if (!cache.has(key)) {
+    cache.set(
+      key,
+      load()
+        .then((module) => (module.default ?? module) as T)
+        .catch((error) => {
+          cache.delete(key);
+          throw error;
+        })
+    );
+  }
+  return cache.get(key)!;
+};
@@ -0,0 +1,72 @@
+// Types and on-demand loading for the manager career profiles
+// generated by scripts/manager_profiles.py
+
+import { loadOnce } from "./loadOnce";
+
+export interface ManagerSummary {
+  manager: string;
+  seasonsPlayed: number;
+  wins: number;
+  losses: number;
+  ties: number;
+  winPct: number | null;
+  championships: number;
+}
+
+export interface SeasonRecord {
+  season: number;
+  wins: number;
+  losses: number;
+  ties: number;
+  winPct: number | null;
+  pointsFor: number;
+  pointsAgainst: number;
+}
+
+export interface OpponentRecord {
+  opponent: string;
+  wins: number;
+  losses: number;
+  ties: number;
+  winPct: number | null;
+}
+
+export interface ManagerProfile {
+  manager: string;
+  seasonsPlayed: number;
+  firstSeason: number | null;
+  lastSeason: number | null;
+  wins: number;
+  losses: number;
+  ties: number;
+  winPct: number | null;
+  pointsFor: number;
+  pointsAgainst: number;
+  pointsPerGame: number | null;
+  championships: number[];
+  runnerUps: number[];
+  thirdPlaces: number[];
+  bestSeason: SeasonRecord | null;
+  worstSeason: SeasonRecord | null;
+  bestGame: {
+    score: number;
+    opponent: string;
+    opponentScore: number;
+    season: number;
+    week: number;
+  } | null;
+  // Lowest / highest win percentage against an opponent faced at least 5 times
+  nemesis: OpponentRecord | null;
+  victim: OpponentRecord | null;
+  seasons: SeasonRecord[];
+  headToHead: OpponentRecord[];
+}
+
+export const formatRecord = (record: { wins: number; losses: number; ties: number }): string =>
+  `${record.wins}-${record.losses}${record.ties ? `-${record.ties}` : ""}`;
+
+const loadedProfiles = new Map<string, Promise<ManagerProfile>>();
+
+// Load one manager's profile; each profile is its own chunk, fetched once
+export const loadManagerProfile = (manager: string): Promise<ManagerProfile> =>
+  loadOnce(loadedProfiles, manager, () => import(`../data/managers/${manager}.json`));
@@ -0,0 +1,49 @@
+// Types and on-demand loading for the per-season power rankings
+// files generated by scripts/convert_power_rankings_to_json.py
+
+import { loadOnce } from "./loadOnce";
+
+export interface ManagerRanking {
+  manager: string;
+  recordRank: number;
+  pointsRank: number;
+  breakdownRank: number;
+  totalRank: number;
+  wins: number;
+  losses: number;
+  ties: number;
+  totalPoints: number;
+  theoreticalWins: number;
+  theoreticalLosses: number;
+  theoreticalTies: number;
+  // Recent-form metrics, only present when generated with --form
+  recentPoints?: number;
+  recentPointsRank?: number;
+  ewmaAllPlayPct?: number;
+  streak?: number;
+}
+
+// Final week ranking with places gained (+) or lost (-) since the previous
+// week; null for a manager who wasn't ranked the previous week
+export interface FinalRanking extends ManagerRanking {
+  movement: number | null;
+}
+
+// One Recharts point per week: { week, [manager]: totalRank }
+export type ChartPoint = { week: number } & Record<string, number>;
+
+// Season file: finalRankings and chartData are precomputed so the page
+// can render them as-is
+export interface PowerRankingSeason {
+  managers: string[];
+  weeks: number[];
+  finalWeek: number;
+  finalRankings: FinalRanking[];
+  chartData: ChartPoint[];
+}
+
+const loadedSeasons = new Map<number, Promise<PowerRankingSeason>>();
+
+// Load one season's rankings; each season is its own chunk, fetched once
+export const loadPowerRankingSeason = (season: number): Promise<PowerRankingSeason> =>
+  loadOnce(loadedSeasons, season, () => import(`../data/powerRankings/${season}.json`));
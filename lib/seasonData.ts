@@ -0,0 +1,45 @@
+// Types and on-demand loading for the per-season standings and schedule
+// files generated by scripts/standings_schedule.py
+
+import { loadOnce } from "./loadOnce";
+
+export interface StandingsRow {
+  place: number;
+  manager: string;
+  teamName: string;
+  wins: number;
+  losses: number;
+  ties: number;
+  winPct: number;
+  pointsFor: number;
+  pointsAgainst: number;
+}
+
+export interface SeasonStandings {
+  season: number;
+  standings: StandingsRow[];
+}
+
+export interface ScheduledGame {
+  home: string;
+  away: string;
+  homeScore: number;
+  awayScore: number;
+  // null for a tie
+  winner: string | null;
+}
+
+export interface SeasonSchedule {
+  season: number;
+  weeks: { week: number; games: ScheduledGame[] }[];
+}
+
+const loadedStandings = new Map<number, Promise<SeasonStandings>>();
+const loadedSchedules = new Map<number, Promise<SeasonSchedule>>();
+
+// Each season is its own chunk, so only the viewed season is downloaded
+export const loadSeasonStandings = (season: number): Promise<SeasonStandings> =>
+  loadOnce(loadedStandings, season, () => import(`../data/standings/${season}.json`));
+
+export const loadSeasonSchedule = (season: number): Promise<SeasonSchedule> =>
+  loadOnce(loadedSchedules, season, () => import(`../data/schedule/${season}.json`));
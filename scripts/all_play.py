@@ -0,0 +1,62 @@
+"""
+All-play (breakdown) records: every manager's score against every other score that week
+
+Tie semantics match the power rankings' theoretical record:
+- a higher score is a theoretical win, a lower score a theoretical loss
+- an equal score is a theoretical tie (a manager is never compared with themselves)
+
+Scores are sorted once; each manager's record then comes from their run of
+equal scores in the sorted order (everyone before the run is beaten, everyone
+after it wins, everyone else in the run ties). That is O(N log N) per week,
+for any league size, instead of comparing every pair.
+"""
+from typing import Dict, List, Sequence, Tuple
+
+def all_play_records(scores: Sequence[float]) -> List[Tuple[int, int, int]]:
+    """
+    Calculate (wins, losses, ties) for each score against all the other scores
+
+    Returns one tuple per input score, in input order.
+    """
+    num_scores = len(scores)
+    order = sorted(range(num_scores), key=scores.__getitem__)
+    records = [(0, 0, 0)] * num_scores
+
+    run_start = 0
+    while run_start < num_scores:
+        # Find the run of equal scores starting at run_start
+        run_end = run_start + 1
+        while run_end < num_scores and scores[order[run_end]] == scores[order[run_start]]:
+            run_end += 1
+
+        record = (run_start, num_scores - run_end, run_end - run_start - 1)
+        for position in range(run_start, run_end):
+            records[order[position]] = record
+
+        run_start = run_end
+
+    return records
+
+def calculate_weekly_all_play(week_scores: Dict[str, float]) -> Tuple[Dict[str, int], Dict[str, int], Dict[str, int]]:
+    """
+    Calculate each manager's all-play (theoretical) record for one week
+
+    Returns (wins, losses, ties) dicts keyed by manager.
+    """
+    managers = list(week_scores.keys())
+    records = all_play_records([week_scores[manager] for manager in managers])
+
+    wins = {}
+    losses = {}
+    ties = {}
+    for manager, (manager_wins, manager_losses, manager_ties) in zip(managers, records):
+        wins[manager] = manager_wins
+        losses[manager] = manager_losses
+        ties[manager] = manager_ties
+
+    return wins, losses, ties
+
+def all_play_win_percentage(wins: int, losses: int, ties: int) -> float:
+    """All-play winning percentage with ties counted as half a win"""
+    games = wins + losses + ties
+    return (wins + 0.5 * ties) / games if games > 0 else 0.0
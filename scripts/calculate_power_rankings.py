@@ -12,22 +12,38 @@ Usage:
     python calculate_power_rankings.py <season>    # Process single season
     python calculate_power_rankings.py --all        # Process all available seasons
     python calculate_power_rankings.py -a           # Process all available seasons
+    python calculate_power_rankings.py --all --jobs 4   # Calculate seasons in 4 worker processes
+    python calculate_power_rankings.py --all --json     # Also write the website JSON directly
+    python calculate_power_rankings.py --all --json --no-csv  # Website JSON only, no CSV files
+    python calculate_power_rankings.py --all --json --format rows  # Row-per-manager JSON instead of compact
+    python calculate_power_rankings.py --all --form     # Add recent-form columns (CSV and JSON)
 
 Output:
     For each season, generates:
     - power_rankings_YYYY.csv (detailed data)
     - power_rankings_YYYY_summary.csv (weekly summary format)
+    With --json, also generates ../data/powerRankings/ (season index and one
+    JSON file per season) from the in-memory results - the same files
+    convert_power_rankings_to_json.py builds from the CSVs.
 """
 import json
 import csv
 from pathlib import Path
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Tuple
 
+from all_play import calculate_weekly_all_play
+from form_metrics import calculate_form_metrics
+from convert_power_rankings_to_json import FORMATS, rankings_to_season_json, write_power_rankings_files
+
 SCRIPT_DIR = Path(__file__).parent
 DATA_DIR = SCRIPT_DIR / "data"
 OUTPUT_DIR = SCRIPT_DIR.parent / "data"
 
+# Optional CSV columns written when recent-form metrics are calculated
+FORM_COLUMNS = ['Recent Points', 'Recent Points Rank', 'EWMA All-Play Pct', 'Streak']
+
 # Manager name mapping: ESPN display name -> First name
 MANAGER_MAPPING = {
     'benhkline': 'Ben',
@@ -126,25 +142,28 @@ def calculate_rank_with_ties(values: List[Tuple[float, str]], total_teams: int)
     
     return ranks
 
-def calculate_power_rankings(season: int) -> List[Dict]:
-    """
-    Calculate power rankings for a season, week by week
-    Returns list of week data with rankings
-    """
-    # Load ESPN data
+def load_all_seasons() -> Dict[int, Dict]:
+    """Load all scraped season data (parses espn_all_seasons.json once)"""
     all_seasons_file = DATA_DIR / "espn_all_seasons.json"
     if not all_seasons_file.exists():
         print(f"Error: {all_seasons_file} not found")
-        return []
+        return {}
     
     with open(all_seasons_file, 'r') as f:
         all_data = json.load(f)
     
-    season_data = all_data.get(str(season))
-    if not season_data:
-        print(f"Error: Season {season} not found in data")
-        return []
+    # Convert string keys to int
+    return {int(k): v for k, v in all_data.items()}
+
+def collect_season_weeks(season_data: Dict) -> List[Dict]:
+    """
+    Resolve a season's valid regular season games into one entry per week
     
+    Each entry is {week, scores, opponents, results} where scores maps
+    manager -> points that week, opponents maps manager -> opponent and
+    results maps manager -> 'W', 'L', 'T' (or None if ESPN recorded no winner).
+    A week with no valid games has empty dicts.
+    """
     matchups = season_data.get('matchups', [])
     has_matchup_type = any(m.get('matchup_type') is not None for m in matchups[:10])
     
@@ -155,24 +174,14 @@ def calculate_power_rankings(season: int) -> List[Dict]:
         if week > 0:
             matchups_by_week[week].append(matchup)
     
-    # Track cumulative stats
-    wins = defaultdict(int)
-    losses = defaultdict(int)
-    ties = defaultdict(int)
-    total_points = defaultdict(float)
-    
-    # Track weekly scores for theoretical record calculation
-    weekly_scores = defaultdict(dict)  # week -> manager -> score
-    
-    power_rankings = []
-    
-    # Process each week
+    season_weeks = []
     for week in sorted(matchups_by_week.keys()):
         week_matchups = matchups_by_week[week]
         valid_matchups = get_valid_regular_season_matchups(week_matchups, week, has_matchup_type)
         
-        # Get all managers and their scores for this week
         week_scores = {}  # manager -> score
+        opponents = {}  # manager -> opponent
+        results = {}  # manager -> 'W' / 'L' / 'T' / None
         
         for matchup in valid_matchups:
             home_mgr = matchup.get('home_manager', '')
@@ -189,75 +198,90 @@ def calculate_power_rankings(season: int) -> List[Dict]:
             home_first = extract_first_name(home_mgr)
             away_first = extract_first_name(away_mgr)
             
-            # Store weekly scores
             week_scores[home_first] = home_score
             week_scores[away_first] = away_score
-            weekly_scores[week][home_first] = home_score
-            weekly_scores[week][away_first] = away_score
+            opponents[home_first] = away_first
+            opponents[away_first] = home_first
             
-            # Update cumulative points
-            total_points[home_first] += home_score
-            total_points[away_first] += away_score
-            
-            # Update record
             is_tie = (home_score == away_score and home_score > 0)
             if is_tie:
-                ties[home_first] += 1
-                ties[away_first] += 1
+                results[home_first] = 'T'
+                results[away_first] = 'T'
             elif winner_id:
-                if winner_id == matchup.get('home_team_id'):
-                    wins[home_first] += 1
-                    losses[away_first] += 1
-                else:
-                    wins[away_first] += 1
-                    losses[home_first] += 1
-        
-        # Calculate theoretical record for this week
-        # For each manager, compare their score against all other managers' scores
-        theoretical_wins = defaultdict(int)
-        theoretical_losses = defaultdict(int)
-        theoretical_ties = defaultdict(int)
+                home_won = winner_id == matchup.get('home_team_id')
+                results[home_first] = 'W' if home_won else 'L'
+                results[away_first] = 'L' if home_won else 'W'
+            else:
+                results[home_first] = None
+                results[away_first] = None
         
-        managers_this_week = list(week_scores.keys())
-        for manager in managers_this_week:
-            manager_score = week_scores[manager]
-            for opponent in managers_this_week:
-                if manager == opponent:
-                    continue
-                opponent_score = week_scores[opponent]
-                if manager_score > opponent_score:
-                    theoretical_wins[manager] += 1
-                elif manager_score < opponent_score:
-                    theoretical_losses[manager] += 1
-                else:
-                    theoretical_ties[manager] += 1
+        season_weeks.append({
+            'week': week,
+            'scores': week_scores,
+            'opponents': opponents,
+            'results': results,
+        })
+    
+    return season_weeks
+
+def calculate_power_rankings(season: int, season_data: Dict = None, include_form: bool = False) -> List[Dict]:
+    """
+    Calculate power rankings for a season, week by week
+    Returns list of week data with rankings
+    
+    Pass season_data (one season from load_all_seasons) to avoid re-reading
+    the scraped data file; otherwise it is loaded for this season alone.
+    With include_form, each ranking also gets the recent-form metrics from
+    form_metrics.py: recent_points (last 3 weeks), recent_points_rank,
+    ewma_all_play_pct and streak.
+    """
+    if season_data is None:
+        season_data = load_all_seasons().get(season)
+    if not season_data:
+        print(f"Error: Season {season} not found in data")
+        return []
+    
+    # Track cumulative stats
+    wins = defaultdict(int)
+    losses = defaultdict(int)
+    ties = defaultdict(int)
+    total_points = defaultdict(float)
+    
+    # Track cumulative theoretical (all-play) record, updated once per week
+    cum_theoretical_wins = defaultdict(int)
+    cum_theoretical_losses = defaultdict(int)
+    cum_theoretical_ties = defaultdict(int)
+    
+    power_rankings = []
+    
+    season_weeks = collect_season_weeks(season_data)
+    form = calculate_form_metrics(season_weeks) if include_form else None
+    
+    # Process each week
+    for week_index, season_week in enumerate(season_weeks):
+        week = season_week['week']
+        week_scores = season_week['scores']
         
-        # Calculate cumulative theoretical record up to this week
-        cum_theoretical_wins = defaultdict(int)
-        cum_theoretical_losses = defaultdict(int)
-        cum_theoretical_ties = defaultdict(int)
+        # Update cumulative points and record
+        for manager, score in week_scores.items():
+            total_points[manager] += score
+            result = season_week['results'][manager]
+            if result == 'W':
+                wins[manager] += 1
+            elif result == 'L':
+                losses[manager] += 1
+            elif result == 'T':
+                ties[manager] += 1
         
-        for w in range(1, week + 1):
-            if w in weekly_scores:
-                week_mgrs = list(weekly_scores[w].keys())
-                for manager in week_mgrs:
-                    manager_score = weekly_scores[w][manager]
-                    for opponent in week_mgrs:
-                        if manager == opponent:
-                            continue
-                        opponent_score = weekly_scores[w][opponent]
-                        if manager_score > opponent_score:
-                            cum_theoretical_wins[manager] += 1
-                        elif manager_score < opponent_score:
-                            cum_theoretical_losses[manager] += 1
-                        else:
-                            cum_theoretical_ties[manager] += 1
+        # Fold this week's all-play (theoretical) record into the running season totals
+        week_wins, week_losses, week_ties = calculate_weekly_all_play(week_scores)
+        for manager in week_scores:
+            cum_theoretical_wins[manager] += week_wins[manager]
+            cum_theoretical_losses[manager] += week_losses[manager]
+            cum_theoretical_ties[manager] += week_ties[manager]
         
         # Get all managers who have played
-        all_managers = set()
-        all_managers.update(wins.keys())
-        all_managers.update(losses.keys())
-        all_managers.update(total_points.keys())
+        all_managers = set(total_points.keys())
         
         if not all_managers:
             continue
@@ -280,6 +304,12 @@ def calculate_power_rankings(season: int) -> List[Dict]:
         breakdown_values = [(cum_theoretical_wins[manager], manager) for manager in all_managers]
         breakdown_ranks = calculate_rank_with_ties(breakdown_values, num_teams)
         
+        # 4. Optional recent-form rank (points over the last few weeks), not part of the total
+        if form is not None:
+            week_form = form[week_index]
+            recent_values = [(week_form[manager]['recent_points'], manager) for manager in all_managers]
+            recent_ranks = calculate_rank_with_ties(recent_values, num_teams)
+        
         # Calculate totals and create week ranking
         week_rankings = []
         for manager in all_managers:
@@ -304,6 +334,14 @@ def calculate_power_rankings(season: int) -> List[Dict]:
                 'theoretical_losses': cum_theoretical_losses[manager],
                 'theoretical_ties': cum_theoretical_ties[manager],
             })
+            
+            if form is not None:
+                week_rankings[-1].update({
+                    'recent_points': week_form[manager]['recent_points'],
+                    'recent_points_rank': recent_ranks[manager],
+                    'ewma_all_play_pct': week_form[manager]['ewma_all_play_pct'],
+                    'streak': week_form[manager]['streak'],
+                })
         
         # Sort by total rank (higher is better in Matt's system)
         week_rankings.sort(key=lambda x: x['total_rank'], reverse=True)
@@ -326,16 +364,22 @@ def export_to_csv(rankings: List[Dict], season: int, output_file: Path):
     with open(output_file, 'w', newline='') as f:
         writer = csv.writer(f)
         
+        # Recent-form columns are only written when they were calculated
+        include_form = 'recent_points' in rankings[0]
+        
         # Write header
-        writer.writerow(['Week', 'Manager', 'Record Rank', 'Points Rank', 'Breakdown Rank', 
-                        'Total Rank', 'Wins', 'Losses', 'Ties', 'Total Points',
-                        'Theoretical Wins', 'Theoretical Losses', 'Theoretical Ties'])
+        header = ['Week', 'Manager', 'Record Rank', 'Points Rank', 'Breakdown Rank', 
+                  'Total Rank', 'Wins', 'Losses', 'Ties', 'Total Points',
+                  'Theoretical Wins', 'Theoretical Losses', 'Theoretical Ties']
+        if include_form:
+            header += FORM_COLUMNS
+        writer.writerow(header)
         
         # Write data by week
         for week in sorted(by_week.keys()):
             week_data = by_week[week]
             for ranking in week_data:
-                writer.writerow([
+                row = [
                     ranking['week'],
                     ranking['manager'],
                     ranking['record_rank'],
@@ -349,7 +393,15 @@ def export_to_csv(rankings: List[Dict], season: int, output_file: Path):
                     ranking['theoretical_wins'],
                     ranking['theoretical_losses'],
                     ranking['theoretical_ties'],
-                ])
+                ]
+                if include_form:
+                    row += [
+                        f"{ranking['recent_points']:.2f}",
+                        ranking['recent_points_rank'],
+                        f"{ranking['ewma_all_play_pct']:.4f}",
+                        ranking['streak'],
+                    ]
+                writer.writerow(row)
     
     print(f"Exported power rankings to {output_file}")
 
@@ -388,47 +440,76 @@ def export_weekly_summary(rankings: List[Dict], season: int, output_file: Path):
     
     print(f"Exported weekly summary to {output_file}")
 
-def get_available_seasons() -> List[int]:
+def get_available_seasons(all_data: Dict[int, Dict] = None) -> List[int]:
     """Get list of all available seasons from the scraped data"""
-    all_seasons_file = DATA_DIR / "espn_all_seasons.json"
-    if not all_seasons_file.exists():
-        print(f"Error: {all_seasons_file} not found")
-        return []
-    
-    with open(all_seasons_file, 'r') as f:
-        all_data = json.load(f)
+    if all_data is None:
+        all_data = load_all_seasons()
     
     # Get all season years and sort them
-    seasons = sorted([int(k) for k in all_data.keys()])
+    seasons = sorted(all_data.keys())
     return seasons
 
-def process_single_season(season: int) -> bool:
+def calculate_power_rankings_batch(all_data: Dict[int, Dict], seasons: List[int] = None, jobs: int = 1,
+                                   include_form: bool = False) -> Dict[int, List[Dict]]:
+    """
+    Calculate power rankings for many seasons from data that is already loaded
+    
+    Each worker only receives its own season's slice of all_data. With
+    jobs > 1 the seasons are calculated in parallel worker processes.
+    Returns rankings keyed by season, in season order.
+    """
+    if seasons is None:
+        seasons = get_available_seasons(all_data)
+    season_slices = [all_data.get(season) for season in seasons]
+    form_flags = [include_form] * len(seasons)
+    
+    if jobs <= 1 or len(seasons) <= 1:
+        results = map(calculate_power_rankings, seasons, season_slices, form_flags)
+        return dict(zip(seasons, results))
+    
+    with ProcessPoolExecutor(max_workers=min(jobs, len(seasons))) as executor:
+        results = executor.map(calculate_power_rankings, seasons, season_slices, form_flags)
+        return dict(zip(seasons, results))
+
+def process_single_season(season: int, rankings: List[Dict] = None, write_csv: bool = True,
+                          include_form: bool = False) -> bool:
     """Process power rankings for a single season"""
     print(f"\n{'='*60}")
     print(f"Calculating power rankings for {season}...")
     print(f"{'='*60}")
     
-    rankings = calculate_power_rankings(season)
+    if rankings is None:
+        rankings = calculate_power_rankings(season, include_form=include_form)
     
     if not rankings:
         print(f"⚠ No rankings calculated for {season}. Skipping.")
         return False
     
-    # Export to CSV
-    csv_file = OUTPUT_DIR / f"power_rankings_{season}.csv"
-    export_to_csv(rankings, season, csv_file)
-    
-    # Export weekly summary
-    summary_file = OUTPUT_DIR / f"power_rankings_{season}_summary.csv"
-    export_weekly_summary(rankings, season, summary_file)
+    if write_csv:
+        # Export to CSV
+        csv_file = OUTPUT_DIR / f"power_rankings_{season}.csv"
+        export_to_csv(rankings, season, csv_file)
+        
+        # Export weekly summary
+        summary_file = OUTPUT_DIR / f"power_rankings_{season}_summary.csv"
+        export_weekly_summary(rankings, season, summary_file)
     
     weeks = len(set(r['week'] for r in rankings))
     print(f"✓ Completed {season}: {weeks} weeks, {len(rankings)} total rankings")
     return True
 
-def process_all_seasons():
-    """Process power rankings for all available seasons"""
-    seasons = get_available_seasons()
+def process_all_seasons(jobs: int = 1, write_csv: bool = True, write_json: bool = False,
+                        json_format: str = "compact", include_form: bool = False):
+    """
+    Process power rankings for all available seasons
+    
+    write_json emits the website's power rankings JSON directly from the
+    in-memory rankings, without going through the CSV files. json_format
+    is 'compact' or 'rows' (see convert_power_rankings_to_json.py).
+    """
+    # Parse the scraped data once and hand each season its own slice
+    all_data = load_all_seasons()
+    seasons = get_available_seasons(all_data)
     
     if not seasons:
         print("No seasons found in data. Make sure espn_all_seasons.json exists.")
@@ -442,12 +523,23 @@ def process_all_seasons():
     successful = 0
     failed = 0
     
+    all_rankings = calculate_power_rankings_batch(all_data, seasons, jobs, include_form)
+    
     for season in seasons:
-        if process_single_season(season):
+        if process_single_season(season, all_rankings[season], write_csv):
             successful += 1
         else:
             failed += 1
     
+    if write_json:
+        season_json = {
+            season: rankings_to_season_json(rankings)
+            for season, rankings in all_rankings.items()
+            if rankings
+        }
+        if season_json:
+            write_power_rankings_files(season_json, source="power rankings engine", output_format=json_format)
+    
     print(f"\n{'='*60}")
     print(f"Batch Processing Complete!")
     print(f"✓ Successful: {successful} seasons")
@@ -456,21 +548,61 @@ def process_all_seasons():
     print(f"{'='*60}")
 
 def main():
+    import os
     import sys
     
+    args = sys.argv[1:]
+    
+    # --jobs N calculates seasons in N worker processes (0 = one per CPU)
+    jobs = 1
+    if '--jobs' in args:
+        index = args.index('--jobs')
+        try:
+            jobs = int(args[index + 1])
+        except (IndexError, ValueError):
+            jobs = -1
+        if jobs < 0:
+            print("Error: --jobs requires a number, e.g. --jobs 4")
+            sys.exit(1)
+        if jobs == 0:
+            jobs = os.cpu_count() or 1
+        del args[index:index + 2]
+    
+    # --format compact|rows picks the website JSON layout (default compact)
+    json_format = "compact"
+    if '--format' in args:
+        index = args.index('--format')
+        json_format = args[index + 1] if index + 1 < len(args) else None
+        if json_format not in FORMATS:
+            print(f"Error: --format must be one of: {', '.join(FORMATS)}")
+            sys.exit(1)
+        del args[index:index + 2]
+    
+    # --json writes the website JSON directly, --no-csv skips the CSV exports,
+    # --form adds the recent-form columns to both
+    write_json = '--json' in args
+    write_csv = '--no-csv' not in args
+    include_form = '--form' in args
+    args = [arg for arg in args if arg not in ('--json', '--no-csv', '--form')]
+    
     # Check for --all flag or if no argument provided
-    if len(sys.argv) < 2 or '--all' in sys.argv or '-a' in sys.argv:
-        process_all_seasons()
+    if not args or '--all' in args or '-a' in args:
+        process_all_seasons(jobs, write_csv, write_json, json_format, include_form)
         return
     
+    if write_json:
+        print("Note: --json needs all seasons (use --all); skipping website JSON")
+    
     # Single season mode
     try:
-        season = int(sys.argv[1])
-        process_single_season(season)
+        season = int(args[0])
+        process_single_season(season, write_csv=write_csv, include_form=include_form)
     except ValueError:
         print("Error: Season must be a number")
         print("Usage: python calculate_power_rankings.py <season>")
         print("       python calculate_power_rankings.py --all  (process all seasons)")
+        print("       python calculate_power_rankings.py --all --jobs 4  (seasons in parallel)")
+        print("       python calculate_power_rankings.py --all --json --no-csv  (website JSON only)")
         print("Example: python calculate_power_rankings.py 2024")
         sys.exit(1)
 
@@ -9,7 +9,9 @@ Usage:
 import json
 import re
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict
+
+from playoff_bracket import build_bracket
 
 # Paths
 SCRIPT_DIR = Path(__file__).parent
@@ -143,8 +145,15 @@ def build_manager_mapping(espn_data: Dict[int, Dict]) -> Dict[str, str]:
     return mapping
 
 
-def extract_playoff_results(espn_data: Dict, season: int, return_debug: bool = False) -> Dict:
-    """Extract playoff results from ESPN data"""
+def extract_playoff_results(espn_data: Dict, season: int) -> Dict:
+    """
+    Extract playoff and regular season results from ESPN data
+
+    Champion, runner-up and third place come from the bracket rebuilt by
+    playoff_bracket.build_bracket, whose rounds are returned as
+    playoffRounds; the regular season champ and most points come from the
+    standings.
+    """
     season_data = espn_data.get(season, {})
     if not season_data:
         return {}
@@ -165,335 +174,27 @@ def extract_playoff_results(espn_data: Dict, season: int, return_debug: bool = F
         most_points = max(standings, key=lambda x: x.get('points_for', 0))
         results['regularSeasonMostPoints'] = most_points.get('manager')
     
-    # Try to get from playoff_results first
-    playoff_data = season_data.get('playoff_results', {})
-    if playoff_data and isinstance(playoff_data, dict):
-        # ESPN playoff bracket structure varies, try common fields
-        # This would need to be adjusted based on actual ESPN bracket structure
-        pass
-    
-    # Fall back to extracting from playoff matchups
-    matchups = season_data.get('matchups', [])
-    
-    # Determine regular season length based on NFL expansion in 2021
-    # Pre-2021: 13 week regular season, playoffs start week 14
-    # 2021+: 14 week regular season, playoffs start week 15
-    if season >= 2021:
-        regular_season_weeks = 14
-    else:
-        regular_season_weeks = 13
-    
-    # Get playoff matchups - use the is_playoff flag from scraper
-    playoff_matchups = [m for m in matchups if m.get('is_playoff', False)]
-    
-    # If no matchups marked as playoff, identify by week number
-    if not playoff_matchups:
-        # Playoffs start after regular season weeks
-        playoff_matchups = [m for m in matchups if m.get('week', 0) > regular_season_weeks]
-    
-    # If still no matchups, try to identify by matchup count (fallback)
-    if not playoff_matchups:
-        all_weeks = [m.get('week', 0) for m in matchups if m.get('week')]
-        if all_weeks:
-            max_week = max(all_weeks)
-            
-            # Count matchups per week to find playoff weeks
-            week_counts = {}
-            for m in matchups:
-                week = m.get('week', 0)
-                week_counts[week] = week_counts.get(week, 0) + 1
-            
-            # Regular season typically has 5 matchups per week (10 teams = 5 games)
-            # Playoffs have fewer (2-4 games depending on round)
-            # Weeks with 4 or fewer matchups are likely playoffs
-            playoff_weeks = [w for w, count in week_counts.items() 
-                           if count <= 4 and w > regular_season_weeks]
-            
-            if playoff_weeks:
-                playoff_matchups = [m for m in matchups if m.get('week', 0) in playoff_weeks]
-    
-    if not playoff_matchups:
-        return results
-    
-    # Find championship game by tracing the bracket
-    if playoff_matchups:
-        # First, deduplicate matchups by team pair and week
-        # ESPN API sometimes returns duplicate matchups
-        seen_matchups = {}
-        unique_matchups = []
-        for matchup in playoff_matchups:
-            week = matchup.get('week', 0)
-            home = matchup.get('home_manager')
-            away = matchup.get('away_manager')
-            # Create a unique key for this matchup
-            key = (week, tuple(sorted([home, away])))
-            
-            if key not in seen_matchups:
-                seen_matchups[key] = matchup
-                unique_matchups.append(matchup)
-            else:
-                # If duplicate, keep the one with higher scores (more likely to be the real game)
-                existing = seen_matchups[key]
-                existing_total = existing.get('home_score', 0) + existing.get('away_score', 0)
-                new_total = matchup.get('home_score', 0) + matchup.get('away_score', 0)
-                if new_total > existing_total:
-                    # Replace with the higher scoring version
-                    idx = unique_matchups.index(existing)
-                    unique_matchups[idx] = matchup
-                    seen_matchups[key] = matchup
-        
-        # Group by week
-        by_week = {}
-        for matchup in unique_matchups:
-            week = matchup.get('week', 0)
-            if week not in by_week:
-                by_week[week] = []
-            by_week[week].append(matchup)
-        
-        if not by_week:
-            return results
-        
-        # Filter out weeks with too many games (likely still has issues)
-        # Normal playoff weeks should have 2-4 games max
-        valid_weeks = {}
-        for week, games in by_week.items():
-            if len(games) <= 10:  # Reasonable threshold
-                valid_weeks[week] = games
-        
-        if not valid_weeks:
-            # Fallback to all weeks if filtering removed everything
-            valid_weeks = by_week
-        
-        # Find the final week (championship week)
-        champ_week = max(valid_weeks.keys())
-        champ_week_games = valid_weeks[champ_week]
-        
-        # Deduplicate championship week games (keep highest scoring version of each matchup)
-        champ_week_deduped = {}
-        for game in champ_week_games:
-            home = game.get('home_manager')
-            away = game.get('away_manager')
-            key = tuple(sorted([home, away]))
-            total_score = game.get('home_score', 0) + game.get('away_score', 0)
-            
-            if key not in champ_week_deduped:
-                champ_week_deduped[key] = game
-            else:
-                # Keep the one with higher total score
-                existing_total = champ_week_deduped[key].get('home_score', 0) + champ_week_deduped[key].get('away_score', 0)
-                if total_score > existing_total:
-                    champ_week_deduped[key] = game
-        
-        champ_week_games = list(champ_week_deduped.values())
-        
-        # Debug: If we still have too many games after deduplication, something is wrong
-        # For a 10-team league, championship week should have 1-2 games max
-        if len(champ_week_games) > 5:
-            # Too many games even after deduplication - might be different playoff structure
-            # Try to filter by looking for games with reasonable scores (not 0-0 ties)
-            champ_week_games = [g for g in champ_week_games 
-                              if (g.get('home_score', 0) + g.get('away_score', 0)) > 50]
-        
-        # Try to identify semifinal winners from the previous week
-        semifinal_winners = set()
-        semifinal_losers = set()
-        if champ_week > min(valid_weeks.keys()):
-            # Look at the week before championship (should be semifinals)
-            prev_week = champ_week - 1
-            if prev_week in valid_weeks:
-                prev_week_games = valid_weeks[prev_week]
-                # Deduplicate previous week games too
-                prev_week_deduped = {}
-                for game in prev_week_games:
-                    home = game.get('home_manager')
-                    away = game.get('away_manager')
-                    key = tuple(sorted([home, away]))
-                    total_score = game.get('home_score', 0) + game.get('away_score', 0)
-                    
-                    if key not in prev_week_deduped:
-                        prev_week_deduped[key] = game
-                    else:
-                        existing_total = prev_week_deduped[key].get('home_score', 0) + prev_week_deduped[key].get('away_score', 0)
-                        if total_score > existing_total:
-                            prev_week_deduped[key] = game
-                
-                # Filter previous week games too if too many
-                prev_week_games_list = list(prev_week_deduped.values())
-                if len(prev_week_games_list) > 5:
-                    # Filter by reasonable scores
-                    prev_week_games_list = [g for g in prev_week_games_list 
-                                          if (g.get('home_score', 0) + g.get('away_score', 0)) > 50]
-                
-                # Find winners and losers of semifinal games
-                # Semifinals should have 2 games (for 4-team playoff) or more
-                for game in prev_week_games_list:
-                    home_score = game.get('home_score', 0)
-                    away_score = game.get('away_score', 0)
-                    if home_score > away_score:
-                        semifinal_winners.add(game.get('home_manager'))
-                        semifinal_losers.add(game.get('away_manager'))
-                    elif away_score > home_score:
-                        semifinal_winners.add(game.get('away_manager'))
-                        semifinal_losers.add(game.get('home_manager'))
-        
-        # If only 1 game in championship week, that's the championship
-        if len(champ_week_games) == 1:
-            champ_game = champ_week_games[0]
-        elif len(champ_week_games) == 2:
-            # Two games: championship and third place
-            # If we found semifinal winners, use them to identify championship game
-            if len(semifinal_winners) == 2:
-                # Championship game should be between the two semifinal winners
-                for game in champ_week_games:
-                    home_mgr = game.get('home_manager')
-                    away_mgr = game.get('away_manager')
-                    if home_mgr in semifinal_winners and away_mgr in semifinal_winners:
-                        champ_game = game
-                        # The other game is third place
-                        third_game = [g for g in champ_week_games if g != champ_game][0]
-                        break
-                else:
-                    # Fallback: use highest combined score
-                    champ_game = max(champ_week_games, key=lambda x: x.get('home_score', 0) + x.get('away_score', 0))
-                    third_game = min(champ_week_games, key=lambda x: x.get('home_score', 0) + x.get('away_score', 0))
-            else:
-                # Fallback: championship is the one with higher combined score
-                champ_game = max(champ_week_games, key=lambda x: x.get('home_score', 0) + x.get('away_score', 0))
-                third_game = min(champ_week_games, key=lambda x: x.get('home_score', 0) + x.get('away_score', 0))
-            
-            # Set third place if we identified it
-            if 'third_game' in locals():
-                if third_game.get('home_score', 0) > third_game.get('away_score', 0):
-                    results['thirdPlace'] = third_game.get('home_manager')
-                else:
-                    results['thirdPlace'] = third_game.get('away_manager')
-        else:
-            # Multiple games - try to find championship using semifinal winners
-            if len(semifinal_winners) == 2:
-                for game in champ_week_games:
-                    home_mgr = game.get('home_manager')
-                    away_mgr = game.get('away_manager')
-                    if home_mgr in semifinal_winners and away_mgr in semifinal_winners:
-                        champ_game = game
-                        break
-                else:
-                    champ_game = max(champ_week_games, key=lambda x: x.get('home_score', 0) + x.get('away_score', 0))
-            else:
-                # Fallback: find the one with highest combined score
-                champ_game = max(champ_week_games, key=lambda x: x.get('home_score', 0) + x.get('away_score', 0))
-        
-        # Set champion and runner-up
-        if champ_game.get('home_score', 0) > champ_game.get('away_score', 0):
-            results['champion'] = champ_game.get('home_manager')
-            results['runnerUp'] = champ_game.get('away_manager')
-        elif champ_game.get('away_score', 0) > champ_game.get('home_score', 0):
-            results['champion'] = champ_game.get('away_manager')
-            results['runnerUp'] = champ_game.get('home_manager')
-        
-        # If we didn't find third place yet, look for it in the final week
-        if not results['thirdPlace'] and len(champ_week_games) >= 2:
-            # First try to use semifinal losers to identify third place game
-            if len(semifinal_losers) == 2:
-                for game in champ_week_games:
-                    if game == champ_game:
-                        continue
-                    home_mgr = game.get('home_manager')
-                    away_mgr = game.get('away_manager')
-                    # Third place game should be between the two semifinal losers
-                    if home_mgr in semifinal_losers and away_mgr in semifinal_losers:
-                        if game.get('home_score', 0) > game.get('away_score', 0):
-                            results['thirdPlace'] = home_mgr
-                        else:
-                            results['thirdPlace'] = away_mgr
-                        break
-            
-            # Fallback: look for any game with different teams than championship
-            if not results['thirdPlace']:
-                for game in champ_week_games:
-                    if game == champ_game:
-                        continue
-                    home_mgr = game.get('home_manager')
-                    away_mgr = game.get('away_manager')
-                    # Make sure it's not the same teams as championship
-                    if (home_mgr != results['champion'] and home_mgr != results['runnerUp'] and
-                        away_mgr != results['champion'] and away_mgr != results['runnerUp']):
-                        # This is likely the third place game
-                        if game.get('home_score', 0) > game.get('away_score', 0):
-                            results['thirdPlace'] = home_mgr
-                        else:
-                            results['thirdPlace'] = away_mgr
-                        break
+    bracket = build_bracket(season, season_data)
+    for field in ('champion', 'runnerUp', 'thirdPlace'):
+        results[field] = bracket[field]
+    results['playoffRounds'] = bracket['rounds']
     
     return results
 
 
-def extract_playoff_results_debug(espn_data: Dict, season: int) -> Tuple[Dict, Dict]:
-    """Extract playoff results with debug info"""
-    results, debug_info = extract_playoff_results(espn_data, season), {}
-    season_data = espn_data.get(season, {})
-    matchups = season_data.get('matchups', [])
-    
-    # Debug: show playoff weeks found
-    playoff_matchups = [m for m in matchups if m.get('is_playoff', False)]
-    all_weeks = sorted(set(m.get('week', 0) for m in matchups))
-    
-    if not playoff_matchups:
-        # Try to identify by week
-        max_week = max(all_weeks) if all_weeks else 0
-        week14_count = len([m for m in matchups if m.get('week') == 14])
-        week13_count = len([m for m in matchups if m.get('week') == 13])
-        
-        if max_week >= 14:
-            if week14_count < week13_count * 0.8:
-                regular_season_weeks = 13
-            else:
-                regular_season_weeks = 14 if max_week >= 15 else 13
-        else:
-            regular_season_weeks = max_week
-        
-        playoff_matchups = [m for m in matchups if m.get('week', 0) > regular_season_weeks]
-    
-    debug_info = {
-        'all_weeks': all_weeks,
-        'playoff_weeks': sorted(set(m.get('week') for m in playoff_matchups)),
-        'playoff_matchup_count': len(playoff_matchups),
-        'regular_season_weeks_estimated': regular_season_weeks if 'regular_season_weeks' in locals() else None,
-    }
-    
-    return results, debug_info
-
-
 def compare_season(season: int, champs_data: Dict, espn_data: Dict, manager_mapping: Dict[str, str]) -> Dict:
     """Compare championship data for a single season"""
     champs = champs_data.get(season, {})
     espn_results = extract_playoff_results(espn_data, season)
     
-    # Get debug info - use the same logic as extract_playoff_results
-    debug_info = {}
+    # Debug info: the playoff rounds the bracket was rebuilt from
     season_data = espn_data.get(season, {})
     matchups = season_data.get('matchups', [])
-    all_weeks = sorted(set(m.get('week', 0) for m in matchups if m.get('week')))
-    
-    # Count matchups marked as playoff
-    playoff_marked = [m for m in matchups if m.get('is_playoff', False)]
-    
-    # If no marked, try to identify playoff weeks by matchup count
-    playoff_weeks_found = []
-    if not playoff_marked:
-        week_counts = {}
-        for m in matchups:
-            week = m.get('week', 0)
-            week_counts[week] = week_counts.get(week, 0) + 1
-        
-        # Find weeks with 4 or fewer matchups (playoff rounds)
-        playoff_weeks_found = [w for w, count in week_counts.items() 
-                              if count <= 4 and w > 10]
-    
+    playoff_rounds = espn_results.get('playoffRounds', [])
     debug_info = {
-        'all_weeks': all_weeks,
-        'playoff_marked_count': len(playoff_marked),
-        'playoff_weeks_marked': sorted(set(m.get('week') for m in playoff_marked)) if playoff_marked else [],
-        'playoff_weeks_detected': playoff_weeks_found,
+        'all_weeks': sorted(set(m.get('week', 0) for m in matchups if m.get('week'))),
+        'playoff_weeks': [playoff_round['round'] for playoff_round in playoff_rounds],
+        'playoff_game_count': sum(len(playoff_round['games']) for playoff_round in playoff_rounds),
     }
     
     if not champs and not espn_results:
@@ -595,12 +296,10 @@ def main():
             # Show debug info for playoff extraction
             if comparison.get('debug_info'):
                 debug = comparison['debug_info']
-                if debug.get('playoff_weeks_marked'):
-                    print(f"  Playoff weeks (marked): {debug['playoff_weeks_marked']}")
-                elif debug.get('playoff_weeks_detected'):
-                    print(f"  Playoff weeks (detected by count): {debug['playoff_weeks_detected']}")
-                if debug.get('playoff_marked_count', 0) > 0:
-                    print(f"  Playoff matchups found: {debug['playoff_marked_count']}")
+                if debug.get('playoff_weeks'):
+                    print(f"  Playoff weeks: {debug['playoff_weeks']} ({debug['playoff_game_count']} games)")
+                else:
+                    print("  No playoff games found in the scraped schedule")
             
             for disc in comparison['discrepancies']:
                 print(f"  {disc['field']}:")
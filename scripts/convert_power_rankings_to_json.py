@@ -1,22 +1,197 @@
 """
 Convert Power Rankings CSV files to JSON format for website
-Reads all power_rankings_YYYY.csv files and creates powerRankings.js
+Reads all power_rankings_YYYY.csv files and creates:
+- powerRankings/index.js: the list of available seasons (small, bundled with the page)
+- powerRankings/YYYY.json: one compact file per season, loaded on demand
+
+Season files are written in one of two formats:
+- compact (default): only the page's ready-to-render data, chartData (one
+  Recharts point per week) and finalRankings (with week-over-week
+  movement), plus the managers and weeks lists (PowerRankingSeason in
+  lib/powerRankings.ts)
+- rows: the same plus a list of weeks, each with one object per manager
+
+Usage:
+    python convert_power_rankings_to_json.py                  # Compact season files
+    python convert_power_rankings_to_json.py --format rows    # Row-per-manager season files
+
+The same JSON can be produced straight from the ranking engine without the
+CSV round trip: python calculate_power_rankings.py --all --json
 """
 import csv
 import json
+from bisect import bisect_left
 from pathlib import Path
 from collections import defaultdict
+from typing import Dict, List
 
 SCRIPT_DIR = Path(__file__).parent
 DATA_DIR = SCRIPT_DIR.parent / "data"
 OUTPUT_DIR = SCRIPT_DIR.parent / "data"
 
-def convert_csv_to_json():
+FORMATS = ('compact', 'rows')
+
+def ranking_to_json(ranking: Dict) -> Dict:
+    """Convert one in-memory ranking row from calculate_power_rankings to website format"""
+    converted = {
+        'manager': ranking['manager'],
+        'recordRank': float(ranking['record_rank']),
+        'pointsRank': float(ranking['points_rank']),
+        'breakdownRank': float(ranking['breakdown_rank']),
+        'totalRank': float(ranking['total_rank']),
+        'wins': int(ranking['wins']),
+        'losses': int(ranking['losses']),
+        'ties': int(ranking['ties']),
+        # Same 2 decimal places as the CSV export
+        'totalPoints': round(ranking['total_points'], 2),
+        'theoreticalWins': int(ranking['theoretical_wins']),
+        'theoreticalLosses': int(ranking['theoretical_losses']),
+        'theoreticalTies': int(ranking['theoretical_ties']),
+    }
+    if 'recent_points' in ranking:
+        converted.update({
+            'recentPoints': round(ranking['recent_points'], 2),
+            'recentPointsRank': float(ranking['recent_points_rank']),
+            'ewmaAllPlayPct': round(ranking['ewma_all_play_pct'], 4),
+            'streak': int(ranking['streak']),
+        })
+    return converted
+
+def _standing_places(managers: List[Dict]) -> Dict[str, int]:
+    """Place in the week's standings: 1 + number of managers with a better total rank"""
+    # Negated so the best total sorts first and bisect counts the better ones
+    negated_totals = sorted(-m['totalRank'] for m in managers)
+    return {m['manager']: 1 + bisect_left(negated_totals, -m['totalRank']) for m in managers}
+
+def build_chart_data(weeks_array: List[Dict]) -> List[Dict]:
+    """One point per week with each manager's totalRank, ready for the Recharts line chart"""
+    chart_data = []
+    for week in weeks_array:
+        point = {'week': week['week']}
+        for manager in week['managers']:
+            point[manager['manager']] = manager['totalRank']
+        chart_data.append(point)
+    return chart_data
+
+def build_final_rankings(weeks_array: List[Dict]) -> List[Dict]:
+    """
+    Final week rankings with each manager's movement since the previous week
+    
+    movement is the number of places gained (positive) or lost (negative),
+    0 in a season's first week, and None for a manager with no previous week.
+    """
+    if not weeks_array:
+        return []
+    
+    final_managers = weeks_array[-1]['managers']
+    final_places = _standing_places(final_managers)
+    previous_places = _standing_places(weeks_array[-2]['managers']) if len(weeks_array) > 1 else final_places
+    
+    final_rankings = []
+    for manager in final_managers:
+        previous_place = previous_places.get(manager['manager'])
+        movement = previous_place - final_places[manager['manager']] if previous_place is not None else None
+        final_rankings.append({**manager, 'movement': movement})
+    return final_rankings
+
+def build_season_json(weeks_data: Dict[int, List[Dict]]) -> Dict:
+    """Build one season's website data from manager rows grouped by week"""
+    # Convert to array format and sort by week
+    weeks_array = []
+    for week in sorted(weeks_data.keys()):
+        # Sort managers by totalRank (descending - higher is better), ties alphabetically
+        managers = sorted(weeks_data[week], key=lambda x: (-x['totalRank'], x['manager']))
+        weeks_array.append({
+            'week': week,
+            'managers': managers
+        })
+    
+    # Get final week rankings
+    final_week = max(weeks_data.keys()) if weeks_data else 0
+    
+    # The page plots chartData and lists finalRankings as-is, with no client-side reshaping
+    return {
+        'weeks': weeks_array,
+        'finalWeek': final_week,
+        'finalRankings': build_final_rankings(weeks_array),
+        'chartData': build_chart_data(weeks_array),
+    }
+
+def rankings_to_season_json(rankings: List[Dict]) -> Dict:
+    """Build one season's website data directly from calculate_power_rankings output"""
+    weeks_data = defaultdict(list)
+    for ranking in rankings:
+        weeks_data[ranking['week']].append(ranking_to_json(ranking))
+    return build_season_json(weeks_data)
+
+def _compact_number(value):
+    """Write whole-number floats (ranks like 8.0) without the trailing .0"""
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+def encode_season_compact(season_data: Dict) -> Dict:
+    """
+    Keep only what the power rankings page renders
+    
+    The per-week manager rows are dropped; finalRankings and chartData
+    already hold everything the page shows, plus the season's managers
+    and weeks.
+    """
+    managers = sorted({m['manager'] for week in season_data['weeks'] for m in week['managers']})
+    return {
+        'managers': managers,
+        'weeks': [week['week'] for week in season_data['weeks']],
+        'finalWeek': season_data['finalWeek'],
+        'finalRankings': [
+            {key: _compact_number(value) for key, value in ranking.items()}
+            for ranking in season_data['finalRankings']
+        ],
+        'chartData': [
+            {key: _compact_number(value) for key, value in point.items()}
+            for point in season_data['chartData']
+        ],
+    }
+
+def write_power_rankings_files(power_rankings: Dict[int, Dict], source: str = "CSV files", output_format: str = "compact"):
+    """
+    Write the season index and one compact JSON file per season
+    
+    The power rankings page only bundles the index and loads a season's
+    file when that season is selected. power_rankings holds row-format
+    season data; output_format 'compact' keeps only what the page renders.
+    """
+    if output_format not in FORMATS:
+        raise ValueError(f"Unknown power rankings format: {output_format}")
+    
+    output_dir = OUTPUT_DIR / "powerRankings"
+    output_dir.mkdir(parents=True, exist_ok=True)
+    
+    for season, season_data in power_rankings.items():
+        if output_format == 'compact':
+            season_data = encode_season_compact(season_data)
+        season_file = output_dir / f"{season}.json"
+        with open(season_file, 'w') as f:
+            json.dump(season_data, f, separators=(',', ':'))
+    
+    seasons = sorted(power_rankings.keys())
+    index_file = output_dir / "index.js"
+    with open(index_file, 'w') as f:
+        f.write("// JBS FFL Power Rankings Seasons\n")
+        f.write(f"// Generated from {source} - Do not edit manually\n")
+        f.write("// Each season's rankings are in powerRankings/YYYY.json\n\n")
+        f.write(f"export const powerRankingSeasons = {json.dumps(seasons)};\n")
+    
+    print(f"\n✓ Converted {len(power_rankings)} seasons to {output_dir}")
+    print(f"  Seasons: {min(seasons)}-{max(seasons)}")
+
+def convert_csv_to_json(output_format: str = "compact"):
     """Convert all power rankings CSV files to JSON format"""
     
     # Find all power rankings CSV files
     csv_files = sorted(DATA_DIR.glob("power_rankings_*.csv"))
-    csv_files = [f for f in csv_files if not f.name.endswith("_summary.csv")]
+    # Only per-season files (power_rankings_YYYY.csv), not summaries or power_rankings_formulas.csv
+    csv_files = [f for f in csv_files if f.stem.split("_")[-1].isdigit()]
     
     if not csv_files:
         print("No power rankings CSV files found")
@@ -51,39 +226,32 @@ def convert_csv_to_json():
                     'theoreticalLosses': int(row['Theoretical Losses']),
                     'theoreticalTies': int(row['Theoretical Ties']),
                 })
+                if row.get('Recent Points'):
+                    weeks_data[week][-1].update({
+                        'recentPoints': float(row['Recent Points']),
+                        'recentPointsRank': float(row['Recent Points Rank']),
+                        'ewmaAllPlayPct': float(row['EWMA All-Play Pct']),
+                        'streak': int(row['Streak']),
+                    })
         
-        # Convert to array format and sort by week
-        weeks_array = []
-        for week in sorted(weeks_data.keys()):
-            # Sort managers by totalRank (descending - higher is better)
-            managers = sorted(weeks_data[week], key=lambda x: x['totalRank'], reverse=True)
-            weeks_array.append({
-                'week': week,
-                'managers': managers
-            })
-        
-        # Get final week rankings
-        final_week = max(weeks_data.keys()) if weeks_data else 0
-        final_rankings = sorted(weeks_data[final_week], key=lambda x: x['totalRank'], reverse=True) if final_week > 0 else []
-        
-        power_rankings[season] = {
-            'weeks': weeks_array,
-            'finalWeek': final_week,
-            'finalRankings': final_rankings
-        }
+        power_rankings[season] = build_season_json(weeks_data)
     
-    # Write to JavaScript file
-    output_file = OUTPUT_DIR / "powerRankings.js"
+    write_power_rankings_files(power_rankings, output_format=output_format)
+
+def main():
+    import sys
     
-    with open(output_file, 'w') as f:
-        f.write("// JBS FFL Power Rankings Data\n")
-        f.write("// Generated from CSV files - Do not edit manually\n\n")
-        f.write("export const powerRankings = ")
-        json.dump(power_rankings, f, indent=2)
-        f.write(";\n")
+    output_format = "compact"
+    if '--format' in sys.argv:
+        try:
+            output_format = sys.argv[sys.argv.index('--format') + 1]
+        except IndexError:
+            output_format = None
+        if output_format not in FORMATS:
+            print(f"Error: --format must be one of: {', '.join(FORMATS)}")
+            sys.exit(1)
     
-    print(f"\n✓ Converted {len(power_rankings)} seasons to {output_file}")
-    print(f"  Seasons: {min(power_rankings.keys())}-{max(power_rankings.keys())}")
+    convert_csv_to_json(output_format)
 
 if __name__ == "__main__":
-    convert_csv_to_json()
+    main()
@@ -0,0 +1,327 @@
+"""
+Elo ratings for every manager over every resolved regular season game
+
+Games are rated in chronological order (season, then week):
+- Expected result: 1 / (1 + 10 ** ((opponent - rating) / 400))
+- Update: rating += K * (result - expected), with a tie as 0.5
+- Between seasons every rating is pulled back toward the starting rating
+  by the regression fraction
+- A manager's first game starts from the starting rating
+
+Each manager plays at most once a week, so a whole week is one set of array
+updates. The games live in flat NumPy arrays, and ratings are a
+configuration x manager matrix, so many K / regression settings are rated
+together in one pass (--sweep).
+
+The rating state is saved after each run with a hash of the games it
+rated. When new weeks are scraped, only those weeks are rated on top of
+the saved state instead of replaying history; if an already rated game
+changed (a corrected score, a filled-in week), history is replayed.
+--rebuild starts over.
+
+Usage:
+    python elo.py                         # Update ratings and write eloHistory.js
+    python elo.py --k 24 --regression 0.3 --rebuild
+    python elo.py --sweep                 # Compare K / regression settings by Brier score
+
+Output:
+    ../data/eloHistory.js
+    cache/elo_state.json (saved rating state for incremental updates)
+"""
+import json
+import time
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from process_data import OUTPUT_DIR, load_all_seasons, resolve_season_games
+from season_cache import CACHE_DIR, hash_season_data
+
+DEFAULT_K = 20.0
+DEFAULT_REGRESSION = 0.25
+INITIAL_RATING = 1500.0
+
+STATE_FILE = CACHE_DIR / "elo_state.json"
+
+SWEEP_K_VALUES = [8, 12, 16, 20, 24, 28, 32, 40, 48, 64]
+SWEEP_REGRESSION_VALUES = [0.0, 0.1, 0.25, 0.4, 0.6]
+
+def build_game_arrays(espn_data: Dict[int, Dict], managers: Sequence[str] = ()) -> Dict:
+    """
+    Flatten every resolved game into chronological NumPy arrays
+
+    managers seeds the manager order (e.g. from a saved state); newcomers are
+    appended in order of their first game. weeks lists (season, week, start,
+    end) slices into the game arrays.
+    """
+    managers = list(managers)
+    index = {manager: i for i, manager in enumerate(managers)}
+
+    home, away, results = [], [], []
+    weeks = []
+    for season in sorted(espn_data.keys()):
+        games = resolve_season_games(season, espn_data[season])
+        for game in games:
+            for manager in (game['home'], game['away']):
+                if manager not in index:
+                    index[manager] = len(managers)
+                    managers.append(manager)
+
+            if not weeks or weeks[-1][:2] != (season, game['week']):
+                weeks.append((season, game['week'], len(home), len(home)))
+            home.append(index[game['home']])
+            away.append(index[game['away']])
+            home_score, away_score = game['home_score'], game['away_score']
+            results.append(1.0 if home_score > away_score else 0.5 if home_score == away_score else 0.0)
+            weeks[-1] = weeks[-1][:3] + (len(home),)
+
+    return {
+        'managers': managers,
+        'home': np.array(home, dtype=np.intp),
+        'away': np.array(away, dtype=np.intp),
+        'results': np.array(results),
+        'weeks': weeks,
+    }
+
+def run_elo(games: Dict, k_values, regression_values, ratings: Optional[np.ndarray] = None,
+            current_season: Optional[int] = None, first_week: int = 0, record_history: bool = False) -> Dict:
+    """
+    Rate games['weeks'][first_week:] for every configuration at once
+
+    k_values and regression_values are equal-length sequences, one entry per
+    configuration. ratings (configuration x manager) and current_season
+    continue from an earlier run; otherwise everyone starts at INITIAL_RATING.
+
+    Returns ratings, the season of the last rated week, games rated,
+    squared error of the predictions per configuration (for Brier scores),
+    and the rating after every week if record_history is set.
+    """
+    k_values = np.asarray(k_values, dtype=float)[:, None]
+    keep = 1.0 - np.asarray(regression_values, dtype=float)[:, None]
+    num_configs = len(k_values)
+    num_managers = len(games['managers'])
+
+    if ratings is None:
+        ratings = np.full((num_configs, num_managers), INITIAL_RATING)
+    elif ratings.shape[1] < num_managers:
+        # Managers new since the saved state start at the initial rating
+        padding = np.full((num_configs, num_managers - ratings.shape[1]), INITIAL_RATING)
+        ratings = np.hstack([ratings, padding])
+    else:
+        ratings = ratings.copy()
+
+    squared_error = np.zeros(num_configs)
+    num_games = 0
+    history = []
+
+    for season, week, start, end in games['weeks'][first_week:]:
+        if current_season is not None and season != current_season:
+            ratings = INITIAL_RATING + keep * (ratings - INITIAL_RATING)
+        current_season = season
+
+        home = games['home'][start:end]
+        away = games['away'][start:end]
+        results = games['results'][start:end]
+
+        expected = 1.0 / (1.0 + 10.0 ** ((ratings[:, away] - ratings[:, home]) / 400.0))
+        squared_error += ((results - expected) ** 2).sum(axis=1)
+        num_games += end - start
+
+        delta = k_values * (results - expected)
+        # add.at so a manager listed twice in one week still gets both updates
+        np.add.at(ratings, (slice(None), home), delta)
+        np.add.at(ratings, (slice(None), away), -delta)
+
+        if record_history:
+            history.append(ratings.copy())
+
+    return {
+        'ratings': ratings,
+        'season': current_season,
+        'games': num_games,
+        'squared_error': squared_error,
+        'history': history,
+    }
+
+def hash_rated_games(games: Dict, num_weeks: int) -> str:
+    """Content hash of the games in the first num_weeks weeks: who played whom, when, and the result"""
+    weeks = games['weeks'][:num_weeks]
+    end = weeks[-1][3] if weeks else 0
+    managers = games['managers']
+    return hash_season_data({
+        'weeks': [[season, week] for season, week, _, _ in weeks],
+        'home': [managers[i] for i in games['home'][:end]],
+        'away': [managers[i] for i in games['away'][:end]],
+        'results': games['results'][:end].tolist(),
+    })
+
+def load_state(k: float, regression: float) -> Optional[Dict]:
+    """Saved state from the last run, if it used the same parameters"""
+    if not STATE_FILE.exists():
+        return None
+    try:
+        with open(STATE_FILE, 'r') as f:
+            state = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    if state.get('k') != k or state.get('regression') != regression:
+        return None
+    return state
+
+def save_state(state: Dict):
+    STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = STATE_FILE.with_suffix('.tmp')
+    with open(tmp_file, 'w') as f:
+        json.dump(state, f, separators=(',', ':'))
+    tmp_file.replace(STATE_FILE)
+
+def update_ratings(espn_data: Dict[int, Dict], k: float, regression: float, rebuild: bool = False) -> Dict:
+    """
+    Bring the saved rating state up to date with the scraped games
+
+    Only weeks after the state's last rated week are rated, unless the games
+    it rated have changed since. Returns the new state: parameters,
+    managers, current ratings, the last rated week, the hash of the rated
+    games and the per-week rating history.
+    """
+    state = None if rebuild else load_state(k, regression)
+    games = build_game_arrays(espn_data, state['managers'] if state else ())
+
+    if state:
+        last = tuple(state['last_week'])
+        first_week = next((i for i, (season, week, _, _) in enumerate(games['weeks']) if (season, week) > last),
+                          len(games['weeks']))
+        if state.get('input_hash') != hash_rated_games(games, first_week):
+            # A rated week was re-scraped with different games: replay history
+            state = None
+            games = build_game_arrays(espn_data)
+
+    if state:
+        ratings = np.array([state['ratings']])
+        current_season = last[0]
+        history = state['history']
+    else:
+        first_week, ratings, current_season, history = 0, None, None, []
+
+    result = run_elo(games, [k], [regression], ratings, current_season, first_week, record_history=True)
+    new_weeks = games['weeks'][first_week:]
+
+    # Managers are numbered in order of their first game, so the first `debuted`
+    # managers are the ones who have played by a given week
+    debuted = len(history[-1]['ratings']) if history else 0
+    for (season, week, start, end), ratings_after in zip(new_weeks, result['history']):
+        debuted = max(debuted, int(games['home'][start:end].max()) + 1, int(games['away'][start:end].max()) + 1)
+        history.append({'season': season, 'week': week, 'ratings': [round(r, 1) for r in ratings_after[0][:debuted]]})
+
+    if games['weeks']:
+        last_week = list(games['weeks'][-1][:2])
+    else:
+        last_week = state['last_week'] if state else None
+    return {
+        'k': k,
+        'regression': regression,
+        'managers': games['managers'],
+        'ratings': result['ratings'][0].tolist(),
+        'last_week': last_week,
+        'input_hash': hash_rated_games(games, len(games['weeks'])),
+        'history': history,
+        'new_weeks': len(new_weeks),
+    }
+
+def summarize_ratings(state: Dict) -> List[Dict]:
+    """Current and peak rating per manager, highest current rating first"""
+    summary = []
+    for i, manager in enumerate(state['managers']):
+        peak = max(state['history'], key=lambda h: h['ratings'][i] if i < len(h['ratings']) else -1)
+        summary.append({
+            'manager': manager,
+            'rating': round(state['ratings'][i], 1),
+            'peak': peak['ratings'][i],
+            'peakSeason': peak['season'],
+            'peakWeek': peak['week'],
+        })
+    summary.sort(key=lambda s: s['rating'], reverse=True)
+    return summary
+
+def write_elo_history(state: Dict, output_file):
+    """Write the rating history in a compact week x manager layout"""
+    num_managers = len(state['managers'])
+    # Older history rows predate later managers; pad them so every row has every manager
+    ratings = [h['ratings'] + [None] * (num_managers - len(h['ratings'])) for h in state['history']]
+
+    with open(output_file, 'w') as f:
+        f.write("// JBS FFL Elo Rating History\n")
+        f.write("// Generated by scripts/elo.py - Do not edit manually\n\n")
+        f.write("export const eloHistory = ")
+        json.dump({
+            'k': state['k'],
+            'regression': state['regression'],
+            'initialRating': INITIAL_RATING,
+            'managers': state['managers'],
+            'weeks': [[h['season'], h['week']] for h in state['history']],
+            'ratings': ratings,
+            'current': summarize_ratings(state),
+        }, f, separators=(',', ':'))
+        f.write(";\n")
+
+def sweep_parameters(espn_data: Dict[int, Dict], k_values: Sequence[float] = SWEEP_K_VALUES,
+                     regression_values: Sequence[float] = SWEEP_REGRESSION_VALUES) -> List[Dict]:
+    """Rate all history under every K / regression pair in one pass; lowest Brier score first"""
+    games = build_game_arrays(espn_data)
+    grid_k = [k for k in k_values for _ in regression_values]
+    grid_regression = [r for _ in k_values for r in regression_values]
+
+    result = run_elo(games, grid_k, grid_regression)
+    brier = result['squared_error'] / max(result['games'], 1)
+    rows = [{'k': k, 'regression': r, 'brier': float(b)} for k, r, b in zip(grid_k, grid_regression, brier)]
+    rows.sort(key=lambda row: row['brier'])
+    return rows
+
+def main():
+    import sys
+
+    args = sys.argv[1:]
+    k = float(args[args.index('--k') + 1]) if '--k' in args else DEFAULT_K
+    regression = float(args[args.index('--regression') + 1]) if '--regression' in args else DEFAULT_REGRESSION
+
+    espn_data = load_all_seasons()
+    if not espn_data:
+        print("❌ No ESPN data found")
+        return
+
+    if '--sweep' in args:
+        print("=" * 70)
+        print("Elo Parameter Sweep")
+        print("=" * 70)
+        start = time.perf_counter()
+        rows = sweep_parameters(espn_data)
+        elapsed = time.perf_counter() - start
+        print(f"✓ Rated {len(rows)} configurations in {elapsed * 1000:.1f}ms "
+              f"({elapsed * 1000 / len(rows):.2f}ms each, including loading games)")
+        print(f"\n{'K':>6} {'Regression':>11} {'Brier':>8}")
+        for row in rows[:10]:
+            print(f"{row['k']:>6g} {row['regression']:>11.2f} {row['brier']:>8.4f}")
+        return
+
+    print("=" * 70)
+    print(f"Elo Ratings (K={k:g}, regression={regression:g})")
+    print("=" * 70)
+
+    start = time.perf_counter()
+    state = update_ratings(espn_data, k, regression, rebuild='--rebuild' in args)
+    elapsed = time.perf_counter() - start
+    print(f"✓ Rated {state['new_weeks']} new weeks in {elapsed * 1000:.1f}ms "
+          f"({len(state['history'])} weeks of history)")
+
+    new_weeks = state.pop('new_weeks')
+    save_state(state)
+
+    for s in summarize_ratings(state):
+        print(f"  {s['manager']:<10} {s['rating']:>7.1f}  (peak {s['peak']:.1f}, {s['peakSeason']} week {s['peakWeek']})")
+
+    output_file = OUTPUT_DIR / "eloHistory.js"
+    write_elo_history(state, output_file)
+    print(f"\n✓ Saved Elo history to {output_file}" + ("" if new_weeks else " (no new weeks)"))
+
+if __name__ == "__main__":
+    main()
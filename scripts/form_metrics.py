@@ -0,0 +1,78 @@
+"""
+Recent-form metrics for power rankings, updated in O(1) per manager per week
+
+- Rolling points: points scored over the last `window` weeks. A running
+  sum adds the newest week and drops the week that left the window.
+- EWMA all-play percentage: exponentially weighted all-play win percentage,
+  ewma = alpha * this week + (1 - alpha) * previous ewma.
+- Streak: current run of results, +N for N straight wins, -N for N straight
+  losses, 0 after a tie.
+
+A manager who doesn't play a week keeps their EWMA and streak unchanged and
+adds 0 points to the rolling window.
+"""
+from collections import defaultdict
+from typing import Dict, List
+
+from all_play import all_play_win_percentage, calculate_weekly_all_play
+
+DEFAULT_WINDOW = 3
+DEFAULT_ALPHA = 0.5
+
+def rolling_sums(weekly_values: List[Dict[str, float]], window: int = DEFAULT_WINDOW) -> List[Dict[str, float]]:
+    """
+    Sum of each manager's last `window` weekly values, for every week
+
+    weekly_values holds one {manager: value} dict per week; a manager missing
+    from a week counts as 0 that week. Returned dicts include every manager
+    seen so far.
+    """
+    running = defaultdict(float)
+    result = []
+    for w, week_values in enumerate(weekly_values):
+        for manager, value in week_values.items():
+            running[manager] += value
+        if w >= window:
+            for manager, value in weekly_values[w - window].items():
+                running[manager] -= value
+        result.append(dict(running))
+    return result
+
+def calculate_form_metrics(season_weeks: List[Dict], window: int = DEFAULT_WINDOW,
+                           alpha: float = DEFAULT_ALPHA) -> List[Dict[str, Dict]]:
+    """
+    Calculate recent-form metrics week by week from collect_season_weeks output
+
+    Returns one dict per week mapping manager -> {recent_points,
+    ewma_all_play_pct, streak} for every manager seen so far.
+    """
+    recent_points = rolling_sums([season_week['scores'] for season_week in season_weeks], window)
+
+    ewma = {}
+    streak = defaultdict(int)
+    form = []
+    for w, season_week in enumerate(season_weeks):
+        week_scores = season_week['scores']
+        week_wins, week_losses, week_ties = calculate_weekly_all_play(week_scores)
+        for manager in week_scores:
+            week_pct = all_play_win_percentage(week_wins[manager], week_losses[manager], week_ties[manager])
+            ewma[manager] = week_pct if manager not in ewma else alpha * week_pct + (1 - alpha) * ewma[manager]
+
+            result = season_week['results'].get(manager)
+            if result == 'W':
+                streak[manager] = streak[manager] + 1 if streak[manager] > 0 else 1
+            elif result == 'L':
+                streak[manager] = streak[manager] - 1 if streak[manager] < 0 else -1
+            elif result == 'T':
+                streak[manager] = 0
+
+        form.append({
+            manager: {
+                # Rounded so the running sum's float drift can't break exact ties
+                'recent_points': round(recent_points[w][manager], 2),
+                'ewma_all_play_pct': ewma.get(manager, 0.0),
+                'streak': streak[manager],
+            }
+            for manager in recent_points[w]
+        })
+    return form
@@ -0,0 +1,20 @@
+"""
+League format shared by the scraper and the data processing scripts
+
+Kept free of other imports so the scraper doesn't pull in the processing
+modules.
+"""
+
+# League playoff format: 6 teams, the top 2 seeds get a first round bye
+PLAYOFF_TEAMS = 6
+BYE_TEAMS = 2
+
+def get_regular_season_weeks(season: int) -> int:
+    """
+    Regular season length
+
+    NFL expanded regular season from 16 to 17 games in 2021, so the fantasy
+    regular season went from 13 to 14 weeks. ESPN's matchupPeriodCount
+    setting doesn't always reflect this, so it's based on season.
+    """
+    return 14 if season >= 2021 else 13
@@ -0,0 +1,180 @@
+"""
+Career profiles for every manager
+
+Built in one pass over each manager's chronological game log (the resolved
+regular season games from process_data.py), plus champions.js:
+- Seasons played, total W/L/T, points for and against
+- Per-season records, with the best and worst season
+  (win percentage, then points for)
+- Championships, runner-up and third place finishes
+- Best single game
+- Head-to-head record against every opponent, with the nemesis (lowest
+  win percentage against) and the victim (highest), over at least
+  MIN_RIVALRY_GAMES games
+
+Each profile is its own small JSON file so a profile page only loads its own
+manager. index.js lists every manager with a few headline numbers.
+
+Usage:
+    python manager_profiles.py
+
+Output:
+    ../data/managers/<Manager>.json
+    ../data/managers/index.js
+"""
+import json
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from process_data import (
+    OUTPUT_DIR, build_manager_game_logs, calculate_season_summaries, load_all_seasons, load_champions,
+)
+
+PROFILES_DIR = OUTPUT_DIR / "managers"
+MIN_RIVALRY_GAMES = 5
+
+def _win_pct(wins: int, losses: int, ties: int) -> Optional[float]:
+    games = wins + losses + ties
+    return round((wins + 0.5 * ties) / games, 3) if games else None
+
+def build_manager_profile(manager: str, log: List[Dict], champs_data: Dict[int, Dict]) -> Dict:
+    """Career aggregates for one manager from their chronological game log"""
+    totals = {'W': 0, 'L': 0, 'T': 0}
+    points_for = 0.0
+    points_against = 0.0
+    seasons = {}  # season -> running season record
+    opponents = defaultdict(lambda: {'W': 0, 'L': 0, 'T': 0})
+    best_game = None
+
+    for game in log:
+        result = game['result']
+        totals[result] += 1
+        points_for += game['score']
+        points_against += game['opponent_score']
+
+        season = seasons.setdefault(game['season'], {'W': 0, 'L': 0, 'T': 0, 'pointsFor': 0.0, 'pointsAgainst': 0.0})
+        season[result] += 1
+        season['pointsFor'] += game['score']
+        season['pointsAgainst'] += game['opponent_score']
+
+        opponents[game['opponent']][result] += 1
+
+        if best_game is None or game['score'] > best_game['score']:
+            best_game = game
+
+    season_records = [{
+        'season': year,
+        'wins': record['W'],
+        'losses': record['L'],
+        'ties': record['T'],
+        'winPct': _win_pct(record['W'], record['L'], record['T']),
+        'pointsFor': round(record['pointsFor'], 2),
+        'pointsAgainst': round(record['pointsAgainst'], 2),
+    } for year, record in sorted(seasons.items())]
+    season_key = lambda s: (s['winPct'], s['pointsFor'])
+
+    head_to_head = sorted(({
+        'opponent': opponent,
+        'wins': record['W'],
+        'losses': record['L'],
+        'ties': record['T'],
+        'winPct': _win_pct(record['W'], record['L'], record['T']),
+    } for opponent, record in opponents.items()), key=lambda h: h['opponent'])
+    rivals = [h for h in head_to_head if h['wins'] + h['losses'] + h['ties'] >= MIN_RIVALRY_GAMES]
+
+    finishes = {'championships': [], 'runnerUps': [], 'thirdPlaces': []}
+    for year, champs in sorted(champs_data.items()):
+        for key, finish in (('champion', 'championships'), ('runnerUp', 'runnerUps'), ('thirdPlace', 'thirdPlaces')):
+            if champs.get(key) == manager:
+                finishes[finish].append(year)
+
+    return {
+        'manager': manager,
+        'seasonsPlayed': len(season_records),
+        'firstSeason': season_records[0]['season'] if season_records else None,
+        'lastSeason': season_records[-1]['season'] if season_records else None,
+        'wins': totals['W'],
+        'losses': totals['L'],
+        'ties': totals['T'],
+        'winPct': _win_pct(totals['W'], totals['L'], totals['T']),
+        'pointsFor': round(points_for, 2),
+        'pointsAgainst': round(points_against, 2),
+        'pointsPerGame': round(points_for / len(log), 2) if log else None,
+        **finishes,
+        'bestSeason': max(season_records, key=season_key) if season_records else None,
+        'worstSeason': min(season_records, key=season_key) if season_records else None,
+        'bestGame': {
+            'score': best_game['score'],
+            'opponent': best_game['opponent'],
+            'opponentScore': best_game['opponent_score'],
+            'season': best_game['season'],
+            'week': best_game['week'],
+        } if best_game else None,
+        # Ties on win percentage go to the opponent with more games played
+        'nemesis': min(rivals, key=lambda h: (h['winPct'], -(h['wins'] + h['losses'] + h['ties']))) if rivals else None,
+        'victim': max(rivals, key=lambda h: (h['winPct'], h['wins'] + h['losses'] + h['ties'])) if rivals else None,
+        'seasons': season_records,
+        'headToHead': head_to_head,
+    }
+
+def build_manager_profiles(season_summaries: Dict[int, Dict], champs_data: Dict[int, Dict]) -> Dict[str, Dict]:
+    """Profile of every manager with a resolved regular season game, keyed by manager"""
+    game_logs = build_manager_game_logs(season_summaries)
+    return {manager: build_manager_profile(manager, game_logs[manager], champs_data)
+            for manager in sorted(game_logs.keys())}
+
+def write_manager_profiles(profiles: Dict[str, Dict]):
+    """One compact JSON file per manager plus an index of headline numbers"""
+    PROFILES_DIR.mkdir(parents=True, exist_ok=True)
+
+    # Remove profiles for managers no longer in the data
+    for stale in PROFILES_DIR.glob("*.json"):
+        if stale.stem not in profiles:
+            stale.unlink()
+
+    for manager, profile in profiles.items():
+        with open(PROFILES_DIR / f"{manager}.json", 'w') as f:
+            json.dump(profile, f, separators=(',', ':'))
+
+    summary = [{
+        'manager': profile['manager'],
+        'seasonsPlayed': profile['seasonsPlayed'],
+        'wins': profile['wins'],
+        'losses': profile['losses'],
+        'ties': profile['ties'],
+        'winPct': profile['winPct'],
+        'championships': len(profile['championships']),
+    } for profile in profiles.values()]
+
+    with open(PROFILES_DIR / "index.js", 'w') as f:
+        f.write("// JBS FFL Manager Profiles\n")
+        f.write("// Generated by scripts/manager_profiles.py - Do not edit manually\n")
+        f.write("// Each manager's full profile is in managers/<Manager>.json\n\n")
+        f.write("export const managerSummaries = ")
+        json.dump(summary, f, separators=(',', ':'))
+        f.write(";\n")
+
+def main():
+    print("=" * 70)
+    print("Building Manager Career Profiles")
+    print("=" * 70)
+
+    espn_data = load_all_seasons()
+    if not espn_data:
+        print("❌ No ESPN data found")
+        return
+
+    season_summaries = calculate_season_summaries(espn_data, use_cache=True)
+    profiles = build_manager_profiles(season_summaries, load_champions())
+    print(f"✓ Built {len(profiles)} profiles")
+
+    for profile in sorted(profiles.values(), key=lambda p: -(p['winPct'] or 0)):
+        nemesis = profile['nemesis']['opponent'] if profile['nemesis'] else '-'
+        print(f"  {profile['manager']:<10} {profile['wins']:>3}-{profile['losses']}-{profile['ties']}  "
+              f"{len(profile['championships'])} titles  nemesis: {nemesis}")
+
+    write_manager_profiles(profiles)
+    print(f"\n✓ Saved profiles to {PROFILES_DIR}")
+
+if __name__ == "__main__":
+    main()
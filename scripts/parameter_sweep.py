@@ -0,0 +1,313 @@
+"""
+Parameter sweeps for the ranking and rating models
+
+Evaluates a grid of model parameters against history: how well each
+model's standings after week N predict the final regular season standings
+from the scraped ESPN standings (record, then points for).
+
+Models:
+- power: Total = record_w * Record Rank + points_w * Points Rank
+  + breakdown_w * Breakdown Rank, using the weekly ranks from
+  calculate_power_rankings
+- elo: ratings from elo.py for each K / regression pair
+
+Metrics (averaged over seasons):
+- spearman: rank correlation between the week-N order and the final standings
+- playoff_hits: share of the week-N top 6 who finished in the final top 6
+
+The inputs are packed into NumPy arrays once and placed in shared memory.
+Each worker process attaches to them and evaluates one slice of the grid,
+and every result lands in one table.
+
+Usage:
+    python parameter_sweep.py               # Sweep both models in one process
+    python parameter_sweep.py --jobs 4      # Split the grid across 4 workers (0 = one per CPU)
+    python parameter_sweep.py --model elo
+
+Output:
+    ../data/parameter_sweep.csv
+"""
+import csv
+import itertools
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from calculate_power_rankings import OUTPUT_DIR, calculate_power_rankings_batch, extract_first_name, load_all_seasons
+from elo import build_game_arrays, run_elo
+from league_rules import PLAYOFF_TEAMS
+from rank_matrix import rank_with_ties_matrix
+from simulation_runner import resolve_jobs
+
+MODELS = ('power', 'elo')
+
+POWER_WEIGHTS = [0.0, 0.5, 1.0, 1.5, 2.0]
+ELO_K_VALUES = [8, 12, 16, 20, 24, 32, 40, 48, 64]
+ELO_REGRESSION_VALUES = [0.0, 0.1, 0.25, 0.4, 0.6]
+EVALUATION_WEEKS = list(range(3, 14))
+
+# Set in each worker by _attach_inputs
+_INPUTS: Dict[str, np.ndarray] = {}
+
+def build_sweep_inputs(all_data: Dict[int, Dict]) -> Dict[str, np.ndarray]:
+    """
+    Pack everything the models need into plain arrays (season x week x manager)
+
+    - ranks: record / points / breakdown rank per season, week and manager
+      (NaN where the manager wasn't ranked)
+    - final_place: final regular season place per season and manager (1 = best)
+    - game arrays for Elo, with managers numbered as in ranks
+    """
+    seasons = sorted(all_data.keys())
+    rankings = calculate_power_rankings_batch(all_data, seasons)
+
+    managers = sorted({r['manager'] for season_rankings in rankings.values() for r in season_rankings})
+    index = {manager: i for i, manager in enumerate(managers)}
+    max_week = max((r['week'] for season_rankings in rankings.values() for r in season_rankings), default=0)
+
+    ranks = np.full((len(seasons), max_week + 1, len(managers), 3), np.nan)
+    for s, season in enumerate(seasons):
+        for r in rankings[season]:
+            ranks[s, r['week'], index[r['manager']]] = (r['record_rank'], r['points_rank'], r['breakdown_rank'])
+
+    final_place = np.full((len(seasons), len(managers)), np.nan)
+    for s, season in enumerate(seasons):
+        standings = []
+        for team in all_data[season].get('standings', []):
+            manager = extract_first_name(team.get('manager', ''))
+            if manager in index:
+                wins = team.get('wins', 0) + 0.5 * team.get('ties', 0)
+                standings.append((-wins, -team.get('points_for', 0), manager))
+        for place, (_, _, manager) in enumerate(sorted(standings), start=1):
+            final_place[s, index[manager]] = place
+
+    games = build_game_arrays(all_data, managers)
+    week_table = np.array([[season, week, start, end] for season, week, start, end in games['weeks']], dtype=np.int64)
+
+    return {
+        'seasons': np.array(seasons, dtype=np.int64),
+        'ranks': ranks,
+        'final_place': final_place,
+        'home': games['home'].astype(np.int64),
+        'away': games['away'].astype(np.int64),
+        'results': games['results'],
+        'week_table': week_table.reshape(-1, 4),
+        'num_managers': np.array([len(games['managers'])], dtype=np.int64),
+    }
+
+def share_inputs(inputs: Dict[str, np.ndarray]) -> Tuple[List[shared_memory.SharedMemory], Dict]:
+    """Copy each input array into shared memory; returns the blocks and their descriptors"""
+    blocks = []
+    descriptors = {}
+    for name, array in inputs.items():
+        block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+        blocks.append(block)
+        descriptors[name] = (block.name, array.shape, array.dtype.str)
+    return blocks, descriptors
+
+def _attach_inputs(descriptors: Dict):
+    """Worker initializer: map the shared input arrays without copying them"""
+    blocks = []
+    for name, (block_name, shape, dtype) in descriptors.items():
+        block = shared_memory.SharedMemory(name=block_name)
+        blocks.append(block)
+        _INPUTS[name] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+    # Keep the blocks referenced for the worker's lifetime
+    _INPUTS['_blocks'] = blocks
+
+def score_predictions(scores: np.ndarray, final_place: np.ndarray) -> Tuple[float, float, int]:
+    """
+    Compare season x manager predicted scores (higher = better) with final places
+
+    Returns (mean Spearman correlation, mean playoff hit rate, seasons scored).
+    """
+    scores = np.where(np.isnan(final_place), np.nan, scores)
+    valid = ~np.isnan(scores)
+    seasons_scored = valid.sum(axis=1) > PLAYOFF_TEAMS
+    if not seasons_scored.any():
+        return float('nan'), float('nan'), 0
+    scores = scores[seasons_scored]
+    final_place = final_place[seasons_scored]
+    valid = valid[seasons_scored]
+
+    predicted_ranks = rank_with_ties_matrix(scores)
+    actual_ranks = rank_with_ties_matrix(np.where(valid, -final_place, np.nan))
+    predicted_centered = predicted_ranks - np.nanmean(predicted_ranks, axis=1, keepdims=True)
+    actual_centered = actual_ranks - np.nanmean(actual_ranks, axis=1, keepdims=True)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        spearman = (np.nansum(predicted_centered * actual_centered, axis=1)
+                    / np.sqrt(np.nansum(predicted_centered ** 2, axis=1) * np.nansum(actual_centered ** 2, axis=1)))
+
+    predicted_top = np.argsort(np.where(valid, -scores, np.inf), axis=1)[:, :PLAYOFF_TEAMS]
+    made_playoffs = np.where(valid, final_place <= PLAYOFF_TEAMS, False)
+    playoff_hits = np.take_along_axis(made_playoffs, predicted_top, axis=1).mean(axis=1)
+
+    return float(np.nanmean(spearman)), float(playoff_hits.mean()), int(seasons_scored.sum())
+
+def evaluate_power_slice(grid: List[Tuple[float, float, float]]) -> List[Dict]:
+    """Evaluate power ranking weights (record, points, breakdown) at every evaluation week"""
+    ranks = _INPUTS['ranks']
+    final_place = _INPUTS['final_place']
+    rows = []
+    for weights in grid:
+        totals = ranks @ np.array(weights)  # season x week x manager
+        for week in EVALUATION_WEEKS:
+            if week >= totals.shape[1]:
+                continue
+            spearman, playoff_hits, seasons = score_predictions(totals[:, week, :], final_place)
+            rows.append({
+                'model': 'power',
+                'params': f"record={weights[0]:g} points={weights[1]:g} breakdown={weights[2]:g}",
+                'week': week,
+                'spearman': spearman,
+                'playoff_hits': playoff_hits,
+                'seasons': seasons,
+            })
+    return rows
+
+def evaluate_elo_slice(grid: List[Tuple[float, float]]) -> List[Dict]:
+    """Evaluate Elo K / regression pairs; the whole slice is rated in one pass"""
+    if not grid:
+        return []
+    week_table = _INPUTS['week_table']
+    games = {
+        'managers': range(int(_INPUTS['num_managers'][0])),
+        'home': _INPUTS['home'],
+        'away': _INPUTS['away'],
+        'results': _INPUTS['results'],
+        'weeks': [tuple(int(v) for v in row) for row in week_table],
+    }
+    result = run_elo(games, [k for k, _ in grid], [r for _, r in grid], record_history=True)
+    history = np.array(result['history'])  # week x config x manager
+    week_position = {(int(season), int(week)): i for i, (season, week, _, _) in enumerate(week_table)}
+
+    seasons = _INPUTS['seasons']
+    final_place = _INPUTS['final_place']
+    rows = []
+    for week in EVALUATION_WEEKS:
+        positions = [week_position.get((int(season), week)) for season in seasons]
+        available = np.array([p is not None for p in positions])
+        # Elo may know managers who were never ranked; only the ranked ones have final places
+        num_managers = final_place.shape[1]
+        ratings = np.full((len(grid), len(seasons), num_managers), np.nan)
+        for s, p in enumerate(positions):
+            if p is not None:
+                ratings[:, s, :] = history[p][:, :num_managers]
+        for c, (k, regression) in enumerate(grid):
+            spearman, playoff_hits, num_seasons = score_predictions(ratings[c][available], final_place[available])
+            rows.append({
+                'model': 'elo',
+                'params': f"k={k:g} regression={regression:g}",
+                'week': week,
+                'spearman': spearman,
+                'playoff_hits': playoff_hits,
+                'seasons': num_seasons,
+            })
+    return rows
+
+def _evaluate_slice(task: Tuple[str, List]) -> List[Dict]:
+    model, grid = task
+    return evaluate_power_slice(grid) if model == 'power' else evaluate_elo_slice(grid)
+
+def unique_directions(weight_vectors: List[Tuple[float, ...]]) -> List[Tuple[float, ...]]:
+    """
+    One weight vector per direction
+
+    Proportional vectors such as (1, 1, 1) and (2, 2, 2) rank every manager
+    the same, so only one is kept: the one with the smallest largest weight
+    of at least 1, else the smallest. Order is preserved.
+    """
+    def direction(weights):
+        return tuple(round(w / max(weights), 6) for w in weights)
+
+    chosen = {}
+    for weights in weight_vectors:
+        key = direction(weights)
+        preference = (max(weights) < 1.0, max(weights))
+        if key not in chosen or preference < chosen[key][0]:
+            chosen[key] = (preference, weights)
+    return [weights for weights in weight_vectors if chosen[direction(weights)][1] == weights]
+
+def build_grids(models: List[str]) -> Dict[str, List]:
+    grids = {}
+    if 'power' in models:
+        grids['power'] = unique_directions([w for w in itertools.product(POWER_WEIGHTS, repeat=3) if any(w)])
+    if 'elo' in models:
+        grids['elo'] = list(itertools.product(ELO_K_VALUES, ELO_REGRESSION_VALUES))
+    return grids
+
+def run_sweep(inputs: Dict[str, np.ndarray], models: List[str], jobs: int = 1) -> List[Dict]:
+    """Evaluate every model's grid, split into one slice per worker"""
+    grids = build_grids(models)
+    tasks = []
+    for model, grid in grids.items():
+        slices = min(max(jobs, 1), len(grid))
+        tasks += [(model, grid[i::slices]) for i in range(slices)]
+
+    if jobs <= 1:
+        _INPUTS.update(inputs)
+        return [row for task in tasks for row in _evaluate_slice(task)]
+
+    blocks, descriptors = share_inputs(inputs)
+    try:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_attach_inputs, initargs=(descriptors,)) as executor:
+            return [row for rows in executor.map(_evaluate_slice, tasks) for row in rows]
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+def main():
+    import sys
+
+    args = sys.argv[1:]
+    jobs = resolve_jobs(int(args[args.index('--jobs') + 1]) if '--jobs' in args else 1)
+    models = list(MODELS)
+    if '--model' in args:
+        model = args[args.index('--model') + 1] if args.index('--model') + 1 < len(args) else None
+        if model not in MODELS:
+            print(f"Error: --model must be one of: {', '.join(MODELS)}")
+            sys.exit(1)
+        models = [model]
+
+    all_data = load_all_seasons()
+    if not all_data:
+        return
+
+    print("=" * 70)
+    print(f"Parameter Sweep ({', '.join(models)}) on {jobs} worker{'s' if jobs != 1 else ''}")
+    print("=" * 70)
+
+    start = time.perf_counter()
+    inputs = build_sweep_inputs(all_data)
+    print(f"✓ Built shared inputs in {time.perf_counter() - start:.2f}s")
+
+    start = time.perf_counter()
+    rows = run_sweep(inputs, models, jobs)
+    elapsed = time.perf_counter() - start
+    print(f"✓ Evaluated {len(rows)} model x week combinations in {elapsed:.2f}s")
+
+    rows.sort(key=lambda row: (row['model'], row['week'], -row['spearman'], -row['playoff_hits'], row['params']))
+
+    # Best parameters per model at a mid-season checkpoint
+    for model in models:
+        week_rows = [row for row in rows if row['model'] == model and row['week'] == 8]
+        for row in week_rows[:3]:
+            print(f"  {model:<6} week 8  {row['params']:<40} spearman {row['spearman']:.3f}  "
+                  f"playoff hits {row['playoff_hits']:.1%}")
+
+    output_file = OUTPUT_DIR / "parameter_sweep.csv"
+    with open(output_file, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['Model', 'Parameters', 'Week', 'Spearman', 'Playoff Hits', 'Seasons'])
+        for row in rows:
+            writer.writerow([row['model'], row['params'], row['week'],
+                             f"{row['spearman']:.4f}", f"{row['playoff_hits']:.4f}", row['seasons']])
+    print(f"\n✓ Saved sweep results to {output_file}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+"""
+Playoff bracket reconstruction from the scraped ESPN schedule
+
+Every scraped week carries ESPN's full season schedule, including the
+playoff matchup periods after the regular season (13 weeks before 2021,
+14 since); the scraper also saves the playoff weeks as playoff_matchups.
+The bracket is rebuilt from those games:
+- Games are deduplicated per (matchup period, team pair) with a dict,
+  keeping the highest scoring copy
+- Each round is indexed by manager, so "who did X play in round r" is
+  one dictionary lookup
+- Winners bracket entrants come from ESPN's bracket data when it was
+  scraped: the games' playoff tier (WINNERS_BRACKET), else the playoff
+  seeds in playoff_results. Older scrapes have neither, so they fall
+  back to the first round: the teams with a bye, plus both teams of
+  every first round game whose winner meets a bye team next round
+- Walking the rounds forward, a winners bracket game is one between two
+  teams still alive. The last one is the final, and the last round game
+  between the two semifinal losers is the third place game
+- ESPN's final ranks in playoff_results, when scraped, decide champion,
+  runner-up and third place
+- A tied playoff game goes to ESPN's recorded winner
+
+Usage:
+    python playoff_bracket.py               # Champion, runner-up and third place per season
+    python playoff_bracket.py 2024          # One season's bracket round by round
+"""
+from typing import Dict, List, Optional
+
+from league_rules import PLAYOFF_TEAMS, get_regular_season_weeks
+from process_data import extract_first_name, load_all_seasons
+
+WINNERS_TIER = 'WINNERS_BRACKET'
+
+def _manager(name: Optional[str]) -> Optional[str]:
+    if not name or 'Team None' in name:
+        return None
+    return extract_first_name(name)
+
+def index_playoff_games(season_data: Dict, regular_season_weeks: int) -> Dict[int, Dict]:
+    """
+    Deduplicated playoff games per matchup period
+
+    Returns period -> {(team id, team id): game}. A bye is a game with
+    away None. Each game has home, away, scores, winner, loser and tier.
+    """
+    rounds = {}
+    # Scrapes since playoff weeks were fetched keep them in playoff_matchups
+    for matchup in season_data.get('matchups', []) + season_data.get('playoff_matchups', []):
+        period = matchup.get('matchup_period_id') or matchup.get('week')
+        if not period or period <= regular_season_weeks:
+            continue
+        home = _manager(matchup.get('home_manager'))
+        away = _manager(matchup.get('away_manager'))
+        if home is None:
+            home, away = away, None
+        if home is None:
+            continue
+
+        home_score = matchup.get('home_score') or 0
+        away_score = matchup.get('away_score') or 0
+        if away is not None and home_score == away_score:
+            espn_winner = matchup.get('winner_espn')
+            winner = home if espn_winner == 'HOME' else away if espn_winner == 'AWAY' else None
+        elif away is not None:
+            winner = home if home_score > away_score else away
+        else:
+            winner = None
+
+        key = tuple(sorted((home, away or '')))
+        games = rounds.setdefault(period, {})
+        existing = games.get(key)
+        if existing and existing['home_score'] + existing['away_score'] >= home_score + away_score:
+            continue
+        games[key] = {
+            'round': period,
+            'home': home,
+            'away': away,
+            'home_score': home_score,
+            'away_score': away_score,
+            'winner': winner,
+            'loser': (away if winner == home else home) if winner else None,
+            'tier': matchup.get('playoff_tier_type'),
+        }
+    return rounds
+
+def _opponent(game: Dict, manager: str) -> Optional[str]:
+    return game['away'] if game['home'] == manager else game['home']
+
+def find_winners_bracket_entrants(rounds: Dict[int, Dict], by_manager: Dict[int, Dict[str, Dict]],
+                                  periods: List[int], playoff_results: Dict) -> set:
+    """Managers who start in the winners bracket"""
+    tiered = {m for games in rounds.values() for g in games.values() if g['tier'] == WINNERS_TIER
+              for m in (g['home'], g['away']) if m}
+    if tiered:
+        return tiered
+
+    seeds = playoff_results.get('seeds', {})
+    if seeds:
+        playoff_teams = playoff_results.get('playoff_team_count') or PLAYOFF_TEAMS
+        return {_manager(m) for m, seed in seeds.items() if seed <= playoff_teams} - {None}
+
+    # Older scrapes have no bracket data: infer the entrants from the byes
+
+    first_round = rounds[periods[0]].values()
+    byes = {g['home'] for g in first_round if g['away'] is None}
+    if not byes or len(periods) < 2:
+        return byes
+
+    # A first round winner who meets a bye team next round came through the winners bracket
+    entrants = set(byes)
+    next_round = by_manager[periods[1]]
+    for game in first_round:
+        if game['away'] is None or game['winner'] is None:
+            continue
+        next_game = next_round.get(game['winner'])
+        if next_game and _opponent(next_game, game['winner']) in byes:
+            entrants.update((game['home'], game['away']))
+    return entrants
+
+def build_bracket(season: int, season_data: Dict) -> Dict:
+    """
+    Rebuild one season's playoff bracket
+
+    Returns champion, runnerUp and thirdPlace (None when they can't be
+    determined), rounds (each round's games labelled winners, third_place,
+    consolation or bye) and final, the championship game as a tree whose
+    feeders are the winners bracket games each finalist came through.
+    """
+    results = {'champion': None, 'runnerUp': None, 'thirdPlace': None, 'rounds': [], 'final': None}
+    rounds = index_playoff_games(season_data, get_regular_season_weeks(season))
+    if not rounds:
+        return results
+
+    periods = sorted(rounds.keys())
+    by_manager = {period: {m: game for game in games.values() for m in (game['home'], game['away']) if m}
+                  for period, games in rounds.items()}
+
+    playoff_results = season_data.get('playoff_results') or {}
+    alive = find_winners_bracket_entrants(rounds, by_manager, periods, playoff_results)
+    eliminated = {}  # manager -> period they lost in the winners bracket
+    for period in periods:
+        for game in rounds[period].values():
+            if game['away'] is None:
+                game['bracket'] = 'bye'
+            elif game['home'] in alive and game['away'] in alive and game['winner']:
+                game['bracket'] = 'winners'
+                alive.discard(game['loser'])
+                eliminated[game['loser']] = period
+            else:
+                game['bracket'] = 'consolation'
+
+    last = periods[-1]
+    finals = [g for g in rounds[last].values() if g['bracket'] == 'winners']
+    if len(finals) == 1:
+        final = finals[0]
+        results['champion'] = final['winner']
+        results['runnerUp'] = final['loser']
+
+        # Third place: the last round game between the two semifinal losers
+        if len(periods) >= 2:
+            semifinal_losers = [m for m, period in eliminated.items() if period == periods[-2]]
+            if len(semifinal_losers) == 2:
+                game = by_manager[last].get(semifinal_losers[0])
+                if game and _opponent(game, semifinal_losers[0]) == semifinal_losers[1]:
+                    game['bracket'] = 'third_place'
+                    results['thirdPlace'] = game['winner']
+
+        results['final'] = _bracket_tree(final, by_manager, periods)
+
+    # ESPN's own final standings take precedence over the rebuilt results
+    places = {rank: _manager(m) for m, rank in playoff_results.get('final_ranks', {}).items()}
+    for rank, field in ((1, 'champion'), (2, 'runnerUp'), (3, 'thirdPlace')):
+        if places.get(rank):
+            results[field] = places[rank]
+
+    results['rounds'] = [{
+        'round': period,
+        'games': sorted(rounds[period].values(), key=lambda g: (g['bracket'] != 'winners', g['home'])),
+    } for period in periods]
+    return results
+
+def _bracket_tree(game: Dict, by_manager: Dict[int, Dict[str, Dict]], periods: List[int]) -> Dict:
+    """A winners bracket game with the earlier winners bracket games of both teams as feeders"""
+    position = periods.index(game['round'])
+    feeders = []
+    for manager in (game['home'], game['away']):
+        previous = by_manager[periods[position - 1]].get(manager) if position > 0 else None
+        feeders.append(_bracket_tree(previous, by_manager, periods)
+                       if previous and previous['bracket'] == 'winners' else None)
+    node = {key: game[key] for key in ('round', 'home', 'away', 'home_score', 'away_score', 'winner')}
+    node['feeders'] = feeders
+    return node
+
+def main():
+    import sys
+
+    espn_data = load_all_seasons()
+    if not espn_data:
+        print("❌ No ESPN data found")
+        return
+
+    if len(sys.argv) > 1:
+        season = int(sys.argv[1])
+        if season not in espn_data:
+            print(f"❌ No data for {season}")
+            return
+        bracket = build_bracket(season, espn_data[season])
+        print(f"{season} Playoffs")
+        for playoff_round in bracket['rounds']:
+            print(f"\n  Week {playoff_round['round']}")
+            for game in playoff_round['games']:
+                if game['away'] is None:
+                    print(f"    {game['home']:<10} bye")
+                else:
+                    print(f"    {game['home']:<10} {game['home_score']:>7.2f} - {game['away_score']:<7.2f} "
+                          f"{game['away']:<10} ({game['bracket']})")
+        print(f"\n  Champion: {bracket['champion']}, runner-up: {bracket['runnerUp']}, third: {bracket['thirdPlace']}")
+        return
+
+    print("=" * 70)
+    print("Playoff Results")
+    print("=" * 70)
+    for season in sorted(espn_data.keys()):
+        bracket = build_bracket(season, espn_data[season])
+        print(f"  {season}: champion {bracket['champion'] or '?':<10} runner-up {bracket['runnerUp'] or '?':<10} "
+              f"third {bracket['thirdPlace'] or '?'}")
+
+if __name__ == "__main__":
+    main()
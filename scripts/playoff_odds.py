@@ -0,0 +1,297 @@
+"""
+Monte Carlo playoff odds for a season in progress
+
+Plays out the rest of the regular season many times from the games already
+played:
+- Each manager's weekly score is drawn from a normal distribution fitted to
+  their scores so far, shrunk toward the league average while the sample is small
+- The remaining schedule comes from the scraped matchup periods after the
+  as-of week, up to the last regular season week (13 before 2021, 14 since,
+  get_regular_season_weeks in league_rules.py)
+- Seeding is by record (ties count half a win), then points for
+
+All simulations in a batch are played at once with NumPy arrays, so 100k
+seasons take well under a second on one core. simulation_runner.py spreads
+them over --jobs worker processes with the same results for any worker count.
+
+The league format is 6 playoff teams with the top 2 seeds on a bye.
+
+Usage:
+    python playoff_odds.py                          # Latest season, as of its last played week
+    python playoff_odds.py 2025 --as-of-week 8      # Odds as they stood after week 8
+    python playoff_odds.py --simulations 500000 --seed 7
+    python playoff_odds.py --simulations 1000000 --jobs 0   # One worker per CPU
+
+Output:
+    ../data/playoffOdds.js
+"""
+import json
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from calculate_power_rankings import DATA_DIR, OUTPUT_DIR, collect_season_weeks, extract_first_name
+from league_rules import BYE_TEAMS, PLAYOFF_TEAMS, get_regular_season_weeks
+from simulation_runner import format_stats, run_simulations
+
+DEFAULT_SIMULATIONS = 100_000
+DEFAULT_SEED = 2009
+BATCH_SIZE = 25_000
+
+# Weeks of league-average scoring blended into each manager's fitted distribution
+SHRINKAGE_WEEKS = 3
+
+def load_season(season: int) -> Optional[Dict]:
+    """Load one season's scraped data (espn_season_YYYY.json)"""
+    season_file = DATA_DIR / f"espn_season_{season}.json"
+    if not season_file.exists():
+        print(f"❌ {season_file} not found")
+        return None
+    with open(season_file, 'r') as f:
+        return json.load(f)
+
+def get_latest_season() -> Optional[int]:
+    seasons = [int(f.stem.split("_")[-1]) for f in DATA_DIR.glob("espn_season_*.json")]
+    return max(seasons) if seasons else None
+
+def get_remaining_schedule(season_data: Dict, first_week: int, last_week: int) -> List[Dict]:
+    """
+    Scheduled games for matchup periods first_week..last_week
+
+    Every scraped week carries ESPN's full schedule, so each future period's
+    pairings are taken from its first occurrence, skipping byes.
+    """
+    schedule = []
+    seen = set()
+    for matchup in season_data.get('matchups', []):
+        period = matchup.get('matchup_period_id')
+        if period is None or not first_week <= period <= last_week:
+            continue
+        home_id = matchup.get('home_team_id')
+        away_id = matchup.get('away_team_id')
+        if home_id is None or away_id is None:
+            continue
+        home_mgr = matchup.get('home_manager', '')
+        away_mgr = matchup.get('away_manager', '')
+        if not home_mgr or not away_mgr or 'Team None' in home_mgr or 'Team None' in away_mgr:
+            continue
+
+        key = (period, tuple(sorted([home_id, away_id])))
+        if key in seen:
+            continue
+        seen.add(key)
+        schedule.append({
+            'week': period,
+            'home': extract_first_name(home_mgr),
+            'away': extract_first_name(away_mgr),
+        })
+
+    schedule.sort(key=lambda g: g['week'])
+    return schedule
+
+def build_season_model(season: int, season_data: Dict, as_of_week: Optional[int] = None) -> Optional[Dict]:
+    """
+    Current standings, fitted score distributions and remaining schedule
+
+    as_of_week defaults to the last week with played games. Returns None if
+    no games have been played by then.
+    """
+    regular_season_weeks = get_regular_season_weeks(season)
+    played_weeks = [w for w in collect_season_weeks(season_data)
+                    if w['scores'] and w['week'] <= regular_season_weeks]
+    if as_of_week is None:
+        as_of_week = played_weeks[-1]['week'] if played_weeks else 0
+    played_weeks = [w for w in played_weeks if w['week'] <= as_of_week]
+    if not played_weeks:
+        return None
+
+    remaining = get_remaining_schedule(season_data, as_of_week + 1, regular_season_weeks)
+    managers = sorted({m for w in played_weeks for m in w['scores']}
+                      | {g['home'] for g in remaining} | {g['away'] for g in remaining})
+    index = {manager: i for i, manager in enumerate(managers)}
+    num_managers = len(managers)
+
+    wins = np.zeros(num_managers)
+    points = np.zeros(num_managers)
+    scores = [[] for _ in managers]
+    for week in played_weeks:
+        for manager, score in week['scores'].items():
+            i = index[manager]
+            scores[i].append(score)
+            points[i] += score
+            result = week['results'][manager]
+            wins[i] += 1.0 if result == 'W' else 0.5 if result == 'T' else 0.0
+
+    all_scores = np.array([s for manager_scores in scores for s in manager_scores])
+    league_mean = all_scores.mean()
+    league_var = all_scores.var()
+
+    means = np.empty(num_managers)
+    stds = np.empty(num_managers)
+    for i, manager_scores in enumerate(scores):
+        n = len(manager_scores)
+        manager_mean = np.mean(manager_scores) if n else league_mean
+        manager_var = np.var(manager_scores) if n else league_var
+        means[i] = (n * manager_mean + SHRINKAGE_WEEKS * league_mean) / (n + SHRINKAGE_WEEKS)
+        stds[i] = np.sqrt((n * manager_var + SHRINKAGE_WEEKS * league_var) / (n + SHRINKAGE_WEEKS))
+
+    return {
+        'season': season,
+        'as_of_week': as_of_week,
+        'regular_season_weeks': regular_season_weeks,
+        'managers': managers,
+        'wins': wins,
+        'points': points,
+        'means': means,
+        'stds': stds,
+        'home': np.array([index[g['home']] for g in remaining], dtype=np.intp),
+        'away': np.array([index[g['away']] for g in remaining], dtype=np.intp),
+        'remaining_games': len(remaining),
+    }
+
+def simulate_seed_counts(model: Dict, num_simulations: int, rng: np.random.Generator,
+                         batch_size: int = BATCH_SIZE) -> np.ndarray:
+    """
+    Play out the rest of the season num_simulations times
+
+    Returns a manager x seed histogram: counts[i, s] is how many simulations
+    manager i finished as seed s + 1. Histograms from separate runs add up.
+    """
+    num_managers = len(model['managers'])
+    home, away = model['home'], model['away']
+    num_games = len(home)
+    counts = np.zeros((num_managers, num_managers), dtype=np.int64)
+
+    # One-hot game -> manager maps turn per-game results into per-manager totals with a matmul
+    home_onehot = np.zeros((num_games, num_managers))
+    home_onehot[np.arange(num_games), home] = 1.0
+    away_onehot = np.zeros((num_games, num_managers))
+    away_onehot[np.arange(num_games), away] = 1.0
+
+    done = 0
+    while done < num_simulations:
+        batch = min(batch_size, num_simulations - done)
+
+        home_scores = rng.normal(model['means'][home], model['stds'][home], size=(batch, num_games))
+        away_scores = rng.normal(model['means'][away], model['stds'][away], size=(batch, num_games))
+        home_results = np.where(home_scores > away_scores, 1.0, np.where(home_scores == away_scores, 0.5, 0.0))
+
+        wins = model['wins'] + home_results @ home_onehot + (1.0 - home_results) @ away_onehot
+        points = model['points'] + home_scores @ home_onehot + away_scores @ away_onehot
+
+        # Record first, points for as the tiebreaker (points stay well below 1e5)
+        seeding_key = wins * 1e5 + points
+        order = np.argsort(-seeding_key, axis=1, kind='stable')
+        seeds = np.empty_like(order)
+        np.put_along_axis(seeds, order, np.arange(num_managers), axis=1)
+
+        # Count (manager, seed) pairs across the batch
+        flat = (np.arange(num_managers) * num_managers + seeds).ravel()
+        counts += np.bincount(flat, minlength=num_managers * num_managers).reshape(num_managers, num_managers)
+        done += batch
+
+    return counts
+
+def summarize_odds(model: Dict, counts: np.ndarray) -> List[Dict]:
+    """Per-manager playoff, bye and last-place probabilities from a seed histogram"""
+    num_simulations = counts[0].sum()
+    num_managers = len(model['managers'])
+    seeds = np.arange(1, num_managers + 1)
+
+    odds = []
+    for i, manager in enumerate(model['managers']):
+        odds.append({
+            'manager': manager,
+            'wins': float(model['wins'][i]),
+            'pointsFor': round(float(model['points'][i]), 2),
+            'projectedMean': round(float(model['means'][i]), 2),
+            'playoffs': round(float(counts[i, :PLAYOFF_TEAMS].sum() / num_simulations), 4),
+            'bye': round(float(counts[i, :BYE_TEAMS].sum() / num_simulations), 4),
+            'lastPlace': round(float(counts[i, -1] / num_simulations), 4),
+            'averageSeed': round(float((counts[i] * seeds).sum() / num_simulations), 2),
+            'seedDistribution': [round(float(c / num_simulations), 4) for c in counts[i]],
+        })
+
+    odds.sort(key=lambda o: (-o['playoffs'], o['averageSeed']))
+    return odds
+
+def write_playoff_odds(model: Dict, odds: List[Dict], num_simulations: int, output_file: Path):
+    with open(output_file, 'w') as f:
+        f.write("// JBS FFL Playoff Odds\n")
+        f.write("// Generated by scripts/playoff_odds.py - Do not edit manually\n\n")
+        f.write("export const playoffOdds = ")
+        json.dump({
+            'season': model['season'],
+            'asOfWeek': model['as_of_week'],
+            'regularSeasonWeeks': model['regular_season_weeks'],
+            'simulations': num_simulations,
+            'playoffTeams': PLAYOFF_TEAMS,
+            'byeTeams': BYE_TEAMS,
+            'managers': odds,
+        }, f, separators=(',', ':'))
+        f.write(";\n")
+
+def main():
+    import sys
+
+    args = sys.argv[1:]
+
+    def option(name: str, default: Optional[int]) -> Optional[int]:
+        if name not in args:
+            return default
+        index = args.index(name)
+        try:
+            value = int(args[index + 1])
+        except (IndexError, ValueError):
+            print(f"Error: {name} requires a number")
+            sys.exit(1)
+        del args[index:index + 2]
+        return value
+
+    as_of_week = option('--as-of-week', None)
+    num_simulations = option('--simulations', DEFAULT_SIMULATIONS)
+    seed = option('--seed', DEFAULT_SEED)
+    jobs = option('--jobs', 1)
+    if num_simulations < 1:
+        print("Error: --simulations must be at least 1")
+        sys.exit(1)
+
+    season = int(args[0]) if args else get_latest_season()
+    if season is None:
+        print("❌ No scraped seasons found")
+        return
+
+    season_data = load_season(season)
+    if season_data is None:
+        return
+
+    model = build_season_model(season, season_data, as_of_week)
+    if model is None:
+        print(f"❌ No games played in {season} by week {as_of_week}")
+        return
+
+    print("=" * 70)
+    print(f"Playoff Odds - {season} after week {model['as_of_week']}")
+    print("=" * 70)
+    if model['remaining_games']:
+        print(f"Remaining games: {model['remaining_games']} "
+              f"(weeks {model['as_of_week'] + 1}-{model['regular_season_weeks']})")
+    else:
+        print("Regular season complete - odds reflect the final standings")
+
+    counts, stats = run_simulations(simulate_seed_counts, model, num_simulations, seed, jobs)
+    print(f"✓ Simulated {format_stats(stats)}\n")
+
+    odds = summarize_odds(model, counts)
+    print(f"{'Manager':<10} {'W':>5} {'Playoffs':>9} {'Bye':>7} {'Last':>7} {'Avg Seed':>9}")
+    for o in odds:
+        print(f"{o['manager']:<10} {o['wins']:>5g} {o['playoffs']:>9.1%} {o['bye']:>7.1%} "
+              f"{o['lastPlace']:>7.1%} {o['averageSeed']:>9.2f}")
+
+    output_file = OUTPUT_DIR / "playoffOdds.js"
+    write_playoff_odds(model, odds, num_simulations, output_file)
+    print(f"\n✓ Saved playoff odds to {output_file}")
+
+if __name__ == "__main__":
+    main()
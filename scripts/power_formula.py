@@ -0,0 +1,304 @@
+"""
+Configurable power ranking formulas
+A formula is a weighted sum of components, each scaled by a ranking mode:
+    Total = sum(weight * mode(component))
+
+Components (cumulative through each week unless noted):
+- record: actual wins
+- points: total points scored
+- breakdown: all-play (theoretical) wins
+- recent_form: points scored over the last `window` weeks (default 3)
+- strength_of_schedule: average all-play win percentage of the opponents faced so far
+
+Modes:
+- rank: average rank with ties, best = number of managers, worst = 1 (Matt's system),
+  ranked for every week of a season at once by rank_matrix.py
+- value: the raw component value
+- zscore: standard deviations above that week's league average
+
+Any component can set "invert": true to reward lower values instead.
+The "traditional" formula in power_formulas.json reproduces the Total Rank
+from calculate_power_rankings.py.
+
+Each season's component arrays are built once and every scaled array is
+cached, so evaluating more formulas only costs the weighted sums.
+
+Usage:
+    python power_formula.py                            # Evaluate every formula for all seasons
+    python power_formula.py --formula recent_form      # Evaluate one formula
+    python power_formula.py --config my_formulas.json  # Use a different formula file
+
+Output:
+    ../data/power_rankings_formulas.csv (one row per season, week and manager,
+    one Total column per formula)
+"""
+import csv
+import json
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from all_play import all_play_win_percentage, calculate_weekly_all_play
+from form_metrics import rolling_sums
+from calculate_power_rankings import (
+    OUTPUT_DIR,
+    SCRIPT_DIR,
+    collect_season_weeks,
+    load_all_seasons,
+)
+from rank_matrix import rank_with_ties_matrix
+
+FORMULAS_FILE = SCRIPT_DIR / "power_formulas.json"
+
+COMPONENTS = ('record', 'points', 'breakdown', 'recent_form', 'strength_of_schedule')
+MODES = ('rank', 'value', 'zscore')
+
+# Component parameters and their defaults
+COMPONENT_PARAMS = {
+    'recent_form': {'window': 3},
+}
+
+def load_formulas(config_file: Path = FORMULAS_FILE) -> Dict[str, Dict]:
+    """Load and validate the formulas defined in a config file"""
+    with open(config_file, 'r') as f:
+        config = json.load(f)
+
+    formulas = config.get('formulas', {})
+    for name, formula in formulas.items():
+        for spec in formula.get('components', []):
+            if spec.get('component') not in COMPONENTS:
+                raise ValueError(f"Formula '{name}': unknown component '{spec.get('component')}'")
+            if spec.get('mode', 'rank') not in MODES:
+                raise ValueError(f"Formula '{name}': unknown mode '{spec.get('mode')}'")
+    return formulas
+
+def _component_params(spec: Dict) -> tuple:
+    """Hashable parameters of a component spec, with defaults filled in"""
+    defaults = COMPONENT_PARAMS.get(spec['component'], {})
+    return tuple(sorted((key, spec.get(key, default)) for key, default in defaults.items()))
+
+def build_season_components(season_weeks: List[Dict]) -> Dict:
+    """
+    Build the per-week base arrays every component is derived from
+
+    Returns managers (sorted), weeks, weekly_scores (one {manager: score}
+    dict per week) and per-week lists aligned to managers: active (has played
+    by that week), wins, points, breakdown_wins and schedule (average
+    opponent all-play win percentage).
+    Values for managers who haven't played yet are None.
+    """
+    managers = sorted({m for week in season_weeks for m in week['scores']})
+    num_managers = len(managers)
+
+    wins = defaultdict(int)
+    total_points = defaultdict(float)
+    theoretical = defaultdict(lambda: [0, 0, 0])
+    opponent_counts = defaultdict(lambda: defaultdict(int))
+    games = defaultdict(int)
+
+    arrays = {key: [] for key in ('active', 'wins', 'points', 'breakdown_wins', 'schedule')}
+
+    for season_week in season_weeks:
+        week_scores = season_week['scores']
+        for manager, score in week_scores.items():
+            total_points[manager] += score
+            if season_week['results'][manager] == 'W':
+                wins[manager] += 1
+            opponent = season_week['opponents'].get(manager)
+            if opponent is not None:
+                opponent_counts[manager][opponent] += 1
+                games[manager] += 1
+
+        week_wins, week_losses, week_ties = calculate_weekly_all_play(week_scores)
+        for manager in week_scores:
+            record = theoretical[manager]
+            record[0] += week_wins[manager]
+            record[1] += week_losses[manager]
+            record[2] += week_ties[manager]
+
+        active = [m in total_points for m in managers]
+        all_play_pct = {m: all_play_win_percentage(*theoretical[m]) for m in theoretical}
+
+        def cumulative(values):
+            return [values[m] if is_active else None for m, is_active in zip(managers, active)]
+
+        arrays['active'].append(active)
+        arrays['wins'].append(cumulative(wins))
+        arrays['points'].append(cumulative(total_points))
+        arrays['breakdown_wins'].append(cumulative({m: theoretical[m][0] for m in managers}))
+        schedule = {}
+        for manager in managers:
+            if games[manager]:
+                faced = opponent_counts[manager]
+                schedule[manager] = sum(count * all_play_pct[opp] for opp, count in faced.items()) / games[manager]
+            else:
+                schedule[manager] = 0.0
+        arrays['schedule'].append(cumulative(schedule))
+
+    return {
+        'managers': managers,
+        'weeks': [week['week'] for week in season_weeks],
+        'weekly_scores': [week['scores'] for week in season_weeks],
+        'num_managers': num_managers,
+        **arrays,
+        # Memoized component values and scaled arrays, filled in on first use
+        'cache': {},
+    }
+
+def component_values(components: Dict, spec: Dict) -> List[List[Optional[float]]]:
+    """Raw week x manager values for a component spec (memoized per season)"""
+    key = ('values', spec['component'], _component_params(spec))
+    cache = components['cache']
+    if key not in cache:
+        name = spec['component']
+        if name == 'record':
+            cache[key] = components['wins']
+        elif name == 'points':
+            cache[key] = components['points']
+        elif name == 'breakdown':
+            cache[key] = components['breakdown_wins']
+        elif name == 'recent_form':
+            window = dict(_component_params(spec))['window']
+            sums = rolling_sums(components['weekly_scores'], window)
+            cache[key] = [
+                [round(week_sums[m], 2) if is_active else None for m, is_active in zip(components['managers'], active)]
+                for week_sums, active in zip(sums, components['active'])
+            ]
+        elif name == 'strength_of_schedule':
+            cache[key] = components['schedule']
+    return cache[key]
+
+def _rank_weeks(values: List[List[Optional[float]]]) -> List[List[Optional[float]]]:
+    """Rank every week of a season at once (average rank with ties, None stays None)"""
+    ranks = rank_with_ties_matrix(np.array(values, dtype=float))
+    return [[None if np.isnan(rank) else float(rank) for rank in week] for week in ranks]
+
+def _scale_week(values: List[Optional[float]], mode: str) -> List[Optional[float]]:
+    """Scale one week's values across the active managers"""
+    active = [value for value in values if value is not None]
+    if mode == 'value':
+        return list(values)
+
+    # zscore
+    count = len(active)
+    mean = sum(active) / count if count else 0.0
+    std = (sum((v - mean) ** 2 for v in active) / count) ** 0.5 if count else 0.0
+    return [None if v is None else ((v - mean) / std if std > 0 else 0.0) for v in values]
+
+def scaled_component(components: Dict, spec: Dict) -> List[List[Optional[float]]]:
+    """Week x manager component scaled by its mode (memoized per season)"""
+    mode = spec.get('mode', 'rank')
+    invert = bool(spec.get('invert', False))
+    key = ('scaled', spec['component'], _component_params(spec), mode, invert)
+    cache = components['cache']
+    if key not in cache:
+        values = component_values(components, spec)
+        if invert:
+            values = [[None if v is None else -v for v in week] for week in values]
+        if mode == 'rank':
+            cache[key] = _rank_weeks(values)
+        else:
+            cache[key] = [_scale_week(week, mode) for week in values]
+    return cache[key]
+
+def evaluate_formula(components: Dict, formula: Dict) -> List[List[Optional[float]]]:
+    """Weighted sum of a formula's scaled components, as a week x manager array"""
+    num_weeks = len(components['weeks'])
+    num_managers = components['num_managers']
+    totals = [[0.0] * num_managers for _ in range(num_weeks)]
+
+    for spec in formula['components']:
+        weight = spec.get('weight', 1)
+        scaled = scaled_component(components, spec)
+        for w in range(num_weeks):
+            week_totals = totals[w]
+            week_scaled = scaled[w]
+            for i in range(num_managers):
+                if week_scaled[i] is not None:
+                    week_totals[i] += weight * week_scaled[i]
+
+    # Managers who haven't played yet have no total
+    return [[total if active else None for total, active in zip(totals[w], components['active'][w])]
+            for w in range(num_weeks)]
+
+def evaluate_formulas(all_data: Dict[int, Dict], formulas: Dict[str, Dict]) -> Dict[int, Dict]:
+    """
+    Evaluate every formula for every season
+
+    Returns {season: {'components': ..., 'totals': {formula_name: week x manager array}}}.
+    """
+    results = {}
+    for season in sorted(all_data.keys()):
+        season_weeks = collect_season_weeks(all_data[season])
+        if not season_weeks:
+            continue
+        components = build_season_components(season_weeks)
+        results[season] = {
+            'components': components,
+            'totals': {name: evaluate_formula(components, formula) for name, formula in formulas.items()},
+        }
+    return results
+
+def export_formulas_csv(results: Dict[int, Dict], formula_names: List[str], output_file: Path):
+    """Write one row per season, week and manager with each formula's total"""
+    with open(output_file, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['Season', 'Week', 'Manager'] + [f"Total ({name})" for name in formula_names])
+        for season, result in results.items():
+            components = result['components']
+            for w, week in enumerate(components['weeks']):
+                for i, manager in enumerate(components['managers']):
+                    if not components['active'][w][i]:
+                        continue
+                    totals = [result['totals'][name][w][i] for name in formula_names]
+                    writer.writerow([season, week, manager] + [f"{total:.3f}" for total in totals])
+
+def main():
+    import sys
+
+    args = sys.argv[1:]
+    config_file = FORMULAS_FILE
+    if '--config' in args:
+        config_file = Path(args[args.index('--config') + 1])
+
+    formulas = load_formulas(config_file)
+    if '--formula' in args:
+        name = args[args.index('--formula') + 1]
+        if name not in formulas:
+            print(f"Error: Unknown formula '{name}'. Available: {', '.join(formulas)}")
+            sys.exit(1)
+        formulas = {name: formulas[name]}
+
+    all_data = load_all_seasons()
+    if not all_data:
+        return
+
+    print(f"\n{'='*60}")
+    print(f"Evaluating {len(formulas)} power ranking formulas")
+    print(f"{'='*60}\n")
+
+    start = time.perf_counter()
+    results = evaluate_formulas(all_data, formulas)
+    elapsed = time.perf_counter() - start
+    print(f"✓ Evaluated {len(formulas)} formulas over {len(results)} seasons in {elapsed:.3f}s")
+
+    # Final week leader for each season under each formula
+    for season, result in results.items():
+        components = result['components']
+        leaders = []
+        for name in formulas:
+            final_totals = result['totals'][name][-1]
+            best = max((total, manager) for total, manager in zip(final_totals, components['managers'])
+                       if total is not None)
+            leaders.append(f"{name}: {best[1]}")
+        print(f"  {season}  " + ", ".join(leaders))
+
+    output_file = OUTPUT_DIR / "power_rankings_formulas.csv"
+    export_formulas_csv(results, list(formulas), output_file)
+    print(f"\n✓ Saved formula totals to {output_file}")
+
+if __name__ == "__main__":
+    main()
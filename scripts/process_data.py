@@ -3,10 +3,15 @@ Process scraped ESPN data into formats useful for the website
 Calculates head-to-head records, all-time statistics, etc.
 """
 import json
+import os
+import re
+from bisect import bisect_left, bisect_right
 from pathlib import Path
 from collections import defaultdict
 from typing import Dict, List, Tuple
 
+from season_cache import compute_seasons, hash_source_files, memoize_seasons
+
 SCRIPT_DIR = Path(__file__).parent
 DATA_DIR = SCRIPT_DIR / "data"
 OUTPUT_DIR = SCRIPT_DIR.parent / "data"
@@ -43,8 +48,37 @@ def load_all_seasons() -> Dict[int, Dict]:
     # Convert string keys to int
     return {int(k): v for k, v in all_data.items()}
 
-def calculate_head_to_head(espn_data: Dict[int, Dict]) -> List[Dict]:
-    """Calculate head-to-head records between all managers"""
+def load_champions() -> Dict[int, Dict]:
+    """
+    Championship history from champions.js, keyed by year
+
+    Each year has champion, runnerUp and thirdPlace (None where unknown).
+    """
+    champs_file = OUTPUT_DIR / "champions.js"
+    champs_data = {}
+    if not champs_file.exists():
+        return champs_data
+
+    with open(champs_file, 'r') as f:
+        content = f.read()
+
+    # Each season is a flat { year: ..., champion: "...", ... } object
+    for block in re.finditer(r'\{([^{}]*)\}', content):
+        fields = dict(re.findall(r'(\w+):\s*("[^"]*"|null|\d+)', block.group(1)))
+        if 'year' not in fields or not fields['year'].isdigit():
+            continue
+        champs_data[int(fields['year'])] = {
+            key: fields[key].strip('"') if fields.get(key, 'null') != 'null' else None
+            for key in ('champion', 'runnerUp', 'thirdPlace')
+        }
+    return champs_data
+
+def calculate_season_head_to_head(data: Dict) -> Tuple[Dict, Dict]:
+    """Calculate head-to-head wins and ties for a single season
+
+    Returns (h2h_wins, h2h_ties), both keyed by sorted (manager1, manager2) pair
+    and then by manager first name.
+    """
     # Track wins and ties for each manager in each pair
     h2h_wins = defaultdict(lambda: defaultdict(int))
     h2h_ties = defaultdict(lambda: defaultdict(int))
@@ -52,244 +86,265 @@ def calculate_head_to_head(espn_data: Dict[int, Dict]) -> List[Dict]:
     # Strategy: Use matchup_type field if available (from updated scraper),
     # otherwise fall back to first occurrence pattern (validated with 2025 schedule)
     
-    for season, data in espn_data.items():
-        matchups = data.get('matchups', [])
-        
-        # Check if we have matchup_type field (new data) or need to use fallback
-        has_matchup_type = any(m.get('matchup_type') is not None for m in matchups[:10])
+    matchups = data.get('matchups', [])
+    
+    # Check if we have matchup_type field (new data) or need to use fallback
+    has_matchup_type = any(m.get('matchup_type') is not None for m in matchups[:10])
+    
+    # Group matchups by week
+    matchups_by_week = defaultdict(list)
+    for matchup in matchups:
+        week = matchup.get('week', 0)
+        if week > 0:
+            matchups_by_week[week].append(matchup)
+    
+    # Process each week separately
+    for week, week_matchups in matchups_by_week.items():
+        # Store original week_matchups for fallback
+        original_week_matchups = week_matchups.copy()
         
-        # Group matchups by week
-        matchups_by_week = defaultdict(list)
-        for matchup in matchups:
-            week = matchup.get('week', 0)
-            if week > 0:
-                matchups_by_week[week].append(matchup)
+        # Strategy 1: Filter by matchup_period_id (most reliable - from raw API analysis)
+        # Actual scheduled games for a week have matchupPeriodId == week
+        # Projected games have different matchupPeriodId values
+        # Check if we have this field in the data
+        has_matchup_period_id = any(m.get('matchup_period_id') is not None for m in week_matchups[:5])
         
-        # Process each week separately
-        for week, week_matchups in matchups_by_week.items():
-            # Store original week_matchups for fallback
-            original_week_matchups = week_matchups.copy()
-            
-            # Strategy 1: Filter by matchup_period_id (most reliable - from raw API analysis)
-            # Actual scheduled games for a week have matchupPeriodId == week
-            # Projected games have different matchupPeriodId values
-            # Check if we have this field in the data
-            has_matchup_period_id = any(m.get('matchup_period_id') is not None for m in week_matchups[:5])
+        if has_matchup_period_id:
+            filtered_matchups = []
+            for matchup in week_matchups:
+                matchup_period_id = matchup.get('matchup_period_id')
+                # If matchup_period_id matches the week, it's likely a scheduled game
+                if matchup_period_id == week:
+                    filtered_matchups.append(matchup)
             
-            if has_matchup_period_id:
-                filtered_matchups = []
-                for matchup in week_matchups:
-                    matchup_period_id = matchup.get('matchup_period_id')
-                    # If matchup_period_id matches the week, it's likely a scheduled game
-                    if matchup_period_id == week:
-                        filtered_matchups.append(matchup)
+            # Validate filtered results: should have exactly 5 games, all with winner_id or ties
+            # and each team should appear exactly once
+            if filtered_matchups:
+                # Apply basic filters to get valid games
+                valid_filtered = []
+                for matchup in filtered_matchups:
+                    home_id = matchup.get('home_team_id')
+                    away_id = matchup.get('away_team_id')
+                    home_score = matchup.get('home_score', 0)
+                    away_score = matchup.get('away_score', 0)
+                    winner_id = matchup.get('winner_id')
+                    
+                    if home_id is None or away_id is None:
+                        continue
+                    # Allow games with winner_id OR ties (home_score == away_score)
+                    is_tie = (home_score == away_score and home_score > 0)
+                    if not winner_id and not is_tie:
+                        continue
+                    if home_score == 0 and away_score == 0:
+                        continue
+                    if home_score < 50 and away_score < 50:
+                        continue
+                    
+                    valid_filtered.append(matchup)
                 
-                # Validate filtered results: should have exactly 5 games, all with winner_id or ties
-                # and each team should appear exactly once
-                if filtered_matchups:
-                    # Apply basic filters to get valid games
-                    valid_filtered = []
-                    for matchup in filtered_matchups:
+                # Check if we have exactly 5 games and each team appears once
+                if len(valid_filtered) == 5:
+                    # Check that each team appears exactly once
+                    team_counts = {}
+                    for matchup in valid_filtered:
                         home_id = matchup.get('home_team_id')
                         away_id = matchup.get('away_team_id')
-                        home_score = matchup.get('home_score', 0)
-                        away_score = matchup.get('away_score', 0)
-                        winner_id = matchup.get('winner_id')
-                        
-                        if home_id is None or away_id is None:
-                            continue
-                        # Allow games with winner_id OR ties (home_score == away_score)
-                        is_tie = (home_score == away_score and home_score > 0)
-                        if not winner_id and not is_tie:
-                            continue
-                        if home_score == 0 and away_score == 0:
-                            continue
-                        if home_score < 50 and away_score < 50:
-                            continue
-                        
-                        valid_filtered.append(matchup)
+                        team_counts[home_id] = team_counts.get(home_id, 0) + 1
+                        team_counts[away_id] = team_counts.get(away_id, 0) + 1
+                    
+                    # All teams should appear exactly once (10 teams, 5 games)
+                    all_appear_once = all(count == 1 for count in team_counts.values())
                     
-                    # Check if we have exactly 5 games and each team appears once
-                    if len(valid_filtered) == 5:
-                        # Check that each team appears exactly once
-                        team_counts = {}
-                        for matchup in valid_filtered:
-                            home_id = matchup.get('home_team_id')
-                            away_id = matchup.get('away_team_id')
-                            team_counts[home_id] = team_counts.get(home_id, 0) + 1
-                            team_counts[away_id] = team_counts.get(away_id, 0) + 1
-                        
-                        # All teams should appear exactly once (10 teams, 5 games)
-                        all_appear_once = all(count == 1 for count in team_counts.values())
-                        
-                        if all_appear_once:
-                            # Validation passed - use filtered matchups
-                            week_matchups = filtered_matchups
-                        else:
-                            # Validation failed - fall back to original
-                            week_matchups = original_week_matchups
+                    if all_appear_once:
+                        # Validation passed - use filtered matchups
+                        week_matchups = filtered_matchups
                     else:
-                        # Not exactly 5 games - fall back to original
+                        # Validation failed - fall back to original
                         week_matchups = original_week_matchups
                 else:
-                    # No filtered matchups - fall back to original
+                    # Not exactly 5 games - fall back to original
                     week_matchups = original_week_matchups
+            else:
+                # No filtered matchups - fall back to original
+                week_matchups = original_week_matchups
+        
+        # Strategy 2: If we have matchup_type, filter by it (secondary filter)
+        if has_matchup_type:
+            # Filter to only scheduled matchups (not projected)
+            scheduled_matchups = []
+            for matchup in week_matchups:
+                matchup_type = matchup.get('matchup_type')
+                # ESPN uses 'SCHEDULED' or similar for actual games
+                # Projected games might be 'PROJECTED', None, or other values
+                if matchup_type and 'SCHEDULED' in str(matchup_type).upper():
+                    scheduled_matchups.append(matchup)
             
-            # Strategy 2: If we have matchup_type, filter by it (secondary filter)
-            if has_matchup_type:
-                # Filter to only scheduled matchups (not projected)
-                scheduled_matchups = []
-                for matchup in week_matchups:
-                    matchup_type = matchup.get('matchup_type')
-                    # ESPN uses 'SCHEDULED' or similar for actual games
-                    # Projected games might be 'PROJECTED', None, or other values
-                    if matchup_type and 'SCHEDULED' in str(matchup_type).upper():
-                        scheduled_matchups.append(matchup)
-                
-                # If we found scheduled matchups, use them
-                if scheduled_matchups:
-                    week_matchups = scheduled_matchups
+            # If we found scheduled matchups, use them
+            if scheduled_matchups:
+                week_matchups = scheduled_matchups
+        
+        # Strategy 3: Fallback - use first occurrence pattern
+        # Track first occurrence of each unique team pair
+        first_occurrence = {}  # team_pair -> matchup
+        seen_pairs = set()
+        
+        # Process matchups in order - first occurrence is the real game
+        for matchup in week_matchups:
+            home_mgr = matchup.get('home_manager')
+            away_mgr = matchup.get('away_manager')
+            home_id = matchup.get('home_team_id')
+            away_id = matchup.get('away_team_id')
+            home_score = matchup.get('home_score', 0)
+            away_score = matchup.get('away_score', 0)
+            winner_id = matchup.get('winner_id')
+            is_bye = matchup.get('is_bye', False)
             
-            # Strategy 3: Fallback - use first occurrence pattern
-            # Track first occurrence of each unique team pair
-            first_occurrence = {}  # team_pair -> matchup
-            seen_pairs = set()
+            # Skip matchups with null team IDs (bye weeks, incomplete matchups)
+            if home_id is None or away_id is None:
+                continue
             
-            # Process matchups in order - first occurrence is the real game
-            for matchup in week_matchups:
-                home_mgr = matchup.get('home_manager')
-                away_mgr = matchup.get('away_manager')
-                home_id = matchup.get('home_team_id')
-                away_id = matchup.get('away_team_id')
-                home_score = matchup.get('home_score', 0)
-                away_score = matchup.get('away_score', 0)
-                winner_id = matchup.get('winner_id')
-                is_bye = matchup.get('is_bye', False)
-                
-                # Skip matchups with null team IDs (bye weeks, incomplete matchups)
-                if home_id is None or away_id is None:
-                    continue
-                
-                # Skip bye weeks
-                if is_bye:
-                    continue
-                
-                # Skip matchups with "Team None" managers (invalid matchups)
-                if not home_mgr or not away_mgr:
-                    continue
-                if 'Team None' in home_mgr or 'Team None' in away_mgr:
-                    continue
-                
-                # Skip games with 0-0 scores (not real games)
-                if home_score == 0 and away_score == 0:
-                    continue
-                
-                # Filter out unrealistic scores (both teams <50 points suggests placeholder/fake game)
-                if home_score < 50 and away_score < 50:
-                    continue
-                
-                # Only process games with winner_id (completed games) OR ties (home_score == away_score)
-                # Ties have winner_id == None, so we need to check for ties separately
-                is_tie = (home_score == away_score and home_score > 0)
-                if not winner_id and not is_tie:
-                    continue
-                
-                # Create unique key for this team pair
-                team_pair = tuple(sorted([home_id, away_id]))
-                
-                # Track first occurrence of each team pair
-                # This is the actual scheduled game (validated with 2025 schedule)
-                if team_pair not in seen_pairs:
-                    seen_pairs.add(team_pair)
-                    first_occurrence[team_pair] = matchup
+            # Skip bye weeks
+            if is_bye:
+                continue
             
-            # Process first occurrences - identify which 5 are the actual scheduled games
-            # Strategy: Select 5 games such that each team appears exactly once
-            # (10-team league = 5 matchups, so each team plays exactly once per week)
+            # Skip matchups with "Team None" managers (invalid matchups)
+            if not home_mgr or not away_mgr:
+                continue
+            if 'Team None' in home_mgr or 'Team None' in away_mgr:
+                continue
             
-            # Get the order of first occurrences as they appear in week_matchups
-            first_occurrence_ordered = []
-            seen_in_order = set()
+            # Skip games with 0-0 scores (not real games)
+            if home_score == 0 and away_score == 0:
+                continue
             
-            for matchup in week_matchups:
-                home_id = matchup.get('home_team_id')
-                away_id = matchup.get('away_team_id')
-                winner_id = matchup.get('winner_id')
-                home_score = matchup.get('home_score', 0)
-                away_score = matchup.get('away_score', 0)
-                
-                # Allow games with winner_id OR ties (home_score == away_score)
-                is_tie = (home_score == away_score and home_score > 0)
-                if home_id is None or away_id is None or (not winner_id and not is_tie):
-                    continue
-                
-                team_pair = tuple(sorted([home_id, away_id]))
-                
-                # Only add if this is the first occurrence and we haven't seen it yet in order
-                if team_pair in first_occurrence and team_pair not in seen_in_order:
-                    seen_in_order.add(team_pair)
-                    first_occurrence_ordered.append((team_pair, matchup))
+            # Filter out unrealistic scores (both teams <50 points suggests placeholder/fake game)
+            if home_score < 50 and away_score < 50:
+                continue
             
-            # Select 5 games ensuring each team appears exactly once
-            selected_games = []
-            used_teams = set()
+            # Only process games with winner_id (completed games) OR ties (home_score == away_score)
+            # Ties have winner_id == None, so we need to check for ties separately
+            is_tie = (home_score == away_score and home_score > 0)
+            if not winner_id and not is_tie:
+                continue
             
-            for team_pair, matchup in first_occurrence_ordered:
-                if len(selected_games) >= 5:
-                    break
-                
-                home_id = matchup.get('home_team_id')
-                away_id = matchup.get('away_team_id')
-                
-                # Only add if neither team has been used yet
-                if home_id not in used_teams and away_id not in used_teams:
-                    selected_games.append((team_pair, matchup))
-                    used_teams.add(home_id)
-                    used_teams.add(away_id)
+            # Create unique key for this team pair
+            team_pair = tuple(sorted([home_id, away_id]))
             
-            # If we didn't get 5 games with the "each team once" constraint,
-            # fall back to first 5 first occurrences
-            if len(selected_games) < 5:
-                selected_games = first_occurrence_ordered[:5]
+            # Track first occurrence of each team pair
+            # This is the actual scheduled game (validated with 2025 schedule)
+            if team_pair not in seen_pairs:
+                seen_pairs.add(team_pair)
+                first_occurrence[team_pair] = matchup
+        
+        # Process first occurrences - identify which 5 are the actual scheduled games
+        # Strategy: Select 5 games such that each team appears exactly once
+        # (10-team league = 5 matchups, so each team plays exactly once per week)
+        
+        # Get the order of first occurrences as they appear in week_matchups
+        first_occurrence_ordered = []
+        seen_in_order = set()
+        
+        for matchup in week_matchups:
+            home_id = matchup.get('home_team_id')
+            away_id = matchup.get('away_team_id')
+            winner_id = matchup.get('winner_id')
+            home_score = matchup.get('home_score', 0)
+            away_score = matchup.get('away_score', 0)
             
-            # Process selected games
-            games_counted = 0
-            for team_pair, matchup in selected_games:
-                
-                games_counted += 1
-                
-                home_mgr = matchup.get('home_manager')
-                away_mgr = matchup.get('away_manager')
-                home_score = matchup.get('home_score', 0)
-                away_score = matchup.get('away_score', 0)
-                
-                # Convert to first names
-                home_first = extract_first_name(home_mgr)
-                away_first = extract_first_name(away_mgr)
-                
-                # Skip if same person (shouldn't happen, but just in case)
-                if home_first == away_first:
-                    continue
-                
-                # Create sorted key for pair (always same order)
-                pair_key = tuple(sorted([home_first, away_first]))
-                
-                # Record the result
-                if home_score > away_score:
-                    h2h_wins[pair_key][home_first] += 1
-                elif away_score > home_score:
-                    h2h_wins[pair_key][away_first] += 1
-                elif home_score == away_score:
-                    # Ties: both managers get a tie
-                    h2h_ties[pair_key][home_first] += 1
-                    h2h_ties[pair_key][away_first] += 1
+            # Allow games with winner_id OR ties (home_score == away_score)
+            is_tie = (home_score == away_score and home_score > 0)
+            if home_id is None or away_id is None or (not winner_id and not is_tie):
+                continue
+            
+            team_pair = tuple(sorted([home_id, away_id]))
+            
+            # Only add if this is the first occurrence and we haven't seen it yet in order
+            if team_pair in first_occurrence and team_pair not in seen_in_order:
+                seen_in_order.add(team_pair)
+                first_occurrence_ordered.append((team_pair, matchup))
+        
+        # Select 5 games ensuring each team appears exactly once
+        selected_games = []
+        used_teams = set()
+        
+        for team_pair, matchup in first_occurrence_ordered:
+            if len(selected_games) >= 5:
+                break
+            
+            home_id = matchup.get('home_team_id')
+            away_id = matchup.get('away_team_id')
+            
+            # Only add if neither team has been used yet
+            if home_id not in used_teams and away_id not in used_teams:
+                selected_games.append((team_pair, matchup))
+                used_teams.add(home_id)
+                used_teams.add(away_id)
+        
+        # If we didn't get 5 games with the "each team once" constraint,
+        # fall back to first 5 first occurrences
+        if len(selected_games) < 5:
+            selected_games = first_occurrence_ordered[:5]
+        
+        # Process selected games
+        games_counted = 0
+        for team_pair, matchup in selected_games:
+            
+            games_counted += 1
+            
+            home_mgr = matchup.get('home_manager')
+            away_mgr = matchup.get('away_manager')
+            home_score = matchup.get('home_score', 0)
+            away_score = matchup.get('away_score', 0)
+            
+            # Convert to first names
+            home_first = extract_first_name(home_mgr)
+            away_first = extract_first_name(away_mgr)
+            
+            # Skip if same person (shouldn't happen, but just in case)
+            if home_first == away_first:
+                continue
+            
+            # Create sorted key for pair (always same order)
+            pair_key = tuple(sorted([home_first, away_first]))
+            
+            # Record the result
+            if home_score > away_score:
+                h2h_wins[pair_key][home_first] += 1
+            elif away_score > home_score:
+                h2h_wins[pair_key][away_first] += 1
+            elif home_score == away_score:
+                # Ties: both managers get a tie
+                h2h_ties[pair_key][home_first] += 1
+                h2h_ties[pair_key][away_first] += 1
     
+    return h2h_wins, h2h_ties
+
+def calculate_head_to_head(espn_data: Dict[int, Dict]) -> List[Dict]:
+    """Calculate head-to-head records between all managers"""
+    # Track wins and ties for each manager in each pair
+    h2h_wins = defaultdict(lambda: defaultdict(int))
+    h2h_ties = defaultdict(lambda: defaultdict(int))
+    
+    for season, data in espn_data.items():
+        season_wins, season_ties = calculate_season_head_to_head(data)
+        for pair_key, records in season_wins.items():
+            for manager, count in records.items():
+                h2h_wins[pair_key][manager] += count
+        for pair_key, records in season_ties.items():
+            for manager, count in records.items():
+                h2h_ties[pair_key][manager] += count
+    
+    return format_head_to_head_records(h2h_wins, h2h_ties)
+
+def format_head_to_head_records(h2h_wins: Dict, h2h_ties: Dict) -> List[Dict]:
+    """Convert pair win/tie tallies into the headToHead.js record list"""
     # Convert to list format
     results = []
     # Get all unique pairs from both wins and ties
     all_pairs = set(h2h_wins.keys()) | set(h2h_ties.keys())
     
-    for pair_key in all_pairs:
+    # Iterate pairs in a fixed order so regenerated files don't reshuffle
+    for pair_key in sorted(all_pairs):
         wins_records = h2h_wins.get(pair_key, {})
         ties_records = h2h_ties.get(pair_key, {})
         
@@ -323,6 +378,152 @@ def calculate_head_to_head(espn_data: Dict[int, Dict]) -> List[Dict]:
     
     return results
 
+def group_head_to_head_by_manager(h2h_records: List[Dict]) -> List[Dict]:
+    """
+    Group pair records into one entry per manager, ready for the head-to-head page
+
+    Each manager gets their record against every opponent plus overall totals.
+    Opponents are sorted by games played and managers by win percentage.
+    """
+    by_manager = {}
+    
+    def add_record(manager: str, opponent: str, wins: int, losses: int, ties: int):
+        if manager not in by_manager:
+            by_manager[manager] = {
+                'manager': manager,
+                'records': [],
+                'totalWins': 0,
+                'totalLosses': 0,
+                'totalTies': 0,
+                'totalGames': 0,
+                'winPercentage': 0,
+            }
+        data = by_manager[manager]
+        data['records'].append({
+            'opponent': opponent,
+            'wins': wins,
+            'losses': losses,
+            'ties': ties,
+            'record': f"{wins}-{losses}-{ties}" if ties > 0 else f"{wins}-{losses}",
+        })
+        data['totalWins'] += wins
+        data['totalLosses'] += losses
+        data['totalTies'] += ties
+        data['totalGames'] += wins + losses + ties
+    
+    for record in h2h_records:
+        ties = record.get('ties', 0)
+        add_record(record['manager1'], record['manager2'], record['manager1Wins'], record['manager2Wins'], ties)
+        add_record(record['manager2'], record['manager1'], record['manager2Wins'], record['manager1Wins'], ties)
+    
+    results = []
+    for data in by_manager.values():
+        if data['totalGames'] > 0:
+            data['winPercentage'] = data['totalWins'] / data['totalGames'] * 100
+        # Most played opponents first
+        data['records'].sort(key=lambda r: r['wins'] + r['losses'], reverse=True)
+        results.append(data)
+    
+    # Best win percentage first
+    results.sort(key=lambda d: d['winPercentage'], reverse=True)
+    
+    return results
+
+def build_head_to_head_cube(espn_data: Dict[int, Dict], season_summaries: Dict[int, Dict] = None) -> Dict:
+    """
+    Build a season x manager x manager head-to-head cube with prefix sums over seasons
+
+    wins[k][i][j] is the number of games manager i won against manager j in
+    seasons[0..k-1] (so wins[0] is all zeros), and ties[k][i][j] likewise for ties.
+    Any season range is then answered with one subtraction per pair.
+    """
+    if season_summaries is None:
+        season_summaries = calculate_season_summaries(espn_data)
+    
+    seasons = sorted(season_summaries.keys())
+    season_results = [season_summaries[season]['head_to_head'] for season in seasons]
+
+    # Collect every manager that appears in any pair
+    managers = set()
+    for head_to_head in season_results:
+        for record in head_to_head:
+            managers.update((record['manager1'], record['manager2']))
+    managers = sorted(managers)
+    index = {manager: i for i, manager in enumerate(managers)}
+    size = len(managers)
+
+    wins = [[[0] * size for _ in range(size)]]
+    ties = [[[0] * size for _ in range(size)]]
+
+    for head_to_head in season_results:
+        # Start from the previous prefix and add this season's games
+        season_win_matrix = [row[:] for row in wins[-1]]
+        season_tie_matrix = [row[:] for row in ties[-1]]
+
+        for record in head_to_head:
+            i, j = index[record['manager1']], index[record['manager2']]
+            season_win_matrix[i][j] += record['manager1Wins']
+            season_win_matrix[j][i] += record['manager2Wins']
+            season_tie_matrix[i][j] += record['ties']
+            season_tie_matrix[j][i] += record['ties']
+
+        wins.append(season_win_matrix)
+        ties.append(season_tie_matrix)
+
+    return {
+        'seasons': seasons,
+        'managers': managers,
+        'wins': wins,
+        'ties': ties,
+    }
+
+def query_head_to_head_range(cube: Dict, start_season: int = None, end_season: int = None) -> List[Dict]:
+    """
+    Get head-to-head records for an inclusive season range from a cube
+
+    Omitting start_season or end_season leaves that end of the range open.
+    Returns records in the same format as calculate_head_to_head.
+    """
+    seasons = cube['seasons']
+    managers = cube['managers']
+    start = 0 if start_season is None else bisect_left(seasons, start_season)
+    end = len(seasons) if end_season is None else bisect_right(seasons, end_season)
+
+    h2h_wins = defaultdict(lambda: defaultdict(int))
+    h2h_ties = defaultdict(lambda: defaultdict(int))
+
+    if start >= end:
+        return []
+
+    wins_end, wins_start = cube['wins'][end], cube['wins'][start]
+    ties_end, ties_start = cube['ties'][end], cube['ties'][start]
+
+    for i, mgr1 in enumerate(managers):
+        for j in range(i + 1, len(managers)):
+            mgr2 = managers[j]
+            pair_key = (mgr1, mgr2)
+            wins1 = wins_end[i][j] - wins_start[i][j]
+            wins2 = wins_end[j][i] - wins_start[j][i]
+            ties = ties_end[i][j] - ties_start[i][j]
+            if wins1:
+                h2h_wins[pair_key][mgr1] = wins1
+            if wins2:
+                h2h_wins[pair_key][mgr2] = wins2
+            if ties:
+                h2h_ties[pair_key][mgr1] = ties
+                h2h_ties[pair_key][mgr2] = ties
+
+    return format_head_to_head_records(h2h_wins, h2h_ties)
+
+def compact_head_to_head_cube(cube: Dict) -> Dict:
+    """Flatten each prefix matrix to a row-major list for the website"""
+    return {
+        'seasons': cube['seasons'],
+        'managers': cube['managers'],
+        'wins': [[count for row in matrix for count in row] for matrix in cube['wins']],
+        'ties': [[count for row in matrix for count in row] for matrix in cube['ties']],
+    }
+
 def get_valid_regular_season_matchups(week_matchups: List[Dict], week: int, has_matchup_type: bool) -> List[Dict]:
     """Extract valid regular season matchups for a week using the same filtering logic as head-to-head"""
     original_week_matchups = week_matchups.copy()
@@ -462,51 +663,157 @@ def get_valid_regular_season_matchups(week_matchups: List[Dict], week: int, has_
     # Return just the matchups
     return [matchup for _, matchup in selected_games]
 
-def calculate_season_totals_from_matchups(espn_data: Dict[int, Dict]) -> Tuple[Dict[Tuple[int, str], float], Dict[str, int]]:
+def resolve_season_games(season: int, data: Dict) -> List[Dict]:
+    """
+    Get the resolved regular season games for a season, in week order
+
+    Uses the same game selection as the season totals and all-time stats.
+    Each game has season, week, home/away manager first names and scores.
+    """
+    matchups = data.get('matchups', [])
+    has_matchup_type = any(m.get('matchup_type') is not None for m in matchups[:10])
+
+    # Group matchups by week
+    matchups_by_week = defaultdict(list)
+    for matchup in matchups:
+        week = matchup.get('week', 0)
+        if week > 0:
+            matchups_by_week[week].append(matchup)
+
+    games = []
+    for week in sorted(matchups_by_week.keys()):
+        valid_matchups = get_valid_regular_season_matchups(matchups_by_week[week], week, has_matchup_type)
+
+        for matchup in valid_matchups:
+            home_mgr = matchup.get('home_manager', '')
+            away_mgr = matchup.get('away_manager', '')
+
+            if not home_mgr or not away_mgr:
+                continue
+            if 'Team None' in home_mgr or 'Team None' in away_mgr:
+                continue
+
+            games.append({
+                'season': season,
+                'week': week,
+                'home': extract_first_name(home_mgr),
+                'away': extract_first_name(away_mgr),
+                'home_score': matchup.get('home_score', 0),
+                'away_score': matchup.get('away_score', 0),
+            })
+
+    return games
+
+def calculate_season_summary(season: int, data: Dict) -> Dict:
+    """
+    Calculate the per-season intermediates that all-time outputs are merged from
+
+    Includes the resolved games, weekly scores, head-to-head results, point
+    totals, games played, deduplicated single game scores and standings records.
+    Everything is JSON-serializable so it can be memoized per season.
+    """
+    games = resolve_season_games(season, data)
+    
+    # Head-to-head results for this season
+    season_wins, season_ties = calculate_season_head_to_head(data)
+    head_to_head = []
+    for pair_key in sorted(set(season_wins.keys()) | set(season_ties.keys())):
+        mgr1, mgr2 = pair_key
+        wins_records = season_wins.get(pair_key, {})
+        ties_records = season_ties.get(pair_key, {})
+        head_to_head.append({
+            'manager1': mgr1,
+            'manager2': mgr2,
+            'manager1Wins': wins_records.get(mgr1, 0),
+            'manager2Wins': wins_records.get(mgr2, 0),
+            # Ties are recorded for both managers in a pair
+            'ties': max(ties_records.get(mgr1, 0), ties_records.get(mgr2, 0)),
+        })
+    
+    # Weekly scores, point totals and games played from regular season games only
+    weekly_scores = defaultdict(dict)  # week -> manager -> score
+    season_points = defaultdict(float)  # manager -> total points
+    games_played = defaultdict(int)  # manager -> games played
+    single_games = []
+    seen_games = set()  # Track (week, manager, score) to deduplicate
+    
+    for game in games:
+        for manager, score in ((game['home'], game['home_score']), (game['away'], game['away_score'])):
+            weekly_scores[game['week']][manager] = score
+            season_points[manager] += score
+            games_played[manager] += 1
+            
+            if score > 0:
+                game_key = (game['week'], manager, score)
+                if game_key not in seen_games:
+                    seen_games.add(game_key)
+                    single_games.append({
+                        'score': score,
+                        'manager': manager,
+                        'week': game['week'],
+                        'season': season,
+                    })
+    
+    # Season records from standings
+    standings = []
+    for team in data.get('standings', []):
+        standings.append({
+            'manager': extract_first_name(team.get('manager', '')),
+            'wins': team.get('wins', 0),
+            'losses': team.get('losses', 0),
+        })
+    
+    return {
+        'season': season,
+        'games': games,
+        'weekly_scores': [{'week': week, 'scores': scores} for week, scores in sorted(weekly_scores.items())],
+        'head_to_head': head_to_head,
+        'season_points': dict(season_points),
+        'games_played': dict(games_played),
+        'single_games': single_games,
+        'standings': standings,
+    }
+
+def calculate_season_summaries(espn_data: Dict[int, Dict], use_cache: bool = False, jobs: int = 1) -> Dict[int, Dict]:
+    """
+    Get calculate_season_summary for every season, keyed by season
+
+    Seasons are independent until the all-time merge, so with jobs > 1 they
+    are computed in a process pool. With use_cache, summaries are memoized per
+    season keyed by a hash of the season's data and of this file, so only
+    seasons whose data changed are recomputed.
+    """
+    if not use_cache:
+        return compute_seasons(espn_data, calculate_season_summary, jobs)
+    
+    code_hash = hash_source_files([Path(__file__)])
+    summaries, recomputed = memoize_seasons(espn_data, calculate_season_summary, code_hash, jobs=jobs)
+    reused = len(summaries) - len(recomputed)
+    print(f"✓ Reused {reused} cached season{'s' if reused != 1 else ''}, "
+          f"recomputed {len(recomputed)}{': ' + ', '.join(map(str, recomputed)) if recomputed else ''}")
+    return summaries
+
+def calculate_season_totals_from_matchups(espn_data: Dict[int, Dict], season_summaries: Dict[int, Dict] = None) -> Tuple[Dict[Tuple[int, str], float], Dict[str, int]]:
     """Calculate season point totals and total games played from regular season matchups only"""
+    if season_summaries is None:
+        season_summaries = calculate_season_summaries(espn_data)
+    
     season_totals = defaultdict(float)  # (season, manager) -> total points
     total_games = defaultdict(int)  # manager -> total games played
     
-    for season, data in espn_data.items():
-        matchups = data.get('matchups', [])
-        has_matchup_type = any(m.get('matchup_type') is not None for m in matchups[:10])
-        
-        # Group matchups by week
-        matchups_by_week = defaultdict(list)
-        for matchup in matchups:
-            week = matchup.get('week', 0)
-            if week > 0:
-                matchups_by_week[week].append(matchup)
-        
-        # Process each week
-        for week, week_matchups in matchups_by_week.items():
-            valid_matchups = get_valid_regular_season_matchups(week_matchups, week, has_matchup_type)
-            
-            for matchup in valid_matchups:
-                home_mgr = matchup.get('home_manager', '')
-                away_mgr = matchup.get('away_manager', '')
-                home_score = matchup.get('home_score', 0)
-                away_score = matchup.get('away_score', 0)
-                
-                if not home_mgr or not away_mgr:
-                    continue
-                if 'Team None' in home_mgr or 'Team None' in away_mgr:
-                    continue
-                
-                home_first = extract_first_name(home_mgr)
-                away_first = extract_first_name(away_mgr)
-                
-                season_totals[(season, home_first)] += home_score
-                season_totals[(season, away_first)] += away_score
-                
-                # Count games played (each matchup = 1 game per manager)
-                total_games[home_first] += 1
-                total_games[away_first] += 1
+    for season, summary in season_summaries.items():
+        for manager, points in summary['season_points'].items():
+            season_totals[(season, manager)] += points
+        for manager, games in summary['games_played'].items():
+            total_games[manager] += games
     
     return season_totals, total_games
 
-def calculate_all_time_stats(espn_data: Dict[int, Dict]) -> Dict:
-    """Calculate all-time statistics"""
+def calculate_all_time_stats(espn_data: Dict[int, Dict], season_summaries: Dict[int, Dict] = None) -> Dict:
+    """Calculate all-time statistics by merging per-season summaries"""
+    if season_summaries is None:
+        season_summaries = calculate_season_summaries(espn_data)
+    
     stats = {
         'all_single_games': [],  # List of all single game scores
         'all_season_totals': [],  # List of all season totals
@@ -517,70 +824,17 @@ def calculate_all_time_stats(espn_data: Dict[int, Dict]) -> Dict:
     }
     
     # Calculate season totals from regular season matchups only
-    season_totals, total_games = calculate_season_totals_from_matchups(espn_data)
+    season_totals, total_games = calculate_season_totals_from_matchups(espn_data, season_summaries)
     
-    for season, data in espn_data.items():
-        matchups = data.get('matchups', [])
-        standings = data.get('standings', [])
-        
-        # Use the same filtering logic as head-to-head to get valid regular season games
-        has_matchup_type = any(m.get('matchup_type') is not None for m in matchups[:10])
-        
-        # Group matchups by week
-        matchups_by_week = defaultdict(list)
-        for matchup in matchups:
-            week = matchup.get('week', 0)
-            if week > 0:
-                matchups_by_week[week].append(matchup)
-        
-        # Process each week to get valid games only
-        seen_games = set()  # Track (season, week, manager, score) to deduplicate
-        for week, week_matchups in matchups_by_week.items():
-            valid_matchups = get_valid_regular_season_matchups(week_matchups, week, has_matchup_type)
-            
-            for matchup in valid_matchups:
-                home_mgr = matchup.get('home_manager', '')
-                away_mgr = matchup.get('away_manager', '')
-                home_score = matchup.get('home_score', 0)
-                away_score = matchup.get('away_score', 0)
-                
-                if not home_mgr or not away_mgr:
-                    continue
-                if 'Team None' in home_mgr or 'Team None' in away_mgr:
-                    continue
-                
-                home_mgr_first = extract_first_name(home_mgr)
-                away_mgr_first = extract_first_name(away_mgr)
-                
-                # Collect home score (deduplicate)
-                if home_score > 0:
-                    game_key = (season, week, home_mgr_first, home_score)
-                    if game_key not in seen_games:
-                        seen_games.add(game_key)
-                        stats['all_single_games'].append({
-                            'score': home_score,
-                            'manager': home_mgr_first,
-                            'week': week,
-                            'season': season,
-                        })
-                
-                # Collect away score (deduplicate)
-                if away_score > 0:
-                    game_key = (season, week, away_mgr_first, away_score)
-                    if game_key not in seen_games:
-                        seen_games.add(game_key)
-                        stats['all_single_games'].append({
-                            'score': away_score,
-                            'manager': away_mgr_first,
-                            'week': week,
-                            'season': season,
-                        })
+    for season, summary in season_summaries.items():
+        # Single game scores were already deduplicated per season
+        stats['all_single_games'].extend(summary['single_games'])
         
         # Collect all season records from standings
-        for team in standings:
-            manager = extract_first_name(team.get('manager', ''))
-            wins = team.get('wins', 0)
-            losses = team.get('losses', 0)
+        for team in summary['standings']:
+            manager = team['manager']
+            wins = team['wins']
+            losses = team['losses']
             
             if wins + losses > 0:  # Only include valid records
                 stats['all_season_records'].append({
@@ -612,9 +866,290 @@ def calculate_all_time_stats(espn_data: Dict[int, Dict]) -> Dict:
     
     return stats
 
-def generate_all_time_records(espn_data: Dict[int, Dict], champs_data: Dict) -> List[Dict]:
+def build_manager_game_logs(season_summaries: Dict[int, Dict]) -> Dict[str, List[Dict]]:
+    """
+    Every manager's resolved regular season games in chronological order
+
+    Seasons run back to back, so a manager's log spans season boundaries.
+    Each entry has season, week, opponent, score, opponent score and result
+    ('W', 'L' or 'T').
+    """
+    logs = defaultdict(list)
+    for season in sorted(season_summaries.keys()):
+        for game in season_summaries[season]['games']:
+            for manager, opponent, score, opponent_score in (
+                (game['home'], game['away'], game['home_score'], game['away_score']),
+                (game['away'], game['home'], game['away_score'], game['home_score']),
+            ):
+                logs[manager].append({
+                    'season': season,
+                    'week': game['week'],
+                    'opponent': opponent,
+                    'score': score,
+                    'opponent_score': opponent_score,
+                    'result': 'W' if score > opponent_score else 'L' if score < opponent_score else 'T',
+                })
+    return dict(logs)
+
+def run_length_encode(values: List) -> List[Tuple]:
+    """Runs of equal consecutive values as (value, start index, length)"""
+    runs = []
+    for i, value in enumerate(values):
+        if runs and runs[-1][0] == value:
+            runs[-1] = (value, runs[-1][1], runs[-1][2] + 1)
+        else:
+            runs.append((value, i, 1))
+    return runs
+
+# Streak kinds: name -> (per-game value, value that counts as the streak, unit, plural unit)
+STREAK_KINDS = {
+    'win': (lambda g: g['result'], 'W', 'win', 'wins'),
+    'loss': (lambda g: g['result'], 'L', 'loss', 'losses'),
+    '100_point': (lambda g: g['score'] >= 100, True, 'game of 100+', 'games of 100+'),
+}
+
+def calculate_streaks(game_logs: Dict[str, List[Dict]]) -> Dict[str, List[Dict]]:
+    """
+    Every win, loss and 100+ point streak of every manager
+
+    Each manager's log is run-length encoded once per streak kind. Returns
+    kind -> streaks with manager, length, first and last game and whether
+    the streak is still active (it runs through the league's latest week,
+    so managers who have left or sat out a season never have one).
+    """
+    latest_week = max(((log[-1]['season'], log[-1]['week']) for log in game_logs.values() if log), default=None)
+    streaks = {kind: [] for kind in STREAK_KINDS}
+    for manager, log in game_logs.items():
+        for kind, (key, streak_value, _, _) in STREAK_KINDS.items():
+            for value, start, length in run_length_encode([key(game) for game in log]):
+                if value != streak_value:
+                    continue
+                streaks[kind].append({
+                    'manager': manager,
+                    'length': length,
+                    'first': log[start],
+                    'last': log[start + length - 1],
+                    'active': (log[start + length - 1]['season'], log[start + length - 1]['week']) == latest_week,
+                })
+    return streaks
+
+def format_streak_span(streak: Dict) -> str:
+    first, last = streak['first'], streak['last']
+    if streak['length'] == 1:
+        return f"Week {first['week']}, {first['season']}"
+    if first['season'] == last['season']:
+        return f"Weeks {first['week']}-{last['week']}, {first['season']}"
+    return f"Week {first['week']}, {first['season']} - Week {last['week']}, {last['season']}"
+
+def generate_streak_records(game_logs: Dict[str, List[Dict]]) -> List[Dict]:
+    """Longest win, loss, 100+ point and active streak records (top 5 each)"""
+    streaks = calculate_streaks(game_logs)
+
+    def top5(candidates: List[Dict], describe) -> List[Dict]:
+        # Longest first; ties go to whoever got there first
+        ranked = sorted(candidates, key=lambda s: (-s['length'], s['last']['season'], s['last']['week'], s['manager']))
+        return [{
+            'rank': idx,
+            'holder': streak['manager'],
+            'record': describe(streak),
+            'details': format_streak_span(streak) + (" (active)" if streak['active'] else ""),
+        } for idx, streak in enumerate(ranked[:5], 1)]
+
+    def describe(streak: Dict, kind: str) -> str:
+        _, _, unit, units = STREAK_KINDS[kind]
+        return f"{streak['length']} {unit if streak['length'] == 1 else units}"
+
+    records = []
+    for kind, category in (('win', 'Longest Winning Streak'),
+                           ('loss', 'Longest Losing Streak'),
+                           ('100_point', 'Longest Streak of 100+ Point Games')):
+        if streaks[kind]:
+            records.append({
+                'category': category,
+                'top5': top5(streaks[kind], lambda s, kind=kind: describe(s, kind)),
+            })
+
+    active = [dict(streak, kind=kind) for kind in STREAK_KINDS for streak in streaks[kind] if streak['active']]
+    if active:
+        records.append({
+            'category': 'Longest Active Streak',
+            'top5': top5(active, lambda s: describe(s, s['kind'])),
+        })
+
+    return records
+
+# A one-score game is decided by less than a touchdown and a two-point conversion
+ONE_SCORE_MARGIN = 8.0
+BLOWOUT_PERCENTILE = 90
+MIN_ONE_SCORE_GAMES = 10
+CLOSE_GAME_THRESHOLDS = [1, 2, 5, 10]
+
+def build_margin_index(season_summaries: Dict[int, Dict]) -> Dict:
+    """
+    Every decided regular season game sorted by margin of victory
+
+    Returns margins (ascending) and the games in the same order, each with
+    season, week, winner, loser, scores and margin. Ties aren't decided, so
+    they're left out. Threshold and percentile queries are binary searches
+    over margins.
+    """
+    decided = []
+    for season in sorted(season_summaries.keys()):
+        for game in season_summaries[season]['games']:
+            home_score, away_score = game['home_score'], game['away_score']
+            if home_score == away_score:
+                continue
+            home_won = home_score > away_score
+            decided.append({
+                'season': season,
+                'week': game['week'],
+                'winner': game['home'] if home_won else game['away'],
+                'loser': game['away'] if home_won else game['home'],
+                'winner_score': max(home_score, away_score),
+                'loser_score': min(home_score, away_score),
+                # Rounded so float noise doesn't move a game across a threshold
+                'margin': round(abs(home_score - away_score), 2),
+            })
+
+    # Stable sort keeps ties in chronological order
+    decided.sort(key=lambda g: g['margin'])
+    return {
+        'margins': [g['margin'] for g in decided],
+        'games': decided,
+    }
+
+def count_games_within(margins: List[float], threshold: float) -> int:
+    """Number of games in a sorted margin list decided by less than threshold"""
+    return bisect_left(margins, threshold)
+
+def margin_percentile(margins: List[float], percentile: float) -> float:
+    """Nearest-rank percentile of a sorted margin list"""
+    if not margins:
+        return 0.0
+    rank = max(1, -(-len(margins) * percentile // 100))
+    return margins[int(rank) - 1]
+
+def calculate_manager_margins(game_logs: Dict[str, List[Dict]], blowout_margin: float) -> List[Dict]:
+    """
+    Per-manager margin summary
+
+    Each manager's winning and losing margins are sorted once; one-score and
+    blowout counts are then binary searches. Includes the one-score record
+    (ties count as one-score games), blowout wins and losses (margins of at
+    least blowout_margin), average and median margins, the biggest win and
+    the narrowest loss. Sorted by one-score win percentage.
+    """
+    summary = []
+    for manager, log in game_logs.items():
+        wins = sorted((round(g['score'] - g['opponent_score'], 2), i) for i, g in enumerate(log) if g['result'] == 'W')
+        losses = sorted((round(g['opponent_score'] - g['score'], 2), i) for i, g in enumerate(log) if g['result'] == 'L')
+        win_margins = [margin for margin, _ in wins]
+        loss_margins = [margin for margin, _ in losses]
+        ties = sum(1 for g in log if g['result'] == 'T')
+
+        close_wins = count_games_within(win_margins, ONE_SCORE_MARGIN)
+        close_losses = count_games_within(loss_margins, ONE_SCORE_MARGIN)
+        close_games = close_wins + close_losses + ties
+
+        def game_details(entry) -> Dict:
+            margin, i = entry
+            return {'margin': margin, 'opponent': log[i]['opponent'], 'season': log[i]['season'], 'week': log[i]['week']}
+
+        summary.append({
+            'manager': manager,
+            'games': len(log),
+            'oneScoreWins': close_wins,
+            'oneScoreLosses': close_losses,
+            'oneScoreTies': ties,
+            'oneScoreWinPct': round((close_wins + 0.5 * ties) / close_games, 3) if close_games else None,
+            'blowoutWins': len(win_margins) - bisect_left(win_margins, blowout_margin),
+            'blowoutLosses': len(loss_margins) - bisect_left(loss_margins, blowout_margin),
+            'averageWinMargin': round(sum(win_margins) / len(win_margins), 2) if win_margins else None,
+            'averageLossMargin': round(sum(loss_margins) / len(loss_margins), 2) if loss_margins else None,
+            'medianWinMargin': margin_percentile(win_margins, 50) if win_margins else None,
+            'medianLossMargin': margin_percentile(loss_margins, 50) if loss_margins else None,
+            'biggestWin': game_details(wins[-1]) if wins else None,
+            'narrowestLoss': game_details(losses[0]) if losses else None,
+        })
+
+    summary.sort(key=lambda m: (-(m['oneScoreWinPct'] or 0), m['manager']))
+    return summary
+
+def calculate_margin_analytics(margin_index: Dict, game_logs: Dict[str, List[Dict]]) -> Dict:
+    """League-wide margin distribution and the per-manager margin summary"""
+    margins = margin_index['margins']
+    blowout_margin = margin_percentile(margins, BLOWOUT_PERCENTILE)
+
+    return {
+        'decidedGames': len(margins),
+        'oneScoreMargin': ONE_SCORE_MARGIN,
+        'blowoutPercentile': BLOWOUT_PERCENTILE,
+        'blowoutMargin': blowout_margin,
+        'medianMargin': margin_percentile(margins, 50),
+        # Games decided by less than each threshold
+        'gamesWithin': {str(t): count_games_within(margins, t) for t in CLOSE_GAME_THRESHOLDS},
+        'managers': calculate_manager_margins(game_logs, blowout_margin),
+    }
+
+def generate_margin_records(margin_index: Dict, manager_margins: List[Dict]) -> List[Dict]:
+    """
+    Largest margin of victory, narrowest loss and best one-score record (top 5 each)
+
+    manager_margins is the per-manager summary from calculate_margin_analytics.
+    """
+    games = margin_index['games']
+    records = []
+
+    if games:
+        # Largest margins are the end of the sorted index, narrowest the start
+        largest = sorted(games[-5:], key=lambda g: -g['margin'])
+        records.append({
+            'category': 'Largest Margin of Victory',
+            'top5': [{
+                'rank': idx,
+                'holder': game['winner'],
+                'record': f"{game['margin']:.2f} points",
+                'details': f"{game['winner_score']:.2f}-{game['loser_score']:.2f} vs {game['loser']}, Week {game['week']}, {game['season']}",
+            } for idx, game in enumerate(largest, 1)],
+        })
+        records.append({
+            'category': 'Narrowest Loss',
+            'top5': [{
+                'rank': idx,
+                'holder': game['loser'],
+                'record': f"{game['margin']:.2f} points",
+                'details': f"{game['loser_score']:.2f}-{game['winner_score']:.2f} vs {game['winner']}, Week {game['week']}, {game['season']}",
+            } for idx, game in enumerate(games[:5], 1)],
+        })
+
+    qualified = [m for m in manager_margins
+                 if m['oneScoreWins'] + m['oneScoreLosses'] + m['oneScoreTies'] >= MIN_ONE_SCORE_GAMES]
+    if qualified:
+        records.append({
+            'category': 'Best Record in One-Score Games',
+            'top5': [{
+                'rank': idx,
+                'holder': m['manager'],
+                'record': f"{m['oneScoreWins']}-{m['oneScoreLosses']}" + (f"-{m['oneScoreTies']}" if m['oneScoreTies'] else ""),
+                'details': f"Games decided by less than {ONE_SCORE_MARGIN:g} points",
+            } for idx, m in enumerate(qualified[:5], 1)],
+        })
+
+    return records
+
+def generate_all_time_records(espn_data: Dict[int, Dict], champs_data: Dict, season_summaries: Dict[int, Dict] = None,
+                              game_logs: Dict[str, List[Dict]] = None, margin_index: Dict = None,
+                              margin_analytics: Dict = None) -> List[Dict]:
     """Generate all-time records list"""
-    stats = calculate_all_time_stats(espn_data)
+    if season_summaries is None:
+        season_summaries = calculate_season_summaries(espn_data)
+    if game_logs is None:
+        game_logs = build_manager_game_logs(season_summaries)
+    if margin_index is None:
+        margin_index = build_margin_index(season_summaries)
+    if margin_analytics is None:
+        margin_analytics = calculate_margin_analytics(margin_index, game_logs)
+    stats = calculate_all_time_stats(espn_data, season_summaries)
     season_totals = stats.get('season_totals', {})
     
     records = []
@@ -718,10 +1253,32 @@ def generate_all_time_records(espn_data: Dict[int, Dict], champs_data: Dict) ->
                 'top5': top5_list,
             })
     
+    # Streaks run across season boundaries
+    records.extend(generate_streak_records(game_logs))
+    records.extend(generate_margin_records(margin_index, margin_analytics['managers']))
+    
     return records
 
 def main():
     """Process data and generate output files"""
+    import sys
+    
+    # --no-cache recomputes every season from the raw data
+    use_cache = '--no-cache' not in sys.argv
+    
+    # --jobs N computes seasons in N worker processes (0 = one per CPU)
+    jobs = 1
+    if '--jobs' in sys.argv:
+        try:
+            jobs = int(sys.argv[sys.argv.index('--jobs') + 1])
+        except (IndexError, ValueError):
+            jobs = -1
+        if jobs < 0:
+            print("Error: --jobs requires a number, e.g. --jobs 4")
+            sys.exit(1)
+        if jobs == 0:
+            jobs = os.cpu_count() or 1
+    
     print("="*70)
     print("Processing ESPN Data for Website")
     print("="*70)
@@ -736,26 +1293,27 @@ def main():
     print(f"✓ Loaded {len(espn_data)} seasons")
     
     # Load championship data for context
-    champs_file = OUTPUT_DIR / "champions.js"
-    champs_data = {}
-    if champs_file.exists():
-        # Simple parsing - just get champion names by year
-        with open(champs_file, 'r') as f:
-            content = f.read()
-            import re
-            for match in re.finditer(r'year:\s*(\d+)[^}]*champion:\s*"([^"]*)"', content):
-                year = int(match.group(1))
-                champ = match.group(2)
-                champs_data[year] = {'champion': champ}
+    champs_data = load_champions()
+    
+    # Per-season intermediates, only recomputed for seasons whose data changed
+    print("\nCalculating per-season results...")
+    season_summaries = calculate_season_summaries(espn_data, use_cache=use_cache, jobs=jobs)
     
     # Calculate head-to-head
     print("\nCalculating head-to-head records...")
-    h2h_records = calculate_head_to_head(espn_data)
+    h2h_cube = build_head_to_head_cube(espn_data, season_summaries)
+    h2h_records = query_head_to_head_range(h2h_cube)
     print(f"✓ Found {len(h2h_records)} manager pairs")
     
     # Calculate all-time stats
     print("\nCalculating all-time statistics...")
-    all_time_records = generate_all_time_records(espn_data, champs_data)
+    # Game logs, the margin index and the margin analytics are shared by the
+    # records and marginAnalytics.js
+    game_logs = build_manager_game_logs(season_summaries)
+    margin_index = build_margin_index(season_summaries)
+    margin_analytics = calculate_margin_analytics(margin_index, game_logs)
+    all_time_records = generate_all_time_records(espn_data, champs_data, season_summaries, game_logs,
+                                                 margin_index, margin_analytics)
     print(f"✓ Generated {len(all_time_records)} records")
     
     # Create output directory
@@ -776,9 +1334,25 @@ def main():
             f.write(f"    ties: {record.get('ties', 0)},\n")
             f.write(f"    record: \"{record['record']}\",\n")
             f.write(f"  }},\n")
-        f.write("];\n")
+        f.write("];\n\n")
+        # Same records grouped per manager with totals, so the page doesn't aggregate
+        f.write("export const headToHeadByManager = ")
+        json.dump(group_head_to_head_by_manager(h2h_records), f, indent=2)
+        f.write(";\n")
     print(f"✓ Saved head-to-head data to {h2h_file}")
     
+    # Save per-season head-to-head cube for season range filters
+    cube_file = OUTPUT_DIR / "headToHeadCube.js"
+    with open(cube_file, 'w') as f:
+        f.write("// JBS FFL Head-to-Head Cube\n")
+        f.write("// Cumulative per-season head-to-head counts (prefix sums over seasons)\n")
+        f.write("// wins[k][i * managers.length + j] = wins of managers[i] over managers[j] in seasons[0..k-1]\n")
+        f.write("// Generated from ESPN scraped data\n\n")
+        f.write("export const headToHeadCube = ")
+        json.dump(compact_head_to_head_cube(h2h_cube), f, separators=(',', ':'))
+        f.write(";\n")
+    print(f"✓ Saved head-to-head cube to {cube_file}")
+    
     # Save all-time records
     records_file = OUTPUT_DIR / "allTimeRecords.js"
     with open(records_file, 'w') as f:
@@ -807,12 +1381,24 @@ def main():
         f.write("];\n")
     print(f"✓ Saved all-time records to {records_file}")
     
+    # Save margin of victory / close game analytics
+    margins_file = OUTPUT_DIR / "marginAnalytics.js"
+    with open(margins_file, 'w') as f:
+        f.write("// JBS FFL Margin of Victory and Close Game Analytics\n")
+        f.write("// Generated from ESPN scraped data\n\n")
+        f.write("export const marginAnalytics = ")
+        json.dump(margin_analytics, f, separators=(',', ':'))
+        f.write(";\n")
+    print(f"✓ Saved margin analytics to {margins_file}")
+    
     print("\n" + "="*70)
     print("✓ Data processing complete!")
     print("="*70)
     print(f"\nGenerated files:")
     print(f"  - {h2h_file}")
+    print(f"  - {cube_file}")
     print(f"  - {records_file}")
+    print(f"  - {margins_file}")
     print(f"\nNext steps:")
     print(f"  1. Update all-time-records/page.tsx to import allTimeRecords")
     print(f"  2. Update head-to-head/page.tsx to import headToHeadRecords")
@@ -0,0 +1,50 @@
+"""
+Vectorized average-rank-with-ties over whole week x manager matrices
+
+Produces the same ranks as calculate_rank_with_ties in calculate_power_rankings.py
+(Matt's system: best = number of ranked managers, worst = 1, ties share the
+average rank, e.g. 8.5), but ranks every week of a season in one NumPy call
+instead of sorting a list of tuples per week and per metric.
+
+NaN marks a manager without a value that week; they get NaN back and don't
+count towards that week's number of ranked managers.
+"""
+import numpy as np
+
+def rank_with_ties_matrix(values) -> np.ndarray:
+    """
+    Rank each row of a week x manager matrix, higher values ranking higher
+
+    Each row is sorted once (descending, NaN last). Runs of equal values are
+    found by comparing neighbours, and each run's first and last sorted
+    positions are spread across it with maximum/minimum.accumulate. A run at
+    sorted positions i..j among n ranked managers gets rank n - (i + j) / 2.
+    """
+    values = np.asarray(values, dtype=float)
+    if values.ndim != 2 or values.size == 0:
+        return np.full(values.shape, np.nan)
+
+    num_weeks, num_managers = values.shape
+    missing = np.isnan(values)
+    counts = (~missing).sum(axis=1, keepdims=True)
+
+    # Sort descending with missing values last
+    keys = np.where(missing, np.inf, -values)
+    order = np.argsort(keys, axis=1, kind='stable')
+    sorted_keys = np.take_along_axis(keys, order, axis=1)
+
+    positions = np.broadcast_to(np.arange(num_managers), (num_weeks, num_managers))
+    run_starts = np.ones((num_weeks, num_managers), dtype=bool)
+    run_starts[:, 1:] = sorted_keys[:, 1:] != sorted_keys[:, :-1]
+    run_ends = np.ones((num_weeks, num_managers), dtype=bool)
+    run_ends[:, :-1] = run_starts[:, 1:]
+
+    first = np.maximum.accumulate(np.where(run_starts, positions, 0), axis=1)
+    last = np.minimum.accumulate(np.where(run_ends, positions, num_managers - 1)[:, ::-1], axis=1)[:, ::-1]
+
+    sorted_ranks = counts - (first + last) / 2.0
+
+    ranks = np.empty_like(values)
+    np.put_along_axis(ranks, order, sorted_ranks, axis=1)
+    ranks[missing] = np.nan
+    return ranks
@@ -0,0 +1,299 @@
+"""
+Schedule luck: how each manager would have done with a different schedule
+
+For every season:
+- Schedule swap matrix: manager i's record if they had played manager j's
+  schedule. Each week i faces j's opponent; when that opponent is i, they
+  face j instead. The diagonal is each manager's actual record.
+- Record distribution: every manager's chance of each possible win total
+  if opponents were drawn at random each week.
+  - exact (default): each week's result is a win, tie or loss with the
+    all-play odds of that week, and the weeks are convolved together.
+    This is the exact distribution over every possible random pairing.
+  - sampled: Monte Carlo over random weekly pairings, as a cross-check,
+    run through simulation_runner.py (seeded per season, --jobs workers)
+
+Both work on the week x manager score arrays from collect_season_weeks,
+with the schedule swaps vectorized in NumPy and the weekly odds taken from
+the all-play records in all_play.py.
+
+Usage:
+    python schedule_luck.py                     # Exact distributions
+    python schedule_luck.py --mode sampled      # Monte Carlo distributions
+    python schedule_luck.py --mode sampled --samples 200000 --seed 7
+    python schedule_luck.py --mode sampled --jobs 0   # One worker per CPU
+
+Output:
+    ../data/scheduleLuck.js
+"""
+import json
+import time
+from typing import Dict, List
+
+import numpy as np
+
+from all_play import all_play_records
+from calculate_power_rankings import OUTPUT_DIR, collect_season_weeks, load_all_seasons
+from simulation_runner import run_simulations
+
+MODES = ('exact', 'sampled')
+DEFAULT_SAMPLES = 100_000
+DEFAULT_SEED = 2009
+BATCH_SIZE = 10_000
+
+def build_schedule_arrays(season_weeks: List[Dict]) -> Dict:
+    """
+    Lay out a season as week x manager arrays
+
+    scores is NaN and opponents is -1 for a manager without a game that week.
+    Weeks without any games are dropped.
+    """
+    season_weeks = [week for week in season_weeks if week['scores']]
+    managers = sorted({m for week in season_weeks for m in week['scores']})
+    index = {manager: i for i, manager in enumerate(managers)}
+
+    shape = (len(season_weeks), len(managers))
+    scores = np.full(shape, np.nan)
+    opponents = np.full(shape, -1, dtype=np.intp)
+    for w, week in enumerate(season_weeks):
+        for manager, score in week['scores'].items():
+            scores[w, index[manager]] = score
+            opponent = week['opponents'].get(manager)
+            if opponent is not None:
+                opponents[w, index[manager]] = index[opponent]
+
+    return {
+        'managers': managers,
+        'weeks': [week['week'] for week in season_weeks],
+        'scores': scores,
+        'opponents': opponents,
+    }
+
+def calculate_schedule_swap_records(arrays: Dict) -> Dict[str, np.ndarray]:
+    """
+    Record of every manager against every manager's schedule
+
+    Returns wins, losses and ties as manager x schedule matrices.
+    """
+    scores = arrays['scores']
+    opponents = arrays['opponents']
+    num_weeks, num_managers = scores.shape
+    managers = np.arange(num_managers)
+
+    # faced[w, i, j]: who i plays in week w on j's schedule
+    schedule_opponents = np.broadcast_to(opponents[:, None, :], (num_weeks, num_managers, num_managers))
+    faced = np.where(schedule_opponents == managers[None, :, None],
+                     np.broadcast_to(managers[None, None, :], schedule_opponents.shape),
+                     schedule_opponents)
+
+    # A game only counts when i played that week and j's schedule has an opponent
+    own_scores = np.broadcast_to(scores[:, :, None], faced.shape)
+    opponent_scores = np.take_along_axis(
+        np.broadcast_to(scores[:, None, :], faced.shape), np.maximum(faced, 0), axis=2)
+    valid = (faced >= 0) & ~np.isnan(own_scores) & ~np.isnan(opponent_scores)
+
+    return {
+        'wins': (valid & (own_scores > opponent_scores)).sum(axis=0),
+        'losses': (valid & (own_scores < opponent_scores)).sum(axis=0),
+        'ties': (valid & (own_scores == opponent_scores)).sum(axis=0),
+    }
+
+def weekly_result_odds(scores: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Chance of a win, tie or loss each week against a random opponent
+
+    Each week's odds are its all-play record (all_play.py) over the number
+    of opponents. Managers without a game that week get zero for all three.
+    """
+    odds = {result: np.zeros(scores.shape) for result in ('win', 'tie', 'loss')}
+    for w, week_scores in enumerate(scores):
+        played = np.flatnonzero(~np.isnan(week_scores))
+        if len(played) < 2:
+            continue
+        records = np.array(all_play_records(week_scores[played].tolist()), dtype=float)
+        records /= len(played) - 1
+        odds['win'][w, played] = records[:, 0]
+        odds['loss'][w, played] = records[:, 1]
+        odds['tie'][w, played] = records[:, 2]
+    return odds
+
+def exact_record_distribution(scores: np.ndarray) -> np.ndarray:
+    """
+    Exact distribution of win totals under random weekly opponents
+
+    Returns manager x half-win probabilities: dist[i, k] is the chance of
+    finishing with k / 2 wins (a tie counts half). Weeks are independent
+    under random pairings, so the distribution is the convolution of each
+    week's win/tie/loss odds.
+    """
+    num_weeks, num_managers = scores.shape
+    odds = weekly_result_odds(scores)
+    played = ~np.isnan(scores)
+
+    dist = np.zeros((num_managers, 2 * num_weeks + 1))
+    dist[:, 0] = 1.0
+    for w in range(num_weeks):
+        loss = np.where(played[w], odds['loss'][w], 1.0)[:, None]
+        new = dist * loss
+        new[:, 1:] += dist[:, :-1] * odds['tie'][w][:, None]
+        new[:, 2:] += dist[:, :-2] * odds['win'][w][:, None]
+        dist = new
+    return dist
+
+def sampled_record_distribution(scores: np.ndarray, num_samples: int, rng: np.random.Generator,
+                                batch_size: int = BATCH_SIZE) -> np.ndarray:
+    """
+    Monte Carlo distribution of win totals under random weekly pairings
+
+    Each sample shuffles the managers who played each week and pairs them off
+    in order. Returns manager x half-win counts (same layout as
+    exact_record_distribution, before dividing by num_samples).
+    """
+    num_weeks, num_managers = scores.shape
+    played = ~np.isnan(scores)
+    active_counts = played.sum(axis=1)
+    counts = np.zeros((num_managers, 2 * num_weeks + 1), dtype=np.int64)
+    manager_offsets = np.arange(num_managers) * (2 * num_weeks + 1)
+
+    done = 0
+    while done < num_samples:
+        batch = min(batch_size, num_samples - done)
+
+        # Random order of each week's active managers; absent managers sort last
+        keys = rng.random((batch, num_weeks, num_managers))
+        keys[:, ~played] = np.inf
+        order = np.argsort(keys, axis=2)
+
+        # Pair positions (0, 1), (2, 3), ... ; an odd manager out sits the week
+        partner_position = np.arange(num_managers) ^ 1
+        partners = np.take_along_axis(order, np.broadcast_to(partner_position, order.shape), axis=2)
+        seated = np.arange(num_managers)[None, :] < active_counts[:, None]
+        in_game = np.broadcast_to(seated & seated[:, partner_position], order.shape)
+
+        own = np.take_along_axis(np.broadcast_to(scores, order.shape), order, axis=2)
+        other = np.take_along_axis(np.broadcast_to(scores, order.shape), partners, axis=2)
+        half_wins = np.where(in_game & (own > other), 2, np.where(in_game & (own == other), 1, 0))
+
+        # Back from shuffled positions to managers, then total over the weeks
+        manager_half_wins = np.zeros((batch, num_weeks, num_managers), dtype=np.int64)
+        np.put_along_axis(manager_half_wins, order, half_wins, axis=2)
+        totals = manager_half_wins.sum(axis=1)
+
+        counts += np.bincount((totals + manager_offsets).ravel(),
+                              minlength=counts.size).reshape(counts.shape)
+        done += batch
+
+    return counts
+
+def calculate_season_schedule_luck(season_weeks: List[Dict], mode: str = 'exact',
+                                   num_samples: int = DEFAULT_SAMPLES, seed=DEFAULT_SEED, jobs: int = 1) -> Dict:
+    """
+    Schedule swap records and win distributions for one season
+
+    In sampled mode, seed is anything numpy.random.SeedSequence accepts.
+    """
+    arrays = build_schedule_arrays(season_weeks)
+    scores = arrays['scores']
+    records = calculate_schedule_swap_records(arrays)
+
+    if mode == 'exact':
+        distribution = exact_record_distribution(scores)
+    else:
+        counts, _ = run_simulations(sampled_record_distribution, scores, num_samples, seed, jobs)
+        distribution = counts / num_samples
+
+    half_wins = np.arange(distribution.shape[1])
+    managers = []
+    for i, manager in enumerate(arrays['managers']):
+        actual_wins = records['wins'][i, i] + 0.5 * records['ties'][i, i]
+        actual_index = int(round(2 * actual_wins))
+        schedule_wins = records['wins'][i] + 0.5 * records['ties'][i]
+        managers.append({
+            'manager': manager,
+            'actualWins': float(actual_wins),
+            'expectedWins': round(float((distribution[i] * half_wins).sum() / 2), 3),
+            'luck': round(float(actual_wins - (distribution[i] * half_wins).sum() / 2), 3),
+            # Share of random schedules that would have produced fewer / more wins
+            'worseSchedules': round(float(distribution[i, :actual_index].sum()), 4),
+            'betterSchedules': round(float(distribution[i, actual_index + 1:].sum()), 4),
+            'bestScheduleWins': float(schedule_wins.max()),
+            'worstScheduleWins': float(schedule_wins.min()),
+            # [wins, probability] for every reachable win total (ties count half)
+            'winDistribution': [[k / 2, round(float(p), 4)] for k, p in enumerate(distribution[i]) if p >= 5e-5],
+        })
+
+    return {
+        'weeks': arrays['weeks'],
+        'managers': arrays['managers'],
+        'scheduleRecords': {
+            'wins': records['wins'].tolist(),
+            'losses': records['losses'].tolist(),
+            'ties': records['ties'].tolist(),
+        },
+        'distributions': managers,
+    }
+
+def main():
+    import sys
+
+    args = sys.argv[1:]
+    mode = 'exact'
+    if '--mode' in args:
+        mode = args[args.index('--mode') + 1] if args.index('--mode') + 1 < len(args) else None
+        if mode not in MODES:
+            print(f"Error: --mode must be one of: {', '.join(MODES)}")
+            sys.exit(1)
+
+    def option(name: str, default: int, minimum: int) -> int:
+        if name not in args:
+            return default
+        try:
+            value = int(args[args.index(name) + 1])
+        except (IndexError, ValueError):
+            value = None
+        if value is None or value < minimum:
+            print(f"Error: {name} requires a number of at least {minimum}")
+            sys.exit(1)
+        return value
+
+    num_samples = option('--samples', DEFAULT_SAMPLES, 1)
+    seed = option('--seed', DEFAULT_SEED, 0)
+    jobs = option('--jobs', 1, 0)  # 0 = one worker per CPU
+
+    print("=" * 70)
+    print(f"Calculating Schedule Luck ({mode})")
+    print("=" * 70)
+
+    all_data = load_all_seasons()
+    if not all_data:
+        print("❌ No ESPN data found")
+        return
+
+    start = time.perf_counter()
+    schedule_luck = {}
+    for season in sorted(all_data.keys()):
+        season_weeks = collect_season_weeks(all_data[season])
+        if not any(week['scores'] for week in season_weeks):
+            continue
+        # Each season gets its own stream so re-running one season reproduces it
+        schedule_luck[season] = calculate_season_schedule_luck(season_weeks, mode, num_samples, [seed, season], jobs)
+    elapsed = time.perf_counter() - start
+    print(f"✓ Analyzed {len(schedule_luck)} seasons in {elapsed:.3f}s")
+
+    # Luckiest and unluckiest schedules of each season
+    for season, result in schedule_luck.items():
+        ranked = sorted(result['distributions'], key=lambda m: m['luck'])
+        print(f"  {season}  luckiest: {ranked[-1]['manager']} ({ranked[-1]['luck']:+.2f}), "
+              f"unluckiest: {ranked[0]['manager']} ({ranked[0]['luck']:+.2f})")
+
+    output_file = OUTPUT_DIR / "scheduleLuck.js"
+    with open(output_file, 'w') as f:
+        f.write("// JBS FFL Schedule Luck\n")
+        f.write("// Generated from ESPN scraped data - Do not edit manually\n\n")
+        f.write("export const scheduleLuck = ")
+        json.dump(schedule_luck, f, separators=(',', ':'))
+        f.write(";\n")
+    print(f"\n✓ Saved schedule luck to {output_file}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""
+Scoring analytics per manager and season from the resolved regular season games
+
+For every manager in every season calculates:
+- Points for / points against
+- Mean, median and standard deviation of weekly scores
+- Percentile bands (10th, 25th, 75th, 90th)
+- Luck index: actual wins minus expected wins from the all-play (breakdown) record
+- Weekly z-scores: how far each score was from that week's league average
+
+Each season is laid out as a week x manager score matrix so the statistics
+are vectorized with NumPy; the all-play records come from all_play.py.
+
+Usage:
+    python scoring_analytics.py
+
+Output:
+    ../data/scoringAnalytics.js
+"""
+import json
+import time
+from typing import Dict, List
+
+import numpy as np
+
+from all_play import all_play_records, all_play_win_percentage
+from process_data import OUTPUT_DIR, load_all_seasons, resolve_season_games
+
+PERCENTILES = [10, 25, 75, 90]
+
+def build_season_matrices(games: List[Dict]) -> Dict:
+    """
+    Lay out a season's resolved games as week x manager matrices
+
+    Returns managers, weeks and three matrices (scores, opponent scores and
+    results where win = 1, tie = 0.5, loss = 0). Weeks a manager didn't play are NaN.
+    """
+    managers = sorted({g['home'] for g in games} | {g['away'] for g in games})
+    weeks = sorted({g['week'] for g in games})
+    manager_index = {manager: i for i, manager in enumerate(managers)}
+    week_index = {week: i for i, week in enumerate(weeks)}
+
+    shape = (len(weeks), len(managers))
+    scores = np.full(shape, np.nan)
+    opponent_scores = np.full(shape, np.nan)
+
+    for game in games:
+        w = week_index[game['week']]
+        home = manager_index[game['home']]
+        away = manager_index[game['away']]
+        scores[w, home] = game['home_score']
+        scores[w, away] = game['away_score']
+        opponent_scores[w, home] = game['away_score']
+        opponent_scores[w, away] = game['home_score']
+
+    # NaN comparisons are False, so unplayed weeks stay NaN below
+    results = np.where(scores > opponent_scores, 1.0, np.where(scores == opponent_scores, 0.5, 0.0))
+    results[np.isnan(scores)] = np.nan
+
+    return {
+        'managers': managers,
+        'weeks': weeks,
+        'scores': scores,
+        'opponent_scores': opponent_scores,
+        'results': results,
+    }
+
+def calculate_expected_wins(scores: np.ndarray) -> np.ndarray:
+    """
+    Expected wins per week x manager from the all-play record
+
+    Each week's all-play records come from all_play.py; the all-play win
+    percentage (a tie counts as half a win) is the probability of winning
+    against a random opponent that week.
+    """
+    expected = np.full(scores.shape, np.nan)
+    for w, week_scores in enumerate(scores):
+        played = np.flatnonzero(~np.isnan(week_scores))
+        if len(played) < 2:
+            continue
+        records = all_play_records(week_scores[played].tolist())
+        expected[w, played] = [all_play_win_percentage(*record) for record in records]
+    return expected
+
+def calculate_weekly_z_scores(scores: np.ndarray) -> np.ndarray:
+    """Standardize each week's scores against that week's league mean and std"""
+    with np.errstate(invalid='ignore', divide='ignore'):
+        week_mean = np.nanmean(scores, axis=1, keepdims=True)
+        week_std = np.nanstd(scores, axis=1, keepdims=True)
+        z_scores = (scores - week_mean) / week_std
+    # A week where everyone scored the same has no spread
+    z_scores[~np.isnan(scores) & (week_std == 0)] = 0.0
+    return z_scores
+
+def _round_or_none(value: float, digits: int = 2):
+    return None if np.isnan(value) else round(float(value), digits)
+
+def calculate_season_analytics(games: List[Dict]) -> List[Dict]:
+    """Calculate scoring analytics for every manager in one season"""
+    if not games:
+        return []
+
+    matrices = build_season_matrices(games)
+    scores = matrices['scores']
+    opponent_scores = matrices['opponent_scores']
+    results = matrices['results']
+
+    expected_wins = calculate_expected_wins(scores)
+    z_scores = calculate_weekly_z_scores(scores)
+
+    with np.errstate(invalid='ignore'):
+        points_for = np.nansum(scores, axis=0)
+        points_against = np.nansum(opponent_scores, axis=0)
+        means = np.nanmean(scores, axis=0)
+        medians = np.nanmedian(scores, axis=0)
+        std_devs = np.nanstd(scores, axis=0)
+        percentiles = np.nanpercentile(scores, PERCENTILES, axis=0)
+        wins = np.nansum(results == 1.0, axis=0)
+        ties = np.nansum(results == 0.5, axis=0)
+        losses = np.nansum(results == 0.0, axis=0)
+        actual_wins = np.nansum(results, axis=0)
+        total_expected_wins = np.nansum(expected_wins, axis=0)
+        average_z_scores = np.nanmean(z_scores, axis=0)
+
+    analytics = []
+    for i, manager in enumerate(matrices['managers']):
+        analytics.append({
+            'manager': manager,
+            'games': int(wins[i] + losses[i] + ties[i]),
+            'wins': int(wins[i]),
+            'losses': int(losses[i]),
+            'ties': int(ties[i]),
+            'pointsFor': round(float(points_for[i]), 2),
+            'pointsAgainst': round(float(points_against[i]), 2),
+            'mean': _round_or_none(means[i]),
+            'median': _round_or_none(medians[i]),
+            'stdDev': _round_or_none(std_devs[i]),
+            'percentiles': {f"p{p}": _round_or_none(percentiles[k, i]) for k, p in enumerate(PERCENTILES)},
+            'expectedWins': round(float(total_expected_wins[i]), 3),
+            'luck': round(float(actual_wins[i] - total_expected_wins[i]), 3),
+            'averageZScore': _round_or_none(average_z_scores[i], 3),
+            'weeklyZScores': [_round_or_none(z, 3) for z in z_scores[:, i]],
+        })
+
+    # Luckiest managers first
+    analytics.sort(key=lambda a: a['luck'], reverse=True)
+    return analytics
+
+def calculate_scoring_analytics(espn_data: Dict[int, Dict]) -> Dict[int, Dict]:
+    """Calculate scoring analytics for all seasons, keyed by season"""
+    analytics = {}
+    for season in sorted(espn_data.keys()):
+        games = resolve_season_games(season, espn_data[season])
+        if not games:
+            continue
+        analytics[season] = {
+            'weeks': sorted({g['week'] for g in games}),
+            'managers': calculate_season_analytics(games),
+        }
+    return analytics
+
+def main():
+    """Calculate scoring analytics and write scoringAnalytics.js"""
+    print("=" * 70)
+    print("Calculating Scoring Analytics")
+    print("=" * 70)
+
+    espn_data = load_all_seasons()
+    if not espn_data:
+        print("❌ No ESPN data found")
+        return
+
+    start = time.perf_counter()
+    analytics = calculate_scoring_analytics(espn_data)
+    elapsed = time.perf_counter() - start
+    print(f"✓ Analyzed {len(analytics)} seasons in {elapsed:.3f}s")
+
+    output_file = OUTPUT_DIR / "scoringAnalytics.js"
+    with open(output_file, 'w') as f:
+        f.write("// JBS FFL Scoring Analytics\n")
+        f.write("// Generated from ESPN scraped data - Do not edit manually\n\n")
+        f.write("export const scoringAnalytics = ")
+        json.dump(analytics, f, separators=(',', ':'))
+        f.write(";\n")
+    print(f"✓ Saved scoring analytics to {output_file}")
+
+if __name__ == "__main__":
+    main()
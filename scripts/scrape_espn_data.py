@@ -11,10 +11,13 @@ Output:
 
 import requests
 import json
+import math
 import time
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
+from league_rules import PLAYOFF_TEAMS, get_regular_season_weeks
+
 # League Configuration
 LEAGUE_ID = 420782
 BASE_URL = "https://lm-api-reads.fantasy.espn.com/apis/v3/games/ffl/seasons"
@@ -62,17 +65,19 @@ def get_standings_url(season: int):
         return f"{BASE_URL}/{season}/segments/0/leagues/{LEAGUE_ID}?view=mStandings"
 
 def get_playoff_url(season: int):
-    """Get URL for playoff bracket"""
+    """Get URL for playoff bracket (with teams, for playoff seeds and final ranks)"""
     if season < 2018:
-        return f"{HISTORY_BASE_URL}/{LEAGUE_ID}?seasonId={season}&view=mPlayoffBracket"
+        return f"{HISTORY_BASE_URL}/{LEAGUE_ID}?seasonId={season}&view=mPlayoffBracket&view=mTeam"
     else:
-        return f"{BASE_URL}/{season}/segments/0/leagues/{LEAGUE_ID}?view=mPlayoffBracket"
+        return f"{BASE_URL}/{season}/segments/0/leagues/{LEAGUE_ID}?view=mPlayoffBracket&view=mTeam"
 
 
 class ESPNFantasyScraper:
     def __init__(self, league_id: int, cookies: Optional[str] = None):
         self.league_id = league_id
         self.session = requests.Session()
+        # League info per (season, views); teams, matchups and standings all need it
+        self._league_info: Dict[tuple, Optional[Dict]] = {}
         # Set headers to mimic a browser request
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -197,12 +202,18 @@ class ESPNFantasyScraper:
             return []
     
     def get_league_info(self, season: int, views: List[str] = None) -> Optional[Dict]:
-        """Get basic league information for a season"""
+        """Get basic league information for a season (fetched once per season and views)"""
+        # Default views to get basic league data
+        if views is None:
+            views = ['mTeam', 'mSettings', 'mStandings']
+        
+        key = (season, tuple(views))
+        if key not in self._league_info:
+            self._league_info[key] = self._fetch_league_info(season, views)
+        return self._league_info[key]
+    
+    def _fetch_league_info(self, season: int, views: List[str]) -> Optional[Dict]:
         try:
-            # Default views to get basic league data
-            if views is None:
-                views = ['mTeam', 'mSettings', 'mStandings']
-            
             url = get_league_url(season, views)
             response = self.session.get(url, timeout=10)
             data = self._check_response(response, url)
@@ -298,125 +309,118 @@ class ESPNFantasyScraper:
         
         return teams
     
-    def get_matchups(self, season: int) -> List[Dict]:
-        """Get all matchups for a season (regular season and playoffs)"""
-        league_data = self.get_league_info(season)
-        if not league_data:
-            return []
-        
-        # Create team ID to manager mapping
+    def _get_team_id_to_manager(self, season: int) -> Dict[int, Dict]:
+        """Team ID -> manager and team name"""
         team_id_to_manager = {}
-        teams_data = self.get_teams(season)
-        for manager, team_info in teams_data.items():
+        for manager, team_info in self.get_teams(season).items():
             team_id_to_manager[team_info['id']] = {
                 'manager': manager,
                 'team_name': team_info['name']
             }
-        
+        return team_id_to_manager
+    
+    def _get_period_matchups(self, season: int, period: int, team_id_to_manager: Dict[int, Dict],
+                             is_playoff: bool = False) -> List[Dict]:
+        """Fetch one matchup period (mMatchup view) and flatten its schedule"""
         matchups = []
-        try:
-            settings = league_data.get('settings', {})
-            schedule_settings = settings.get('scheduleSettings', {})
+        url = get_matchup_url(season, period)
+        response = self.session.get(url, timeout=10)
+        matchup_response = self._check_response(response, url)
+        
+        if not matchup_response or '_error' in matchup_response:
+            return matchups
+        
+        # Handle both list (historical) and dict (modern) responses
+        matchup_data = matchup_response
+        if isinstance(matchup_response, list):
+            if len(matchup_response) > 0 and isinstance(matchup_response[0], dict):
+                matchup_data = matchup_response[0]
+            else:
+                return matchups
+        
+        if not isinstance(matchup_data, dict):
+            return matchups
+        
+        # ESPN API structure: schedule can be a list or in schedule.matchupsByMatchupPeriod
+        schedule_list = matchup_data.get('schedule', [])
+        if not schedule_list and 'schedule' in matchup_data:
+            # Try alternative structure: schedule.matchupsByMatchupPeriod[period]
+            schedule_obj = matchup_data.get('schedule', {})
+            if isinstance(schedule_obj, dict):
+                matchups_by_period = schedule_obj.get('matchupsByMatchupPeriod', {})
+                if matchups_by_period:
+                    schedule_list = matchups_by_period.get(str(period), [])
+        
+        # No matchups found for this period (might be a bye week or no games)
+        for matchup in schedule_list or []:
+            home_team = matchup.get('home', {})
+            away_team = matchup.get('away', {})
             
-            # Get regular season weeks from settings
-            regular_season_weeks = schedule_settings.get('matchupPeriodCount', 13)
+            # Get team IDs
+            home_team_id = home_team.get('teamId')
+            away_team_id = away_team.get('teamId')
             
-            # NFL expanded regular season from 16 to 17 games in 2021
-            # This means fantasy regular season went from 13 to 14 weeks
-            # If the setting doesn't reflect this, override based on season
-            if season >= 2021:
-                # 2021+: Regular season is 14 weeks, playoffs start week 15
-                regular_season_weeks = 14
-            else:
-                # Pre-2021: Regular season is 13 weeks, playoffs start week 14
-                regular_season_weeks = 13
+            # Get scores
+            home_score = home_team.get('totalPoints', 0)
+            away_score = away_team.get('totalPoints', 0)
             
-            # Only fetch regular season weeks (no playoffs)
-            # Fetch matchups for each period (regular season only)
+            # Get manager names from mapping
+            home_manager = team_id_to_manager.get(home_team_id, {}).get('manager', f"Team {home_team_id}")
+            away_manager = team_id_to_manager.get(away_team_id, {}).get('manager', f"Team {away_team_id}")
+            
+            home_team_name = team_id_to_manager.get(home_team_id, {}).get('team_name', f"Team {home_team_id}")
+            away_team_name = team_id_to_manager.get(away_team_id, {}).get('team_name', f"Team {away_team_id}")
+            
+            # Capture additional fields to distinguish scheduled vs projected games
+            matchup_type = matchup.get('matchupType')  # e.g., 'SCHEDULED', 'PROJECTED', etc.
+            matchup_id = matchup.get('id')
+            matchup_period_id = matchup.get('matchupPeriodId')  # Critical: distinguishes scheduled vs projected
+            playoff_tier_type = matchup.get('playoffTierType')  # e.g., 'WINNERS_BRACKET' for playoff games
+            is_bye = matchup.get('isBye', False)
+            winner = matchup.get('winner')  # ESPN's winner field (may differ from our calculation)
+            
+            matchups.append({
+                'week': period,
+                'is_playoff': is_playoff,
+                'home_team_id': home_team_id,
+                'away_team_id': away_team_id,
+                'home_manager': home_manager,
+                'away_manager': away_manager,
+                'home_team_name': home_team_name,
+                'away_team_name': away_team_name,
+                'home_score': home_score,
+                'away_score': away_score,
+                'winner_id': home_team_id if home_score > away_score else away_team_id if away_score > home_score else None,
+                'winner_manager': home_manager if home_score > away_score else away_manager if away_score > home_score else None,
+                # Additional fields for filtering
+                'matchup_type': matchup_type,
+                'matchup_id': matchup_id,
+                'matchup_period_id': matchup_period_id,  # Key field for filtering scheduled games
+                'playoff_tier_type': playoff_tier_type,
+                'is_bye': is_bye,
+                'winner_espn': winner,
+            })
+        
+        return matchups
+    
+    def get_matchups(self, season: int) -> List[Dict]:
+        """Get all regular season matchups for a season"""
+        league_data = self.get_league_info(season)
+        if not league_data:
+            return []
+        
+        team_id_to_manager = self._get_team_id_to_manager(season)
+        
+        matchups = []
+        try:
+            regular_season_weeks = get_regular_season_weeks(season)
+            
+            # Only fetch regular season weeks; playoff weeks are fetched by get_playoff_matchups
             print(f"    Fetching regular season periods 1-{regular_season_weeks}")
             
             for period in range(1, regular_season_weeks + 1):
                 try:
-                    url = get_matchup_url(season, period)
-                    response = self.session.get(url, timeout=10)
-                    matchup_response = self._check_response(response, url)
-                    
-                    if matchup_response and '_error' not in matchup_response:
-                        # Handle both list (historical) and dict (modern) responses
-                        matchup_data = matchup_response
-                        if isinstance(matchup_response, list):
-                            if len(matchup_response) > 0 and isinstance(matchup_response[0], dict):
-                                matchup_data = matchup_response[0]
-                            else:
-                                continue
-                        
-                        if not isinstance(matchup_data, dict):
-                            continue
-                        
-                        # ESPN API structure: schedule can be a list or in schedule.matchupsByMatchupPeriod
-                        schedule_list = matchup_data.get('schedule', [])
-                        if not schedule_list and 'schedule' in matchup_data:
-                            # Try alternative structure: schedule.matchupsByMatchupPeriod[period]
-                            schedule_obj = matchup_data.get('schedule', {})
-                            if isinstance(schedule_obj, dict):
-                                matchups_by_period = schedule_obj.get('matchupsByMatchupPeriod', {})
-                                if matchups_by_period:
-                                    schedule_list = matchups_by_period.get(str(period), [])
-                        
-                        if not schedule_list:
-                            # No matchups found for this period (might be a bye week or no games)
-                            continue
-                            
-                        for matchup in schedule_list:
-                            home_team = matchup.get('home', {})
-                            away_team = matchup.get('away', {})
-                            
-                            # Get team IDs
-                            home_team_id = home_team.get('teamId')
-                            away_team_id = away_team.get('teamId')
-                            
-                            # Get scores
-                            home_score = home_team.get('totalPoints', 0)
-                            away_score = away_team.get('totalPoints', 0)
-                            
-                            # Get manager names from mapping
-                            home_manager = team_id_to_manager.get(home_team_id, {}).get('manager', f"Team {home_team_id}")
-                            away_manager = team_id_to_manager.get(away_team_id, {}).get('manager', f"Team {away_team_id}")
-                            
-                            home_team_name = team_id_to_manager.get(home_team_id, {}).get('team_name', f"Team {home_team_id}")
-                            away_team_name = team_id_to_manager.get(away_team_id, {}).get('team_name', f"Team {away_team_id}")
-                            
-                            # Capture additional fields to distinguish scheduled vs projected games
-                            matchup_type = matchup.get('matchupType')  # e.g., 'SCHEDULED', 'PROJECTED', etc.
-                            matchup_id = matchup.get('id')
-                            matchup_period_id = matchup.get('matchupPeriodId')  # Critical: distinguishes scheduled vs projected
-                            playoff_tier_type = matchup.get('playoffTierType')
-                            is_bye = matchup.get('isBye', False)
-                            winner = matchup.get('winner')  # ESPN's winner field (may differ from our calculation)
-                            
-                            # All matchups are regular season (we're not fetching playoffs)
-                            matchups.append({
-                                'week': period,
-                                'is_playoff': False,
-                                'home_team_id': home_team_id,
-                                'away_team_id': away_team_id,
-                                'home_manager': home_manager,
-                                'away_manager': away_manager,
-                                'home_team_name': home_team_name,
-                                'away_team_name': away_team_name,
-                                'home_score': home_score,
-                                'away_score': away_score,
-                                'winner_id': home_team_id if home_score > away_score else away_team_id if away_score > home_score else None,
-                                'winner_manager': home_manager if home_score > away_score else away_manager if away_score > home_score else None,
-                                # Additional fields for filtering
-                                'matchup_type': matchup_type,
-                                'matchup_id': matchup_id,
-                                'matchup_period_id': matchup_period_id,  # Key field for filtering scheduled games
-                                'playoff_tier_type': playoff_tier_type,
-                                'is_bye': is_bye,
-                                'winner_espn': winner,
-                            })
-                    
+                    matchups.extend(self._get_period_matchups(season, period, team_id_to_manager))
                     time.sleep(0.5)  # Rate limiting
                 except Exception as e:
                     print(f"  Error fetching matchups for week {period}: {e}")
@@ -427,6 +431,39 @@ class ESPNFantasyScraper:
         
         return matchups
     
+    def get_playoff_matchups(self, season: int) -> List[Dict]:
+        """
+        Get the playoff weeks' matchups for a season (is_playoff set)
+        
+        Playoff rounds follow the regular season, one matchup period each;
+        the number of rounds comes from the league's playoff team count.
+        """
+        league_data = self.get_league_info(season)
+        if not league_data:
+            return []
+        
+        team_id_to_manager = self._get_team_id_to_manager(season)
+        schedule_settings = league_data.get('settings', {}).get('scheduleSettings', {})
+        playoff_teams = schedule_settings.get('playoffTeamCount') or PLAYOFF_TEAMS
+        playoff_rounds = max(1, math.ceil(math.log2(playoff_teams)))
+        
+        first_period = get_regular_season_weeks(season) + 1
+        last_period = first_period + playoff_rounds - 1
+        print(f"    Fetching playoff periods {first_period}-{last_period}")
+        
+        matchups = []
+        for period in range(first_period, last_period + 1):
+            try:
+                # Each response carries the whole season schedule; keep only this period's games
+                matchups.extend(m for m in self._get_period_matchups(season, period, team_id_to_manager, is_playoff=True)
+                                if m['matchup_period_id'] == period)
+                time.sleep(0.5)  # Rate limiting
+            except Exception as e:
+                print(f"  Error fetching playoff matchups for week {period}: {e}")
+                continue
+        
+        return matchups
+    
     def get_standings(self, season: int) -> List[Dict]:
         """Get regular season standings"""
         league_data = self.get_league_info(season)
@@ -492,12 +529,17 @@ class ESPNFantasyScraper:
         return standings
     
     def get_playoff_results(self, season: int) -> Dict:
-        """Get playoff bracket and results"""
-        league_data = self.get_league_info(season)
-        if not league_data:
-            return {}
+        """
+        Get playoff bracket and results (mPlayoffBracket view, one request)
         
+        Returns playoff_team_count, seeds (manager -> playoff seed),
+        final_ranks (manager -> final place, once the playoffs are over)
+        and ESPN's playoffBracket as returned under bracket.
+        """
         playoff_data = {}
+        league_data = self.get_league_info(season)
+        schedule_settings = (league_data or {}).get('settings', {}).get('scheduleSettings', {})
+        team_id_to_manager = self._get_team_id_to_manager(season)
         try:
             # Try to get playoff bracket
             url = get_playoff_url(season)
@@ -514,7 +556,24 @@ class ESPNFantasyScraper:
                         return {}
                 
                 if isinstance(bracket_data, dict):
-                    playoff_data = bracket_data.get('playoffBracket', {})
+                    seeds = {}
+                    final_ranks = {}
+                    for team in bracket_data.get('teams', []):
+                        manager = team_id_to_manager.get(team.get('id'), {}).get('manager')
+                        if not manager:
+                            continue
+                        # 0 until ESPN has seeded or finished the playoffs
+                        if team.get('playoffSeed'):
+                            seeds[manager] = team['playoffSeed']
+                        if team.get('rankCalculatedFinal'):
+                            final_ranks[manager] = team['rankCalculatedFinal']
+                    
+                    playoff_data = {
+                        'playoff_team_count': schedule_settings.get('playoffTeamCount') or PLAYOFF_TEAMS,
+                        'seeds': seeds,
+                        'final_ranks': final_ranks,
+                        'bracket': bracket_data.get('playoffBracket', {}),
+                    }
         except Exception as e:
             print(f"Error getting playoff results for {season}: {e}")
         
@@ -537,6 +596,7 @@ class ESPNFantasyScraper:
                 'teams': {},
                 'matchups': [],
                 'standings': [],
+                'playoff_matchups': [],
                 'playoff_results': {},
             }
             
@@ -552,8 +612,11 @@ class ESPNFantasyScraper:
             print("  Fetching standings...")
             season_data['standings'] = self.get_standings(season)
             
-            # Skip playoff results - focusing on regular season data only
-            season_data['playoff_results'] = {}
+            # Playoff weeks are kept apart from the regular season matchups
+            # so regular season calculations never see them
+            print("  Fetching playoffs...")
+            season_data['playoff_matchups'] = self.get_playoff_matchups(season)
+            season_data['playoff_results'] = self.get_playoff_results(season)
             
             all_data[season] = season_data
             
@@ -634,7 +697,7 @@ def main():
     print(f"League ID: {LEAGUE_ID}")
     print("Scraping seasons: 2009-2025 (ESPN era)")
     print("Note: 1999-2008 seasons were on CBS Sportsline (not included)")
-    print("Focus: Regular season data only (no playoffs)")
+    print("Playoff weeks are saved separately (playoff_matchups)")
     print("=" * 60)
     
     # Check for cookies in environment variable or config
@@ -0,0 +1,113 @@
+"""
+Per-season memoization for the data processing scripts
+
+Each season's intermediate results are stored in cache/season_YYYY.json next
+to the hashes they were computed from:
+- input_hash: hash of that season's scraped data
+- code_hash: hash of the source files the intermediates depend on
+
+A cached entry is only reused when both hashes still match, so re-scraping one
+season (or changing the processing code) recomputes exactly what is affected.
+"""
+import hashlib
+import json
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Tuple
+
+SCRIPT_DIR = Path(__file__).parent
+CACHE_DIR = SCRIPT_DIR / "cache"
+
+def hash_season_data(season_data: Dict) -> str:
+    """Content hash of a season's scraped data (independent of key order)"""
+    content = json.dumps(season_data, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+def hash_source_files(paths: Iterable[Path]) -> str:
+    """Hash of the code the cached intermediates were computed with"""
+    digest = hashlib.sha256()
+    for path in sorted(Path(p) for p in paths):
+        digest.update(path.name.encode('utf-8'))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+def get_cache_file(season: int, cache_dir: Path = CACHE_DIR) -> Path:
+    return cache_dir / f"season_{season}.json"
+
+def load_cached_season(season: int, input_hash: str, code_hash: str, cache_dir: Path = CACHE_DIR):
+    """Return the cached intermediates for a season, or None if missing or stale"""
+    cache_file = get_cache_file(season, cache_dir)
+    if not cache_file.exists():
+        return None
+
+    try:
+        with open(cache_file, 'r') as f:
+            entry = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+    if entry.get('input_hash') != input_hash or entry.get('code_hash') != code_hash:
+        return None
+    return entry.get('result')
+
+def save_cached_season(season: int, input_hash: str, code_hash: str, result: Dict, cache_dir: Path = CACHE_DIR):
+    """Store a season's intermediates along with the hashes they depend on"""
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    cache_file = get_cache_file(season, cache_dir)
+    # Write to a temp file first so an interrupted run never leaves a half-written entry
+    tmp_file = cache_file.with_suffix('.tmp')
+    with open(tmp_file, 'w') as f:
+        json.dump({
+            'season': season,
+            'input_hash': input_hash,
+            'code_hash': code_hash,
+            'result': result,
+        }, f, separators=(',', ':'))
+    tmp_file.replace(cache_file)
+
+def compute_seasons(espn_data: Dict[int, Dict], compute: Callable[[int, Dict], Dict], jobs: int = 1) -> Dict[int, Dict]:
+    """
+    Run compute(season, data) for every season, optionally across a process pool
+
+    Seasons are independent, so with jobs > 1 they are mapped over worker
+    processes. compute must be a module-level function so it can be pickled.
+    Results are keyed by season in espn_data order either way.
+    """
+    seasons = list(espn_data.keys())
+    if jobs <= 1 or len(seasons) <= 1:
+        return {season: compute(season, espn_data[season]) for season in seasons}
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(seasons))) as executor:
+        results = executor.map(compute, seasons, [espn_data[season] for season in seasons])
+        return dict(zip(seasons, results))
+
+def memoize_seasons(espn_data: Dict[int, Dict], compute: Callable[[int, Dict], Dict],
+                    code_hash: str, cache_dir: Path = CACHE_DIR, jobs: int = 1) -> Tuple[Dict[int, Dict], list]:
+    """
+    Get compute(season, data) for every season, reusing cached results when possible
+
+    Returns (results keyed by season in espn_data order, list of recomputed seasons).
+    Stale seasons are recomputed with compute_seasons, in parallel when jobs > 1.
+    Results must be JSON-serializable; they are returned exactly as read back
+    from the cache so fresh and cached runs produce identical output.
+    """
+    cached = {}
+    stale = {}
+    input_hashes = {}
+
+    for season, data in espn_data.items():
+        input_hashes[season] = hash_season_data(data)
+        result = load_cached_season(season, input_hashes[season], code_hash, cache_dir)
+        if result is None:
+            stale[season] = data
+        else:
+            cached[season] = result
+
+    computed = compute_seasons(stale, compute, jobs)
+    for season, result in computed.items():
+        save_cached_season(season, input_hashes[season], code_hash, result, cache_dir)
+        # Round-trip through JSON so tuples/int keys match what a cache hit returns
+        cached[season] = json.loads(json.dumps(result))
+
+    results = {season: cached[season] for season in espn_data.keys()}
+    return results, list(stale.keys())
@@ -0,0 +1,74 @@
+"""
+Parallel, reproducible runner for the Monte Carlo scripts
+
+Trials are split into fixed-size chunks. Each chunk gets its own random
+stream, spawned from one seed with numpy.random.SeedSequence, and returns a
+histogram (any NumPy array of counts). The histograms are summed.
+
+The chunk boundaries and streams depend only on the seed, the number of
+trials and the chunk size, not on the worker count. The same seed therefore
+gives bit-identical results with --jobs 1 or --jobs 8.
+
+A trial function looks like simulate(data, num_trials, rng) -> counts. It
+must be a module-level function so worker processes can unpickle it, e.g.
+playoff_odds.simulate_seed_counts or schedule_luck.sampled_record_distribution.
+"""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Sequence, Tuple, Union
+
+import numpy as np
+
+DEFAULT_CHUNK_SIZE = 25_000
+
+def resolve_jobs(jobs: int) -> int:
+    """--jobs value to a worker count (0 = one per CPU)"""
+    return jobs if jobs > 0 else (os.cpu_count() or 1)
+
+def plan_chunks(num_trials: int, seed: Union[int, Sequence[int]], chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[Tuple[int, np.random.SeedSequence]]:
+    """Split num_trials into (trials, seed sequence) chunks, one independent stream each"""
+    num_chunks = max(1, -(-num_trials // chunk_size))
+    streams = np.random.SeedSequence(seed).spawn(num_chunks)
+    sizes = [chunk_size] * (num_chunks - 1) + [num_trials - chunk_size * (num_chunks - 1)]
+    return list(zip(sizes, streams))
+
+def _run_chunk(task: Tuple[Callable, Any, int, np.random.SeedSequence]) -> np.ndarray:
+    simulate, data, num_trials, stream = task
+    return simulate(data, num_trials, np.random.default_rng(stream))
+
+def run_simulations(simulate: Callable[[Any, int, np.random.Generator], np.ndarray], data: Any,
+                    num_trials: int, seed: Union[int, Sequence[int]], jobs: int = 1,
+                    chunk_size: int = DEFAULT_CHUNK_SIZE) -> Tuple[np.ndarray, Dict]:
+    """
+    Run simulate over num_trials, split into chunks across up to `jobs` processes
+
+    Returns (summed histogram, stats) where stats has trials, chunks, jobs,
+    seconds and trials_per_second.
+    """
+    tasks = [(simulate, data, size, stream) for size, stream in plan_chunks(num_trials, seed, chunk_size)]
+    jobs = min(resolve_jobs(jobs), len(tasks))
+
+    start = time.perf_counter()
+    if jobs <= 1:
+        partials = map(_run_chunk, tasks)
+        total = sum(partials)
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            # map keeps chunk order, so the sum is the same for any worker count
+            total = sum(executor.map(_run_chunk, tasks))
+    elapsed = time.perf_counter() - start
+
+    stats = {
+        'trials': num_trials,
+        'chunks': len(tasks),
+        'jobs': jobs,
+        'seconds': elapsed,
+        'trials_per_second': num_trials / elapsed if elapsed > 0 else float('inf'),
+    }
+    return total, stats
+
+def format_stats(stats: Dict) -> str:
+    return (f"{stats['trials']:,} trials in {stats['seconds']:.2f}s "
+            f"({stats['trials_per_second']:,.0f} trials/sec, "
+            f"{stats['chunks']} chunks on {stats['jobs']} worker{'s' if stats['jobs'] != 1 else ''})")
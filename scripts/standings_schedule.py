@@ -0,0 +1,123 @@
+"""
+Per-season standings and schedules for the standings and schedule pages
+
+Both come from the resolved regular season games (process_data.py), so they
+agree with every other generated file:
+- Standings: W/L/T, win percentage, points for and against per manager,
+  ordered by record (ties count half a win), then points for
+- Schedule: every regular season week's games with scores and winners
+
+Each season is its own small JSON file per page, so a page only downloads
+the season being viewed.
+
+Usage:
+    python standings_schedule.py
+
+Output:
+    ../data/standings/YYYY.json and ../data/standings/index.js
+    ../data/schedule/YYYY.json and ../data/schedule/index.js
+"""
+import json
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List
+
+from process_data import OUTPUT_DIR, calculate_season_summaries, extract_first_name, load_all_seasons
+
+STANDINGS_DIR = OUTPUT_DIR / "standings"
+SCHEDULE_DIR = OUTPUT_DIR / "schedule"
+
+def build_season_standings(season_data: Dict, summary: Dict) -> List[Dict]:
+    """Regular season standings from the resolved games, best record first"""
+    team_names = {extract_first_name(team.get('manager', '')): team.get('team_name', '')
+                  for team in season_data.get('standings', [])}
+
+    records = defaultdict(lambda: {'wins': 0, 'losses': 0, 'ties': 0, 'pointsFor': 0.0, 'pointsAgainst': 0.0})
+    for game in summary['games']:
+        for manager, score, opponent_score in ((game['home'], game['home_score'], game['away_score']),
+                                               (game['away'], game['away_score'], game['home_score'])):
+            record = records[manager]
+            record['wins' if score > opponent_score else 'losses' if score < opponent_score else 'ties'] += 1
+            record['pointsFor'] += score
+            record['pointsAgainst'] += opponent_score
+
+    standings = []
+    for manager, record in records.items():
+        games = record['wins'] + record['losses'] + record['ties']
+        standings.append({
+            'manager': manager,
+            'teamName': team_names.get(manager, ''),
+            'wins': record['wins'],
+            'losses': record['losses'],
+            'ties': record['ties'],
+            'winPct': round((record['wins'] + 0.5 * record['ties']) / games, 3) if games else 0.0,
+            'pointsFor': round(record['pointsFor'], 2),
+            'pointsAgainst': round(record['pointsAgainst'], 2),
+        })
+
+    standings.sort(key=lambda s: (-(s['wins'] + 0.5 * s['ties']), -s['pointsFor'], s['manager']))
+    return [{'place': place, **team} for place, team in enumerate(standings, 1)]
+
+def build_season_schedule(summary: Dict) -> List[Dict]:
+    """Every regular season week's games, in week order"""
+    weeks = {}
+    for game in summary['games']:
+        home_score, away_score = game['home_score'], game['away_score']
+        weeks.setdefault(game['week'], []).append({
+            'home': game['home'],
+            'away': game['away'],
+            'homeScore': home_score,
+            'awayScore': away_score,
+            'winner': game['home'] if home_score > away_score else game['away'] if away_score > home_score else None,
+        })
+    return [{'week': week, 'games': games} for week, games in sorted(weeks.items())]
+
+def write_season_files(output_dir: Path, export_name: str, title: str, files: Dict[int, object]):
+    """One compact JSON file per season plus an index.js listing the seasons"""
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    # Remove files for seasons no longer in the data
+    for stale in output_dir.glob("*.json"):
+        if not stale.stem.isdigit() or int(stale.stem) not in files:
+            stale.unlink()
+
+    for season, content in files.items():
+        with open(output_dir / f"{season}.json", 'w') as f:
+            json.dump(content, f, separators=(',', ':'))
+
+    with open(output_dir / "index.js", 'w') as f:
+        f.write(f"// JBS FFL {title} Seasons\n")
+        f.write("// Generated by scripts/standings_schedule.py - Do not edit manually\n")
+        f.write(f"// Each season is in {output_dir.name}/YYYY.json\n\n")
+        f.write(f"export const {export_name} = {json.dumps(sorted(files.keys()))};\n")
+
+def main():
+    print("=" * 70)
+    print("Generating Standings and Schedules")
+    print("=" * 70)
+
+    espn_data = load_all_seasons()
+    if not espn_data:
+        print("❌ No ESPN data found")
+        return
+
+    season_summaries = calculate_season_summaries(espn_data, use_cache=True)
+
+    standings = {}
+    schedules = {}
+    for season in sorted(season_summaries.keys()):
+        summary = season_summaries[season]
+        if not summary['games']:
+            continue
+        standings[season] = {'season': season, 'standings': build_season_standings(espn_data[season], summary)}
+        schedules[season] = {'season': season, 'weeks': build_season_schedule(summary)}
+        leader = standings[season]['standings'][0]
+        print(f"  {season}: {len(schedules[season]['weeks'])} weeks, "
+              f"first place {leader['manager']} ({leader['wins']}-{leader['losses']}-{leader['ties']})")
+
+    write_season_files(STANDINGS_DIR, "standingsSeasons", "Standings", standings)
+    write_season_files(SCHEDULE_DIR, "scheduleSeasons", "Schedule", schedules)
+    print(f"\n✓ Saved {len(standings)} seasons to {STANDINGS_DIR} and {SCHEDULE_DIR}")
+
+if __name__ == "__main__":
+    main()